@@ -1,355 +1,763 @@
 """Analysis module - Frequency, Pattern, Stability, Criticality, Number Index, Calendar, Decade Affinity."""
 
-from kenobase.analysis.calendar_features import (
-    CalendarAnalysisResult,
-    CalendarFeatures,
-    analyze_calendar_correlation,
-    extract_calendar_features,
-    predict_next_gk1,
-)
-from kenobase.analysis.frequency import (
-    FrequencyResult,
-    PairFrequencyResult,
-    YearlyFrequencyResult,
-    calculate_frequency,
-    calculate_frequency_per_year,
-    calculate_pair_frequency,
-    calculate_rolling_frequency,
-    classify_numbers,
-    classify_pairs,
-    get_cold_numbers,
-    get_hot_numbers,
-)
-from kenobase.analysis.number_index import (
-    CorrelationResult,
-    IndexResult,
-    NumberIndex,
-    calculate_index_correlation,
-    calculate_index_table,
-    export_index_table,
-)
-from kenobase.analysis.pattern import (
-    PatternResult,
-    aggregate_patterns,
-    extract_patterns,
-    extract_patterns_from_draws,
-)
-from kenobase.analysis.distribution import (
-    DistributionResult,
-    DistributionSummary,
-    load_gq_data,
-    analyze_distribution,
-    detect_anomalies,
-    create_summary,
-)
-from kenobase.analysis.near_miss import (
-    NearMissResult,
-    KENO_PROBABILITIES,
-    calculate_expected_ratio,
-    analyze_near_miss,
-    analyze_all_near_miss,
-    count_significant_anomalies,
-)
-from kenobase.analysis.reinforcement import (
-    ReinforcementResult,
-    load_restbetrag_data,
-    calculate_regularity_score,
-    analyze_trend,
-    calculate_autocorrelation,
-    analyze_reinforcement,
-    is_suspicious,
-)
-from kenobase.analysis.popularity_correlation import (
-    PopularityResult,
-    RollingCorrelationResult,
-    BIRTHDAY_NUMBERS,
-    SCHOENE_ZAHLEN,
-    load_gq_popularity,
-    calculate_popularity_scores_heuristic,
-    calculate_draw_frequency,
-    aggregate_gq_to_number_popularity,
-    analyze_correlation,
-    analyze_rolling_correlation,
-    run_hyp004_analysis,
-)
-from kenobase.analysis.recurrence import (
-    RecurrenceResult,
-    PairStabilityResult,
-    GK1CorrelationResult,
-    analyze_recurrence,
-    analyze_pair_stability,
-    calculate_gk1_correlation,
-    analyze_number_streaks,
-    generate_recurrence_report,
-)
-from kenobase.analysis.odds_correlation import (
-    OddsCorrelationResult,
-    NumberClassification,
-    OddsAnalysisSummary,
-    load_gq_winner_data,
-    aggregate_winners_by_date,
-    calculate_number_winner_scores,
-    analyze_odds_correlation,
-    classify_numbers_by_popularity,
-    run_hyp010_analysis,
-)
-from kenobase.analysis.temporal_cycles import (
-    TemporalCyclesResult,
-    TemporalDimensionResult,
-    NumberTemporalResult,
-    analyze_temporal_cycles,
-    analyze_dimension,
-    analyze_holiday_proximity,
-    analyze_number_temporal,
-    GERMAN_HOLIDAYS,
-    WEEKDAYS_DE,
-    MONTHS_DE,
-)
-from kenobase.analysis.stake_correlation import (
-    StakeCorrelationResult,
-    NumberStakeClassification,
-    StakeAnalysisSummary,
-    StakeDrawRecord,
-    load_stake_data,
-    aggregate_stake_by_date,
-    calculate_number_stake_scores,
-    calculate_draw_frequency_from_records,
-    analyze_stake_correlation,
-    analyze_auszahlung_correlation,
-    analyze_restbetrag_correlation,
-    classify_numbers_by_stake,
-    run_hyp012_analysis,
-)
-from kenobase.analysis.stable_numbers import (
-    StableNumberResult,
-    calculate_stability_score,
-    analyze_stable_numbers,
-    get_stable_numbers,
-    export_stable_numbers,
-)
-from kenobase.analysis.cluster_reset import (
-    ClusterEvent,
-    ClusterResetResult,
-    TradingSignal,
-    detect_cluster_events,
-    analyze_reset_probability,
-    generate_trading_signals,
-    generate_cluster_reset_report,
-)
-from kenobase.analysis.gk1_waiting import (
-    WaitingTimeStats,
-    ChiSquareResult,
-    OutlierInfo,
-    HistogramBin,
-    GK1WaitingResult,
-    load_gk1_summary_data,
-    calculate_waiting_stats,
-    calculate_histogram,
-    chi_square_uniformity_test,
-    detect_outliers,
-    analyze_gk1_waiting,
-    export_result_to_json,
-    run_hyp002_waiting_analysis,
-)
-from kenobase.analysis.decade_affinity import (
-    DecadeAffinityResult,
-    NUM_DECADES,
-    DECADES,
-    get_decade,
-    count_decade_occurrences,
-    calculate_expected_pair_frequency,
-    chi_square_test_single_pair,
-    analyze_decade_affinity,
-    get_top_affinity_pairs,
-    get_anti_affinity_pairs,
-    decade_pair_to_name,
-    generate_affinity_report,
-    run_hyp005_analysis,
-)
-from kenobase.analysis.sum_distribution import (
-    HistogramBin as SumHistogramBin,
-    SumCluster,
-    ChiSquareResult as SumChiSquareResult,
-    SumDistributionResult,
-    calculate_sum_histogram,
-    chi_square_uniformity_test as sum_chi_square_test,
-    detect_sum_clusters,
-    analyze_sum_distribution,
-    run_sum_window_analysis,
-    export_result_to_json as export_sum_result,
-    plot_sum_distribution,
-)
-from kenobase.analysis.regional_affinity import (
-    RegionalAffinityAnalysis,
-    RegionalAffinityResult,
-    RegionalNumberStat,
-    analyze_regional_affinity,
-    get_top_affinities,
-)
-from kenobase.analysis.longterm_balance import (
-    NumberBalanceStats,
-    BalanceTrigger,
-    BalanceResult,
-    calculate_balance_score,
-    calculate_deviation_std,
-    classify_balance,
-    detect_balance_triggers,
-    analyze_longterm_balance,
-    get_underrepresented_numbers,
-    get_overrepresented_numbers,
-    generate_longterm_balance_report,
-)
-from kenobase.analysis.synthesizer import (
-    KenoSynthesizer,
-)
-from kenobase.analysis.press_hypotheses import (
-    HypothesisCandidate,
-    PressHypothesesResult,
-    PressHypothesesGenerator,
-    generate_hypotheses_markdown,
-)
-from kenobase.analysis.multiweek_timing import (
-    SimulationConfig,
-    PositionDistribution,
-    ChiSquareResult as MultiweekChiSquareResult,
-    MonteCarloComparison,
-    MultiweekTimingResult,
-    ABO_LENGTHS,
-    N_POSITION_BINS,
-    simulate_random_abo_starts,
-    calculate_position_distribution,
-    chi_square_uniformity_test as multiweek_chi_square_test,
-    compare_to_monte_carlo,
-    analyze_multiweek_timing,
-    to_dict as multiweek_to_dict,
-    export_result_to_json as export_multiweek_result,
-    run_hyp014_analysis,
-)
-from kenobase.analysis.jackpot_correlation import (
-    GK1Event,
-    NumberTypeStats,
-    JackpotCorrelationResult,
-    JackpotAnalysisSummary,
-    BIRTHDAY_MIN,
-    BIRTHDAY_MAX,
-    HIGH_MIN,
-    HIGH_MAX,
-    DECADES as JACKPOT_DECADES,
-    load_gk1_events,
-    get_jackpot_dates,
-    classify_number_type,
-    get_decade as get_jackpot_decade,
-    calculate_type_ratios,
-    calculate_draw_type_features,
-    chi_square_test as jackpot_chi_square_test,
-    analyze_jackpot_correlation,
-    calculate_number_type_stats,
-    run_hyp015_analysis,
-    export_result_to_json as export_jackpot_result,
-)
-from kenobase.analysis.house_edge_stability import (
-    RollingWindowResult,
-    HouseEdgeStabilityResult,
-    CV_STABILITY_THRESHOLD,
-    DEFAULT_WINDOWS,
-    calculate_rolling_cv,
-    analyze_single_window,
-    analyze_house_edge_stability,
-    run_house003_analysis,
-    result_to_dict as house003_result_to_dict,
-)
-from kenobase.analysis.null_models import (
-    PermutationResult,
-    FDRResult,
-    NullModelTestResult,
-    NullModelRunner,
-    schedule_permutation,
-    block_permutation,
-    iid_permutation,
-    calculate_empirical_p_value,
-    benjamini_hochberg_fdr,
-    run_axiom_prediction_test,
-)
-from kenobase.analysis.draw_features import (
-    DrawFeatures,
-    FeatureStatistics,
-    DrawFeatureExtractor,
-    extract_draw_features,
-    compute_feature_matrix,
-)
-from kenobase.analysis.popularity_risk import (
-    PopularityRiskScore,
-    PopularityRiskLevel,
-    calculate_birthday_score,
-    calculate_pattern_score,
-    estimate_competition_factor,
-    calculate_popularity_risk_score,
-    should_play,
-    adjust_recommendation_by_popularity,
-    analyze_draw_popularity,
-)
-from kenobase.analysis.summen_signatur import (
-    SummenSignaturRecord,
-    aggregate_bucket_counts,
-    compute_summen_signatur,
-    export_signatures as export_summen_signatur,
-    split_signatures_by_date,
-)
-from kenobase.analysis.regime_detection import (
-    RegimeDetectionConfig,
-    RegimeDetectionResult,
-    detect_regimes,
-)
-from kenobase.analysis.cross_spectrum_coupling import (
-    FrequencyBand,
-    CoherenceResult,
-    PhaseResult,
-    SpectralCouplingResult,
-    CrossSpectrumSummary,
-    DEFAULT_BANDS,
-    analyze_spectral_coupling,
-    run_cross_spectrum_analysis,
-)
-from kenobase.analysis.parity_ratio import (
-    ParityBin,
-    ParityRatioResult,
-    analyze_parity_ratio,
-    count_parity,
-    is_even,
-)
-from kenobase.analysis.spread_index import (
-    SpreadBin,
-    SpreadIndexResult,
-    analyze_spread_index,
-    calculate_spread_index,
-    calculate_spread_for_draws,
-    create_spread_bins,
-)
-from kenobase.analysis.cycle_phases import (
-    Phase,
-    PhaseLabel,
-    COOLDOWN_MAX_DAYS,
-    GROWTH_MAX_DAYS,
-    get_phase_for_days,
-    get_phase_for_date,
-    label_phases,
-    filter_draws_by_phase,
-    get_phase_statistics,
-)
-from kenobase.analysis.ticket_correlation import (
-    TicketPair,
-    OverlapResult,
-    SyncResult,
-    TimingResult,
-    PairCorrelation,
-    TicketCorrelationResult,
-    calculate_overlap,
-    calculate_roi_sync,
-    calculate_timing,
-    calculate_diversification_score,
-    analyze_ticket_pair,
-    analyze_ticket_correlation,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from kenobase.analysis.calendar_features import (
+        CalendarAnalysisResult,
+        CalendarFeatures,
+        analyze_calendar_correlation,
+        extract_calendar_features,
+        predict_next_gk1,
+    )
+    from kenobase.analysis.frequency import (
+        FrequencyResult,
+        PairFrequencyResult,
+        RollingFrequencyMatrix,
+        YearlyFrequencyResult,
+        build_presence_matrix,
+        calculate_frequency,
+        calculate_frequency_per_year,
+        calculate_pair_frequency,
+        calculate_rolling_frequency,
+        calculate_rolling_frequency_matrix,
+        classify_numbers,
+        classify_pairs,
+        get_cold_numbers,
+        get_hot_numbers,
+    )
+    from kenobase.analysis.number_index import (
+        CorrelationResult,
+        GK1IndexEngine,
+        IndexResult,
+        NumberIndex,
+        calculate_index_correlation,
+        calculate_index_table,
+        export_index_table,
+    )
+    from kenobase.analysis.pattern import (
+        PatternResult,
+        aggregate_patterns,
+        extract_patterns,
+        extract_patterns_from_draws,
+    )
+    from kenobase.analysis.distribution import (
+        DistributionResult,
+        DistributionSummary,
+        load_gq_data,
+        analyze_distribution,
+        detect_anomalies,
+        create_summary,
+    )
+    from kenobase.analysis.near_miss import (
+        NearMissResult,
+        KENO_PROBABILITIES,
+        calculate_expected_ratio,
+        analyze_near_miss,
+        analyze_all_near_miss,
+        count_significant_anomalies,
+    )
+    from kenobase.analysis.reinforcement import (
+        ReinforcementResult,
+        load_restbetrag_data,
+        calculate_regularity_score,
+        analyze_trend,
+        calculate_autocorrelation,
+        analyze_reinforcement,
+        is_suspicious,
+    )
+    from kenobase.analysis.popularity_correlation import (
+        PopularityResult,
+        RollingCorrelationResult,
+        BIRTHDAY_NUMBERS,
+        SCHOENE_ZAHLEN,
+        load_gq_popularity,
+        calculate_popularity_scores_heuristic,
+        calculate_draw_frequency,
+        aggregate_gq_to_number_popularity,
+        analyze_correlation,
+        analyze_rolling_correlation,
+        run_hyp004_analysis,
+    )
+    from kenobase.analysis.recurrence import (
+        RecurrenceResult,
+        PairStabilityResult,
+        GK1CorrelationResult,
+        analyze_recurrence,
+        analyze_pair_stability,
+        calculate_gk1_correlation,
+        analyze_number_streaks,
+        generate_recurrence_report,
+    )
+    from kenobase.analysis.odds_correlation import (
+        OddsCorrelationResult,
+        NumberClassification,
+        OddsAnalysisSummary,
+        load_gq_winner_data,
+        aggregate_winners_by_date,
+        calculate_number_winner_scores,
+        analyze_odds_correlation,
+        classify_numbers_by_popularity,
+        run_hyp010_analysis,
+    )
+    from kenobase.analysis.temporal_cycles import (
+        TemporalCyclesResult,
+        TemporalDimensionResult,
+        NumberTemporalResult,
+        analyze_temporal_cycles,
+        analyze_dimension,
+        analyze_holiday_proximity,
+        analyze_number_temporal,
+        GERMAN_HOLIDAYS,
+        WEEKDAYS_DE,
+        MONTHS_DE,
+    )
+    from kenobase.analysis.stake_correlation import (
+        StakeCorrelationResult,
+        NumberStakeClassification,
+        StakeAnalysisSummary,
+        StakeDrawRecord,
+        StakeDataset,
+        load_stake_data,
+        aggregate_stake_by_date,
+        calculate_number_stake_scores,
+        calculate_draw_frequency_from_records,
+        analyze_stake_correlation,
+        analyze_auszahlung_correlation,
+        analyze_restbetrag_correlation,
+        classify_numbers_by_stake,
+        run_hyp012_analysis,
+    )
+    from kenobase.analysis.stable_numbers import (
+        StableNumberResult,
+        calculate_stability_score,
+        calculate_stability_scores,
+        analyze_stable_numbers,
+        analyze_stable_numbers_multi,
+        get_stable_numbers,
+        export_stable_numbers,
+    )
+    from kenobase.analysis.cluster_reset import (
+        ClusterEvent,
+        ClusterResetResult,
+        TradingSignal,
+        detect_cluster_events,
+        analyze_reset_probability,
+        generate_trading_signals,
+        generate_cluster_reset_report,
+    )
+    from kenobase.analysis.gk1_waiting import (
+        WaitingTimeStats,
+        ChiSquareResult,
+        OutlierInfo,
+        HistogramBin,
+        GK1WaitingResult,
+        load_gk1_summary_data,
+        calculate_waiting_stats,
+        calculate_histogram,
+        chi_square_uniformity_test,
+        detect_outliers,
+        analyze_gk1_waiting,
+        export_result_to_json,
+        run_hyp002_waiting_analysis,
+    )
+    from kenobase.analysis.decade_affinity import (
+        DecadeAffinityResult,
+        NUM_DECADES,
+        DECADES,
+        get_decade,
+        count_decade_occurrences,
+        calculate_expected_pair_frequency,
+        chi_square_test_single_pair,
+        analyze_decade_affinity,
+        get_top_affinity_pairs,
+        get_anti_affinity_pairs,
+        decade_pair_to_name,
+        generate_affinity_report,
+        run_hyp005_analysis,
+    )
+    from kenobase.analysis.sum_distribution import (
+        HistogramBin as SumHistogramBin,
+        SumCluster,
+        ChiSquareResult as SumChiSquareResult,
+        SumDistributionResult,
+        calculate_sum_histogram,
+        chi_square_uniformity_test as sum_chi_square_test,
+        chi_square_exact_test as sum_chi_square_exact_test,
+        detect_sum_clusters,
+        analyze_sum_distribution,
+        run_sum_window_analysis,
+        export_result_to_json as export_sum_result,
+        plot_sum_distribution,
+    )
+    from kenobase.analysis.regional_affinity import (
+        RegionalAffinityAnalysis,
+        RegionalAffinityResult,
+        RegionalNumberStat,
+        analyze_regional_affinity,
+        get_top_affinities,
+    )
+    from kenobase.analysis.longterm_balance import (
+        NumberBalanceStats,
+        BalanceTrigger,
+        BalanceResult,
+        calculate_balance_score,
+        calculate_deviation_std,
+        classify_balance,
+        detect_balance_triggers,
+        analyze_longterm_balance,
+        get_underrepresented_numbers,
+        get_overrepresented_numbers,
+        generate_longterm_balance_report,
+    )
+    from kenobase.analysis.synthesizer import (
+        KenoSynthesizer,
+    )
+    from kenobase.analysis.press_hypotheses import (
+        HypothesisCandidate,
+        PressHypothesesResult,
+        PressHypothesesGenerator,
+        generate_hypotheses_markdown,
+    )
+    from kenobase.analysis.multiweek_timing import (
+        SimulationConfig,
+        PositionDistribution,
+        ChiSquareResult as MultiweekChiSquareResult,
+        MonteCarloComparison,
+        MultiweekTimingResult,
+        ABO_LENGTHS,
+        N_POSITION_BINS,
+        simulate_random_abo_starts,
+        calculate_position_distribution,
+        chi_square_uniformity_test as multiweek_chi_square_test,
+        compare_to_monte_carlo,
+        analyze_multiweek_timing,
+        to_dict as multiweek_to_dict,
+        export_result_to_json as export_multiweek_result,
+        run_hyp014_analysis,
+    )
+    from kenobase.analysis.jackpot_correlation import (
+        GK1Event,
+        NumberTypeStats,
+        JackpotCorrelationResult,
+        JackpotAnalysisSummary,
+        BIRTHDAY_MIN,
+        BIRTHDAY_MAX,
+        HIGH_MIN,
+        HIGH_MAX,
+        DECADES as JACKPOT_DECADES,
+        load_gk1_events,
+        get_jackpot_dates,
+        classify_number_type,
+        get_decade as get_jackpot_decade,
+        calculate_type_ratios,
+        calculate_draw_type_features,
+        chi_square_test as jackpot_chi_square_test,
+        analyze_jackpot_correlation,
+        calculate_number_type_stats,
+        run_hyp015_analysis,
+        export_result_to_json as export_jackpot_result,
+    )
+    from kenobase.analysis.house_edge_stability import (
+        RollingWindowResult,
+        HouseEdgeStabilityResult,
+        CV_STABILITY_THRESHOLD,
+        DEFAULT_WINDOWS,
+        calculate_rolling_cv,
+        analyze_single_window,
+        analyze_house_edge_stability,
+        run_house003_analysis,
+        result_to_dict as house003_result_to_dict,
+    )
+    from kenobase.analysis.null_models import (
+        PermutationResult,
+        FDRResult,
+        NullModelTestResult,
+        NullModelRunner,
+        schedule_permutation,
+        block_permutation,
+        iid_permutation,
+        calculate_empirical_p_value,
+        benjamini_hochberg_fdr,
+        run_axiom_prediction_test,
+    )
+    from kenobase.analysis.draw_features import (
+        DrawFeatures,
+        FeatureStatistics,
+        DrawFeatureExtractor,
+        extract_draw_features,
+        compute_feature_matrix,
+    )
+    from kenobase.analysis.popularity_risk import (
+        PopularityRiskScore,
+        PopularityRiskLevel,
+        calculate_birthday_score,
+        calculate_pattern_score,
+        estimate_competition_factor,
+        calculate_popularity_risk_score,
+        should_play,
+        adjust_recommendation_by_popularity,
+        analyze_draw_popularity,
+    )
+    from kenobase.analysis.summen_signatur import (
+        SummenSignaturRecord,
+        SummenSignaturTable,
+        aggregate_bucket_counts,
+        compute_summen_signatur,
+        compute_summen_signatur_table,
+        export_signatures as export_summen_signatur,
+        split_signatures_by_date,
+    )
+    from kenobase.analysis.regime_detection import (
+        RegimeDetectionConfig,
+        RegimeDetectionResult,
+        detect_regimes,
+    )
+    from kenobase.analysis.cross_spectrum_coupling import (
+        FrequencyBand,
+        CoherenceResult,
+        PhaseResult,
+        SpectralCouplingResult,
+        CrossSpectrumSummary,
+        DEFAULT_BANDS,
+        analyze_spectral_coupling,
+        run_cross_spectrum_analysis,
+    )
+    from kenobase.analysis.parity_ratio import (
+        ParityBin,
+        ParityRatioResult,
+        analyze_parity_ratio,
+        count_parity,
+        is_even,
+    )
+    from kenobase.analysis.spread_index import (
+        SpreadBin,
+        SpreadIndexResult,
+        analyze_spread_index,
+        calculate_spread_index,
+        calculate_spread_for_draws,
+        create_spread_bins,
+    )
+    from kenobase.analysis.cycle_phases import (
+        Phase,
+        PhaseLabel,
+        COOLDOWN_MAX_DAYS,
+        GROWTH_MAX_DAYS,
+        get_phase_for_days,
+        get_phase_for_date,
+        label_phases,
+        filter_draws_by_phase,
+        get_phase_statistics,
+    )
+    from kenobase.analysis.ticket_correlation import (
+        TicketPair,
+        OverlapResult,
+        SyncResult,
+        TimingResult,
+        PairCorrelation,
+        TicketCorrelationResult,
+        TicketCorrelationMatrix,
+        calculate_overlap,
+        calculate_roi_sync,
+        calculate_timing,
+        calculate_diversification_score,
+        analyze_ticket_pair,
+        analyze_ticket_correlation,
+        calculate_correlation_matrix,
+    )
+
+# Oeffentlicher Name -> Submodul; importiert wird erst beim ersten Zugriff (PEP 562)
+_LAZY_EXPORTS: dict[str, tuple[str, ...]] = {
+    "calendar_features": (
+        "CalendarAnalysisResult",
+        "CalendarFeatures",
+        "analyze_calendar_correlation",
+        "extract_calendar_features",
+        "predict_next_gk1",
+    ),
+    "frequency": (
+        "FrequencyResult",
+        "PairFrequencyResult",
+        "RollingFrequencyMatrix",
+        "YearlyFrequencyResult",
+        "build_presence_matrix",
+        "calculate_frequency",
+        "calculate_frequency_per_year",
+        "calculate_pair_frequency",
+        "calculate_rolling_frequency",
+        "calculate_rolling_frequency_matrix",
+        "classify_numbers",
+        "classify_pairs",
+        "get_cold_numbers",
+        "get_hot_numbers",
+    ),
+    "number_index": (
+        "CorrelationResult",
+        "GK1IndexEngine",
+        "IndexResult",
+        "NumberIndex",
+        "calculate_index_correlation",
+        "calculate_index_table",
+        "export_index_table",
+    ),
+    "pattern": (
+        "PatternResult",
+        "aggregate_patterns",
+        "extract_patterns",
+        "extract_patterns_from_draws",
+    ),
+    "distribution": (
+        "DistributionResult",
+        "DistributionSummary",
+        "load_gq_data",
+        "analyze_distribution",
+        "detect_anomalies",
+        "create_summary",
+    ),
+    "near_miss": (
+        "NearMissResult",
+        "KENO_PROBABILITIES",
+        "calculate_expected_ratio",
+        "analyze_near_miss",
+        "analyze_all_near_miss",
+        "count_significant_anomalies",
+    ),
+    "reinforcement": (
+        "ReinforcementResult",
+        "load_restbetrag_data",
+        "calculate_regularity_score",
+        "analyze_trend",
+        "calculate_autocorrelation",
+        "analyze_reinforcement",
+        "is_suspicious",
+    ),
+    "popularity_correlation": (
+        "PopularityResult",
+        "RollingCorrelationResult",
+        "BIRTHDAY_NUMBERS",
+        "SCHOENE_ZAHLEN",
+        "load_gq_popularity",
+        "calculate_popularity_scores_heuristic",
+        "calculate_draw_frequency",
+        "aggregate_gq_to_number_popularity",
+        "analyze_correlation",
+        "analyze_rolling_correlation",
+        "run_hyp004_analysis",
+    ),
+    "recurrence": (
+        "RecurrenceResult",
+        "PairStabilityResult",
+        "GK1CorrelationResult",
+        "analyze_recurrence",
+        "analyze_pair_stability",
+        "calculate_gk1_correlation",
+        "analyze_number_streaks",
+        "generate_recurrence_report",
+    ),
+    "odds_correlation": (
+        "OddsCorrelationResult",
+        "NumberClassification",
+        "OddsAnalysisSummary",
+        "load_gq_winner_data",
+        "aggregate_winners_by_date",
+        "calculate_number_winner_scores",
+        "analyze_odds_correlation",
+        "classify_numbers_by_popularity",
+        "run_hyp010_analysis",
+    ),
+    "temporal_cycles": (
+        "TemporalCyclesResult",
+        "TemporalDimensionResult",
+        "NumberTemporalResult",
+        "analyze_temporal_cycles",
+        "analyze_dimension",
+        "analyze_holiday_proximity",
+        "analyze_number_temporal",
+        "GERMAN_HOLIDAYS",
+        "WEEKDAYS_DE",
+        "MONTHS_DE",
+    ),
+    "stake_correlation": (
+        "StakeCorrelationResult",
+        "NumberStakeClassification",
+        "StakeAnalysisSummary",
+        "StakeDrawRecord",
+        "StakeDataset",
+        "load_stake_data",
+        "aggregate_stake_by_date",
+        "calculate_number_stake_scores",
+        "calculate_draw_frequency_from_records",
+        "analyze_stake_correlation",
+        "analyze_auszahlung_correlation",
+        "analyze_restbetrag_correlation",
+        "classify_numbers_by_stake",
+        "run_hyp012_analysis",
+    ),
+    "stable_numbers": (
+        "StableNumberResult",
+        "calculate_stability_score",
+        "calculate_stability_scores",
+        "analyze_stable_numbers",
+        "analyze_stable_numbers_multi",
+        "get_stable_numbers",
+        "export_stable_numbers",
+    ),
+    "cluster_reset": (
+        "ClusterEvent",
+        "ClusterResetResult",
+        "TradingSignal",
+        "detect_cluster_events",
+        "analyze_reset_probability",
+        "generate_trading_signals",
+        "generate_cluster_reset_report",
+    ),
+    "gk1_waiting": (
+        "WaitingTimeStats",
+        "ChiSquareResult",
+        "OutlierInfo",
+        "HistogramBin",
+        "GK1WaitingResult",
+        "load_gk1_summary_data",
+        "calculate_waiting_stats",
+        "calculate_histogram",
+        "chi_square_uniformity_test",
+        "detect_outliers",
+        "analyze_gk1_waiting",
+        "export_result_to_json",
+        "run_hyp002_waiting_analysis",
+    ),
+    "decade_affinity": (
+        "DecadeAffinityResult",
+        "NUM_DECADES",
+        "DECADES",
+        "get_decade",
+        "count_decade_occurrences",
+        "calculate_expected_pair_frequency",
+        "chi_square_test_single_pair",
+        "analyze_decade_affinity",
+        "get_top_affinity_pairs",
+        "get_anti_affinity_pairs",
+        "decade_pair_to_name",
+        "generate_affinity_report",
+        "run_hyp005_analysis",
+    ),
+    "sum_distribution": (
+        "SumCluster",
+        "SumDistributionResult",
+        "calculate_sum_histogram",
+        "detect_sum_clusters",
+        "analyze_sum_distribution",
+        "run_sum_window_analysis",
+        "plot_sum_distribution",
+    ),
+    "regional_affinity": (
+        "RegionalAffinityAnalysis",
+        "RegionalAffinityResult",
+        "RegionalNumberStat",
+        "analyze_regional_affinity",
+        "get_top_affinities",
+    ),
+    "longterm_balance": (
+        "NumberBalanceStats",
+        "BalanceTrigger",
+        "BalanceResult",
+        "calculate_balance_score",
+        "calculate_deviation_std",
+        "classify_balance",
+        "detect_balance_triggers",
+        "analyze_longterm_balance",
+        "get_underrepresented_numbers",
+        "get_overrepresented_numbers",
+        "generate_longterm_balance_report",
+    ),
+    "synthesizer": (
+        "KenoSynthesizer",
+    ),
+    "press_hypotheses": (
+        "HypothesisCandidate",
+        "PressHypothesesResult",
+        "PressHypothesesGenerator",
+        "generate_hypotheses_markdown",
+    ),
+    "multiweek_timing": (
+        "SimulationConfig",
+        "PositionDistribution",
+        "MonteCarloComparison",
+        "MultiweekTimingResult",
+        "ABO_LENGTHS",
+        "N_POSITION_BINS",
+        "simulate_random_abo_starts",
+        "calculate_position_distribution",
+        "compare_to_monte_carlo",
+        "analyze_multiweek_timing",
+        "run_hyp014_analysis",
+    ),
+    "jackpot_correlation": (
+        "GK1Event",
+        "NumberTypeStats",
+        "JackpotCorrelationResult",
+        "JackpotAnalysisSummary",
+        "BIRTHDAY_MIN",
+        "BIRTHDAY_MAX",
+        "HIGH_MIN",
+        "HIGH_MAX",
+        "load_gk1_events",
+        "get_jackpot_dates",
+        "classify_number_type",
+        "calculate_type_ratios",
+        "calculate_draw_type_features",
+        "analyze_jackpot_correlation",
+        "calculate_number_type_stats",
+        "run_hyp015_analysis",
+    ),
+    "house_edge_stability": (
+        "RollingWindowResult",
+        "HouseEdgeStabilityResult",
+        "CV_STABILITY_THRESHOLD",
+        "DEFAULT_WINDOWS",
+        "calculate_rolling_cv",
+        "analyze_single_window",
+        "analyze_house_edge_stability",
+        "run_house003_analysis",
+    ),
+    "null_models": (
+        "PermutationResult",
+        "FDRResult",
+        "NullModelTestResult",
+        "NullModelRunner",
+        "schedule_permutation",
+        "block_permutation",
+        "iid_permutation",
+        "calculate_empirical_p_value",
+        "benjamini_hochberg_fdr",
+        "run_axiom_prediction_test",
+    ),
+    "draw_features": (
+        "DrawFeatures",
+        "FeatureStatistics",
+        "DrawFeatureExtractor",
+        "extract_draw_features",
+        "compute_feature_matrix",
+    ),
+    "popularity_risk": (
+        "PopularityRiskScore",
+        "PopularityRiskLevel",
+        "calculate_birthday_score",
+        "calculate_pattern_score",
+        "estimate_competition_factor",
+        "calculate_popularity_risk_score",
+        "should_play",
+        "adjust_recommendation_by_popularity",
+        "analyze_draw_popularity",
+    ),
+    "summen_signatur": (
+        "SummenSignaturRecord",
+        "SummenSignaturTable",
+        "aggregate_bucket_counts",
+        "compute_summen_signatur",
+        "compute_summen_signatur_table",
+        "split_signatures_by_date",
+    ),
+    "regime_detection": (
+        "RegimeDetectionConfig",
+        "RegimeDetectionResult",
+        "detect_regimes",
+    ),
+    "cross_spectrum_coupling": (
+        "FrequencyBand",
+        "CoherenceResult",
+        "PhaseResult",
+        "SpectralCouplingResult",
+        "CrossSpectrumSummary",
+        "DEFAULT_BANDS",
+        "analyze_spectral_coupling",
+        "run_cross_spectrum_analysis",
+    ),
+    "parity_ratio": (
+        "ParityBin",
+        "ParityRatioResult",
+        "analyze_parity_ratio",
+        "count_parity",
+        "is_even",
+    ),
+    "spread_index": (
+        "SpreadBin",
+        "SpreadIndexResult",
+        "analyze_spread_index",
+        "calculate_spread_index",
+        "calculate_spread_for_draws",
+        "create_spread_bins",
+    ),
+    "cycle_phases": (
+        "Phase",
+        "PhaseLabel",
+        "COOLDOWN_MAX_DAYS",
+        "GROWTH_MAX_DAYS",
+        "get_phase_for_days",
+        "get_phase_for_date",
+        "label_phases",
+        "filter_draws_by_phase",
+        "get_phase_statistics",
+    ),
+    "ticket_correlation": (
+        "TicketPair",
+        "OverlapResult",
+        "SyncResult",
+        "TimingResult",
+        "PairCorrelation",
+        "TicketCorrelationResult",
+        "TicketCorrelationMatrix",
+        "calculate_overlap",
+        "calculate_roi_sync",
+        "calculate_timing",
+        "calculate_diversification_score",
+        "analyze_ticket_pair",
+        "analyze_ticket_correlation",
+        "calculate_correlation_matrix",
+    ),
+}
+
+# Umbenannte Exporte: Alias -> (Submodul, Originalname)
+_LAZY_ALIASES: dict[str, tuple[str, str]] = {
+    "SumHistogramBin": ("sum_distribution", "HistogramBin"),
+    "SumChiSquareResult": ("sum_distribution", "ChiSquareResult"),
+    "sum_chi_square_test": ("sum_distribution", "chi_square_uniformity_test"),
+    "sum_chi_square_exact_test": ("sum_distribution", "chi_square_exact_test"),
+    "export_sum_result": ("sum_distribution", "export_result_to_json"),
+    "MultiweekChiSquareResult": ("multiweek_timing", "ChiSquareResult"),
+    "multiweek_chi_square_test": ("multiweek_timing", "chi_square_uniformity_test"),
+    "multiweek_to_dict": ("multiweek_timing", "to_dict"),
+    "export_multiweek_result": ("multiweek_timing", "export_result_to_json"),
+    "JACKPOT_DECADES": ("jackpot_correlation", "DECADES"),
+    "get_jackpot_decade": ("jackpot_correlation", "get_decade"),
+    "jackpot_chi_square_test": ("jackpot_correlation", "chi_square_test"),
+    "export_jackpot_result": ("jackpot_correlation", "export_result_to_json"),
+    "house003_result_to_dict": ("house_edge_stability", "result_to_dict"),
+    "export_summen_signatur": ("summen_signatur", "export_signatures"),
+}
+
+_EXPORT_INDEX: dict[str, tuple[str, str]] = {
+    name: (module, name) for module, names in _LAZY_EXPORTS.items() for name in names
+}
+_EXPORT_INDEX.update(_LAZY_ALIASES)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _EXPORT_INDEX[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Calendar Features (HYP-002)
@@ -366,12 +774,16 @@ __all__ = [
     "calculate_frequency_per_year",
     "calculate_pair_frequency",
     "calculate_rolling_frequency",
+    "calculate_rolling_frequency_matrix",
+    "RollingFrequencyMatrix",
+    "build_presence_matrix",
     "classify_numbers",
     "classify_pairs",
     "get_hot_numbers",
     "get_cold_numbers",
     # Number Index (HYP-005)
     "NumberIndex",
+    "GK1IndexEngine",
     "IndexResult",
     "CorrelationResult",
     "calculate_index_table",
@@ -451,6 +863,7 @@ __all__ = [
     "NumberStakeClassification",
     "StakeAnalysisSummary",
     "StakeDrawRecord",
+    "StakeDataset",
     "load_stake_data",
     "aggregate_stake_by_date",
     "calculate_number_stake_scores",
@@ -463,7 +876,9 @@ __all__ = [
     # Stable Numbers (Model Law A)
     "StableNumberResult",
     "calculate_stability_score",
+    "calculate_stability_scores",
     "analyze_stable_numbers",
+    "analyze_stable_numbers_multi",
     "get_stable_numbers",
     "export_stable_numbers",
     # Cluster Reset (HYP-003)
@@ -509,6 +924,7 @@ __all__ = [
     "SumDistributionResult",
     "calculate_sum_histogram",
     "sum_chi_square_test",
+    "sum_chi_square_exact_test",
     "detect_sum_clusters",
     "analyze_sum_distribution",
     "run_sum_window_analysis",
@@ -615,7 +1031,9 @@ __all__ = [
     "analyze_draw_popularity",
     # Summen Signatur (TRANS-001)
     "SummenSignaturRecord",
+    "SummenSignaturTable",
     "compute_summen_signatur",
+    "compute_summen_signatur_table",
     "export_summen_signatur",
     "split_signatures_by_date",
     "aggregate_bucket_counts",
@@ -662,10 +1080,12 @@ __all__ = [
     "TimingResult",
     "PairCorrelation",
     "TicketCorrelationResult",
+    "TicketCorrelationMatrix",
     "calculate_overlap",
     "calculate_roi_sync",
     "calculate_timing",
     "calculate_diversification_score",
     "analyze_ticket_pair",
     "analyze_ticket_correlation",
+    "calculate_correlation_matrix",
 ]
@@ -32,6 +32,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from kenobase.core.draw_collection import sort_draws
+
 if TYPE_CHECKING:
     from kenobase.core.data_loader import DrawResult
 
@@ -135,7 +137,7 @@ def detect_cluster_events(
     if len(draws) < threshold:
         return []
 
-    sorted_draws = sorted(draws, key=lambda d: d.date)
+    sorted_draws = sort_draws(draws)
     cluster_events: list[ClusterEvent] = []
 
     # Track consecutive appearances for each number (1-70)
@@ -236,7 +238,7 @@ def analyze_reset_probability(
             lift=1.0,
         )
 
-    sorted_draws = sorted(draws, key=lambda d: d.date)
+    sorted_draws = sort_draws(draws)
     cluster_events = detect_cluster_events(draws, threshold)
 
     # Count clusters with known reset status
@@ -293,7 +295,7 @@ def generate_trading_signals(
     if not draws:
         return []
 
-    sorted_draws = sorted(draws, key=lambda d: d.date)
+    sorted_draws = sort_draws(draws)
     last_draw = sorted_draws[-1]
     last_date = last_draw.date
 
@@ -8,6 +8,7 @@ Kernausgaben:
 - Counts pro Dekade, erwartete Counts basierend auf gleichverteilten Zahlen
 - Relative Frequenzen und Abweichungen
 - Chi-Quadrat-Test gegen Uniformitaet
+- Exakter Test der maximalen Dekaden-Belegung pro Ziehung (Klumpung)
 - Guardrail: maximal zulässige Abweichung von 20% (configurierbar)
 """
 
@@ -20,6 +21,7 @@ import numpy as np
 from scipy import stats
 
 from kenobase.core.data_loader import DrawResult
+from kenobase.core.exact_distribution import exact_distribution
 
 
 @dataclass(frozen=True)
@@ -51,6 +53,9 @@ class DecadeDistributionResult:
     guardrail_breached: bool
     bins: List[DecadeBin]
     warnings: list[str]
+    # Maximale Belegung einer Dekade pro Ziehung gegen die exakte Verteilung
+    occupancy_chi_square: float = 0.0
+    occupancy_p_value: float = 1.0
 
 
 def map_number_to_decade(number: int, decade_size: int = 10, max_number: int = 70) -> int:
@@ -79,6 +84,45 @@ def _collect_numbers(draws: Iterable[DrawResult]) -> list[int]:
     return numbers
 
 
+def max_occupancy_test(
+    draws: list[DrawResult],
+    max_number: int = 70,
+    decade_size: int = 10,
+) -> tuple[float, float]:
+    """Chi-Quadrat-Test der maximalen Dekaden-Belegung pro Ziehung.
+
+    Die exakte Nullverteilung stammt aus allen Belegungsvektoren der
+    Dekaden (k Zahlen ohne Zuruecklegen aus 1..max_number).
+
+    Args:
+        draws: Liste von Ziehungsergebnissen (gleiche Anzahl Zahlen)
+        max_number: Groesste Zahl
+        decade_size: Breite einer Dekade
+
+    Returns:
+        Tuple (chi_square, p_value); (0.0, 1.0) wenn kein Test moeglich ist.
+    """
+    sizes = {len(d.numbers) for d in draws}
+    if len(sizes) != 1:
+        return 0.0, 1.0
+    k = sizes.pop()
+    if k == 0 or k > max_number:
+        return 0.0, 1.0
+
+    observed = []
+    for draw in draws:
+        numbers = np.asarray(draw.numbers)
+        if numbers.min() < 1 or numbers.max() > max_number:
+            return 0.0, 1.0
+        observed.append(int(np.bincount((numbers - 1) // decade_size).max()))
+
+    dist = exact_distribution(
+        "decade_max", numbers_max=max_number, numbers_drawn=k, decade_size=decade_size
+    )
+    chi_square, p_value, _ = dist.chi_square(observed)
+    return chi_square, p_value
+
+
 def analyze_decade_distribution(
     draws: list[DrawResult],
     max_number: Optional[int] = None,
@@ -170,6 +214,8 @@ def analyze_decade_distribution(
     max_dev = float(max(abs(float(r)) for r in deviation_ratios)) if deviation_ratios else 0.0
     guardrail_breached = bool(max_dev > guardrail_ratio)
 
+    occupancy_chi_square, occupancy_p_value = max_occupancy_test(draws, max_val, decade_size)
+
     return DecadeDistributionResult(
         total_draws=len(draws),
         numbers_per_draw=numbers_per_draw or len(draws[0].numbers),
@@ -182,6 +228,8 @@ def analyze_decade_distribution(
         guardrail_breached=guardrail_breached,
         bins=decade_bins,
         warnings=warnings,
+        occupancy_chi_square=float(occupancy_chi_square),
+        occupancy_p_value=float(occupancy_p_value),
     )
 
 
@@ -190,4 +238,5 @@ __all__ = [
     "DecadeDistributionResult",
     "analyze_decade_distribution",
     "map_number_to_decade",
+    "max_occupancy_test",
 ]
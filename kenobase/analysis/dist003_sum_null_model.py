@@ -13,13 +13,14 @@ of a uniform-bin test, which will be "significant" by construction).
 
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
 from typing import Optional
 
 import numpy as np
 from scipy import stats
 
+from kenobase.core.exact_distribution import exact_distribution
+
 
 @dataclass
 class SumNullModelFit:
@@ -47,43 +48,19 @@ def exact_sum_counts(
 ) -> dict[int, int]:
     """Exact distribution of sum for choosing `numbers_drawn` distinct ints from [min..max].
 
+    Backed by the memoized engine in kenobase.core.exact_distribution.
+
     Returns a mapping: sum_value -> number_of_combinations.
     """
-    if numbers_min != 1:
-        # Shift to 1..N then shift sums back
-        shift = numbers_min - 1
-        shifted = exact_sum_counts(
-            numbers_min=1,
-            numbers_max=numbers_max - shift,
-            numbers_drawn=numbers_drawn,
-        )
-        return {s + shift * numbers_drawn: c for s, c in shifted.items()}
-
-    n = numbers_max
-    k = numbers_drawn
-
-    if k <= 0 or k > n:
+    n = numbers_max - numbers_min + 1
+    if numbers_drawn <= 0 or numbers_drawn > n:
         return {}
-
-    max_sum = sum(range(n - k + 1, n + 1))
-    dp = [[0] * (max_sum + 1) for _ in range(k + 1)]
-    dp[0][0] = 1
-
-    for value in range(1, n + 1):
-        for j in range(min(k, value), 0, -1):
-            for s in range(max_sum, value - 1, -1):
-                dp[j][s] += dp[j - 1][s - value]
-
-    return {s: dp[k][s] for s in range(max_sum + 1) if dp[k][s] > 0}
-
-
-def _expected_stats_from_counts(counts: dict[int, int]) -> tuple[float, float]:
-    total = sum(counts.values())
-    if total <= 0:
-        return 0.0, 0.0
-    mean = sum(s * c for s, c in counts.items()) / total
-    var = sum(((s - mean) ** 2) * c for s, c in counts.items()) / total
-    return float(mean), float(math.sqrt(var))
+    return exact_distribution(
+        "sum",
+        numbers_min=numbers_min,
+        numbers_max=numbers_max,
+        numbers_drawn=numbers_drawn,
+    ).count_map()
 
 
 def fit_sum_null_model(
@@ -115,13 +92,13 @@ def fit_sum_null_model(
             note="no sums provided",
         )
 
-    counts = exact_sum_counts(
+    dist = exact_distribution(
+        "sum",
         numbers_min=numbers_min,
         numbers_max=numbers_max,
         numbers_drawn=numbers_drawn,
     )
-    total_combos = math.comb(numbers_max - numbers_min + 1, numbers_drawn)
-    expected_mean, expected_std = _expected_stats_from_counts(counts)
+    expected_mean, expected_std = float(dist.mean), float(dist.std)
 
     sums_arr = np.asarray(sums, dtype=int)
     obs_min = int(sums_arr.min())
@@ -136,13 +113,8 @@ def fit_sum_null_model(
     bins = np.arange(r_min, r_max + bin_width + 1, bin_width, dtype=int)
     observed, bin_edges = np.histogram(sums_arr, bins=bins)
 
-    # Expected counts per bin from exact PMF
-    expected = np.zeros_like(observed, dtype=float)
-    for i in range(len(observed)):
-        start = int(bin_edges[i])
-        end = int(bin_edges[i + 1])
-        prob = sum(c for s, c in counts.items() if start <= s < end) / total_combos
-        expected[i] = prob * len(sums_arr)
+    # Expected counts per bin from exact PMF (half-open bins [start, end))
+    expected = dist.bin_probabilities(bin_edges) * len(sums_arr)
 
     # Numerical safety: enforce identical totals for chi-square (SciPy requires this).
     if expected.sum() > 0:
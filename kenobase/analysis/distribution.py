@@ -14,7 +14,7 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
-from kenobase.core.parsing import parse_float_mixed_german, parse_int_mixed_german
+from kenobase.core.gq_store import load_gq_frame, to_legacy_frame
 
 logger = logging.getLogger(__name__)
 
@@ -106,64 +106,14 @@ def load_gq_data(
             (z.B. ``So, 28.12.`` aus gescrapten 2025-Dateien). Wenn nicht gesetzt,
             wird versucht das Jahr aus dem Dateinamen zu inferieren.
 
+    Die Datei wird ueber kenobase.core.gq_store nur einmal geparst (Memo-Cache
+    bzw. konfigurierter GQStore).
+
     Returns:
         DataFrame mit Spalten: Datum, Keno-Typ, Anzahl richtiger Zahlen,
                                Anzahl der Gewinner, 1 Euro Gewinn
     """
-    df = pd.read_csv(path, encoding=encoding)
-
-    # Bereinige Spaltennamen
-    df.columns = df.columns.str.strip()
-
-    # Infer default year from filename if needed (e.g. "Keno_GQ_2025.csv").
-    if default_year is None:
-        name = str(path)
-        year_match = pd.Series([name]).str.extract(r"(20\d{2})", expand=False).iloc[0]
-        if isinstance(year_match, str) and year_match.isdigit():
-            default_year = int(year_match)
-
-    # Parse Datum (supports both "08.02.2024" and "So, 28.12.")
-    date_text = df["Datum"].astype(str).str.strip()
-    parsed_full = pd.to_datetime(date_text, format="%d.%m.%Y", errors="coerce")
-    if default_year is not None:
-        # Fill missing with day/month + inferred/default year.
-        dm = date_text.str.extract(r"(?P<day>\d{1,2})\.(?P<month>\d{1,2})\.?", expand=True)
-        has_dm = dm["day"].notna() & dm["month"].notna()
-        needs_fill = parsed_full.isna() & has_dm
-        if needs_fill.any():
-            reconstructed = (
-                dm.loc[needs_fill, "day"].astype(str).str.zfill(2)
-                + "."
-                + dm.loc[needs_fill, "month"].astype(str).str.zfill(2)
-                + f".{default_year}"
-            )
-            parsed_full.loc[needs_fill] = pd.to_datetime(
-                reconstructed, format="%d.%m.%Y", errors="coerce"
-            )
-
-    df["Datum"] = parsed_full
-    df = df.dropna(subset=["Datum"]).copy()
-
-    # Bereinige Gewinner-Spalte (mixed formats: 275.0, 3.462, 2.91, ...)
-    if "Anzahl der Gewinner" in df.columns:
-        df["Anzahl der Gewinner"] = df["Anzahl der Gewinner"].apply(parse_int_mixed_german)
-
-    # Filter rows: some scraped files contain non-hit "Gewinnklasse..." rows.
-    if "Anzahl richtiger Zahlen" in df.columns:
-        matches_text = df["Anzahl richtiger Zahlen"].astype(str).str.strip()
-        is_numeric_match = matches_text.str.fullmatch(r"\d+").fillna(False)
-        df = df[is_numeric_match].copy()
-        df["Anzahl richtiger Zahlen"] = matches_text[is_numeric_match].astype(int)
-
-    if "Keno-Typ" in df.columns:
-        keno_type_text = df["Keno-Typ"].astype(str).str.strip()
-        is_numeric_type = keno_type_text.str.fullmatch(r"\d+").fillna(False)
-        df = df[is_numeric_type].copy()
-        df["Keno-Typ"] = keno_type_text[is_numeric_type].astype(int)
-
-    if "1 Euro Gewinn" in df.columns:
-        df["1 Euro Gewinn"] = df["1 Euro Gewinn"].apply(parse_float_mixed_german)
-
+    df = to_legacy_frame(load_gq_frame(path, encoding=encoding, default_year=default_year))
     logger.info(f"Loaded {len(df)} rows from {path}")
     return df
 
@@ -301,22 +251,7 @@ def load_quote_details_data(
         DataFrame mit Spalten: Datum, Keno-Typ, Anzahl richtiger Zahlen,
                                Anzahl der Gewinner, Gewinn/1Eur, Auszahlung
     """
-    df = pd.read_csv(path, encoding=encoding, sep=";")
-
-    # Bereinige Spaltennamen
-    df.columns = df.columns.str.strip()
-
-    # Parse Datum
-    df["Datum"] = pd.to_datetime(df["Datum"], format="%d.%m.%Y")
-
-    # Bereinige Gewinner-Spalte (mixed formats possible)
-    if "Anzahl der Gewinner" in df.columns:
-        df["Anzahl der Gewinner"] = df["Anzahl der Gewinner"].apply(parse_int_mixed_german)
-
-    # Bereinige Auszahlung-Spalte
-    if "Auszahlung" in df.columns:
-        df["Auszahlung"] = df["Auszahlung"].apply(parse_float_mixed_german)
-
+    df = to_legacy_frame(load_gq_frame(path, encoding=encoding), payout_column="Gewinn/1Eur")
     logger.info(f"Loaded {len(df)} rows from {path}")
     return df
 
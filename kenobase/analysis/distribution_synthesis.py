@@ -22,6 +22,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from kenobase.core.result_cache import ResultCache
+
 logger = logging.getLogger(__name__)
 
 # Default weights for each data source in the synthesis
@@ -44,6 +46,7 @@ class SourceResult:
         evidence_score: Normalized score 0.0-1.0 (higher = more evidence of stability)
         key_metrics: Dictionary of key metrics from the analysis
         source_file: Path to the source result file
+        freshness: "fresh", "stale" or "unknown" (see ResultCache.artifact_status)
     """
 
     source_id: str
@@ -52,6 +55,7 @@ class SourceResult:
     evidence_score: float
     key_metrics: dict[str, Any] = field(default_factory=dict)
     source_file: str = ""
+    freshness: str = "unknown"
 
 
 @dataclass
@@ -400,18 +404,22 @@ def get_distribution_verdict(score: float) -> str:
 def run_synthesis(
     results_dir: Path,
     weights: dict[str, float] | None = None,
+    result_cache: ResultCache | None = None,
 ) -> DistributionSynthesisReport:
     """Run the full synthesis of all distribution pattern sources.
 
     Args:
         results_dir: Path to results directory
         weights: Optional custom weights for sources
+        result_cache: Cache used to check whether source files are stale
+            (default: ResultCache(results_dir / ".cache"))
 
     Returns:
         DistributionSynthesisReport with all results
     """
     results_dir = Path(results_dir)
     weights = weights or DEFAULT_WEIGHTS
+    result_cache = result_cache or ResultCache(results_dir / ".cache")
 
     sources: list[SourceResult] = []
 
@@ -426,6 +434,11 @@ def run_synthesis(
     for filepath, loader in loaders:
         result = loader(filepath)
         if result:
+            result.freshness = result_cache.artifact_status(filepath)
+            if result.freshness == "stale":
+                logger.warning(
+                    f"{result.source_id}: {filepath.name} is stale, re-run the analysis"
+                )
             sources.append(result)
             status = "available" if result.available else "NO_DATA"
             logger.info(
@@ -467,6 +480,7 @@ def source_to_dict(src: SourceResult) -> dict[str, Any]:
         "evidence_score": src.evidence_score,
         "key_metrics": src.key_metrics,
         "source_file": src.source_file,
+        "freshness": src.freshness,
     }
 
 
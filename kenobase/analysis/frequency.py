@@ -21,6 +21,10 @@ Usage:
 
     # Paar-Frequenzen (Duos)
     pair_results = calculate_pair_frequency(draws)
+
+    # Rolling-Frequenz aller Zahlen als (n_windows, n_numbers) Matrix
+    rolling = calculate_rolling_frequency_matrix(draws, window=50, number_range=(1, 70))
+    rolling.column(7)
 """
 
 from __future__ import annotations
@@ -30,6 +34,8 @@ from dataclasses import dataclass
 from itertools import combinations
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from kenobase.core.data_loader import DrawResult
 
@@ -290,6 +296,162 @@ def classify_pairs(
     return classified
 
 
+@dataclass(frozen=True)
+class RollingFrequencyMatrix:
+    """Rolling-Frequenzen aller Zahlen eines Bereichs.
+
+    Attributes:
+        frequencies: Array (n_windows, n_numbers); Zeile i = Fenster draws[i : i + window]
+        numbers: Zahlen in Spaltenreihenfolge (aufsteigend, lueckenlos)
+        window: Verwendete Fenstergroesse
+    """
+
+    frequencies: np.ndarray
+    numbers: tuple[int, ...]
+    window: int
+
+    @property
+    def n_windows(self) -> int:
+        """Anzahl Fenster (= Zeilen)."""
+        return int(self.frequencies.shape[0])
+
+    def column(self, number: int) -> np.ndarray:
+        """Rolling-Frequenz einer einzelnen Zahl.
+
+        Args:
+            number: Zahl im Bereich von `numbers`
+
+        Returns:
+            1D-Array der Laenge n_windows (View, keine Kopie).
+
+        Raises:
+            KeyError: Wenn die Zahl nicht im Bereich liegt.
+        """
+        if not self.numbers or not self.numbers[0] <= number <= self.numbers[-1]:
+            raise KeyError(number)
+        return self.frequencies[:, number - self.numbers[0]]
+
+
+def build_presence_matrix(
+    draws: list[DrawResult],
+    number_range: tuple[int, int],
+) -> np.ndarray:
+    """Erstellt die binaere Praesenzmatrix der Ziehungen.
+
+    Args:
+        draws: Liste von DrawResult-Objekten (chronologisch sortiert)
+        number_range: Zahlenbereich (min, max); Zahlen ausserhalb werden ignoriert
+
+    Returns:
+        Array (n_draws, max - min + 1) mit dtype int32; Eintrag 1 wenn die
+        Zahl in der Ziehung vorkommt (Duplikate zaehlen einfach).
+
+    Raises:
+        ValueError: Wenn number_range ungueltig ist (min > max).
+    """
+    min_num, max_num = number_range
+    if min_num > max_num:
+        raise ValueError(f"Invalid number_range: min ({min_num}) > max ({max_num})")
+
+    presence = np.zeros((len(draws), max_num - min_num + 1), dtype=np.int32)
+    if not draws:
+        return presence
+
+    lengths = np.fromiter((len(d.numbers) for d in draws), dtype=np.int64, count=len(draws))
+    rows = np.repeat(np.arange(len(draws)), lengths)
+    cols = np.fromiter(
+        (n for d in draws for n in d.numbers), dtype=np.int64, count=int(lengths.sum())
+    ) - min_num
+    mask = (cols >= 0) & (cols <= max_num - min_num)
+    presence[rows[mask], cols[mask]] = 1
+    return presence
+
+
+def presence_cumsum(presence: np.ndarray) -> np.ndarray:
+    """Kumulative Summe der Praesenzmatrix mit fuehrender Nullzeile.
+
+    Args:
+        presence: Praesenzmatrix (n_draws, n_numbers)
+
+    Returns:
+        Array (n_draws + 1, n_numbers); Zeile i enthaelt die Vorkommen in
+        den ersten i Ziehungen.
+    """
+    cumsum = np.zeros((presence.shape[0] + 1, presence.shape[1]), dtype=np.int64)
+    np.cumsum(presence, axis=0, out=cumsum[1:])
+    return cumsum
+
+
+def rolling_window_counts_from_cumsum(cumsum: np.ndarray, window: int) -> np.ndarray:
+    """Zaehlt Vorkommen pro Fenster aus einer vorberechneten kumulativen Summe.
+
+    Args:
+        cumsum: Ergebnis von presence_cumsum (n_draws + 1, n_numbers)
+        window: Fenstergroesse (>= 1)
+
+    Returns:
+        Array (max(0, n_draws - window + 1), n_numbers) mit Zaehlwerten.
+    """
+    if cumsum.shape[0] - 1 < window:
+        return np.zeros((0, cumsum.shape[1]), dtype=np.int64)
+    return cumsum[window:] - cumsum[:-window]
+
+
+def rolling_window_counts(presence: np.ndarray, window: int) -> np.ndarray:
+    """Zaehlt Vorkommen pro Fenster ueber eine kumulative Summe.
+
+    Args:
+        presence: Praesenzmatrix (n_draws, n_numbers)
+        window: Fenstergroesse (>= 1)
+
+    Returns:
+        Array (max(0, n_draws - window + 1), n_numbers) mit Zaehlwerten.
+    """
+    if presence.shape[0] < window:
+        return np.zeros((0, presence.shape[1]), dtype=np.int64)
+    return rolling_window_counts_from_cumsum(presence_cumsum(presence), window)
+
+
+def calculate_rolling_frequency_matrix(
+    draws: list[DrawResult],
+    window: int,
+    number_range: tuple[int, int] | None = None,
+) -> RollingFrequencyMatrix:
+    """Berechnet Rolling-Frequenzen aller Zahlen in einem Durchlauf.
+
+    Eine kumulative Summe ueber die Praesenzmatrix liefert alle Fenster
+    in O(n_draws * n_numbers) statt O(n_numbers * n_draws * window).
+
+    Args:
+        draws: Liste von DrawResult-Objekten (chronologisch sortiert)
+        window: Fenstergroesse (Anzahl Ziehungen)
+        number_range: Zahlenbereich (min, max). Wenn None, aus draws abgeleitet.
+
+    Returns:
+        RollingFrequencyMatrix mit frequencies der Form
+        (max(0, len(draws) - window + 1), n_numbers).
+
+    Raises:
+        ValueError: Wenn window < 1 oder number_range ungueltig.
+    """
+    if window < 1:
+        raise ValueError(f"window must be >= 1, got {window}")
+
+    if number_range is None:
+        all_numbers = {n for d in draws for n in d.numbers}
+        if not all_numbers:
+            return RollingFrequencyMatrix(np.zeros((0, 0)), (), window)
+        number_range = (min(all_numbers), max(all_numbers))
+
+    presence = build_presence_matrix(draws, number_range)
+    counts = rolling_window_counts(presence, window)
+    return RollingFrequencyMatrix(
+        frequencies=counts / window,
+        numbers=tuple(range(number_range[0], number_range[1] + 1)),
+        window=window,
+    )
+
+
 def calculate_rolling_frequency(
     draws: list[DrawResult],
     window: int,
@@ -298,7 +460,8 @@ def calculate_rolling_frequency(
     """Berechnet Rolling-Frequenz einer Zahl ueber ein Fenster.
 
     Fuer jeden Draw ab Position `window` wird die relative Frequenz
-    der letzten `window` Ziehungen berechnet.
+    der letzten `window` Ziehungen berechnet. Duenne Sicht auf
+    calculate_rolling_frequency_matrix fuer eine einzelne Zahl.
 
     Args:
         draws: Liste von DrawResult-Objekten (chronologisch sortiert)
@@ -323,13 +486,8 @@ def calculate_rolling_frequency(
     if len(draws) < window:
         return []
 
-    results = []
-    for i in range(len(draws) - window + 1):
-        window_draws = draws[i : i + window]
-        count = sum(1 for d in window_draws if number in d.numbers)
-        results.append(count / window)
-
-    return results
+    matrix = calculate_rolling_frequency_matrix(draws, window, (number, number))
+    return matrix.column(number).tolist()
 
 
 def get_hot_numbers(
@@ -487,12 +645,18 @@ __all__ = [
     "FrequencyResult",
     "PairFrequencyResult",
     "YearlyFrequencyResult",
+    "RollingFrequencyMatrix",
+    "build_presence_matrix",
     "calculate_frequency",
     "calculate_frequency_per_year",
     "calculate_pair_frequency",
     "classify_numbers",
     "classify_pairs",
     "calculate_rolling_frequency",
+    "calculate_rolling_frequency_matrix",
+    "presence_cumsum",
+    "rolling_window_counts",
+    "rolling_window_counts_from_cumsum",
     "get_hot_numbers",
     "get_cold_numbers",
 ]
@@ -21,6 +21,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from kenobase.core.result_cache import ResultCache
+
 logger = logging.getLogger(__name__)
 
 # Default weights for each hypothesis in the synthesis
@@ -43,6 +45,7 @@ class HypothesisResult:
         evidence_score: Normalized score 0.0-1.0 (higher = more evidence)
         key_metrics: Dictionary of key metrics from the analysis
         source_file: Path to the source result file
+        freshness: "fresh", "stale" or "unknown" (see ResultCache.artifact_status)
     """
 
     hypothesis_id: str
@@ -51,6 +54,7 @@ class HypothesisResult:
     evidence_score: float
     key_metrics: dict[str, Any] = field(default_factory=dict)
     source_file: str = ""
+    freshness: str = "unknown"
 
 
 @dataclass
@@ -328,18 +332,22 @@ def get_manipulation_verdict(score: float) -> str:
 def run_synthesis(
     results_dir: Path,
     weights: dict[str, float] | None = None,
+    result_cache: ResultCache | None = None,
 ) -> SynthesisReport:
     """Run the full synthesis of all house-edge hypothesis results.
 
     Args:
         results_dir: Path to results directory
         weights: Optional custom weights for hypotheses
+        result_cache: Cache used to check whether source files are stale
+            (default: ResultCache(results_dir / ".cache"))
 
     Returns:
         SynthesisReport with all results
     """
     results_dir = Path(results_dir)
     weights = weights or DEFAULT_WEIGHTS
+    result_cache = result_cache or ResultCache(results_dir / ".cache")
 
     hypotheses: list[HypothesisResult] = []
 
@@ -354,6 +362,11 @@ def run_synthesis(
     for filepath, loader in loaders:
         result = loader(filepath)
         if result:
+            result.freshness = result_cache.artifact_status(filepath)
+            if result.freshness == "stale":
+                logger.warning(
+                    f"{result.hypothesis_id}: {filepath.name} is stale, re-run the analysis"
+                )
             hypotheses.append(result)
             status = "SUPPORTED" if result.supported else "not supported"
             logger.info(
@@ -395,6 +408,7 @@ def hypothesis_to_dict(hyp: HypothesisResult) -> dict[str, Any]:
         "evidence_score": hyp.evidence_score,
         "key_metrics": hyp.key_metrics,
         "source_file": hyp.source_file,
+        "freshness": hyp.freshness,
     }
 
 
@@ -646,20 +646,16 @@ def run_hyp015_analysis(
     )
 
 
-def export_result_to_json(
-    result: JackpotAnalysisSummary,
-    output_path: str | Path,
-) -> None:
-    """Export analysis result to JSON file.
+def result_to_dict(result: JackpotAnalysisSummary) -> dict:
+    """Convert JackpotAnalysisSummary to dictionary.
 
     Args:
-        result: JackpotAnalysisSummary to export
-        output_path: Path for output JSON file
-    """
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+        result: JackpotAnalysisSummary instance
 
-    data = {
+    Returns:
+        Dictionary representation for JSON export
+    """
+    return {
         "hypothesis": "HYP-015",
         "description": "Jackpot-Hoehe vs. Zahlentyp Korrelation",
         "correlation": {
@@ -698,8 +694,22 @@ def export_result_to_json(
         },
     }
 
+
+def export_result_to_json(
+    result: JackpotAnalysisSummary,
+    output_path: str | Path,
+) -> None:
+    """Export analysis result to JSON file.
+
+    Args:
+        result: JackpotAnalysisSummary to export
+        output_path: Path for output JSON file
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
     with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        json.dump(result_to_dict(result), f, indent=2, ensure_ascii=False, default=str)
 
     logger.info(f"Exported result to {output_path}")
 
@@ -724,5 +734,6 @@ __all__ = [
     "analyze_jackpot_correlation",
     "calculate_number_type_stats",
     "run_hyp015_analysis",
+    "result_to_dict",
     "export_result_to_json",
 ]
@@ -31,6 +31,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from kenobase.core.draw_collection import sort_draws
+
 if TYPE_CHECKING:
     from kenobase.core.data_loader import DrawResult
 
@@ -218,7 +220,7 @@ def detect_balance_triggers(
     if len(draws) < window:
         return []
 
-    sorted_draws = sorted(draws, key=lambda d: d.date)
+    sorted_draws = sort_draws(draws)
     recent_draws = sorted_draws[-window:]
     last_date = recent_draws[-1].date
 
@@ -302,7 +304,7 @@ def analyze_longterm_balance(
             expected_frequency=20 / 70,
         )
 
-    sorted_draws = sorted(draws, key=lambda d: d.date)
+    sorted_draws = sort_draws(draws)
     recent_draws = sorted_draws[-window:]
 
     # Erwartete Frequenz pro Zahl
@@ -10,13 +10,14 @@ Spieler-Bindungsstrategie hindeuten ("fast gewonnen" motiviert Weiterspielen).
 from __future__ import annotations
 
 import logging
-import math
 from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
 from scipy import stats
 
+from kenobase.core.keno_ev import hit_probability
+
 logger = logging.getLogger(__name__)
 
 
@@ -58,18 +59,8 @@ def _keno_match_probability(
 
     P(X=m) = C(k, m) * C(N-k, n-m) / C(N, n)
     """
-    if matches < 0 or matches > keno_type:
-        return 0.0
-    misses = numbers_drawn - matches
-    if misses < 0:
-        return 0.0
-    if misses > (numbers_range - keno_type):
-        return 0.0
-    denom = math.comb(numbers_range, numbers_drawn)
-    return (
-        math.comb(keno_type, matches)
-        * math.comb(numbers_range - keno_type, misses)
-        / denom
+    return hit_probability(
+        keno_type, matches, numbers_range=numbers_range, numbers_drawn=numbers_drawn
     )
 
 
@@ -40,6 +40,7 @@ from kenobase.analysis.near_miss import (
     analyze_near_miss,
     calculate_expected_ratio,
 )
+from kenobase.core.gq_store import load_gq_frame, to_legacy_frame
 
 if TYPE_CHECKING:
     pass
@@ -322,7 +323,7 @@ def run_house004_analysis(
         # Try different encodings (utf-8-sig handles BOM)
         for encoding in ["utf-8-sig", "utf-8", "latin-1", "cp1252"]:
             try:
-                df = pd.read_csv(gq_path, encoding=encoding, sep=None, engine="python")
+                df = to_legacy_frame(load_gq_frame(gq_path, encoding=encoding))
                 break
             except UnicodeDecodeError:
                 continue
@@ -333,8 +334,6 @@ def run_house004_analysis(
                 gk1_source=str(gk1_path),
                 gq_source=str(gq_path),
             )
-        # Strip BOM from column names if present
-        df.columns = [c.lstrip("\ufeff") for c in df.columns]
     except Exception as e:
         logger.error(f"Failed to load GQ data: {e}")
         return House004AnalysisSummary(
@@ -345,21 +344,6 @@ def run_house004_analysis(
 
     logger.info(f"Loaded GQ data: {len(df)} records")
 
-    # Ensure required columns exist
-    required_cols = ["Datum", "Keno-Typ", "Anzahl richtiger Zahlen", "Anzahl der Gewinner"]
-    missing_cols = [c for c in required_cols if c not in df.columns]
-    if missing_cols:
-        logger.error(f"GQ data missing columns: {missing_cols}")
-        return House004AnalysisSummary(
-            n_gk1_events=len(gk1_events),
-            gk1_source=str(gk1_path),
-            gq_source=str(gq_path),
-        )
-
-    # Parse dates
-    df["Datum"] = pd.to_datetime(df["Datum"], dayfirst=True, errors="coerce")
-    df = df.dropna(subset=["Datum"])
-
     # Determine date range
     date_range_start = df["Datum"].min()
     date_range_end = df["Datum"].max()
@@ -18,10 +18,17 @@ Usage:
 
     # Korrelationsanalyse
     correlation = calculate_index_correlation(draws, gk1_dates)
+
+    # Vorberechneter Index fuer beliebige Stichtage (inkrementell erweiterbar)
+    engine = GK1IndexEngine.from_draws(draws, gk1_dates)
+    engine.index_table(at=datetime(2024, 6, 1))
+    engine.append_draw(new_date, new_numbers)
+    engine.add_gk1_event(gk1_date, 10)
 """
 
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -87,6 +94,257 @@ class CorrelationResult:
     segment_details: list[dict[str, Any]] = field(default_factory=list)
 
 
+class GK1IndexEngine:
+    """Vorberechneter Zahlen-Index fuer jeden Ziehungstag.
+
+    Speichert pro Ziehung die kumulierten Erscheinungen jeder Zahl seit dem
+    letzten GK1-Event (segmentweise kumulative Summe, Reset an jedem Event)
+    sowie die Position der letzten Erscheinung. Die Index-Tabelle zu einem
+    beliebigen Datum ist damit ein direkter Zeilenzugriff.
+
+    Neue Ziehungen werden in O(number_range) angehaengt. GK1-Events nach der
+    letzten Ziehung wirken ab der naechsten passenden Ziehung; nachtraeglich
+    gemeldete (aeltere) Events berechnen nur die betroffenen Zeilen neu.
+
+    Segment-Semantik wie calculate_index_table: Eine Ziehung gehoert zum
+    Segment des letzten GK1-Events mit event_date <= draw_date.
+    """
+
+    def __init__(
+        self,
+        number_range: int = 70,
+        gk1_events: list[tuple[datetime, int]] | None = None,
+    ):
+        """Initialisiert eine leere Engine.
+
+        Args:
+            number_range: Maximale Zahl (default: 70)
+            gk1_events: Optionale (datum, keno_typ) GK1-Events
+        """
+        self.number_range = number_range
+        self._events: list[tuple[datetime, int]] = []
+        self._dates: list[datetime] = []
+        self._numbers: list[list[int]] = []
+        self._n = 0
+        self._counts = np.zeros((0, number_range), dtype=np.int32)
+        self._last_seen = np.zeros((0, number_range), dtype=np.int32)
+        # Segmente: (start_position, reset_date, keno_typ)
+        self._segments: list[tuple[int, datetime | None, int | None]] = []
+
+        for event_date, keno_type in gk1_events or []:
+            self.add_gk1_event(event_date, keno_type)
+
+    @classmethod
+    def from_draws(
+        cls,
+        draws: list[tuple[datetime, list[int]]],
+        gk1_events: list[tuple[datetime, int]],
+        number_range: int = 70,
+    ) -> "GK1IndexEngine":
+        """Baut die Engine aus allen Ziehungen und Events.
+
+        Args:
+            draws: Liste von (datum, zahlen) Tupeln (wird stabil nach Datum sortiert)
+            gk1_events: Liste von (datum, keno_typ) Tupeln
+            number_range: Maximale Zahl (default: 70)
+
+        Returns:
+            Befuellte GK1IndexEngine
+        """
+        engine = cls(number_range=number_range, gk1_events=gk1_events)
+        engine.extend(sorted(draws, key=lambda x: x[0]))
+        return engine
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def dates(self) -> list[datetime]:
+        """Ziehungsdaten in chronologischer Reihenfolge."""
+        return list(self._dates)
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Index-Matrix (n_draws, number_range), Spalte k = Zahl k + 1 (read-only)."""
+        view = self._counts[: self._n]
+        view.flags.writeable = False
+        return view
+
+    def _reserve(self, size: int) -> None:
+        capacity = self._counts.shape[0]
+        if size <= capacity:
+            return
+        new_capacity = max(size, 2 * capacity, 64)
+        counts = np.zeros((new_capacity, self.number_range), dtype=np.int32)
+        last_seen = np.full((new_capacity, self.number_range), -1, dtype=np.int32)
+        counts[: self._n] = self._counts[: self._n]
+        last_seen[: self._n] = self._last_seen[: self._n]
+        self._counts, self._last_seen = counts, last_seen
+
+    def _event_for(self, draw_date: datetime) -> tuple[datetime, int] | None:
+        """Letztes GK1-Event mit event_date <= draw_date."""
+        pos = bisect.bisect_right(self._events, draw_date, key=lambda e: e[0])
+        return self._events[pos - 1] if pos > 0 else None
+
+    def _append_row(self, draw_date: datetime, numbers: list[int]) -> None:
+        pos = self._n
+        event = self._event_for(draw_date)
+        reset_date = event[0] if event else None
+
+        new_segment = not self._segments or (
+            reset_date is not None
+            and (self._segments[-1][1] is None or reset_date > self._segments[-1][1])
+        )
+        if new_segment:
+            self._segments.append((pos, reset_date, event[1] if event else None))
+
+        row = np.zeros(self.number_range, dtype=np.int32)
+        valid = [n - 1 for n in numbers if 1 <= n <= self.number_range]
+        np.add.at(row, valid, 1)
+
+        self._reserve(pos + 1)
+        if new_segment:
+            self._counts[pos] = row
+            self._last_seen[pos] = np.where(row > 0, pos, -1)
+        else:
+            self._counts[pos] = self._counts[pos - 1] + row
+            self._last_seen[pos] = np.where(row > 0, pos, self._last_seen[pos - 1])
+
+        self._dates.append(draw_date)
+        self._numbers.append(list(numbers))
+        self._n = pos + 1
+
+    def append_draw(self, draw_date: datetime, numbers: list[int]) -> None:
+        """Haengt eine neue Ziehung an (O(number_range)).
+
+        Args:
+            draw_date: Datum der Ziehung (>= letzte Ziehung)
+            numbers: Gezogene Zahlen
+
+        Raises:
+            ValueError: Wenn draw_date vor der letzten Ziehung liegt.
+        """
+        if self._dates and draw_date < self._dates[-1]:
+            raise ValueError(
+                f"Draws must be appended chronologically: {draw_date} < {self._dates[-1]}"
+            )
+        self._append_row(draw_date, numbers)
+
+    def extend(self, draws: list[tuple[datetime, list[int]]]) -> None:
+        """Haengt mehrere chronologisch sortierte Ziehungen an."""
+        self._reserve(self._n + len(draws))
+        for draw_date, numbers in draws:
+            self.append_draw(draw_date, numbers)
+
+    def add_gk1_event(self, event_date: datetime, keno_type: int) -> None:
+        """Registriert ein GK1-Event.
+
+        Liegt das Event nach der letzten Ziehung, ist nichts neu zu berechnen.
+        Sonst werden die Zeilen ab der ersten Ziehung mit draw_date >= event_date
+        neu aufgebaut.
+
+        Args:
+            event_date: Datum des GK1-Events
+            keno_type: Keno-Typ (9 oder 10)
+        """
+        bisect.insort_right(self._events, (event_date, keno_type), key=lambda e: e[0])
+        if self._dates and event_date <= self._dates[-1]:
+            self._rebuild_from(bisect.bisect_left(self._dates, event_date))
+
+    def _rebuild_from(self, pos: int) -> None:
+        replay = list(zip(self._dates[pos:], self._numbers[pos:]))
+        del self._dates[pos:]
+        del self._numbers[pos:]
+        self._segments = [seg for seg in self._segments if seg[0] < pos]
+        self._n = pos
+        for draw_date, numbers in replay:
+            self._append_row(draw_date, numbers)
+
+    def position(self, at: datetime | None = None) -> int:
+        """Position der letzten Ziehung mit draw_date <= at (-1 wenn keine)."""
+        if at is None:
+            return self._n - 1
+        return bisect.bisect_right(self._dates, at) - 1
+
+    def _segment_at(self, pos: int) -> tuple[int, datetime | None, int | None]:
+        idx = bisect.bisect_right(self._segments, pos, key=lambda seg: seg[0]) - 1
+        return self._segments[idx]
+
+    def segments(self) -> list[tuple[int, int]]:
+        """Segmentgrenzen als (start, end) Positionen (end exklusiv)."""
+        starts = [seg[0] for seg in self._segments]
+        return list(zip(starts, starts[1:] + [self._n]))
+
+    def index_vector(self, at: datetime | None = None) -> np.ndarray:
+        """Index aller Zahlen zum Stichtag (Laenge number_range, Kopie)."""
+        pos = self.position(at)
+        if pos < 0:
+            return np.zeros(self.number_range, dtype=np.int32)
+        return self._counts[pos].copy()
+
+    def occurrences(self, start: int, end: int) -> np.ndarray:
+        """Erscheinungen pro Ziehung fuer Positionen [start, end).
+
+        Args:
+            start: Erste Position
+            end: Position nach der letzten (exklusiv)
+
+        Returns:
+            Array (end - start, number_range) mit Vorkommen je Ziehung.
+        """
+        rows = self._counts[start:end].astype(np.int32, copy=True)
+        if end <= start:
+            return rows
+        positions = np.arange(start, end)
+        starts = np.array([seg[0] for seg in self._segments])
+        continues = ~np.isin(positions, starts)
+        rows[continues] -= self._counts[positions[continues] - 1]
+        return rows
+
+    def index_table(self, at: datetime | None = None) -> IndexResult:
+        """Index-Tabelle zum Stichtag als direkter Lookup.
+
+        Args:
+            at: Stichtag (None = letzte Ziehung)
+
+        Returns:
+            IndexResult wie calculate_index_table fuer alle Ziehungen <= at
+        """
+        pos = self.position(at)
+        if pos < 0:
+            return IndexResult(
+                indices={
+                    num: NumberIndex(
+                        number=num, current_index=0, last_seen=None, total_appearances=0
+                    )
+                    for num in range(1, self.number_range + 1)
+                },
+                last_reset_date=None,
+                draws_since_reset=0,
+                gk1_event_type=None,
+            )
+
+        start, reset_date, keno_type = self._segment_at(pos)
+        counts = self._counts[pos].tolist()
+        last_seen = self._last_seen[pos].tolist()
+
+        indices = {
+            num: NumberIndex(
+                number=num,
+                current_index=counts[num - 1],
+                last_seen=self._dates[last_seen[num - 1]] if last_seen[num - 1] >= 0 else None,
+                total_appearances=counts[num - 1],
+            )
+            for num in range(1, self.number_range + 1)
+        }
+        return IndexResult(
+            indices=indices,
+            last_reset_date=reset_date,
+            draws_since_reset=pos - start + 1,
+            gk1_event_type=keno_type,
+        )
+
+
 def calculate_index_table(
     draws: list[tuple[datetime, list[int]]],
     gk1_events: list[tuple[datetime, int]],
@@ -104,63 +362,7 @@ def calculate_index_table(
     Returns:
         IndexResult mit Index-Werten fuer alle Zahlen
     """
-    # Initialisiere Index fuer alle Zahlen
-    indices: dict[int, NumberIndex] = {}
-    for num in range(1, number_range + 1):
-        indices[num] = NumberIndex(
-            number=num,
-            current_index=0,
-            last_seen=None,
-            total_appearances=0,
-        )
-
-    if not draws:
-        return IndexResult(
-            indices=indices,
-            last_reset_date=None,
-            draws_since_reset=0,
-            gk1_event_type=None,
-        )
-
-    # Sortiere GK1-Events nach Datum
-    gk1_sorted = sorted(gk1_events, key=lambda x: x[0])
-
-    # Finde letztes GK1-Event vor oder am letzten Draw-Datum
-    last_draw_date = draws[-1][0]
-    last_reset_date = None
-    last_gk1_type = None
-
-    for gk1_date, gk1_type in reversed(gk1_sorted):
-        if gk1_date <= last_draw_date:
-            last_reset_date = gk1_date
-            last_gk1_type = gk1_type
-            break
-
-    # Zaehle Erscheinungen seit letztem Reset
-    draws_since_reset = 0
-    for draw_date, numbers in draws:
-        # Nur Ziehungen nach dem letzten Reset zaehlen
-        if last_reset_date is not None and draw_date < last_reset_date:
-            continue
-
-        draws_since_reset += 1
-
-        for num in numbers:
-            if 1 <= num <= number_range:
-                idx = indices[num]
-                indices[num] = NumberIndex(
-                    number=num,
-                    current_index=idx.current_index + 1,
-                    last_seen=draw_date,
-                    total_appearances=idx.total_appearances + 1,
-                )
-
-    return IndexResult(
-        indices=indices,
-        last_reset_date=last_reset_date,
-        draws_since_reset=draws_since_reset,
-        gk1_event_type=last_gk1_type,
-    )
+    return GK1IndexEngine.from_draws(draws, gk1_events, number_range).index_table()
 
 
 def calculate_index_correlation(
@@ -197,67 +399,38 @@ def calculate_index_correlation(
             interpretation="Insufficient data (< 20 draws)",
         )
 
-    # Sortiere Events
-    gk1_sorted = sorted(gk1_events, key=lambda x: x[0])
-    draws_sorted = sorted(draws, key=lambda x: x[0])
-
-    # Erstelle Segmente zwischen GK1-Events
-    segments: list[list[tuple[datetime, list[int]]]] = []
-    current_segment: list[tuple[datetime, list[int]]] = []
-    gk1_idx = 0
-
-    for draw_date, numbers in draws_sorted:
-        # Pruefe ob wir ein GK1-Event erreicht haben
-        while gk1_idx < len(gk1_sorted) and gk1_sorted[gk1_idx][0] <= draw_date:
-            if current_segment:
-                segments.append(current_segment)
-                current_segment = []
-            gk1_idx += 1
-
-        current_segment.append((draw_date, numbers))
-
-    # Letztes Segment hinzufuegen
-    if current_segment:
-        segments.append(current_segment)
+    engine = GK1IndexEngine.from_draws(draws, gk1_events, number_range)
+    segments = engine.segments()
 
     # Analysiere jeden Segment
     all_hits_high: list[int] = []
     all_hits_low: list[int] = []
     segment_details: list[dict[str, Any]] = []
 
-    for seg_idx, segment in enumerate(segments):
-        if len(segment) < 10:
+    for seg_idx, (start, end) in enumerate(segments):
+        seg_len = end - start
+        if seg_len < 10:
             continue
 
-        # Rolling Index innerhalb des Segments
-        for i in range(5, len(segment) - 1):
-            # Berechne Index basierend auf bisherigen Ziehungen im Segment
-            index_counts: dict[int, int] = {n: 0 for n in range(1, number_range + 1)}
-            for j in range(i):
-                for num in segment[j][1]:
-                    if 1 <= num <= number_range:
-                        index_counts[num] += 1
-
-            # Top-N Zahlen nach Index
-            sorted_by_index = sorted(
-                index_counts.items(), key=lambda x: x[1], reverse=True
-            )
-            top_numbers = {num for num, _ in sorted_by_index[:top_n]}
-            bottom_numbers = {num for num, _ in sorted_by_index[-top_n:]}
-
-            # Pruefe naechste Ziehung
-            next_draw = set(segment[i + 1][1])
+        # Index vor Ziehung i (= kumuliert bis i - 1) fuer i in [5, seg_len - 1)
+        index_rows = engine.counts[start + 4 : end - 2]
+        # Stabil absteigend: Gleichstand nach aufsteigender Zahl (wie sorted(reverse=True))
+        order = np.argsort(-index_rows, axis=1, kind="stable")
+        top_cols = order[:, :top_n]
+        bottom_cols = order[:, -top_n:]
 
-            hits_high = len(next_draw & top_numbers)
-            hits_low = len(next_draw & bottom_numbers)
+        # Naechste Ziehung i + 1
+        next_present = engine.occurrences(start + 6, end) > 0
+        hits_high = np.take_along_axis(next_present, top_cols, axis=1).sum(axis=1)
+        hits_low = np.take_along_axis(next_present, bottom_cols, axis=1).sum(axis=1)
 
-            all_hits_high.append(hits_high)
-            all_hits_low.append(hits_low)
+        all_hits_high.extend(hits_high.tolist())
+        all_hits_low.extend(hits_low.tolist())
 
         segment_details.append({
             "segment": seg_idx,
-            "n_draws": len(segment),
-            "mean_hits_high": np.mean(all_hits_high[-len(segment):]) if all_hits_high else 0,
+            "n_draws": seg_len,
+            "mean_hits_high": np.mean(all_hits_high[-seg_len:]) if all_hits_high else 0,
         })
 
     if not all_hits_high:
@@ -368,6 +541,7 @@ def export_index_table(
 
 
 __all__ = [
+    "GK1IndexEngine",
     "NumberIndex",
     "IndexResult",
     "CorrelationResult",
@@ -34,7 +34,8 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
-from kenobase.analysis.distribution import load_gq_data
+from kenobase.core.draw_collection import filter_draws_by_date
+from kenobase.core.gq_store import load_gq_frame
 
 if TYPE_CHECKING:
     from kenobase.core.data_loader import DrawResult
@@ -133,11 +134,11 @@ def load_gq_winner_data(
         lambda: defaultdict(float)
     )
 
-    df = load_gq_data(str(file_path), encoding=encoding)
+    df = load_gq_frame(file_path, encoding=encoding)
     if df.empty:
         return {}
 
-    grouped = df.groupby(["Datum", "Keno-Typ"])["Anzahl der Gewinner"].sum()
+    grouped = df.groupby(["date", "keno_type"])["winners"].sum()
     for (date, keno_typ), winners in grouped.items():
         date_winners[pd.Timestamp(date).to_pydatetime()][int(keno_typ)] = float(winners)
 
@@ -245,11 +246,7 @@ def calculate_draw_frequency(
         return {}
 
     # Filter by date range
-    filtered = draws
-    if start_date:
-        filtered = [d for d in filtered if d.date >= start_date]
-    if end_date:
-        filtered = [d for d in filtered if d.date <= end_date]
+    filtered = filter_draws_by_date(draws, start_date, end_date)
 
     if not filtered:
         return {}
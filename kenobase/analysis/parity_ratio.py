@@ -7,6 +7,7 @@ Kernausgaben:
 - Counts fuer gerade und ungerade Zahlen
 - Binomial-Test gegen 50/50 Erwartung
 - Chi-Quadrat-Test fuer Verteilungsvergleich
+- Exakter Test der Gerade-Anzahl pro Ziehung (hypergeometrisches Nullmodell)
 - Guardrail: maximal zulaessige Abweichung von 10% (konfigurierbar)
 """
 
@@ -19,6 +20,7 @@ import numpy as np
 from scipy import stats
 
 from kenobase.core.data_loader import DrawResult
+from kenobase.core.exact_distribution import exact_distribution
 
 
 @dataclass(frozen=True)
@@ -50,6 +52,9 @@ class ParityRatioResult:
     guardrail_breached: bool
     bins: List[ParityBin]
     warnings: list[str]
+    # Gerade-Anzahl pro Ziehung gegen die exakte (hypergeometrische) Verteilung
+    per_draw_chi_square: float = 0.0
+    per_draw_p_value: float = 1.0
 
 
 def is_even(number: int) -> bool:
@@ -71,10 +76,41 @@ def count_parity(numbers: list[int]) -> tuple[int, int]:
     return even, odd
 
 
+def per_draw_even_test(
+    draws: list[DrawResult],
+    max_number: Optional[int] = None,
+) -> tuple[float, float]:
+    """Chi-Quadrat-Test der Gerade-Anzahl pro Ziehung gegen die exakte Verteilung.
+
+    Nullmodell: k Zahlen ohne Zuruecklegen aus 1..max_number, d.h.
+    P(e gerade) = C(E, e) * C(O, k - e) / C(N, k).
+
+    Args:
+        draws: Liste von Ziehungsergebnissen (gleiche Anzahl Zahlen)
+        max_number: Groesste Zahl (inferiert aus den Ziehungen wenn None)
+
+    Returns:
+        Tuple (chi_square, p_value); (0.0, 1.0) wenn kein Test moeglich ist.
+    """
+    sizes = {len(d.numbers) for d in draws}
+    if len(sizes) != 1:
+        return 0.0, 1.0
+    k = sizes.pop()
+    max_val = max_number or max((max(d.numbers) for d in draws if d.numbers), default=0)
+    if k == 0 or k > max_val:
+        return 0.0, 1.0
+
+    dist = exact_distribution("even", numbers_max=max_val, numbers_drawn=k)
+    evens = [count_parity(d.numbers)[0] for d in draws]
+    chi_square, p_value, _ = dist.chi_square(evens)
+    return chi_square, p_value
+
+
 def analyze_parity_ratio(
     draws: list[DrawResult],
     numbers_per_draw: Optional[int] = None,
     guardrail_ratio: float = 0.10,
+    max_number: Optional[int] = None,
 ) -> ParityRatioResult:
     """Berechnet Paritaets-Verteilung und statistische Tests gegen 50/50.
 
@@ -82,6 +118,7 @@ def analyze_parity_ratio(
         draws: Liste von Ziehungsergebnissen
         numbers_per_draw: Optionale Anzahl Zahlen pro Ziehung (inferiert wenn None)
         guardrail_ratio: Maximal erlaubte Abweichung von 50% (default 10%)
+        max_number: Groesste Zahl fuer den exakten Test pro Ziehung (inferiert wenn None)
 
     Returns:
         ParityRatioResult mit allen Metriken
@@ -161,6 +198,13 @@ def analyze_parity_ratio(
     )
     binomial_p_value = binomial_result.pvalue
 
+    per_draw_chi_square, per_draw_p_value = per_draw_even_test(draws, max_number)
+    if max_number is None:
+        warnings.append(
+            "max_number not given; per-draw exact test infers N from the largest "
+            "observed number (pass the game's numbers_range)"
+        )
+
     # Erzeuge Bins
     bins = [
         ParityBin(
@@ -200,6 +244,8 @@ def analyze_parity_ratio(
         guardrail_breached=guardrail_breached,
         bins=bins,
         warnings=warnings,
+        per_draw_chi_square=float(per_draw_chi_square),
+        per_draw_p_value=float(per_draw_p_value),
     )
 
 
@@ -209,4 +255,5 @@ __all__ = [
     "analyze_parity_ratio",
     "count_parity",
     "is_even",
+    "per_draw_even_test",
 ]
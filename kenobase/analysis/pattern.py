@@ -30,6 +30,10 @@ from dataclasses import dataclass, field
 from itertools import combinations
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from kenobase.core.bitmask import encode, encode_draws, intersection_count
+
 if TYPE_CHECKING:
     from kenobase.core.data_loader import DrawResult
 
@@ -162,13 +166,16 @@ def extract_patterns_from_draws(
         >>> len([r for r in results if r.match_count >= 4])
         3  # Anzahl Ziehungen mit 4+ Treffern
     """
-    results = []
-    for draw in draws:
-        pattern = extract_patterns(combination, draw.numbers)
-        # Only include draws with at least 2 matches (at least one duo)
-        if pattern.match_count >= 2:
-            results.append(pattern)
-    return results
+    if not draws:
+        return []
+
+    # Trefferzahl per Bitmaske vorab bestimmen; Muster nur fuer Ziehungen
+    # mit mind. 2 Treffern (mind. ein Duo) extrahieren.
+    match_counts = intersection_count(encode_draws(draws), encode(combination))
+    return [
+        extract_patterns(combination, draws[int(i)].numbers)
+        for i in np.flatnonzero(match_counts >= 2)
+    ]
 
 
 def aggregate_patterns(
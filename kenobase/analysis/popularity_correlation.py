@@ -32,7 +32,7 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
-from kenobase.analysis.distribution import load_gq_data
+from kenobase.core.gq_store import load_gq_frame
 
 if TYPE_CHECKING:
     from kenobase.core.data_loader import DrawResult
@@ -115,11 +115,11 @@ def load_gq_popularity(
         lambda: defaultdict(float)
     )
 
-    df = load_gq_data(str(file_path), encoding=encoding)
+    df = load_gq_frame(file_path, encoding=encoding)
     if df.empty:
         return {}
 
-    grouped = df.groupby(["Datum", "Keno-Typ"])["Anzahl der Gewinner"].sum()
+    grouped = df.groupby(["date", "keno_type"])["winners"].sum()
     for (date, keno_typ), winners in grouped.items():
         weight = int(keno_typ) / 10.0
         date_popularity[pd.Timestamp(date).to_pydatetime()][int(keno_typ)] = float(winners) * weight
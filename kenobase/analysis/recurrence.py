@@ -34,6 +34,8 @@ from datetime import datetime
 from itertools import combinations
 from typing import TYPE_CHECKING
 
+from kenobase.core.draw_collection import sort_draws
+
 if TYPE_CHECKING:
     from kenobase.core.data_loader import DrawResult
 
@@ -185,7 +187,7 @@ def analyze_recurrence(
         )
 
     # Sort by date ascending
-    sorted_draws = sorted(draws, key=lambda d: d.date)
+    sorted_draws = sort_draws(draws)
 
     recurrence_counts: list[int] = []
     recurrence_by_number: Counter[int] = Counter()
@@ -322,7 +324,7 @@ def calculate_gk1_correlation(
         )
 
     # Sort draws by date
-    sorted_draws = sorted(draws, key=lambda d: d.date)
+    sorted_draws = sort_draws(draws)
     gk1_date_set = set(gk1_dates)
 
     # Build date-to-draw index
@@ -400,7 +402,7 @@ def analyze_number_streaks(
         >>> for num, series in streaks.items():
         ...     print(f"Zahl {num}: {len(series)} Serien")
     """
-    sorted_draws = sorted(draws, key=lambda d: d.date)
+    sorted_draws = sort_draws(draws)
 
     # Track current streaks for each number
     current_streak: dict[int, tuple[datetime, int]] = {}  # num -> (start_date, length)
@@ -465,7 +467,7 @@ def analyze_weekly_cycle(
     if len(draws) < 2:
         return WeeklyCycleResult(total_draws=len(draws))
 
-    sorted_draws = sorted(draws, key=lambda d: d.date)
+    sorted_draws = sort_draws(draws)
 
     # Track draws and recurrences by weekday
     draws_by_weekday: dict[int, int] = {i: 0 for i in range(7)}
@@ -540,7 +542,7 @@ def analyze_recurrence_days(
 
     from datetime import timedelta
 
-    sorted_draws = sorted(draws, key=lambda d: d.date)
+    sorted_draws = sort_draws(draws)
 
     recurrence_counts: list[int] = []
     recurrence_by_number: Counter[int] = Counter()
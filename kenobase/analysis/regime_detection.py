@@ -30,6 +30,7 @@ except ImportError:  # pragma: no cover - handled via fallback
     KMeans = None
 
 from kenobase.core.data_loader import DrawResult
+from kenobase.core.draw_collection import DrawCollection
 from kenobase.core.economic_state import (
     classify_economic_state,
     compute_rolling_cv,
@@ -314,9 +315,9 @@ def detect_regimes(
             train_size=0,
         )
 
-    sorted_draws = sorted(draws, key=lambda d: d.date)
+    sorted_draws = DrawCollection(draws)
     dates = [d.date for d in sorted_draws]
-    train_mask = np.array([d.date < cfg.train_split_date for d in sorted_draws])
+    train_mask = sorted_draws.dates < np.datetime64(cfg.train_split_date, "us")
 
     spieleinsatz = [parse_spieleinsatz(d.metadata) for d in sorted_draws]
     jackpot = [parse_jackpot(d.metadata) for d in sorted_draws]
@@ -19,6 +19,9 @@ Usage:
     draws = loader.load("data/raw/keno/KENO.csv")
     results = analyze_stable_numbers(draws, window=50, threshold=0.90)
     stable = [r for r in results if r.is_stable]
+
+    # Mehrere Fenstergroessen aus einer Praesenzmatrix
+    by_window = analyze_stable_numbers_multi(draws, windows=[20, 50, 100])
 """
 
 from __future__ import annotations
@@ -26,11 +29,15 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 import numpy as np
 
-from kenobase.analysis.frequency import calculate_rolling_frequency
+from kenobase.analysis.frequency import (
+    build_presence_matrix,
+    presence_cumsum,
+    rolling_window_counts_from_cumsum,
+)
 
 if TYPE_CHECKING:
     from kenobase.core.data_loader import DrawResult
@@ -96,6 +103,118 @@ def calculate_stability_score(rolling_frequencies: list[float]) -> tuple[float,
     return stability, mean_val, std_val
 
 
+def calculate_stability_scores(
+    rolling_matrix: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vektorisierte Variante von calculate_stability_score fuer alle Spalten.
+
+    Args:
+        rolling_matrix: Array (n_windows, n_numbers) mit relativen Frequenzen
+
+    Returns:
+        Tuple (stability_scores, means, stds), jeweils Laenge n_numbers.
+        Spalten mit mean = 0 erhalten stability_score = 0.0.
+    """
+    n_numbers = rolling_matrix.shape[1] if rolling_matrix.ndim == 2 else 0
+    if rolling_matrix.size == 0:
+        zeros = np.zeros(n_numbers)
+        return zeros, zeros.copy(), zeros.copy()
+
+    # Zeilen pro Zahl zusammenhaengend -> gleiche Summationsreihenfolge wie 1D
+    per_number = np.ascontiguousarray(rolling_matrix.T, dtype=np.float64)
+    means = per_number.mean(axis=1)
+    stds = per_number.std(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stability = np.where(means > 0, 1.0 - stds / means, 0.0)
+    stability = np.clip(stability, 0.0, 1.0)
+    return stability, means, stds
+
+
+def _resolve_number_range(
+    draws: list[DrawResult],
+    number_range: tuple[int, int] | None,
+) -> tuple[int, int] | None:
+    if number_range is not None:
+        return number_range
+    all_numbers = {n for draw in draws for n in draw.numbers}
+    if not all_numbers:
+        return None
+    return min(all_numbers), max(all_numbers)
+
+
+def analyze_stable_numbers_multi(
+    draws: list[DrawResult],
+    windows: Iterable[int],
+    stability_threshold: float = 0.90,
+    number_range: tuple[int, int] | None = None,
+) -> dict[int, list[StableNumberResult]]:
+    """Analysiert Stabilitaet fuer mehrere Fenstergroessen in einem Durchlauf.
+
+    Die Praesenzmatrix und ihre kumulative Summe werden einmal berechnet;
+    jede Fenstergroesse ist danach eine Differenz zweier Zeilen-Slices.
+
+    Args:
+        draws: Liste von DrawResult-Objekten (chronologisch sortiert)
+        windows: Fenstergroessen
+        stability_threshold: Schwellwert fuer "stabil" (default 0.90)
+        number_range: Zahlenbereich (min, max). Wenn None, wird aus draws abgeleitet.
+
+    Returns:
+        Dict window -> Liste von StableNumberResult (sortiert nach
+        stability_score absteigend). Fenster groesser als die Anzahl
+        Ziehungen liefern eine leere Liste.
+
+    Raises:
+        ValueError: Wenn ein window < 1 oder stability_threshold nicht in [0, 1]
+    """
+    windows = list(windows)
+    for window in windows:
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+    if not 0.0 <= stability_threshold <= 1.0:
+        raise ValueError(f"stability_threshold must be in [0, 1], got {stability_threshold}")
+
+    output: dict[int, list[StableNumberResult]] = {window: [] for window in windows}
+    if not draws:
+        return output
+
+    resolved = _resolve_number_range(draws, number_range)
+    if resolved is None:
+        return output
+    min_num, max_num = resolved
+
+    cumsum = presence_cumsum(build_presence_matrix(draws, resolved))
+    numbers = range(min_num, max_num + 1)
+
+    for window in windows:
+        if len(draws) < window:
+            # Nicht genug Daten fuer Rolling-Berechnung
+            continue
+
+        rolling = rolling_window_counts_from_cumsum(cumsum, window) / window
+        stability, means, stds = calculate_stability_scores(rolling)
+        data_points = rolling.shape[0]
+
+        results = [
+            StableNumberResult(
+                number=number,
+                stability_score=float(stability[i]),
+                is_stable=bool(stability[i] >= stability_threshold),
+                avg_frequency=float(means[i]),
+                std_frequency=float(stds[i]),
+                window=window,
+                data_points=data_points,
+            )
+            for i, number in enumerate(numbers)
+        ]
+        # Sort by stability_score descending
+        results.sort(key=lambda r: r.stability_score, reverse=True)
+        output[window] = results
+
+    return output
+
+
 def analyze_stable_numbers(
     draws: list[DrawResult],
     window: int = 50,
@@ -109,6 +228,9 @@ def analyze_stable_numbers(
     2. Berechne stability_score = 1 - (std / mean)
     3. Klassifiziere als stabil wenn score >= threshold
 
+    Alle Zahlen werden gemeinsam aus einer Rolling-Frequency-Matrix
+    berechnet (siehe analyze_stable_numbers_multi).
+
     Args:
         draws: Liste von DrawResult-Objekten (chronologisch sortiert)
         window: Fenstergroesse fuer Rolling-Frequency (default 50)
@@ -128,70 +250,12 @@ def analyze_stable_numbers(
         >>> len(stable_numbers)
         12
     """
-    if window < 1:
-        raise ValueError(f"window must be >= 1, got {window}")
-    if not 0.0 <= stability_threshold <= 1.0:
-        raise ValueError(f"stability_threshold must be in [0, 1], got {stability_threshold}")
-
-    if not draws:
-        return []
-
-    if len(draws) < window:
-        # Nicht genug Daten fuer Rolling-Berechnung
-        return []
-
-    # Determine number range
-    if number_range is None:
-        # Infer from data
-        all_numbers = set()
-        for draw in draws:
-            all_numbers.update(draw.numbers)
-        if not all_numbers:
-            return []
-        min_num = min(all_numbers)
-        max_num = max(all_numbers)
-    else:
-        min_num, max_num = number_range
-
-    results: list[StableNumberResult] = []
-
-    for number in range(min_num, max_num + 1):
-        # Calculate rolling frequency for this number
-        rolling_freqs = calculate_rolling_frequency(draws, window, number)
-
-        if not rolling_freqs:
-            # Nicht genug Daten
-            results.append(
-                StableNumberResult(
-                    number=number,
-                    stability_score=0.0,
-                    is_stable=False,
-                    avg_frequency=0.0,
-                    std_frequency=0.0,
-                    window=window,
-                    data_points=0,
-                )
-            )
-            continue
-
-        stability, avg_freq, std_freq = calculate_stability_score(rolling_freqs)
-
-        results.append(
-            StableNumberResult(
-                number=number,
-                stability_score=stability,
-                is_stable=stability >= stability_threshold,
-                avg_frequency=avg_freq,
-                std_frequency=std_freq,
-                window=window,
-                data_points=len(rolling_freqs),
-            )
-        )
-
-    # Sort by stability_score descending
-    results.sort(key=lambda r: r.stability_score, reverse=True)
-
-    return results
+    return analyze_stable_numbers_multi(
+        draws,
+        windows=[window],
+        stability_threshold=stability_threshold,
+        number_range=number_range,
+    )[window]
 
 
 def get_stable_numbers(
@@ -261,7 +325,9 @@ def export_stable_numbers(
 __all__ = [
     "StableNumberResult",
     "calculate_stability_score",
+    "calculate_stability_scores",
     "analyze_stable_numbers",
+    "analyze_stable_numbers_multi",
     "get_stable_numbers",
     "export_stable_numbers",
 ]
@@ -21,7 +21,7 @@ Usage:
         classify_numbers_by_stake,
     )
 
-    # Load and analyze
+    # Load and analyze (StakeDataset: columnar, iterates StakeDrawRecord lazily)
     stake_data = load_stake_data("Keno_GPTs/Keno_Ziehung2023_+_Restbetrag_v2.CSV")
     result = analyze_stake_correlation(stake_data)
 """
@@ -29,11 +29,12 @@ Usage:
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Union
 
 import numpy as np
 import pandas as pd
@@ -44,6 +45,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# KENO: 20 aus 70
+KENO_MAX_NUMBER = 70
+NUMBERS_PER_DRAW = 20
+
 
 @dataclass(frozen=True)
 class StakeCorrelationResult:
@@ -131,21 +136,194 @@ class StakeDrawRecord:
     kasse: float
 
 
+class StakeDataset(Sequence[StakeDrawRecord]):
+    """Columnar stake data: one array per column instead of one object per draw.
+
+    Behaves like a read-only sequence of StakeDrawRecord (records are built
+    lazily on access), so existing record-based code keeps working while the
+    analyses in this module operate on the arrays directly.
+
+    Attributes:
+        dates: Draw dates, datetime64[ns], shape (n,)
+        numbers: Drawn numbers, int16, shape (n, 20); 0 marks a missing number
+        spieleinsatz: Stake amount per draw
+        total_gewinner: Total winners per draw (int64)
+        total_auszahlung: Total payout per draw
+        restbetrag: Remaining amount after payout per draw
+        kasse: Running total per draw
+    """
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        numbers: np.ndarray,
+        spieleinsatz: np.ndarray,
+        total_gewinner: np.ndarray,
+        total_auszahlung: np.ndarray,
+        restbetrag: np.ndarray,
+        kasse: np.ndarray,
+    ) -> None:
+        self.dates = np.asarray(dates, dtype="datetime64[ns]")
+        self.numbers = np.asarray(numbers, dtype=np.int16)
+        self.spieleinsatz = np.asarray(spieleinsatz, dtype=np.float64)
+        self.total_gewinner = np.asarray(total_gewinner, dtype=np.int64)
+        self.total_auszahlung = np.asarray(total_auszahlung, dtype=np.float64)
+        self.restbetrag = np.asarray(restbetrag, dtype=np.float64)
+        self.kasse = np.asarray(kasse, dtype=np.float64)
+
+    @classmethod
+    def empty(cls) -> StakeDataset:
+        """Dataset without draws."""
+        zeros = np.zeros(0)
+        return cls(zeros, np.zeros((0, NUMBERS_PER_DRAW)), zeros, zeros, zeros, zeros, zeros)
+
+    @classmethod
+    def from_records(cls, records: Sequence[StakeDrawRecord]) -> StakeDataset:
+        """Build a dataset from StakeDrawRecord objects.
+
+        Args:
+            records: Stake records (numbers may have any length)
+
+        Returns:
+            StakeDataset with the same draws in the same order
+        """
+        if isinstance(records, StakeDataset):
+            return records
+        records = list(records)
+        if not records:
+            return cls.empty()
+        width = max(NUMBERS_PER_DRAW, max(len(r.numbers) for r in records))
+        numbers = np.zeros((len(records), width), dtype=np.int16)
+        for row, rec in enumerate(records):
+            numbers[row, : len(rec.numbers)] = rec.numbers
+        return cls(
+            dates=np.array([np.datetime64(r.date, "ns") for r in records]),
+            numbers=numbers,
+            spieleinsatz=np.array([r.spieleinsatz for r in records], dtype=np.float64),
+            total_gewinner=np.array([r.total_gewinner for r in records], dtype=np.int64),
+            total_auszahlung=np.array([r.total_auszahlung for r in records], dtype=np.float64),
+            restbetrag=np.array([r.restbetrag for r in records], dtype=np.float64),
+            kasse=np.array([r.kasse for r in records], dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self))[index])
+        row = self.numbers[index]
+        return StakeDrawRecord(
+            date=pd.Timestamp(self.dates[index]).to_pydatetime(),
+            numbers=row[row > 0].tolist(),
+            spieleinsatz=float(self.spieleinsatz[index]),
+            total_gewinner=int(self.total_gewinner[index]),
+            total_auszahlung=float(self.total_auszahlung[index]),
+            restbetrag=float(self.restbetrag[index]),
+            kasse=float(self.kasse[index]),
+        )
+
+    def __iter__(self) -> Iterator[StakeDrawRecord]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def take(self, indices: np.ndarray) -> StakeDataset:
+        """Subset by row indices or boolean mask."""
+        return StakeDataset(
+            dates=self.dates[indices],
+            numbers=self.numbers[indices],
+            spieleinsatz=self.spieleinsatz[indices],
+            total_gewinner=self.total_gewinner[indices],
+            total_auszahlung=self.total_auszahlung[indices],
+            restbetrag=self.restbetrag[indices],
+            kasse=self.kasse[indices],
+        )
+
+    def to_records(self) -> list[StakeDrawRecord]:
+        """Materialize all draws as StakeDrawRecord objects."""
+        return list(self)
+
+    @cached_property
+    def draw_sizes(self) -> np.ndarray:
+        """Number of drawn numbers per draw."""
+        return (self.numbers > 0).sum(axis=1)
+
+    @cached_property
+    def number_counts(self) -> np.ndarray:
+        """Occurrences of each number (index 1-70; index 0 unused)."""
+        return self._bincount(None)
+
+    def _bincount(self, values: np.ndarray | None) -> np.ndarray:
+        weights = None if values is None else np.repeat(values, self.numbers.shape[1])
+        counts = np.bincount(
+            self.numbers.ravel(), weights=weights, minlength=KENO_MAX_NUMBER + 1
+        )
+        counts[0] = 0
+        return counts
+
+    def number_means(self, values: np.ndarray) -> np.ndarray:
+        """Mean of a per-draw value over the draws containing each number.
+
+        Args:
+            values: Per-draw values, shape (n,)
+
+        Returns:
+            Array indexed by number (0 unused); 0.0 for numbers never drawn
+        """
+        counts = self.number_counts
+        sums = self._bincount(np.asarray(values, dtype=np.float64))
+        return np.divide(sums, counts, out=np.zeros(len(sums)), where=counts > 0)
+
+
+StakeData = Union[StakeDataset, Sequence[StakeDrawRecord]]
+
+_AMOUNT_COLUMNS = (
+    "Spieleinsatz",
+    "Total_gewinner",
+    "Total_Auszahlung",
+    "Restbetrag_nach_Auszahlung",
+    "Kasse",
+)
+
+
+def _as_dataset(records: StakeData) -> StakeDataset:
+    return StakeDataset.from_records(records)
+
+
+def _parse_german_numbers(values: pd.Series) -> np.ndarray:
+    """Vectorized _parse_german_number for a whole column.
+
+    Returns:
+        float64 array; NaN marks values _parse_german_number rejects
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(np.float64).fillna(0.0).to_numpy()
+    text = values.astype("string").str.strip()
+    thousands_only = text.str.contains(".", regex=False) & ~text.str.contains(",", regex=False)
+    text = text.where(~thousands_only.fillna(False), text.str.replace(".", "", regex=False))
+    text = text.str.replace(",", ".", regex=False)
+    text = text.mask(text == "", "0").fillna("0")
+    return pd.to_numeric(text, errors="coerce").astype(np.float64).to_numpy()
+
+
 def load_stake_data(
     path: str | Path,
     encoding: str = "utf-8",
-) -> list[StakeDrawRecord]:
+) -> StakeDataset:
     """Load stake data from Keno_Ziehung CSV with financial columns.
 
     Format: Datum;z1;z2;...;z20;Plus-5;Spieleinsatz;Total_gewinner;
             Total_Auszahlung;Eur_pro_Spieler;Restbetrag_nach_Auszahlung;Kasse
 
+    Dates and German numerics are parsed column-wise; rows with an invalid
+    date, number or amount are skipped.
+
     Args:
         path: Path to CSV file
         encoding: File encoding (default utf-8)
 
     Returns:
-        List of StakeDrawRecord objects
+        StakeDataset (sequence of StakeDrawRecord, empty if columns are missing)
 
     Raises:
         FileNotFoundError: If file does not exist
@@ -154,8 +332,6 @@ def load_stake_data(
     if not file_path.exists():
         raise FileNotFoundError(f"Stake data file not found: {file_path}")
 
-    records: list[StakeDrawRecord] = []
-
     df = pd.read_csv(file_path, sep=";", encoding=encoding)
 
     # Normalize column names
@@ -163,53 +339,48 @@ def load_stake_data(
 
     # Check required columns
     required = ["Datum", "Spieleinsatz"]
-    number_cols = [f"z{i}" for i in range(1, 21)]
+    number_cols = [f"z{i}" for i in range(1, NUMBERS_PER_DRAW + 1)]
     required.extend(number_cols)
 
     for col in required:
         if col not in df.columns:
             logger.warning(f"Missing required column: {col} in {file_path}")
-            return []
-
-    for _, row in df.iterrows():
-        try:
-            date_str = str(row["Datum"]).strip()
-            date = datetime.strptime(date_str, "%d.%m.%Y")
-
-            # Extract drawn numbers
-            numbers = []
-            for i in range(1, 21):
-                col = f"z{i}"
-                if col in row and pd.notna(row[col]):
-                    numbers.append(int(row[col]))
-
-            # Parse stake (German format: 342.774 = 342774)
-            spieleinsatz = _parse_german_number(row.get("Spieleinsatz", 0))
-            total_gewinner = int(_parse_german_number(row.get("Total_gewinner", 0)))
-            total_auszahlung = _parse_german_number(row.get("Total_Auszahlung", 0))
-            restbetrag = _parse_german_number(
-                row.get("Restbetrag_nach_Auszahlung", 0)
-            )
-            kasse = _parse_german_number(row.get("Kasse", 0))
-
-            records.append(
-                StakeDrawRecord(
-                    date=date,
-                    numbers=numbers,
-                    spieleinsatz=spieleinsatz,
-                    total_gewinner=total_gewinner,
-                    total_auszahlung=total_auszahlung,
-                    restbetrag=restbetrag,
-                    kasse=kasse,
-                )
-            )
+            return StakeDataset.empty()
 
-        except (ValueError, KeyError) as e:
-            logger.debug(f"Skipping row: {e}")
-            continue
-
-    logger.info(f"Loaded {len(records)} stake records from {file_path.name}")
-    return records
+    dates = pd.to_datetime(
+        df["Datum"].astype(str).str.strip(), format="%d.%m.%Y", errors="coerce"
+    )
+    valid = dates.notna().to_numpy(copy=True)
+
+    raw_numbers = df[number_cols]
+    numbers = raw_numbers.apply(pd.to_numeric, errors="coerce")
+    # Missing numbers are dropped, unparsable ones invalidate the row
+    valid &= ~(numbers.isna() & raw_numbers.notna()).any(axis=1).to_numpy()
+    numbers = numbers.fillna(0).to_numpy().astype(np.int16)
+
+    amounts = {}
+    for col in _AMOUNT_COLUMNS:
+        if col in df.columns:
+            amounts[col] = _parse_german_numbers(df[col])
+            valid &= ~np.isnan(amounts[col])
+        else:
+            amounts[col] = np.zeros(len(df))
+
+    skipped = int((~valid).sum())
+    if skipped:
+        logger.debug(f"Skipping {skipped} invalid rows")
+
+    dataset = StakeDataset(
+        dates=dates.to_numpy()[valid],
+        numbers=numbers[valid],
+        spieleinsatz=amounts["Spieleinsatz"][valid],
+        total_gewinner=amounts["Total_gewinner"][valid].astype(np.int64),
+        total_auszahlung=amounts["Total_Auszahlung"][valid],
+        restbetrag=amounts["Restbetrag_nach_Auszahlung"][valid],
+        kasse=amounts["Kasse"][valid],
+    )
+    logger.info(f"Loaded {len(dataset)} stake records from {file_path.name}")
+    return dataset
 
 
 def _parse_german_number(value) -> float:
@@ -244,24 +415,23 @@ def _parse_german_number(value) -> float:
 
 
 def aggregate_stake_by_date(
-    records: list[StakeDrawRecord],
+    records: StakeData,
 ) -> dict[datetime, float]:
     """Aggregate stake per date.
 
     Args:
-        records: List of StakeDrawRecord objects
+        records: StakeDataset or list of StakeDrawRecord objects
 
     Returns:
         Dict mapping date -> spieleinsatz
     """
-    result = {}
-    for rec in records:
-        result[rec.date] = rec.spieleinsatz
-    return result
+    data = _as_dataset(records)
+    dates = pd.DatetimeIndex(data.dates).to_pydatetime()
+    return dict(zip(dates, data.spieleinsatz.tolist()))
 
 
 def calculate_number_stake_scores(
-    records: list[StakeDrawRecord],
+    records: StakeData,
 ) -> dict[int, tuple[float, int]]:
     """Calculate average stake associated with each drawn number.
 
@@ -269,139 +439,73 @@ def calculate_number_stake_scores(
     then average by draw count.
 
     Args:
-        records: List of StakeDrawRecord objects
+        records: StakeDataset or list of StakeDrawRecord objects
 
     Returns:
         Dict mapping number -> (avg_stake, draw_count)
     """
-    number_stakes: dict[int, float] = defaultdict(float)
-    number_counts: dict[int, int] = defaultdict(int)
-
-    for rec in records:
-        for num in rec.numbers:
-            number_stakes[num] += rec.spieleinsatz
-            number_counts[num] += 1
-
-    # Calculate average
-    result = {}
-    for num in range(1, 71):  # KENO uses 1-70
-        if number_counts[num] > 0:
-            avg = number_stakes[num] / number_counts[num]
-            result[num] = (avg, number_counts[num])
-        else:
-            result[num] = (0.0, 0)
-
-    return result
+    data = _as_dataset(records)
+    counts = data.number_counts
+    means = data.number_means(data.spieleinsatz)
+    return {
+        num: (float(means[num]), int(counts[num]))
+        for num in range(1, KENO_MAX_NUMBER + 1)  # KENO uses 1-70
+    }
 
 
 def calculate_draw_frequency_from_records(
-    records: list[StakeDrawRecord],
+    records: StakeData,
 ) -> dict[int, float]:
     """Calculate draw frequency for each number from stake records.
 
     Args:
-        records: List of StakeDrawRecord objects
+        records: StakeDataset or list of StakeDrawRecord objects
 
     Returns:
         Dict mapping number -> relative_frequency (0-1)
     """
-    if not records:
+    data = _as_dataset(records)
+    if not len(data):
         return {}
 
-    from collections import Counter
-
-    counter: Counter[int] = Counter()
-    for rec in records:
-        counter.update(rec.numbers)
+    frequencies = data.number_counts / len(data)
+    return {n: float(frequencies[n]) for n in range(1, KENO_MAX_NUMBER + 1)}
 
-    total = len(records)
-    frequencies = {}
-
-    for n in range(1, 71):  # KENO uses 1-70
-        frequencies[n] = counter.get(n, 0) / total
-
-    return frequencies
 
+def _no_correlation(n_samples: int, n_draws: int) -> StakeCorrelationResult:
+    return StakeCorrelationResult(
+        pearson_r=0.0,
+        pearson_p=1.0,
+        spearman_r=0.0,
+        spearman_p=1.0,
+        is_significant=False,
+        n_samples=n_samples,
+        n_draws=n_draws,
+    )
 
-def analyze_stake_correlation(
-    records: list[StakeDrawRecord],
-) -> StakeCorrelationResult:
-    """Analyze correlation between draw frequency and stake amounts.
 
-    Tests HYP-012: Do drawn numbers correlate with stake amounts?
-    - Positive correlation: numbers in high-stake draws appear more often
-    - Negative correlation: numbers in low-stake draws appear more often
+def _correlate_with_frequency(data: StakeDataset, values: np.ndarray) -> StakeCorrelationResult:
+    """Correlate the per-number mean of a per-draw value with draw frequency.
 
     Args:
-        records: List of StakeDrawRecord objects
+        data: Stake dataset with at least one draw
+        values: Per-draw values (e.g. data.spieleinsatz)
 
     Returns:
-        StakeCorrelationResult with Pearson and Spearman correlations
+        StakeCorrelationResult over numbers 1-70
     """
-    if not records:
-        logger.warning("No stake records provided")
-        return StakeCorrelationResult(
-            pearson_r=0.0,
-            pearson_p=1.0,
-            spearman_r=0.0,
-            spearman_p=1.0,
-            is_significant=False,
-            n_samples=0,
-            n_draws=0,
-        )
-
-    if len(records) < 10:
-        logger.warning(f"Only {len(records)} stake records available")
-        return StakeCorrelationResult(
-            pearson_r=0.0,
-            pearson_p=1.0,
-            spearman_r=0.0,
-            spearman_p=1.0,
-            is_significant=False,
-            n_samples=0,
-            n_draws=len(records),
-        )
-
-    # Calculate stake scores per number
-    stake_scores = calculate_number_stake_scores(records)
-
-    # Calculate draw frequency
-    draw_freq = calculate_draw_frequency_from_records(records)
-
-    # Prepare arrays for correlation
-    numbers = sorted(set(stake_scores.keys()) & set(draw_freq.keys()))
-
-    if len(numbers) < 10:
-        logger.warning(f"Only {len(numbers)} numbers with data")
-        return StakeCorrelationResult(
-            pearson_r=0.0,
-            pearson_p=1.0,
-            spearman_r=0.0,
-            spearman_p=1.0,
-            is_significant=False,
-            n_samples=len(numbers),
-            n_draws=len(records),
-        )
-
-    stake_values = [stake_scores[n][0] for n in numbers]  # avg_stake
-    freq_values = [draw_freq[n] for n in numbers]
+    numbers = slice(1, KENO_MAX_NUMBER + 1)
+    number_values = data.number_means(values)[numbers]
+    freq_values = data.number_counts[numbers] / len(data)
+    n_samples = KENO_MAX_NUMBER
 
     # Check for constant arrays
-    if len(set(stake_values)) == 1 or len(set(freq_values)) == 1:
+    if np.ptp(number_values) == 0 or np.ptp(freq_values) == 0:
         logger.warning("Constant input detected, correlation undefined")
-        return StakeCorrelationResult(
-            pearson_r=0.0,
-            pearson_p=1.0,
-            spearman_r=0.0,
-            spearman_p=1.0,
-            is_significant=False,
-            n_samples=len(numbers),
-            n_draws=len(records),
-        )
+        return _no_correlation(n_samples, len(data))
 
-    # Calculate correlations
-    pearson_r, pearson_p = stats.pearsonr(stake_values, freq_values)
-    spearman_r, spearman_p = stats.spearmanr(stake_values, freq_values)
+    pearson_r, pearson_p = stats.pearsonr(number_values, freq_values)
+    spearman_r, spearman_p = stats.spearmanr(number_values, freq_values)
 
     # Handle NaN
     if np.isnan(pearson_r):
@@ -409,169 +513,82 @@ def analyze_stake_correlation(
     if np.isnan(spearman_r):
         spearman_r, spearman_p = 0.0, 1.0
 
-    is_significant = pearson_p < 0.05 or spearman_p < 0.05
-
     return StakeCorrelationResult(
         pearson_r=float(pearson_r),
         pearson_p=float(pearson_p),
         spearman_r=float(spearman_r),
         spearman_p=float(spearman_p),
-        is_significant=is_significant,
-        n_samples=len(numbers),
-        n_draws=len(records),
+        is_significant=bool(pearson_p < 0.05 or spearman_p < 0.05),
+        n_samples=n_samples,
+        n_draws=len(data),
     )
 
 
-def analyze_auszahlung_correlation(
-    records: list[StakeDrawRecord],
+def analyze_stake_correlation(
+    records: StakeData,
 ) -> StakeCorrelationResult:
-    """Analyze correlation between draw frequency and Total_Auszahlung.
+    """Analyze correlation between draw frequency and stake amounts.
+
+    Tests HYP-012: Do drawn numbers correlate with stake amounts?
+    - Positive correlation: numbers in high-stake draws appear more often
+    - Negative correlation: numbers in low-stake draws appear more often
 
     Args:
-        records: List of StakeDrawRecord objects
+        records: StakeDataset or list of StakeDrawRecord objects
 
     Returns:
-        StakeCorrelationResult for Total_Auszahlung correlation
+        StakeCorrelationResult with Pearson and Spearman correlations
     """
-    if not records or len(records) < 10:
-        return StakeCorrelationResult(
-            pearson_r=0.0,
-            pearson_p=1.0,
-            spearman_r=0.0,
-            spearman_p=1.0,
-            is_significant=False,
-            n_samples=0,
-            n_draws=len(records) if records else 0,
-        )
-
-    # Calculate auszahlung scores per number
-    number_auszahlung: dict[int, float] = defaultdict(float)
-    number_counts: dict[int, int] = defaultdict(int)
+    data = _as_dataset(records)
+    if not len(data):
+        logger.warning("No stake records provided")
+        return _no_correlation(0, 0)
 
-    for rec in records:
-        for num in rec.numbers:
-            number_auszahlung[num] += rec.total_auszahlung
-            number_counts[num] += 1
+    if len(data) < 10:
+        logger.warning(f"Only {len(data)} stake records available")
+        return _no_correlation(0, len(data))
 
-    auszahlung_scores = {}
-    for num in range(1, 71):
-        if number_counts[num] > 0:
-            auszahlung_scores[num] = number_auszahlung[num] / number_counts[num]
-        else:
-            auszahlung_scores[num] = 0.0
+    return _correlate_with_frequency(data, data.spieleinsatz)
 
-    draw_freq = calculate_draw_frequency_from_records(records)
 
-    numbers = sorted(set(auszahlung_scores.keys()) & set(draw_freq.keys()))
-    auszahlung_values = [auszahlung_scores[n] for n in numbers]
-    freq_values = [draw_freq[n] for n in numbers]
-
-    if len(set(auszahlung_values)) == 1 or len(set(freq_values)) == 1:
-        return StakeCorrelationResult(
-            pearson_r=0.0,
-            pearson_p=1.0,
-            spearman_r=0.0,
-            spearman_p=1.0,
-            is_significant=False,
-            n_samples=len(numbers),
-            n_draws=len(records),
-        )
+def analyze_auszahlung_correlation(
+    records: StakeData,
+) -> StakeCorrelationResult:
+    """Analyze correlation between draw frequency and Total_Auszahlung.
 
-    pearson_r, pearson_p = stats.pearsonr(auszahlung_values, freq_values)
-    spearman_r, spearman_p = stats.spearmanr(auszahlung_values, freq_values)
+    Args:
+        records: StakeDataset or list of StakeDrawRecord objects
 
-    if np.isnan(pearson_r):
-        pearson_r, pearson_p = 0.0, 1.0
-    if np.isnan(spearman_r):
-        spearman_r, spearman_p = 0.0, 1.0
+    Returns:
+        StakeCorrelationResult for Total_Auszahlung correlation
+    """
+    data = _as_dataset(records)
+    if len(data) < 10:
+        return _no_correlation(0, len(data))
 
-    return StakeCorrelationResult(
-        pearson_r=float(pearson_r),
-        pearson_p=float(pearson_p),
-        spearman_r=float(spearman_r),
-        spearman_p=float(spearman_p),
-        is_significant=pearson_p < 0.05 or spearman_p < 0.05,
-        n_samples=len(numbers),
-        n_draws=len(records),
-    )
+    return _correlate_with_frequency(data, data.total_auszahlung)
 
 
 def analyze_restbetrag_correlation(
-    records: list[StakeDrawRecord],
+    records: StakeData,
 ) -> StakeCorrelationResult:
     """Analyze correlation between draw frequency and Restbetrag.
 
     Args:
-        records: List of StakeDrawRecord objects
+        records: StakeDataset or list of StakeDrawRecord objects
 
     Returns:
         StakeCorrelationResult for Restbetrag correlation
     """
-    if not records or len(records) < 10:
-        return StakeCorrelationResult(
-            pearson_r=0.0,
-            pearson_p=1.0,
-            spearman_r=0.0,
-            spearman_p=1.0,
-            is_significant=False,
-            n_samples=0,
-            n_draws=len(records) if records else 0,
-        )
+    data = _as_dataset(records)
+    if len(data) < 10:
+        return _no_correlation(0, len(data))
 
-    # Calculate restbetrag scores per number
-    number_restbetrag: dict[int, float] = defaultdict(float)
-    number_counts: dict[int, int] = defaultdict(int)
-
-    for rec in records:
-        for num in rec.numbers:
-            number_restbetrag[num] += rec.restbetrag
-            number_counts[num] += 1
-
-    restbetrag_scores = {}
-    for num in range(1, 71):
-        if number_counts[num] > 0:
-            restbetrag_scores[num] = number_restbetrag[num] / number_counts[num]
-        else:
-            restbetrag_scores[num] = 0.0
-
-    draw_freq = calculate_draw_frequency_from_records(records)
-
-    numbers = sorted(set(restbetrag_scores.keys()) & set(draw_freq.keys()))
-    restbetrag_values = [restbetrag_scores[n] for n in numbers]
-    freq_values = [draw_freq[n] for n in numbers]
-
-    if len(set(restbetrag_values)) == 1 or len(set(freq_values)) == 1:
-        return StakeCorrelationResult(
-            pearson_r=0.0,
-            pearson_p=1.0,
-            spearman_r=0.0,
-            spearman_p=1.0,
-            is_significant=False,
-            n_samples=len(numbers),
-            n_draws=len(records),
-        )
-
-    pearson_r, pearson_p = stats.pearsonr(restbetrag_values, freq_values)
-    spearman_r, spearman_p = stats.spearmanr(restbetrag_values, freq_values)
-
-    if np.isnan(pearson_r):
-        pearson_r, pearson_p = 0.0, 1.0
-    if np.isnan(spearman_r):
-        spearman_r, spearman_p = 0.0, 1.0
-
-    return StakeCorrelationResult(
-        pearson_r=float(pearson_r),
-        pearson_p=float(pearson_p),
-        spearman_r=float(spearman_r),
-        spearman_p=float(spearman_p),
-        is_significant=pearson_p < 0.05 or spearman_p < 0.05,
-        n_samples=len(numbers),
-        n_draws=len(records),
-    )
+    return _correlate_with_frequency(data, data.restbetrag)
 
 
 def classify_numbers_by_stake(
-    records: list[StakeDrawRecord],
+    records: StakeData,
     threshold_std: float = 1.0,
 ) -> list[NumberStakeClassification]:
     """Classify numbers as low_stake, neutral, or high_stake based on correlation.
@@ -580,7 +597,7 @@ def classify_numbers_by_stake(
     high_stake numbers: above median + 1*std (appear more in high-stake draws)
 
     Args:
-        records: List of StakeDrawRecord objects
+        records: StakeDataset or list of StakeDrawRecord objects
         threshold_std: Number of standard deviations for classification (default 1.0)
 
     Returns:
@@ -726,7 +743,7 @@ class HighStakePopularityResult:
 
 
 def analyze_high_stake_popularity_bias(
-    stake_records: list[StakeDrawRecord],
+    stake_records: StakeData,
     popularity_scores: dict[int, float] | None = None,
     high_stake_percentile: float = 0.75,
     correlation_threshold: float = 0.15,
@@ -742,7 +759,7 @@ def analyze_high_stake_popularity_bias(
     3. Compute Spearman correlation between stake and unpopular-ratio
 
     Args:
-        stake_records: List of StakeDrawRecord objects with stake and numbers
+        stake_records: StakeDataset or list of StakeDrawRecord objects
         popularity_scores: Dict mapping number -> popularity (0-1). If None, uses
             heuristic based on birthday numbers and "schoene Zahlen".
         high_stake_percentile: Percentile threshold for high-stake classification
@@ -798,30 +815,27 @@ def analyze_high_stake_popularity_bias(
     }
 
     # Calculate stake threshold for high-stake classification
-    all_stakes = [rec.spieleinsatz for rec in stake_records]
-    high_stake_threshold = float(np.percentile(all_stakes, high_stake_percentile * 100))
-
-    # For each draw, calculate unpopular-ratio and stake
-    stakes = []
-    unpopular_ratios = []
-    high_stake_ratios = []
-    low_stake_ratios = []
-
-    for rec in stake_records:
-        stake = rec.spieleinsatz
-        n_unpopular = sum(1 for n in rec.numbers if n in unpopular_numbers)
-        unpopular_ratio = n_unpopular / len(rec.numbers) if rec.numbers else 0.0
-
-        stakes.append(stake)
-        unpopular_ratios.append(unpopular_ratio)
+    data = _as_dataset(stake_records)
+    stakes = data.spieleinsatz
+    high_stake_threshold = float(np.percentile(stakes, high_stake_percentile * 100))
+
+    # For each draw, calculate unpopular-ratio (index 0 = missing number)
+    is_unpopular = np.zeros(max(KENO_MAX_NUMBER, int(data.numbers.max())) + 1, dtype=bool)
+    is_unpopular[[n for n in unpopular_numbers if 0 < n < len(is_unpopular)]] = True
+    n_unpopular = is_unpopular[data.numbers].sum(axis=1)
+    unpopular_ratios = np.divide(
+        n_unpopular,
+        data.draw_sizes,
+        out=np.zeros(len(data)),
+        where=data.draw_sizes > 0,
+    )
 
-        if stake >= high_stake_threshold:
-            high_stake_ratios.append(unpopular_ratio)
-        else:
-            low_stake_ratios.append(unpopular_ratio)
+    is_high = stakes >= high_stake_threshold
+    high_stake_ratios = unpopular_ratios[is_high]
+    low_stake_ratios = unpopular_ratios[~is_high]
 
     # Calculate Spearman correlation
-    if len(set(stakes)) < 2 or len(set(unpopular_ratios)) < 2:
+    if len(np.unique(stakes)) < 2 or len(np.unique(unpopular_ratios)) < 2:
         logger.warning("Constant values detected, correlation undefined")
         return HighStakePopularityResult(
             spearman_r=0.0,
@@ -832,10 +846,10 @@ def analyze_high_stake_popularity_bias(
             n_high_stake=len(high_stake_ratios),
             high_stake_threshold=high_stake_threshold,
             mean_unpopular_ratio_high=float(np.mean(high_stake_ratios))
-            if high_stake_ratios
+            if high_stake_ratios.size
             else 0.0,
             mean_unpopular_ratio_low=float(np.mean(low_stake_ratios))
-            if low_stake_ratios
+            if low_stake_ratios.size
             else 0.0,
         )
 
@@ -845,13 +859,13 @@ def analyze_high_stake_popularity_bias(
     if np.isnan(spearman_r) or np.isnan(spearman_p):
         spearman_r, spearman_p = 0.0, 1.0
 
-    is_significant = spearman_p < 0.05
-    supports_hypothesis = abs(spearman_r) > correlation_threshold and is_significant
+    is_significant = bool(spearman_p < 0.05)
+    supports_hypothesis = bool(abs(spearman_r) > correlation_threshold and is_significant)
 
     mean_unpopular_high = (
-        float(np.mean(high_stake_ratios)) if high_stake_ratios else 0.0
+        float(np.mean(high_stake_ratios)) if high_stake_ratios.size else 0.0
     )
-    mean_unpopular_low = float(np.mean(low_stake_ratios)) if low_stake_ratios else 0.0
+    mean_unpopular_low = float(np.mean(low_stake_ratios)) if low_stake_ratios.size else 0.0
 
     logger.info(
         f"HOUSE-002: r={spearman_r:.4f}, p={spearman_p:.4f}, "
@@ -876,6 +890,7 @@ __all__ = [
     "NumberStakeClassification",
     "StakeAnalysisSummary",
     "StakeDrawRecord",
+    "StakeDataset",
     "HighStakePopularityResult",
     "load_stake_data",
     "aggregate_stake_by_date",
@@ -11,6 +11,7 @@ KENO-Kontext:
 
 Metriken:
 - Chi-Quadrat-Test gegen Gleichverteilung in Bins
+- Optional: Chi-Quadrat-Test gegen die exakte Summenverteilung (Nullmodell)
 - Cluster-Identifikation durch Peak-Erkennung
 - Konfidenzintervalle fuer Summen-Fenster
 
@@ -36,6 +37,8 @@ from typing import Optional
 import numpy as np
 from scipy import stats
 
+from kenobase.core.exact_distribution import exact_distribution
+
 logger = logging.getLogger(__name__)
 
 
@@ -108,6 +111,7 @@ class SumDistributionResult:
         chi_square: Chi-Quadrat-Testergebnis
         analysis_date: Zeitpunkt der Analyse
         data_source: Pfad zur Quelldatei
+        chi_square_exact: Test gegen die exakte Summenverteilung (falls berechnet)
     """
 
     total_draws: int
@@ -121,6 +125,7 @@ class SumDistributionResult:
     chi_square: ChiSquareResult
     analysis_date: datetime = field(default_factory=datetime.now)
     data_source: str = ""
+    chi_square_exact: Optional[ChiSquareResult] = None
 
 
 def calculate_sum_histogram(
@@ -224,6 +229,40 @@ def chi_square_uniformity_test(
     )
 
 
+def chi_square_exact_test(
+    sums: list[int],
+    numbers_range: tuple[int, int] = (1, 70),
+    numbers_drawn: int = 20,
+) -> ChiSquareResult:
+    """Fuehrt Chi-Quadrat-Test gegen die exakte Summenverteilung durch.
+
+    Im Gegensatz zu chi_square_uniformity_test ist die Nullhypothese hier
+    die tatsaechliche Verteilung der Summe von numbers_drawn Zahlen ohne
+    Zuruecklegen (Werte mit kleiner Erwartung werden zusammengefasst).
+
+    Args:
+        sums: Liste der Summen pro Ziehung
+        numbers_range: (min, max) des Zahlenbereichs
+        numbers_drawn: Anzahl gezogener Zahlen pro Ziehung
+
+    Returns:
+        ChiSquareResult mit Statistik und p-Wert
+    """
+    dist = exact_distribution(
+        "sum",
+        numbers_min=numbers_range[0],
+        numbers_max=numbers_range[1],
+        numbers_drawn=numbers_drawn,
+    )
+    statistic, p_value, dof = dist.chi_square(sums)
+    return ChiSquareResult(
+        statistic=statistic,
+        p_value=p_value,
+        degrees_of_freedom=dof,
+        is_significant=p_value < 0.05,
+    )
+
+
 def detect_sum_clusters(
     sums: list[int],
     histogram: list[HistogramBin],
@@ -296,6 +335,8 @@ def analyze_sum_distribution(
     expected_mean: float = 710.0,
     bin_width: int = 20,
     data_source: str = "",
+    numbers_range: Optional[tuple[int, int]] = None,
+    numbers_drawn: Optional[int] = None,
 ) -> SumDistributionResult:
     """Fuehrt vollstaendige Summen-Verteilungsanalyse durch.
 
@@ -304,6 +345,9 @@ def analyze_sum_distribution(
         expected_mean: Theoretischer Erwartungswert (710 fuer KENO)
         bin_width: Histogramm-Bin-Breite
         data_source: Pfad zur Quelldatei
+        numbers_range: Zahlenbereich; mit numbers_drawn zusaetzlich Test gegen
+            die exakte Summenverteilung
+        numbers_drawn: Anzahl gezogener Zahlen pro Ziehung
 
     Returns:
         SumDistributionResult mit allen Analyseergebnissen
@@ -335,6 +379,9 @@ def analyze_sum_distribution(
 
     # Chi-Quadrat-Test
     chi_square = chi_square_uniformity_test(histogram)
+    chi_square_exact = None
+    if numbers_range is not None and numbers_drawn is not None:
+        chi_square_exact = chi_square_exact_test(sums, numbers_range, numbers_drawn)
 
     # Cluster-Erkennung
     clusters = detect_sum_clusters(
@@ -358,6 +405,7 @@ def analyze_sum_distribution(
         clusters=clusters,
         chi_square=chi_square,
         data_source=data_source,
+        chi_square_exact=chi_square_exact,
     )
 
 
@@ -398,6 +446,8 @@ def run_sum_window_analysis(
         expected_mean=710.0,  # E[sum] = 20 * (1+70)/2 = 710
         bin_width=bin_width,
         data_source=str(data_path),
+        numbers_range=(1, 70),
+        numbers_drawn=20,
     )
 
     if output_path:
@@ -406,21 +456,24 @@ def run_sum_window_analysis(
     return result
 
 
-def export_result_to_json(
-    result: SumDistributionResult,
-    output_path: str | Path,
-) -> None:
-    """Exportiert Analyseergebnis als JSON.
+def _chi_square_to_dict(chi: ChiSquareResult) -> dict:
+    return {
+        "statistic": float(chi.statistic),
+        "p_value": float(chi.p_value),
+        "degrees_of_freedom": int(chi.degrees_of_freedom),
+        "is_significant": bool(chi.is_significant),
+    }
+
+
+def result_to_dict(result: SumDistributionResult) -> dict:
+    """Wandelt ein SumDistributionResult in ein JSON-faehiges Dict um.
 
     Args:
         result: SumDistributionResult
-        output_path: Zielpfad fuer JSON-Datei
-    """
-    import json
-
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    Returns:
+        Dict im Format von export_result_to_json
+    """
     data = {
         "total_draws": result.total_draws,
         "sum_min": result.sum_min,
@@ -447,18 +500,58 @@ def export_result_to_json(
             }
             for c in result.clusters
         ],
-        "chi_square": {
-            "statistic": float(result.chi_square.statistic),
-            "p_value": float(result.chi_square.p_value),
-            "degrees_of_freedom": int(result.chi_square.degrees_of_freedom),
-            "is_significant": bool(result.chi_square.is_significant),
-        },
+        "chi_square": _chi_square_to_dict(result.chi_square),
         "analysis_date": result.analysis_date.isoformat(),
         "data_source": result.data_source,
     }
+    if result.chi_square_exact is not None:
+        data["chi_square_exact"] = _chi_square_to_dict(result.chi_square_exact)
+    return data
+
+
+def result_from_dict(data: dict) -> SumDistributionResult:
+    """Baut ein SumDistributionResult aus result_to_dict-Daten wieder auf.
+
+    Args:
+        data: Dict im Format von result_to_dict / export_result_to_json
+
+    Returns:
+        SumDistributionResult
+    """
+    exact = data.get("chi_square_exact")
+    return SumDistributionResult(
+        total_draws=data["total_draws"],
+        sum_min=data["sum_min"],
+        sum_max=data["sum_max"],
+        sum_mean=data["sum_mean"],
+        sum_std=data["sum_std"],
+        expected_mean=data["expected_mean"],
+        histogram=[HistogramBin(**h) for h in data["histogram"]],
+        clusters=[SumCluster(**c) for c in data["clusters"]],
+        chi_square=ChiSquareResult(**data["chi_square"]),
+        analysis_date=datetime.fromisoformat(data["analysis_date"]),
+        data_source=data.get("data_source", ""),
+        chi_square_exact=ChiSquareResult(**exact) if exact is not None else None,
+    )
+
+
+def export_result_to_json(
+    result: SumDistributionResult,
+    output_path: str | Path,
+) -> None:
+    """Exportiert Analyseergebnis als JSON.
+
+    Args:
+        result: SumDistributionResult
+        output_path: Zielpfad fuer JSON-Datei
+    """
+    import json
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        json.dump(result_to_dict(result), f, indent=2, ensure_ascii=False)
 
     logger.info(f"Exported sum distribution result to {output_path}")
 
@@ -548,9 +641,12 @@ __all__ = [
     "SumDistributionResult",
     "calculate_sum_histogram",
     "chi_square_uniformity_test",
+    "chi_square_exact_test",
     "detect_sum_clusters",
     "analyze_sum_distribution",
     "run_sum_window_analysis",
+    "result_to_dict",
+    "result_from_dict",
     "export_result_to_json",
     "plot_sum_distribution",
 ]
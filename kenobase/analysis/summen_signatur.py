@@ -7,7 +7,12 @@ Summen-Signatur mit:
 - sum_bucket: Typ-spezifische Bucket-Einordnung anhand Erwartung/Std
 - parity_vector: Gerade/Ungerade Erwartungswerte fuer den KENO-Typ
 - decade_hist: Erwartete Zehnergruppen-Verteilung fuer den KENO-Typ
-- checksum: SHA-Hash ueber Kernfelder fuer Reproduzierbarkeit
+- checksum: Hash ueber die kanonische Binaerkodierung der Kernfelder
+
+Die Berechnung erfolgt spaltenweise fuer alle Ziehungen x KENO-Typen
+(SummenSignaturTable); Records werden nur fuer den JSON-Export erzeugt.
+Als Parquet-Dataset koennen neue Ziehungen inkrementell angehaengt werden
+(append_signatures_parquet).
 
 Train/Test-Split gemaess ADR: train < 2024-01-01, test >= 2024-01-01.
 """
@@ -15,22 +20,54 @@ Train/Test-Split gemaess ADR: train < 2024-01-01, test >= 2024-01-01.
 from __future__ import annotations
 
 import hashlib
+import importlib.util
 import json
 import logging
 import math
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
 
 from kenobase.analysis.decade_affinity import DECADES
 from kenobase.core.data_loader import DrawResult
+from kenobase.core.draw_collection import sort_draws
 
 logger = logging.getLogger(__name__)
 
+# pyarrow nur fuer den Parquet-Export (optional, Import erst bei Bedarf)
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
 # Konstanten
 DEFAULT_NUMBER_RANGE = (1, 70)
-SUMMEN_SIGNATUR_VERSION = "1.0"
+# 2.0: Checksumme ueber kanonische Binaerzeile statt JSON-Payload
+SUMMEN_SIGNATUR_VERSION = "2.0"
+
+BUCKET_LABELS: tuple[str, ...] = ("very_low", "low", "mid", "high", "very_high", "unknown")
+
+# Kanonische Zeilenkodierung fuer Checksummen (little-endian, ohne Padding)
+_ROW_DTYPE = np.dtype(
+    [
+        ("date", "<i8"),  # Tage seit 1970-01-01
+        ("draw_index", "<i4"),
+        ("keno_type", "<i1"),
+        ("sum_total", "<i4"),
+        ("sum_scaled", "<f8"),  # auf 6 Nachkommastellen gerundet
+        ("sum_bucket", "<i1"),
+        ("parity", "<i2", (2,)),
+        ("decade", "<i2", (len(DECADES),)),
+    ]
+)
+
+DECADE_LABELS: tuple[str, ...] = tuple(
+    f"{min(rng):02d}-{max(rng):02d}" for _, rng in sorted(DECADES.items())
+)
+
+# Parquet: Schluessel der Parameter in den Schema-Metadaten
+_PARQUET_META_KEY = b"summen_signatur"
 
 
 def _mean_for_type(keno_type: int, number_range: tuple[int, int]) -> float:
@@ -49,79 +86,78 @@ def _std_for_type(keno_type: int, population_size: int = 70) -> float:
     return math.sqrt(keno_type * single_var * correction)
 
 
-def _scale_distribution(counts: Sequence[int], target_total: int) -> list[int]:
-    """Skaliert eine Verteilung deterministisch auf target_total Elemente."""
-    total = sum(counts)
-    if target_total <= 0 or total <= 0:
-        return [0 for _ in counts]
+def _decade_label(decade_idx: int) -> str:
+    """Gibt string label fuer Dekade zurueck, z.B. '01-10'."""
+    rng = DECADES.get(decade_idx)
+    if not rng:
+        return f"decade_{decade_idx}"
+    return f"{min(rng):02d}-{max(rng):02d}"
 
-    scaled = [int((c / total) * target_total) for c in counts]
-    remainder = target_total - sum(scaled)
 
-    if remainder:
-        fractions = [
-            (((c / total) * target_total) - base, idx) for idx, (c, base) in enumerate(zip(counts, scaled))
-        ]
-        fractions.sort(key=lambda x: (-x[0], x[1]))
-        for _, idx in fractions[:remainder]:
-            scaled[idx] += 1
+def _scale_distributions(counts: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Skaliert Verteilungen zeilenweise deterministisch auf targets Elemente.
 
-    return scaled
+    Largest-Remainder-Verfahren: abgerundete Anteile, Rest an die groessten
+    Nachkommaanteile (bei Gleichstand der kleinere Index).
+
+    Args:
+        counts: (m, c) Zaehlungen
+        targets: (m,) Zielsummen
 
+    Returns:
+        (m, c) int64-Array; Nullzeilen bei targets <= 0 oder leerer Verteilung.
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    total = counts.sum(axis=1)
+    valid = (targets > 0) & (total > 0)
 
-def _decade_counts(numbers: Sequence[int]) -> list[int]:
-    """Zaehlt Zahlen pro Dekade."""
-    counts = [0 for _ in range(len(DECADES))]
-    for n in numbers:
-        for idx, rng in DECADES.items():
-            if n in rng:
-                counts[idx] += 1
-                break
-    return counts
+    exact = (counts / np.where(total > 0, total, 1)[:, None]) * targets[:, None]
+    base = exact.astype(np.int64)
+    remainder = targets - base.sum(axis=1)
+
+    order = np.argsort(-(exact - base), axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.broadcast_to(np.arange(counts.shape[1]), order.shape), 1)
+    scaled = base + (ranks < remainder[:, None])
+    scaled[~valid] = 0
+    return scaled
 
 
-def _bucket_label(
-    value: float,
-    mean: float,
-    std: float,
+def _bucket_codes(
+    values: np.ndarray,
+    mean: np.ndarray,
+    std: np.ndarray,
     low_mult: float,
     high_mult: float,
-) -> str:
-    """Mappt Wert auf typisierte Buckets."""
-    if std <= 0:
-        return "unknown"
-
+) -> np.ndarray:
+    """Mappt Werte auf Indizes in BUCKET_LABELS."""
     low_bound = mean - low_mult * std
     high_bound = mean + low_mult * std
     very_low_bound = mean - high_mult * std
     very_high_bound = mean + high_mult * std
-
-    if value <= very_low_bound:
-        return "very_low"
-    if value <= low_bound:
-        return "low"
-    if value >= very_high_bound:
-        return "very_high"
-    if value >= high_bound:
-        return "high"
-    return "mid"
-
-
-def _checksum(payload: dict, algorithm: str = "sha256") -> str:
-    """Berechnet deterministischen Hash ueber Payload."""
+    return np.select(
+        [
+            std <= 0,
+            values <= very_low_bound,
+            values <= low_bound,
+            values >= very_high_bound,
+            values >= high_bound,
+        ],
+        [5, 0, 1, 4, 3],
+        default=2,
+    ).astype(np.int8)
+
+
+def _checksums(rows: np.ndarray, algorithm: str = "sha256") -> np.ndarray:
+    """Hash je Zeile ueber die kanonische Binaerkodierung (ein Durchlauf ueber den Puffer)."""
     algo = algorithm if algorithm in hashlib.algorithms_available else "sha256"
-    serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False)
-    h = hashlib.new(algo)
-    h.update(serialized.encode("utf-8"))
-    return h.hexdigest()
-
-
-def _decade_label(decade_idx: int) -> str:
-    """Gibt string label fuer Dekade zurueck, z.B. '01-10'."""
-    rng = DECADES.get(decade_idx)
-    if not rng:
-        return f"decade_{decade_idx}"
-    return f"{min(rng):02d}-{max(rng):02d}"
+    buffer = memoryview(np.ascontiguousarray(rows, dtype=_ROW_DTYPE).tobytes())
+    size = _ROW_DTYPE.itemsize
+    return np.array(
+        [hashlib.new(algo, buffer[i : i + size]).hexdigest() for i in range(0, len(buffer), size)],
+        dtype=object,
+    )
 
 
 @dataclass
@@ -159,7 +195,218 @@ class SummenSignaturRecord:
         }
 
 
-def compute_summen_signatur(
+@dataclass
+class SummenSignaturTable:
+    """Spaltenweise Summen-Signaturen (eine Zeile je Ziehung x KENO-Typ).
+
+    Attributes:
+        draw_date: Ziehungsdatum, datetime64[ns]
+        draw_index: Index der Ziehung in der sortierten Historie
+        keno_type: KENO-Typ
+        sum_total: Summe der gezogenen Zahlen
+        sum_scaled: Auf den KENO-Typ projizierte Summe
+        sum_bucket: Index in BUCKET_LABELS
+        parity: (n, 2) skalierte Gerade/Ungerade-Verteilung
+        decade: (n, 7) skalierte Zehnergruppen-Verteilung
+        checksum: Hex-Digest je Zeile
+        source: Datenquelle
+        version: Version der Signatur-Definition
+    """
+
+    draw_date: np.ndarray
+    draw_index: np.ndarray
+    keno_type: np.ndarray
+    sum_total: np.ndarray
+    sum_scaled: np.ndarray
+    sum_bucket: np.ndarray
+    parity: np.ndarray
+    decade: np.ndarray
+    checksum: np.ndarray
+    source: str = ""
+    version: str = SUMMEN_SIGNATUR_VERSION
+
+    @classmethod
+    def empty(cls, source: str = "") -> SummenSignaturTable:
+        """Tabelle ohne Zeilen."""
+        return cls(
+            draw_date=np.zeros(0, dtype="datetime64[ns]"),
+            draw_index=np.zeros(0, dtype=np.int64),
+            keno_type=np.zeros(0, dtype=np.int8),
+            sum_total=np.zeros(0, dtype=np.int64),
+            sum_scaled=np.zeros(0, dtype=np.float64),
+            sum_bucket=np.zeros(0, dtype=np.int8),
+            parity=np.zeros((0, 2), dtype=np.int64),
+            decade=np.zeros((0, len(DECADE_LABELS)), dtype=np.int64),
+            checksum=np.zeros(0, dtype=object),
+            source=source,
+        )
+
+    def __len__(self) -> int:
+        return len(self.draw_index)
+
+    def take(self, indices: np.ndarray) -> SummenSignaturTable:
+        """Teilmenge per Indizes oder boolescher Maske."""
+        return SummenSignaturTable(
+            draw_date=self.draw_date[indices],
+            draw_index=self.draw_index[indices],
+            keno_type=self.keno_type[indices],
+            sum_total=self.sum_total[indices],
+            sum_scaled=self.sum_scaled[indices],
+            sum_bucket=self.sum_bucket[indices],
+            parity=self.parity[indices],
+            decade=self.decade[indices],
+            checksum=self.checksum[indices],
+            source=self.source,
+            version=self.version,
+        )
+
+    @classmethod
+    def concat(cls, tables: Sequence[SummenSignaturTable]) -> SummenSignaturTable:
+        """Haengt Tabellen aneinander (Quelle/Version der ersten Tabelle)."""
+        if not tables:
+            return cls.empty()
+        first = tables[0]
+        return cls(
+            **{
+                name: np.concatenate([getattr(t, name) for t in tables])
+                for name in (
+                    "draw_date",
+                    "draw_index",
+                    "keno_type",
+                    "sum_total",
+                    "sum_scaled",
+                    "sum_bucket",
+                    "parity",
+                    "decade",
+                    "checksum",
+                )
+            },
+            source=first.source,
+            version=first.version,
+        )
+
+    def bucket_labels(self) -> np.ndarray:
+        """Bucket-Namen je Zeile."""
+        return np.asarray(BUCKET_LABELS, dtype=object)[self.sum_bucket]
+
+    def bucket_counts(self) -> dict[int, dict[str, int]]:
+        """Bucket-Haeufigkeiten pro KENO-Typ (wie aggregate_bucket_counts)."""
+        n_labels = len(BUCKET_LABELS)
+        types, type_idx = np.unique(self.keno_type, return_inverse=True)
+        counts = np.bincount(
+            type_idx * n_labels + self.sum_bucket, minlength=len(types) * n_labels
+        ).reshape(len(types), n_labels)
+        return {
+            int(k): {BUCKET_LABELS[b]: int(c) for b, c in enumerate(row) if c}
+            for k, row in zip(types, counts)
+        }
+
+    def to_dicts(self) -> list[dict]:
+        """Zeilen im JSON-Format von SummenSignaturRecord.to_dict."""
+        dates = pd.DatetimeIndex(self.draw_date).to_pydatetime()
+        return [
+            {
+                "draw_date": date.isoformat(),
+                **row,
+                "sum_scaled": round(row["sum_scaled"], 3),
+                "source": self.source,
+                "version": self.version,
+                "metadata": {},
+            }
+            for date, row in zip(dates, self._raw_rows())
+        ]
+
+    def to_records(self) -> list[SummenSignaturRecord]:
+        """Erzeugt SummenSignaturRecord-Objekte."""
+        dates = pd.DatetimeIndex(self.draw_date).to_pydatetime()
+        return [
+            SummenSignaturRecord(
+                draw_date=date,
+                draw_index=row["draw_index"],
+                keno_type=row["keno_type"],
+                sum_total=row["sum_total"],
+                sum_scaled=row["sum_scaled"],
+                sum_bucket=row["sum_bucket"],
+                parity_vector=row["parity_vector"],
+                decade_hist=row["decade_hist"],
+                checksum=row["checksum"],
+                source=self.source,
+                version=self.version,
+            )
+            for date, row in zip(dates, self._raw_rows())
+        ]
+
+    def _raw_rows(self) -> list[dict]:
+        return [
+            {
+                "draw_index": draw_index,
+                "keno_type": keno_type,
+                "sum_total": sum_total,
+                "sum_scaled": sum_scaled,
+                "sum_bucket": bucket,
+                "parity_vector": {"even": parity[0], "odd": parity[1]},
+                "decade_hist": dict(zip(DECADE_LABELS, decade)),
+                "checksum": checksum,
+            }
+            for draw_index, keno_type, sum_total, sum_scaled, bucket, parity, decade, checksum
+            in zip(
+                self.draw_index.tolist(),
+                self.keno_type.tolist(),
+                self.sum_total.tolist(),
+                self.sum_scaled.tolist(),
+                self.bucket_labels().tolist(),
+                self.parity.tolist(),
+                self.decade.tolist(),
+                self.checksum.tolist(),
+            )
+        ]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Flacher DataFrame (eine Spalte je Paritaet/Dekade) fuer Parquet."""
+        frame = pd.DataFrame(
+            {
+                "draw_date": self.draw_date,
+                "draw_index": self.draw_index.astype(np.int64),
+                "keno_type": self.keno_type.astype(np.int8),
+                "sum_total": self.sum_total.astype(np.int64),
+                "sum_scaled": self.sum_scaled,
+                "sum_bucket": pd.Categorical.from_codes(self.sum_bucket, BUCKET_LABELS),
+                "parity_even": self.parity[:, 0].astype(np.int8),
+                "parity_odd": self.parity[:, 1].astype(np.int8),
+            }
+        )
+        for idx, label in enumerate(DECADE_LABELS):
+            frame[f"decade_{label}"] = self.decade[:, idx].astype(np.int8)
+        frame["checksum"] = self.checksum.astype(str)
+        return frame
+
+    @classmethod
+    def from_frame(
+        cls,
+        frame: pd.DataFrame,
+        source: str = "",
+        version: str = SUMMEN_SIGNATUR_VERSION,
+    ) -> SummenSignaturTable:
+        """Umkehrung von to_frame."""
+        buckets = pd.Categorical(frame["sum_bucket"], categories=BUCKET_LABELS)
+        return cls(
+            draw_date=frame["draw_date"].to_numpy(dtype="datetime64[ns]"),
+            draw_index=frame["draw_index"].to_numpy(dtype=np.int64),
+            keno_type=frame["keno_type"].to_numpy(dtype=np.int8),
+            sum_total=frame["sum_total"].to_numpy(dtype=np.int64),
+            sum_scaled=frame["sum_scaled"].to_numpy(dtype=np.float64),
+            sum_bucket=buckets.codes.astype(np.int8),
+            parity=frame[["parity_even", "parity_odd"]].to_numpy(dtype=np.int64),
+            decade=frame[[f"decade_{label}" for label in DECADE_LABELS]].to_numpy(
+                dtype=np.int64
+            ),
+            checksum=frame["checksum"].to_numpy(dtype=object),
+            source=source,
+            version=version,
+        )
+
+
+def compute_summen_signatur_table(
     draws: Sequence[DrawResult],
     keno_types: Iterable[int],
     bucket_std_low: float = 0.5,
@@ -167,88 +414,153 @@ def compute_summen_signatur(
     checksum_algorithm: str = "sha256",
     number_range: tuple[int, int] = DEFAULT_NUMBER_RANGE,
     source: str = "",
-) -> list[SummenSignaturRecord]:
-    """Berechnet Summen-Signaturen fuer alle Ziehungen/KENO-Typen."""
+    *,
+    start_index: int = 0,
+    numbers_per_draw: Optional[int] = None,
+) -> SummenSignaturTable:
+    """Berechnet Summen-Signaturen fuer alle Ziehungen x KENO-Typen als Arrays.
+
+    Args:
+        draws: Ziehungen (werden nach Datum sortiert)
+        keno_types: KENO-Typen (nur 2-10 werden beruecksichtigt)
+        bucket_std_low: Std-Multiplikator fuer low/high
+        bucket_std_high: Std-Multiplikator fuer very_low/very_high
+        checksum_algorithm: hashlib-Algorithmus (Fallback sha256)
+        number_range: Zahlenbereich des Spiels
+        source: Datenquelle (nur Metadaten)
+        start_index: draw_index der ersten Ziehung (fuer inkrementelles Anhaengen)
+        numbers_per_draw: Zahlen pro Ziehung fuer die Skalierung
+            (default: Laenge der ersten sortierten Ziehung)
+
+    Returns:
+        SummenSignaturTable, Zeilen nach Ziehung und dann KENO-Typ sortiert.
+    """
     if not draws:
-        return []
+        return SummenSignaturTable.empty(source)
 
-    sorted_draws = sorted(draws, key=lambda d: d.date)
+    sorted_draws = sort_draws(draws)
     keno_types_unique = sorted({int(k) for k in keno_types if 2 <= int(k) <= 10})
     if not keno_types_unique:
         logger.warning("No valid keno_types provided; skipping computation")
-        return []
-
-    numbers_per_draw = len(sorted_draws[0].numbers) if sorted_draws[0].numbers else 0
-    records: list[SummenSignaturRecord] = []
-
-    for draw_idx, draw in enumerate(sorted_draws):
-        if not draw.numbers:
-            logger.warning("Skipping draw without numbers at index %s", draw_idx)
-            continue
-
-        sum_total = sum(draw.numbers)
-        even_count = sum(1 for n in draw.numbers if n % 2 == 0)
-        odd_count = len(draw.numbers) - even_count
-        decade_counts = _decade_counts(draw.numbers)
+        return SummenSignaturTable.empty(source)
+
+    if numbers_per_draw is None:
+        numbers_per_draw = len(sorted_draws[0].numbers) if sorted_draws[0].numbers else 0
+
+    lengths = np.fromiter((len(d.numbers) for d in sorted_draws), dtype=np.int64)
+    has_numbers = lengths > 0
+    if not has_numbers.all():
+        logger.warning("Skipping %s draws without numbers", int((~has_numbers).sum()))
+    n_draws = len(sorted_draws)
+
+    # Pro Ziehung: Summe, Gerade-Anzahl, Dekaden-Histogramm
+    flat = np.fromiter(
+        (n for d in sorted_draws for n in d.numbers), dtype=np.int64, count=int(lengths.sum())
+    )
+    row_of = np.repeat(np.arange(n_draws), lengths)
+    sum_total = np.bincount(row_of, weights=flat, minlength=n_draws).astype(np.int64)
+    even = np.bincount(row_of, weights=flat % 2 == 0, minlength=n_draws).astype(np.int64)
+
+    n_decades = len(DECADE_LABELS)
+    decade_lut = np.full(max(int(flat.max(initial=0)), max(DECADES[n_decades - 1])) + 1, -1)
+    for idx, rng in DECADES.items():
+        decade_lut[list(rng)] = idx
+    decade_of = decade_lut[np.clip(flat, 0, None)]
+    in_decade = decade_of >= 0
+    decade_counts = np.bincount(
+        row_of[in_decade] * n_decades + decade_of[in_decade], minlength=n_draws * n_decades
+    ).reshape(n_draws, n_decades)
+
+    # Zeilen: Ziehung x KENO-Typ (Ziehung aussen)
+    draw_rows = np.flatnonzero(has_numbers)
+    n_types = len(keno_types_unique)
+    rows = np.repeat(draw_rows, n_types)
+    types = np.tile(np.array(keno_types_unique, dtype=np.int64), len(draw_rows))
+    type_pos = np.tile(np.arange(n_types), len(draw_rows))
+
+    totals = sum_total[rows]
+    if numbers_per_draw:
+        scaled_sum = (totals / numbers_per_draw) * types
+    else:
+        scaled_sum = totals.astype(np.float64)
+    means = np.array([_mean_for_type(k, number_range) for k in keno_types_unique])
+    stds = np.array(
+        [_std_for_type(k, population_size=number_range[1]) for k in keno_types_unique]
+    )
+    buckets = _bucket_codes(
+        scaled_sum, means[type_pos], stds[type_pos], bucket_std_low, bucket_std_high
+    )
+    parity = _scale_distributions(
+        np.stack([even, lengths - even], axis=1)[rows], types
+    )
+    decade = _scale_distributions(decade_counts[rows], types)
+
+    dates = np.array([np.datetime64(d.date, "ns") for d in sorted_draws])[rows]
+    draw_index = rows + start_index
+
+    encoded = np.zeros(len(rows), dtype=_ROW_DTYPE)
+    encoded["date"] = dates.astype(np.int64)
+    encoded["draw_index"] = draw_index
+    encoded["keno_type"] = types
+    encoded["sum_total"] = totals
+    encoded["sum_scaled"] = np.round(scaled_sum, 6)
+    encoded["sum_bucket"] = buckets
+    encoded["parity"] = parity
+    encoded["decade"] = decade
+
+    return SummenSignaturTable(
+        draw_date=dates,
+        draw_index=draw_index,
+        keno_type=types.astype(np.int8),
+        sum_total=totals,
+        sum_scaled=scaled_sum,
+        sum_bucket=buckets,
+        parity=parity,
+        decade=decade,
+        checksum=_checksums(encoded, checksum_algorithm),
+        source=source,
+    )
 
-        for keno_type in keno_types_unique:
-            scaled_sum = (sum_total / numbers_per_draw) * keno_type if numbers_per_draw else float(sum_total)
-            mean_expected = _mean_for_type(keno_type, number_range)
-            std_expected = _std_for_type(keno_type, population_size=number_range[1])
 
-            parity_scaled = _scale_distribution([even_count, odd_count], keno_type)
-            decade_scaled = _scale_distribution(decade_counts, keno_type)
-
-            decade_hist = {
-                _decade_label(idx): count for idx, count in enumerate(decade_scaled)
-            }
-
-            payload = {
-                "date": draw.date.isoformat(),
-                "draw_index": draw_idx,
-                "keno_type": keno_type,
-                "sum_total": sum_total,
-                "sum_scaled": round(scaled_sum, 6),
-                "sum_bucket": _bucket_label(
-                    scaled_sum,
-                    mean_expected,
-                    std_expected,
-                    bucket_std_low,
-                    bucket_std_high,
-                ),
-                "parity_vector": {"even": parity_scaled[0], "odd": parity_scaled[1]},
-                "decade_hist": decade_hist,
-            }
+def compute_summen_signatur(
+    draws: Sequence[DrawResult],
+    keno_types: Iterable[int],
+    bucket_std_low: float = 0.5,
+    bucket_std_high: float = 1.5,
+    checksum_algorithm: str = "sha256",
+    number_range: tuple[int, int] = DEFAULT_NUMBER_RANGE,
+    source: str = "",
+) -> list[SummenSignaturRecord]:
+    """Berechnet Summen-Signaturen fuer alle Ziehungen/KENO-Typen."""
+    return compute_summen_signatur_table(
+        draws,
+        keno_types,
+        bucket_std_low=bucket_std_low,
+        bucket_std_high=bucket_std_high,
+        checksum_algorithm=checksum_algorithm,
+        number_range=number_range,
+        source=source,
+    ).to_records()
 
-            record = SummenSignaturRecord(
-                draw_date=draw.date,
-                draw_index=draw_idx,
-                keno_type=keno_type,
-                sum_total=sum_total,
-                sum_scaled=scaled_sum,
-                sum_bucket=payload["sum_bucket"],
-                parity_vector=payload["parity_vector"],
-                decade_hist=decade_hist,
-                checksum=_checksum(payload, checksum_algorithm),
-                source=source,
-            )
-            records.append(record)
 
-    return records
+Signatures = Union[SummenSignaturTable, Sequence[SummenSignaturRecord]]
 
 
 def split_signatures_by_date(
-    records: Sequence[SummenSignaturRecord],
+    records: Signatures,
     split_date: datetime,
-) -> tuple[list[SummenSignaturRecord], list[SummenSignaturRecord]]:
-    """Teilt Signaturen in Train/Test anhand split_date."""
+) -> tuple[Signatures, Signatures]:
+    """Teilt Signaturen in Train/Test anhand split_date (Tabelle -> Tabellen)."""
+    if isinstance(records, SummenSignaturTable):
+        is_train = records.draw_date < np.datetime64(split_date, "ns")
+        return records.take(is_train), records.take(~is_train)
     train = [r for r in records if r.draw_date < split_date]
     test = [r for r in records if r.draw_date >= split_date]
     return train, test
 
 
 def export_signatures(
-    records: Sequence[SummenSignaturRecord],
+    records: Signatures,
     output_path: str | Path,
     metadata: dict | None = None,
 ) -> None:
@@ -256,11 +568,15 @@ def export_signatures(
     path = Path(output_path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    if isinstance(records, SummenSignaturTable):
+        rows = records.to_dicts()
+    else:
+        rows = [r.to_dict() for r in records]
     payload = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "record_count": len(records),
         "metadata": metadata or {},
-        "records": [r.to_dict() for r in records],
+        "records": rows,
     }
 
     path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
@@ -268,9 +584,11 @@ def export_signatures(
 
 
 def aggregate_bucket_counts(
-    records: Sequence[SummenSignaturRecord],
+    records: Signatures,
 ) -> dict[int, dict[str, int]]:
     """Aggregiert Bucket-Haeufigkeiten pro KENO-Typ."""
+    if isinstance(records, SummenSignaturTable):
+        return records.bucket_counts()
     aggregated: dict[int, dict[str, int]] = {}
     for rec in records:
         type_buckets = aggregated.setdefault(rec.keno_type, {})
@@ -278,10 +596,189 @@ def aggregate_bucket_counts(
     return aggregated
 
 
+# ----------------------------------------------------------------------
+# Parquet-Export (inkrementell)
+# ----------------------------------------------------------------------
+
+
+def _require_pyarrow() -> None:
+    if not HAS_PYARROW:
+        raise ImportError(
+            "pyarrow is required for Parquet export. Install with: pip install pyarrow"
+        )
+
+
+def _parquet_parts(path: Path) -> list[Path]:
+    return sorted(path.glob("part-*.parquet")) if path.is_dir() else []
+
+
+def _read_parquet_params(part: Path) -> dict:
+    import pyarrow.parquet as pq
+
+    meta = pq.read_schema(part).metadata or {}
+    return json.loads(meta.get(_PARQUET_META_KEY, b"{}"))
+
+
+def write_signatures_parquet(
+    table: SummenSignaturTable,
+    path: str | Path,
+    params: dict | None = None,
+) -> Path:
+    """Schreibt eine Signatur-Tabelle als Parquet-Datei.
+
+    Args:
+        table: Signatur-Tabelle
+        path: Zieldatei
+        params: Berechnungsparameter (werden in den Schema-Metadaten abgelegt)
+
+    Returns:
+        Pfad der geschriebenen Datei.
+
+    Raises:
+        ImportError: Wenn pyarrow nicht installiert ist
+    """
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    arrow_table = pa.Table.from_pandas(table.to_frame(), preserve_index=False)
+    meta = dict(arrow_table.schema.metadata or {})
+    meta[_PARQUET_META_KEY] = json.dumps(
+        dict(params or {}, source=table.source, version=table.version), sort_keys=True
+    ).encode("utf-8")
+    pq.write_table(arrow_table.replace_schema_metadata(meta), path)
+    return path
+
+
+def read_signatures_parquet(path: str | Path) -> SummenSignaturTable:
+    """Liest eine Parquet-Datei oder ein mit append_signatures_parquet erzeugtes Verzeichnis.
+
+    Raises:
+        ImportError: Wenn pyarrow nicht installiert ist
+        FileNotFoundError: Wenn keine Parquet-Daten vorhanden sind
+    """
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    files = _parquet_parts(path) if path.is_dir() else [path]
+    if not files or not files[0].exists():
+        raise FileNotFoundError(f"No summen_signatur parquet data at {path}")
+
+    params = _read_parquet_params(files[0])
+    tables = [
+        SummenSignaturTable.from_frame(
+            pq.read_table(f).to_pandas(),
+            source=params.get("source", ""),
+            version=params.get("version", SUMMEN_SIGNATUR_VERSION),
+        )
+        for f in files
+    ]
+    return SummenSignaturTable.concat(tables)
+
+
+def append_signatures_parquet(
+    draws: Sequence[DrawResult],
+    output_dir: str | Path,
+    keno_types: Iterable[int],
+    bucket_std_low: float = 0.5,
+    bucket_std_high: float = 1.5,
+    checksum_algorithm: str = "sha256",
+    number_range: tuple[int, int] = DEFAULT_NUMBER_RANGE,
+    source: str = "",
+    rebuild: bool = False,
+) -> SummenSignaturTable:
+    """Berechnet nur Signaturen neuer Ziehungen und haengt sie als Parquet-Teil an.
+
+    Layout: output_dir/part-<erster>-<letzter draw_index>.parquet. Neue
+    Ziehungen sind solche nach dem letzten gespeicherten Datum; draw_index
+    setzt die sortierte Historie fort. Aendern sich die Parameter (KENO-Typen,
+    Buckets, Checksumme, Version), wird das Verzeichnis neu aufgebaut.
+
+    Args:
+        draws: Komplette Ziehungshistorie
+        output_dir: Verzeichnis des Parquet-Datasets
+        keno_types: KENO-Typen (2-10)
+        bucket_std_low: Std-Multiplikator fuer low/high
+        bucket_std_high: Std-Multiplikator fuer very_low/very_high
+        checksum_algorithm: hashlib-Algorithmus
+        number_range: Zahlenbereich des Spiels
+        source: Datenquelle
+        rebuild: Vorhandene Teile verwerfen und alles neu berechnen
+
+    Returns:
+        Tabelle der neu angehaengten Zeilen (leer wenn nichts neu ist).
+
+    Raises:
+        ImportError: Wenn pyarrow nicht installiert ist
+    """
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    output_dir = Path(output_dir)
+    sorted_draws = sort_draws(draws) if draws else []
+    if not sorted_draws:
+        return SummenSignaturTable.empty(source)
+
+    params = {
+        "keno_types": sorted({int(k) for k in keno_types if 2 <= int(k) <= 10}),
+        "bucket_std_low": bucket_std_low,
+        "bucket_std_high": bucket_std_high,
+        "checksum_algorithm": checksum_algorithm,
+        "number_range": list(number_range),
+        "numbers_per_draw": len(sorted_draws[0].numbers),
+    }
+
+    parts = _parquet_parts(output_dir)
+    if parts:
+        stored = _read_parquet_params(parts[0])
+        stored_params = {k: stored.get(k) for k in params}
+        if rebuild or stored_params != params or stored.get("version") != SUMMEN_SIGNATUR_VERSION:
+            logger.info("Rebuilding summen_signatur parquet in %s", output_dir)
+            for part in parts:
+                part.unlink()
+            parts = []
+
+    start = 0
+    if parts:
+        last = pq.read_table(parts[-1], columns=["draw_date", "draw_index"]).to_pandas()
+        last_date = last["draw_date"].max()
+        dates = pd.DatetimeIndex([d.date for d in sorted_draws])
+        start = int(np.searchsorted(dates, last_date, side="right"))
+        if start >= len(sorted_draws):
+            return SummenSignaturTable.empty(source)
+
+    table = compute_summen_signatur_table(
+        sorted_draws[start:],
+        params["keno_types"],
+        bucket_std_low=bucket_std_low,
+        bucket_std_high=bucket_std_high,
+        checksum_algorithm=checksum_algorithm,
+        number_range=number_range,
+        source=source,
+        start_index=start,
+        numbers_per_draw=params["numbers_per_draw"],
+    )
+    if len(table):
+        first, last_idx = int(table.draw_index[0]), int(table.draw_index[-1])
+        part = output_dir / f"part-{first:06d}-{last_idx:06d}.parquet"
+        write_signatures_parquet(table, part, params)
+        logger.info("Appended %s summen_signatur rows to %s", len(table), part)
+    return table
+
+
 __all__ = [
+    "BUCKET_LABELS",
     "SummenSignaturRecord",
+    "SummenSignaturTable",
     "compute_summen_signatur",
+    "compute_summen_signatur_table",
     "split_signatures_by_date",
     "export_signatures",
     "aggregate_bucket_counts",
+    "write_signatures_parquet",
+    "read_signatures_parquet",
+    "append_signatures_parquet",
 ]
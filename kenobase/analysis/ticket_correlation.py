@@ -9,14 +9,21 @@ across three dimensions:
 The goal is NOT to find profitable tickets (all have negative ROI: -43% to -67%),
 but to identify anti-correlated tickets for portfolio diversification.
 
+For large candidate sets use the matrix mode: all pairs are evaluated at once
+(bitmask popcounts for overlap, one rank transform + matrix product for the
+Spearman correlations, boolean matrix products for win co-occurrence).
+
 Usage:
     from kenobase.analysis.ticket_correlation import (
         analyze_ticket_correlation,
+        calculate_correlation_matrix,
         calculate_overlap,
         calculate_roi_sync,
     )
 
     result = analyze_ticket_correlation(tickets, backtest_results)
+    matrix = calculate_correlation_matrix(candidate_tickets, roi_series, win_flags)
+    best = matrix.most_diversified(10)
 
 Author: EXECUTOR (TASK_034)
 Date: 2025-12-30
@@ -27,13 +34,14 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from itertools import combinations
-from typing import Optional, Sequence
+from itertools import combinations_with_replacement
+from typing import Hashable, Optional, Sequence
 
 import numpy as np
 from scipy import stats
 
 from kenobase.analysis.null_models import benjamini_hochberg_fdr, FDRResult
+from kenobase.core.bitmask import encode_many, hit_matrix, number_mask, popcount
 
 logger = logging.getLogger(__name__)
 
@@ -221,14 +229,11 @@ def calculate_overlap(
     Returns:
         OverlapResult with Jaccard index and counts
     """
-    set_a = set(numbers_a)
-    set_b = set(numbers_b)
-
-    intersection = set_a & set_b
-    union = set_a | set_b
+    mask_a = number_mask(numbers_a)
+    mask_b = number_mask(numbers_b)
 
-    overlap_count = len(intersection)
-    union_count = len(union)
+    overlap_count = (mask_a & mask_b).bit_count()
+    union_count = (mask_a | mask_b).bit_count()
 
     if union_count == 0:
         jaccard = 0.0
@@ -469,6 +474,424 @@ def analyze_ticket_pair(
     )
 
 
+# --- Matrix Mode ---
+
+@dataclass(frozen=True)
+class OverlapMatrix:
+    """Pairwise Zahlen-Overlap for N tickets.
+
+    Attributes:
+        overlap_count: (N, N) shared numbers
+        union_count: (N, N) unique numbers across both tickets
+        jaccard_index: (N, N) overlap_count / union_count (0 for empty unions)
+    """
+    overlap_count: np.ndarray
+    union_count: np.ndarray
+    jaccard_index: np.ndarray
+
+
+@dataclass(frozen=True)
+class SyncMatrix:
+    """Pairwise ROI-Synchronization for N tickets.
+
+    Attributes:
+        spearman_r: (N, N) Spearman correlation (NaN where not computable)
+        spearman_p: (N, N) p-values (NaN where not computable)
+        n_observations: (N, N) paired non-NaN observations
+        valid: (N, N) True where calculate_roi_sync would return a result
+    """
+    spearman_r: np.ndarray
+    spearman_p: np.ndarray
+    n_observations: np.ndarray
+    valid: np.ndarray
+
+    @property
+    def is_significant(self) -> np.ndarray:
+        """(N, N) True where valid and p < 0.05."""
+        return self.valid & (np.nan_to_num(self.spearman_p, nan=1.0) < 0.05)
+
+
+@dataclass(frozen=True)
+class TimingMatrix:
+    """Pairwise Gewinn-Timing for N tickets.
+
+    Pairs are compared over their common prefix of draws (as in
+    calculate_timing), so win rates are stored per pair.
+
+    Attributes:
+        cooccurrence_ratio: (N, N) fraction of shared draws where both win
+        win_rate: (N, N) win rate of ticket i over the draws shared with j
+        expected_cooccurrence: (N, N) win_rate * win_rate.T
+        lift: (N, N) cooccurrence / expected (NaN where not computable)
+        n_draws: (N, N) number of shared draws
+        valid: (N, N) True where calculate_timing would return a result
+    """
+    cooccurrence_ratio: np.ndarray
+    win_rate: np.ndarray
+    expected_cooccurrence: np.ndarray
+    lift: np.ndarray
+    n_draws: np.ndarray
+    valid: np.ndarray
+
+
+@dataclass
+class TicketCorrelationMatrix:
+    """Correlation matrices and diversification scores for N tickets.
+
+    Attributes:
+        labels: Ticket identifiers (index order of all matrices)
+        tickets: Ticket numbers
+        overlap: OverlapMatrix
+        sync: SyncMatrix (None if no ROI series given)
+        timing: TimingMatrix (None if no win flags given)
+        diversification: (N, N) diversification scores (diagonal = self pair)
+    """
+    labels: list[Hashable]
+    tickets: list[tuple[int, ...]]
+    overlap: OverlapMatrix
+    sync: Optional[SyncMatrix]
+    timing: Optional[TimingMatrix]
+    diversification: np.ndarray
+
+    @property
+    def n_tickets(self) -> int:
+        return len(self.labels)
+
+    def pair_indices(self) -> tuple[np.ndarray, np.ndarray]:
+        """Index arrays (i, j) of all pairs i < j in combinations() order."""
+        return np.triu_indices(self.n_tickets, k=1)
+
+    def mean_diversification(self) -> np.ndarray:
+        """(N,) average diversification score of each ticket against all others."""
+        n = self.n_tickets
+        if n < 2:
+            return np.zeros(n)
+        off_diagonal = self.diversification.sum(axis=1) - np.diag(self.diversification)
+        return off_diagonal / (n - 1)
+
+    def most_diversified(self, n: int = 10) -> list[tuple[Hashable, Hashable, float]]:
+        """Top-n pairs by diversification score (stable for ties).
+
+        Returns:
+            List of (label_a, label_b, score), best first.
+        """
+        rows, cols = self.pair_indices()
+        scores = self.diversification[rows, cols]
+        order = np.argsort(-scores, kind="stable")[:n]
+        return [
+            (self.labels[rows[k]], self.labels[cols[k]], float(scores[k])) for k in order
+        ]
+
+    def pair_correlation(
+        self, i: int, j: int, ticket_types: Optional[tuple[int, int]] = None
+    ) -> PairCorrelation:
+        """Builds the PairCorrelation of tickets i and j from the matrices.
+
+        Args:
+            i: Index of ticket A
+            j: Index of ticket B
+            ticket_types: Keno types for the TicketPair (default: ticket lengths)
+
+        Returns:
+            PairCorrelation equivalent to analyze_ticket_pair()
+        """
+        type_a, type_b = ticket_types or (len(self.tickets[i]), len(self.tickets[j]))
+        overlap = OverlapResult(
+            jaccard_index=float(self.overlap.jaccard_index[i, j]),
+            overlap_count=int(self.overlap.overlap_count[i, j]),
+            union_count=int(self.overlap.union_count[i, j]),
+        )
+        sync = None
+        if self.sync is not None and self.sync.valid[i, j]:
+            p_value = float(self.sync.spearman_p[i, j])
+            sync = SyncResult(
+                spearman_r=float(self.sync.spearman_r[i, j]),
+                spearman_p=p_value,
+                n_observations=int(self.sync.n_observations[i, j]),
+                is_significant=p_value < 0.05,
+            )
+        timing = None
+        if self.timing is not None and self.timing.valid[i, j]:
+            timing = TimingResult(
+                cooccurrence_ratio=float(self.timing.cooccurrence_ratio[i, j]),
+                ticket_a_win_rate=float(self.timing.win_rate[i, j]),
+                ticket_b_win_rate=float(self.timing.win_rate[j, i]),
+                expected_cooccurrence=float(self.timing.expected_cooccurrence[i, j]),
+                lift=float(self.timing.lift[i, j]),
+                n_draws=int(self.timing.n_draws[i, j]),
+            )
+        return PairCorrelation(
+            pair=TicketPair(
+                ticket_a_type=type_a,
+                ticket_b_type=type_b,
+                ticket_a_numbers=self.tickets[i],
+                ticket_b_numbers=self.tickets[j],
+            ),
+            overlap=overlap,
+            sync=sync,
+            timing=timing,
+            diversification_score=float(self.diversification[i, j]),
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization (matrices as nested lists)."""
+        result = {
+            "labels": list(self.labels),
+            "tickets": [list(t) for t in self.tickets],
+            "jaccard_index": self.overlap.jaccard_index.tolist(),
+            "diversification": self.diversification.tolist(),
+        }
+        if self.sync is not None:
+            result["spearman_r"] = np.where(
+                self.sync.valid, np.nan_to_num(self.sync.spearman_r), None
+            ).tolist()
+        if self.timing is not None:
+            result["lift"] = np.where(
+                self.timing.valid & np.isfinite(self.timing.lift), self.timing.lift, None
+            ).tolist()
+        return result
+
+
+def calculate_overlap_matrix(tickets: Sequence[Sequence[int]]) -> OverlapMatrix:
+    """Calculate Jaccard similarity for all ticket pairs via bitmask popcounts.
+
+    Args:
+        tickets: N tickets (number sequences)
+
+    Returns:
+        OverlapMatrix with (N, N) arrays
+    """
+    masks = encode_many(tickets)
+    overlap = hit_matrix(masks, masks).astype(np.int64)
+    sizes = popcount(masks)
+    union = sizes[:, None] + sizes[None, :] - overlap
+    jaccard = np.divide(
+        overlap, union, out=np.zeros(overlap.shape, dtype=float), where=union > 0
+    )
+    return OverlapMatrix(overlap_count=overlap, union_count=union, jaccard_index=jaccard)
+
+
+def _pad_series(series: Sequence[Optional[Sequence[float]]]) -> np.ndarray:
+    """Stack series as columns of an (n_max, N) float array, NaN-padded."""
+    arrays = [
+        np.asarray(s, dtype=float) if s is not None else np.empty(0) for s in series
+    ]
+    length = max((len(a) for a in arrays), default=0)
+    out = np.full((length, len(arrays)), np.nan)
+    for k, a in enumerate(arrays):
+        out[: len(a), k] = a
+    return out
+
+
+def calculate_roi_sync_matrix(
+    roi_series: Sequence[Optional[Sequence[float]]],
+    min_observations: int = 10,
+) -> SyncMatrix:
+    """Calculate Spearman correlations of all ROI series pairs.
+
+    Series without NaN are rank-transformed once and correlated with a
+    single matrix product; pairs involving NaN or shorter series fall back
+    to calculate_roi_sync (pairwise NaN filtering). Missing series (None)
+    yield invalid entries.
+
+    Args:
+        roi_series: N ROI time series (None for tickets without data)
+        min_observations: Minimum paired observations required
+
+    Returns:
+        SyncMatrix with (N, N) arrays
+    """
+    n = len(roi_series)
+    values = _pad_series(roi_series)
+    lengths = {len(s) for s in roi_series if s is not None}
+    if len(lengths) > 1:
+        logger.warning(f"ROI series length mismatch: {sorted(lengths)}, using common prefixes")
+    r = np.full((n, n), np.nan)
+    p = np.full((n, n), np.nan)
+    finite = ~np.isnan(values)
+    n_obs = finite.T.astype(np.int64) @ finite.astype(np.int64)
+    valid = n_obs >= min_observations
+
+    clean = finite.all(axis=0) if len(values) else np.zeros(n, dtype=bool)
+    idx = np.flatnonzero(clean)
+    n_rows = len(values)
+    if idx.size and n_rows >= min_observations:
+        ranks = stats.rankdata(values[:, idx], axis=0)
+        centered = ranks - ranks.mean(axis=0)
+        norms = np.sqrt((centered**2).sum(axis=0))
+        constant = norms == 0
+        z = centered / np.where(constant, 1.0, norms)
+        rs = np.clip(z.T @ z, -1.0, 1.0)
+        dof = n_rows - 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = rs * np.sqrt((dof / ((rs + 1.0) * (1.0 - rs))).clip(0))
+        ps = 2 * stats.t.sf(np.abs(t), dof)
+        # Constant series: correlation undefined -> neutral (as calculate_roi_sync)
+        undefined = constant[:, None] | constant[None, :]
+        rs[undefined] = 0.0
+        ps[undefined] = 1.0
+        r[np.ix_(idx, idx)] = rs
+        p[np.ix_(idx, idx)] = ps
+
+    for i, j in combinations_with_replacement(range(n), 2):
+        if (clean[i] and clean[j]) or not valid[i, j]:
+            continue
+        result = calculate_roi_sync(values[:, i], values[:, j], min_observations)
+        if result is not None:
+            r[i, j] = r[j, i] = result.spearman_r
+            p[i, j] = p[j, i] = result.spearman_p
+
+    r[~valid] = np.nan
+    p[~valid] = np.nan
+    return SyncMatrix(spearman_r=r, spearman_p=p, n_observations=n_obs, valid=valid)
+
+
+def calculate_timing_matrix(
+    win_flags: Sequence[Optional[Sequence[bool]]],
+    min_draws: int = 10,
+) -> TimingMatrix:
+    """Calculate win co-occurrence and lift for all ticket pairs.
+
+    Each pair is compared over its common prefix of draws; for every
+    distinct prefix length one boolean matrix product yields all
+    co-occurrence counts. Missing series (None) yield invalid entries.
+
+    Args:
+        win_flags: N boolean win series (None for tickets without data)
+        min_draws: Minimum number of shared draws required
+
+    Returns:
+        TimingMatrix with (N, N) arrays
+    """
+    n = len(win_flags)
+    lengths = np.array([len(w) if w is not None else 0 for w in win_flags], dtype=np.int64)
+    distinct = {len(w) for w in win_flags if w is not None}
+    if len(distinct) > 1:
+        logger.warning(f"Wins series length mismatch: {sorted(distinct)}, using common prefixes")
+    wins = np.zeros((int(lengths.max(initial=0)), n), dtype=np.int64)
+    for k, w in enumerate(win_flags):
+        if w is not None:
+            wins[: lengths[k], k] = np.asarray(w, dtype=bool)
+
+    n_draws = np.minimum.outer(lengths, lengths)
+    cooccurrence = np.zeros((n, n))
+    win_rate = np.zeros((n, n))
+    for length in np.unique(n_draws):
+        if length == 0:
+            continue
+        sel = n_draws == length
+        prefix = wins[:length]
+        cooccurrence[sel] = (prefix.T @ prefix)[sel] / length
+        rates = prefix.sum(axis=0) / length
+        win_rate[sel] = np.broadcast_to(rates[:, None], (n, n))[sel]
+
+    expected = win_rate * win_rate.T
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lift = np.where(
+            expected > 0,
+            cooccurrence / expected,
+            np.where(cooccurrence == 0, 1.0, np.inf),
+        )
+    valid = n_draws >= max(min_draws, 1)
+    lift[~valid] = np.nan
+    return TimingMatrix(
+        cooccurrence_ratio=cooccurrence,
+        win_rate=win_rate,
+        expected_cooccurrence=expected,
+        lift=lift,
+        n_draws=n_draws,
+        valid=valid,
+    )
+
+
+def calculate_diversification_matrix(
+    overlap: OverlapMatrix,
+    sync: Optional[SyncMatrix],
+    timing: Optional[TimingMatrix],
+    overlap_weight: float = 0.3,
+    sync_weight: float = 0.4,
+    timing_weight: float = 0.3,
+) -> np.ndarray:
+    """Diversification scores for all pairs (see calculate_diversification_score).
+
+    Args:
+        overlap: OverlapMatrix
+        sync: Optional SyncMatrix
+        timing: Optional TimingMatrix
+        overlap_weight: Weight for overlap component (default 0.3)
+        sync_weight: Weight for sync component (default 0.4)
+        timing_weight: Weight for timing component (default 0.3)
+
+    Returns:
+        (N, N) diversification scores 0-1 (higher = more diversified)
+    """
+    overlap_score = 1.0 - overlap.jaccard_index
+    shape = overlap_score.shape
+
+    if sync is not None:
+        sync_score = np.where(sync.is_significant, (1.0 - sync.spearman_r) / 2.0, 0.5)
+    else:
+        sync_score = np.full(shape, 0.5)
+
+    if timing is not None:
+        capped_lift = np.minimum(np.nan_to_num(timing.lift, nan=0.0), 2.0)
+        timing_score = np.where(timing.valid, 1.0 - capped_lift / 2.0, 0.5)
+    else:
+        timing_score = np.full(shape, 0.5)
+
+    total_weight = overlap_weight + sync_weight + timing_weight
+    return (
+        overlap_weight * overlap_score
+        + sync_weight * sync_score
+        + timing_weight * timing_score
+    ) / total_weight
+
+
+def calculate_correlation_matrix(
+    tickets: Sequence[Sequence[int]],
+    roi_series: Optional[Sequence[Optional[Sequence[float]]]] = None,
+    win_flags: Optional[Sequence[Optional[Sequence[bool]]]] = None,
+    labels: Optional[Sequence[Hashable]] = None,
+    min_observations: int = 10,
+    min_draws: int = 10,
+) -> TicketCorrelationMatrix:
+    """Correlation matrices and diversification scores for N tickets at once.
+
+    Matrix counterpart of analyze_ticket_pair() over all pairs.
+
+    Args:
+        tickets: N tickets (number sequences)
+        roi_series: Optional ROI time series per ticket (None entries allowed)
+        win_flags: Optional win flags per ticket (None entries allowed)
+        labels: Ticket identifiers (default: 0..N-1)
+        min_observations: Minimum paired ROI observations for sync
+        min_draws: Minimum shared draws for timing
+
+    Returns:
+        TicketCorrelationMatrix
+
+    Raises:
+        ValueError: If series or labels do not match the number of tickets
+    """
+    n = len(tickets)
+    for name, values in (("roi_series", roi_series), ("win_flags", win_flags), ("labels", labels)):
+        if values is not None and len(values) != n:
+            raise ValueError(f"{name} has {len(values)} entries for {n} tickets")
+
+    overlap = calculate_overlap_matrix(tickets)
+    sync = calculate_roi_sync_matrix(roi_series, min_observations) if roi_series else None
+    timing = calculate_timing_matrix(win_flags, min_draws) if win_flags else None
+
+    return TicketCorrelationMatrix(
+        labels=list(labels) if labels is not None else list(range(n)),
+        tickets=[tuple(t) for t in tickets],
+        overlap=overlap,
+        sync=sync,
+        timing=timing,
+        diversification=calculate_diversification_matrix(overlap, sync, timing),
+    )
+
+
 def analyze_ticket_correlation(
     tickets: dict[int, tuple[int, ...]],
     backtest_results: Optional[dict[int, dict]] = None,
@@ -502,32 +925,23 @@ def analyze_ticket_correlation(
             n_pairs=0,
         )
 
-    pair_correlations: list[PairCorrelation] = []
-
-    # Generate all pairs
-    for type_a, type_b in combinations(sorted(tickets.keys()), 2):
-        numbers_a = tickets[type_a]
-        numbers_b = tickets[type_b]
-
-        pair = TicketPair(
-            ticket_a_type=type_a,
-            ticket_b_type=type_b,
-            ticket_a_numbers=tuple(numbers_a),
-            ticket_b_numbers=tuple(numbers_b),
-        )
-
-        # Get backtest data if available
-        roi_a = roi_b = wins_a = wins_b = None
-        if backtest_results:
-            if type_a in backtest_results:
-                roi_a = backtest_results[type_a].get("roi_series")
-                wins_a = backtest_results[type_a].get("win_flags")
-            if type_b in backtest_results:
-                roi_b = backtest_results[type_b].get("roi_series")
-                wins_b = backtest_results[type_b].get("win_flags")
-
-        correlation = analyze_ticket_pair(pair, roi_a, roi_b, wins_a, wins_b)
-        pair_correlations.append(correlation)
+    types = sorted(tickets.keys())
+    backtest_results = backtest_results or {}
+    roi_series = [backtest_results.get(t, {}).get("roi_series") for t in types]
+    win_flags = [backtest_results.get(t, {}).get("win_flags") for t in types]
+
+    # All pairs at once; sync/timing only where both tickets have data
+    matrix = calculate_correlation_matrix(
+        [tuple(tickets[t]) for t in types],
+        roi_series=roi_series if any(r is not None for r in roi_series) else None,
+        win_flags=win_flags if any(w is not None for w in win_flags) else None,
+        labels=types,
+    )
+    rows, cols = matrix.pair_indices()
+    pair_correlations = [
+        matrix.pair_correlation(int(i), int(j), (types[i], types[j]))
+        for i, j in zip(rows, cols)
+    ]
 
     # Apply FDR if we have sync results and enough tests
     fdr_result = None
@@ -575,6 +989,10 @@ __all__ = [
     "TimingResult",
     "PairCorrelation",
     "TicketCorrelationResult",
+    "OverlapMatrix",
+    "SyncMatrix",
+    "TimingMatrix",
+    "TicketCorrelationMatrix",
     # Functions
     "calculate_overlap",
     "calculate_roi_sync",
@@ -582,4 +1000,9 @@ __all__ = [
     "calculate_diversification_score",
     "analyze_ticket_pair",
     "analyze_ticket_correlation",
+    "calculate_overlap_matrix",
+    "calculate_roi_sync_matrix",
+    "calculate_timing_matrix",
+    "calculate_diversification_matrix",
+    "calculate_correlation_matrix",
 ]
@@ -17,7 +17,7 @@ Usage:
     message = bot.format_prediction(result, style="short")
 """
 
-from kenobase.bot.core import BotCore, PredictionResult
+from kenobase.bot.core import BotCore, PredictionResult, SharedPredictionStore
 from kenobase.bot.formatters import (
     format_short,
     format_detailed,
@@ -28,6 +28,7 @@ from kenobase.bot.formatters import (
 __all__ = [
     "BotCore",
     "PredictionResult",
+    "SharedPredictionStore",
     "format_short",
     "format_detailed",
     "format_telegram",
@@ -2,17 +2,33 @@
 
 Orchestriert Prediction-Abrufe und verwaltet Cache fuer Rate-Limiting.
 Integriert mit kenobase.prediction.recommendation fuer Zahlenempfehlungen.
+
+Async-Handler nutzen get_prediction_async(): die Synthese laeuft in einem
+Thread-Pool, abgelaufene Eintraege werden sofort ausgeliefert und im
+Hintergrund erneuert (stale-while-revalidate). Ein optionaler Hintergrund-
+Thread berechnet Predictions vor, sobald sich HYP-Ergebnisse oder
+Ziehungsdaten aendern. Mit cache.shared_path teilen sich mehrere Bot-
+Prozesse (Telegram, Discord) einen dateibasierten Cache; Schreibzugriffe
+werden dort per flock auf eine Lock-Datei serialisiert.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import importlib.util
+import json
 import logging
 import os
+import tempfile
+import threading
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from kenobase.prediction.synthesizer import HypothesisSynthesizer
 from kenobase.prediction.recommendation import (
@@ -23,6 +39,8 @@ from kenobase.prediction.recommendation import (
 
 logger = logging.getLogger(__name__)
 
+HAS_FCNTL = importlib.util.find_spec("fcntl") is not None
+
 
 @dataclass
 class PredictionResult:
@@ -36,6 +54,130 @@ class PredictionResult:
     details: dict[str, Any] = field(default_factory=dict)
     cached: bool = False
 
+    def to_dict(self) -> dict:
+        """Serialisiert das Ergebnis (JSON-kompatibel)."""
+        data = asdict(self)
+        data["timestamp"] = self.timestamp.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PredictionResult":
+        """Erstellt PredictionResult aus to_dict()-Ausgabe."""
+        return cls(
+            numbers=list(data["numbers"]),
+            tier_summary=dict(data.get("tier_summary", {})),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            game_type=data["game_type"],
+            confidence=data.get("confidence", 0.0),
+            details=data.get("details", {}),
+            cached=data.get("cached", False),
+        )
+
+
+class SharedPredictionStore:
+    """Dateibasierter Prediction-Cache fuer mehrere Bot-Prozesse.
+
+    Eine JSON-Datei mit einem Eintrag pro Cache-Key. Schreiben erfolgt
+    atomar (tempfile + os.replace), so dass Leser nie eine halbe Datei sehen.
+    Read-modify-write laeuft unter einem exklusiven flock auf
+    `<path>.lock`, damit parallele Prozesse keine Keys verlieren (ohne
+    fcntl, z.B. unter Windows, nur prozessintern gesperrt).
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialisiert den Store.
+
+        Args:
+            path: Pfad zur JSON-Datei.
+        """
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Exklusive Sperre ueber Threads und Prozesse hinweg."""
+        with self._lock:
+            if not HAS_FCNTL:
+                yield
+                return
+            import fcntl
+
+            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_path, "a") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, cache_key: str) -> Optional[tuple[PredictionResult, float, str]]:
+        """Laedt einen Eintrag.
+
+        Args:
+            cache_key: Cache-Schluessel.
+
+        Returns:
+            Tuple (result, cached_time, fingerprint) oder None.
+        """
+        entry = self._read().get(cache_key)
+        if not entry:
+            return None
+        try:
+            result = PredictionResult.from_dict(entry["result"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return result, float(entry["cached_at"]), entry.get("fingerprint", "")
+
+    def put(
+        self,
+        cache_key: str,
+        result: PredictionResult,
+        cached_time: float,
+        fingerprint: str,
+    ) -> None:
+        """Speichert einen Eintrag (read-modify-write unter Lock, atomar ersetzt).
+
+        Args:
+            cache_key: Cache-Schluessel.
+            result: Zu speicherndes Ergebnis.
+            cached_time: Zeitpunkt der Berechnung (time.time()).
+            fingerprint: Quell-Fingerprint zum Berechnungszeitpunkt.
+        """
+        with self._locked():
+            data = self._read()
+            data[cache_key] = {
+                "result": replace(result, cached=False).to_dict(),
+                "cached_at": cached_time,
+                "fingerprint": fingerprint,
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+    def clear(self) -> None:
+        """Entfernt die Store-Datei."""
+        with self._locked():
+            if self.path.exists():
+                self.path.unlink()
+
 
 class BotCore:
     """Zentraler Bot-Service mit Prediction-Cache.
@@ -67,6 +209,18 @@ class BotCore:
         cache_config = config.get("cache", {})
         self.cache_enabled = cache_config.get("enabled", True)
         self.cache_ttl = cache_config.get("ttl_seconds", 300)
+        self.background_refresh = cache_config.get("background_refresh", False)
+        self.poll_seconds = cache_config.get("poll_seconds", 30)
+        self.precompute_keys: list[tuple[str, int]] = [
+            (str(game), int(top_n))
+            for game, top_n in cache_config.get("precompute", [["keno", 6]])
+        ]
+        self.watch_paths = [Path(p) for p in cache_config.get("watch_paths", [])]
+        self.fingerprint_seconds = cache_config.get("fingerprint_seconds", 5)
+        shared_path = cache_config.get("shared_path")
+        self.shared_store = (
+            SharedPredictionStore(shared_path) if shared_path else None
+        )
 
         # Rate-Limiting
         rate_config = config.get("rate_limit", {})
@@ -76,6 +230,13 @@ class BotCore:
         # Interner State
         self._cache: dict[str, tuple[PredictionResult, float]] = {}
         self._request_times: list[float] = []
+        self._lock = threading.RLock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._inflight: dict[str, Future] = {}
+        self._fingerprints: dict[str, str] = {}
+        self._last_fingerprint: Optional[tuple[str, float]] = None
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_stop = threading.Event()
 
         logger.info(
             f"BotCore initialized: cache_ttl={self.cache_ttl}s, "
@@ -90,9 +251,11 @@ class BotCore:
         """
         now = time.time()
         # Entferne alte Requests (aelter als 60s)
-        self._request_times = [t for t in self._request_times if now - t < 60]
+        with self._lock:
+            self._request_times = [t for t in self._request_times if now - t < 60]
+            n_recent = len(self._request_times)
 
-        if len(self._request_times) >= self.rate_limit_rpm:
+        if n_recent >= self.rate_limit_rpm:
             logger.warning(
                 f"Rate limit reached: {len(self._request_times)}/{self.rate_limit_rpm} rpm"
             )
@@ -101,7 +264,8 @@ class BotCore:
 
     def _record_request(self) -> None:
         """Zeichnet einen Request fuer Rate-Limiting auf."""
-        self._request_times.append(time.time())
+        with self._lock:
+            self._request_times.append(time.time())
 
     def _get_from_cache(self, cache_key: str) -> Optional[PredictionResult]:
         """Holt Prediction aus Cache wenn gueltig.
@@ -115,17 +279,18 @@ class BotCore:
         if not self.cache_enabled:
             return None
 
-        if cache_key in self._cache:
-            result, cached_time = self._cache[cache_key]
-            age = time.time() - cached_time
+        with self._lock:
+            if cache_key in self._cache:
+                result, cached_time = self._cache[cache_key]
+                age = time.time() - cached_time
 
-            if age < self.cache_ttl:
-                logger.debug(f"Cache hit for {cache_key} (age: {age:.1f}s)")
-                result.cached = True
-                return result
-            else:
-                logger.debug(f"Cache expired for {cache_key} (age: {age:.1f}s)")
-                del self._cache[cache_key]
+                if age < self.cache_ttl:
+                    logger.debug(f"Cache hit for {cache_key} (age: {age:.1f}s)")
+                    result.cached = True
+                    return result
+                else:
+                    logger.debug(f"Cache expired for {cache_key} (age: {age:.1f}s)")
+                    del self._cache[cache_key]
 
         return None
 
@@ -137,9 +302,106 @@ class BotCore:
             result: Zu cachende PredictionResult.
         """
         if self.cache_enabled:
-            self._cache[cache_key] = (result, time.time())
+            with self._lock:
+                self._cache[cache_key] = (result, time.time())
             logger.debug(f"Cached prediction for {cache_key}")
 
+    def _get_entry(self, cache_key: str) -> Optional[tuple[PredictionResult, float]]:
+        """Holt Cache-Eintrag unabhaengig vom Alter (fuer stale-while-revalidate).
+
+        Faellt bei einem lokalen Miss auf den geteilten Datei-Store zurueck.
+
+        Args:
+            cache_key: Cache-Schluessel.
+
+        Returns:
+            Tuple (result, cached_time) oder None.
+        """
+        if not self.cache_enabled:
+            return None
+
+        with self._lock:
+            entry = self._cache.get(cache_key)
+        if entry is not None:
+            return entry
+
+        if self.shared_store is not None:
+            shared = self.shared_store.get(cache_key)
+            if shared is not None:
+                result, cached_time, fingerprint = shared
+                with self._lock:
+                    self._cache[cache_key] = (result, cached_time)
+                    self._fingerprints[cache_key] = fingerprint
+                return result, cached_time
+        return None
+
+    def _source_fingerprint(self) -> str:
+        """Fingerprint der Eingabedaten (HYP-Ergebnisse + Ziehungsdaten).
+
+        Basiert auf Name, mtime und Groesse von results_dir/hyp*.json und
+        den konfigurierten cache.watch_paths.
+
+        Returns:
+            Hex-Digest; aendert sich, sobald eine Quelldatei sich aendert.
+        """
+        files: list[Path] = []
+        if self.results_dir.exists():
+            files.extend(self.results_dir.glob("hyp*.json"))
+        for path in self.watch_paths:
+            if path.is_dir():
+                files.extend(p for p in path.rglob("*") if p.is_file())
+            else:
+                files.append(path)
+
+        digest = hashlib.sha1()
+        for path in sorted(set(files)):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            digest.update(f"{path}|{stat.st_mtime_ns}|{stat.st_size}\n".encode())
+        fingerprint = digest.hexdigest()
+        with self._lock:
+            self._last_fingerprint = (fingerprint, time.time())
+        return fingerprint
+
+    def _recent_fingerprint(self) -> str:
+        """Zuletzt berechneter Fingerprint, hoechstens fingerprint_seconds alt.
+
+        Vermeidet, dass jede Anfrage die watch_paths erneut durchlaeuft.
+
+        Returns:
+            Hex-Digest wie _source_fingerprint.
+        """
+        with self._lock:
+            last = self._last_fingerprint
+        if last is not None and time.time() - last[1] < self.fingerprint_seconds:
+            return last[0]
+        return self._source_fingerprint()
+
+    def _check_entry(self, cache_key: str) -> Optional[tuple[PredictionResult, bool]]:
+        """Cache-Eintrag und ob er neu berechnet werden muss.
+
+        Args:
+            cache_key: Cache-Schluessel.
+
+        Returns:
+            Tuple (result, stale) oder None bei einem Miss.
+        """
+        entry = self._get_entry(cache_key)
+        if entry is None:
+            return None
+        result, cached_time = entry
+        return result, self._is_stale(cache_key, cached_time, self._recent_fingerprint())
+
+    def _is_stale(self, cache_key: str, cached_time: float, fingerprint: str) -> bool:
+        """True wenn TTL abgelaufen oder Quelldaten geaendert."""
+        if time.time() - cached_time >= self.cache_ttl:
+            return True
+        with self._lock:
+            known = self._fingerprints.get(cache_key)
+        return known is not None and known != fingerprint
+
     def get_prediction(
         self,
         game_type: str = "keno",
@@ -160,7 +422,6 @@ class BotCore:
             RuntimeError: Bei Rate-Limiting oder Fehlern.
         """
         cache_key = f"{game_type}_{top_n}"
-        start_time = time.time()
 
         # Cache-Check
         if not force_refresh:
@@ -175,6 +436,24 @@ class BotCore:
             )
 
         self._record_request()
+        return self._compute_prediction(game_type, top_n)
+
+    def _compute_prediction(self, game_type: str, top_n: int) -> PredictionResult:
+        """Berechnet Prediction (blockierend) und legt sie im Cache ab.
+
+        Args:
+            game_type: Spieltyp.
+            top_n: Anzahl empfohlener Zahlen.
+
+        Returns:
+            Frisch berechnetes PredictionResult.
+
+        Raises:
+            RuntimeError: Bei Fehlern in der Synthese.
+        """
+        cache_key = f"{game_type}_{top_n}"
+        start_time = time.time()
+        fingerprint = self._source_fingerprint()
 
         try:
             # Lade Synthesizer und generiere Recommendations
@@ -202,20 +481,220 @@ class BotCore:
                 cached=False,
             )
 
-            # Cache speichern
-            self._put_to_cache(cache_key, result)
+        except Exception as e:
+            logger.error(f"Prediction failed for {game_type}: {e}")
+            raise RuntimeError(f"Prediction failed: {e}") from e
+
+        # Cache speichern
+        self._put_to_cache(cache_key, result)
+        if self.cache_enabled:
+            with self._lock:
+                self._fingerprints[cache_key] = fingerprint
+            if self.shared_store is not None:
+                try:
+                    self.shared_store.put(cache_key, result, time.time(), fingerprint)
+                except OSError as e:
+                    logger.warning(f"Shared cache write failed: {e}")
+
+        elapsed = time.time() - start_time
+        logger.info(
+            f"Prediction generated for {game_type}: "
+            f"{result.numbers} in {elapsed:.2f}s"
+        )
+
+        return result
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="botcore"
+                )
+            return self._executor
+
+    def _schedule_refresh(self, game_type: str, top_n: int) -> Future:
+        """Startet Neuberechnung im Thread-Pool (dedupliziert pro Key).
+
+        Args:
+            game_type: Spieltyp.
+            top_n: Anzahl empfohlener Zahlen.
 
-            elapsed = time.time() - start_time
-            logger.info(
-                f"Prediction generated for {game_type}: "
-                f"{result.numbers} in {elapsed:.2f}s"
+        Returns:
+            Future der laufenden (ggf. bereits gestarteten) Berechnung.
+        """
+        cache_key = f"{game_type}_{top_n}"
+        with self._lock:
+            future = self._inflight.get(cache_key)
+            if future is not None and not future.done():
+                return future
+            future = self._get_executor().submit(
+                self._compute_prediction, game_type, top_n
             )
+            self._inflight[cache_key] = future
 
-            return result
+        def _done(f: Future) -> None:
+            with self._lock:
+                if self._inflight.get(cache_key) is f:
+                    del self._inflight[cache_key]
+            if f.exception() is not None:
+                logger.warning(f"Background refresh failed for {cache_key}: {f.exception()}")
 
-        except Exception as e:
-            logger.error(f"Prediction failed for {game_type}: {e}")
-            raise RuntimeError(f"Prediction failed: {e}") from e
+        future.add_done_callback(_done)
+        return future
+
+    async def get_prediction_async(
+        self,
+        game_type: str = "keno",
+        top_n: int = 6,
+        force_refresh: bool = False,
+    ) -> PredictionResult:
+        """Nicht-blockierende Variante von get_prediction fuer Bot-Handler.
+
+        Cache-Eintraege werden auch nach Ablauf sofort ausgeliefert und im
+        Hintergrund erneuert (stale-while-revalidate); der Treffer selbst
+        wartet nie auf den Synthese-Pool. Die Cache-Pruefung (Shared-Store,
+        Quell-Fingerprint) laeuft im Default-Executor des Event-Loops. Nur
+        bei einem Cache-Miss wird auf die Berechnung gewartet - im
+        Thread-Pool, so dass der Event-Loop frei bleibt.
+
+        Args:
+            game_type: Spieltyp ("keno", "eurojackpot", "lotto").
+            top_n: Anzahl empfohlener Zahlen.
+            force_refresh: Ignoriere Cache wenn True.
+
+        Returns:
+            PredictionResult mit Zahlenempfehlungen.
+
+        Raises:
+            RuntimeError: Bei Rate-Limiting oder Fehlern.
+        """
+        cache_key = f"{game_type}_{top_n}"
+
+        if not force_refresh:
+            # Datei-I/O im Default-Executor, nicht im Synthese-Pool (sonst
+            # warten Cache-Treffer hinter laufenden Neuberechnungen)
+            checked = await asyncio.to_thread(self._check_entry, cache_key)
+            if checked is not None:
+                result, stale = checked
+                if stale:
+                    logger.debug(f"Serving stale {cache_key}, refreshing in background")
+                    self._schedule_refresh(game_type, top_n)
+                return replace(result, cached=True)
+
+        if self._is_rate_limited():
+            raise RuntimeError(
+                f"Rate limit exceeded. Please wait {self.cooldown_seconds}s."
+            )
+        self._record_request()
+
+        future = self._schedule_refresh(game_type, top_n)
+        return await asyncio.wrap_future(future)
+
+    def _refresh_now(self, game_type: str, top_n: int) -> PredictionResult:
+        """Berechnet im aufrufenden Thread (ohne Thread-Pool).
+
+        Laeuft fuer den Key bereits eine Berechnung, wird auf deren Ergebnis
+        gewartet statt doppelt zu rechnen.
+
+        Args:
+            game_type: Spieltyp.
+            top_n: Anzahl empfohlener Zahlen.
+
+        Returns:
+            Frisch berechnetes PredictionResult.
+
+        Raises:
+            RuntimeError: Bei Fehlern in der Synthese.
+        """
+        cache_key = f"{game_type}_{top_n}"
+        with self._lock:
+            future = self._inflight.get(cache_key)
+            owner = future is None or future.done()
+            if owner:
+                future = Future()
+                self._inflight[cache_key] = future
+        if not owner:
+            return future.result()
+
+        try:
+            future.set_result(self._compute_prediction(game_type, top_n))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                if self._inflight.get(cache_key) is future:
+                    del self._inflight[cache_key]
+        return future.result()
+
+    def refresh_if_changed(self) -> list[str]:
+        """Berechnet vorkonfigurierte Keys neu, wenn sich Quelldaten aenderten.
+
+        Wird vom Hintergrund-Thread periodisch aufgerufen, kann aber auch
+        direkt (z.B. nach einem Daten-Update) genutzt werden. Die
+        Berechnung laeuft im aufrufenden Thread, der Thread-Pool bleibt fuer
+        Benutzeranfragen frei.
+
+        Returns:
+            Liste der neu berechneten Cache-Keys.
+        """
+        fingerprint = self._source_fingerprint()
+        refreshed = []
+        for game_type, top_n in self.precompute_keys:
+            cache_key = f"{game_type}_{top_n}"
+            entry = self._get_entry(cache_key)
+            with self._lock:
+                known = self._fingerprints.get(cache_key)
+            if entry is not None and known == fingerprint and not self._is_stale(
+                cache_key, entry[1], fingerprint
+            ):
+                continue
+            try:
+                self._refresh_now(game_type, top_n)
+                refreshed.append(cache_key)
+            except RuntimeError as e:
+                logger.warning(f"Precompute failed for {cache_key}: {e}")
+        return refreshed
+
+    def _refresh_loop(self) -> None:
+        while not self._refresh_stop.is_set():
+            try:
+                self.refresh_if_changed()
+            except Exception as e:  # Thread darf nicht sterben
+                logger.error(f"Background refresh error: {e}")
+            self._refresh_stop.wait(self.poll_seconds)
+
+    def start_background_refresh(self) -> None:
+        """Startet Hintergrund-Thread fuer Vorberechnung (idempotent)."""
+        if not self.cache_enabled:
+            return
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_stop.clear()
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_loop, name="botcore-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+        logger.info(
+            f"Background refresh started: keys={self.precompute_keys}, "
+            f"poll={self.poll_seconds}s"
+        )
+
+    def stop_background_refresh(self, timeout: Optional[float] = None) -> None:
+        """Stoppt Hintergrund-Thread und Thread-Pool.
+
+        Args:
+            timeout: Max. Wartezeit auf den Thread in Sekunden.
+        """
+        self._refresh_stop.set()
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+        self._refresh_thread = None
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
 
     def _get_numbers_range(self, game_type: str) -> tuple[int, int]:
         """Gibt Zahlenbereich fuer Spieltyp zurueck.
@@ -287,17 +766,23 @@ class BotCore:
             Dict mit Status-Informationen.
         """
         now = time.time()
-        recent_requests = len([t for t in self._request_times if now - t < 60])
+        with self._lock:
+            recent_requests = len([t for t in self._request_times if now - t < 60])
+            cache_entries = len(self._cache)
 
         return {
             "cache_enabled": self.cache_enabled,
-            "cache_entries": len(self._cache),
+            "cache_entries": cache_entries,
             "cache_ttl_seconds": self.cache_ttl,
             "rate_limit_rpm": self.rate_limit_rpm,
             "requests_last_minute": recent_requests,
             "rate_limit_remaining": self.rate_limit_rpm - recent_requests,
             "results_dir": str(self.results_dir),
             "results_dir_exists": self.results_dir.exists(),
+            "background_refresh": (
+                self._refresh_thread is not None and self._refresh_thread.is_alive()
+            ),
+            "shared_cache": str(self.shared_store.path) if self.shared_store else None,
         }
 
     def clear_cache(self) -> int:
@@ -306,8 +791,12 @@ class BotCore:
         Returns:
             Anzahl der geloeschten Cache-Eintraege.
         """
-        count = len(self._cache)
-        self._cache.clear()
+        with self._lock:
+            count = len(self._cache)
+            self._cache.clear()
+            self._fingerprints.clear()
+        if self.shared_store is not None:
+            self.shared_store.clear()
         logger.info(f"Cleared {count} cache entries")
         return count
 
@@ -332,4 +821,9 @@ def create_bot_core_from_config(config_path: str = "config/default.yaml") -> Bot
     return BotCore(config=bot_config, results_dir=results_dir)
 
 
-__all__ = ["BotCore", "PredictionResult", "create_bot_core_from_config"]
+__all__ = [
+    "BotCore",
+    "PredictionResult",
+    "SharedPredictionStore",
+    "create_bot_core_from_config",
+]
@@ -55,7 +55,7 @@ class PredictionCog(commands.Cog):
             ctx: Command Context.
         """
         try:
-            result = self.bot_core.get_prediction(game_type="keno", top_n=6)
+            result = await self.bot_core.get_prediction_async(game_type="keno", top_n=6)
             message = self.bot_core.format_prediction(result, style="discord")
 
             await ctx.send(message)
@@ -253,8 +253,14 @@ async def run_discord_bot(
         await setup_cogs(bot, bot_core)
         logger.info(f"Discord bot ready: {bot.user}")
 
+    if bot_core.background_refresh:
+        bot_core.start_background_refresh()
+
     logger.info("Starting Discord bot...")
-    await bot.start(token)
+    try:
+        await bot.start(token)
+    finally:
+        bot_core.stop_background_refresh(timeout=5)
 
 
 __all__ = [
@@ -64,7 +64,7 @@ async def predict_command(
 
     try:
         # Hole Prediction
-        result = bot_core.get_prediction(game_type="keno", top_n=6)
+        result = await bot_core.get_prediction_async(game_type="keno", top_n=6)
         message = bot_core.format_prediction(result, style="telegram")
 
         await update.message.reply_text(
@@ -271,6 +271,8 @@ async def run_telegram_bot(
         allowed_chat_ids: Optionale Whitelist.
     """
     app = create_telegram_app(token, bot_core, allowed_chat_ids)
+    if bot_core.background_refresh:
+        bot_core.start_background_refresh()
 
     logger.info("Starting Telegram bot polling...")
     await app.initialize()
@@ -287,6 +289,7 @@ async def run_telegram_bot(
         await app.updater.stop()
         await app.stop()
         await app.shutdown()
+        bot_core.stop_background_refresh(timeout=5)
 
 
 __all__ = [
@@ -21,6 +21,11 @@ from kenobase.core.data_loader import (
     GameType,
     FormatInfo,
 )
+from kenobase.core.draw_collection import (
+    DrawCollection,
+    filter_draws_by_date,
+    sort_draws,
+)
 from kenobase.core.number_pool import (
     NumberPoolGenerator,
     PeriodAnalysis,
@@ -68,6 +73,44 @@ from kenobase.core.economic_state import (
     get_bet_recommendation,
     compute_state_distribution,
 )
+from kenobase.core.bitmask import (
+    encode_draws,
+    encode_many,
+    hit_matrix,
+    intersection_count,
+    number_mask,
+)
+from kenobase.core.keno_ev import (
+    PortfolioDistribution,
+    expected_return,
+    hit_distribution,
+    portfolio_distribution,
+)
+from kenobase.core.exact_distribution import ExactDistribution
+from kenobase.core.portfolio_optimizer import (
+    BacktestObjective,
+    CoverageObjective,
+    OptimizerConfig,
+    PortfolioOptimizer,
+    PortfolioResult,
+)
+from kenobase.core.gq_store import (
+    GQStore,
+    load_gq_frame,
+    set_default_gq_store,
+)
+from kenobase.core.result_cache import (
+    CacheEntry,
+    CacheKey,
+    ResultCache,
+)
+from kenobase.core.profiling import (
+    Profiler,
+    disable_profiling,
+    enable_profiling,
+    profiled,
+    span,
+)
 
 __all__ = [
     # Config
@@ -89,6 +132,9 @@ __all__ = [
     "DrawResult",
     "GameType",
     "FormatInfo",
+    "DrawCollection",
+    "filter_draws_by_date",
+    "sort_draws",
     # Number Pool
     "NumberPoolGenerator",
     "PeriodAnalysis",
@@ -131,4 +177,37 @@ __all__ = [
     "extract_economic_states",
     "get_bet_recommendation",
     "compute_state_distribution",
+    # Bitmask
+    "encode_draws",
+    "encode_many",
+    "hit_matrix",
+    "intersection_count",
+    "number_mask",
+    # Keno EV
+    "PortfolioDistribution",
+    "expected_return",
+    "hit_distribution",
+    "portfolio_distribution",
+    # Exact Distribution
+    "ExactDistribution",
+    # Portfolio Optimizer
+    "BacktestObjective",
+    "CoverageObjective",
+    "OptimizerConfig",
+    "PortfolioOptimizer",
+    "PortfolioResult",
+    # GQ Store
+    "GQStore",
+    "load_gq_frame",
+    "set_default_gq_store",
+    # Result Cache
+    "CacheEntry",
+    "CacheKey",
+    "ResultCache",
+    # Profiling
+    "Profiler",
+    "disable_profiling",
+    "enable_profiling",
+    "profiled",
+    "span",
 ]
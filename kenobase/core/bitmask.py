@@ -0,0 +1,235 @@
+"""Bitmask - Gepackte Darstellung von Ziehungen und Tipps als uint64-Bitmasken.
+
+Ein Zahlenraum bis 128 (KENO 1-70, Lotto 1-49, EuroJackpot 1-50) passt in
+zwei uint64-Woerter; Zahl n belegt Bit (n - 1). Trefferzaehlung wird damit
+zu AND + Popcount statt Set-Intersection:
+
+- number_mask() / mask_bit_count(): Python-int-Masken fuer skalare Schleifen
+  (int.bit_count(), keine Set-Allokation pro Vergleich)
+- encode_many() / encode_draws(): (n, 2) uint64-Arrays fuer viele Ziehungen
+- intersection_count() / union_count() / hit_matrix(): vektorisierter
+  Popcount ueber Arrays (numpy.bitwise_count, Fallback per Byte-Tabelle)
+
+Usage:
+    from kenobase.core.bitmask import encode_draws, encode_many, hit_matrix
+
+    draw_masks = encode_draws(draws)              # (n_draws, 2) uint64
+    ticket_masks = encode_many([[1, 5, 12], [7, 8, 9, 10]])
+    hits = hit_matrix(draw_masks, ticket_masks)   # (n_draws, n_tickets)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from itertools import chain
+
+import numpy as np
+
+from kenobase.core.data_loader import DrawResult
+
+N_WORDS = 2
+MAX_NUMBER = 64 * N_WORDS
+
+_WORD_MASK = (1 << 64) - 1
+
+if hasattr(np, "bitwise_count"):  # numpy >= 2.0
+
+    def _popcount_words(words: np.ndarray) -> np.ndarray:
+        return np.bitwise_count(words)
+
+else:
+    _BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _popcount_words(words: np.ndarray) -> np.ndarray:
+        words = np.ascontiguousarray(words, dtype=np.uint64)
+        per_byte = _BYTE_POPCOUNT[words.view(np.uint8)]
+        return per_byte.reshape(*words.shape, 8).sum(axis=-1, dtype=np.uint8)
+
+
+def _check_number(n: int) -> int:
+    if not 1 <= n <= MAX_NUMBER:
+        raise ValueError(f"Number {n} outside bitmask range 1-{MAX_NUMBER}")
+    return n
+
+
+# ----------------------------------------------------------------------
+# Skalare Masken (Python int)
+# ----------------------------------------------------------------------
+
+
+def number_mask(numbers: Iterable[int]) -> int:
+    """Bitmaske einer Zahlenmenge als Python int.
+
+    Args:
+        numbers: Zahlen im Bereich 1-128
+
+    Returns:
+        int mit gesetztem Bit (n - 1) fuer jede Zahl n.
+
+    Raises:
+        ValueError: Bei Zahlen ausserhalb 1-128
+    """
+    mask = 0
+    for n in numbers:
+        mask |= 1 << (_check_number(int(n)) - 1)
+    return mask
+
+
+def mask_bit_count(mask: int) -> int:
+    """Anzahl gesetzter Bits einer int-Maske."""
+    return mask.bit_count()
+
+
+def mask_numbers(mask: int) -> list[int]:
+    """Dekodiert eine int-Maske in eine sortierte Zahlenliste."""
+    numbers = []
+    while mask:
+        low = mask & -mask
+        numbers.append(low.bit_length())
+        mask ^= low
+    return numbers
+
+
+def masks_to_array(masks: Sequence[int]) -> np.ndarray:
+    """Wandelt int-Masken in ein (n, 2) uint64-Array um.
+
+    Args:
+        masks: Python-int-Masken (z.B. aus number_mask)
+
+    Returns:
+        Array der Form (len(masks), N_WORDS), dtype uint64.
+    """
+    n = len(masks)
+    out = np.empty((n, N_WORDS), dtype=np.uint64)
+    out[:, 0] = np.fromiter((m & _WORD_MASK for m in masks), dtype=np.uint64, count=n)
+    out[:, 1] = np.fromiter((m >> 64 for m in masks), dtype=np.uint64, count=n)
+    return out
+
+
+# ----------------------------------------------------------------------
+# Array-Kodierung
+# ----------------------------------------------------------------------
+
+
+def encode(numbers: Iterable[int]) -> np.ndarray:
+    """Kodiert eine Zahlenmenge als (2,) uint64-Array."""
+    return masks_to_array([number_mask(numbers)])[0]
+
+
+def encode_many(rows: Iterable[Iterable[int]]) -> np.ndarray:
+    """Kodiert viele Zahlenmengen (z.B. Ziehungen oder Tipps) vektorisiert.
+
+    Args:
+        rows: Iterable von Zahlenmengen (unterschiedliche Laengen erlaubt)
+
+    Returns:
+        Array der Form (n_rows, N_WORDS), dtype uint64.
+
+    Raises:
+        ValueError: Bei Zahlen ausserhalb 1-128
+    """
+    rows = [r if isinstance(r, (list, tuple)) else list(r) for r in rows]
+    n_rows = len(rows)
+    if n_rows == 0:
+        return np.zeros((0, N_WORDS), dtype=np.uint64)
+
+    lengths = np.fromiter(map(len, rows), dtype=np.intp, count=n_rows)
+    flat = np.fromiter(chain.from_iterable(rows), dtype=np.int64, count=int(lengths.sum()))
+    if flat.size and (flat.min() < 1 or flat.max() > MAX_NUMBER):
+        bad = flat[(flat < 1) | (flat > MAX_NUMBER)][0]
+        raise ValueError(f"Number {bad} outside bitmask range 1-{MAX_NUMBER}")
+
+    # One-Hot (n_rows x MAX_NUMBER) -> little-endian Bits -> uint64-Woerter
+    onehot = np.zeros(n_rows * MAX_NUMBER, dtype=np.uint8)
+    onehot[np.repeat(np.arange(n_rows) * MAX_NUMBER, lengths) + flat - 1] = 1
+    packed = np.packbits(onehot.reshape(n_rows, MAX_NUMBER), axis=1, bitorder="little")
+    return packed.view("<u8").astype(np.uint64)
+
+
+def encode_draws(draws: Iterable[DrawResult]) -> np.ndarray:
+    """Kodiert die Zahlen von Ziehungen als (n_draws, 2) uint64-Array.
+
+    Fuer eine DrawCollection werden die dort zwischengespeicherten Masken
+    verwendet (einmal pro Sammlung kodiert).
+    """
+    from kenobase.core.draw_collection import DrawCollection
+
+    if isinstance(draws, DrawCollection):
+        return draws.masks
+    return encode_many([d.numbers for d in draws])
+
+
+def decode(words: np.ndarray) -> list[int]:
+    """Dekodiert eine (2,) Maske in eine sortierte Zahlenliste."""
+    words = np.asarray(words, dtype=np.uint64)
+    mask = int(words[0]) | (int(words[1]) << 64)
+    return mask_numbers(mask)
+
+
+# ----------------------------------------------------------------------
+# Vektorisierte Mengenoperationen
+# ----------------------------------------------------------------------
+
+
+def popcount(masks: np.ndarray) -> np.ndarray:
+    """Anzahl gesetzter Bits pro Maske (Summe ueber die letzte Achse).
+
+    Args:
+        masks: Array der Form (..., N_WORDS), dtype uint64
+
+    Returns:
+        int64-Array der Form (...).
+    """
+    return _popcount_words(np.asarray(masks, dtype=np.uint64)).sum(axis=-1, dtype=np.int64)
+
+
+def intersection_count(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """|A ∩ B| fuer broadcast-kompatible Masken-Arrays."""
+    return popcount(np.bitwise_and(a, b))
+
+
+def union_count(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """|A ∪ B| fuer broadcast-kompatible Masken-Arrays."""
+    return popcount(np.bitwise_or(a, b))
+
+
+def hit_matrix(
+    draw_masks: np.ndarray,
+    ticket_masks: np.ndarray,
+    chunk_size: int = 4096,
+) -> np.ndarray:
+    """Treffer jeder Ziehung gegen jeden Tipp.
+
+    Args:
+        draw_masks: (n_draws, N_WORDS) uint64
+        ticket_masks: (n_tickets, N_WORDS) uint64
+        chunk_size: Ziehungen pro Block (begrenzt den Zwischenspeicher)
+
+    Returns:
+        (n_draws, n_tickets) uint8-Array mit Trefferanzahlen.
+    """
+    draw_masks = np.asarray(draw_masks, dtype=np.uint64)
+    ticket_masks = np.asarray(ticket_masks, dtype=np.uint64)
+    out = np.empty((len(draw_masks), len(ticket_masks)), dtype=np.uint8)
+    for start in range(0, len(draw_masks), chunk_size):
+        block = draw_masks[start : start + chunk_size, None, :]
+        out[start : start + chunk_size] = intersection_count(block, ticket_masks[None, :, :])
+    return out
+
+
+__all__ = [
+    "MAX_NUMBER",
+    "N_WORDS",
+    "decode",
+    "encode",
+    "encode_draws",
+    "encode_many",
+    "hit_matrix",
+    "intersection_count",
+    "mask_bit_count",
+    "mask_numbers",
+    "masks_to_array",
+    "number_mask",
+    "popcount",
+    "union_count",
+]
@@ -35,6 +35,7 @@ Usage:
 from __future__ import annotations
 
 import logging
+import random
 from dataclasses import dataclass, field
 from itertools import combinations
 from typing import TYPE_CHECKING, Iterator, Optional
@@ -128,6 +129,7 @@ class CombinationEngine:
 
         # Sortierte Liste fuer konsistente Iteration
         self._sorted_pool = sorted(pool)
+        self._pool_set = frozenset(pool)
 
         logger.debug(
             f"CombinationEngine initialized: pool_size={len(pool)}, "
@@ -178,6 +180,57 @@ class CombinationEngine:
             f"(filtered: {filtered_decade} by decade, {filtered_sum} by sum)"
         )
 
+    def is_valid(self, numbers: tuple[int, ...]) -> bool:
+        """Prueft ob eine Kombination aus dem Pool alle Filter erfuellt.
+
+        Args:
+            numbers: Sortiertes Tuple von Zahlen
+
+        Returns:
+            True wenn Groesse, Pool-Zugehoerigkeit, Dekaden- und Summen-Filter passen
+        """
+        if len(numbers) != self.combination_size or len(set(numbers)) != len(numbers):
+            return False
+        if not self._pool_set.issuperset(numbers):
+            return False
+        return self._passes_decade_filter(numbers) and self._passes_sum_filter(sum(numbers))
+
+    def sample(
+        self,
+        n: int,
+        seed: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+    ) -> list[CombinationResult]:
+        """Zieht bis zu n verschiedene gueltige Kombinationen zufaellig.
+
+        Fuer grosse Pools (z.B. 10 aus 40), bei denen generate() nicht
+        vollstaendig durchlaufen werden kann. Verwendet Rejection-Sampling
+        mit denselben Filtern wie generate().
+
+        Args:
+            n: Gewuenschte Anzahl Kombinationen
+            seed: Zufalls-Seed fuer Reproduzierbarkeit
+            max_attempts: Max. Ziehversuche (default 50 * n)
+
+        Returns:
+            Liste von CombinationResult (kann kuerzer als n sein, wenn die
+            Filter nur wenige Kombinationen zulassen)
+        """
+        rng = random.Random(seed)
+        attempts = max_attempts if max_attempts is not None else 50 * n
+        seen: set[tuple[int, ...]] = set()
+        results: list[CombinationResult] = []
+        for _ in range(attempts):
+            if len(results) >= n:
+                break
+            combo = tuple(sorted(rng.sample(self._sorted_pool, self.combination_size)))
+            if combo in seen:
+                continue
+            seen.add(combo)
+            if self._passes_decade_filter(combo) and self._passes_sum_filter(sum(combo)):
+                results.append(CombinationResult(numbers=combo, sum_value=sum(combo)))
+        return results
+
     def _passes_decade_filter(self, numbers: tuple[int, ...]) -> bool:
         """Prueft ob Kombination die Zehnergruppen-Regel erfuellt.
 
@@ -141,6 +141,8 @@ class SummenSignaturConfig(BaseModel):
     train_output: str = "results/summen_signatur_train.json"
     test_output: str = "results/summen_signatur_test.json"
     latest_output: str = "results/summen_signatur_latest.json"
+    # Parquet-Dataset (inkrementell, neue Ziehungen werden angehaengt); None = aus
+    parquet_output: Optional[str] = None
     bucket_std_low: float = Field(default=0.5, ge=0.0)
     bucket_std_high: float = Field(default=1.5, ge=0.0)
     checksum_algorithm: str = "sha256"
@@ -23,13 +23,16 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import pandas as pd
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from kenobase.core.regions import normalize_region
 
+if TYPE_CHECKING:
+    from kenobase.core.draw_collection import DrawCollection
+
 logger = logging.getLogger(__name__)
 
 
@@ -259,6 +262,26 @@ class DataLoader:
 
         return parser(file_path, format_info)
 
+    def load_collection(
+        self,
+        path: str | Path,
+        game_type: Optional[GameType] = None,
+        encoding: Optional[str] = None,
+    ) -> DrawCollection:
+        """Laedt Ziehungsdaten als sortierte DrawCollection.
+
+        Args:
+            path: Pfad zur CSV-Datei
+            game_type: Optionaler Spieltyp (wird automatisch erkannt wenn None)
+            encoding: Optionales Encoding (Standard: utf-8)
+
+        Returns:
+            DrawCollection mit Datumsindex (chronologisch sortiert)
+        """
+        from kenobase.core.draw_collection import DrawCollection
+
+        return DrawCollection(self.load(path, game_type=game_type, encoding=encoding))
+
     def _detect_format(self, path: Path, encoding: str) -> FormatInfo:
         """Erkennt CSV-Format anhand des Headers.
 
@@ -0,0 +1,325 @@
+"""DrawCollection - Sortierte, unveraenderliche Ziehungs-Sammlung mit Datumsindex.
+
+Viele Analysefunktionen sortieren ihre Eingabe mit
+``sorted(draws, key=lambda d: d.date)`` und filtern danach per
+List-Comprehension nach Datum. DrawCollection sortiert genau einmal und
+haelt zusaetzlich einen datetime64-Index:
+
+- between(start, end) / before(date, n) / since(date): O(log n) per searchsorted
+- Slicing (collection[a:b]) ist zero-copy (gleiche Basis, anderer Offset)
+- weekday_mask / month_mask: vektorisierte Kalender-Filter
+- masks: Zahlen als uint64-Bitmasken (kenobase.core.bitmask), einmal pro
+  Sammlung kodiert und von allen Slices geteilt
+
+DrawCollection ist eine Sequence[DrawResult] und kann ueberall uebergeben
+werden, wo list[DrawResult] erwartet wird. Funktionen, die intern sortieren,
+nutzen sort_draws(): eine DrawCollection wird dabei nicht erneut sortiert.
+
+Usage:
+    from kenobase.core.draw_collection import DrawCollection
+
+    draws = DrawCollection(loader.load("data/raw/keno/KENO_ab_2018.csv"))
+    train = draws.between(datetime(2018, 1, 1), datetime(2023, 12, 31))
+    last_30 = draws.before(datetime(2024, 6, 1), n=30)
+    weekends = draws.select(draws.weekday_mask({5, 6}))
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date, datetime
+from typing import Literal, Optional, Union, overload
+
+import numpy as np
+
+from kenobase.core.bitmask import encode_many
+from kenobase.core.data_loader import DrawResult
+
+DateLike = Union[datetime, date, np.datetime64, str]
+Inclusive = Literal["both", "left", "right", "neither"]
+
+_DATE_UNIT = "datetime64[us]"
+
+
+def _to_datetime64(value: DateLike) -> np.datetime64:
+    """Konvertiert datetime/date/str in datetime64[us]."""
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.replace(tzinfo=None)
+    return np.datetime64(value, "us")
+
+
+class DrawCollection(Sequence[DrawResult]):
+    """Chronologisch sortierte, unveraenderliche Sammlung von DrawResult.
+
+    Slices teilen sich die Basisdaten (Draw-Tupel und Datumsarray); nur
+    Offsets werden neu gesetzt. Masken-Auswahl (select) erzeugt eine neue
+    Basis.
+    """
+
+    __slots__ = ("_draws", "_dates", "_start", "_stop", "_mask_cache")
+
+    def __init__(self, draws: Iterable[DrawResult] = ()):
+        """Erstellt die Sammlung (stabil nach Datum sortiert).
+
+        Args:
+            draws: Beliebig sortierte DrawResult-Objekte
+        """
+        if isinstance(draws, DrawCollection):
+            self._draws = draws._draws
+            self._dates = draws._dates
+            self._start = draws._start
+            self._stop = draws._stop
+            self._mask_cache = draws._mask_cache
+            return
+
+        items = list(draws)
+        dates = np.array([d.date for d in items], dtype=_DATE_UNIT)
+        if len(dates) > 1 and (np.diff(dates) < np.timedelta64(0, "us")).any():
+            order = np.argsort(dates, kind="stable")
+            items = [items[i] for i in order]
+            dates = dates[order]
+
+        dates.flags.writeable = False
+        self._draws: tuple[DrawResult, ...] = tuple(items)
+        self._dates: np.ndarray = dates
+        self._start = 0
+        self._stop = len(items)
+        self._mask_cache: list[Optional[np.ndarray]] = [None]
+
+    @classmethod
+    def _view(cls, base: "DrawCollection", start: int, stop: int) -> "DrawCollection":
+        view = cls.__new__(cls)
+        view._draws = base._draws
+        view._dates = base._dates
+        view._start = start
+        view._stop = max(start, stop)
+        view._mask_cache = base._mask_cache
+        return view
+
+    # ------------------------------------------------------------------
+    # Sequence-Protokoll
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @overload
+    def __getitem__(self, index: int) -> DrawResult: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "DrawCollection": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return DrawCollection._view(self, self._start + start, self._start + stop)
+            return DrawCollection(self._draws[self._start + start : self._start + stop : step])
+
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("DrawCollection index out of range")
+        return self._draws[self._start + index]
+
+    def __iter__(self) -> Iterator[DrawResult]:
+        return iter(self._draws[self._start : self._stop])
+
+    def __reversed__(self) -> Iterator[DrawResult]:
+        return reversed(self._draws[self._start : self._stop])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DrawCollection):
+            return list(self) == list(other)
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __add__(self, other: Iterable[DrawResult]) -> list[DrawResult]:
+        return list(self) + list(other)
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "DrawCollection([])"
+        return (
+            f"DrawCollection(n={len(self)}, "
+            f"{self.first_date:%Y-%m-%d}..{self.last_date:%Y-%m-%d})"
+        )
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    @property
+    def dates(self) -> np.ndarray:
+        """Datumsindex als read-only datetime64[us] View."""
+        return self._dates[self._start : self._stop]
+
+    @property
+    def first_date(self) -> Optional[datetime]:
+        """Datum der ersten Ziehung (None wenn leer)."""
+        return self[0].date if len(self) else None
+
+    @property
+    def last_date(self) -> Optional[datetime]:
+        """Datum der letzten Ziehung (None wenn leer)."""
+        return self[-1].date if len(self) else None
+
+    @property
+    def masks(self) -> np.ndarray:
+        """Gezogene Zahlen als read-only (n, 2) uint64-Bitmasken.
+
+        Wird beim ersten Zugriff fuer die gesamte Basis kodiert und danach
+        von allen Slices geteilt.
+        """
+        masks = self._mask_cache[0]
+        if masks is None:
+            masks = encode_many([d.numbers for d in self._draws])
+            masks.flags.writeable = False
+            self._mask_cache[0] = masks
+        return masks[self._start : self._stop]
+
+    def to_list(self) -> list[DrawResult]:
+        """Kopie als Liste."""
+        return list(self)
+
+    def searchsorted(self, value: DateLike, side: Literal["left", "right"] = "left") -> int:
+        """Einfuegeposition eines Datums (relativ zu dieser Sammlung)."""
+        return int(np.searchsorted(self.dates, _to_datetime64(value), side=side))
+
+    def between(
+        self,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        inclusive: Inclusive = "both",
+    ) -> "DrawCollection":
+        """Ziehungen im Datumsbereich (zero-copy).
+
+        Args:
+            start: Startdatum (None = offen)
+            end: Enddatum (None = offen)
+            inclusive: Welche Grenzen eingeschlossen sind
+                ("both", "left", "right", "neither")
+
+        Returns:
+            DrawCollection-View auf den Bereich.
+        """
+        lo = 0
+        hi = len(self)
+        if start is not None:
+            lo = self.searchsorted(start, "left" if inclusive in ("both", "left") else "right")
+        if end is not None:
+            hi = self.searchsorted(end, "right" if inclusive in ("both", "right") else "left")
+        return DrawCollection._view(self, self._start + lo, self._start + hi)
+
+    def before(self, when: DateLike, n: Optional[int] = None) -> "DrawCollection":
+        """Ziehungen strikt vor einem Datum (optional nur die letzten n).
+
+        Args:
+            when: Stichtag (exklusiv)
+            n: Maximale Anzahl (die juengsten), None = alle
+
+        Returns:
+            DrawCollection-View.
+        """
+        hi = self.searchsorted(when, "left")
+        lo = 0 if n is None else max(0, hi - n)
+        return DrawCollection._view(self, self._start + lo, self._start + hi)
+
+    def since(self, when: DateLike) -> "DrawCollection":
+        """Ziehungen ab einem Datum (inklusive)."""
+        return self.between(start=when)
+
+    def weekday_mask(self, weekdays: Iterable[int]) -> np.ndarray:
+        """Bool-Maske fuer Wochentage (0=Montag ... 6=Sonntag)."""
+        days = self.dates.astype("datetime64[D]").astype(np.int64)
+        weekday = (days + 3) % 7  # 1970-01-01 war ein Donnerstag
+        return np.isin(weekday, list(weekdays))
+
+    def month_mask(self, months: Iterable[int]) -> np.ndarray:
+        """Bool-Maske fuer Monate (1-12)."""
+        month = self.dates.astype("datetime64[M]").astype(np.int64) % 12 + 1
+        return np.isin(month, list(months))
+
+    def year_mask(self, years: Iterable[int]) -> np.ndarray:
+        """Bool-Maske fuer Jahre."""
+        year = self.dates.astype("datetime64[Y]").astype(np.int64) + 1970
+        return np.isin(year, list(years))
+
+    def select(self, mask: np.ndarray) -> "DrawCollection":
+        """Auswahl per Bool-Maske (neue Basis, bleibt sortiert).
+
+        Args:
+            mask: Bool-Array der Laenge len(self)
+
+        Returns:
+            Neue DrawCollection mit den markierten Ziehungen.
+        """
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (len(self),):
+            raise ValueError(f"mask must have shape ({len(self)},), got {mask.shape}")
+        idx = np.flatnonzero(mask) + self._start
+        selected = DrawCollection.__new__(DrawCollection)
+        selected._draws = tuple(self._draws[i] for i in idx)
+        dates = self._dates[idx]
+        dates.flags.writeable = False
+        selected._dates = dates
+        selected._start = 0
+        selected._stop = len(idx)
+        selected._mask_cache = [None]
+        return selected
+
+
+def sort_draws(draws: Sequence[DrawResult]) -> Sequence[DrawResult]:
+    """Chronologisch sortierte Ziehungen ohne erneutes Sortieren einer DrawCollection.
+
+    Ersatz fuer ``sorted(draws, key=lambda d: d.date)`` in Analysefunktionen.
+
+    Args:
+        draws: list[DrawResult] oder DrawCollection
+
+    Returns:
+        Die DrawCollection selbst oder eine sortierte Liste.
+    """
+    if isinstance(draws, DrawCollection):
+        return draws
+    return sorted(draws, key=lambda d: d.date)
+
+
+def filter_draws_by_date(
+    draws: Sequence[DrawResult],
+    start: Optional[DateLike] = None,
+    end: Optional[DateLike] = None,
+) -> Sequence[DrawResult]:
+    """Filtert Ziehungen auf [start, end] (beide inklusive).
+
+    Bei einer DrawCollection per Binaersuche (zero-copy), sonst per Scan
+    unter Beibehaltung der Eingabereihenfolge.
+
+    Args:
+        draws: list[DrawResult] oder DrawCollection
+        start: Startdatum (None = offen)
+        end: Enddatum (None = offen)
+
+    Returns:
+        Gefilterte Ziehungen (gleicher Containertyp wie die Eingabe).
+    """
+    if isinstance(draws, DrawCollection):
+        return draws.between(start, end)
+
+    filtered = list(draws)
+    if start is not None:
+        filtered = [d for d in filtered if d.date >= start]
+    if end is not None:
+        filtered = [d for d in filtered if d.date <= end]
+    return filtered
+
+
+__all__ = [
+    "DrawCollection",
+    "filter_draws_by_date",
+    "sort_draws",
+]
@@ -20,6 +20,7 @@ from typing import Optional
 import numpy as np
 
 from kenobase.core.data_loader import DrawResult
+from kenobase.core.draw_collection import sort_draws
 
 
 @dataclass
@@ -251,7 +252,7 @@ def extract_economic_states(
         List of EconomicState objects, one per draw
     """
     # Sort by date
-    sorted_draws = sorted(draws, key=lambda d: d.date)
+    sorted_draws = sort_draws(draws)
 
     # Extract spieleinsatz values for baseline
     spieleinsatz_values = []
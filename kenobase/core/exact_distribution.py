@@ -0,0 +1,542 @@
+"""Exact Distribution - Exakte Nullverteilungen fuer k-aus-N Ziehungen.
+
+Bei einer Ziehung von k verschiedenen Zahlen aus [numbers_min..numbers_max]
+ist jede k-Teilmenge gleich wahrscheinlich. Statistiken wie Summe, Anzahl
+gerader Zahlen oder Dekaden-Belegung haben daher exakte Verteilungen, die
+sich ueber erzeugende Funktionen berechnen lassen:
+
+- Summe (und Summe x gerade): 0/1-Rucksack-DP als Polynom-Faltung; jede
+  Zahl w verschiebt die Koeffizienten-Matrix um eine Zeile (Anzahl) und
+  w Spalten (Summe). Eine numpy-Operation pro Zahl statt drei
+  verschachtelter Python-Schleifen.
+- Gerade Zahlen: hypergeometrisch, C(E, e) * C(O, k - e).
+- Dekaden: alle Belegungsvektoren (c_1..c_D) mit Summe k, Gewicht
+  prod C(Groesse_d, c_d); abgeleitet daraus maximale Belegung und Anzahl
+  leerer Dekaden.
+
+Die Zaehlungen sind exakt (int64, bzw. Python-int bei C(N, k) >= 2^63).
+Ergebnisse werden prozessweit memoisiert und als .npz unter
+results/.cache/exact abgelegt (ueberschreibbar per KENOBASE_EXACT_CACHE
+oder set_exact_cache_dir), so dass jedes Nullmodell exakte Erwartungen
+praktisch ohne Rechenzeit bekommt.
+
+Usage:
+    from kenobase.core.exact_distribution import exact_distribution
+
+    dist = exact_distribution("sum")              # 20 aus 1..70
+    print(dist.mean, dist.std, dist.prob(710))
+    stat, p, dof = dist.chi_square(observed_sums)
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+EXACT_CACHE_ENV = "KENOBASE_EXACT_CACHE"
+DEFAULT_EXACT_CACHE_DIR = Path("results/.cache/exact")
+
+# Bei Aenderung der Berechnung erhoehen (invalidiert den Disk-Cache)
+EXACT_ENGINE_VERSION = 1
+
+# Statistik -> Spaltennamen des Traegers
+STATISTICS: dict[str, tuple[str, ...]] = {
+    "sum": ("sum",),
+    "even": ("even",),
+    "sum_even": ("sum", "even"),
+    "decades": (),  # Spalten dynamisch: decade_0 .. decade_{D-1}
+    "decade_max": ("decade_max",),
+    "decade_empty": ("decade_empty",),
+}
+
+_DECADE_STATISTICS = frozenset({"decades", "decade_max", "decade_empty"})
+
+_MEMO: dict[tuple, "ExactDistribution"] = {}
+_MEMO_LOCK = threading.Lock()
+_CACHE_DIR: Optional[Path] = None
+
+
+@dataclass(eq=False)
+class ExactDistribution:
+    """Exakte Verteilung einer Statistik ueber alle k-Teilmengen.
+
+    Attributes:
+        statistic: Name der Statistik (siehe STATISTICS)
+        numbers_min: Kleinste Zahl
+        numbers_max: Groesste Zahl
+        numbers_drawn: Anzahl gezogener Zahlen k
+        decade_size: Dekadenbreite (nur fuer Dekaden-Statistiken relevant)
+        columns: Spaltennamen des Traegers
+        support: (m, len(columns)) Werte mit positiver Anzahl, lexikographisch sortiert
+        counts: (m,) exakte Anzahl Teilmengen je Wert
+    """
+
+    statistic: str
+    numbers_min: int
+    numbers_max: int
+    numbers_drawn: int
+    decade_size: int
+    columns: tuple[str, ...]
+    support: np.ndarray
+    counts: np.ndarray
+
+    @property
+    def total(self) -> int:
+        """Anzahl aller k-Teilmengen, C(N, k)."""
+        return math.comb(self.numbers_max - self.numbers_min + 1, self.numbers_drawn)
+
+    @property
+    def values(self) -> np.ndarray:
+        """Traeger als 1-D Array (nur fuer einspaltige Statistiken)."""
+        if len(self.columns) != 1:
+            raise ValueError(f"{self.statistic} is multivariate, use support or marginal()")
+        return self.support[:, 0]
+
+    @property
+    def pmf(self) -> np.ndarray:
+        """Wahrscheinlichkeiten je Traegerwert (float64)."""
+        total = self.total
+        if total == 0:
+            return np.zeros(len(self.counts))
+        if self.counts.dtype == object:
+            return np.array([c / total for c in self.counts], dtype=float)
+        return self.counts / float(total)
+
+    @property
+    def mean(self) -> Union[float, np.ndarray]:
+        """Erwartungswert (Skalar bzw. je Spalte)."""
+        means = self.pmf @ self.support
+        return float(means[0]) if len(self.columns) == 1 else means
+
+    @property
+    def var(self) -> Union[float, np.ndarray]:
+        """Varianz (Skalar bzw. je Spalte)."""
+        pmf = self.pmf
+        centered = self.support - pmf @ self.support
+        variances = pmf @ (centered**2)
+        return float(variances[0]) if len(self.columns) == 1 else variances
+
+    @property
+    def std(self) -> Union[float, np.ndarray]:
+        """Standardabweichung (Skalar bzw. je Spalte)."""
+        return np.sqrt(self.var) if len(self.columns) > 1 else math.sqrt(self.var)
+
+    def count_map(self) -> dict:
+        """Traegerwert -> exakte Anzahl (Tupel als Schluessel bei mehreren Spalten)."""
+        if len(self.columns) == 1:
+            keys = [int(v) for v in self.support[:, 0]]
+        else:
+            keys = [tuple(int(x) for x in row) for row in self.support]
+        return {key: int(c) for key, c in zip(keys, self.counts)}
+
+    def prob(self, value: Union[int, Sequence[int]]) -> float:
+        """Wahrscheinlichkeit eines Traegerwerts (0.0 ausserhalb des Traegers)."""
+        row = np.atleast_1d(np.asarray(value, dtype=np.int64))
+        if row.shape != (len(self.columns),):
+            raise ValueError(f"Expected {len(self.columns)} values for {self.statistic}")
+        matches = np.flatnonzero((self.support == row).all(axis=1))
+        return float(self.pmf[matches[0]]) if matches.size else 0.0
+
+    def marginal(self, column: str) -> ExactDistribution:
+        """Randverteilung einer Spalte (z.B. "even" aus "sum_even")."""
+        if column not in self.columns:
+            raise KeyError(f"Unknown column {column!r} for {self.statistic}")
+        idx = self.columns.index(column)
+        values, counts = _aggregate(self.support[:, idx], self.counts)
+        return ExactDistribution(
+            statistic=f"{self.statistic}:{column}",
+            numbers_min=self.numbers_min,
+            numbers_max=self.numbers_max,
+            numbers_drawn=self.numbers_drawn,
+            decade_size=self.decade_size,
+            columns=(column,),
+            support=_freeze(values[:, None]),
+            counts=_freeze(counts),
+        )
+
+    def bin_probabilities(self, edges: Sequence[float]) -> np.ndarray:
+        """Wahrscheinlichkeit je halboffenem Bin [edges[i], edges[i+1]).
+
+        Args:
+            edges: Aufsteigende Bin-Grenzen (len(edges) - 1 Bins)
+
+        Returns:
+            Array der Bin-Wahrscheinlichkeiten; Werte ausserhalb fallen weg.
+        """
+        edges = np.asarray(edges, dtype=float)
+        n_bins = max(len(edges) - 1, 0)
+        idx = np.searchsorted(edges, self.values, side="right") - 1
+        inside = (idx >= 0) & (idx < n_bins)
+        return np.bincount(idx[inside], weights=self.pmf[inside], minlength=n_bins)[:n_bins]
+
+    def expected_counts(self, n_draws: int) -> np.ndarray:
+        """Erwartete Haeufigkeit je Traegerwert bei n_draws Ziehungen."""
+        return self.pmf * n_draws
+
+    def chi_square(
+        self,
+        observed: Sequence[int],
+        min_expected: float = 5.0,
+    ) -> tuple[float, float, int]:
+        """Chi-Quadrat-Anpassungstest beobachteter Werte gegen die exakte Verteilung.
+
+        Benachbarte Traegerwerte werden von unten zusammengefasst, bis jede
+        Klasse eine erwartete Haeufigkeit >= min_expected hat; ein Rest wird
+        der letzten Klasse zugeschlagen. Beobachtungen ausserhalb des
+        Traegers werden dem naechstgelegenen Traegerwert zugeordnet.
+
+        Args:
+            observed: Beobachtete Werte (ein Wert je Ziehung)
+            min_expected: Mindest-Erwartung je Klasse
+
+        Returns:
+            (statistic, p_value, degrees_of_freedom); (0.0, 1.0, 0) wenn
+            weniger als zwei Klassen uebrig bleiben.
+        """
+        from scipy import stats
+
+        obs = np.asarray(observed, dtype=np.int64)
+        values = self.values
+        if obs.size == 0 or values.size == 0:
+            return 0.0, 1.0, 0
+
+        idx = np.clip(np.searchsorted(values, obs), 0, len(values) - 1)
+        below = (idx > 0) & (np.abs(values[idx - 1] - obs) < np.abs(values[idx] - obs))
+        idx = np.where(below, idx - 1, idx)
+        obs_counts = np.bincount(idx, minlength=len(values))
+        expected = self.expected_counts(int(obs.size))
+
+        merged_obs: list[int] = []
+        merged_exp: list[float] = []
+        acc_obs, acc_exp = 0, 0.0
+        for o, e in zip(obs_counts.tolist(), expected.tolist()):
+            acc_obs += o
+            acc_exp += e
+            if acc_exp >= min_expected:
+                merged_obs.append(acc_obs)
+                merged_exp.append(acc_exp)
+                acc_obs, acc_exp = 0, 0.0
+        if merged_obs:
+            merged_obs[-1] += acc_obs
+            merged_exp[-1] += acc_exp
+
+        if len(merged_obs) < 2:
+            return 0.0, 1.0, 0
+
+        exp_arr = np.asarray(merged_exp, dtype=float)
+        exp_arr *= obs.size / exp_arr.sum()
+        statistic, p_value = stats.chisquare(np.asarray(merged_obs), f_exp=exp_arr)
+        return float(statistic), float(p_value), len(merged_obs) - 1
+
+    def to_dict(self) -> dict:
+        """Serialisierbare Darstellung (Anzahlen als int)."""
+        return {
+            "statistic": self.statistic,
+            "numbers_min": self.numbers_min,
+            "numbers_max": self.numbers_max,
+            "numbers_drawn": self.numbers_drawn,
+            "decade_size": self.decade_size,
+            "columns": list(self.columns),
+            "total": self.total,
+            "support": self.support.tolist(),
+            "counts": [int(c) for c in self.counts],
+        }
+
+
+# ----------------------------------------------------------------------
+# Berechnung
+# ----------------------------------------------------------------------
+
+
+def _freeze(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+def _count_dtype(n: int, k: int) -> type:
+    return np.int64 if math.comb(n, k) < 2**63 else object
+
+
+def _aggregate(keys: np.ndarray, counts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Summiert Anzahlen je Schluessel exakt (ohne Float-Gewichte)."""
+    uniq, inverse = np.unique(keys, axis=0, return_inverse=True)
+    out = np.zeros(len(uniq), dtype=counts.dtype)
+    if out.dtype == object:
+        out[:] = 0
+    np.add.at(out, inverse.reshape(-1), counts)
+    return uniq, out
+
+
+def _sum_dp(weights: np.ndarray, k: int, dtype: type, parity: Optional[np.ndarray] = None):
+    """Polynom-Faltung ueber alle Zahlen: dp[j, (e,) s] = #Teilmengen.
+
+    Args:
+        weights: Verschobene Zahlen (0..N-1)
+        k: Teilmengengroesse
+        dtype: int64 oder object
+        parity: Optional Maske gerader Zahlen (fuegt die Achse e hinzu)
+
+    Returns:
+        dp[k] als (S+1,) bzw. (k+1, S+1) Array.
+    """
+    max_sum = int(np.sort(weights)[::-1][:k].sum())
+    shape = (k + 1, max_sum + 1) if parity is None else (k + 1, k + 1, max_sum + 1)
+    dp = np.zeros(shape, dtype=dtype)
+    if dtype == object:
+        dp[...] = 0
+    dp[(0,) * (len(shape) - 1) + (0,)] = 1
+
+    for i, w in enumerate(int(x) for x in weights):
+        width = max_sum + 1 - w
+        if parity is None:
+            dp[1:, w:] = dp[1:, w:] + dp[:-1, :width]
+        elif parity[i]:
+            dp[1:, 1:, w:] = dp[1:, 1:, w:] + dp[:-1, :-1, :width]
+        else:
+            dp[1:, :, w:] = dp[1:, :, w:] + dp[:-1, :, :width]
+    return dp[k]
+
+
+def _decade_occupancy(sizes: Sequence[int], k: int, dtype: type):
+    """Alle Belegungsvektoren mit Summe k und Gewicht prod C(size_d, c_d)."""
+    states = np.zeros((1, 0), dtype=np.int16)
+    used = np.zeros(1, dtype=np.int64)
+    counts = np.ones(1, dtype=dtype)
+    capacity_left = int(sum(sizes))
+
+    for size in sizes:
+        capacity_left -= size
+        parts_states, parts_used, parts_counts = [], [], []
+        for take in range(min(size, k) + 1):
+            new_used = used + take
+            # Nur Zustaende behalten, die mit den restlichen Dekaden k erreichen koennen
+            keep = (new_used <= k) & (new_used + capacity_left >= k)
+            if not keep.any():
+                continue
+            column = np.full((int(keep.sum()), 1), take, dtype=np.int16)
+            parts_states.append(np.hstack([states[keep], column]))
+            parts_used.append(new_used[keep])
+            parts_counts.append(counts[keep] * math.comb(size, take))
+        states = np.vstack(parts_states)
+        used = np.concatenate(parts_used)
+        counts = np.concatenate(parts_counts)
+
+    order = np.lexsort(states.T[::-1])
+    return states[order].astype(np.int64), counts[order]
+
+
+def _compute(
+    statistic: str,
+    numbers_min: int,
+    numbers_max: int,
+    numbers_drawn: int,
+    decade_size: int,
+) -> ExactDistribution:
+    values = np.arange(numbers_min, numbers_max + 1, dtype=np.int64)
+    n, k = len(values), numbers_drawn
+    dtype = _count_dtype(n, k)
+    columns = STATISTICS[statistic]
+
+    if statistic == "sum":
+        dp = _sum_dp(values - numbers_min, k, dtype)
+        (sums,) = np.nonzero(dp)
+        support = (sums + k * numbers_min)[:, None]
+        counts = dp[sums]
+    elif statistic == "sum_even":
+        dp = _sum_dp(values - numbers_min, k, dtype, parity=values % 2 == 0)
+        evens, sums = np.nonzero(dp)
+        order = np.lexsort((evens, sums))
+        support = np.column_stack([sums + k * numbers_min, evens])[order]
+        counts = dp[evens, sums][order]
+    elif statistic == "even":
+        n_even = int((values % 2 == 0).sum())
+        evens = np.arange(max(0, k - (n - n_even)), min(k, n_even) + 1)
+        support = evens[:, None]
+        counts = np.array(
+            [math.comb(n_even, e) * math.comb(n - n_even, k - e) for e in evens], dtype=dtype
+        )
+    else:
+        decade_idx = (values - numbers_min) // decade_size
+        sizes = np.bincount(decade_idx).tolist()
+        occupancy, counts = _decade_occupancy(sizes, k, dtype)
+        if statistic == "decades":
+            support = occupancy
+            columns = tuple(f"decade_{d}" for d in range(len(sizes)))
+        elif statistic == "decade_max":
+            support, counts = _aggregate(occupancy.max(axis=1), counts)
+            support = support[:, None]
+        else:
+            support, counts = _aggregate((occupancy == 0).sum(axis=1), counts)
+            support = support[:, None]
+
+    return ExactDistribution(
+        statistic=statistic,
+        numbers_min=numbers_min,
+        numbers_max=numbers_max,
+        numbers_drawn=numbers_drawn,
+        decade_size=decade_size,
+        columns=columns,
+        support=_freeze(np.ascontiguousarray(support, dtype=np.int64)),
+        counts=_freeze(np.asarray(counts, dtype=dtype)),
+    )
+
+
+# ----------------------------------------------------------------------
+# Disk-Cache
+# ----------------------------------------------------------------------
+
+
+def set_exact_cache_dir(path: Optional[PathLike]) -> None:
+    """Setzt das Verzeichnis des Disk-Caches (None: KENOBASE_EXACT_CACHE bzw. Default)."""
+    global _CACHE_DIR
+    _CACHE_DIR = Path(path) if path is not None else None
+
+
+def get_exact_cache_dir() -> Path:
+    """Aktives Cache-Verzeichnis (set_exact_cache_dir > KENOBASE_EXACT_CACHE > Default)."""
+    if _CACHE_DIR is not None:
+        return _CACHE_DIR
+    env = os.environ.get(EXACT_CACHE_ENV)
+    return Path(env) if env else DEFAULT_EXACT_CACHE_DIR
+
+
+def _cache_file(cache_dir: Path, key: tuple) -> Path:
+    statistic, numbers_min, numbers_max, numbers_drawn, decade_size = key
+    name = f"{statistic}_n{numbers_min}-{numbers_max}_k{numbers_drawn}"
+    if statistic in _DECADE_STATISTICS:
+        name += f"_d{decade_size}"
+    return cache_dir / f"{name}_v{EXACT_ENGINE_VERSION}.npz"
+
+
+def _load_cached(path: Path, key: tuple) -> Optional[ExactDistribution]:
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            support = data["support"]
+            counts = data["counts"]
+            columns = tuple(str(c) for c in data["columns"])
+    except FileNotFoundError:
+        return None
+    except (OSError, KeyError, ValueError) as e:
+        logger.warning(f"Corrupt exact distribution cache {path.name}: {e}")
+        return None
+    if counts.dtype.kind == "U":
+        counts = np.array([int(c) for c in counts], dtype=object)
+    statistic, numbers_min, numbers_max, numbers_drawn, decade_size = key
+    return ExactDistribution(
+        statistic=statistic,
+        numbers_min=numbers_min,
+        numbers_max=numbers_max,
+        numbers_drawn=numbers_drawn,
+        decade_size=decade_size,
+        columns=columns,
+        support=_freeze(support),
+        counts=_freeze(counts),
+    )
+
+
+def _store_cached(path: Path, dist: ExactDistribution) -> None:
+    counts = dist.counts.astype(str) if dist.counts.dtype == object else dist.counts
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".npz")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, support=dist.support, counts=counts, columns=np.array(dist.columns))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Could not persist exact distribution {path.name}: {e}")
+
+
+# ----------------------------------------------------------------------
+# Oeffentliche API
+# ----------------------------------------------------------------------
+
+
+def exact_distribution(
+    statistic: str,
+    *,
+    numbers_min: int = 1,
+    numbers_max: int = 70,
+    numbers_drawn: int = 20,
+    decade_size: int = 10,
+    persist: bool = True,
+) -> ExactDistribution:
+    """Exakte Verteilung einer Statistik fuer k aus [numbers_min..numbers_max].
+
+    Args:
+        statistic: "sum", "even", "sum_even", "decades", "decade_max" oder "decade_empty"
+        numbers_min: Kleinste Zahl
+        numbers_max: Groesste Zahl
+        numbers_drawn: Anzahl gezogener Zahlen k
+        decade_size: Dekadenbreite; Dekade = (Zahl - numbers_min) // decade_size
+        persist: Disk-Cache lesen/schreiben (Memo-Cache wird immer genutzt)
+
+    Returns:
+        ExactDistribution (memoisiert; Arrays sind schreibgeschuetzt).
+
+    Raises:
+        ValueError: Bei unbekannter Statistik oder ungueltigem Bereich
+    """
+    if statistic not in STATISTICS:
+        raise ValueError(f"Unknown statistic {statistic!r}, expected one of {sorted(STATISTICS)}")
+    n = numbers_max - numbers_min + 1
+    if n <= 0 or not 0 <= numbers_drawn <= n:
+        raise ValueError(f"Cannot draw {numbers_drawn} from [{numbers_min}, {numbers_max}]")
+    if statistic in _DECADE_STATISTICS and decade_size <= 0:
+        raise ValueError(f"decade_size must be positive, got {decade_size}")
+
+    key = (
+        statistic,
+        int(numbers_min),
+        int(numbers_max),
+        int(numbers_drawn),
+        int(decade_size) if statistic in _DECADE_STATISTICS else 0,
+    )
+    with _MEMO_LOCK:
+        cached = _MEMO.get(key)
+    if cached is not None:
+        return cached
+
+    path = _cache_file(get_exact_cache_dir(), key) if persist else None
+    dist = _load_cached(path, key) if path is not None else None
+    if dist is None:
+        dist = _compute(*key)
+        if path is not None:
+            _store_cached(path, dist)
+
+    with _MEMO_LOCK:
+        _MEMO[key] = dist
+    return dist
+
+
+def clear_exact_cache(disk: bool = False) -> None:
+    """Leert den Memo-Cache (und optional die Dateien im Cache-Verzeichnis)."""
+    with _MEMO_LOCK:
+        _MEMO.clear()
+    if disk:
+        for path in get_exact_cache_dir().glob(f"*_v{EXACT_ENGINE_VERSION}.npz"):
+            path.unlink(missing_ok=True)
+
+
+__all__ = [
+    "DEFAULT_EXACT_CACHE_DIR",
+    "EXACT_CACHE_ENV",
+    "EXACT_ENGINE_VERSION",
+    "STATISTICS",
+    "ExactDistribution",
+    "clear_exact_cache",
+    "exact_distribution",
+    "get_exact_cache_dir",
+    "set_exact_cache_dir",
+]
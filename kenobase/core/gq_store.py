@@ -0,0 +1,712 @@
+"""GQ Store - Einmal normalisierte Gewinnquoten (GQ) als typisiertes Dataset.
+
+Die GQ-CSVs (Keno_GQ_*.csv, Quote-Details) werden von mehreren Analysen
+gelesen (distribution, odds_correlation, popularity_correlation,
+payout_inference, near_miss_jackpot). Statt jede Datei pro Aufruf neu zu
+parsen, wird sie hier genau einmal in ein festes Schema ueberfuehrt:
+
+    date          datetime64[ns]
+    keno_type     int8
+    hits          int8     (Anzahl richtiger Zahlen)
+    winners       int64    (Anzahl der Gewinner)
+    payout        float64  (1 Euro Gewinn bzw. Gewinn/1Eur)
+    total_payout  float64  (Auszahlung, NaN wenn nicht vorhanden)
+
+Zwei Ebenen:
+- load_gq_frame(): prozessweiter Memo-Cache (Schluessel Pfad/mtime/Groesse),
+  funktioniert ohne Zusatzabhaengigkeiten.
+- GQStore: nach Jahr partitioniertes Parquet-Dataset (pyarrow, optional)
+  mit Datumsindex im Manifest. Abfragen waehlen Partitionen ueber den
+  Datumsindex und filtern per Predicate-Pushdown auf Row-Group-Ebene.
+
+Layout unter root:
+    year=YYYY/<source_id>.parquet   nach Datum sortierte Zeilen einer Quelle
+    _manifest.json                  Quelle -> Digest, Einstellungen, Partitionen
+
+Usage:
+    from kenobase.core.gq_store import GQStore, load_gq_frame
+
+    frame = load_gq_frame("Keno_GPTs/Keno_GQ_2022_2023-2024.csv")
+
+    store = GQStore("data/gq_store")
+    store.ingest(["Keno_GPTs/Keno_GQ_2022_2023-2024.csv", "Keno_GPTs/Keno_GQ_2025.csv"])
+    typ10 = store.query("2024-01-01", "2024-12-31", keno_types=[10], hits=[9, 10])
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from kenobase.core.parsing import (
+    parse_float_series_mixed_german,
+    parse_int_series_mixed_german,
+)
+
+logger = logging.getLogger(__name__)
+
+# pyarrow wird erst beim ersten Zugriff auf den Store importiert (Startzeit)
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+PathLike = Union[str, Path]
+DateLike = Union[str, datetime, pd.Timestamp, None]
+
+# Version der Normalisierung; Aenderungen invalidieren bestehende Partitionen
+GQ_SCHEMA_VERSION = 1
+
+GQ_COLUMNS: tuple[str, ...] = (
+    "date",
+    "keno_type",
+    "hits",
+    "winners",
+    "payout",
+    "total_payout",
+)
+
+GQ_DTYPES: dict[str, str] = {
+    "date": "datetime64[ns]",
+    "keno_type": "int8",
+    "hits": "int8",
+    "winners": "int64",
+    "payout": "float64",
+    "total_payout": "float64",
+}
+
+# Schema-Spalte -> Spaltenname der Legacy-DataFrames (load_gq_data & Co.)
+LEGACY_COLUMNS: dict[str, str] = {
+    "date": "Datum",
+    "keno_type": "Keno-Typ",
+    "hits": "Anzahl richtiger Zahlen",
+    "winners": "Anzahl der Gewinner",
+    "payout": "1 Euro Gewinn",
+    "total_payout": "Auszahlung",
+}
+
+_PAYOUT_SOURCE_COLUMNS = ("1 Euro Gewinn", "Gewinn/1Eur")
+_REQUIRED_SOURCE_COLUMNS = ("Datum", "Keno-Typ", "Anzahl richtiger Zahlen", "Anzahl der Gewinner")
+
+MANIFEST_NAME = "_manifest.json"
+GQ_STORE_ENV = "KENOBASE_GQ_STORE"
+
+_MEMO_SIZE = 32
+_FRAME_MEMO: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+_MEMO_LOCK = threading.Lock()
+
+
+# ----------------------------------------------------------------------
+# Normalisierung
+# ----------------------------------------------------------------------
+
+
+def infer_default_year(path: PathLike) -> Optional[int]:
+    """Jahr aus dem Dateinamen (z.B. ``Keno_GQ_2025.csv`` -> 2025), sonst None."""
+    match = pd.Series([str(path)]).str.extract(r"(20\d{2})", expand=False).iloc[0]
+    if isinstance(match, str) and match.isdigit():
+        return int(match)
+    return None
+
+
+def _sniff_separator(path: PathLike, encoding: str) -> str:
+    with open(path, encoding=encoding) as handle:
+        header = handle.readline()
+    return ";" if header.count(";") > header.count(",") else ","
+
+
+def _parse_dates(values: pd.Series, default_year: Optional[int]) -> pd.Series:
+    # "08.02.2024" direkt, "So, 28.12." mit default_year
+    date_text = values.astype(str).str.strip()
+    parsed = pd.to_datetime(date_text, format="%d.%m.%Y", errors="coerce")
+    if default_year is not None:
+        dm = date_text.str.extract(r"(?P<day>\d{1,2})\.(?P<month>\d{1,2})\.?", expand=True)
+        needs_fill = parsed.isna() & dm["day"].notna() & dm["month"].notna()
+        if needs_fill.any():
+            reconstructed = (
+                dm.loc[needs_fill, "day"].str.zfill(2)
+                + "."
+                + dm.loc[needs_fill, "month"].str.zfill(2)
+                + f".{default_year}"
+            )
+            parsed.loc[needs_fill] = pd.to_datetime(
+                reconstructed, format="%d.%m.%Y", errors="coerce"
+            )
+    return parsed
+
+
+def empty_gq_frame(columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """Leerer DataFrame im GQ-Schema."""
+    columns = list(columns or GQ_COLUMNS)
+    return pd.DataFrame({c: pd.Series(dtype=GQ_DTYPES[c]) for c in columns})
+
+
+def normalize_gq_frame(raw: pd.DataFrame, default_year: Optional[int] = None) -> pd.DataFrame:
+    """Ueberfuehrt einen roh eingelesenen GQ-DataFrame in das GQ-Schema.
+
+    Bereinigung wie bisher in load_gq_data: Datumsformate mit/ohne Jahr,
+    gemischte deutsche Zahlformate, Zeilen mit nicht-numerischer
+    Gewinnklasse bzw. Keno-Typ (gescrapte "Gewinnklasse..."-Zeilen) werden
+    verworfen. Zahlen werden pro eindeutigem Wert einmal geparst.
+
+    Args:
+        raw: DataFrame mit den Originalspalten der CSV
+        default_year: Jahr fuer Datumsangaben ohne Jahr
+
+    Returns:
+        DataFrame mit GQ_COLUMNS, stabil nach Datum sortiert.
+
+    Raises:
+        ValueError: Wenn Pflichtspalten fehlen
+    """
+    raw = raw.rename(columns=lambda c: str(c).lstrip("\ufeff").strip())
+    missing = [c for c in _REQUIRED_SOURCE_COLUMNS if c not in raw.columns]
+    if missing:
+        raise ValueError(f"GQ data missing columns: {missing}")
+
+    dates = _parse_dates(raw["Datum"], default_year)
+    hits_text = raw["Anzahl richtiger Zahlen"].astype(str).str.strip()
+    type_text = raw["Keno-Typ"].astype(str).str.strip()
+    keep = (
+        dates.notna().to_numpy()
+        & hits_text.str.fullmatch(r"\d+").fillna(False).to_numpy(dtype=bool)
+        & type_text.str.fullmatch(r"\d+").fillna(False).to_numpy(dtype=bool)
+    )
+    rows = raw.loc[keep]
+
+    payout_column = next((c for c in _PAYOUT_SOURCE_COLUMNS if c in rows.columns), None)
+    n_rows = len(rows)
+    frame = pd.DataFrame(
+        {
+            "date": dates[keep].to_numpy(dtype="datetime64[ns]"),
+            "keno_type": type_text[keep].astype(np.int64).to_numpy(dtype=np.int8),
+            "hits": hits_text[keep].astype(np.int64).to_numpy(dtype=np.int8),
+            "winners": parse_int_series_mixed_german(rows["Anzahl der Gewinner"]).to_numpy(),
+            "payout": (
+                parse_float_series_mixed_german(rows[payout_column]).to_numpy()
+                if payout_column is not None
+                else np.full(n_rows, np.nan)
+            ),
+            "total_payout": (
+                parse_float_series_mixed_german(rows["Auszahlung"]).to_numpy()
+                if "Auszahlung" in rows.columns
+                else np.full(n_rows, np.nan)
+            ),
+        }
+    )
+    frame = frame.sort_values("date", kind="stable", ignore_index=True)
+    return frame.astype(GQ_DTYPES)
+
+
+def read_gq_csv(
+    path: PathLike,
+    encoding: str = "utf-8-sig",
+    default_year: Optional[int] = None,
+) -> pd.DataFrame:
+    """Liest eine GQ-CSV (Trenner ``,`` oder ``;``) und normalisiert sie.
+
+    Args:
+        path: Pfad zur CSV-Datei
+        encoding: Encoding der Datei
+        default_year: Jahr fuer Datumsangaben ohne Jahr (default: aus Dateiname)
+
+    Returns:
+        DataFrame im GQ-Schema.
+
+    Raises:
+        FileNotFoundError: Wenn die Datei nicht existiert
+        ValueError: Wenn Pflichtspalten fehlen
+    """
+    if default_year is None:
+        default_year = infer_default_year(path)
+    sep = _sniff_separator(path, encoding)
+    raw = pd.read_csv(path, encoding=encoding, sep=sep)
+    return normalize_gq_frame(raw, default_year=default_year)
+
+
+def to_legacy_frame(frame: pd.DataFrame, payout_column: str = "1 Euro Gewinn") -> pd.DataFrame:
+    """Wandelt einen GQ-Frame in die deutschen Spaltennamen der Legacy-Loader um.
+
+    Optionale Spalten (Quote, Auszahlung) werden nur uebernommen, wenn sie
+    Werte enthalten.
+
+    Args:
+        frame: DataFrame im GQ-Schema
+        payout_column: Name der Quote-Spalte ("1 Euro Gewinn" oder "Gewinn/1Eur")
+
+    Returns:
+        DataFrame mit Datum, Keno-Typ, Anzahl richtiger Zahlen, Anzahl der
+        Gewinner und ggf. Quote/Auszahlung; Gewinnklasse und Typ als int.
+    """
+    legacy = pd.DataFrame(
+        {
+            "Datum": frame["date"],
+            "Keno-Typ": frame["keno_type"].astype(int),
+            "Anzahl richtiger Zahlen": frame["hits"].astype(int),
+            "Anzahl der Gewinner": frame["winners"],
+        }
+    )
+    if "payout" in frame.columns and frame["payout"].notna().any():
+        legacy[payout_column] = frame["payout"]
+    if "total_payout" in frame.columns and frame["total_payout"].notna().any():
+        legacy[LEGACY_COLUMNS["total_payout"]] = frame["total_payout"]
+    return legacy
+
+
+# ----------------------------------------------------------------------
+# Prozessweiter Memo-Cache
+# ----------------------------------------------------------------------
+
+
+def load_gq_frame(
+    path: PathLike,
+    encoding: str = "utf-8-sig",
+    default_year: Optional[int] = None,
+    store: Optional[GQStore] = None,
+) -> pd.DataFrame:
+    """Normalisierte GQ-Daten einer Datei (jede Datei wird nur einmal geparst).
+
+    Ist ein Store angegeben (oder per set_default_gq_store/KENOBASE_GQ_STORE
+    konfiguriert), wird die Datei bei Bedarf eingelesen und aus dem Parquet-
+    Dataset gelesen; sonst dient ein In-Process-Cache (Pfad, mtime, Groesse)
+    als Ablage.
+
+    Args:
+        path: Pfad zur CSV-Datei
+        encoding: Encoding der Datei
+        default_year: Jahr fuer Datumsangaben ohne Jahr (default: aus Dateiname)
+        store: Optionaler GQStore (default: konfigurierter Default-Store)
+
+    Returns:
+        Kopie des DataFrames im GQ-Schema.
+
+    Raises:
+        FileNotFoundError: Wenn die Datei nicht existiert
+        ValueError: Wenn Pflichtspalten fehlen
+    """
+    if default_year is None:
+        default_year = infer_default_year(path)
+    store = store if store is not None else get_default_gq_store()
+    if store is not None:
+        store.ingest([path], encoding=encoding, default_year=default_year)
+        return store.query(sources=[path])
+
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    key = (str(resolved), stat.st_mtime_ns, stat.st_size, encoding, default_year)
+    with _MEMO_LOCK:
+        cached = _FRAME_MEMO.get(key)
+        if cached is not None:
+            _FRAME_MEMO.move_to_end(key)
+            return cached.copy()
+
+    frame = read_gq_csv(resolved, encoding=encoding, default_year=default_year)
+    with _MEMO_LOCK:
+        _FRAME_MEMO[key] = frame
+        while len(_FRAME_MEMO) > _MEMO_SIZE:
+            _FRAME_MEMO.popitem(last=False)
+    return frame.copy()
+
+
+def clear_gq_cache() -> None:
+    """Leert den In-Process-Cache von load_gq_frame."""
+    with _MEMO_LOCK:
+        _FRAME_MEMO.clear()
+
+
+# ----------------------------------------------------------------------
+# Parquet-Store
+# ----------------------------------------------------------------------
+
+
+def _require_pyarrow() -> None:
+    if not HAS_PYARROW:
+        raise ImportError("pyarrow is required for GQStore. Install with: pip install pyarrow")
+
+
+def _source_key(path: PathLike) -> str:
+    return str(Path(path).resolve())
+
+
+def _source_id(source_key: str) -> str:
+    return hashlib.sha256(source_key.encode("utf-8")).hexdigest()[:16]
+
+
+def _as_timestamp(value: DateLike) -> Optional[pd.Timestamp]:
+    return None if value is None else pd.Timestamp(value)
+
+
+@dataclass
+class GQPartition:
+    """Eine Parquet-Datei des Stores (eine Quelle, ein Jahr)."""
+
+    path: str
+    year: int
+    rows: int
+    min_date: str
+    max_date: str
+
+    def overlaps(self, start: Optional[pd.Timestamp], end: Optional[pd.Timestamp]) -> bool:
+        """True wenn der Datumsbereich der Partition [start, end] schneidet."""
+        if start is not None and pd.Timestamp(self.max_date) < start:
+            return False
+        if end is not None and pd.Timestamp(self.min_date) > end:
+            return False
+        return True
+
+
+@dataclass
+class GQSource:
+    """Manifest-Eintrag einer eingelesenen GQ-Datei."""
+
+    source: str
+    digest: str
+    encoding: str
+    default_year: Optional[int]
+    rows: int
+    ingested_at: str
+    schema_version: int = GQ_SCHEMA_VERSION
+    partitions: list[GQPartition] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialisiert den Eintrag fuer das Manifest."""
+        return {
+            "source": self.source,
+            "digest": self.digest,
+            "encoding": self.encoding,
+            "default_year": self.default_year,
+            "rows": self.rows,
+            "ingested_at": self.ingested_at,
+            "schema_version": self.schema_version,
+            "partitions": [vars(p) for p in self.partitions],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> GQSource:
+        """Erzeugt einen Eintrag aus dem Manifest."""
+        data = dict(data)
+        partitions = [GQPartition(**p) for p in data.pop("partitions", [])]
+        return cls(**data, partitions=partitions)
+
+
+class GQStore:
+    """Nach Jahr partitioniertes Parquet-Dataset aller GQ-Dateien.
+
+    Jede Quelldatei wird einmal normalisiert (Digest im Manifest); geaenderte
+    Dateien werden beim naechsten ingest() ersetzt. Abfragen lesen nur die
+    Partitionen, deren Datumsbereich passt, und geben Filter auf Datum,
+    Keno-Typ und Gewinnklasse als Predicate an pyarrow weiter.
+
+    Args:
+        root: Verzeichnis des Stores (wird bei Bedarf angelegt)
+
+    Raises:
+        ImportError: Wenn pyarrow nicht installiert ist
+    """
+
+    def __init__(self, root: PathLike = "data/gq_store") -> None:
+        _require_pyarrow()
+        self.root = Path(root)
+        self._lock = threading.Lock()
+
+    # -- Manifest --------------------------------------------------------
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / MANIFEST_NAME
+
+    def sources(self) -> dict[str, GQSource]:
+        """Alle eingelesenen Quellen (Pfad -> Manifest-Eintrag)."""
+        if not self.manifest_path.exists():
+            return {}
+        with open(self.manifest_path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        return {key: GQSource.from_dict(entry) for key, entry in data["sources"].items()}
+
+    def _write_manifest(self, sources: dict[str, GQSource]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "schema_version": GQ_SCHEMA_VERSION,
+            "sources": {key: src.to_dict() for key, src in sorted(sources.items())},
+        }
+        tmp = self.manifest_path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
+        os.replace(tmp, self.manifest_path)
+
+    # -- Ingestion -------------------------------------------------------
+
+    def _write_partitions(self, source_key: str, frame: pd.DataFrame) -> list[GQPartition]:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        partitions = []
+        source_id = _source_id(source_key)
+        years = frame["date"].dt.year
+        for year, part in frame.groupby(years, sort=True):
+            rel_path = f"year={int(year)}/{source_id}.parquet"
+            target = self.root / rel_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            table = pa.Table.from_pandas(part[list(GQ_COLUMNS)], preserve_index=False)
+            pq.write_table(table, target, row_group_size=8192)
+            partitions.append(
+                GQPartition(
+                    path=rel_path,
+                    year=int(year),
+                    rows=len(part),
+                    min_date=part["date"].min().isoformat(),
+                    max_date=part["date"].max().isoformat(),
+                )
+            )
+        return partitions
+
+    def _remove_partitions(self, source: GQSource) -> None:
+        for partition in source.partitions:
+            (self.root / partition.path).unlink(missing_ok=True)
+
+    def ingest(
+        self,
+        paths: Iterable[PathLike],
+        encoding: str = "utf-8-sig",
+        default_year: Optional[int] = None,
+        force: bool = False,
+    ) -> list[str]:
+        """Normalisiert GQ-Dateien in den Store (unveraenderte Dateien werden uebersprungen).
+
+        Args:
+            paths: Pfade zu GQ-CSV-Dateien
+            encoding: Encoding der Dateien
+            default_year: Jahr fuer Datumsangaben ohne Jahr (default: pro Datei
+                aus dem Dateinamen)
+            force: Auch unveraenderte Dateien neu einlesen
+
+        Returns:
+            Liste der tatsaechlich (neu) eingelesenen Quellen.
+
+        Raises:
+            FileNotFoundError: Wenn eine Datei nicht existiert
+            ValueError: Wenn Pflichtspalten fehlen
+        """
+        from kenobase.core.result_cache import file_digest
+
+        ingested = []
+        with self._lock:
+            sources = self.sources()
+            for path in paths:
+                if not Path(path).is_file():
+                    raise FileNotFoundError(f"GQ file not found: {path}")
+                year = default_year if default_year is not None else infer_default_year(path)
+                key = _source_key(path)
+                digest = file_digest(path)
+                current = sources.get(key)
+                if (
+                    not force
+                    and current is not None
+                    and current.digest == digest
+                    and current.encoding == encoding
+                    and current.default_year == year
+                    and current.schema_version == GQ_SCHEMA_VERSION
+                ):
+                    continue
+
+                frame = read_gq_csv(path, encoding=encoding, default_year=year)
+                if current is not None:
+                    self._remove_partitions(current)
+                sources[key] = GQSource(
+                    source=key,
+                    digest=digest,
+                    encoding=encoding,
+                    default_year=year,
+                    rows=len(frame),
+                    ingested_at=datetime.now().isoformat(timespec="seconds"),
+                    partitions=self._write_partitions(key, frame),
+                )
+                ingested.append(key)
+                logger.info(f"Ingested {len(frame)} GQ rows from {path}")
+            if ingested:
+                self._write_manifest(sources)
+        return ingested
+
+    def remove(self, path: PathLike) -> bool:
+        """Entfernt eine Quelle samt Partitionen aus dem Store."""
+        with self._lock:
+            sources = self.sources()
+            source = sources.pop(_source_key(path), None)
+            if source is None:
+                return False
+            self._remove_partitions(source)
+            self._write_manifest(sources)
+        return True
+
+    # -- Abfragen --------------------------------------------------------
+
+    def partitions(
+        self,
+        start: DateLike = None,
+        end: DateLike = None,
+        sources: Optional[Sequence[PathLike]] = None,
+    ) -> list[GQPartition]:
+        """Partitionen, deren Datumsbereich [start, end] schneidet (Datumsindex).
+
+        Args:
+            start: Erstes Datum (inklusive)
+            end: Letztes Datum (inklusive)
+            sources: Nur diese Quelldateien beruecksichtigen
+
+        Returns:
+            Partitionen in Reihenfolge von ``sources`` (default: nach Pfad), je
+            Quelle nach Jahr.
+        """
+        start_ts, end_ts = _as_timestamp(start), _as_timestamp(end)
+        available = self.sources()
+        if sources is not None:
+            keys = [_source_key(s) for s in sources]
+            missing = [k for k in keys if k not in available]
+            if missing:
+                raise KeyError(f"GQ sources not ingested: {missing}")
+        else:
+            keys = list(available)
+        return [
+            partition
+            for key in keys
+            for partition in available[key].partitions
+            if partition.overlaps(start_ts, end_ts)
+        ]
+
+    def query(
+        self,
+        start: DateLike = None,
+        end: DateLike = None,
+        *,
+        keno_types: Optional[Iterable[int]] = None,
+        hits: Optional[Iterable[int]] = None,
+        columns: Optional[Sequence[str]] = None,
+        sources: Optional[Sequence[PathLike]] = None,
+        deduplicate: bool = False,
+    ) -> pd.DataFrame:
+        """Liest GQ-Zeilen mit Filtern auf Datum, Keno-Typ und Gewinnklasse.
+
+        Args:
+            start: Erstes Datum (inklusive)
+            end: Letztes Datum (inklusive)
+            keno_types: Nur diese Keno-Typen
+            hits: Nur diese Gewinnklassen (Anzahl richtiger Zahlen)
+            columns: Zu lesende Spalten (default: alle aus GQ_COLUMNS)
+            sources: Nur diese Quelldateien (default: alle)
+            deduplicate: Bei Ueberschneidungen mehrerer Quellen nur die letzte
+                Zeile je (date, keno_type, hits) behalten
+
+        Returns:
+            DataFrame im GQ-Schema, stabil nach Datum sortiert.
+
+        Raises:
+            KeyError: Wenn eine angefragte Quelle nicht eingelesen ist
+            ValueError: Bei unbekannten Spalten
+        """
+        import pyarrow.dataset as ds
+
+        columns = list(columns or GQ_COLUMNS)
+        unknown = set(columns) - set(GQ_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown GQ columns: {sorted(unknown)}")
+        read_columns = list(columns)
+        if deduplicate:
+            read_columns += [c for c in ("date", "keno_type", "hits") if c not in read_columns]
+
+        partitions = self.partitions(start, end, sources)
+        if not partitions:
+            return empty_gq_frame(columns)
+
+        predicate = None
+        conditions = []
+        if start is not None:
+            conditions.append(ds.field("date") >= pd.Timestamp(start).to_datetime64())
+        if end is not None:
+            conditions.append(ds.field("date") <= pd.Timestamp(end).to_datetime64())
+        if keno_types is not None:
+            conditions.append(ds.field("keno_type").isin([int(k) for k in keno_types]))
+        if hits is not None:
+            conditions.append(ds.field("hits").isin([int(h) for h in hits]))
+        for condition in conditions:
+            predicate = condition if predicate is None else predicate & condition
+
+        dataset = ds.dataset([str(self.root / p.path) for p in partitions], format="parquet")
+        table = dataset.to_table(columns=read_columns, filter=predicate)
+        frame = table.to_pandas()
+        frame = frame.astype({c: GQ_DTYPES[c] for c in read_columns})
+
+        if deduplicate:
+            frame = frame.drop_duplicates(["date", "keno_type", "hits"], keep="last")
+        if "date" in frame.columns:
+            frame = frame.sort_values("date", kind="stable")
+        return frame[columns].reset_index(drop=True)
+
+    def dates(self, sources: Optional[Sequence[PathLike]] = None) -> pd.DatetimeIndex:
+        """Sortierte, eindeutige Ziehungsdaten im Store."""
+        frame = self.query(columns=["date"], sources=sources)
+        return pd.DatetimeIndex(frame["date"].unique()).sort_values()
+
+
+# ----------------------------------------------------------------------
+# Default-Store
+# ----------------------------------------------------------------------
+
+_DEFAULT_STORE: Optional[GQStore] = None
+
+
+def set_default_gq_store(store: Union[GQStore, PathLike, None]) -> Optional[GQStore]:
+    """Setzt den Store, den load_gq_frame (und damit die GQ-Loader) verwenden.
+
+    Args:
+        store: GQStore, Verzeichnis eines Stores oder None (nur Memo-Cache)
+
+    Returns:
+        Der gesetzte Store (oder None).
+    """
+    global _DEFAULT_STORE
+    if store is not None and not isinstance(store, GQStore):
+        store = GQStore(store)
+    _DEFAULT_STORE = store
+    return store
+
+
+def get_default_gq_store() -> Optional[GQStore]:
+    """Konfigurierter Default-Store (set_default_gq_store oder KENOBASE_GQ_STORE)."""
+    if _DEFAULT_STORE is not None:
+        return _DEFAULT_STORE
+    root = os.environ.get(GQ_STORE_ENV)
+    if root and HAS_PYARROW:
+        return GQStore(root)
+    return None
+
+
+__all__ = [
+    "GQ_COLUMNS",
+    "GQ_DTYPES",
+    "GQ_SCHEMA_VERSION",
+    "GQ_STORE_ENV",
+    "GQPartition",
+    "GQSource",
+    "GQStore",
+    "HAS_PYARROW",
+    "LEGACY_COLUMNS",
+    "clear_gq_cache",
+    "empty_gq_frame",
+    "get_default_gq_store",
+    "infer_default_year",
+    "load_gq_frame",
+    "normalize_gq_frame",
+    "read_gq_csv",
+    "set_default_gq_store",
+    "to_legacy_frame",
+]
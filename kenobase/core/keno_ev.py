@@ -0,0 +1,450 @@
+"""Keno EV - Exakte Gewinnverteilungen fuer einzelne Tipps und Portfolios.
+
+Ein einzelner Tipp vom Typ k hat hypergeometrisch verteilte Treffer
+(20 aus 70 gezogen). Fuer mehrere, sich ueberlappende Tipps sind die
+Treffer nicht unabhaengig; die gemeinsame Verteilung ergibt sich exakt
+ueber die Venn-Regionen der Tipps:
+
+- Jede gespielte Zahl gehoert zu genau einer Region (Menge der Tipps,
+  die sie enthalten); die Anzahl gezogener Zahlen pro Region ist
+  multivariat hypergeometrisch verteilt.
+- Die Regionen werden nacheinander aufgezaehlt. Sobald alle Regionen
+  eines Tipps verarbeitet sind, wird seine Trefferzahl in die Auszahlung
+  gefaltet, so dass der Zustand klein bleibt (gezogene Zahlen, Treffer
+  offener Tipps, bisherige Auszahlung).
+- Zustaende werden als numpy-Arrays gefuehrt und nach jeder Region
+  zusammengefasst; Gewichte sind Produkte von Binomialkoeffizienten,
+  normiert erst am Ende mit C(70, 20).
+
+Ersetzt die verstreuten Einzelberechnungen (near_miss, Backtester,
+generate_guarantee) und Monte-Carlo-Simulationen fuer Portfolios.
+
+Usage:
+    from kenobase.core.keno_ev import portfolio_distribution
+
+    dist = portfolio_distribution([[1, 2, 3, 4, 5, 6], [4, 5, 6, 7, 8, 9]])
+    print(dist.ev, dist.p_profit, dist.prob_at_least(100.0))
+"""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+from kenobase.core.keno_quotes import KENO_FIXED_QUOTES_BY_TYPE
+
+KENO_NUMBERS_RANGE = 70
+KENO_NUMBERS_DRAWN = 20
+
+# Auszahlungen werden auf diese Stellenzahl gerundet, um Float-Rauschen
+# beim Aufsummieren nicht als unterschiedliche Auszahlungswerte zu zaehlen.
+_PAYOUT_DECIMALS = 6
+
+# Obergrenze fuer Zwischenzustaende (Speicherschutz bei dichten Portfolios)
+DEFAULT_MAX_STATES = 5_000_000
+
+
+# ----------------------------------------------------------------------
+# Einzelner Tipp
+# ----------------------------------------------------------------------
+
+
+@lru_cache(maxsize=None)
+def _hit_distribution(
+    keno_type: int, numbers_range: int, numbers_drawn: int
+) -> tuple[float, ...]:
+    denom = math.comb(numbers_range, numbers_drawn)
+    return tuple(
+        math.comb(keno_type, m) * math.comb(numbers_range - keno_type, numbers_drawn - m) / denom
+        for m in range(keno_type + 1)
+    )
+
+
+def hit_distribution(
+    keno_type: int,
+    *,
+    numbers_range: int = KENO_NUMBERS_RANGE,
+    numbers_drawn: int = KENO_NUMBERS_DRAWN,
+) -> dict[int, float]:
+    """Exakte Trefferverteilung eines Tipps mit keno_type Zahlen.
+
+    P(X=m) = C(k, m) * C(N-k, n-m) / C(N, n)
+
+    Args:
+        keno_type: Anzahl gespielter Zahlen k
+        numbers_range: Zahlenraum N (KENO: 70)
+        numbers_drawn: Gezogene Zahlen n (KENO: 20)
+
+    Returns:
+        Dict Trefferanzahl -> Wahrscheinlichkeit (0..keno_type).
+    """
+    if not 0 <= keno_type <= numbers_range:
+        raise ValueError(f"keno_type {keno_type} outside 0-{numbers_range}")
+    probs = _hit_distribution(int(keno_type), int(numbers_range), int(numbers_drawn))
+    return dict(enumerate(probs))
+
+
+def hit_probability(
+    keno_type: int,
+    matches: int,
+    *,
+    numbers_range: int = KENO_NUMBERS_RANGE,
+    numbers_drawn: int = KENO_NUMBERS_DRAWN,
+) -> float:
+    """Wahrscheinlichkeit fuer genau `matches` Treffer (0.0 ausserhalb 0..k)."""
+    if matches < 0 or matches > keno_type:
+        return 0.0
+    return hit_distribution(
+        keno_type, numbers_range=numbers_range, numbers_drawn=numbers_drawn
+    )[matches]
+
+
+def hypergeom_mean_var(
+    *,
+    keno_type: int,
+    numbers_range: int = KENO_NUMBERS_RANGE,
+    numbers_drawn: int = KENO_NUMBERS_DRAWN,
+) -> tuple[float, float]:
+    """Erwartungswert und Varianz der Treffer eines Tipps (geschlossene Form).
+
+    Returns:
+        Tuple (mean, var).
+    """
+    n = numbers_drawn
+    N = numbers_range
+    K = keno_type
+    mean = n * (K / N)
+    var = n * (K / N) * (1.0 - K / N) * ((N - n) / (N - 1))
+    return float(mean), float(var)
+
+
+def expected_return(
+    keno_type: int,
+    *,
+    quotes: Optional[Mapping[int, Mapping[int, float]]] = None,
+) -> float:
+    """Erwartete Brutto-Auszahlung pro 1 EUR Einsatz fuer einen Tipp.
+
+    Args:
+        keno_type: Keno-Typ (2-10)
+        quotes: Quotentabelle Typ -> {Treffer: EUR} (Default: feste KENO-Quoten)
+
+    Returns:
+        Erwartete Auszahlung in EUR (ROI = Wert - 1).
+
+    Raises:
+        ValueError: Wenn fuer keno_type keine Quoten existieren
+    """
+    table = (quotes if quotes is not None else KENO_FIXED_QUOTES_BY_TYPE).get(int(keno_type))
+    if not table:
+        raise ValueError(f"Unsupported keno_type: {keno_type}")
+    probs = hit_distribution(int(keno_type))
+    return float(sum(probs.get(int(h), 0.0) * float(q) for h, q in table.items()))
+
+
+# ----------------------------------------------------------------------
+# Portfolio
+# ----------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class PortfolioDistribution:
+    """Exakte Auszahlungsverteilung eines Ticket-Portfolios fuer eine Ziehung.
+
+    Attributes:
+        payouts: Sortierte, eindeutige Brutto-Auszahlungen in EUR
+        probabilities: Wahrscheinlichkeit je Auszahlung (Summe 1)
+        stake: Gesamteinsatz in EUR
+        n_tickets: Anzahl Tipps
+        n_regions: Anzahl Venn-Regionen (ohne ungespielte Zahlen)
+    """
+
+    payouts: np.ndarray
+    probabilities: np.ndarray
+    stake: float
+    n_tickets: int
+    n_regions: int
+
+    @property
+    def ev(self) -> float:
+        """Erwartete Brutto-Auszahlung."""
+        return float(np.dot(self.payouts, self.probabilities))
+
+    @property
+    def variance(self) -> float:
+        return float(np.dot((self.payouts - self.ev) ** 2, self.probabilities))
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def expected_profit(self) -> float:
+        return self.ev - self.stake
+
+    @property
+    def roi(self) -> float:
+        """Erwarteter Nettogewinn relativ zum Einsatz."""
+        return self.expected_profit / self.stake if self.stake else 0.0
+
+    @property
+    def p_profit(self) -> float:
+        """P(Auszahlung > Einsatz)."""
+        return self.prob_at_least(self.stake, strict=True)
+
+    @property
+    def p_no_payout(self) -> float:
+        return float(self.probabilities[self.payouts <= 0].sum())
+
+    def prob_at_least(self, amount: float, *, strict: bool = False) -> float:
+        """Tail-Wahrscheinlichkeit P(Auszahlung >= amount) bzw. > amount."""
+        mask = self.payouts > amount if strict else self.payouts >= amount
+        return float(self.probabilities[mask].sum())
+
+    def quantile(self, q: float) -> float:
+        """Kleinste Auszahlung x mit P(Auszahlung <= x) >= q."""
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be in [0, 1]")
+        cdf = np.cumsum(self.probabilities)
+        idx = int(np.searchsorted(cdf, q - 1e-12, side="left"))
+        return float(self.payouts[min(idx, len(self.payouts) - 1)])
+
+    def to_dict(self) -> dict:
+        return {
+            "n_tickets": self.n_tickets,
+            "n_regions": self.n_regions,
+            "stake": self.stake,
+            "ev": self.ev,
+            "expected_profit": self.expected_profit,
+            "roi": self.roi,
+            "variance": self.variance,
+            "std": self.std,
+            "p_profit": self.p_profit,
+            "p_no_payout": self.p_no_payout,
+            "distribution": {
+                str(float(p)): float(prob)
+                for p, prob in zip(self.payouts, self.probabilities)
+            },
+        }
+
+
+def _venn_regions(
+    tickets: Sequence[Sequence[int]], numbers_range: int
+) -> list[tuple[tuple[int, ...], int]]:
+    """Gruppiert gespielte Zahlen nach der Menge der Tipps, die sie enthalten.
+
+    Returns:
+        Liste (Tipp-Indizes, Regionsgroesse) in Verarbeitungsreihenfolge.
+    """
+    membership: dict[int, list[int]] = defaultdict(list)
+    for idx, ticket in enumerate(tickets):
+        numbers = [int(n) for n in ticket]
+        if len(set(numbers)) != len(numbers):
+            raise ValueError(f"Ticket {idx} contains duplicate numbers: {list(ticket)}")
+        for n in numbers:
+            if not 1 <= n <= numbers_range:
+                raise ValueError(f"Ticket {idx}: number {n} outside 1-{numbers_range}")
+            membership[n].append(idx)
+
+    sizes: dict[tuple[int, ...], int] = defaultdict(int)
+    for members in membership.values():
+        sizes[tuple(members)] += 1
+    regions = sorted(sizes.items())
+    return [regions[r] for r in _region_order(regions, len(tickets))]
+
+
+def _merge_states(
+    drawn: np.ndarray, hits: np.ndarray, payout: np.ndarray, weight: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Fasst Zeilen mit identischem (gezogen, Treffer, Auszahlung) zusammen.
+
+    Der Zustand wird, wenn er in 63 Bit passt, zu einem int64-Schluessel
+    gepackt (1-D np.unique ist deutlich schneller als axis=0).
+    """
+    payout = np.round(payout, _PAYOUT_DECIMALS)
+    _, payout_code = np.unique(payout, return_inverse=True)
+    columns = [drawn, *hits.T, payout_code.reshape(-1)]
+    widths = [max(int(col.max()), 1).bit_length() if len(col) else 1 for col in columns]
+
+    if sum(widths) <= 63:
+        key = np.zeros(len(drawn), dtype=np.int64)
+        for col, width in zip(columns, widths):
+            key = (key << width) | col.astype(np.int64)
+        _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+    else:
+        _, first, inverse = np.unique(
+            np.column_stack(columns), axis=0, return_index=True, return_inverse=True
+        )
+    inverse = inverse.reshape(-1)
+    merged_weight = np.bincount(inverse, weights=weight, minlength=len(first))
+    return drawn[first], hits[first], payout[first], merged_weight
+
+
+def _region_order(regions: list[tuple[tuple[int, ...], int]], n_tickets: int) -> list[int]:
+    """Reihenfolge der Regionen, die offene Tipps moeglichst frueh abschliesst.
+
+    Greedy: Es wird jeweils der offene Tipp mit den wenigsten verbleibenden
+    Regionen vollstaendig abgearbeitet.
+    """
+    remaining: dict[int, set[int]] = {t: set() for t in range(n_tickets)}
+    for r, (members, _) in enumerate(regions):
+        for t in members:
+            remaining[t].add(r)
+
+    order: list[int] = []
+    done: set[int] = set()
+    opened: set[int] = set()
+    while len(done) < len(regions):
+        candidates = [t for t in opened if remaining[t]] or [
+            t for t in range(n_tickets) if remaining[t]
+        ]
+        ticket = min(candidates, key=lambda t: (len(remaining[t]), t))
+        for r in sorted(remaining[ticket], key=lambda r: (len(regions[r][0]), r)):
+            order.append(r)
+            done.add(r)
+            for t in regions[r][0]:
+                remaining[t].discard(r)
+                opened.add(t)
+    return order
+
+
+def portfolio_distribution(
+    tickets: Sequence[Sequence[int]],
+    *,
+    stakes: Optional[Sequence[float]] = None,
+    quotes: Optional[Mapping[int, Mapping[int, float]]] = None,
+    numbers_range: int = KENO_NUMBERS_RANGE,
+    numbers_drawn: int = KENO_NUMBERS_DRAWN,
+    max_states: int = DEFAULT_MAX_STATES,
+) -> PortfolioDistribution:
+    """Exakte gemeinsame Auszahlungsverteilung mehrerer Tipps fuer eine Ziehung.
+
+    Der Keno-Typ jedes Tipps ist seine Laenge; die Auszahlung eines Tipps
+    ist stake * quotes[typ][treffer].
+
+    Args:
+        tickets: Tipps als Zahlenlisten (duerfen sich ueberlappen)
+        stakes: Einsatz pro Tipp in EUR (Default: 1 EUR je Tipp)
+        quotes: Quotentabelle Typ -> {Treffer: EUR pro 1 EUR Einsatz}
+            (Default: KENO_FIXED_QUOTES_BY_TYPE)
+        numbers_range: Zahlenraum (KENO: 70)
+        numbers_drawn: Gezogene Zahlen (KENO: 20)
+        max_states: Maximale Anzahl Zwischenzustaende; dichte Portfolios mit
+            vielen gleichzeitig offenen Tipps ueberschreiten sie
+
+    Returns:
+        PortfolioDistribution mit EV, Varianz, P(Gewinn) und Tail-Wahrscheinlichkeiten.
+
+    Raises:
+        ValueError: Bei leeren/ungueltigen Tipps, unbekanntem Keno-Typ oder
+            wenn max_states ueberschritten wird
+    """
+    if not tickets:
+        raise ValueError("At least one ticket is required")
+    table = quotes if quotes is not None else KENO_FIXED_QUOTES_BY_TYPE
+    stakes = [1.0] * len(tickets) if stakes is None else [float(s) for s in stakes]
+    if len(stakes) != len(tickets):
+        raise ValueError("stakes must have the same length as tickets")
+
+    # Auszahlung je Tipp und Trefferzahl (vorab skaliert mit dem Einsatz)
+    payout_by_hits: list[list[float]] = []
+    for idx, ticket in enumerate(tickets):
+        keno_type = len(ticket)
+        if keno_type not in table:
+            raise ValueError(f"Ticket {idx}: unsupported keno_type {keno_type}")
+        payout_by_hits.append(
+            [stakes[idx] * float(table[keno_type].get(h, 0.0)) for h in range(keno_type + 1)]
+        )
+
+    regions = _venn_regions(tickets, numbers_range)
+    n_played = sum(size for _, size in regions)
+    n_unplayed = numbers_range - n_played
+
+    # Letzte Region, in der ein Tipp vorkommt -> danach wird er abgeschlossen
+    finish_at: dict[int, list[int]] = defaultdict(list)
+    for ticket_idx in range(len(tickets)):
+        last = max(r for r, (members, _) in enumerate(regions) if ticket_idx in members)
+        finish_at[last].append(ticket_idx)
+
+    # Vektorisierter Zustand je Zeile: gezogene Zahlen, Treffer offener Tipps,
+    # bisherige Auszahlung, Gewicht (Produkt der Binomialkoeffizienten)
+    open_tickets: list[int] = []
+    drawn = np.zeros(1, dtype=np.int64)
+    hits = np.zeros((1, 0), dtype=np.int8)
+    payout = np.zeros(1, dtype=np.float64)
+    weight = np.ones(1, dtype=np.float64)
+
+    for r, (members, size) in enumerate(regions):
+        for t in members:
+            if t not in open_tickets:
+                open_tickets.append(t)
+                hits = np.hstack([hits, np.zeros((len(hits), 1), dtype=np.int8)])
+
+        # Jede Zeile mit c = 0..size gezogenen Zahlen aus der Region erweitern
+        counts = np.arange(size + 1)
+        rows = len(drawn)
+        c = np.tile(counts, rows)
+        src = np.repeat(np.arange(rows), size + 1)
+        keep = drawn[src] + c <= numbers_drawn
+        c, src = c[keep], src[keep]
+        if len(src) > max_states:
+            raise ValueError(
+                f"Portfolio too dense for exact enumeration ({len(src)} states > "
+                f"max_states={max_states}); reduce overlap or split the portfolio"
+            )
+
+        drawn = drawn[src] + c
+        hits = hits[src]
+        cols = [open_tickets.index(t) for t in members]
+        hits[:, cols] += c[:, None].astype(np.int8)
+        payout = payout[src].copy()
+        comb = np.array([math.comb(size, k) for k in counts], dtype=np.float64)
+        weight = weight[src] * comb[c]
+
+        finishing = finish_at.get(r, [])
+        if finishing:
+            for t in finishing:
+                col = open_tickets.index(t)
+                payout += np.asarray(payout_by_hits[t], dtype=np.float64)[hits[:, col]]
+            keep_cols = [i for i, t in enumerate(open_tickets) if t not in finishing]
+            open_tickets = [open_tickets[i] for i in keep_cols]
+            hits = hits[:, keep_cols]
+
+        drawn, hits, payout, weight = _merge_states(drawn, hits, payout, weight)
+
+    # Restliche gezogene Zahlen fallen auf ungespielte Zahlen
+    rest = numbers_drawn - drawn
+    valid = rest <= n_unplayed
+    rest_comb = np.array(
+        [math.comb(n_unplayed, k) if k <= n_unplayed else 0 for k in range(numbers_drawn + 1)],
+        dtype=np.float64,
+    )
+    unique_payouts, inverse = np.unique(payout[valid], return_inverse=True)
+    totals = np.bincount(inverse, weights=weight[valid] * rest_comb[rest[valid]])
+
+    return PortfolioDistribution(
+        payouts=unique_payouts,
+        probabilities=totals / math.comb(numbers_range, numbers_drawn),
+        stake=float(sum(stakes)),
+        n_tickets=len(tickets),
+        n_regions=len(regions),
+    )
+
+
+__all__ = [
+    "DEFAULT_MAX_STATES",
+    "KENO_NUMBERS_DRAWN",
+    "KENO_NUMBERS_RANGE",
+    "PortfolioDistribution",
+    "expected_return",
+    "hit_distribution",
+    "hit_probability",
+    "hypergeom_mean_var",
+    "portfolio_distribution",
+]
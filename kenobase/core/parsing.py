@@ -15,7 +15,10 @@ from __future__ import annotations
 
 import math
 import re
-from typing import Any
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
 
 _THOUSAND_GROUPS_DOT = re.compile(r"^\d{1,3}(?:\.\d{3})+$")
 _TWO_DECIMALS_DOT = re.compile(r"^\d+\.\d{2}$")
@@ -134,7 +137,32 @@ def parse_int_mixed_german(value: Any, *, default: int = 0) -> int:
     return int(digits) if digits else default
 
 
+def _parse_unique(values: pd.Series, parser: Callable[[Any], Any], dtype: Any) -> np.ndarray:
+    # Jeder eindeutige Wert wird genau einmal geparst (Spalten wiederholen sich stark)
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    parsed = np.array([parser(u) for u in uniques] + [parser(None)], dtype=dtype)
+    return parsed[codes]  # Code -1 (NaN) -> letzter Eintrag (default)
+
+
+def parse_int_series_mixed_german(values: pd.Series, *, default: int = 0) -> pd.Series:
+    """Vectorized ``parse_int_mixed_german`` for a whole column (same results as ``.apply``)."""
+    parsed = _parse_unique(
+        values, lambda v: parse_int_mixed_german(v, default=default), np.int64
+    )
+    return pd.Series(parsed, index=values.index, name=values.name)
+
+
+def parse_float_series_mixed_german(values: pd.Series, *, default: float = 0.0) -> pd.Series:
+    """Vectorized ``parse_float_mixed_german`` for a whole column (same results as ``.apply``)."""
+    parsed = _parse_unique(
+        values, lambda v: parse_float_mixed_german(v, default=default), np.float64
+    )
+    return pd.Series(parsed, index=values.index, name=values.name)
+
+
 __all__ = [
     "parse_float_mixed_german",
+    "parse_float_series_mixed_german",
     "parse_int_mixed_german",
+    "parse_int_series_mixed_german",
 ]
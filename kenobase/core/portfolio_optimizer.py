@@ -0,0 +1,642 @@
+"""Portfolio Optimizer - Ticket-Portfolios mit maximaler Abdeckung oder Backtest-ROI.
+
+Sucht fuer ein Budget von n Tipps ein Portfolio aus den gueltigen
+Kombinationen einer CombinationEngine (Pool + Dekaden-/Summen-Filter):
+
+1. Kandidaten: vollstaendige Aufzaehlung via generate() fuer kleine Pools,
+   sonst Stichprobe via sample() (Pools mit 30-40 Zahlen)
+2. Lazy Greedy (CELF): Marginalgewinne werden nur neu berechnet, wenn ein
+   Kandidat oben im Heap landet (Ziele sind submodular)
+3. Simulated Annealing: Austausch einzelner Tipps bzw. einzelner Zahlen
+   eines Tipps, Temperatur relativ zum mittleren Tippbeitrag
+4. Mehrere Restarts (verschiedene Seeds und Kandidaten-Stichproben)
+   parallel in einem ProcessPoolExecutor; das beste Portfolio gewinnt
+
+Ziele:
+- CoverageObjective: (gewichtete) Abdeckung aller Paare/Trios des Pools
+- BacktestObjective: historischer Nettoertrag mit festen KENO-Quoten,
+  Trefferzaehlung ueber die uint64-Bitmasken aus kenobase.core.bitmask
+
+Usage:
+    from kenobase.core.combination_engine import CombinationEngine
+    from kenobase.core.portfolio_optimizer import CoverageObjective, PortfolioOptimizer
+
+    engine = CombinationEngine(pool=set(range(1, 36)), combination_size=8)
+    optimizer = PortfolioOptimizer(engine, CoverageObjective(engine.pool, t=3))
+    result = optimizer.optimize(n_tickets=20)
+    print(result.normalized_score, result.tickets)
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+import multiprocessing
+import os
+import random
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Any, Optional, Protocol
+
+import numpy as np
+
+from kenobase.core.bitmask import (
+    encode,
+    encode_draws,
+    encode_many,
+    hit_matrix,
+    intersection_count,
+)
+from kenobase.core.combination_engine import CombinationEngine
+from kenobase.core.data_loader import DrawResult
+from kenobase.core.keno_quotes import KENO_FIXED_QUOTES_BY_TYPE
+from kenobase.core.profiling import profiled
+
+logger = logging.getLogger(__name__)
+
+Ticket = tuple[int, ...]
+
+# Cache-Groesse fuer ticket -> Teilmengen/Wert (Annealing erzeugt viele neue Tipps)
+_TICKET_CACHE_LIMIT = 200_000
+
+# Bis zu diesem Vielfachen von max_candidates wird aufgezaehlt statt gesampelt
+_ENUMERATION_FACTOR = 20
+
+
+# ----------------------------------------------------------------------
+# Ziele
+# ----------------------------------------------------------------------
+
+
+class PortfolioObjective(Protocol):
+    """Schnittstelle fuer Portfolio-Ziele mit inkrementellem Zustand."""
+
+    name: str
+
+    def new_state(self) -> Any: ...
+
+    def gain(self, state: Any, ticket: Ticket) -> float:
+        """Zuwachs des Scores beim Hinzufuegen von ticket."""
+
+    def gains(self, state: Any, tickets: Sequence[Ticket]) -> np.ndarray:
+        """Zuwaechse fuer viele Tipps auf einmal (vektorisiert)."""
+
+    def loss(self, state: Any, ticket: Ticket) -> float:
+        """Verlust des Scores beim Entfernen eines enthaltenen ticket."""
+
+    def add(self, state: Any, ticket: Ticket) -> None: ...
+
+    def remove(self, state: Any, ticket: Ticket) -> None: ...
+
+    def score(self, state: Any) -> float: ...
+
+    def normalize(self, score: float, n_tickets: int) -> float:
+        """Score als vergleichbare Kennzahl (Abdeckungsanteil bzw. ROI)."""
+
+
+class CoverageObjective:
+    """Gewichtete Abdeckung aller t-Teilmengen (Paare, Trios) des Pools.
+
+    Eine t-Teilmenge gilt als abgedeckt, wenn mindestens ein Tipp alle
+    ihre Zahlen enthaelt. Der Zustand zaehlt pro Teilmenge die Tipps,
+    die sie abdecken; Gewinne/Verluste betreffen nur die Teilmengen des
+    jeweiligen Tipps.
+
+    Args:
+        pool: Zahlenpool
+        t: Teilmengengroesse (2 = Paare, 3 = Trios)
+        weights: Optionale Gewichte pro Teilmenge (z.B. TOP_PAIRS-Haeufigkeiten),
+            nicht genannte Teilmengen erhalten default_weight
+        default_weight: Gewicht nicht genannter Teilmengen
+    """
+
+    name = "coverage"
+
+    def __init__(
+        self,
+        pool: Iterable[int],
+        t: int = 2,
+        weights: Optional[Mapping[tuple[int, ...], float]] = None,
+        default_weight: float = 1.0,
+    ) -> None:
+        self.pool = sorted(set(pool))
+        if not 1 <= t <= len(self.pool):
+            raise ValueError(f"t must be in 1..{len(self.pool)}, got {t}")
+        self.t = t
+        self._position = {n: i for i, n in enumerate(self.pool)}
+        self.n_subsets = math.comb(len(self.pool), t)
+
+        self.weights = np.full(self.n_subsets, float(default_weight), dtype=np.float64)
+        for subset, value in (weights or {}).items():
+            if len(subset) != t or not set(subset) <= self._position.keys():
+                raise ValueError(f"Weight key {subset} is not a {t}-subset of the pool")
+            positions = sorted(self._position[n] for n in subset)
+            self.weights[self._rank(positions)] = float(value)
+        self.total_weight = float(self.weights.sum())
+        self._cache: dict[Ticket, np.ndarray] = {}
+
+    @staticmethod
+    def _rank(positions: Sequence[int]) -> int:
+        # Kombinatorisches Zahlensystem (colex): eindeutiger Index in [0, C(n, t))
+        return sum(math.comb(p, i + 1) for i, p in enumerate(positions))
+
+    def subsets(self, ticket: Ticket) -> np.ndarray:
+        """Indizes der vom Tipp abgedeckten t-Teilmengen des Pools."""
+        ids = self._cache.get(ticket)
+        if ids is None:
+            positions = sorted(self._position[n] for n in ticket if n in self._position)
+            ids = np.fromiter(
+                (self._rank(c) for c in combinations(positions, self.t)), dtype=np.int64
+            )
+            if len(self._cache) >= _TICKET_CACHE_LIMIT:
+                self._cache.clear()
+            self._cache[ticket] = ids
+        return ids
+
+    def subsets_many(self, tickets: Sequence[Ticket]) -> np.ndarray:
+        """Teilmengen-Indizes fuer viele gleich grosse Tipps aus dem Pool.
+
+        Returns:
+            int64-Array der Form (len(tickets), C(k, t)).
+        """
+        positions = np.sort(
+            np.array([[self._position[n] for n in t] for t in tickets], dtype=np.int64), axis=1
+        )
+        k = positions.shape[1]
+        combo_cols = np.array(list(combinations(range(k), self.t)), dtype=np.int64)
+        chosen = positions[:, combo_cols]  # (n, C(k, t), t), je Zeile aufsteigend
+        comb_table = np.array(
+            [[math.comb(p, i) for i in range(self.t + 1)] for p in range(len(self.pool))],
+            dtype=np.int64,
+        )
+        return comb_table[chosen, np.arange(1, self.t + 1)].sum(axis=2)
+
+    def new_state(self) -> np.ndarray:
+        return np.zeros(self.n_subsets, dtype=np.int32)
+
+    def gain(self, state: np.ndarray, ticket: Ticket) -> float:
+        ids = self.subsets(ticket)
+        return float(self.weights[ids][state[ids] == 0].sum())
+
+    def gains(self, state: np.ndarray, tickets: Sequence[Ticket]) -> np.ndarray:
+        lengths = {len(t) for t in tickets}
+        if len(lengths) != 1 or not all(self._position.keys() >= set(t) for t in tickets):
+            return np.array([self.gain(state, t) for t in tickets], dtype=np.float64)
+        ids = self.subsets_many(tickets)
+        if len(self._cache) + len(tickets) < _TICKET_CACHE_LIMIT:
+            self._cache.update(zip(tickets, ids))
+        return (self.weights[ids] * (state[ids] == 0)).sum(axis=1)
+
+    def loss(self, state: np.ndarray, ticket: Ticket) -> float:
+        ids = self.subsets(ticket)
+        return float(self.weights[ids][state[ids] == 1].sum())
+
+    def add(self, state: np.ndarray, ticket: Ticket) -> None:
+        state[self.subsets(ticket)] += 1
+
+    def remove(self, state: np.ndarray, ticket: Ticket) -> None:
+        state[self.subsets(ticket)] -= 1
+
+    def score(self, state: np.ndarray) -> float:
+        return float(self.weights[state > 0].sum())
+
+    def normalize(self, score: float, n_tickets: int) -> float:
+        return score / self.total_weight if self.total_weight else 0.0
+
+
+class BacktestObjective:
+    """Historischer Nettoertrag der Tipps ueber eine Ziehungsreihe.
+
+    Jeder Tipp wird mit stake EUR pro Ziehung gespielt; der Wert eines
+    Tipps ist Summe(Auszahlung) - Einsatz. Das Ziel ist additiv, der
+    Greedy waehlt also die besten Einzeltipps; das Annealing erkundet
+    zusaetzlich Tipps ausserhalb der Kandidatenliste.
+
+    Args:
+        draws: Historische Ziehungen (Liste oder DrawCollection)
+        stake: Einsatz pro Tipp und Ziehung in EUR
+        quotes: Quotentabelle Typ -> {Treffer: EUR} (Default: feste KENO-Quoten)
+    """
+
+    name = "backtest_roi"
+
+    def __init__(
+        self,
+        draws: Sequence[DrawResult],
+        stake: float = 1.0,
+        quotes: Optional[Mapping[int, Mapping[int, float]]] = None,
+    ) -> None:
+        if len(draws) == 0:
+            raise ValueError("BacktestObjective requires at least one draw")
+        self.draw_masks = encode_draws(draws)
+        self.n_draws = len(self.draw_masks)
+        self.stake = float(stake)
+        self._quotes = quotes if quotes is not None else KENO_FIXED_QUOTES_BY_TYPE
+        self._payout_tables: dict[int, np.ndarray] = {}
+        self._cache: dict[Ticket, float] = {}
+
+    def _payout_table(self, keno_type: int) -> np.ndarray:
+        table = self._payout_tables.get(keno_type)
+        if table is None:
+            if keno_type not in self._quotes:
+                raise ValueError(f"Unsupported keno_type: {keno_type}")
+            quotes = self._quotes[keno_type]
+            table = self.stake * np.array(
+                [float(quotes.get(h, 0.0)) for h in range(keno_type + 1)], dtype=np.float64
+            )
+            self._payout_tables[keno_type] = table
+        return table
+
+    def value(self, ticket: Ticket) -> float:
+        """Nettoertrag eines einzelnen Tipps ueber alle Ziehungen."""
+        value = self._cache.get(ticket)
+        if value is None:
+            hits = intersection_count(self.draw_masks, encode(ticket))
+            payout = float(self._payout_table(len(ticket))[hits].sum())
+            value = payout - self.stake * self.n_draws
+            if len(self._cache) >= _TICKET_CACHE_LIMIT:
+                self._cache.clear()
+            self._cache[ticket] = value
+        return value
+
+    def new_state(self) -> list[float]:
+        return [0.0]
+
+    def gain(self, state: list[float], ticket: Ticket) -> float:
+        return self.value(ticket)
+
+    def gains(self, state: list[float], tickets: Sequence[Ticket]) -> np.ndarray:
+        values = np.empty(len(tickets), dtype=np.float64)
+        by_type: dict[int, list[int]] = {}
+        for i, ticket in enumerate(tickets):
+            by_type.setdefault(len(ticket), []).append(i)
+        for keno_type, rows in by_type.items():
+            hits = hit_matrix(self.draw_masks, encode_many([tickets[i] for i in rows]))
+            payouts = self._payout_table(keno_type)[hits].sum(axis=0)
+            values[rows] = payouts - self.stake * self.n_draws
+        if len(self._cache) + len(tickets) < _TICKET_CACHE_LIMIT:
+            self._cache.update(zip(tickets, values.tolist()))
+        return values
+
+    def loss(self, state: list[float], ticket: Ticket) -> float:
+        return self.value(ticket)
+
+    def add(self, state: list[float], ticket: Ticket) -> None:
+        state[0] += self.value(ticket)
+
+    def remove(self, state: list[float], ticket: Ticket) -> None:
+        state[0] -= self.value(ticket)
+
+    def score(self, state: list[float]) -> float:
+        return state[0]
+
+    def normalize(self, score: float, n_tickets: int) -> float:
+        invested = self.stake * self.n_draws * n_tickets
+        return score / invested if invested else 0.0
+
+
+# ----------------------------------------------------------------------
+# Konfiguration und Ergebnis
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class OptimizerConfig:
+    """Parameter fuer PortfolioOptimizer.
+
+    Attributes:
+        max_candidates: Max. Kandidaten (darueber wird gesampelt statt aufgezaehlt)
+        n_restarts: Anzahl unabhaengiger Greedy+Annealing-Laeufe
+        restart_sample: Anteil der Kandidaten, den Restarts > 0 fuer den Greedy nutzen
+        anneal_steps: Annealing-Schritte pro Restart (0 = nur Greedy)
+        initial_temperature: Starttemperatur relativ zum mittleren Tippbeitrag
+        final_temperature: Endtemperatur relativ zum mittleren Tippbeitrag
+        mutation_rate: Anteil der Zuege, die eine Zahl tauschen (Rest: ganzer Tipp)
+        max_workers: Worker-Prozesse fuer Restarts (None = CPU-Anzahl)
+        seed: Basis-Seed; Restart r verwendet seed + r
+    """
+
+    max_candidates: int = 20_000
+    n_restarts: int = 4
+    restart_sample: float = 0.5
+    anneal_steps: int = 5_000
+    initial_temperature: float = 0.05
+    final_temperature: float = 0.001
+    mutation_rate: float = 0.7
+    max_workers: Optional[int] = None
+    seed: int = 0
+
+
+@dataclass
+class PortfolioResult:
+    """Ergebnis einer Portfolio-Optimierung.
+
+    Attributes:
+        tickets: Gewaehlte Tipps (sortierte Tupel)
+        objective: Name des Ziels
+        score: Score des besten Portfolios
+        normalized_score: Abdeckungsanteil bzw. ROI
+        greedy_score: Score des Greedy-Startportfolios im besten Restart
+        restart_scores: Endscores aller Restarts
+        n_candidates: Anzahl Kandidaten
+        elapsed_s: Gesamtlaufzeit in Sekunden
+    """
+
+    tickets: list[Ticket]
+    objective: str
+    score: float
+    normalized_score: float
+    greedy_score: float
+    restart_scores: list[float] = field(default_factory=list)
+    n_candidates: int = 0
+    elapsed_s: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "objective": self.objective,
+            "n_tickets": len(self.tickets),
+            "score": self.score,
+            "normalized_score": self.normalized_score,
+            "greedy_score": self.greedy_score,
+            "restart_scores": self.restart_scores,
+            "n_candidates": self.n_candidates,
+            "elapsed_s": self.elapsed_s,
+            "tickets": [list(t) for t in self.tickets],
+        }
+
+
+# ----------------------------------------------------------------------
+# Suche
+# ----------------------------------------------------------------------
+
+
+def lazy_greedy(
+    objective: PortfolioObjective,
+    candidates: Sequence[Ticket],
+    n_tickets: int,
+) -> tuple[list[Ticket], Any]:
+    """Greedy-Auswahl mit lazy evaluation (CELF).
+
+    Args:
+        objective: Portfolio-Ziel
+        candidates: Kandidaten-Tipps
+        n_tickets: Anzahl zu waehlender Tipps
+
+    Returns:
+        Tuple (gewaehlte Tipps, Zustand des Ziels).
+    """
+    state = objective.new_state()
+    initial = objective.gains(state, candidates) if len(candidates) else []
+    heap = [(-float(g), i) for i, g in enumerate(initial)]
+    heapq.heapify(heap)
+
+    selected: list[Ticket] = []
+    while heap and len(selected) < n_tickets:
+        _, idx = heapq.heappop(heap)
+        gain = objective.gain(state, candidates[idx])
+        # Submodular: veraltete Gewinne sind obere Schranken
+        if not heap or gain >= -heap[0][0] - 1e-12:
+            selected.append(candidates[idx])
+            objective.add(state, candidates[idx])
+        else:
+            heapq.heappush(heap, (-gain, idx))
+    return selected, state
+
+
+def _mutate(
+    ticket: Ticket, pool: Sequence[int], engine: CombinationEngine, rng: random.Random
+) -> Optional[Ticket]:
+    """Tauscht eine Zahl des Tipps gegen eine Pool-Zahl (Filter der Engine)."""
+    outside = [n for n in pool if n not in ticket]
+    if not outside:
+        return None
+    for _ in range(10):
+        numbers = list(ticket)
+        numbers[rng.randrange(len(numbers))] = rng.choice(outside)
+        candidate = tuple(sorted(numbers))
+        if engine.is_valid(candidate):
+            return candidate
+    return None
+
+
+def anneal(
+    objective: PortfolioObjective,
+    engine: CombinationEngine,
+    candidates: Sequence[Ticket],
+    tickets: list[Ticket],
+    state: Any,
+    config: OptimizerConfig,
+    rng: random.Random,
+) -> tuple[list[Ticket], float]:
+    """Simulated Annealing ueber Tipp-Austausch und Zahlen-Mutation.
+
+    Args:
+        objective: Portfolio-Ziel
+        engine: CombinationEngine (Pool und Filter fuer Mutationen)
+        candidates: Kandidaten fuer den Austausch ganzer Tipps
+        tickets: Startportfolio (wird nicht veraendert)
+        state: Zustand des Ziels zum Startportfolio (wird veraendert)
+        config: Annealing-Parameter
+        rng: Zufallsgenerator
+
+    Returns:
+        Tuple (bestes Portfolio, dessen Score).
+    """
+    current = list(tickets)
+    current_set = set(current)
+    score = objective.score(state)
+    best, best_score = list(current), score
+    if not current or config.anneal_steps <= 0:
+        return best, best_score
+
+    scale = abs(score) / len(current) or 1.0
+    t_start = config.initial_temperature * scale
+    t_end = config.final_temperature * scale
+    ratio = (t_end / t_start) ** (1.0 / max(config.anneal_steps - 1, 1))
+
+    pool = sorted(engine.pool)
+    temperature = t_start
+    for _ in range(config.anneal_steps):
+        pos = rng.randrange(len(current))
+        old = current[pos]
+        if rng.random() < config.mutation_rate:
+            new = _mutate(old, pool, engine, rng)
+        else:
+            new = candidates[rng.randrange(len(candidates))] if candidates else None
+        if new is not None and new not in current_set:
+            objective.remove(state, old)
+            delta = objective.gain(state, new) - objective.gain(state, old)
+            if delta >= 0 or rng.random() < math.exp(delta / temperature):
+                objective.add(state, new)
+                current[pos] = new
+                current_set.discard(old)
+                current_set.add(new)
+                score += delta
+                if score > best_score + 1e-12:
+                    best, best_score = list(current), score
+            else:
+                objective.add(state, old)
+        temperature *= ratio
+    return best, best_score
+
+
+# Worker-Zustand (per initializer gesetzt, mit fork ohne Kopie geteilt)
+_WORKER: dict[str, Any] = {}
+
+
+def _init_worker(shared: dict[str, Any]) -> None:
+    _WORKER.clear()
+    _WORKER.update(shared)
+
+
+def _run_restart(restart: int) -> tuple[list[Ticket], float, float]:
+    objective = _WORKER["objective"]
+    engine = _WORKER["engine"]
+    candidates = _WORKER["candidates"]
+    config: OptimizerConfig = _WORKER["config"]
+    n_tickets = _WORKER["n_tickets"]
+
+    rng = random.Random(config.seed + restart)
+    pool = list(candidates)
+    if restart > 0 and config.restart_sample < 1.0:
+        k = max(n_tickets, int(len(pool) * config.restart_sample))
+        pool = rng.sample(pool, min(k, len(pool)))
+
+    tickets, state = lazy_greedy(objective, pool, n_tickets)
+    greedy_score = objective.score(state)
+    tickets, score = anneal(objective, engine, candidates, tickets, state, config, rng)
+    return tickets, score, greedy_score
+
+
+class PortfolioOptimizer:
+    """Optimiert Ticket-Portfolios auf Basis einer CombinationEngine.
+
+    Args:
+        engine: CombinationEngine mit Pool, Tippgroesse und Filtern
+        objective: Ziel (CoverageObjective, BacktestObjective, ...)
+        config: Such-Parameter (default OptimizerConfig())
+
+    Example:
+        >>> engine = CombinationEngine(pool=set(range(1, 21)), combination_size=5)
+        >>> result = PortfolioOptimizer(engine, CoverageObjective(engine.pool)).optimize(8)
+    """
+
+    def __init__(
+        self,
+        engine: CombinationEngine,
+        objective: PortfolioObjective,
+        config: Optional[OptimizerConfig] = None,
+    ) -> None:
+        self.engine = engine
+        self.objective = objective
+        self.config = config or OptimizerConfig()
+
+    def candidates(self) -> list[Ticket]:
+        """Gueltige Kandidaten der Engine, hoechstens config.max_candidates.
+
+        Bis zum 20-fachen von max_candidates wird generate() vollstaendig
+        durchlaufen und bei Bedarf zufaellig ausgeduennt, darueber per
+        sample() gezogen.
+        """
+        limit = self.config.max_candidates
+        theoretical = math.comb(len(self.engine.pool), self.engine.combination_size)
+        if theoretical > _ENUMERATION_FACTOR * limit:
+            return [c.numbers for c in self.engine.sample(limit, seed=self.config.seed)]
+
+        candidates = [c.numbers for c in self.engine.generate()]
+        if len(candidates) > limit:
+            candidates = sorted(random.Random(self.config.seed).sample(candidates, limit))
+        return candidates
+
+    @profiled("portfolio.optimize")
+    def optimize(
+        self,
+        n_tickets: Optional[int] = None,
+        *,
+        budget: Optional[float] = None,
+        stake: float = 1.0,
+    ) -> PortfolioResult:
+        """Sucht das beste Portfolio mit n_tickets Tipps.
+
+        Args:
+            n_tickets: Anzahl Tipps im Portfolio
+            budget: Alternativ Budget in EUR (n_tickets = budget // stake)
+            stake: Einsatz pro Tipp in EUR (nur mit budget)
+
+        Returns:
+            PortfolioResult des besten Restarts.
+
+        Raises:
+            ValueError: Wenn weder n_tickets noch budget gesetzt ist oder
+                keine Kandidaten existieren
+        """
+        if n_tickets is None:
+            if budget is None:
+                raise ValueError("Either n_tickets or budget is required")
+            n_tickets = int(budget // stake)
+        if n_tickets < 1:
+            raise ValueError(f"n_tickets must be >= 1, got {n_tickets}")
+
+        start = time.perf_counter()
+        candidates = self.candidates()
+        if not candidates:
+            raise ValueError("CombinationEngine yields no valid candidates")
+
+        shared = {
+            "objective": self.objective,
+            "engine": self.engine,
+            "candidates": candidates,
+            "config": self.config,
+            "n_tickets": n_tickets,
+        }
+        restarts = range(max(self.config.n_restarts, 1))
+        workers = min(self.config.max_workers or os.cpu_count() or 1, len(restarts))
+
+        if workers == 1:
+            _init_worker(shared)
+            try:
+                outcomes = [_run_restart(r) for r in restarts]
+            finally:
+                _init_worker({})
+        else:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("fork" if "fork" in methods else None)
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(shared,),
+            ) as executor:
+                outcomes = list(executor.map(_run_restart, restarts))
+
+        best_tickets, best_score, greedy_score = max(outcomes, key=lambda o: o[1])
+        logger.info(
+            f"Portfolio optimized: objective={self.objective.name}, tickets={n_tickets}, "
+            f"candidates={len(candidates)}, score={best_score:.4f}"
+        )
+        return PortfolioResult(
+            tickets=sorted(best_tickets),
+            objective=self.objective.name,
+            score=best_score,
+            normalized_score=self.objective.normalize(best_score, len(best_tickets)),
+            greedy_score=greedy_score,
+            restart_scores=[o[1] for o in outcomes],
+            n_candidates=len(candidates),
+            elapsed_s=round(time.perf_counter() - start, 4),
+        )
+
+
+__all__ = [
+    "BacktestObjective",
+    "CoverageObjective",
+    "OptimizerConfig",
+    "PortfolioObjective",
+    "PortfolioOptimizer",
+    "PortfolioResult",
+    "anneal",
+    "lazy_greedy",
+]
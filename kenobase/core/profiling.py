@@ -0,0 +1,514 @@
+"""Profiling - Leichtgewichtige Zeitmessung fuer Pipeline-Stufen und Analysen.
+
+Spans werden per Context-Manager (`span`) oder Decorator (`profiled`)
+gesetzt und verschachteln sich pro Thread. Erfasst werden Wall-Zeit,
+Eigenzeit (ohne Kind-Spans), Aufrufanzahl und der Zuwachs des
+Peak-RSS (ru_maxrss) waehrend des Spans.
+
+Solange kein Profiler aktiv ist, liefert `span` ein geteiltes No-op-Objekt
+und `profiled` ruft die Funktion direkt auf - die Instrumentierung kostet
+dann nur einen Attribut-Lookup pro Aufruf.
+
+Export:
+    - JSON (Spans + Aggregat je Name)
+    - Chrome Trace Event Format (chrome://tracing, Perfetto)
+
+Usage:
+    from kenobase.core.profiling import profiled, profiling, span
+
+    @profiled("analysis.frequency")
+    def calculate(...): ...
+
+    with profiling() as profiler:
+        with span("pipeline.load", path=str(path)):
+            draws = loader.load(path)
+        calculate(draws)
+    print(profiler.summary())
+    profiler.save("results/profile.trace.json", fmt="chrome")
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib.util
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, TypeVar, Union, overload
+
+logger = logging.getLogger(__name__)
+
+HAS_RESOURCE = importlib.util.find_spec("resource") is not None
+
+PROFILE_FORMAT_VERSION = 1
+PROFILE_FORMATS: tuple[str, ...] = ("json", "chrome")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def peak_rss_kb() -> int:
+    """Peak Resident Set Size des Prozesses in KiB (0 wenn nicht verfuegbar)."""
+    if not HAS_RESOURCE:
+        return 0
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS liefert Bytes, Linux KiB
+    return int(peak // 1024) if sys.platform == "darwin" else int(peak)
+
+
+@dataclass
+class SpanRecord:
+    """Ein abgeschlossener Span.
+
+    Attributes:
+        name: Span-Name (z.B. "pipeline.frequency")
+        start_us: Startzeit relativ zum Profiler-Start (Mikrosekunden)
+        duration_us: Wall-Zeit (Mikrosekunden)
+        self_us: Wall-Zeit ohne direkte Kind-Spans (Mikrosekunden)
+        depth: Verschachtelungstiefe (0 = oberste Ebene)
+        parent: Name des umschliessenden Spans (None auf oberster Ebene)
+        thread_id: Thread-Ident
+        rss_delta_kb: Zuwachs des Peak-RSS waehrend des Spans (KiB)
+        attrs: Zusaetzliche Attribute (z.B. Anzahl Ziehungen)
+    """
+
+    name: str
+    start_us: float
+    duration_us: float
+    self_us: float
+    depth: int
+    parent: Optional[str]
+    thread_id: int
+    rss_delta_kb: int = 0
+    attrs: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class SpanStats:
+    """Aggregat aller Spans mit demselben Namen.
+
+    Attributes:
+        name: Span-Name
+        count: Anzahl Aufrufe
+        total_s: Summe der Wall-Zeit (Sekunden)
+        self_s: Summe der Eigenzeit (Sekunden)
+        min_s: Kuerzester Aufruf (Sekunden)
+        max_s: Laengster Aufruf (Sekunden)
+        max_rss_delta_kb: Groesster Peak-RSS-Zuwachs eines Aufrufs (KiB)
+    """
+
+    name: str
+    count: int = 0
+    total_s: float = 0.0
+    self_s: float = 0.0
+    min_s: float = float("inf")
+    max_s: float = 0.0
+    max_rss_delta_kb: int = 0
+
+    @property
+    def mean_s(self) -> float:
+        """Mittlere Wall-Zeit pro Aufruf (Sekunden)."""
+        return self.total_s / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialisierbares Dict (gerundete Sekunden)."""
+        return {
+            "name": self.name,
+            "count": self.count,
+            "total_s": round(self.total_s, 6),
+            "self_s": round(self.self_s, 6),
+            "mean_s": round(self.mean_s, 6),
+            "min_s": round(self.min_s if self.count else 0.0, 6),
+            "max_s": round(self.max_s, 6),
+            "max_rss_delta_kb": self.max_rss_delta_kb,
+        }
+
+
+class _NullSpan:
+    """No-op-Span fuer deaktiviertes Profiling."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc: object) -> bool:
+        return False
+
+    def set(self, **attrs: Any) -> None:
+        """Ignoriert Attribute."""
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Aktiver Span eines Profilers (nicht direkt instanziieren)."""
+
+    __slots__ = ("_profiler", "name", "attrs", "_start_ns", "_rss_start", "_child_ns", "_depth")
+
+    def __init__(self, profiler: "Profiler", name: str, attrs: dict[str, Any]):
+        self._profiler = profiler
+        self.name = name
+        self.attrs = attrs
+        self._start_ns = 0
+        self._rss_start = 0
+        self._child_ns = 0
+        self._depth = 0
+
+    def set(self, **attrs: Any) -> None:
+        """Ergaenzt Attribute (z.B. Ergebnisgroessen) waehrend des Spans."""
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "_Span":
+        stack = self._profiler._stack()
+        self._depth = len(stack)
+        stack.append(self)
+        if self._profiler.track_memory:
+            self._rss_start = peak_rss_kb()
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc: object) -> bool:
+        end_ns = time.perf_counter_ns()
+        duration_ns = end_ns - self._start_ns
+        rss_delta = peak_rss_kb() - self._rss_start if self._profiler.track_memory else 0
+
+        stack = self._profiler._stack()
+        # Robust gegen falsch verschachtelte Spans: bis zu diesem Span abbauen
+        while stack and stack[-1] is not self:
+            stack.pop()
+        if stack:
+            stack.pop()
+        parent = stack[-1] if stack else None
+        if parent is not None:
+            parent._child_ns += duration_ns
+
+        self._profiler._record(
+            SpanRecord(
+                name=self.name,
+                start_us=(self._start_ns - self._profiler._origin_ns) / 1000.0,
+                duration_us=duration_ns / 1000.0,
+                self_us=max(duration_ns - self._child_ns, 0) / 1000.0,
+                depth=self._depth,
+                parent=parent.name if parent is not None else None,
+                thread_id=threading.get_ident(),
+                rss_delta_kb=max(rss_delta, 0),
+                attrs=self.attrs,
+            )
+        )
+        return False
+
+
+class Profiler:
+    """Sammelt Spans und aggregiert sie pro Name.
+
+    Thread-sicher: jeder Thread hat einen eigenen Span-Stack, abgeschlossene
+    Spans werden unter einem Lock gesammelt.
+
+    Args:
+        track_memory: Peak-RSS-Zuwachs je Span erfassen (ein getrusage-Aufruf
+            pro Span-Grenze)
+        max_records: Maximal gespeicherte Einzel-Spans; darueber hinaus
+            werden nur noch Aggregate gefuehrt (None = unbegrenzt)
+    """
+
+    def __init__(self, track_memory: bool = True, max_records: Optional[int] = 100_000):
+        self.track_memory = track_memory and HAS_RESOURCE
+        self.max_records = max_records
+        self.records: list[SpanRecord] = []
+        self.dropped = 0
+        self._stats: dict[str, SpanStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin_ns = time.perf_counter_ns()
+        self._origin_wall = time.time()
+
+    def _stack(self) -> list[_Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, record: SpanRecord) -> None:
+        duration_s = record.duration_us / 1e6
+        with self._lock:
+            stats = self._stats.get(record.name)
+            if stats is None:
+                stats = self._stats[record.name] = SpanStats(name=record.name)
+            stats.count += 1
+            stats.total_s += duration_s
+            stats.self_s += record.self_us / 1e6
+            stats.min_s = min(stats.min_s, duration_s)
+            stats.max_s = max(stats.max_s, duration_s)
+            stats.max_rss_delta_kb = max(stats.max_rss_delta_kb, record.rss_delta_kb)
+
+            if self.max_records is None or len(self.records) < self.max_records:
+                self.records.append(record)
+            else:
+                self.dropped += 1
+
+    def span(self, name: str, **attrs: Any) -> _Span:
+        """Neuer Span als Context-Manager.
+
+        Args:
+            name: Span-Name
+            **attrs: Zusaetzliche Attribute (JSON-serialisierbar)
+
+        Returns:
+            Span-Objekt (mit set(**attrs) fuer nachtraegliche Attribute)
+        """
+        return _Span(self, name, attrs)
+
+    def reset(self) -> None:
+        """Verwirft alle gesammelten Spans und setzt den Zeitursprung neu."""
+        with self._lock:
+            self.records.clear()
+            self._stats.clear()
+            self.dropped = 0
+            self._origin_ns = time.perf_counter_ns()
+            self._origin_wall = time.time()
+
+    def stats(self) -> dict[str, SpanStats]:
+        """Aggregate je Span-Name, absteigend nach Gesamtzeit sortiert."""
+        with self._lock:
+            items = sorted(self._stats.values(), key=lambda s: s.total_s, reverse=True)
+        return {s.name: s for s in items}
+
+    def summary(self, limit: Optional[int] = 30) -> str:
+        """Textuelle Tabelle der teuersten Spans.
+
+        Args:
+            limit: Maximale Anzahl Zeilen (None = alle)
+
+        Returns:
+            Mehrzeiliger String
+        """
+        rows = list(self.stats().values())[:limit]
+        if not rows:
+            return "No spans recorded"
+        width = max(24, max(len(s.name) for s in rows))
+        lines = [
+            f"{'Span':<{width}} {'Calls':>7} {'Total [s]':>10} {'Self [s]':>10} "
+            f"{'Mean [ms]':>10} {'Max [ms]':>10} {'dRSS [MiB]':>10}"
+        ]
+        for s in rows:
+            lines.append(
+                f"{s.name:<{width}} {s.count:>7} {s.total_s:>10.3f} {s.self_s:>10.3f} "
+                f"{s.mean_s * 1e3:>10.2f} {s.max_s * 1e3:>10.2f} "
+                f"{s.max_rss_delta_kb / 1024:>10.1f}"
+            )
+        if self.dropped:
+            lines.append(f"({self.dropped} spans not stored individually)")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-Export: Metadaten, Aggregate und Einzel-Spans."""
+        with self._lock:
+            records = [asdict(r) for r in self.records]
+        return {
+            "version": PROFILE_FORMAT_VERSION,
+            "started_at": self._origin_wall,
+            "pid": os.getpid(),
+            "peak_rss_kb": peak_rss_kb(),
+            "dropped_spans": self.dropped,
+            "stats": [s.to_dict() for s in self.stats().values()],
+            "spans": records,
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Export im Chrome Trace Event Format ("X" = Complete Events).
+
+        Returns:
+            Dict mit traceEvents; laedt in chrome://tracing bzw. Perfetto
+        """
+        pid = os.getpid()
+        with self._lock:
+            records = list(self.records)
+        events = []
+        for r in records:
+            args = dict(r.attrs)
+            if r.rss_delta_kb:
+                args["rss_delta_kb"] = r.rss_delta_kb
+            events.append(
+                {
+                    "name": r.name,
+                    "cat": r.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": round(r.start_us, 3),
+                    "dur": round(r.duration_us, 3),
+                    "pid": pid,
+                    "tid": r.thread_id,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, path: Union[str, Path], fmt: str = "json") -> Path:
+        """Schreibt den Trace als Datei.
+
+        Args:
+            path: Zielpfad (Verzeichnisse werden angelegt)
+            fmt: "json" (to_dict) oder "chrome" (to_chrome_trace)
+
+        Returns:
+            Pfad der geschriebenen Datei
+
+        Raises:
+            ValueError: Bei unbekanntem Format
+        """
+        if fmt not in PROFILE_FORMATS:
+            raise ValueError(f"Unknown profile format: {fmt}. Supported: {PROFILE_FORMATS}")
+        payload = self.to_chrome_trace() if fmt == "chrome" else self.to_dict()
+        out = Path(path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(payload, default=str), encoding="utf-8")
+        logger.info(f"Profile written to {out} ({fmt}, {len(self.records)} spans)")
+        return out
+
+
+# Aktiver Profiler (None = Profiling deaktiviert)
+_ACTIVE: Optional[Profiler] = None
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Aktiver Profiler oder None."""
+    return _ACTIVE
+
+
+def is_profiling() -> bool:
+    """True wenn ein Profiler aktiv ist."""
+    return _ACTIVE is not None
+
+
+def enable_profiling(
+    profiler: Optional[Profiler] = None,
+    track_memory: bool = True,
+) -> Profiler:
+    """Aktiviert Profiling prozessweit.
+
+    Args:
+        profiler: Bestehender Profiler (default: neuer Profiler)
+        track_memory: Siehe Profiler (nur fuer neuen Profiler)
+
+    Returns:
+        Aktiver Profiler
+    """
+    global _ACTIVE
+    _ACTIVE = profiler if profiler is not None else Profiler(track_memory=track_memory)
+    return _ACTIVE
+
+
+def disable_profiling() -> Optional[Profiler]:
+    """Deaktiviert Profiling.
+
+    Returns:
+        Bisher aktiver Profiler (fuer Export) oder None
+    """
+    global _ACTIVE
+    profiler, _ACTIVE = _ACTIVE, None
+    return profiler
+
+
+@contextmanager
+def profiling(
+    profiler: Optional[Profiler] = None,
+    track_memory: bool = True,
+) -> Iterator[Profiler]:
+    """Aktiviert Profiling fuer einen Block und stellt danach den Vorzustand her.
+
+    Args:
+        profiler: Bestehender Profiler (default: neuer Profiler)
+        track_memory: Siehe Profiler
+
+    Yields:
+        Aktiver Profiler
+    """
+    global _ACTIVE
+    previous = _ACTIVE
+    active = enable_profiling(profiler, track_memory=track_memory)
+    try:
+        yield active
+    finally:
+        _ACTIVE = previous
+
+
+def span(name: str, **attrs: Any) -> Union[_Span, _NullSpan]:
+    """Span im aktiven Profiler (No-op wenn Profiling deaktiviert ist).
+
+    Args:
+        name: Span-Name, Konvention "<bereich>.<stufe>"
+        **attrs: Zusaetzliche Attribute
+
+    Returns:
+        Context-Manager
+    """
+    profiler = _ACTIVE
+    if profiler is None:
+        return NULL_SPAN
+    return _Span(profiler, name, attrs)
+
+
+@overload
+def profiled(name: F) -> F: ...
+
+
+@overload
+def profiled(name: Optional[str] = None) -> Callable[[F], F]: ...
+
+
+def profiled(name: Union[str, Callable[..., Any], None] = None) -> Any:
+    """Decorator: jeder Aufruf wird als Span erfasst.
+
+    Verwendbar als `@profiled` (Name = module.qualname) oder
+    `@profiled("pipeline.run")`.
+
+    Args:
+        name: Span-Name oder die dekorierte Funktion
+
+    Returns:
+        Dekorierte Funktion bzw. Decorator
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name if isinstance(name, str) else f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            profiler = _ACTIVE
+            if profiler is None:
+                return func(*args, **kwargs)
+            with _Span(profiler, span_name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    if callable(name):
+        return decorator(name)  # type: ignore[arg-type]
+    return decorator
+
+
+__all__ = [
+    "HAS_RESOURCE",
+    "NULL_SPAN",
+    "PROFILE_FORMATS",
+    "PROFILE_FORMAT_VERSION",
+    "Profiler",
+    "SpanRecord",
+    "SpanStats",
+    "disable_profiling",
+    "enable_profiling",
+    "get_profiler",
+    "is_profiling",
+    "peak_rss_kb",
+    "profiled",
+    "profiling",
+    "span",
+]
@@ -0,0 +1,644 @@
+"""Result Cache - Inhaltsadressierter Cache fuer Analyse-Artefakte in results/.
+
+Jedes Artefakt wird unter einem Schluessel abgelegt, der aus
+- den SHA-256-Hashes der Eingabedateien,
+- den Analyse-Parametern und
+- der Modulversion (Hash des Quellcodes bzw. explizite Version)
+abgeleitet ist. Stimmt der Schluessel, wird das Artefakt ohne Neuberechnung
+zurueckgegeben. Zusaetzlich kann jedes Artefakt unter seinem gewohnten Pfad
+(z.B. results/house003_rolling_stability.json) veroeffentlicht werden; ueber
+artifact_status() koennen Konsumenten pruefen, ob diese Datei noch zu den
+aktuellen Eingaben und zum aktuellen Code passt.
+
+Layout unter root (default: results/.cache):
+    objects/<kk>/<key>.json       Artefakt (JSON)
+    objects/<kk>/<key>.meta.json  Metadaten (Eingaben, Parameter, Modul, ...)
+    published/<hash>.json         Veroeffentlichungspfad -> Schluessel
+
+Es gibt keinen globalen Index; jede Datei wird atomar ersetzt, mehrere
+Prozesse koennen den Cache parallel nutzen. Cache-Treffer aktualisieren nur
+die mtime des Objekts (LRU fuer gc).
+
+Usage:
+    from kenobase.core.result_cache import ResultCache
+
+    cache = ResultCache("results/.cache")
+    result = cache.get_or_compute(
+        "house003",
+        lambda: result_to_dict(run_house003_analysis(stake_path)),
+        module="kenobase.analysis.house_edge_stability",
+        inputs={"stake": stake_path},
+        params={"windows": [7, 14, 30]},
+        publish_to="results/house003_rolling_stability.json",
+    )
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+Inputs = Union[Mapping[str, PathLike], Sequence[PathLike], None]
+
+MISSING_DIGEST = "missing"
+
+_DIGEST_MEMO: dict[tuple[str, int, int], str] = {}
+_DIGEST_LOCK = threading.Lock()
+
+
+def file_digest(path: PathLike, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 ueber den Dateiinhalt (prozessweit per mtime/Groesse memoisiert).
+
+    Args:
+        path: Dateipfad
+        chunk_size: Lesegroesse in Bytes
+
+    Returns:
+        Hex-Digest ("missing" wenn die Datei nicht existiert).
+    """
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return MISSING_DIGEST
+    if not path.is_file():
+        return MISSING_DIGEST
+
+    memo_key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    with _DIGEST_LOCK:
+        cached = _DIGEST_MEMO.get(memo_key)
+    if cached is not None:
+        return cached
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    hexdigest = digest.hexdigest()
+    with _DIGEST_LOCK:
+        _DIGEST_MEMO[memo_key] = hexdigest
+    return hexdigest
+
+
+def module_version(module: str | ModuleType, version: Optional[str] = None) -> str:
+    """Version eines Analysemoduls.
+
+    Modulnamen werden nur aufgeloest (importlib.util.find_spec), nicht
+    ausgefuehrt; so koennen auch Skripte (z.B. "scripts.analyze_hyp001_complete")
+    als erzeugendes Modul dienen, ohne beim Status-Check importiert zu werden.
+
+    Args:
+        module: Modulname oder Modulobjekt
+        version: Explizite Version (ueberschreibt den Quellcode-Hash)
+
+    Returns:
+        Explizite Version oder die ersten 16 Hex-Zeichen des Quellcode-Hashes.
+
+    Raises:
+        ImportError: Wenn der Modulname nicht aufgeloest werden kann
+    """
+    if version is not None:
+        return str(version)
+    if isinstance(module, str):
+        try:
+            spec = importlib.util.find_spec(module)
+        except ValueError:
+            spec = None
+        if spec is None:
+            raise ImportError(f"No module named {module!r}")
+        origin = spec.origin
+    else:
+        origin = getattr(module, "__file__", None)
+
+    if not origin or not origin.endswith(".py") or not os.path.isfile(origin):
+        if isinstance(module, str):
+            module = importlib.import_module(module)
+        return str(getattr(module, "__version__", "unknown"))
+    with open(origin, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def _module_name(module: str | ModuleType) -> str:
+    return module if isinstance(module, str) else module.__name__
+
+
+def _normalize_inputs(inputs: Inputs) -> dict[str, str]:
+    if inputs is None:
+        return {}
+    if isinstance(inputs, Mapping):
+        return {str(role): str(path) for role, path in inputs.items()}
+    return {str(i): str(path) for i, path in enumerate(inputs)}
+
+
+def _canonical_json(data: Any) -> str:
+    return json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def _write_json_atomic(path: Path, data: Any, indent: Optional[int] = None) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = json.dumps(data, indent=indent, ensure_ascii=False, default=str)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return len(payload.encode("utf-8"))
+
+
+@dataclass(frozen=True)
+class CacheKey:
+    """Schluessel eines Cache-Eintrags.
+
+    Attributes:
+        digest: SHA-256 ueber Eingabe-Hashes, Parameter und Modulversion
+        module: Modulname der erzeugenden Analyse
+        module_version: Version/Quellcode-Hash des Moduls
+        inputs: Rolle -> {"path", "digest"}
+        params: Analyse-Parameter
+        explicit_version: module_version wurde explizit gesetzt
+    """
+
+    digest: str
+    module: str
+    module_version: str
+    inputs: dict[str, dict[str, str]] = field(default_factory=dict, compare=False)
+    params: dict[str, Any] = field(default_factory=dict, compare=False)
+    explicit_version: bool = False
+
+
+@dataclass
+class CacheEntry:
+    """Metadaten eines gespeicherten Artefakts.
+
+    Attributes:
+        key: Schluessel-Digest
+        name: Artefakt-Name (z.B. "house003")
+        module: Erzeugendes Modul
+        module_version: Modulversion zum Erzeugungszeitpunkt
+        inputs: Rolle -> {"path", "digest"} zum Erzeugungszeitpunkt
+        params: Analyse-Parameter
+        created_at: ISO-Zeitstempel der Erzeugung
+        size: Groesse des Artefakts in Bytes
+        last_access: Unix-Zeit des letzten Zugriffs (mtime des Objekts)
+        published: Optionaler Veroeffentlichungspfad
+        artifact_digest: SHA-256 des veroeffentlichten Artefakts
+        explicit_version: Modulversion explizit gesetzt (kein Quellcode-Hash)
+        stale_reasons: Gruende fuer Veraltung (nach ResultCache.check)
+    """
+
+    key: str
+    name: str
+    module: str
+    module_version: str
+    inputs: dict[str, dict[str, str]]
+    params: dict[str, Any]
+    created_at: str
+    size: int = 0
+    last_access: float = 0.0
+    published: Optional[str] = None
+    artifact_digest: Optional[str] = None
+    explicit_version: bool = False
+    stale_reasons: list[str] = field(default_factory=list)
+
+    @property
+    def is_stale(self) -> bool:
+        return bool(self.stale_reasons)
+
+    @property
+    def age_days(self) -> float:
+        """Tage seit dem letzten Zugriff."""
+        return max(0.0, (time.time() - self.last_access) / 86400.0)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialisierbare Darstellung."""
+        return {
+            "key": self.key,
+            "name": self.name,
+            "module": self.module,
+            "module_version": self.module_version,
+            "inputs": self.inputs,
+            "params": self.params,
+            "created_at": self.created_at,
+            "size": self.size,
+            "published": self.published,
+            "artifact_digest": self.artifact_digest,
+            "explicit_version": self.explicit_version,
+        }
+
+
+class ResultCache:
+    """Inhaltsadressierter Artefakt-Cache."""
+
+    def __init__(self, root: PathLike = "results/.cache"):
+        """Initialisiert den Cache (legt noch keine Dateien an).
+
+        Args:
+            root: Cache-Verzeichnis
+        """
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.published_dir = self.root / "published"
+
+    # ------------------------------------------------------------------
+    # Schluessel
+    # ------------------------------------------------------------------
+
+    def make_key(
+        self,
+        module: str | ModuleType,
+        inputs: Inputs = None,
+        params: Optional[Mapping[str, Any]] = None,
+        version: Optional[str] = None,
+    ) -> CacheKey:
+        """Leitet den Schluessel aus Eingaben, Parametern und Modulversion ab.
+
+        Args:
+            module: Erzeugendes Analysemodul (Name oder Modul)
+            inputs: Eingabedateien (Rolle -> Pfad oder Liste von Pfaden)
+            params: Analyse-Parameter (JSON-serialisierbar)
+            version: Explizite Modulversion (default: Quellcode-Hash)
+
+        Returns:
+            CacheKey
+        """
+        name = _module_name(module)
+        mod_version = module_version(module, version)
+        resolved = {
+            role: {"path": path, "digest": file_digest(path)}
+            for role, path in _normalize_inputs(inputs).items()
+        }
+        params = dict(params or {})
+        material = {
+            "inputs": {role: info["digest"] for role, info in resolved.items()},
+            "params": params,
+            "module": name,
+            "module_version": mod_version,
+        }
+        digest = hashlib.sha256(_canonical_json(material).encode("utf-8")).hexdigest()
+        return CacheKey(
+            digest=digest,
+            module=name,
+            module_version=mod_version,
+            inputs=resolved,
+            params=params,
+            explicit_version=version is not None,
+        )
+
+    # ------------------------------------------------------------------
+    # Lesen/Schreiben
+    # ------------------------------------------------------------------
+
+    def _object_path(self, key: str) -> Path:
+        return self.objects_dir / key[:2] / f"{key}.json"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.objects_dir / key[:2] / f"{key}.meta.json"
+
+    def _published_path(self, path: PathLike) -> Path:
+        target = str(Path(path).resolve())
+        name = hashlib.sha256(target.encode("utf-8")).hexdigest()[:32]
+        return self.published_dir / f"{name}.json"
+
+    def _published_key(self, path: PathLike) -> Optional[str]:
+        try:
+            with open(self._published_path(path), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict) or data.get("path") != str(Path(path).resolve()):
+            return None
+        return data.get("key")
+
+    def contains(self, key: CacheKey | str) -> bool:
+        """Prueft, ob ein Artefakt zum Schluessel existiert."""
+        digest = key.digest if isinstance(key, CacheKey) else key
+        return self._object_path(digest).exists()
+
+    def get(self, key: CacheKey | str) -> Optional[Any]:
+        """Gibt das Artefakt zum Schluessel zurueck (None bei Miss).
+
+        Args:
+            key: CacheKey oder Digest
+
+        Returns:
+            Geparstes JSON-Artefakt oder None.
+        """
+        digest = key.digest if isinstance(key, CacheKey) else key
+        path = self._object_path(digest)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Corrupt cache object {path.name}: {e}")
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(
+        self,
+        key: CacheKey,
+        artifact: Any,
+        name: str = "",
+        publish_to: Optional[PathLike] = None,
+    ) -> CacheEntry:
+        """Speichert ein Artefakt unter seinem Schluessel.
+
+        Args:
+            key: Schluessel aus make_key()
+            artifact: JSON-serialisierbares Artefakt
+            name: Artefakt-Name fuer status/gc
+            publish_to: Optional zusaetzlich unter diesem Pfad schreiben
+
+        Returns:
+            CacheEntry des gespeicherten Artefakts.
+        """
+        size = _write_json_atomic(self._object_path(key.digest), artifact)
+
+        published = None
+        artifact_digest = None
+        if publish_to is not None:
+            published = str(Path(publish_to))
+            _write_json_atomic(Path(publish_to), artifact, indent=2)
+            artifact_digest = file_digest(publish_to)
+
+        entry = CacheEntry(
+            key=key.digest,
+            name=name or key.module.rsplit(".", 1)[-1],
+            module=key.module,
+            module_version=key.module_version,
+            inputs=key.inputs,
+            params=key.params,
+            created_at=datetime.now().isoformat(),
+            size=size,
+            last_access=time.time(),
+            published=published,
+            artifact_digest=artifact_digest,
+            explicit_version=key.explicit_version,
+        )
+        _write_json_atomic(self._meta_path(key.digest), entry.to_dict(), indent=2)
+        if publish_to is not None:
+            _write_json_atomic(
+                self._published_path(publish_to),
+                {"path": str(Path(publish_to).resolve()), "key": key.digest},
+            )
+        return entry
+
+    def lookup(
+        self,
+        key: CacheKey,
+        name: str = "",
+        publish_to: Optional[PathLike] = None,
+    ) -> Optional[Any]:
+        """Gibt das Artefakt zum Schluessel zurueck und veroeffentlicht es bei Bedarf.
+
+        Fehlt die veroeffentlichte Datei oder wurde sie veraendert, wird sie
+        aus dem Cache neu geschrieben.
+
+        Args:
+            key: Schluessel aus make_key()
+            name: Artefakt-Name fuer status/gc
+            publish_to: Optionaler Veroeffentlichungspfad
+
+        Returns:
+            Artefakt oder None bei Miss.
+        """
+        cached = self.get(key)
+        if cached is None:
+            return None
+        logger.debug(f"Cache hit for {name or key.module} ({key.digest[:12]})")
+        if publish_to is not None and not self._published_matches(key.digest, publish_to):
+            self.put(key, cached, name=name, publish_to=publish_to)
+        return cached
+
+    def get_or_compute(
+        self,
+        name: str,
+        compute: Callable[[], Any],
+        module: str | ModuleType,
+        inputs: Inputs = None,
+        params: Optional[Mapping[str, Any]] = None,
+        version: Optional[str] = None,
+        publish_to: Optional[PathLike] = None,
+        force: bool = False,
+    ) -> Any:
+        """Gibt das gecachte Artefakt zurueck oder berechnet und speichert es.
+
+        Args:
+            name: Artefakt-Name
+            compute: Erzeugt das JSON-serialisierbare Artefakt
+            module: Erzeugendes Analysemodul
+            inputs: Eingabedateien
+            params: Analyse-Parameter
+            version: Explizite Modulversion
+            publish_to: Optionaler Veroeffentlichungspfad in results/
+            force: Auch bei einem Treffer neu berechnen
+
+        Returns:
+            Artefakt (aus dem Cache oder frisch berechnet).
+        """
+        key = self.make_key(module, inputs, params, version)
+        if not force:
+            cached = self.lookup(key, name=name, publish_to=publish_to)
+            if cached is not None:
+                return cached
+
+        logger.info(f"Cache miss for {name} ({key.digest[:12]}), computing")
+        artifact = compute()
+        self.put(key, artifact, name=name, publish_to=publish_to)
+        return artifact
+
+    def _published_matches(self, key: str, path: PathLike) -> bool:
+        entry = self._read_meta(self._meta_path(key))
+        return (
+            entry is not None
+            and entry.published == str(Path(path))
+            and entry.artifact_digest == file_digest(path)
+        )
+
+    # ------------------------------------------------------------------
+    # Status / GC
+    # ------------------------------------------------------------------
+
+    def _read_meta(self, meta_path: Path) -> Optional[CacheEntry]:
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            entry = CacheEntry(**data)
+        except (OSError, json.JSONDecodeError, TypeError):
+            return None
+        try:
+            obj = self._object_path(entry.key).stat()
+            entry.last_access = obj.st_mtime
+            entry.size = obj.st_size
+        except OSError:
+            return None
+        return entry
+
+    def entries(self) -> list[CacheEntry]:
+        """Alle Eintraege (ohne Staleness-Pruefung), neueste zuerst."""
+        if not self.objects_dir.exists():
+            return []
+        entries = [
+            entry
+            for meta_path in self.objects_dir.glob("*/*.meta.json")
+            if (entry := self._read_meta(meta_path)) is not None
+        ]
+        return sorted(entries, key=lambda e: e.last_access, reverse=True)
+
+    def check(self, entry: CacheEntry) -> list[str]:
+        """Prueft, ob ein Eintrag zu aktuellen Eingaben und Code passt.
+
+        Args:
+            entry: CacheEntry
+
+        Returns:
+            Liste von Gruenden fuer Veraltung (leer = aktuell).
+        """
+        reasons = []
+        for role, info in entry.inputs.items():
+            current = file_digest(info["path"])
+            if current == MISSING_DIGEST:
+                reasons.append(f"input {role} missing: {info['path']}")
+            elif current != info["digest"]:
+                reasons.append(f"input {role} changed: {info['path']}")
+        if not entry.explicit_version:
+            try:
+                current_version = module_version(entry.module)
+            except ImportError:
+                reasons.append(f"module {entry.module} not importable")
+            else:
+                if current_version != entry.module_version:
+                    reasons.append(f"module {entry.module} changed")
+        entry.stale_reasons = reasons
+        return reasons
+
+    def status(self) -> list[CacheEntry]:
+        """Alle Eintraege mit gefuellten stale_reasons."""
+        entries = self.entries()
+        for entry in entries:
+            self.check(entry)
+        return entries
+
+    def artifact_status(self, path: PathLike) -> str:
+        """Frische eines veroeffentlichten Artefakts in results/.
+
+        Args:
+            path: Pfad der Ergebnisdatei
+
+        Returns:
+            "fresh" (Eingaben und Code unveraendert), "stale" oder
+            "unknown" (nicht ueber den Cache erzeugt oder nachtraeglich
+            veraendert).
+        """
+        current = file_digest(path)
+        if current == MISSING_DIGEST:
+            return "unknown"
+        key = self._published_key(path)
+        entry = self._read_meta(self._meta_path(key)) if key else None
+        if entry is None or entry.artifact_digest != current:
+            return "unknown"
+        return "stale" if self.check(entry) else "fresh"
+
+    def evict(self, entry: CacheEntry | str) -> None:
+        """Entfernt einen Eintrag (Artefakt, Metadaten und Veroeffentlichungsindex)."""
+        key = entry.key if isinstance(entry, CacheEntry) else entry
+        meta = entry if isinstance(entry, CacheEntry) else self._read_meta(self._meta_path(key))
+        if meta is not None and meta.published and self._published_key(meta.published) == key:
+            self._published_path(meta.published).unlink(missing_ok=True)
+        for path in (self._object_path(key), self._meta_path(key)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def gc(
+        self,
+        max_age_days: Optional[float] = None,
+        max_size_mb: Optional[float] = None,
+        stale: bool = False,
+        dry_run: bool = False,
+    ) -> list[CacheEntry]:
+        """Raeumt den Cache auf.
+
+        Reihenfolge: veraltete Eintraege (stale=True), Eintraege ohne Zugriff
+        seit max_age_days, danach die am laengsten nicht genutzten Eintraege,
+        bis die Gesamtgroesse unter max_size_mb liegt.
+
+        Args:
+            max_age_days: Maximales Alter seit letztem Zugriff
+            max_size_mb: Maximale Gesamtgroesse der Artefakte
+            stale: Veraltete Eintraege entfernen
+            dry_run: Nur ermitteln, nichts loeschen
+
+        Returns:
+            Liste der (zu) entfernenden Eintraege.
+        """
+        entries = self.status() if stale else self.entries()
+        evicted: list[CacheEntry] = []
+        remaining: list[CacheEntry] = []
+        for entry in entries:
+            if (stale and entry.is_stale) or (
+                max_age_days is not None and entry.age_days > max_age_days
+            ):
+                evicted.append(entry)
+            else:
+                remaining.append(entry)
+
+        if max_size_mb is not None:
+            budget = max_size_mb * 1024 * 1024
+            total = sum(e.size for e in remaining)
+            for entry in sorted(remaining, key=lambda e: e.last_access):
+                if total <= budget:
+                    break
+                evicted.append(entry)
+                total -= entry.size
+
+        if not dry_run:
+            for entry in evicted:
+                self.evict(entry)
+        return evicted
+
+    def clear(self) -> int:
+        """Entfernt alle Eintraege.
+
+        Returns:
+            Anzahl entfernter Eintraege.
+        """
+        entries = self.entries()
+        for entry in entries:
+            self.evict(entry)
+        return len(entries)
+
+
+__all__ = [
+    "CacheEntry",
+    "CacheKey",
+    "ResultCache",
+    "file_digest",
+    "module_version",
+]
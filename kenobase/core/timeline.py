@@ -18,22 +18,46 @@ Usage:
 
     aligned_df = grid.to_dataframe()
     grid.to_parquet("data/processed/timeline_grid.parquet")
+
+    # Jahres-partitioniertes Dataset; spaeter nur Teile davon laden
+    grid.to_parquet("data/processed/timeline", mode="dataset")
+    lotto_2024 = load_multi_game_grid(
+        dataset_path="data/processed/timeline", games=["lotto"], start="2024-01-01"
+    )
+
+Intern haelt jedes Spiel seine Ziehungen als Arrays fester Breite
+(Datum, Zahlen, Bonus; 0-gepolstert plus Laengen). Die Ausrichtung auf das
+Tages-Grid ist ein einziges searchsorted, forward-fill ein kumulatives
+Maximum ueber die Ziehungsindizes.
 """
 
 from __future__ import annotations
 
+import importlib.util
+import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Literal, Optional, Sequence, Union
 
+import numpy as np
 import pandas as pd
 
 from kenobase.core.data_loader import DrawResult, GameType
 
 logger = logging.getLogger(__name__)
 
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Version des Parquet-Datasets (mode="dataset")
+TIMELINE_DATASET_VERSION = 1
+_MANIFEST_NAME = "_timeline.json"
+_META_PREFIX = "meta."
+
+DateLike = Union[str, datetime, pd.Timestamp]
+
 
 # Draw day patterns (0=Monday, 6=Sunday)
 DRAW_PATTERNS: dict[str, set[int]] = {
@@ -43,18 +67,206 @@ DRAW_PATTERNS: dict[str, set[int]] = {
 }
 
 
+def _pad_rows(rows: list[Sequence[int]], dtype: type) -> tuple[np.ndarray, np.ndarray]:
+    """Packt Zahlenfolgen in ein 0-gepolstertes (n, max_len) Array plus Laengen."""
+    lengths = np.fromiter(map(len, rows), dtype=np.int64, count=len(rows))
+    width = int(lengths.max(initial=0))
+    out = np.zeros((len(rows), width), dtype=dtype)
+    if width:
+        flat = np.fromiter(chain.from_iterable(rows), dtype=dtype, count=int(lengths.sum()))
+        out[np.arange(width) < lengths[:, None]] = flat
+    return out, lengths
+
+
+def _unpad_rows(values: np.ndarray, lengths: np.ndarray) -> list[tuple[int, ...]]:
+    """Gegenstueck zu _pad_rows: Tupel je Zeile."""
+    return [tuple(row[:n]) for row, n in zip(values.tolist(), lengths.tolist())]
+
+
 @dataclass
 class GameData:
     """Container for a single game's draw data.
 
+    Die Ziehungen werden beim Anlegen einmal in Arrays fester Breite
+    ueberfuehrt (nach Datum sortiert, je Tag die letzte Ziehung).
+
     Attributes:
         game_type: Type of lottery game
         draws: List of DrawResult objects
-        df: DataFrame representation of draws
+        df: Metadaten je Ziehungstag (Index = Datum)
+        dates: (n,) datetime64 (Tagesdatum), sortiert und eindeutig
+        numbers: (n, max_numbers) int16, 0-gepolstert
+        number_counts: (n,) Anzahl Zahlen je Ziehung
+        bonus: (n, max_bonus) int64, 0-gepolstert
+        bonus_counts: (n,) Anzahl Bonuszahlen je Ziehung
     """
     game_type: GameType
     draws: list[DrawResult]
     df: Optional[pd.DataFrame] = None
+    dates: Optional[np.ndarray] = None
+    numbers: Optional[np.ndarray] = None
+    number_counts: Optional[np.ndarray] = None
+    bonus: Optional[np.ndarray] = None
+    bonus_counts: Optional[np.ndarray] = None
+
+    def __post_init__(self) -> None:
+        if self.dates is not None:
+            return
+        raw_dates = pd.to_datetime(
+            [d.date.date() if isinstance(d.date, datetime) else d.date for d in self.draws]
+        )
+        order = np.argsort(raw_dates.values, kind="stable")
+        sorted_dates = raw_dates.values[order]
+        # Doppelte Tage: letzte Ziehung (in Eingabereihenfolge) gewinnt
+        keep = np.append(sorted_dates[1:] != sorted_dates[:-1], True) if len(order) else order
+        rows = order[keep]
+
+        self.dates = sorted_dates[keep]
+        self.numbers, self.number_counts = _pad_rows(
+            [self.draws[i].numbers for i in rows], np.int16
+        )
+        self.bonus, self.bonus_counts = _pad_rows(
+            [self.draws[i].bonus or () for i in rows], np.int64
+        )
+        if self.df is None:
+            self.df = pd.DataFrame(
+                [self.draws[i].metadata for i in rows],
+                index=pd.DatetimeIndex(self.dates, name="date"),
+            )
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def numbers_tuples(self) -> list[tuple[int, ...]]:
+        """Zahlen je Ziehungstag als Tupel."""
+        return _unpad_rows(self.numbers, self.number_counts)
+
+    @property
+    def bonus_tuples(self) -> list[tuple[int, ...]]:
+        """Bonuszahlen je Ziehungstag als Tupel (leer wenn keine)."""
+        return _unpad_rows(self.bonus, self.bonus_counts)
+
+    def day_positions(self, daily_index: pd.DatetimeIndex) -> np.ndarray:
+        """Position jeder Ziehung im Tages-Index (ein searchsorted)."""
+        return daily_index.values.searchsorted(self.dates)
+
+    def draw_index(self, daily_index: pd.DatetimeIndex, ffill: bool = False) -> np.ndarray:
+        """Ziehungsindex je Tag (-1 ohne Ziehung bzw. vor der ersten Ziehung).
+
+        Args:
+            daily_index: Taeglicher DatetimeIndex des Grids
+            ffill: Tage ohne Ziehung zeigen auf die letzte vorherige Ziehung
+
+        Returns:
+            (n_days,) int64-Array
+        """
+        index = np.full(len(daily_index), -1, dtype=np.int64)
+        positions = self.day_positions(daily_index)
+        inside = (positions < len(daily_index)) & (
+            daily_index.values[np.minimum(positions, len(daily_index) - 1)] == self.dates
+        )
+        index[positions[inside]] = np.flatnonzero(inside)
+        if ffill:
+            index = np.maximum.accumulate(index)
+        return index
+
+
+def _take_object(values: list, index: np.ndarray) -> np.ndarray:
+    """values[index] als Objekt-Array, NaN wo index < 0."""
+    source = np.empty(len(values) + 1, dtype=object)
+    source[:-1] = values
+    source[-1] = np.nan
+    return source[index]
+
+
+def _take_numeric(values: np.ndarray, index: np.ndarray, as_float: bool) -> np.ndarray:
+    """values[index] als Spalte: int64 oder float64 mit NaN wo index < 0."""
+    if not as_float:
+        return values[index].astype(np.int64)
+    out = values[np.maximum(index, 0)].astype(float)
+    out[index < 0] = np.nan
+    return out
+
+
+def _game_columns(game_data: GameData, rows: slice) -> dict:
+    """Spalten (pyarrow-Arrays) einer Jahres-Partition im Dataset-Format."""
+    import pyarrow as pa
+
+    columns: dict = {
+        "date": pa.array(game_data.dates[rows], type=pa.timestamp("ns")),
+        "n_numbers": pa.array(game_data.number_counts[rows].astype(np.int16)),
+    }
+    for i in range(game_data.numbers.shape[1]):
+        columns[f"z{i+1}"] = pa.array(game_data.numbers[rows, i])
+    columns["n_bonus"] = pa.array(game_data.bonus_counts[rows].astype(np.int16))
+    for i in range(game_data.bonus.shape[1]):
+        columns[f"bonus{i+1}"] = pa.array(game_data.bonus[rows, i])
+
+    for key in game_data.df.columns:
+        values = game_data.df[key].iloc[rows]
+        try:
+            columns[f"{_META_PREFIX}{key}"] = pa.array(values, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Gemischte Typen: als Text ablegen, fehlende Werte bleiben null
+            columns[f"{_META_PREFIX}{key}"] = pa.array(
+                values.map(str).where(values.notna(), None), type=pa.string()
+            )
+    return columns
+
+
+def _game_from_table(table, game_type: GameType) -> GameData:
+    """Baut GameData (Arrays plus DrawResults) aus einer Dataset-Tabelle."""
+    names = table.column_names
+    z_cols = [c for c in names if c.startswith("z") and c[1:].isdigit()]
+    b_cols = [c for c in names if c.startswith("bonus") and c[5:].isdigit()]
+    meta_cols = [c for c in names if c.startswith(_META_PREFIX)]
+
+    dates = table.column("date").to_numpy().astype("datetime64[s]")
+    numbers = np.zeros((len(dates), len(z_cols)), dtype=np.int16)
+    for i, col in enumerate(z_cols):
+        numbers[:, i] = table.column(col).to_numpy()
+    bonus = np.zeros((len(dates), len(b_cols)), dtype=np.int64)
+    for i, col in enumerate(b_cols):
+        bonus[:, i] = table.column(col).to_numpy()
+    number_counts = table.column("n_numbers").to_numpy().astype(np.int64)
+    bonus_counts = table.column("n_bonus").to_numpy().astype(np.int64)
+
+    meta_values = {c[len(_META_PREFIX):]: table.column(c).to_pylist() for c in meta_cols}
+    metadata = [
+        {k: v[i] for k, v in meta_values.items() if v[i] is not None}
+        for i in range(len(dates))
+    ]
+    df = pd.DataFrame(
+        metadata, index=pd.DatetimeIndex(dates, name="date"), columns=list(meta_values)
+    )
+
+    game_value = GameType(game_type).value
+    draws = [
+        DrawResult.model_construct(
+            date=pd.Timestamp(day).to_pydatetime(),
+            numbers=list(nums),
+            bonus=list(bon),
+            game_type=game_value,
+            metadata=meta,
+        )
+        for day, nums, bon, meta in zip(
+            dates,
+            _unpad_rows(numbers, number_counts),
+            _unpad_rows(bonus, bonus_counts),
+            metadata,
+        )
+    ]
+    return GameData(
+        game_type=GameType(game_type),
+        draws=draws,
+        df=df,
+        dates=dates,
+        numbers=numbers,
+        number_counts=number_counts,
+        bonus=bonus,
+        bonus_counts=bonus_counts,
+    )
 
 
 @dataclass
@@ -109,41 +321,26 @@ class TimelineGrid:
             if isinstance(game_type, str):
                 game_type = GameType(game_type)
 
-        # Build DataFrame from draws
-        data = []
-        for draw in draws:
-            row = {
-                "date": draw.date.date() if isinstance(draw.date, datetime) else draw.date,
-                "numbers": tuple(draw.numbers),
-                "bonus": tuple(draw.bonus) if draw.bonus else (),
-            }
-            row.update(draw.metadata)
-            data.append(row)
+        game_data = GameData(game_type=game_type, draws=draws)
+        self._add_game_data(game_name, game_data)
 
-        df = pd.DataFrame(data)
-        df["date"] = pd.to_datetime(df["date"])
-        df = df.sort_values("date").drop_duplicates(subset=["date"], keep="last")
-        df = df.set_index("date")
+        logger.info(
+            f"Added game '{game_name}' with {len(draws)} draws "
+            f"({pd.Timestamp(game_data.dates[0]).date()} to "
+            f"{pd.Timestamp(game_data.dates[-1]).date()})"
+        )
 
-        # Update date range
-        game_start = df.index.min()
-        game_end = df.index.max()
+    def _add_game_data(self, game_name: str, game_data: GameData) -> None:
+        """Registriert fertige GameData und erweitert den Datumsbereich."""
+        game_start = pd.Timestamp(game_data.dates[0])
+        game_end = pd.Timestamp(game_data.dates[-1])
 
         if self.start_date is None or game_start < self.start_date:
             self.start_date = game_start
         if self.end_date is None or game_end > self.end_date:
             self.end_date = game_end
 
-        self.games[game_name] = GameData(
-            game_type=game_type,
-            draws=draws,
-            df=df,
-        )
-
-        logger.info(
-            f"Added game '{game_name}' with {len(draws)} draws "
-            f"({game_start.date()} to {game_end.date()})"
-        )
+        self.games[game_name] = game_data
 
     def add_game_from_csv(
         self,
@@ -202,32 +399,26 @@ class TimelineGrid:
             raise ValueError("No games added to grid")
 
         daily_index = self._create_daily_index()
-        result_df = pd.DataFrame(index=daily_index)
-        result_df.index.name = "date"
+        ffill = self.fill_strategy == "ffill"
+        columns: dict[str, np.ndarray] = {}
 
         for game_name, game_data in self.games.items():
-            source_df = game_data.df
-
-            # Reindex to daily grid
-            aligned = source_df.reindex(daily_index)
-
-            # Create draw mask (True where we have a draw)
-            has_draw = ~aligned["numbers"].isna()
+            raw_index = game_data.draw_index(daily_index)
+            fill_index = game_data.draw_index(daily_index, ffill=True) if ffill else raw_index
 
             if include_draw_mask:
-                result_df[f"{game_name}_has_draw"] = has_draw
+                columns[f"{game_name}_has_draw"] = raw_index >= 0
 
             if include_numbers:
-                if self.fill_strategy == "ffill":
-                    result_df[f"{game_name}_numbers"] = aligned["numbers"].ffill()
-                else:
-                    result_df[f"{game_name}_numbers"] = aligned["numbers"]
+                columns[f"{game_name}_numbers"] = _take_object(
+                    game_data.numbers_tuples, fill_index
+                )
 
-            if include_bonus and "bonus" in aligned.columns:
-                if self.fill_strategy == "ffill":
-                    result_df[f"{game_name}_bonus"] = aligned["bonus"].ffill()
-                else:
-                    result_df[f"{game_name}_bonus"] = aligned["bonus"]
+            if include_bonus:
+                columns[f"{game_name}_bonus"] = _take_object(game_data.bonus_tuples, fill_index)
+
+        result_df = pd.DataFrame(columns, index=daily_index)
+        result_df.index.name = "date"
 
         logger.info(
             f"Created timeline grid: {len(result_df)} days, "
@@ -252,58 +443,45 @@ class TimelineGrid:
             raise ValueError("No games added to grid")
 
         daily_index = self._create_daily_index()
-        result_df = pd.DataFrame(index=daily_index)
-        result_df.index.name = "date"
+        ffill = self.fill_strategy == "ffill"
+        columns: dict[str, pd.Series | np.ndarray] = {}
 
         for game_name, game_data in self.games.items():
-            source_df = game_data.df.copy()
-
-            # Expand numbers tuple to separate columns
-            if "numbers" in source_df.columns:
-                # Get max length of numbers across all draws
-                num_lengths = source_df["numbers"].dropna().apply(len)
-                if len(num_lengths) > 0:
-                    max_len = num_lengths.max()
-
-                    for i in range(max_len):
-                        col_name = f"{game_name}_z{i+1}"
-                        source_df[col_name] = source_df["numbers"].apply(
-                            lambda x: x[i] if isinstance(x, tuple) and len(x) > i else None
-                        )
-
-            # Expand bonus tuple to separate columns
-            if "bonus" in source_df.columns:
-                bonus_lengths = source_df["bonus"].dropna().apply(
-                    lambda x: len(x) if isinstance(x, tuple) else 0
-                )
-                if len(bonus_lengths) > 0 and bonus_lengths.max() > 0:
-                    max_bonus = bonus_lengths.max()
-
-                    prefix = "euro" if game_name == "eurojackpot" else "bonus"
-                    for i in range(max_bonus):
-                        col_name = f"{game_name}_{prefix}{i+1}"
-                        source_df[col_name] = source_df["bonus"].apply(
-                            lambda x: x[i] if isinstance(x, tuple) and len(x) > i else None
-                        )
-
-            # Remove original tuple columns
-            cols_to_keep = [c for c in source_df.columns if c not in ["numbers", "bonus"]]
-            source_df = source_df[cols_to_keep]
-
-            # Reindex to daily grid
-            aligned = source_df.reindex(daily_index)
-
-            # Add has_draw column
-            first_num_col = f"{game_name}_z1"
-            if first_num_col in aligned.columns:
-                result_df[f"{game_name}_has_draw"] = ~aligned[first_num_col].isna()
-
-            # Apply fill strategy and add columns
-            for col in aligned.columns:
-                if self.fill_strategy == "ffill":
-                    result_df[col] = aligned[col].ffill()
-                else:
-                    result_df[col] = aligned[col]
+            raw_index = game_data.draw_index(daily_index)
+            number_width = game_data.numbers.shape[1]
+
+            if number_width:
+                columns[f"{game_name}_has_draw"] = raw_index >= 0
+
+            # Metadaten: ein Reindex fuer alle Spalten
+            if len(game_data.df.columns):
+                meta = game_data.df.reindex(daily_index)
+                if ffill:
+                    meta = meta.ffill()
+                for col in meta.columns:
+                    columns[col] = meta[col]
+
+            # Zahlen/Bonus: Spalte i ist gueltig, wenn die Ziehung > i Werte hat;
+            # forward-fill je Spalte, float64 sobald ein Tag (ungefuellt) fehlt
+            for values, counts, prefix in (
+                (game_data.numbers, game_data.number_counts, "z"),
+                (
+                    game_data.bonus,
+                    game_data.bonus_counts,
+                    "euro" if game_name == "eurojackpot" else "bonus",
+                ),
+            ):
+                for i in range(values.shape[1]):
+                    col_index = np.where(counts[np.maximum(raw_index, 0)] > i, raw_index, -1)
+                    as_float = bool((col_index < 0).any())
+                    if ffill:
+                        col_index = np.maximum.accumulate(col_index)
+                    columns[f"{game_name}_{prefix}{i+1}"] = _take_numeric(
+                        values[:, i], col_index, as_float
+                    )
+
+        result_df = pd.DataFrame(columns, index=daily_index)
+        result_df.index.name = "date"
 
         logger.info(
             f"Created numbers matrix: {len(result_df)} days, "
@@ -315,18 +493,27 @@ class TimelineGrid:
     def to_parquet(
         self,
         path: str | Path,
-        mode: Literal["tuple", "matrix"] = "tuple",
+        mode: Literal["tuple", "matrix", "dataset"] = "tuple",
     ) -> Path:
-        """Exportiert das Grid als Parquet-Datei.
+        """Exportiert das Grid als Parquet-Datei bzw. -Dataset.
 
         Args:
-            path: Ziel-Pfad fuer Parquet-Datei
-            mode: 'tuple' fuer Zahlen als Tupel, 'matrix' fuer expandierte Spalten
+            path: Ziel-Pfad fuer Parquet-Datei (bei 'dataset': Verzeichnis)
+            mode: 'tuple' fuer Zahlen als Tupel, 'matrix' fuer expandierte Spalten,
+                'dataset' fuer ein nach Spiel und Jahr partitioniertes Verzeichnis
+                (nur Ziehungstage, lesbar mit TimelineGrid.read_parquet)
 
         Returns:
-            Pfad zur erstellten Datei
+            Pfad zur erstellten Datei bzw. zum Dataset-Verzeichnis
+
+        Raises:
+            ImportError: Wenn mode='dataset' und pyarrow nicht installiert ist
         """
         path = Path(path)
+
+        if mode == "dataset":
+            return self._write_dataset(path)
+
         path.parent.mkdir(parents=True, exist_ok=True)
 
         if mode == "matrix":
@@ -344,6 +531,141 @@ class TimelineGrid:
         logger.info(f"Exported timeline grid to {path}")
         return path
 
+    def _write_dataset(self, root: Path) -> Path:
+        """Schreibt root/game=<name>/year=<YYYY>/part-0.parquet plus Manifest.
+
+        Pro Spiel und Jahr eine Datei mit den Ziehungstagen: date, n_numbers,
+        z1..zW, n_bonus, bonus1..bonusB und Metadaten als 'meta.<key>'.
+        Vorhandene Partitionen der geschriebenen Spiele werden ersetzt.
+        """
+        if not HAS_PYARROW:
+            raise ImportError(
+                "pyarrow is required for Parquet export. Install with: pip install pyarrow"
+            )
+        import shutil
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not self.games:
+            raise ValueError("No games added to grid")
+
+        root.mkdir(parents=True, exist_ok=True)
+        manifest_path = root / _MANIFEST_NAME
+        manifest = (
+            json.loads(manifest_path.read_text(encoding="utf-8"))
+            if manifest_path.exists()
+            else {"games": {}}
+        )
+
+        for game_name, game_data in self.games.items():
+            game_dir = root / f"game={game_name}"
+            if game_dir.exists():
+                shutil.rmtree(game_dir)
+
+            years = pd.DatetimeIndex(game_data.dates).year.to_numpy()
+            bounds = np.flatnonzero(np.diff(years)) + 1
+            starts = np.concatenate(([0], bounds))
+            ends = np.concatenate((bounds, [len(years)]))
+
+            for lo, hi in zip(starts.tolist(), ends.tolist()):
+                table = pa.table(_game_columns(game_data, slice(lo, hi)))
+                year_dir = game_dir / f"year={years[lo]}"
+                year_dir.mkdir(parents=True, exist_ok=True)
+                pq.write_table(table, year_dir / "part-0.parquet")
+
+            manifest["games"][game_name] = {
+                "game_type": GameType(game_data.game_type).value,
+                "start": str(pd.Timestamp(game_data.dates[0]).date()),
+                "end": str(pd.Timestamp(game_data.dates[-1]).date()),
+                "years": sorted(set(years.tolist())),
+                "rows": len(game_data),
+            }
+
+        manifest["version"] = TIMELINE_DATASET_VERSION
+        manifest["fill_strategy"] = self.fill_strategy
+        manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+        logger.info(f"Exported timeline dataset ({len(self.games)} games) to {root}")
+        return root
+
+    @classmethod
+    def read_parquet(
+        cls,
+        root: str | Path,
+        games: Optional[Sequence[str]] = None,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        fill_strategy: Optional[Literal["nan", "ffill"]] = None,
+    ) -> "TimelineGrid":
+        """Laedt ein mit mode='dataset' geschriebenes Grid (ganz oder teilweise).
+
+        Gelesen werden nur die Jahresdateien der angeforderten Spiele, die
+        den Zeitraum [start, end] beruehren; der Datumsfilter wird an
+        pyarrow weitergereicht.
+
+        Args:
+            root: Dataset-Verzeichnis
+            games: Spielnamen (default: alle im Manifest)
+            start: Erster Tag (inklusive, optional)
+            end: Letzter Tag (inklusive, optional)
+            fill_strategy: Ueberschreibt die gespeicherte fill_strategy
+
+        Returns:
+            TimelineGrid mit den gefilterten Ziehungen
+
+        Raises:
+            ImportError: Wenn pyarrow nicht installiert ist
+            FileNotFoundError: Wenn kein Manifest vorhanden ist
+            KeyError: Wenn ein Spiel nicht im Dataset enthalten ist
+        """
+        if not HAS_PYARROW:
+            raise ImportError(
+                "pyarrow is required for Parquet import. Install with: pip install pyarrow"
+            )
+        import pyarrow as pa
+        import pyarrow.dataset as pds
+
+        root = Path(root)
+        manifest_path = root / _MANIFEST_NAME
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"No timeline dataset manifest at {manifest_path}")
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+        available = manifest["games"]
+        selected = list(available) if games is None else list(games)
+        unknown = [g for g in selected if g not in available]
+        if unknown:
+            raise KeyError(f"Games not in timeline dataset: {unknown}")
+
+        start_ts = pd.Timestamp(start).normalize() if start is not None else None
+        end_ts = pd.Timestamp(end).normalize() if end is not None else None
+
+        date_filter = None
+        if start_ts is not None:
+            date_filter = pds.field("date") >= pa.scalar(start_ts, type=pa.timestamp("ns"))
+        if end_ts is not None:
+            upper = pds.field("date") <= pa.scalar(end_ts, type=pa.timestamp("ns"))
+            date_filter = upper if date_filter is None else date_filter & upper
+
+        grid = cls(fill_strategy=fill_strategy or manifest.get("fill_strategy", "nan"))
+        for game_name in selected:
+            info = available[game_name]
+            files = [
+                str(root / f"game={game_name}" / f"year={year}" / "part-0.parquet")
+                for year in info["years"]
+                if (start_ts is None or year >= start_ts.year)
+                and (end_ts is None or year <= end_ts.year)
+            ]
+            if not files:
+                continue
+            table = pds.dataset(files, format="parquet").to_table(filter=date_filter)
+            if table.num_rows == 0:
+                continue
+            grid._add_game_data(game_name, _game_from_table(table, GameType(info["game_type"])))
+
+        return grid
+
     def get_draw_coverage(self) -> pd.DataFrame:
         """Berechnet die Ziehungs-Abdeckung pro Spiel.
 
@@ -364,10 +686,8 @@ class TimelineGrid:
 
         stats = []
         for game_name, game_data in self.games.items():
-            source_df = game_data.df
-
             # Count draws within the grid date range
-            draw_days = len(source_df)
+            draw_days = len(game_data)
 
             # Expected draws based on pattern
             pattern_key = game_name.lower()
@@ -402,16 +722,17 @@ class TimelineGrid:
         if not games:
             return pd.DatetimeIndex([])
 
-        # Start with first game's draw dates
-        joint_dates = set(self.games[games[0]].df.index)
+        # Start with first game's draw dates (sorted, unique)
+        joint_dates = self.games[games[0]].dates
 
         # Intersect with remaining games
         for game_name in games[1:]:
             if game_name in self.games:
-                game_dates = set(self.games[game_name].df.index)
-                joint_dates &= game_dates
+                joint_dates = np.intersect1d(
+                    joint_dates, self.games[game_name].dates, assume_unique=True
+                )
 
-        return pd.DatetimeIndex(sorted(joint_dates))
+        return pd.DatetimeIndex(joint_dates)
 
     def summary(self) -> dict:
         """Gibt eine Zusammenfassung des Grids zurueck.
@@ -436,14 +757,26 @@ def load_multi_game_grid(
     lotto_path: Optional[str | Path] = None,
     eurojackpot_path: Optional[str | Path] = None,
     fill_strategy: Literal["nan", "ffill"] = "nan",
+    dataset_path: Optional[str | Path] = None,
+    games: Optional[Sequence[str]] = None,
+    start: Optional[DateLike] = None,
+    end: Optional[DateLike] = None,
 ) -> TimelineGrid:
     """Convenience-Funktion zum Laden mehrerer Spiele.
 
+    Mit dataset_path wird ein per to_parquet(mode="dataset") geschriebenes
+    Dataset gelesen (nur die Partitionen von games/start/end); die CSV-Pfade
+    werden dann ignoriert.
+
     Args:
         keno_path: Pfad zu KENO CSV (optional)
         lotto_path: Pfad zu Lotto CSV (optional)
         eurojackpot_path: Pfad zu EuroJackpot CSV (optional)
         fill_strategy: Strategie fuer nicht-Ziehungstage
+        dataset_path: Verzeichnis eines Timeline-Datasets (optional)
+        games: Spielauswahl fuer dataset_path (default: alle)
+        start: Erster Tag fuer dataset_path (optional)
+        end: Letzter Tag fuer dataset_path (optional)
 
     Returns:
         Konfiguriertes TimelineGrid
@@ -456,6 +789,11 @@ def load_multi_game_grid(
         ... )
         >>> df = grid.to_dataframe()
     """
+    if dataset_path is not None:
+        return TimelineGrid.read_parquet(
+            dataset_path, games=games, start=start, end=end, fill_strategy=fill_strategy
+        )
+
     grid = TimelineGrid(fill_strategy=fill_strategy)
 
     if keno_path:
@@ -474,5 +812,6 @@ __all__ = [
     "TimelineGrid",
     "GameData",
     "DRAW_PATTERNS",
+    "TIMELINE_DATASET_VERSION",
     "load_multi_game_grid",
 ]
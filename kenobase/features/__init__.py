@@ -6,7 +6,8 @@ die alle verfuegbaren Analyse-Module zu einem Feature-Vektor pro Zahl kombiniert
 Hauptkomponenten:
 - FeatureRegistry: Zentrale Registrierung aller Feature-Extraktoren
 - FeatureExtractor: Extrahiert Features aus Rohdaten
-- FeatureStore: Speichert und laedt Feature-Vektoren
+- FeatureStore: Speichert und laedt Feature-Vektoren (inkl. Walk-Forward-Snapshots)
+- FeatureSnapshots: Feature-Tensor (Datum x Zahl x Feature) mit as_of-Abfragen
 - FeaturePipeline: Orchestriert den gesamten Feature-Engineering-Prozess
 
 Verwendung:
@@ -27,6 +28,10 @@ from kenobase.features.registry import (
     FeatureDefinition,
     register_feature,
 )
+from kenobase.features.snapshots import (
+    FeatureSnapshots,
+    build_feature_snapshots,
+)
 from kenobase.features.store import (
     FeatureStore,
     StorageFormat,
@@ -46,6 +51,9 @@ __all__ = [
     "FeatureRegistry",
     "FeatureDefinition",
     "register_feature",
+    # Snapshots
+    "FeatureSnapshots",
+    "build_feature_snapshots",
     # Store
     "FeatureStore",
     "StorageFormat",
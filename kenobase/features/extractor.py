@@ -116,6 +116,18 @@ class FeatureExtractor:
 
         self._all_numbers = list(range(numbers_range[0], numbers_range[1] + 1))
 
+    @property
+    def settings(self) -> dict[str, Any]:
+        """Einstellungen, von denen die extrahierten Features abhaengen (JSON-faehig)."""
+        return {
+            "numbers_range": list(self.numbers_range),
+            "numbers_to_draw": self.numbers_to_draw,
+            "hot_threshold": self.hot_threshold,
+            "cold_threshold": self.cold_threshold,
+            "rolling_window": self.rolling_window,
+            "stability_threshold": self.stability_threshold,
+        }
+
     def extract(
         self,
         draws: list[DrawResult],
@@ -17,7 +17,6 @@ Verwendung:
 
 from __future__ import annotations
 
-import json
 import logging
 import time
 from dataclasses import dataclass, field
@@ -26,6 +25,7 @@ from pathlib import Path
 from typing import Any, Optional
 
 from kenobase.core.data_loader import DataLoader, DrawResult, GameType
+from kenobase.core.profiling import profiled, span
 from kenobase.features.extractor import FeatureExtractor, FeatureVector
 from kenobase.features.store import FeatureStore, StorageFormat
 
@@ -182,6 +182,7 @@ class FeaturePipeline:
             default_format=self.config.storage_format,
         )
 
+    @profiled("features.run")
     def run(
         self,
         draws: Optional[list[DrawResult]] = None,
@@ -204,16 +205,19 @@ class FeaturePipeline:
         try:
             # Step 1: Load data
             if draws is None:
-                draws = self._load_draws()
+                with span("features.load_draws"):
+                    draws = self._load_draws()
             result.draw_count = len(draws)
             logger.info(f"Loaded {result.draw_count} draws")
 
             # Step 2: Load hypothesis results
-            hyp_results = self._load_hypothesis_results()
+            with span("features.load_hypotheses"):
+                hyp_results = self._load_hypothesis_results()
             logger.info(f"Loaded {len(hyp_results)} hypothesis results")
 
             # Step 3: Extract features
-            features = self._extractor.extract(draws, hyp_results)
+            with span("features.extract", draws=len(draws)):
+                features = self._extractor.extract(draws, hyp_results)
             result.features = features
 
             # Step 4: Calculate metrics
@@ -238,16 +242,17 @@ class FeaturePipeline:
             # Step 5: Save features
             if save:
                 feature_name = name or f"{self.config.game}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                output_path = self._store.save(
-                    features,
-                    feature_name,
-                    metadata={
-                        "game": self.config.game,
-                        "draw_count": result.draw_count,
-                        "feature_count": result.feature_count,
-                        "timestamp": datetime.now().isoformat(),
-                    },
-                )
+                with span("features.save"):
+                    output_path = self._store.save(
+                        features,
+                        feature_name,
+                        metadata={
+                            "game": self.config.game,
+                            "draw_count": result.draw_count,
+                            "feature_count": result.feature_count,
+                            "timestamp": datetime.now().isoformat(),
+                        },
+                    )
                 result.output_path = str(output_path)
                 logger.info(f"Saved features to {output_path}")
 
@@ -289,26 +294,10 @@ class FeaturePipeline:
         return self._loader.load(path, game_type=game_type)
 
     def _load_hypothesis_results(self) -> dict[str, dict]:
-        """Laedt Hypothesen-Ergebnisse aus results/."""
-        results = {}
-        results_dir = Path(self.config.results_dir)
-
-        if not results_dir.exists():
-            logger.warning(f"Results directory not found: {results_dir}")
-            return results
-
-        for json_file in results_dir.glob("hyp*.json"):
-            try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    hyp_id = data.get("hypothesis", data.get("hypothesis_id", ""))
-                    if hyp_id:
-                        results[hyp_id] = data
-                        logger.debug(f"Loaded {hyp_id} from {json_file.name}")
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Could not load {json_file}: {e}")
-
-        return results
+        """Laedt Hypothesen-Ergebnisse aus results/ (ueber den ResultsIndex)."""
+        from kenobase.prediction.results_index import load_hypothesis_results
+
+        return load_hypothesis_results(self.config.results_dir)
 
     def get_synthesized_scores(self) -> dict[int, float]:
         """Gibt kombinierte Scores aus HypothesisSynthesizer zurueck.
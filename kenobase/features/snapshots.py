@@ -0,0 +1,349 @@
+"""Feature Snapshots - Walk-Forward Feature-Tensor (Datum x Zahl x Feature).
+
+Ein Snapshot zum Datum D enthaelt die Features, die FeatureExtractor.extract
+aus allen Ziehungen von `origin` bis einschliesslich D liefert. Damit sind
+Point-in-Time-Abfragen ("Features wie am Tag D bekannt") ohne erneute
+Extraktion moeglich; persistiert werden die Snapshots ueber
+FeatureStore.save_snapshots / append_snapshots.
+
+Pro Tag werden zusaetzlich die Anzahl der Kontext-Ziehungen und ein
+kumulativer Fingerprint der Historie (history_digests) gespeichert, fuer
+die Reihe ausserdem die Einstellungen des FeatureExtractor. Konsumenten
+wie KenoTrainer nutzen einen Snapshot nur, wenn alles zu ihren eigenen
+Ziehungen und ihrem Extractor passt (gefilterte Listen, korrigierte CSVs,
+andere Schwellen).
+
+Verwendung:
+    snapshots = build_feature_snapshots(draws)
+    vectors = snapshots.as_of("2024-03-01")      # dict[int, FeatureVector]
+    X = snapshots.matrix("2024-03-01", KenoPredictor.FEATURE_NAMES)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Optional, Sequence, Union
+
+import numpy as np
+
+from kenobase.core.data_loader import DrawResult
+from kenobase.features.extractor import FeatureExtractor, FeatureVector
+
+logger = logging.getLogger(__name__)
+
+# Tier-Codes im Tensor (uint8-Index in dieses Tupel)
+TIER_CODES: tuple[str, ...] = ("A", "B", "C")
+
+DateLike = Union[str, date, datetime, np.datetime64]
+
+
+def to_day(value: DateLike) -> np.datetime64:
+    """Normalisiert ein Datum auf np.datetime64 mit Tagesaufloesung."""
+    if isinstance(value, datetime):
+        value = value.date()
+    return np.datetime64(value, "D")
+
+
+def history_digests(draws: Sequence[DrawResult]) -> np.ndarray:
+    """Kumulative Fingerprints der Ziehungshistorie.
+
+    digests[i] haengt von Tag und Zahlen aller Ziehungen draws[0..i] ab
+    (verkettetes BLAKE2b, 8 Byte). Gleiche Werte bedeuten dieselbe
+    Historie; ein Prefix der Liste hat dieselben Prefix-Digests.
+
+    Args:
+        draws: Ziehungen in chronologischer Reihenfolge
+
+    Returns:
+        (len(draws),) uint64
+    """
+    digests = np.empty(len(draws), dtype=np.uint64)
+    state = b""
+    for i, draw in enumerate(draws):
+        numbers = ",".join(map(str, sorted(draw.numbers)))
+        state = hashlib.blake2b(
+            state + f"{to_day(draw.date)}|{numbers}".encode(), digest_size=8
+        ).digest()
+        digests[i] = int.from_bytes(state, "little")
+    return digests
+
+
+@dataclass
+class FeatureSnapshots:
+    """Feature-Tensor ueber Ziehungstage.
+
+    Attributes:
+        dates: (T,) datetime64[D], streng aufsteigend
+        numbers: (N,) Zahlen (z.B. 1-70)
+        feature_names: Namen der F Feature-Kanaele
+        values: (T, N, F) float32, NaN = Feature fehlt im Vektor
+        combined_scores: (T, N) float32
+        tiers: (T, N) uint8, Index in TIER_CODES
+        origin: Datum der ersten Kontext-Ziehung (None = unbekannt)
+        draw_counts: (T,) int64, Anzahl Kontext-Ziehungen je Tag (None = unbekannt)
+        history: (T,) uint64, history_digests der letzten Kontext-Ziehung je Tag
+        extractor_settings: FeatureExtractor.settings beim Erstellen (None = unbekannt)
+    """
+
+    dates: np.ndarray
+    numbers: np.ndarray
+    feature_names: list[str]
+    values: np.ndarray
+    combined_scores: np.ndarray
+    tiers: np.ndarray
+    origin: Optional[np.datetime64] = None
+    draw_counts: Optional[np.ndarray] = None
+    history: Optional[np.ndarray] = None
+    extractor_settings: Optional[dict[str, Any]] = None
+
+    def __post_init__(self) -> None:
+        t, n, f = len(self.dates), len(self.numbers), len(self.feature_names)
+        if self.values.shape != (t, n, f):
+            raise ValueError(f"values shape {self.values.shape} != {(t, n, f)}")
+        if self.combined_scores.shape != (t, n) or self.tiers.shape != (t, n):
+            raise ValueError("combined_scores/tiers must have shape (dates, numbers)")
+        if t > 1 and not (np.diff(self.dates) > np.timedelta64(0, "D")).all():
+            raise ValueError("Snapshot dates must be strictly increasing")
+        for name in ("draw_counts", "history"):
+            column = getattr(self, name)
+            if column is not None and column.shape != (t,):
+                raise ValueError(f"{name} must have shape (dates,)")
+
+    @property
+    def has_history(self) -> bool:
+        """True wenn Ziehungsanzahl und Historien-Fingerprint je Tag vorliegen."""
+        return self.draw_counts is not None and self.history is not None
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def first_date(self) -> Optional[np.datetime64]:
+        """Erster Snapshot-Tag (None wenn leer)."""
+        return self.dates[0] if len(self.dates) else None
+
+    @property
+    def last_date(self) -> Optional[np.datetime64]:
+        """Letzter Snapshot-Tag (None wenn leer)."""
+        return self.dates[-1] if len(self.dates) else None
+
+    def index_of(self, when: DateLike, exact: bool = False) -> int:
+        """Index des letzten Snapshots mit Datum <= when.
+
+        Args:
+            when: Stichtag
+            exact: Nur einen Snapshot genau an diesem Tag akzeptieren
+
+        Returns:
+            Zeilenindex in dates
+
+        Raises:
+            KeyError: Wenn kein (passender) Snapshot existiert
+        """
+        day = to_day(when)
+        idx = int(np.searchsorted(self.dates, day, side="right")) - 1
+        if idx < 0 or (exact and self.dates[idx] != day):
+            raise KeyError(f"No feature snapshot {'at' if exact else 'as of'} {day}")
+        return idx
+
+    def verified_index(
+        self,
+        when: DateLike,
+        draw_count: int,
+        digest: int,
+        extractor_settings: Optional[dict[str, Any]] = None,
+    ) -> Optional[int]:
+        """Index des Snapshots genau am Tag when, falls er aus derselben Historie stammt.
+
+        Args:
+            when: Tag der letzten Kontext-Ziehung
+            draw_count: Anzahl Kontext-Ziehungen bis einschliesslich when
+            digest: history_digests-Wert der letzten Kontext-Ziehung
+            extractor_settings: FeatureExtractor.settings des Aufrufers; wenn
+                angegeben, muessen sie mit denen der Reihe uebereinstimmen
+
+        Returns:
+            Zeilenindex oder None (kein Snapshot an dem Tag, keine Historie
+            gespeichert, Anzahl/Fingerprint oder Einstellungen weichen ab)
+        """
+        if not self.has_history:
+            return None
+        if extractor_settings is not None and self.extractor_settings != extractor_settings:
+            return None
+        try:
+            idx = self.index_of(when, exact=True)
+        except KeyError:
+            return None
+        if int(self.draw_counts[idx]) != draw_count or int(self.history[idx]) != int(digest):
+            return None
+        return idx
+
+    def as_of(self, when: DateLike) -> dict[int, FeatureVector]:
+        """Point-in-Time-Abfrage: Feature-Vektoren des letzten Snapshots <= when.
+
+        Args:
+            when: Stichtag
+
+        Returns:
+            Dict mit Zahl -> FeatureVector (wie FeatureExtractor.extract)
+        """
+        idx = self.index_of(when)
+        values = np.asarray(self.values[idx], dtype=np.float64)
+        scores = np.asarray(self.combined_scores[idx], dtype=np.float64)
+        snapshot_day = str(self.dates[idx])
+
+        vectors: dict[int, FeatureVector] = {}
+        for j, num in enumerate(self.numbers.tolist()):
+            row = values[j]
+            vectors[num] = FeatureVector(
+                number=num,
+                features={
+                    name: float(row[k])
+                    for k, name in enumerate(self.feature_names)
+                    if not np.isnan(row[k])
+                },
+                combined_score=float(scores[j]),
+                tier=TIER_CODES[int(self.tiers[idx, j])],
+                metadata={"snapshot_date": snapshot_day},
+            )
+        return vectors
+
+    def matrix(
+        self,
+        when: DateLike,
+        feature_names: Optional[Sequence[str]] = None,
+        exact: bool = False,
+    ) -> np.ndarray:
+        """Feature-Matrix (Zahlen x Features) eines Snapshots.
+
+        Fehlende Features (NaN bzw. unbekannte Namen) werden wie bei
+        `vec.features.get(name, 0.0)` als 0.0 geliefert.
+
+        Args:
+            when: Stichtag
+            feature_names: Spaltenreihenfolge (default: self.feature_names)
+            exact: Siehe index_of
+
+        Returns:
+            (N, len(feature_names)) float32
+        """
+        row = np.asarray(self.values[self.index_of(when, exact=exact)], dtype=np.float32)
+        if feature_names is None:
+            return np.nan_to_num(row, nan=0.0)
+
+        out = np.zeros((len(self.numbers), len(feature_names)), dtype=np.float32)
+        position = {name: k for k, name in enumerate(self.feature_names)}
+        for k, name in enumerate(feature_names):
+            if name in position:
+                out[:, k] = row[:, position[name]]
+        return np.nan_to_num(out, nan=0.0)
+
+    def between(
+        self,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+    ) -> "FeatureSnapshots":
+        """Snapshots mit start <= Datum <= end (Views, keine Kopie)."""
+        lo = 0 if start is None else int(np.searchsorted(self.dates, to_day(start), "left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.dates, to_day(end), "right"))
+        return FeatureSnapshots(
+            dates=self.dates[lo:hi],
+            numbers=self.numbers,
+            feature_names=self.feature_names,
+            values=self.values[lo:hi],
+            combined_scores=self.combined_scores[lo:hi],
+            tiers=self.tiers[lo:hi],
+            origin=self.origin,
+            draw_counts=self.draw_counts[lo:hi] if self.draw_counts is not None else None,
+            history=self.history[lo:hi] if self.history is not None else None,
+            extractor_settings=self.extractor_settings,
+        )
+
+
+def build_feature_snapshots(
+    draws: list[DrawResult],
+    extractor: Optional[FeatureExtractor] = None,
+    feature_names: Optional[Sequence[str]] = None,
+    after: Optional[DateLike] = None,
+) -> FeatureSnapshots:
+    """Berechnet Walk-Forward-Snapshots fuer chronologisch sortierte Ziehungen.
+
+    Pro Ziehungstag D wird extractor.extract(draws bis einschliesslich D)
+    gespeichert; bei mehreren Ziehungen am selben Tag zaehlt der Stand
+    nach der letzten.
+
+    Args:
+        draws: Ziehungen in chronologischer Reihenfolge
+        extractor: FeatureExtractor (default: FeatureExtractor())
+        feature_names: Feature-Kanaele (default: Reihenfolge des ersten Snapshots)
+        after: Nur Snapshots fuer Tage > after berechnen (inkrementelles Update)
+
+    Returns:
+        FeatureSnapshots (origin = Datum der ersten Ziehung, extractor_settings
+        = extractor.settings)
+
+    Raises:
+        ValueError: Wenn draws leer oder nicht chronologisch sortiert sind
+    """
+    if not draws:
+        raise ValueError("No draws provided")
+    extractor = extractor or FeatureExtractor()
+
+    days = np.array([to_day(d.date) for d in draws])
+    if len(days) > 1 and (np.diff(days) < np.timedelta64(0, "D")).any():
+        raise ValueError("Draws must be sorted by date")
+
+    # Letzte Ziehung je Tag, optional nur Tage nach `after`
+    last_of_day = np.flatnonzero(np.append(days[1:] != days[:-1], True))
+    if after is not None:
+        last_of_day = last_of_day[days[last_of_day] > to_day(after)]
+
+    low, high = extractor.numbers_range
+    numbers = np.arange(low, high + 1, dtype=np.int64)
+    names = list(feature_names) if feature_names is not None else None
+    values = scores = tiers = None
+
+    for t, idx in enumerate(last_of_day.tolist()):
+        vectors = extractor.extract(draws[: idx + 1])
+        if names is None:
+            names = list(vectors[int(numbers[0])].features)
+        if values is None:
+            values = np.full((len(last_of_day), len(numbers), len(names)), np.nan, np.float32)
+            scores = np.zeros((len(last_of_day), len(numbers)), dtype=np.float32)
+            tiers = np.zeros((len(last_of_day), len(numbers)), dtype=np.uint8)
+        for j, num in enumerate(numbers.tolist()):
+            vec = vectors[num]
+            values[t, j] = [vec.features.get(name, np.nan) for name in names]
+            scores[t, j] = vec.combined_score
+            tiers[t, j] = TIER_CODES.index(vec.tier)
+
+    if values is None:
+        names = names or []
+        values = np.zeros((0, len(numbers), len(names)), dtype=np.float32)
+        scores = np.zeros((0, len(numbers)), dtype=np.float32)
+        tiers = np.zeros((0, len(numbers)), dtype=np.uint8)
+
+    logger.info(f"Built {len(last_of_day)} feature snapshots ({len(names)} features)")
+    return FeatureSnapshots(
+        dates=days[last_of_day],
+        numbers=numbers,
+        feature_names=names,
+        values=values,
+        combined_scores=scores,
+        tiers=tiers,
+        origin=days[0],
+        draw_counts=(last_of_day + 1).astype(np.int64),
+        history=history_digests(draws)[last_of_day],
+        extractor_settings=extractor.settings,
+    )
+
+
+__all__ = [
+    "TIER_CODES",
+    "FeatureSnapshots",
+    "build_feature_snapshots",
+    "history_digests",
+]
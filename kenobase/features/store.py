@@ -5,24 +5,48 @@ persistent speichert und laedt. Unterstuetzte Formate:
 - JSON: Menschenlesbar, gut fuer Debugging
 - Pickle: Schnell, gut fuer Produktion
 - Parquet: Effizient fuer grosse Datensaetze
+
+Zusaetzlich speichert er Walk-Forward-Snapshots (FeatureSnapshots) als
+Verzeichnis `<name>.snapshots/` mit float32-Chunks (memory-mapped .npy):
+Point-in-Time-Abfragen (`as_of`) und Bereichs-Abfragen lesen nur die
+betroffenen Chunks, neue Tage werden per `append_snapshots` angehaengt.
+Neben `dates.npy` liegen `draw_counts.npy` und `history.npy` (Anzahl und
+Fingerprint der Kontext-Ziehungen je Tag), das Manifest haelt die
+Extractor-Einstellungen; damit koennen Konsumenten pruefen, ob ein
+Snapshot aus ihrer Ziehungshistorie und mit ihrem Extractor entstand.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
 import pickle
+import shutil
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
-from kenobase.features.extractor import FeatureVector
+from kenobase.core.data_loader import DrawResult
+from kenobase.features.extractor import FeatureExtractor, FeatureVector
+from kenobase.features.snapshots import (
+    DateLike,
+    FeatureSnapshots,
+    build_feature_snapshots,
+    history_digests,
+    to_day,
+)
 
 logger = logging.getLogger(__name__)
 
+SNAPSHOT_FORMAT_VERSION = "snapshots-1.0"
+DEFAULT_SNAPSHOT_CHUNK = 256  # Tage pro Chunk-Datei
+_SNAPSHOT_SUFFIX = ".snapshots"
+
 
 class StorageFormat(str, Enum):
     """Unterstuetzte Speicherformate."""
@@ -248,6 +272,7 @@ class FeatureStore:
         for ext in ["json", "pkl", "parquet"]:
             for path in self.base_dir.glob(f"*.{ext}"):
                 names.add(path.stem)
+        names.update(self.list_snapshots())
         return sorted(names)
 
     def exists(self, name: str) -> bool:
@@ -262,7 +287,7 @@ class FeatureStore:
         for ext in ["json", "pkl", "parquet"]:
             if (self.base_dir / f"{name}.{ext}").exists():
                 return True
-        return False
+        return self.has_snapshots(name)
 
     def delete(self, name: str) -> bool:
         """Loescht ein Feature-Set.
@@ -286,8 +311,360 @@ class FeatureStore:
         if meta_path.exists():
             meta_path.unlink()
 
+        snapshot_dir = self._snapshot_dir(name)
+        if snapshot_dir.exists():
+            shutil.rmtree(snapshot_dir)
+            deleted = True
+            logger.info(f"Deleted {snapshot_dir}")
+
         return deleted
 
+    # ------------------------------------------------------------------
+    # Walk-Forward-Snapshots
+    # ------------------------------------------------------------------
+
+    def _snapshot_dir(self, name: str) -> Path:
+        return self.base_dir / f"{name}{_SNAPSHOT_SUFFIX}"
+
+    def _read_snapshot_manifest(self, name: str) -> dict:
+        path = self._snapshot_dir(name) / "manifest.json"
+        if not path.exists():
+            raise FileNotFoundError(f"No feature snapshots found for: {name}")
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def list_snapshots(self) -> list[str]:
+        """Listet alle gespeicherten Snapshot-Reihen.
+
+        Returns:
+            Liste von Namen
+        """
+        return sorted(
+            path.parent.name[: -len(_SNAPSHOT_SUFFIX)]
+            for path in self.base_dir.glob(f"*{_SNAPSHOT_SUFFIX}/manifest.json")
+        )
+
+    def has_snapshots(self, name: str) -> bool:
+        """Prueft ob eine Snapshot-Reihe existiert."""
+        return (self._snapshot_dir(name) / "manifest.json").exists()
+
+    def save_snapshots(
+        self,
+        snapshots: FeatureSnapshots,
+        name: str,
+        chunk_size: int = DEFAULT_SNAPSHOT_CHUNK,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> Path:
+        """Speichert eine Snapshot-Reihe (ersetzt eine vorhandene).
+
+        Args:
+            snapshots: FeatureSnapshots
+            name: Name der Reihe
+            chunk_size: Tage pro Chunk-Datei
+            metadata: Zusaetzliche Metadaten
+
+        Returns:
+            Pfad zum Snapshot-Verzeichnis
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+
+        directory = self._snapshot_dir(name)
+        if directory.exists():
+            shutil.rmtree(directory)
+        directory.mkdir(parents=True)
+
+        manifest = {
+            "name": name,
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "dtype": "float32",
+            "chunk_size": chunk_size,
+            "numbers": snapshots.numbers.tolist(),
+            "feature_names": list(snapshots.feature_names),
+            "origin": str(snapshots.origin) if snapshots.origin is not None else None,
+            "extractor_settings": snapshots.extractor_settings,
+            "n_dates": 0,
+            "n_chunks": 0,
+            "metadata": metadata or {},
+        }
+        self._write_snapshot_rows(directory, manifest, snapshots)
+        logger.info(f"Saved {len(snapshots)} feature snapshots to {directory}")
+        return directory
+
+    def append_snapshots(self, snapshots: FeatureSnapshots, name: str) -> int:
+        """Haengt neue Tage an eine gespeicherte Snapshot-Reihe an.
+
+        Tage <= dem letzten gespeicherten Tag werden uebersprungen. Nur der
+        letzte (unvollstaendige) Chunk wird neu geschrieben.
+
+        Args:
+            snapshots: FeatureSnapshots mit (auch) neuen Tagen
+            name: Name der Reihe
+
+        Returns:
+            Anzahl angehaengter Tage
+
+        Raises:
+            FileNotFoundError: Wenn die Reihe nicht existiert
+            ValueError: Wenn Zahlen, Features, origin oder Extractor-Einstellungen
+                nicht passen
+        """
+        manifest = self._read_snapshot_manifest(name)
+        if (
+            manifest["numbers"] != snapshots.numbers.tolist()
+            or manifest["feature_names"] != list(snapshots.feature_names)
+        ):
+            raise ValueError(f"Snapshot layout of '{name}' does not match (numbers/features)")
+        stored_origin = manifest.get("origin")
+        if snapshots.origin is not None and stored_origin not in (None, str(snapshots.origin)):
+            raise ValueError(
+                f"Snapshot origin mismatch for '{name}': {stored_origin} != {snapshots.origin}"
+            )
+        if manifest.get("extractor_settings") != snapshots.extractor_settings:
+            raise ValueError(f"Extractor settings of '{name}' do not match the stored series")
+
+        last = manifest.get("last")
+        new = snapshots if last is None else snapshots.between(start=to_day(last) + 1)
+        if len(new) == 0:
+            return 0
+
+        self._write_snapshot_rows(self._snapshot_dir(name), manifest, new)
+        logger.info(f"Appended {len(new)} feature snapshots to '{name}'")
+        return len(new)
+
+    def _write_snapshot_rows(
+        self,
+        directory: Path,
+        manifest: dict,
+        new: FeatureSnapshots,
+    ) -> None:
+        """Schreibt neue Zeilen in Chunks und danach (atomar) das Manifest."""
+        chunk_size = manifest["chunk_size"]
+        n_old = manifest["n_dates"]
+
+        dates_path = directory / "dates.npy"
+        old_dates = np.load(dates_path) if n_old else np.array([], dtype="datetime64[D]")
+        dates = np.concatenate([old_dates, new.dates.astype("datetime64[D]")])
+
+        values = np.concatenate(
+            [new.values, new.combined_scores[..., None]], axis=2
+        ).astype(np.float32)
+        tiers = np.asarray(new.tiers, dtype=np.uint8)
+
+        # Angefangenen letzten Chunk auffuellen, danach neue Chunks
+        first_chunk = n_old // chunk_size
+        if n_old % chunk_size:
+            head_values = np.load(directory / f"chunk-{first_chunk:05d}.values.npy")
+            head_tiers = np.load(directory / f"chunk-{first_chunk:05d}.tiers.npy")
+            values = np.concatenate([head_values, values])
+            tiers = np.concatenate([head_tiers, tiers])
+
+        for start in range(0, len(values), chunk_size):
+            chunk = first_chunk + start // chunk_size
+            _atomic_save(
+                directory / f"chunk-{chunk:05d}.values.npy", values[start : start + chunk_size]
+            )
+            _atomic_save(
+                directory / f"chunk-{chunk:05d}.tiers.npy", tiers[start : start + chunk_size]
+            )
+        _atomic_save(dates_path, dates)
+
+        # Historie nur behalten, wenn sie fuer alle Zeilen vorliegt
+        has_history = new.has_history and (n_old == 0 or manifest.get("has_history", False))
+        if has_history:
+            for column in ("draw_counts", "history"):
+                path = directory / f"{column}.npy"
+                old = np.load(path) if n_old else np.array([], dtype=getattr(new, column).dtype)
+                _atomic_save(path, np.concatenate([old, getattr(new, column)]))
+        else:
+            for column in ("draw_counts", "history"):
+                (directory / f"{column}.npy").unlink(missing_ok=True)
+
+        manifest.update(
+            has_history=has_history,
+            timestamp=datetime.now().isoformat(),
+            n_dates=len(dates),
+            n_chunks=-(-len(dates) // chunk_size),
+            first=str(dates[0]) if len(dates) else None,
+            last=str(dates[-1]) if len(dates) else None,
+        )
+        tmp = directory / "manifest.json.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp, directory / "manifest.json")
+
+    def load_snapshots(
+        self,
+        name: str,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        mmap: bool = True,
+    ) -> FeatureSnapshots:
+        """Laedt eine Snapshot-Reihe oder einen Datumsbereich daraus.
+
+        Es werden nur die Chunks gelesen, die [start, end] ueberlappen; mit
+        mmap=True sind die Arrays (bei einem einzigen Chunk) read-only Views
+        auf die Dateien.
+
+        Args:
+            name: Name der Reihe
+            start: Erster Tag (inklusive, optional)
+            end: Letzter Tag (inklusive, optional)
+            mmap: Chunks memory-mapped oeffnen
+
+        Returns:
+            FeatureSnapshots
+
+        Raises:
+            FileNotFoundError: Wenn die Reihe nicht existiert
+        """
+        manifest = self._read_snapshot_manifest(name)
+        directory = self._snapshot_dir(name)
+        chunk_size = manifest["chunk_size"]
+        numbers = np.array(manifest["numbers"], dtype=np.int64)
+        feature_names = list(manifest["feature_names"])
+        n_features = len(feature_names)
+
+        dates = self.snapshot_dates(name)
+        lo = 0 if start is None else int(np.searchsorted(dates, to_day(start), "left"))
+        hi = len(dates) if end is None else int(np.searchsorted(dates, to_day(end), "right"))
+
+        mmap_mode = "r" if mmap else None
+        value_parts, tier_parts = [], []
+        if hi > lo:
+            for chunk in range(lo // chunk_size, (hi - 1) // chunk_size + 1):
+                base = chunk * chunk_size
+                rows = slice(max(lo - base, 0), min(hi - base, chunk_size))
+                stem = directory / f"chunk-{chunk:05d}"
+                value_parts.append(np.load(f"{stem}.values.npy", mmap_mode=mmap_mode)[rows])
+                tier_parts.append(np.load(f"{stem}.tiers.npy", mmap_mode=mmap_mode)[rows])
+
+        if len(value_parts) == 1:
+            values, tiers = value_parts[0], tier_parts[0]
+        elif value_parts:
+            values, tiers = np.concatenate(value_parts), np.concatenate(tier_parts)
+        else:
+            values = np.zeros((0, len(numbers), n_features + 1), dtype=np.float32)
+            tiers = np.zeros((0, len(numbers)), dtype=np.uint8)
+
+        draw_counts = history = None
+        if manifest.get("has_history") and manifest["n_dates"]:
+            draw_counts = np.load(directory / "draw_counts.npy")[lo:hi]
+            history = np.load(directory / "history.npy")[lo:hi]
+
+        origin = manifest.get("origin")
+        return FeatureSnapshots(
+            dates=dates[lo:hi],
+            numbers=numbers,
+            feature_names=feature_names,
+            values=values[:, :, :n_features],
+            combined_scores=values[:, :, n_features],
+            tiers=tiers,
+            origin=np.datetime64(origin, "D") if origin else None,
+            draw_counts=draw_counts,
+            history=history,
+            extractor_settings=manifest.get("extractor_settings"),
+        )
+
+    def snapshot_dates(self, name: str) -> np.ndarray:
+        """Gespeicherte Snapshot-Tage (datetime64[D])."""
+        manifest = self._read_snapshot_manifest(name)
+        if not manifest["n_dates"]:
+            return np.array([], dtype="datetime64[D]")
+        return np.load(self._snapshot_dir(name) / "dates.npy")
+
+    def as_of(self, name: str, when: DateLike) -> dict[int, FeatureVector]:
+        """Point-in-Time-Abfrage aus einer gespeicherten Reihe.
+
+        Liest nur den Chunk des letzten Snapshots <= when.
+
+        Args:
+            name: Name der Reihe
+            when: Stichtag
+
+        Returns:
+            Dict mit Zahl -> FeatureVector
+
+        Raises:
+            KeyError: Wenn es keinen Snapshot <= when gibt
+        """
+        dates = self.snapshot_dates(name)
+        idx = int(np.searchsorted(dates, to_day(when), side="right")) - 1
+        if idx < 0:
+            raise KeyError(f"No feature snapshot as of {to_day(when)} in '{name}'")
+        return self.load_snapshots(name, start=dates[idx], end=dates[idx]).as_of(when)
+
+    def sync_snapshots(
+        self,
+        name: str,
+        draws: list[DrawResult],
+        extractor: Optional[FeatureExtractor] = None,
+        chunk_size: int = DEFAULT_SNAPSHOT_CHUNK,
+    ) -> FeatureSnapshots:
+        """Bringt eine Snapshot-Reihe auf den Stand von draws und laedt sie.
+
+        Existiert die Reihe, werden nur Tage nach dem letzten gespeicherten
+        Snapshot berechnet und angehaengt; sonst wird sie komplett erstellt.
+        Reihen ohne gespeicherte Historie (aeltere Versionen) oder mit
+        anderen Extractor-Einstellungen werden neu erstellt.
+
+        Args:
+            name: Name der Reihe
+            draws: Ziehungen in chronologischer Reihenfolge (gleiche Historie)
+            extractor: FeatureExtractor (default: FeatureExtractor())
+            chunk_size: Tage pro Chunk (nur bei Neuanlage)
+
+        Returns:
+            Vollstaendige FeatureSnapshots der Reihe
+
+        Raises:
+            ValueError: Wenn die gespeicherte Reihe aus einer anderen Historie
+                stammt (erste Ziehung, Anzahl oder Fingerprint bis zum letzten Tag)
+        """
+        if not self.has_snapshots(name):
+            self.save_snapshots(build_feature_snapshots(draws, extractor), name, chunk_size)
+            return self.load_snapshots(name)
+
+        extractor = extractor or FeatureExtractor()
+        manifest = self._read_snapshot_manifest(name)
+        rebuild_reason = None
+        if manifest.get("extractor_settings") != extractor.settings:
+            rebuild_reason = "uses other extractor settings"
+        elif manifest["n_dates"] and not manifest.get("has_history"):
+            rebuild_reason = "has no history fingerprints"
+        if rebuild_reason is not None:
+            logger.info(f"Snapshot series '{name}' {rebuild_reason}, rebuilding")
+            self.save_snapshots(
+                build_feature_snapshots(draws, extractor, feature_names=manifest["feature_names"]),
+                name,
+                manifest["chunk_size"],
+                manifest.get("metadata"),
+            )
+            return self.load_snapshots(name)
+
+        last = manifest.get("last")
+        if last is not None:
+            stored = self.load_snapshots(name, start=last, end=last)
+            days = np.array([to_day(d.date) for d in draws], dtype="datetime64[D]")
+            count = int(np.searchsorted(days, to_day(last), side="right"))
+            if (
+                count != int(stored.draw_counts[-1])
+                or int(history_digests(draws[:count])[-1]) != int(stored.history[-1])
+            ):
+                raise ValueError(
+                    f"Snapshot series '{name}' was built from a different draw history "
+                    f"up to {last}; rebuild it with save_snapshots"
+                )
+
+        new = build_feature_snapshots(
+            draws,
+            extractor,
+            feature_names=manifest["feature_names"],
+            after=manifest.get("last"),
+        )
+        self.append_snapshots(new, name)
+        return self.load_snapshots(name)
+
     def to_dataframe(self, features: dict[int, FeatureVector]) -> pd.DataFrame:
         """Konvertiert Features zu DataFrame.
 
@@ -312,7 +689,16 @@ class FeatureStore:
         return df
 
 
+def _atomic_save(path: Path, array: np.ndarray) -> None:
+    """np.save ueber eine temporaere Datei plus os.replace."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, np.ascontiguousarray(array))
+    os.replace(tmp, path)
+
+
 __all__ = [
     "FeatureStore",
     "StorageFormat",
+    "SNAPSHOT_FORMAT_VERSION",
 ]
@@ -1,5 +1,13 @@
 """Pipeline module - Runner, Least Action, Validators, Output Formats, Validation Metrics."""
 
+from kenobase.pipeline.hypothesis_batch import (
+    BatchInputs,
+    BatchResult,
+    HypothesisRunReport,
+    HypothesisSpec,
+    run_hypothesis_batch,
+)
+
 from kenobase.pipeline.least_action import (
     DEFAULT_PIPELINE_VARIANTS,
     PipelineSelector,
@@ -13,6 +21,8 @@ from kenobase.pipeline.output_formats import (
     OutputFormatter,
     format_output,
     get_supported_formats,
+    write_csv_records,
+    write_jsonl,
 )
 from kenobase.pipeline.runner import (
     PhysicsResult,
@@ -43,12 +53,16 @@ from kenobase.pipeline.validation_metrics import (
 __all__ = [
     "AntiClusterStrategy",
     "BacktestStrategy",
+    "BatchInputs",
+    "BatchResult",
     "ColdNumberStrategy",
     "CompositeStrategy",
     "DEFAULT_PIPELINE_VARIANTS",
     "FormatterConfig",
     "HotNumberAntiClusterStrategy",
     "HotNumberStrategy",
+    "HypothesisRunReport",
+    "HypothesisSpec",
     "OutputFormat",
     "OutputFormatter",
     "PhysicsResult",
@@ -69,5 +83,8 @@ __all__ = [
     "create_variant_from_analysis_config",
     "format_output",
     "get_supported_formats",
+    "run_hypothesis_batch",
     "run_pipeline",
+    "write_csv_records",
+    "write_jsonl",
 ]
@@ -0,0 +1,469 @@
+"""Hypothesis Batch Runner - Mehrere HYP-Analysen parallel mit geteilten Eingaben.
+
+Die analyze_hyp0XX.py / validate_*.py Skripte laden jeweils dieselben
+KENO-, GQ- und GK1-Dateien und fuehren danach genau ein Analysemodul aus.
+Der Batch-Runner:
+
+- laedt die KENO-Ziehungen genau einmal im Elternprozess als unveraenderliche
+  DrawCollection; Worker erben sie per fork (copy-on-write) bzw. erhalten sie
+  einmal pro Worker (spawn)
+- fuehrt die gewaehlten Hypothesen parallel in einem ProcessPoolExecutor aus
+- schreibt alle Ergebnis-JSONs erst am Ende (atomar)
+- misst pro Hypothese Wall-Time und Peak-Memory (tracemalloc)
+- ueberspringt Hypothesen, deren Eingabedateien und Code-Hash unveraendert
+  sind: Ergebnisse laufen ueber den ResultCache (default
+  `<output_dir>/.cache`) und werden von dort veroeffentlicht, sodass
+  ResultCache.artifact_status sie als fresh/stale erkennt
+
+Usage:
+    from kenobase.pipeline.hypothesis_batch import BatchInputs, run_hypothesis_batch
+
+    result = run_hypothesis_batch(
+        ["HYP-004", "HYP-010", "HYP-015"],
+        inputs=BatchInputs(keno_path="data/raw/keno/KENO_ab_2018.csv"),
+        output_dir="results/batch",
+        max_workers=4,
+    )
+    for report in result.reports:
+        print(report.hypothesis_id, report.status, report.wall_time_s)
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import multiprocessing
+import os
+import time
+import tracemalloc
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field, is_dataclass
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from kenobase.core.data_loader import DataLoader
+from kenobase.core.profiling import profiled
+from kenobase.core.result_cache import CacheKey, ResultCache, file_digest
+
+logger = logging.getLogger(__name__)
+
+# Dataset-Keys, die als geladene Objekte (statt als Pfad) uebergeben werden
+LOADED_DATASETS = frozenset({"keno"})
+
+
+@dataclass(frozen=True)
+class BatchInputs:
+    """Pfade der geteilten Eingabedaten.
+
+    Attributes:
+        keno_path: KENO-Ziehungen (wird einmal geladen und geteilt)
+        gq_path: Gewinnquoten (GQ) CSV
+        gk1_path: GK1-Daten (10-9_KGDaten_gefiltert.csv)
+        stake_path: Spieleinsatz-/Restbetrag-Daten
+    """
+
+    keno_path: str = "data/raw/keno/KENO_ab_2018.csv"
+    gq_path: str = "Keno_GPTs/Keno_GQ_2022_2023-2024.csv"
+    gk1_path: str = "Keno_GPTs/10-9_KGDaten_gefiltert.csv"
+    stake_path: str = "Keno_GPTs/Keno_Ziehung2023_+_Restbetrag_v2.CSV"
+
+    def path_for(self, dataset: str) -> Path:
+        """Pfad eines Datasets ("keno", "gq", "gk1", "stake")."""
+        try:
+            return Path(getattr(self, f"{dataset}_path"))
+        except AttributeError:
+            raise KeyError(f"Unknown dataset: {dataset}") from None
+
+
+@dataclass(frozen=True)
+class HypothesisSpec:
+    """Beschreibung einer batch-faehigen Hypothesen-Analyse.
+
+    Attributes:
+        hypothesis_id: z.B. "HYP-010"
+        target: "modul:funktion" der Analysefunktion (picklebar per Name)
+        arguments: Funktionsparameter -> Dataset-Key (z.B. {"draws": "keno"})
+        output_name: Dateiname der Ergebnis-JSON im Ausgabeverzeichnis
+        kwargs: Zusaetzliche feste Parameter
+    """
+
+    hypothesis_id: str
+    target: str
+    arguments: dict[str, str]
+    output_name: str
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def datasets(self) -> tuple[str, ...]:
+        """Benoetigte Dataset-Keys (sortiert)."""
+        return tuple(sorted(set(self.arguments.values())))
+
+    def resolve(self) -> Callable[..., Any]:
+        """Importiert die Analysefunktion."""
+        module_name, func_name = self.target.split(":")
+        return getattr(importlib.import_module(module_name), func_name)
+
+
+HYPOTHESIS_REGISTRY: dict[str, HypothesisSpec] = {
+    spec.hypothesis_id: spec
+    for spec in (
+        HypothesisSpec(
+            "HYP-002",
+            "kenobase.analysis.gk1_waiting:run_hyp002_waiting_analysis",
+            {"data_path": "gk1"},
+            "hyp002_gk1_waiting.json",
+        ),
+        HypothesisSpec(
+            "HYP-004",
+            "kenobase.analysis.popularity_correlation:run_hyp004_analysis",
+            {"draws": "keno", "gq_path": "gq"},
+            "hyp004_popularity_correlation.json",
+        ),
+        HypothesisSpec(
+            "HYP-010",
+            "kenobase.analysis.odds_correlation:run_hyp010_analysis",
+            {"draws": "keno", "gq_path": "gq"},
+            "hyp010_odds_correlation.json",
+        ),
+        HypothesisSpec(
+            "HYP-012",
+            "kenobase.analysis.stake_correlation:run_hyp012_analysis",
+            {"stake_path": "stake"},
+            "hyp012_stake_correlation.json",
+        ),
+        HypothesisSpec(
+            "HYP-015",
+            "kenobase.analysis.jackpot_correlation:run_hyp015_analysis",
+            {"draws": "keno", "gk1_path": "gk1"},
+            "hyp015_jackpot_correlation.json",
+        ),
+        HypothesisSpec(
+            "HOUSE-003",
+            "kenobase.analysis.house_edge_stability:run_house003_analysis",
+            {"stake_path": "stake"},
+            "house003_rolling_stability.json",
+        ),
+    )
+}
+
+
+@dataclass
+class HypothesisRunReport:
+    """Ergebnis eines einzelnen Hypothesen-Laufs.
+
+    Attributes:
+        hypothesis_id: Hypothesen-ID
+        status: "ok", "skipped" oder "error"
+        wall_time_s: Laufzeit der Analysefunktion in Sekunden
+        peak_memory_mb: Peak der Python-Allokationen (tracemalloc) in MB
+        output_path: Geschriebene/vorhandene Ergebnisdatei
+        fingerprint: ResultCache-Schluessel (Hash aus Code, Parametern und Eingabedaten)
+        error: Fehlermeldung bei status="error"
+    """
+
+    hypothesis_id: str
+    status: str
+    wall_time_s: float = 0.0
+    peak_memory_mb: float = 0.0
+    output_path: Optional[str] = None
+    fingerprint: str = ""
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchResult:
+    """Gesamtergebnis eines Batch-Laufs."""
+
+    reports: list[HypothesisRunReport]
+    total_wall_time_s: float
+    load_time_s: float
+    output_dir: str
+
+    @property
+    def n_ok(self) -> int:
+        return sum(1 for r in self.reports if r.status == "ok")
+
+    @property
+    def n_skipped(self) -> int:
+        return sum(1 for r in self.reports if r.status == "skipped")
+
+    @property
+    def n_errors(self) -> int:
+        return sum(1 for r in self.reports if r.status == "error")
+
+    def to_dict(self) -> dict:
+        """Serialisierbare Darstellung."""
+        return {
+            "output_dir": self.output_dir,
+            "total_wall_time_s": round(self.total_wall_time_s, 3),
+            "load_time_s": round(self.load_time_s, 3),
+            "n_ok": self.n_ok,
+            "n_skipped": self.n_skipped,
+            "n_errors": self.n_errors,
+            "reports": [asdict(r) for r in self.reports],
+        }
+
+
+# ----------------------------------------------------------------------
+# Fingerprints
+# ----------------------------------------------------------------------
+
+
+def spec_key(cache: ResultCache, spec: HypothesisSpec, paths: dict[str, str]) -> CacheKey:
+    """ResultCache-Schluessel einer Hypothese.
+
+    Args:
+        cache: ResultCache
+        spec: HypothesisSpec
+        paths: Dataset-Key -> Pfad
+
+    Returns:
+        CacheKey aus Analysemodul, Zielfunktion, festen Parametern und
+        den Hashes der benoetigten Eingabedateien.
+    """
+    return cache.make_key(
+        spec.target.split(":")[0],
+        inputs={dataset: paths[dataset] for dataset in spec.datasets},
+        params={"target": spec.target, "kwargs": spec.kwargs},
+    )
+
+
+# ----------------------------------------------------------------------
+# Serialisierung
+# ----------------------------------------------------------------------
+
+
+def to_jsonable(obj: Any) -> Any:
+    """Wandelt Analyseergebnisse (Dataclasses, numpy, datetime, ...) in JSON-Typen um."""
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        if isinstance(obj, float) and not np.isfinite(obj):
+            return None
+        return obj
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f: to_jsonable(getattr(obj, f)) for f in obj.__dataclass_fields__}
+    if isinstance(obj, dict):
+        return {str(k): to_jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        items = sorted(obj) if isinstance(obj, (set, frozenset)) else obj
+        return [to_jsonable(v) for v in items]
+    if isinstance(obj, np.ndarray):
+        return to_jsonable(obj.tolist())
+    if isinstance(obj, np.generic):
+        return to_jsonable(obj.item())
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return to_jsonable(obj.value)
+    if isinstance(obj, Path):
+        return str(obj)
+    return str(obj)
+
+
+# ----------------------------------------------------------------------
+# Worker
+# ----------------------------------------------------------------------
+
+# Geteilte, geladene Datasets im Worker-Prozess (per Initializer gesetzt)
+_SHARED_DATA: dict[str, Any] = {}
+
+
+def _init_worker(shared: dict[str, Any]) -> None:
+    global _SHARED_DATA
+    _SHARED_DATA = shared
+
+
+def _execute(
+    spec: HypothesisSpec,
+    paths: dict[str, str],
+    trace_memory: bool,
+) -> tuple[str, Optional[Any], float, float, Optional[str]]:
+    """Fuehrt eine Hypothese aus (im Worker oder in-process).
+
+    Returns:
+        (hypothesis_id, JSON-Ergebnis, wall_time_s, peak_memory_mb, error)
+    """
+    call_kwargs: dict[str, Any] = dict(spec.kwargs)
+    for param, dataset in spec.arguments.items():
+        if dataset in LOADED_DATASETS:
+            call_kwargs[param] = _SHARED_DATA[dataset]
+        else:
+            call_kwargs[param] = paths[dataset]
+
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = to_jsonable(spec.resolve()(**call_kwargs))
+        error = None
+    except Exception as e:  # noqa: BLE001 - Fehler pro Hypothese isolieren
+        result = None
+        error = f"{type(e).__name__}: {e}"
+    wall_time = time.perf_counter() - start
+    peak_mb = 0.0
+    if trace_memory:
+        peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+    return spec.hypothesis_id, result, wall_time, peak_mb, error
+
+
+# ----------------------------------------------------------------------
+# Runner
+# ----------------------------------------------------------------------
+
+
+@profiled("batch.run")
+def run_hypothesis_batch(
+    hypotheses: Iterable[str] | None = None,
+    inputs: BatchInputs | None = None,
+    output_dir: str | Path = "results/batch",
+    max_workers: int | None = None,
+    force: bool = False,
+    trace_memory: bool = True,
+    registry: dict[str, HypothesisSpec] | None = None,
+    result_cache: ResultCache | None = None,
+) -> BatchResult:
+    """Fuehrt mehrere Hypothesen-Analysen parallel mit geteilten Eingaben aus.
+
+    Args:
+        hypotheses: Hypothesen-IDs (None = alle registrierten)
+        inputs: Pfade der Eingabedaten (default: BatchInputs())
+        output_dir: Zielverzeichnis fuer Ergebnis-JSONs
+        max_workers: Anzahl Worker-Prozesse (1 = sequentiell in-process)
+        force: Unveraenderte Hypothesen nicht ueberspringen
+        trace_memory: Peak-Memory per tracemalloc messen
+        registry: Alternative Hypothesen-Registry (default: HYPOTHESIS_REGISTRY)
+        result_cache: Cache fuer Ergebnisse (default: ResultCache(output_dir / ".cache"))
+
+    Returns:
+        BatchResult mit einem Report pro Hypothese (Eingabereihenfolge).
+
+    Raises:
+        KeyError: Bei unbekannter Hypothesen-ID
+    """
+    total_start = time.perf_counter()
+    registry = HYPOTHESIS_REGISTRY if registry is None else registry
+    inputs = inputs or BatchInputs()
+    output_dir = Path(output_dir)
+    result_cache = result_cache or ResultCache(output_dir / ".cache")
+
+    hyp_ids = list(registry) if hypotheses is None else list(dict.fromkeys(hypotheses))
+    unknown = [h for h in hyp_ids if h not in registry]
+    if unknown:
+        raise KeyError(f"Unknown hypotheses: {unknown}. Available: {sorted(registry)}")
+    specs = [registry[h] for h in hyp_ids]
+
+    datasets = sorted({d for spec in specs for d in spec.datasets})
+    paths = {d: str(inputs.path_for(d)) for d in datasets}
+
+    reports: dict[str, HypothesisRunReport] = {}
+    pending: list[HypothesisSpec] = []
+    keys: dict[str, CacheKey] = {}
+
+    for spec in specs:
+        key = spec_key(result_cache, spec, paths)
+        keys[spec.hypothesis_id] = key
+        output_path = output_dir / spec.output_name
+        cached = None
+        if not force:
+            cached = result_cache.lookup(key, name=spec.hypothesis_id, publish_to=output_path)
+        if cached is not None:
+            logger.info(f"{spec.hypothesis_id}: unchanged, skipping")
+            reports[spec.hypothesis_id] = HypothesisRunReport(
+                hypothesis_id=spec.hypothesis_id,
+                status="skipped",
+                output_path=str(output_path),
+                fingerprint=key.digest,
+            )
+        else:
+            pending.append(spec)
+
+    # Geteilte Datasets genau einmal laden
+    load_start = time.perf_counter()
+    shared: dict[str, Any] = {}
+    needed = {d for spec in pending for d in spec.datasets} & LOADED_DATASETS
+    if "keno" in needed:
+        logger.info(f"Loading KENO draws from {paths['keno']}")
+        shared["keno"] = DataLoader().load_collection(paths["keno"])
+    load_time = time.perf_counter() - load_start
+
+    outcomes: list[tuple[str, Optional[Any], float, float, Optional[str]]] = []
+    workers = min(max_workers or os.cpu_count() or 1, len(pending)) if pending else 0
+
+    if workers == 1:
+        _init_worker(shared)
+        try:
+            outcomes = [_execute(spec, paths, trace_memory) for spec in pending]
+        finally:
+            _init_worker({})
+    elif workers > 1:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(shared,),
+        ) as executor:
+            futures = [
+                executor.submit(_execute, spec, paths, trace_memory) for spec in pending
+            ]
+            for future in as_completed(futures):
+                outcomes.append(future.result())
+
+    # Ergebnisse gesammelt am Ende in den Cache schreiben und veroeffentlichen
+    generated_at = datetime.now().isoformat()
+    for hyp_id, result, wall_time, peak_mb, error in outcomes:
+        spec = registry[hyp_id]
+        key = keys[hyp_id]
+        report = HypothesisRunReport(
+            hypothesis_id=hyp_id,
+            status="ok" if error is None else "error",
+            wall_time_s=round(wall_time, 4),
+            peak_memory_mb=round(peak_mb, 3),
+            fingerprint=key.digest,
+            error=error,
+        )
+        if error is None:
+            output_path = output_dir / spec.output_name
+            result_cache.put(
+                key,
+                {
+                    "hypothesis": hyp_id,
+                    "generated_at": generated_at,
+                    "inputs": {d: paths[d] for d in spec.datasets},
+                    "fingerprint": key.digest,
+                    "result": result,
+                },
+                name=hyp_id,
+                publish_to=output_path,
+            )
+            report.output_path = str(output_path)
+            logger.info(f"{hyp_id}: {wall_time:.2f}s, peak {peak_mb:.1f} MB")
+        else:
+            logger.error(f"{hyp_id} failed: {error}")
+        reports[hyp_id] = report
+
+    return BatchResult(
+        reports=[reports[h] for h in hyp_ids],
+        total_wall_time_s=time.perf_counter() - total_start,
+        load_time_s=load_time,
+        output_dir=str(output_dir),
+    )
+
+
+__all__ = [
+    "BatchInputs",
+    "BatchResult",
+    "HYPOTHESIS_REGISTRY",
+    "HypothesisRunReport",
+    "HypothesisSpec",
+    "file_digest",
+    "run_hypothesis_batch",
+    "spec_key",
+    "to_jsonable",
+]
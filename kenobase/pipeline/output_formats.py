@@ -2,63 +2,209 @@
 
 Dieses Modul implementiert verschiedene Output-Formate fuer Kenobase V2.0:
 - JSON: Vollstaendige Datenstruktur
+- JSONL: Ein JSON-Objekt pro Zeile (record-orientiert, streambar)
 - CSV: Tabellarische Frequenzdaten (erweitert mit Physics)
 - HTML: Interaktiver Report
 - Markdown: GFM-kompatibles Textformat
 - YAML: Strukturierte Konfiguration/Daten
 
+Alle eingebauten Formate werden direkt in ein file-like Objekt geschrieben
+(`OutputFormatter.write` / `write_file`); `format` ist nur ein StringIO
+darum. Fuer grosse Record-Listen (Paar-Frequenzen, Signatur-Records,
+Backtest daily_results) schreiben `write_jsonl` und `write_csv_records`
+Iterables zeilenweise; sie laufen ueber orjson, falls installiert. Die
+Formate JSON und JSONL bleiben beim json-Modul, damit NaN/Infinity und die
+Float-Darstellung (1e-05, 1e+20, float32) unveraendert bleiben.
+
 Usage:
     from kenobase.pipeline.output_formats import OutputFormatter, OutputFormat
 
     formatter = OutputFormatter()
     result = formatter.format(data, OutputFormat.MARKDOWN)
+    formatter.write_file(data, "results/report.html", OutputFormat.HTML)
+
+    with open("results/daily.jsonl", "w", encoding="utf-8") as f:
+        write_jsonl(daily_results, f)
 """
 
 from __future__ import annotations
 
 import csv
+import dataclasses
+import importlib.util
 import io
 import json
+import sys
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
-from typing import Any, Callable, Optional
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, TextIO
+
+HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+
+# Records pro write()-Aufruf beim zeilenweisen Schreiben
+DEFAULT_CHUNK_SIZE = 1000
 
 
 class OutputFormat(Enum):
     """Unterstuetzte Ausgabeformate."""
 
     JSON = "json"
+    JSONL = "jsonl"
     CSV = "csv"
     HTML = "html"
     MARKDOWN = "markdown"
     YAML = "yaml"
 
 
+def json_default(obj: Any) -> Any:
+    """Fallback fuer nicht JSON-native Typen.
+
+    Unterstuetzt numpy-Skalare/-Arrays, Dataclasses, datetime/date, Enums,
+    Pfade sowie set/tuple/frozenset.
+
+    Raises:
+        TypeError: Fuer sonstige Typen
+    """
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+
+    # numpy nur pruefen, wenn es bereits geladen ist (kein Import-Zwang)
+    np = sys.modules.get("numpy")
+    if np is not None:
+        if isinstance(obj, np.bool_):
+            return bool(obj)
+        if isinstance(obj, np.integer):
+            return int(obj)
+        if isinstance(obj, np.floating):
+            return float(obj)
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, np.datetime64):
+            return str(obj)
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj: Any, indent: Optional[int] = None, keep_nan: bool = False) -> str:
+    """Serialisiert nach JSON (orjson wenn verfuegbar, sonst json).
+
+    Ohne indent kompakt (ohne Leerzeichen, eine Zeile); mit orjson nur fuer
+    indent None oder 2, andere Einrueckungen laufen ueber json.
+
+    Mit orjson weicht die Ausgabe vom json-Modul ab: NaN/Infinity werden
+    zu null (striktes JSON), Floats in kuerzester Darstellung (0.00001
+    statt 1e-05, 1e20 statt 1e+20) und numpy.float32 ohne float64-Rundung
+    (0.1 statt 0.10000000149011612). Wo NaN erhalten bleiben muss,
+    keep_nan=True setzen (wie OutputFormat.JSON und JSONL).
+
+    Args:
+        obj: Zu serialisierendes Objekt
+        indent: Einrueckung (None = kompakt)
+        keep_nan: Immer das json-Modul verwenden (NaN bleibt NaN)
+
+    Returns:
+        JSON-String (UTF-8, nicht ASCII-escaped)
+    """
+    if HAS_ORJSON and not keep_nan and indent in (None, 2):
+        return _orjson_dumps(obj, indent).decode("utf-8")
+    if indent is None:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=json_default)
+    return json.dumps(obj, ensure_ascii=False, indent=indent, default=json_default)
+
+
+def _orjson_dumps(obj: Any, indent: Optional[int]) -> bytes:
+    import orjson
+
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if indent == 2:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, default=json_default, option=option)
+
+
+def write_jsonl(
+    records: Iterable[Any],
+    fp: TextIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    keep_nan: bool = False,
+) -> int:
+    """Schreibt Records als JSON Lines (ein kompaktes JSON-Objekt pro Zeile).
+
+    Records werden in Bloecken von chunk_size Zeilen geschrieben; das
+    Iterable wird nie komplett materialisiert.
+
+    Args:
+        records: Dicts, Dataclasses oder sonstige JSON-faehige Objekte
+        fp: Text-Stream
+        chunk_size: Zeilen pro write()-Aufruf
+        keep_nan: Siehe dumps_json
+
+    Returns:
+        Anzahl geschriebener Records
+    """
+    count = 0
+    chunk: list[str] = []
+    for record in records:
+        chunk.append(dumps_json(record, keep_nan=keep_nan))
+        count += 1
+        if len(chunk) >= chunk_size:
+            fp.write("\n".join(chunk) + "\n")
+            chunk = []
+    if chunk:
+        fp.write("\n".join(chunk) + "\n")
+    return count
+
+
+def write_csv_records(
+    records: Iterable[dict],
+    fp: TextIO,
+    fieldnames: Optional[list[str]] = None,
+) -> int:
+    """Schreibt Dict-Records als CSV (Header + eine Zeile pro Record).
+
+    Args:
+        records: Dicts (Dataclasses werden per asdict konvertiert)
+        fp: Text-Stream (bei Dateien mit newline="" oeffnen)
+        fieldnames: Spalten (default: Keys des ersten Records)
+
+    Returns:
+        Anzahl geschriebener Records
+    """
+    writer = None
+    count = 0
+    for record in records:
+        if dataclasses.is_dataclass(record) and not isinstance(record, type):
+            record = dataclasses.asdict(record)
+        if writer is None:
+            writer = csv.DictWriter(
+                fp, fieldnames=fieldnames or list(record), extrasaction="ignore"
+            )
+            writer.writeheader()
+        writer.writerow(record)
+        count += 1
+    if writer is None and fieldnames:
+        csv.DictWriter(fp, fieldnames=fieldnames).writeheader()
+    return count
+
+
 class CustomJSONEncoder(json.JSONEncoder):
-    """Custom JSON Encoder fuer numpy und datetime Typen."""
+    """Custom JSON Encoder fuer numpy, Dataclass und datetime Typen."""
 
     def default(self, obj: Any) -> Any:
         """Konvertiert spezielle Typen zu JSON-serialisierbaren Werten."""
-        # Handle numpy types if numpy is available
         try:
-            import numpy as np
-            if isinstance(obj, (np.bool_, bool)):
-                return bool(obj)
-            if isinstance(obj, (np.integer, int)):
-                return int(obj)
-            if isinstance(obj, (np.floating, float)):
-                return float(obj)
-            if isinstance(obj, np.ndarray):
-                return obj.tolist()
-        except ImportError:
-            pass
-
-        # Handle datetime
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-
-        return super().default(obj)
+            return json_default(obj)
+        except TypeError:
+            return super().default(obj)
 
 
 @dataclass
@@ -83,13 +229,16 @@ class FormatterConfig:
 class OutputFormatter:
     """Formatiert Pipeline-Ergebnisse in verschiedene Ausgabeformate.
 
-    Unterstuetzt JSON, CSV, HTML, Markdown und YAML.
-    Verwendet Registry-Pattern fuer einfache Erweiterbarkeit.
+    Unterstuetzt JSON, JSON Lines, CSV, HTML, Markdown und YAML.
+    Verwendet Registry-Pattern fuer einfache Erweiterbarkeit: eingebaute
+    Formate sind Writer (dict, Stream) -> None, per register_formatter
+    registrierte Formatter (dict -> str) ersetzen den Writer ihres Formats.
 
     Example:
         >>> formatter = OutputFormatter()
         >>> json_output = formatter.format(data, OutputFormat.JSON)
         >>> md_output = formatter.format(data, OutputFormat.MARKDOWN)
+        >>> formatter.write_file(data, "report.html", OutputFormat.HTML)
     """
 
     def __init__(self, config: Optional[FormatterConfig] = None) -> None:
@@ -99,14 +248,40 @@ class OutputFormatter:
             config: Optionale Formatter-Konfiguration.
         """
         self.config = config or FormatterConfig()
+        self._writers: dict[OutputFormat, Callable[[dict, TextIO], None]] = {
+            OutputFormat.JSON: self._write_json,
+            OutputFormat.JSONL: self._write_jsonl,
+            OutputFormat.CSV: self._write_csv,
+            OutputFormat.HTML: self._write_html,
+            OutputFormat.MARKDOWN: self._write_markdown,
+            OutputFormat.YAML: self._write_yaml,
+        }
         self._formatters: dict[OutputFormat, Callable[[dict], str]] = {
             OutputFormat.JSON: self._format_json,
+            OutputFormat.JSONL: self._format_jsonl,
             OutputFormat.CSV: self._format_csv,
             OutputFormat.HTML: self._format_html,
             OutputFormat.MARKDOWN: self._format_markdown,
             OutputFormat.YAML: self._format_yaml,
         }
 
+    @staticmethod
+    def _resolve_format(output_format: OutputFormat | str) -> OutputFormat:
+        """Konvertiert String zu OutputFormat.
+
+        Raises:
+            ValueError: Bei unbekanntem Format.
+        """
+        if isinstance(output_format, OutputFormat):
+            return output_format
+        try:
+            return OutputFormat(output_format.lower())
+        except ValueError:
+            raise ValueError(
+                f"Unknown format: {output_format}. "
+                f"Supported: {[f.value for f in OutputFormat]}"
+            )
+
     def format(self, data: dict, output_format: OutputFormat | str) -> str:
         """Formatiert Daten in das angegebene Format.
 
@@ -120,15 +295,7 @@ class OutputFormatter:
         Raises:
             ValueError: Bei unbekanntem Format.
         """
-        # Convert string to enum if needed
-        if isinstance(output_format, str):
-            try:
-                output_format = OutputFormat(output_format.lower())
-            except ValueError:
-                raise ValueError(
-                    f"Unknown format: {output_format}. "
-                    f"Supported: {[f.value for f in OutputFormat]}"
-                )
+        output_format = self._resolve_format(output_format)
 
         formatter = self._formatters.get(output_format)
         if formatter is None:
@@ -136,6 +303,55 @@ class OutputFormatter:
 
         return formatter(data)
 
+    def write(self, data: dict, fp: TextIO, output_format: OutputFormat | str) -> None:
+        """Schreibt Daten im angegebenen Format direkt in einen Text-Stream.
+
+        Liefert denselben Inhalt wie format(), ohne den Report vorher als
+        String aufzubauen.
+
+        Args:
+            data: Pipeline-Ergebnisse als Dict.
+            fp: Text-Stream (z.B. geoeffnete Datei, sys.stdout).
+            output_format: Zielformat (OutputFormat enum oder String).
+
+        Raises:
+            ValueError: Bei unbekanntem Format.
+        """
+        output_format = self._resolve_format(output_format)
+
+        writer = self._writers.get(output_format)
+        if writer is not None:
+            writer(data, fp)
+            return
+
+        formatter = self._formatters.get(output_format)
+        if formatter is None:
+            raise ValueError(f"No formatter registered for {output_format}")
+        fp.write(formatter(data))
+
+    def write_file(
+        self,
+        data: dict,
+        path: str | Path,
+        output_format: OutputFormat | str,
+    ) -> Path:
+        """Schreibt Daten im angegebenen Format in eine Datei (UTF-8).
+
+        Args:
+            data: Pipeline-Ergebnisse als Dict.
+            path: Zieldatei (Elternverzeichnisse werden angelegt).
+            output_format: Zielformat (OutputFormat enum oder String).
+
+        Returns:
+            Pfad zur geschriebenen Datei.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # newline="": Zeilenenden (u.a. CSV \r\n) unveraendert uebernehmen
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            self.write(data, f, output_format)
+        return path
+
     def register_formatter(
         self,
         output_format: OutputFormat,
@@ -148,32 +364,102 @@ class OutputFormatter:
             formatter: Formatter-Funktion (dict -> str).
         """
         self._formatters[output_format] = formatter
+        self._writers.pop(output_format, None)
+
+    def register_writer(
+        self,
+        output_format: OutputFormat,
+        writer: Callable[[dict, TextIO], None],
+    ) -> None:
+        """Registriert einen benutzerdefinierten Stream-Writer.
+
+        Args:
+            output_format: Zu registrierendes Format.
+            writer: Writer-Funktion (dict, Stream) -> None.
+        """
+        self._writers[output_format] = writer
+        self._formatters[output_format] = lambda data: self._render(writer, data)
+
+    @staticmethod
+    def _render(writer: Callable[[dict, TextIO], None], data: dict) -> str:
+        """Fuehrt einen Writer gegen einen StringIO aus."""
+        output = io.StringIO()
+        writer(data, output)
+        return output.getvalue()
 
     def _format_json(self, data: dict) -> str:
         """Formatiert als JSON."""
-        return json.dumps(
-            data,
-            indent=self.config.indent,
-            ensure_ascii=False,
-            cls=CustomJSONEncoder,
-        )
+        return self._render(self._write_json, data)
+
+    def _format_jsonl(self, data: dict) -> str:
+        """Formatiert als JSON Lines."""
+        return self._render(self._write_jsonl, data)
 
     def _format_csv(self, data: dict) -> str:
-        """Formatiert als CSV (erweitert mit Physics-Daten).
+        """Formatiert als CSV (erweitert mit Physics-Daten)."""
+        return self._render(self._write_csv, data)
+
+    def _format_html(self, data: dict) -> str:
+        """Formatiert als HTML-Report."""
+        return self._render(self._write_html, data)
+
+    def _format_markdown(self, data: dict) -> str:
+        """Formatiert als Markdown (GFM-kompatibel)."""
+        return self._render(self._write_markdown, data)
+
+    def _format_yaml(self, data: dict) -> str:
+        """Formatiert als YAML."""
+        return self._render(self._write_yaml, data)
+
+    def _write_json(self, data: dict, fp: TextIO) -> None:
+        """Schreibt JSON stueckweise via json.JSONEncoder.iterencode.
+
+        Bewusst ohne orjson: NaN-p-Werte bleiben NaN statt null und die
+        Float-Darstellung entspricht json.dumps.
+        """
+        encoder = CustomJSONEncoder(indent=self.config.indent, ensure_ascii=False)
+        for chunk in encoder.iterencode(data):
+            fp.write(chunk)
+
+    def _write_jsonl(self, data: dict, fp: TextIO) -> None:
+        """Schreibt JSON Lines: eine Zeile pro Record.
+
+        Erste Zeile: {"section": "meta", ...} mit allen Eintraegen, die keine
+        Listen sind; danach je Listen-Eintrag eine Zeile pro Element
+        ({"section": key, **record} bzw. {"section": key, "value": item}).
+        Wie _write_json ueber das json-Modul, damit NaN-p-Werte NaN bleiben.
+        """
+        meta = {"section": "meta"}
+        meta.update((k, v) for k, v in data.items() if not isinstance(v, list))
+        fp.write(dumps_json(meta, keep_nan=True) + "\n")
+
+        for key, value in data.items():
+            if isinstance(value, list):
+                write_jsonl(
+                    (
+                        {"section": key, **item}
+                        if isinstance(item, dict)
+                        else {"section": key, "value": item}
+                        for item in value
+                    ),
+                    fp,
+                    keep_nan=True,
+                )
+
+    def _write_csv(self, data: dict, fp: TextIO) -> None:
+        """Schreibt CSV (erweitert mit Physics-Daten).
 
         Erzeugt mehrere Sektionen:
         - frequency_results
         - pair_frequency_results (optional)
         - physics_summary (wenn vorhanden)
         """
-        output = io.StringIO()
-
         # Section 1: Frequency Results
         freq_results = data.get("frequency_results", [])
         if freq_results:
-            output.write("# Frequency Results\n")
+            fp.write("# Frequency Results\n")
             writer = csv.DictWriter(
-                output,
+                fp,
                 fieldnames=["number", "count", "relative_frequency", "classification"],
                 extrasaction="ignore",
             )
@@ -185,16 +471,16 @@ class OutputFormatter:
                     "relative_frequency": f"{r.get('relative_frequency', 0):.4f}",
                     "classification": r.get("classification", ""),
                 })
-            output.write("\n")
+            fp.write("\n")
 
         # Section 2: Pair Frequency Results
         pair_results = data.get("pair_frequency_results", [])
         if pair_results and self.config.include_patterns:
-            output.write("# Pair Frequency Results (Top {})\n".format(
+            fp.write("# Pair Frequency Results (Top {})\n".format(
                 self.config.top_n_pairs
             ))
             writer = csv.DictWriter(
-                output,
+                fp,
                 fieldnames=["pair", "count", "relative_frequency", "classification"],
                 extrasaction="ignore",
             )
@@ -207,35 +493,33 @@ class OutputFormatter:
                     "relative_frequency": f"{r.get('relative_frequency', 0):.4f}",
                     "classification": r.get("classification", ""),
                 })
-            output.write("\n")
+            fp.write("\n")
 
         # Section 3: Physics Summary
         physics = data.get("physics_result")
         if physics and self.config.include_physics:
-            output.write("# Physics Summary\n")
-            output.write("metric,value\n")
-            output.write(f"stability_score,{physics.get('stability_score', 0):.4f}\n")
-            output.write(f"is_stable_law,{physics.get('is_stable_law', False)}\n")
-            output.write(f"criticality_score,{physics.get('criticality_score', 0):.4f}\n")
-            output.write(f"criticality_level,{physics.get('criticality_level', 'N/A')}\n")
-            output.write(f"hurst_exponent,{physics.get('hurst_exponent', 0):.4f}\n")
-            output.write(f"regime_complexity,{physics.get('regime_complexity', 0)}\n")
-            output.write(f"recommended_max_picks,{physics.get('recommended_max_picks', 6)}\n")
+            fp.write("# Physics Summary\n")
+            fp.write("metric,value\n")
+            fp.write(f"stability_score,{physics.get('stability_score', 0):.4f}\n")
+            fp.write(f"is_stable_law,{physics.get('is_stable_law', False)}\n")
+            fp.write(f"criticality_score,{physics.get('criticality_score', 0):.4f}\n")
+            fp.write(f"criticality_level,{physics.get('criticality_level', 'N/A')}\n")
+            fp.write(f"hurst_exponent,{physics.get('hurst_exponent', 0):.4f}\n")
+            fp.write(f"regime_complexity,{physics.get('regime_complexity', 0)}\n")
+            fp.write(f"recommended_max_picks,{physics.get('recommended_max_picks', 6)}\n")
 
             avalanche = physics.get("avalanche")
             if avalanche:
-                output.write(f"avalanche_theta,{avalanche.get('theta', 0):.4f}\n")
-                output.write(f"avalanche_state,{avalanche.get('state', 'N/A')}\n")
-                output.write(f"is_safe_to_bet,{avalanche.get('is_safe_to_bet', False)}\n")
+                fp.write(f"avalanche_theta,{avalanche.get('theta', 0):.4f}\n")
+                fp.write(f"avalanche_state,{avalanche.get('state', 'N/A')}\n")
+                fp.write(f"is_safe_to_bet,{avalanche.get('is_safe_to_bet', False)}\n")
 
-        return output.getvalue()
-
-    def _format_html(self, data: dict) -> str:
-        """Formatiert als HTML-Report."""
+    def _write_html(self, data: dict, fp: TextIO) -> None:
+        """Schreibt den HTML-Report."""
         timestamp = data.get("timestamp", "N/A")
         draws_count = data.get("draws_count", 0)
 
-        html = f"""<!DOCTYPE html>
+        fp.write(f"""<!DOCTYPE html>
 <html lang="de">
 <head>
     <meta charset="UTF-8">
@@ -269,41 +553,41 @@ class OutputFormatter:
 <div class="container">
     <h1>Kenobase Analysis Report</h1>
     <p class="meta">Generated: {timestamp} | Draws analyzed: {draws_count}</p>
-"""
+""")
 
         # Warnings
         warnings = data.get("warnings", [])
         if warnings:
-            html += "<h2>Warnings</h2>\n"
+            fp.write("<h2>Warnings</h2>\n")
             for w in warnings:
-                html += f'<div class="warning">{w}</div>\n'
+                fp.write(f'<div class="warning">{w}</div>\n')
 
         # Physics Results
         physics = data.get("physics_result")
         if physics and self.config.include_physics:
             stability_status = "Stable" if physics.get("is_stable_law") else "Unstable"
-            html += '<h2>Physics Analysis</h2>\n<div class="physics">\n'
-            html += '<div class="physics-grid">\n'
-            html += f'<div class="physics-item"><strong>Stability Score:</strong> {physics.get("stability_score", 0):.3f} ({stability_status})</div>\n'
-            html += f'<div class="physics-item"><strong>Criticality:</strong> {physics.get("criticality_score", 0):.3f} ({physics.get("criticality_level", "N/A")})</div>\n'
-            html += f'<div class="physics-item"><strong>Hurst Exponent:</strong> {physics.get("hurst_exponent", 0):.3f}</div>\n'
-            html += f'<div class="physics-item"><strong>Regime Complexity:</strong> {physics.get("regime_complexity", 0)}</div>\n'
-            html += f'<div class="physics-item"><strong>Recommended Max Picks:</strong> {physics.get("recommended_max_picks", 6)}</div>\n'
+            fp.write('<h2>Physics Analysis</h2>\n<div class="physics">\n')
+            fp.write('<div class="physics-grid">\n')
+            fp.write(f'<div class="physics-item"><strong>Stability Score:</strong> {physics.get("stability_score", 0):.3f} ({stability_status})</div>\n')
+            fp.write(f'<div class="physics-item"><strong>Criticality:</strong> {physics.get("criticality_score", 0):.3f} ({physics.get("criticality_level", "N/A")})</div>\n')
+            fp.write(f'<div class="physics-item"><strong>Hurst Exponent:</strong> {physics.get("hurst_exponent", 0):.3f}</div>\n')
+            fp.write(f'<div class="physics-item"><strong>Regime Complexity:</strong> {physics.get("regime_complexity", 0)}</div>\n')
+            fp.write(f'<div class="physics-item"><strong>Recommended Max Picks:</strong> {physics.get("recommended_max_picks", 6)}</div>\n')
 
             avalanche = physics.get("avalanche")
             if avalanche:
                 state = avalanche.get("state", "N/A")
                 state_class = f"avalanche-{state.lower()}" if state != "N/A" else ""
-                html += f'<div class="physics-item"><strong>Avalanche:</strong> theta={avalanche.get("theta", 0):.3f}, '
-                html += f'<span class="{state_class}">state={state}</span>, safe={avalanche.get("is_safe_to_bet", False)}</div>\n'
+                fp.write(f'<div class="physics-item"><strong>Avalanche:</strong> theta={avalanche.get("theta", 0):.3f}, ')
+                fp.write(f'<span class="{state_class}">state={state}</span>, safe={avalanche.get("is_safe_to_bet", False)}</div>\n')
 
-            html += '</div>\n</div>\n'
+            fp.write('</div>\n</div>\n')
 
         # Frequency Table
         freq_results = data.get("frequency_results", [])
         if freq_results:
-            html += f"<h2>Number Frequencies (Top {self.config.top_n_frequencies})</h2>\n"
-            html += "<table>\n<tr><th>Number</th><th>Count</th><th>Frequency</th><th>Classification</th></tr>\n"
+            fp.write(f"<h2>Number Frequencies (Top {self.config.top_n_frequencies})</h2>\n")
+            fp.write("<table>\n<tr><th>Number</th><th>Count</th><th>Frequency</th><th>Classification</th></tr>\n")
             freq_sorted = sorted(
                 freq_results,
                 key=lambda x: x.get("count", 0),
@@ -311,48 +595,52 @@ class OutputFormatter:
             )[:self.config.top_n_frequencies]
             for r in freq_sorted:
                 cls = r.get("classification", "normal")
-                html += f'<tr class="{cls}"><td>{r.get("number", "")}</td>'
-                html += f'<td>{r.get("count", 0)}</td>'
-                html += f'<td>{r.get("relative_frequency", 0):.4f}</td>'
-                html += f'<td>{cls}</td></tr>\n'
-            html += "</table>\n"
+                fp.write(f'<tr class="{cls}"><td>{r.get("number", "")}</td>')
+                fp.write(f'<td>{r.get("count", 0)}</td>')
+                fp.write(f'<td>{r.get("relative_frequency", 0):.4f}</td>')
+                fp.write(f'<td>{cls}</td></tr>\n')
+            fp.write("</table>\n")
 
         # Pair Frequency Table
         pair_results = data.get("pair_frequency_results", [])
         if pair_results and self.config.include_patterns:
-            html += f"<h2>Pair Frequencies (Top {self.config.top_n_pairs})</h2>\n"
-            html += "<table>\n<tr><th>Pair</th><th>Count</th><th>Frequency</th><th>Classification</th></tr>\n"
+            fp.write(f"<h2>Pair Frequencies (Top {self.config.top_n_pairs})</h2>\n")
+            fp.write("<table>\n<tr><th>Pair</th><th>Count</th><th>Frequency</th><th>Classification</th></tr>\n")
             for r in pair_results[:self.config.top_n_pairs]:
                 pair_str = "-".join(str(x) for x in r.get("pair", []))
                 cls = r.get("classification", "normal")
-                html += f'<tr class="{cls}"><td>{pair_str}</td>'
-                html += f'<td>{r.get("count", 0)}</td>'
-                html += f'<td>{r.get("relative_frequency", 0):.4f}</td>'
-                html += f'<td>{cls}</td></tr>\n'
-            html += "</table>\n"
+                fp.write(f'<tr class="{cls}"><td>{pair_str}</td>')
+                fp.write(f'<td>{r.get("count", 0)}</td>')
+                fp.write(f'<td>{r.get("relative_frequency", 0):.4f}</td>')
+                fp.write(f'<td>{cls}</td></tr>\n')
+            fp.write("</table>\n")
 
         # Pipeline Selection
         pipeline = data.get("pipeline_selection")
         if pipeline:
-            html += "<h2>Pipeline Selection (Least-Action)</h2>\n"
-            html += f"<p><strong>Selected:</strong> {pipeline.get('selected_name', 'N/A')} "
-            html += f"(action={pipeline.get('selected_action', 0):.3f})</p>\n"
+            fp.write("<h2>Pipeline Selection (Least-Action)</h2>\n")
+            fp.write(f"<p><strong>Selected:</strong> {pipeline.get('selected_name', 'N/A')} ")
+            fp.write(f"(action={pipeline.get('selected_action', 0):.3f})</p>\n")
 
-        html += "</div>\n</body>\n</html>"
-        return html
+        fp.write("</div>\n</body>\n</html>")
 
-    def _format_markdown(self, data: dict) -> str:
-        """Formatiert als Markdown (GFM-kompatibel)."""
+    def _write_markdown(self, data: dict, fp: TextIO) -> None:
+        """Schreibt Markdown (GFM-kompatibel).
+
+        Sektionen werden einzeln geschrieben; Zeilen sind wie bisher mit
+        "\\n" verbunden (kein abschliessender Zeilenumbruch).
+        """
         timestamp = data.get("timestamp", "N/A")
         draws_count = data.get("draws_count", 0)
 
-        lines = [
+        lines = _LineStream(fp)
+        lines.extend([
             "# Kenobase Analysis Report",
             "",
             f"**Generated:** {timestamp}  ",
             f"**Draws analyzed:** {draws_count}",
             "",
-        ]
+        ])
 
         # Warnings
         warnings = data.get("warnings", [])
@@ -444,14 +732,13 @@ class OutputFormatter:
         lines.append("---")
         lines.append("*Generated by Kenobase V2.0*")
 
-        return "\n".join(lines)
-
-    def _format_yaml(self, data: dict) -> str:
-        """Formatiert als YAML."""
+    def _write_yaml(self, data: dict, fp: TextIO) -> None:
+        """Schreibt YAML (pyyaml streamt direkt in fp)."""
         try:
             import yaml
-            return yaml.dump(
+            yaml.dump(
                 data,
+                fp,
                 default_flow_style=False,
                 allow_unicode=True,
                 indent=self.config.indent,
@@ -459,7 +746,7 @@ class OutputFormatter:
             )
         except ImportError:
             # Fallback: Simple YAML-like formatting
-            return self._simple_yaml_format(data)
+            fp.write(self._simple_yaml_format(data))
 
     def _simple_yaml_format(self, data: dict, indent: int = 0) -> str:
         """Einfache YAML-Formatierung ohne pyyaml Abhaengigkeit."""
@@ -498,6 +785,24 @@ class OutputFormatter:
         return "\n".join(lines)
 
 
+class _LineStream:
+    """Schreibt Zeilen wie "\\n".join(lines), aber direkt in einen Stream."""
+
+    def __init__(self, fp: TextIO) -> None:
+        self._fp = fp
+        self._first = True
+
+    def append(self, line: str) -> None:
+        if not self._first:
+            self._fp.write("\n")
+        self._fp.write(line)
+        self._first = False
+
+    def extend(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.append(line)
+
+
 def format_output(data: dict, output_format: str) -> str:
     """Convenience-Funktion fuer Format-Konvertierung.
 
@@ -522,8 +827,13 @@ def get_supported_formats() -> list[str]:
 __all__ = [
     "CustomJSONEncoder",
     "FormatterConfig",
+    "HAS_ORJSON",
     "OutputFormat",
     "OutputFormatter",
+    "dumps_json",
     "format_output",
     "get_supported_formats",
+    "json_default",
+    "write_csv_records",
+    "write_jsonl",
 ]
@@ -46,8 +46,8 @@ from kenobase.analysis.sum_distribution import (
     analyze_sum_distribution,
 )
 from kenobase.analysis.summen_signatur import (
-    aggregate_bucket_counts,
-    compute_summen_signatur,
+    append_signatures_parquet,
+    compute_summen_signatur_table,
     export_signatures as export_summen_signatur,
 )
 from kenobase.analysis.regional_affinity import (
@@ -55,6 +55,7 @@ from kenobase.analysis.regional_affinity import (
     analyze_regional_affinity,
 )
 from kenobase.core.combination_filter import SumBounds, derive_sum_bounds_from_result
+from kenobase.core.profiling import profiled, span
 from kenobase.physics.avalanche import (
     AvalancheResult,
     AvalancheState,
@@ -187,6 +188,7 @@ class PipelineRunner:
                 "criticality_critical_threshold should be > criticality_warning_threshold"
             )
 
+    @profiled("pipeline.run")
     def run(
         self,
         draws: list[DrawResult],
@@ -225,24 +227,27 @@ class PipelineRunner:
         game_config = self.config.get_active_game()
         number_range = game_config.numbers_range
 
-        frequency_results = calculate_frequency(draws, number_range)
-        frequency_results = classify_numbers(
-            frequency_results,
-            hot_threshold=self.config.analysis.max_frequency_threshold,
-            cold_threshold=self.config.analysis.min_frequency_threshold,
-        )
+        with span("pipeline.frequency", draws=len(draws)):
+            frequency_results = calculate_frequency(draws, number_range)
+            frequency_results = classify_numbers(
+                frequency_results,
+                hot_threshold=self.config.analysis.max_frequency_threshold,
+                cold_threshold=self.config.analysis.min_frequency_threshold,
+            )
 
-        pair_frequency_results = calculate_pair_frequency(draws)
-        pair_frequency_results = classify_pairs(pair_frequency_results)
+        with span("pipeline.pair_frequency"):
+            pair_frequency_results = calculate_pair_frequency(draws)
+            pair_frequency_results = classify_pairs(pair_frequency_results)
 
         # Step 1.5: Dekaden-Verteilung (TRANS-002)
         max_number = max(number_range) if number_range else 70
-        decade_distribution = analyze_decade_distribution(
-            draws,
-            max_number=max_number,
-            numbers_per_draw=game_config.numbers_to_draw,
-            guardrail_ratio=0.20,
-        )
+        with span("pipeline.decade_distribution"):
+            decade_distribution = analyze_decade_distribution(
+                draws,
+                max_number=max_number,
+                numbers_per_draw=game_config.numbers_to_draw,
+                guardrail_ratio=0.20,
+            )
         if decade_distribution.guardrail_breached:
             warnings.append(
                 f"decade_distribution guardrail exceeded (max deviation "
@@ -257,8 +262,9 @@ class PipelineRunner:
         aggregated_patterns: dict = {}
 
         if combination:
-            pattern_results = extract_patterns_from_draws(combination, draws)
-            aggregated_patterns = aggregate_patterns(pattern_results)
+            with span("pipeline.patterns"):
+                pattern_results = extract_patterns_from_draws(combination, draws)
+                aggregated_patterns = aggregate_patterns(pattern_results)
 
         # Step 2.5: Sum Distribution Analysis (TASK-P05)
         sum_distribution_result: Optional[SumDistributionResult] = None
@@ -279,16 +285,17 @@ class PipelineRunner:
         regional_affinity: Optional[RegionalAffinityAnalysis] = None
         regional_cfg = self.config.analysis.regional_affinity
         if regional_cfg.enabled:
-            regional_affinity = analyze_regional_affinity(
-                draws,
-                number_range=number_range,
-                numbers_per_draw=regional_cfg.numbers_per_draw_override
-                or game_config.numbers_to_draw,
-                min_draws_per_region=regional_cfg.min_draws_per_region,
-                smoothing_alpha=regional_cfg.smoothing_alpha,
-                z_threshold=regional_cfg.z_threshold,
-                game=self.config.active_game,
-            )
+            with span("pipeline.regional_affinity"):
+                regional_affinity = analyze_regional_affinity(
+                    draws,
+                    number_range=number_range,
+                    numbers_per_draw=regional_cfg.numbers_per_draw_override
+                    or game_config.numbers_to_draw,
+                    min_draws_per_region=regional_cfg.min_draws_per_region,
+                    smoothing_alpha=regional_cfg.smoothing_alpha,
+                    z_threshold=regional_cfg.z_threshold,
+                    game=self.config.active_game,
+                )
             if regional_affinity.warnings:
                 warnings.extend(
                     f"regional_affinity: {w}" for w in regional_affinity.warnings
@@ -361,6 +368,7 @@ class PipelineRunner:
             config_snapshot=self._get_config_snapshot(),
         )
 
+    @profiled("pipeline.physics")
     def _run_physics_layer(
         self,
         draws: list[DrawResult],
@@ -438,6 +446,7 @@ class PipelineRunner:
             recommended_max_picks=recommended_max_picks,
         )
 
+    @profiled("pipeline.sum_distribution")
     def _run_sum_analysis(
         self,
         draws: list[DrawResult],
@@ -484,6 +493,8 @@ class PipelineRunner:
             sums=sums,
             expected_mean=expected_mean,
             bin_width=sum_cfg.bin_width,
+            numbers_range=game_config.numbers_range,
+            numbers_drawn=game_config.numbers_to_draw,
         )
 
         # Derive bounds from detected clusters
@@ -496,6 +507,7 @@ class PipelineRunner:
 
         return result, sum_bounds
 
+    @profiled("pipeline.summen_signatur")
     def _run_summen_signatur(
         self,
         draws: list[DrawResult],
@@ -506,7 +518,7 @@ class PipelineRunner:
         if not draws:
             return None, None
 
-        records = compute_summen_signatur(
+        table = compute_summen_signatur_table(
             draws=draws,
             keno_types=cfg.keno_types,
             bucket_std_low=cfg.bucket_std_low,
@@ -515,10 +527,10 @@ class PipelineRunner:
             number_range=self.config.get_active_game().numbers_range,
             source=source_path or "",
         )
-        if not records:
+        if not len(table):
             return None, None
 
-        bucket_counts = aggregate_bucket_counts(records)
+        bucket_counts = table.bucket_counts()
         metadata = {
             "source": source_path or "",
             "keno_types": cfg.keno_types,
@@ -527,9 +539,25 @@ class PipelineRunner:
             "bucket_std_high": cfg.bucket_std_high,
             "generated_by": "pipeline_runner",
         }
-        export_summen_signatur(records, cfg.latest_output, metadata)
+        export_summen_signatur(table, cfg.latest_output, metadata)
+
+        if cfg.parquet_output:
+            try:
+                append_signatures_parquet(
+                    draws,
+                    cfg.parquet_output,
+                    keno_types=cfg.keno_types,
+                    bucket_std_low=cfg.bucket_std_low,
+                    bucket_std_high=cfg.bucket_std_high,
+                    checksum_algorithm=cfg.checksum_algorithm,
+                    number_range=self.config.get_active_game().numbers_range,
+                    source=source_path or "",
+                )
+            except ImportError as e:
+                logger.warning(f"Summen-Signatur parquet export skipped: {e}")
         return bucket_counts, cfg.latest_output
 
+    @profiled("pipeline.least_action")
     def _run_least_action_selection(
         self,
         performance_overrides: Optional[dict[str, float]] = None,
@@ -605,6 +633,7 @@ class PipelineRunner:
                     "latest_output": summen_cfg.latest_output,
                     "train_output": summen_cfg.train_output,
                     "test_output": summen_cfg.test_output,
+                    "parquet_output": summen_cfg.parquet_output,
                 },
             },
         }
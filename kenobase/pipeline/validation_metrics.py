@@ -19,6 +19,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from kenobase.core.bitmask import encode, encode_draws, intersection_count
+
 if TYPE_CHECKING:
     from kenobase.core.data_loader import DrawResult
 
@@ -82,11 +84,10 @@ def calculate_hits(
         >>> calculate_hits([1, 2, 3], draws)
         5
     """
-    hits = 0
-    predicted_set = set(predicted)
-    for draw in draws:
-        hits += len(predicted_set.intersection(draw.numbers))
-    return hits
+    if not draws:
+        return 0
+    draw_masks = encode_draws(draws)
+    return int(intersection_count(draw_masks, encode(predicted)).sum())
 
 
 def calculate_precision(
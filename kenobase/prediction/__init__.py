@@ -23,64 +23,172 @@ Usage:
     predictions = trainer.predict(draws, top_n=10)
 """
 
-from kenobase.prediction.synthesizer import HypothesisSynthesizer
-from kenobase.prediction.recommendation import (
-    generate_recommendations,
-    Recommendation,
-    RecommendationTier,
-)
-from kenobase.prediction.model import (
-    KenoPredictor,
-    ModelConfig,
-    ModelMetrics,
-    PredictionResult,
-    HAS_LIGHTGBM,
-    HAS_OPTUNA,
-)
-from kenobase.prediction.trainer import (
-    KenoTrainer,
-    TrainingReport,
-    WalkForwardConfig,
-    WalkForwardResult,
-)
-from kenobase.prediction.ensemble import (
-    EnsemblePredictor,
-    EnsemblePrediction,
-    EnsembleReport,
-)
-from kenobase.prediction.storage import (
-    Prediction,
-    PredictionMetrics,
-    PredictionStorage,
-    generate_draw_id,
-)
-from kenobase.prediction.explainability import (
-    SHAPExplainer,
-    SHAPExplanation,
-    HAS_SHAP,
-    validate_shap_native_correlation,
-)
-from kenobase.prediction.state_aware import (
-    StateAwarePredictor,
-    StateAwarePrediction,
-    StateAwareReport,
-    DEFAULT_STATE_ALPHAS,
-)
-from kenobase.prediction.win_class_calculator import (
-    GK_LABELS_BY_TYPE,
-    WinClassResult,
-    TicketEvaluation,
-    get_gewinnklasse,
-    calculate_hits,
-    evaluate_ticket_single_draw,
-    evaluate_ticket_parallel,
-    evaluate_v1_v2_parallel,
-    format_evaluation_summary,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from kenobase.prediction.synthesizer import HypothesisSynthesizer
+    from kenobase.prediction.results_index import (
+        HypothesisView,
+        ResultsIndex,
+        clear_results_index,
+        get_results_index,
+    )
+    from kenobase.prediction.recommendation import (
+        generate_recommendations,
+        Recommendation,
+        RecommendationTier,
+    )
+    from kenobase.prediction.model import (
+        KenoPredictor,
+        ModelConfig,
+        ModelMetrics,
+        PredictionResult,
+        HAS_LIGHTGBM,
+        HAS_OPTUNA,
+    )
+    from kenobase.prediction.trainer import (
+        KenoTrainer,
+        TrainingReport,
+        WalkForwardConfig,
+        WalkForwardResult,
+    )
+    from kenobase.prediction.ensemble import (
+        EnsemblePredictor,
+        EnsemblePrediction,
+        EnsembleReport,
+    )
+    from kenobase.prediction.storage import (
+        Prediction,
+        PredictionMetrics,
+        PredictionStorage,
+        SQLitePredictionStorage,
+        generate_draw_id,
+    )
+    from kenobase.prediction.explainability import (
+        SHAPBatch,
+        SHAPExplainer,
+        SHAPExplanation,
+        HAS_SHAP,
+        clear_shap_cache,
+        validate_shap_native_correlation,
+    )
+    from kenobase.prediction.state_aware import (
+        StateAwarePredictor,
+        StateAwarePrediction,
+        StateAwareReport,
+        DEFAULT_STATE_ALPHAS,
+    )
+    from kenobase.prediction.win_class_calculator import (
+        GK_LABELS_BY_TYPE,
+        WinClassResult,
+        TicketEvaluation,
+        get_gewinnklasse,
+        calculate_hits,
+        evaluate_ticket_single_draw,
+        evaluate_ticket_parallel,
+        evaluate_v1_v2_parallel,
+        format_evaluation_summary,
+    )
+
+# Oeffentlicher Name -> Submodul; importiert wird erst beim ersten Zugriff (PEP 562)
+_LAZY_EXPORTS: dict[str, tuple[str, ...]] = {
+    "synthesizer": (
+        "HypothesisSynthesizer",
+    ),
+    "results_index": (
+        "HypothesisView",
+        "ResultsIndex",
+        "clear_results_index",
+        "get_results_index",
+    ),
+    "recommendation": (
+        "generate_recommendations",
+        "Recommendation",
+        "RecommendationTier",
+    ),
+    "model": (
+        "KenoPredictor",
+        "ModelConfig",
+        "ModelMetrics",
+        "PredictionResult",
+        "HAS_LIGHTGBM",
+        "HAS_OPTUNA",
+    ),
+    "trainer": (
+        "KenoTrainer",
+        "TrainingReport",
+        "WalkForwardConfig",
+        "WalkForwardResult",
+    ),
+    "ensemble": (
+        "EnsemblePredictor",
+        "EnsemblePrediction",
+        "EnsembleReport",
+    ),
+    "storage": (
+        "Prediction",
+        "PredictionMetrics",
+        "PredictionStorage",
+        "SQLitePredictionStorage",
+        "generate_draw_id",
+    ),
+    "explainability": (
+        "SHAPBatch",
+        "SHAPExplainer",
+        "SHAPExplanation",
+        "HAS_SHAP",
+        "clear_shap_cache",
+        "validate_shap_native_correlation",
+    ),
+    "state_aware": (
+        "StateAwarePredictor",
+        "StateAwarePrediction",
+        "StateAwareReport",
+        "DEFAULT_STATE_ALPHAS",
+    ),
+    "win_class_calculator": (
+        "GK_LABELS_BY_TYPE",
+        "WinClassResult",
+        "TicketEvaluation",
+        "get_gewinnklasse",
+        "calculate_hits",
+        "evaluate_ticket_single_draw",
+        "evaluate_ticket_parallel",
+        "evaluate_v1_v2_parallel",
+        "format_evaluation_summary",
+    ),
+}
+
+_EXPORT_INDEX: dict[str, tuple[str, str]] = {
+    name: (module, name) for module, names in _LAZY_EXPORTS.items() for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _EXPORT_INDEX[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Synthesizer
     "HypothesisSynthesizer",
+    # Results Index
+    "HypothesisView",
+    "ResultsIndex",
+    "clear_results_index",
+    "get_results_index",
     # Recommendation
     "generate_recommendations",
     "Recommendation",
@@ -105,11 +213,14 @@ __all__ = [
     "Prediction",
     "PredictionMetrics",
     "PredictionStorage",
+    "SQLitePredictionStorage",
     "generate_draw_id",
     # Explainability (TASK-P14)
+    "SHAPBatch",
     "SHAPExplainer",
     "SHAPExplanation",
     "HAS_SHAP",
+    "clear_shap_cache",
     "validate_shap_native_correlation",
     # State-Aware (TASK_004)
     "StateAwarePredictor",
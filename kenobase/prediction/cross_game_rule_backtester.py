@@ -27,6 +27,7 @@ from typing import Optional
 import numpy as np
 
 from kenobase.analysis.cross_lottery_coupling import GameDraws
+from kenobase.core.profiling import profiled
 from kenobase.prediction.position_rule_layer import BASE_ABSENCE, BASE_PRESENCE, KENO_MAX_NUMBER
 
 
@@ -123,6 +124,7 @@ def _parse_ordered_value_trigger(trigger: str) -> tuple[str, int]:
     return label, int(value)
 
 
+@profiled("backtest.cross_game_rule_layer")
 def backtest_cross_game_rule_layer(
     keno: GameDraws,
     *,
@@ -34,6 +34,7 @@ from typing import Any, Optional, Union
 import numpy as np
 
 from kenobase.core.data_loader import DrawResult
+from kenobase.features.snapshots import FeatureSnapshots
 from kenobase.prediction.model import (
     KenoPredictor,
     ModelConfig,
@@ -196,6 +197,7 @@ class EnsemblePredictor:
         results_dir: str = "results",
         model_config: Optional[ModelConfig] = None,
         wf_config: Optional[WalkForwardConfig] = None,
+        feature_snapshots: Optional[FeatureSnapshots] = None,
     ):
         """Initialisiert den EnsemblePredictor.
 
@@ -206,6 +208,8 @@ class EnsemblePredictor:
             results_dir: Pfad zu HYP-Ergebnis-Dateien
             model_config: Optionale ModelConfig fuer ML
             wf_config: Optionale WalkForwardConfig fuer ML
+            feature_snapshots: Vorberechnete Walk-Forward-Features fuer den ML-Teil
+                (siehe KenoTrainer)
         """
         if not 0.0 <= alpha <= 1.0:
             raise ValueError(f"alpha muss zwischen 0 und 1 liegen, ist {alpha}")
@@ -231,6 +235,7 @@ class EnsemblePredictor:
             wf_config=wf_config,
             numbers_range=numbers_range,
             numbers_to_draw=numbers_to_draw,
+            feature_snapshots=feature_snapshots,
         )
 
         # Confidence Interval Estimator
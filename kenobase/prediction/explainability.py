@@ -9,12 +9,21 @@ Hauptfunktionen:
 - summary_plot: Visualisierung der wichtigsten Features
 - force_plot: Visualisierung einer einzelnen Vorhersage
 
+SHAP-Werte werden als ein (n_samples, n_features) Array berechnet und
+pro (Modell-Hash, Input-Hash) zwischengespeichert. Fuer LightGBM wird
+standardmaessig die native TreeSHAP-Implementierung (pred_contrib=True)
+verwendet; das shap-Paket ist dann nur fuer Plots erforderlich.
+
 Referenz: TASK-P14 Model Explainability
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional, Union
@@ -90,11 +99,88 @@ class SHAPExplanation:
         ]
 
 
+# Prozessweiter Cache: (model_hash, input_hash) -> SHAP-Matrix
+_SHAP_CACHE: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+_SHAP_CACHE_LOCK = threading.Lock()
+SHAP_CACHE_MAXSIZE = 32
+
+
+def clear_shap_cache() -> None:
+    """Leert den prozessweiten SHAP-Cache."""
+    with _SHAP_CACHE_LOCK:
+        _SHAP_CACHE.clear()
+
+
+def _hash_array(X: np.ndarray) -> str:
+    """Stabiler Hash ueber Shape, dtype und Inhalt eines Arrays."""
+    X = np.ascontiguousarray(X)
+    digest = hashlib.sha1(str((X.shape, X.dtype.str)).encode())
+    digest.update(X.tobytes())
+    return digest.hexdigest()
+
+
+class SHAPBatch(Sequence):
+    """SHAP-Werte fuer mehrere Vorhersagen als eine Matrix.
+
+    Verhaelt sich wie eine Liste von SHAPExplanation, baut die
+    Einzelobjekte aber erst beim Zugriff.
+
+    Attributes:
+        values: SHAP-Werte (n_samples, n_features)
+        base_value: Baseline-Vorhersage (expected value)
+        feature_names: Namen der Features
+        feature_values: Feature-Matrix (n_samples, n_features)
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        base_value: float,
+        feature_names: list[str],
+        feature_values: np.ndarray,
+    ):
+        self.values = values
+        self.base_value = base_value
+        self.feature_names = feature_names[:values.shape[1]]
+        self.feature_values = feature_values
+
+    @property
+    def predictions(self) -> np.ndarray:
+        """Rohvorhersagen (base_value + Summe der SHAP-Werte) pro Zeile."""
+        return self.base_value + self.values.sum(axis=1)
+
+    def mean_abs(self) -> dict[str, float]:
+        """Mittlere absolute SHAP-Werte pro Feature."""
+        mean_abs = np.abs(self.values).mean(axis=0)
+        return {name: float(val) for name, val in zip(self.feature_names, mean_abs)}
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        shap_vals = self.values[index]
+        return SHAPExplanation(
+            shap_values=shap_vals,
+            base_value=self.base_value,
+            feature_names=self.feature_names,
+            feature_values=self.feature_values[index],
+            prediction=float(self.base_value + np.sum(shap_vals)),
+        )
+
+    def __iter__(self) -> Iterator[SHAPExplanation]:
+        for i in range(len(self)):
+            yield self[i]
+
+
 class SHAPExplainer:
     """SHAP-Explainer fuer LightGBM-Modelle.
 
-    Verwendet TreeExplainer fuer optimale Performance mit LightGBM.
-    TreeExplainer nutzt die Baumstruktur direkt (O(n) statt O(2^n)).
+    Verwendet fuer LightGBM die native TreeSHAP-Implementierung
+    (``pred_contrib=True``), sonst shap.TreeExplainer. Beide nutzen die
+    Baumstruktur direkt (O(n) statt O(2^n)).
 
     Usage:
         predictor = KenoPredictor()
@@ -103,8 +189,9 @@ class SHAPExplainer:
         explainer = SHAPExplainer(predictor)
         explanation = explainer.explain_single(X_test[0])
 
-        # Oder fuer Batch:
-        explanations = explainer.explain_batch(X_test[:10])
+        # Oder fuer Batch (eine Matrix, Einzelobjekte on demand):
+        batch = explainer.explain_batch(X_test[:10])
+        batch.values  # (10, n_features)
     """
 
     def __init__(
@@ -112,29 +199,31 @@ class SHAPExplainer:
         predictor: Any,
         feature_names: Optional[list[str]] = None,
         check_additivity: bool = True,
+        backend: str = "auto",
+        use_cache: bool = True,
     ):
         """Initialisiert den SHAP-Explainer.
 
         Args:
             predictor: Trainierter KenoPredictor
             feature_names: Optionale Feature-Namen (sonst aus Predictor)
-            check_additivity: SHAP additivity check (kann Performance reduzieren)
+            check_additivity: SHAP additivity check (nur Backend "shap")
+            backend: "auto" (native fuer LightGBM, sonst shap), "native" oder "shap"
+            use_cache: SHAP-Matrizen pro (Modell, Input) zwischenspeichern
 
         Raises:
-            ImportError: Wenn SHAP nicht installiert ist
-            ValueError: Wenn Predictor nicht trainiert ist
+            ImportError: Wenn das Backend "shap" benoetigt wird, aber fehlt
+            ValueError: Wenn Predictor nicht trainiert ist oder Backend unbekannt
         """
-        if not HAS_SHAP:
-            raise ImportError(
-                "SHAP ist nicht installiert. "
-                "Installiere via: pip install shap>=0.44.0"
-            )
+        if backend not in ("auto", "native", "shap"):
+            raise ValueError(f"Unbekanntes SHAP-Backend: {backend}")
 
         if not predictor._is_trained:
             raise ValueError("Predictor muss zuerst trainiert werden.")
 
         self._predictor = predictor
         self._check_additivity = check_additivity
+        self._use_cache = use_cache
 
         # Feature-Namen aus Predictor oder explizit
         if feature_names is not None:
@@ -144,28 +233,63 @@ class SHAPExplainer:
         else:
             self._feature_names = [f"feature_{i}" for i in range(20)]
 
-        # Erstelle TreeExplainer fuer LightGBM
         model = predictor._models[0]
 
         # Pruefe ob es ein BoosterWrapper (nach load) oder LGBMClassifier ist
         if hasattr(model, "_booster"):
             # BoosterWrapper nach model.load()
-            self._explainer = shap.TreeExplainer(model._booster)
+            booster = model._booster
         elif hasattr(model, "booster_"):
             # LGBMClassifier nach model.train()
-            self._explainer = shap.TreeExplainer(model.booster_)
+            booster = model.booster_
+        else:
+            booster = None
+
+        if backend == "auto":
+            backend = "native" if booster is not None else "shap"
+        if backend == "native" and booster is None:
+            raise ValueError("Native SHAP erfordert ein LightGBM-Modell.")
+        if backend == "shap" and not HAS_SHAP:
+            raise ImportError(
+                "SHAP ist nicht installiert. "
+                "Installiere via: pip install shap>=0.44.0"
+            )
+        self._backend = backend
+
+        # Cache-Schluessel: Modellinhalt + Backend (identische Modelle teilen Eintraege)
+        if booster is not None:
+            model_digest = hashlib.sha1(booster.model_to_string().encode()).hexdigest()
         else:
-            # Fallback: versuche direkt
-            self._explainer = shap.TreeExplainer(model)
-
-        # Handle expected_value which may be scalar or array
-        expected = self._explainer.expected_value
-        if hasattr(expected, "__len__") and len(expected) > 0:
-            # Array-like: take first element (for binary classification)
-            self._base_value = float(expected[0]) if len(expected) == 1 else float(expected[1])
+            model_digest = f"id-{id(model)}"
+        self._model_hash = f"{backend}:{model_digest}"
+
+        if backend == "native":
+            self._booster = booster
+            self._explainer = None
+            # Letzte Spalte von pred_contrib ist der expected value
+            probe = np.zeros((1, booster.num_feature()))
+            self._base_value = float(booster.predict(probe, pred_contrib=True)[0, -1])
         else:
-            self._base_value = float(expected)
-        logger.debug(f"SHAP TreeExplainer initialisiert. Base value: {self._base_value:.4f}")
+            self._booster = None
+            self._explainer = shap.TreeExplainer(booster if booster is not None else model)
+
+            # Handle expected_value which may be scalar or array
+            expected = self._explainer.expected_value
+            if hasattr(expected, "__len__") and len(expected) > 0:
+                # Array-like: take first element (for binary classification)
+                self._base_value = float(expected[0]) if len(expected) == 1 else float(expected[1])
+            else:
+                self._base_value = float(expected)
+
+        logger.debug(
+            f"SHAP Explainer ({self._backend}) initialisiert. "
+            f"Base value: {self._base_value:.4f}"
+        )
+
+    @property
+    def backend(self) -> str:
+        """Verwendetes Backend ("native" oder "shap")."""
+        return self._backend
 
     @property
     def base_value(self) -> float:
@@ -177,74 +301,89 @@ class SHAPExplainer:
         """Feature-Namen."""
         return self._feature_names
 
-    def explain_single(
-        self,
-        X: np.ndarray,
-    ) -> SHAPExplanation:
-        """Erklaert eine einzelne Vorhersage.
+    def shap_values(self, X: np.ndarray) -> np.ndarray:
+        """Berechnet SHAP-Werte als Matrix (mit Cache).
 
         Args:
-            X: Feature-Vektor (1D array) oder (1, n_features)
+            X: Feature-Matrix (n_samples, n_features) oder 1D-Vektor
 
         Returns:
-            SHAPExplanation mit SHAP-Werten
+            Array (n_samples, n_features) fuer die positive Klasse
         """
-        # Stelle sicher dass X 2D ist
+        X = np.asarray(X)
         if X.ndim == 1:
             X = X.reshape(1, -1)
 
+        if not self._use_cache:
+            return self._compute_shap_values(X)
+
+        key = (self._model_hash, _hash_array(X))
+        with _SHAP_CACHE_LOCK:
+            cached = _SHAP_CACHE.get(key)
+            if cached is not None:
+                _SHAP_CACHE.move_to_end(key)
+                return cached
+
+        values = self._compute_shap_values(X)
+        values.setflags(write=False)
+
+        with _SHAP_CACHE_LOCK:
+            _SHAP_CACHE[key] = values
+            while len(_SHAP_CACHE) > SHAP_CACHE_MAXSIZE:
+                _SHAP_CACHE.popitem(last=False)
+
+        return values
+
+    def _compute_shap_values(self, X: np.ndarray) -> np.ndarray:
+        """Berechnet SHAP-Werte ohne Cache."""
+        if self._backend == "native":
+            contrib = self._booster.predict(X, pred_contrib=True)
+            return np.asarray(contrib)[:, :-1]
+
         shap_values = self._explainer.shap_values(X, check_additivity=self._check_additivity)
 
         # LightGBM binary classifier: shap_values kann [neg_class, pos_class] sein
         if isinstance(shap_values, list) and len(shap_values) == 2:
             shap_values = shap_values[1]  # Positive Klasse
 
-        shap_vals = shap_values[0]  # Erste (einzige) Vorhersage
-        prediction = float(self._base_value + np.sum(shap_vals))
+        return np.asarray(shap_values)
 
-        return SHAPExplanation(
-            shap_values=shap_vals,
-            base_value=self._base_value,
-            feature_names=self._feature_names[:len(shap_vals)],
-            feature_values=X[0],
-            prediction=prediction,
-        )
+    def explain_single(
+        self,
+        X: np.ndarray,
+    ) -> SHAPExplanation:
+        """Erklaert eine einzelne Vorhersage.
+
+        Args:
+            X: Feature-Vektor (1D array) oder (1, n_features)
+
+        Returns:
+            SHAPExplanation mit SHAP-Werten
+        """
+        return self.explain_batch(X)[0]
 
     def explain_batch(
         self,
         X: np.ndarray,
-    ) -> list[SHAPExplanation]:
+    ) -> SHAPBatch:
         """Erklaert mehrere Vorhersagen.
 
         Args:
             X: Feature-Matrix (n_samples, n_features)
 
         Returns:
-            Liste von SHAPExplanation
+            SHAPBatch (Sequenz von SHAPExplanation, lazy)
         """
+        X = np.asarray(X)
         if X.ndim == 1:
             X = X.reshape(1, -1)
 
-        shap_values = self._explainer.shap_values(X, check_additivity=self._check_additivity)
-
-        # LightGBM binary classifier handling
-        if isinstance(shap_values, list) and len(shap_values) == 2:
-            shap_values = shap_values[1]
-
-        explanations = []
-        for i in range(len(X)):
-            shap_vals = shap_values[i]
-            prediction = float(self._base_value + np.sum(shap_vals))
-
-            explanations.append(SHAPExplanation(
-                shap_values=shap_vals,
-                base_value=self._base_value,
-                feature_names=self._feature_names[:len(shap_vals)],
-                feature_values=X[i],
-                prediction=prediction,
-            ))
-
-        return explanations
+        return SHAPBatch(
+            values=self.shap_values(X),
+            base_value=self._base_value,
+            feature_names=self._feature_names,
+            feature_values=X,
+        )
 
     def get_mean_abs_shap(
         self,
@@ -261,20 +400,7 @@ class SHAPExplainer:
         Returns:
             Dict mit Feature-Name -> mean(|SHAP|)
         """
-        if X.ndim == 1:
-            X = X.reshape(1, -1)
-
-        shap_values = self._explainer.shap_values(X, check_additivity=self._check_additivity)
-
-        if isinstance(shap_values, list) and len(shap_values) == 2:
-            shap_values = shap_values[1]
-
-        mean_abs = np.mean(np.abs(shap_values), axis=0)
-
-        return {
-            name: float(val)
-            for name, val in zip(self._feature_names[:len(mean_abs)], mean_abs)
-        }
+        return self.explain_batch(X).mean_abs()
 
     def compare_with_native_importance(
         self,
@@ -353,13 +479,14 @@ class SHAPExplainer:
             logger.warning("matplotlib nicht installiert. Summary plot nicht moeglich.")
             return
 
+        if not HAS_SHAP:
+            logger.warning("SHAP nicht installiert. Summary plot nicht moeglich.")
+            return
+
         if X.ndim == 1:
             X = X.reshape(1, -1)
 
-        shap_values = self._explainer.shap_values(X, check_additivity=self._check_additivity)
-
-        if isinstance(shap_values, list) and len(shap_values) == 2:
-            shap_values = shap_values[1]
+        shap_values = self.shap_values(X)
 
         plt.figure(figsize=(10, 6))
         shap.summary_plot(
@@ -394,13 +521,14 @@ class SHAPExplainer:
         Returns:
             SHAP Force Plot Objekt (fuer Jupyter Display)
         """
+        if not HAS_SHAP:
+            logger.warning("SHAP nicht installiert. Force plot nicht moeglich.")
+            return None
+
         if X.ndim == 1:
             X = X.reshape(1, -1)
 
-        shap_values = self._explainer.shap_values(X, check_additivity=self._check_additivity)
-
-        if isinstance(shap_values, list) and len(shap_values) == 2:
-            shap_values = shap_values[1]
+        shap_values = self.shap_values(X)
 
         force = shap.force_plot(
             self._base_value,
@@ -436,9 +564,6 @@ def validate_shap_native_correlation(
     Returns:
         Tuple aus (passed, correlation, details)
     """
-    if not HAS_SHAP:
-        return False, 0.0, {"error": "SHAP not installed"}
-
     explainer = SHAPExplainer(predictor)
     comparison, correlation = explainer.compare_with_native_importance(X)
 
@@ -454,7 +579,9 @@ def validate_shap_native_correlation(
 
 __all__ = [
     "SHAPExplanation",
+    "SHAPBatch",
     "SHAPExplainer",
+    "clear_shap_cache",
     "HAS_SHAP",
     "validate_shap_native_correlation",
 ]
@@ -22,7 +22,7 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
 from typing import Any, Optional, Union
 
@@ -217,6 +217,7 @@ class KenoPredictor:
         self._models: dict[int, lgb.LGBMClassifier] = {}
         self._is_trained = False
         self._feature_importance: dict[str, float] = {}
+        self.tuning_summary: Optional[dict[str, Any]] = None
 
     def train(
         self,
@@ -404,14 +405,36 @@ class KenoPredictor:
         y: np.ndarray,
         n_trials: int = 50,
         n_folds: int = 5,
+        storage_path: Optional[Union[str, Path]] = None,
+        study_name: str = "keno_predictor",
+        pruner: Optional[str] = "median",
+        n_jobs: int = 1,
+        train_test_ratio: int = 6,
+        block_size: int = 1,
     ) -> ModelConfig:
         """Tuned Hyperparameter mit Optuna.
 
+        Die Folds folgen dem Walk-Forward Schema (Train-Fenster vor
+        Test-Fenster, keine Zukunftsdaten im Training). Nach jedem Fold
+        wird der laufende F1-Mittelwert an Optuna gemeldet, sodass
+        schlechte Trials frueh gepruned werden.
+
+        Mit ``storage_path`` wird die Study in einer lokalen SQLite-Datei
+        persistiert und bei erneutem Aufruf fortgesetzt; ``n_trials`` ist
+        dann die Gesamtzahl abgeschlossener Trials der Study. Nur mit
+        Storage koennen Trials ueber ``n_jobs`` Prozesse verteilt werden.
+
         Args:
-            X: Feature-Matrix
+            X: Feature-Matrix (chronologisch sortiert)
             y: Target-Vektor
-            n_trials: Anzahl Optuna Trials
-            n_folds: Anzahl CV Folds
+            n_trials: Anzahl Optuna Trials (gesamt inkl. bereits gelaufener)
+            n_folds: Anzahl Walk-Forward Folds
+            storage_path: Optionaler Pfad zur SQLite-Datei der Study
+            study_name: Name der Study im Storage
+            pruner: "median", "hyperband" oder None
+            n_jobs: Anzahl paralleler Prozesse (erfordert storage_path)
+            train_test_ratio: Laenge Train-Fenster relativ zum Test-Fenster
+            block_size: Zeilen pro Ziehung (Folds schneiden keine Ziehung)
 
         Returns:
             Beste ModelConfig
@@ -420,49 +443,74 @@ class KenoPredictor:
             logger.warning("Optuna nicht installiert. Verwende Default-Config.")
             return self.config
 
-        from sklearn.model_selection import cross_val_score
-
-        def objective(trial: optuna.Trial) -> float:
-            params = {
-                "boosting_type": "gbdt",
-                "objective": "binary",
-                "metric": "binary_logloss",
-                "learning_rate": trial.suggest_float("learning_rate", 0.01, 0.3, log=True),
-                "num_leaves": trial.suggest_int("num_leaves", 15, 63),
-                "max_depth": trial.suggest_int("max_depth", 3, 12),
-                "min_child_samples": trial.suggest_int("min_child_samples", 10, 100),
-                "subsample": trial.suggest_float("subsample", 0.6, 1.0),
-                "colsample_bytree": trial.suggest_float("colsample_bytree", 0.6, 1.0),
-                "reg_alpha": trial.suggest_float("reg_alpha", 1e-8, 1.0, log=True),
-                "reg_lambda": trial.suggest_float("reg_lambda", 1e-8, 1.0, log=True),
-                "random_state": 42,
-                "verbose": -1,
-                "n_estimators": 100,
-            }
-
-            model = lgb.LGBMClassifier(**params)
-            scores = cross_val_score(
-                model, X, y, cv=n_folds, scoring="f1", n_jobs=-1
+        folds = _walk_forward_folds(
+            len(y), n_folds, train_test_ratio=train_test_ratio, block_size=block_size
+        )
+        if not folds:
+            raise ValueError("Zu wenige Samples fuer Walk-Forward Folds")
+
+        storage = None
+        if storage_path is not None:
+            storage_path = Path(storage_path)
+            storage_path.parent.mkdir(parents=True, exist_ok=True)
+            storage = f"sqlite:///{storage_path.resolve()}"
+        elif n_jobs > 1:
+            logger.warning(
+                "Paralleles Tuning erfordert storage_path. Verwende n_jobs=1."
             )
-            return float(np.mean(scores))
+            n_jobs = 1
+
+        study = optuna.create_study(
+            study_name=study_name,
+            storage=storage,
+            direction="maximize",
+            sampler=optuna.samplers.TPESampler(seed=self.config.random_state),
+            pruner=_make_pruner(pruner, len(folds)),
+            load_if_exists=True,
+        )
+
+        finished_states = (
+            optuna.trial.TrialState.COMPLETE,
+            optuna.trial.TrialState.PRUNED,
+        )
+        n_done = len(study.get_trials(deepcopy=False, states=finished_states))
+        n_remaining = max(0, n_trials - n_done)
+        if n_done:
+            logger.info(f"Resuming study '{study_name}': {n_done} trials done")
+
+        objective = _TuningObjective(
+            X=X,
+            y=y,
+            folds=folds,
+            base_params=self.config.to_lgb_params(),
+            lgb_n_jobs=1 if n_jobs > 1 else -1,
+        )
+
+        if n_remaining > 0 and n_jobs > 1:
+            from joblib import Parallel, delayed
 
-        study = optuna.create_study(direction="maximize")
-        study.optimize(objective, n_trials=n_trials, show_progress_bar=True)
+            shares = [n_remaining // n_jobs] * n_jobs
+            for i in range(n_remaining % n_jobs):
+                shares[i] += 1
+
+            Parallel(n_jobs=n_jobs)(
+                delayed(_optimize_worker)(
+                    storage, study_name, objective, share, pruner, len(folds)
+                )
+                for share in shares
+                if share > 0
+            )
+        elif n_remaining > 0:
+            study.optimize(objective, n_trials=n_remaining, show_progress_bar=False)
 
         best_params = study.best_params
         logger.info(f"Best trial: F1={study.best_value:.4f}")
         logger.info(f"Best params: {best_params}")
 
-        return ModelConfig(
-            learning_rate=best_params["learning_rate"],
-            num_leaves=best_params["num_leaves"],
-            max_depth=best_params["max_depth"],
-            min_child_samples=best_params["min_child_samples"],
-            subsample=best_params["subsample"],
-            colsample_bytree=best_params["colsample_bytree"],
-            reg_alpha=best_params["reg_alpha"],
-            reg_lambda=best_params["reg_lambda"],
-        )
+        best_config = replace(self.config, **best_params)
+        self.tuning_summary = _summarize_study(study, storage_path, best_config)
+
+        return best_config
 
     def get_feature_importance(self) -> dict[str, float]:
         """Gibt Feature-Importance zurueck.
@@ -514,6 +562,11 @@ class KenoPredictor:
         with open(path.with_suffix(".json"), "w") as f:
             json.dump(metadata, f, indent=2)
 
+        # Save tuning history (best config + trials) next to the model
+        if self.tuning_summary is not None:
+            with open(path.with_suffix(".tuning.json"), "w") as f:
+                json.dump(self.tuning_summary, f, indent=2)
+
         logger.info(f"Model saved to {path}")
 
     def load(self, path: Union[str, Path]) -> None:
@@ -531,6 +584,11 @@ class KenoPredictor:
         self.numbers_range = tuple(metadata["numbers_range"])
         self._feature_importance = metadata.get("feature_importance", {})
 
+        tuning_path = path.with_suffix(".tuning.json")
+        if tuning_path.exists():
+            with open(tuning_path, "r") as f:
+                self.tuning_summary = json.load(f)
+
         # Load model - use Booster directly for prediction
         booster = lgb.Booster(model_file=str(path.with_suffix(".lgb")))
 
@@ -603,6 +661,159 @@ class KenoPredictor:
         )
 
 
+# Suchraum fuer Optuna (siehe Modul-Docstring)
+def _suggest_params(trial: "optuna.Trial") -> dict[str, Any]:
+    """Zieht einen Parametersatz aus dem Suchraum."""
+    return {
+        "learning_rate": trial.suggest_float("learning_rate", 0.01, 0.3, log=True),
+        "num_leaves": trial.suggest_int("num_leaves", 15, 63),
+        "max_depth": trial.suggest_int("max_depth", 3, 12),
+        "min_child_samples": trial.suggest_int("min_child_samples", 10, 100),
+        "subsample": trial.suggest_float("subsample", 0.6, 1.0),
+        "colsample_bytree": trial.suggest_float("colsample_bytree", 0.6, 1.0),
+        "reg_alpha": trial.suggest_float("reg_alpha", 1e-8, 1.0, log=True),
+        "reg_lambda": trial.suggest_float("reg_lambda", 1e-8, 1.0, log=True),
+    }
+
+
+def _walk_forward_folds(
+    n_samples: int,
+    n_folds: int,
+    train_test_ratio: int = 6,
+    block_size: int = 1,
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Erzeugt Walk-Forward Folds ueber chronologisch sortierte Samples.
+
+    Analog zu KenoTrainer._walk_forward_validation: ein gleitendes
+    Train-Fenster (``train_test_ratio`` x Testlaenge) direkt vor jedem
+    Test-Fenster. Die letzten ``n_folds`` Test-Fenster decken das Ende
+    der Daten ab. Grenzen liegen auf Vielfachen von ``block_size``,
+    damit die Zeilen einer Ziehung nicht auf Train und Test verteilt werden.
+
+    Args:
+        n_samples: Anzahl Samples
+        n_folds: Anzahl Folds
+        train_test_ratio: Verhaeltnis Train- zu Testlaenge
+        block_size: Zeilen pro Ziehung
+
+    Returns:
+        Liste von (train_idx, test_idx) Tupeln
+    """
+    block_size = max(1, block_size)
+    n_blocks = n_samples // block_size
+    test_blocks = max(1, n_blocks // (n_folds + train_test_ratio))
+    train_blocks = test_blocks * train_test_ratio
+
+    folds = []
+    for k in range(n_folds):
+        test_end = n_blocks - (n_folds - 1 - k) * test_blocks
+        test_start = test_end - test_blocks
+        if test_start <= 0:
+            continue
+        train_start = max(0, test_start - train_blocks)
+
+        stop = n_samples if k == n_folds - 1 else test_end * block_size
+        folds.append((
+            np.arange(train_start * block_size, test_start * block_size),
+            np.arange(test_start * block_size, stop),
+        ))
+
+    return folds
+
+
+def _make_pruner(name: Optional[str], n_folds: int) -> "optuna.pruners.BasePruner":
+    """Erstellt den Optuna-Pruner (Schritte = Folds)."""
+    if name is None or name == "none":
+        return optuna.pruners.NopPruner()
+    if name == "median":
+        return optuna.pruners.MedianPruner(n_startup_trials=5, n_warmup_steps=1)
+    if name == "hyperband":
+        return optuna.pruners.HyperbandPruner(min_resource=1, max_resource=n_folds)
+    raise ValueError(f"Unbekannter Pruner: {name}")
+
+
+@dataclass
+class _TuningObjective:
+    """Picklebare Optuna-Objective (auch fuer Worker-Prozesse).
+
+    Meldet nach jedem Fold den laufenden F1-Mittelwert und bricht ab,
+    sobald der Pruner den Trial verwirft.
+    """
+
+    X: np.ndarray
+    y: np.ndarray
+    folds: list[tuple[np.ndarray, np.ndarray]]
+    base_params: dict[str, Any]
+    lgb_n_jobs: int = -1
+
+    def __call__(self, trial: "optuna.Trial") -> float:
+        from sklearn.metrics import f1_score
+
+        params = {**self.base_params, **_suggest_params(trial), "n_jobs": self.lgb_n_jobs}
+
+        scores = []
+        for step, (train_idx, test_idx) in enumerate(self.folds):
+            model = lgb.LGBMClassifier(**params)
+            model.fit(self.X[train_idx], self.y[train_idx])
+            y_pred = model.predict(self.X[test_idx])
+            scores.append(f1_score(self.y[test_idx], y_pred, zero_division=0))
+
+            trial.report(float(np.mean(scores)), step)
+            if trial.should_prune():
+                raise optuna.TrialPruned()
+
+        return float(np.mean(scores))
+
+
+def _optimize_worker(
+    storage: str,
+    study_name: str,
+    objective: _TuningObjective,
+    n_trials: int,
+    pruner: Optional[str],
+    n_folds: int,
+) -> None:
+    """Worker-Prozess: laedt die geteilte Study und fuehrt Trials aus."""
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    study = optuna.load_study(
+        study_name=study_name,
+        storage=storage,
+        pruner=_make_pruner(pruner, n_folds),
+    )
+    study.optimize(objective, n_trials=n_trials)
+
+
+def _summarize_study(
+    study: "optuna.Study",
+    storage_path: Optional[Path],
+    best_config: ModelConfig,
+) -> dict[str, Any]:
+    """Fasst Study-Verlauf und beste Config als JSON-Dict zusammen."""
+    trials = study.get_trials(deepcopy=False)
+    return {
+        "study_name": study.study_name,
+        "storage": str(storage_path) if storage_path is not None else None,
+        "best_value": float(study.best_value),
+        "best_params": study.best_params,
+        "best_config": asdict(best_config),
+        "n_trials": len(trials),
+        "n_complete": sum(t.state == optuna.trial.TrialState.COMPLETE for t in trials),
+        "n_pruned": sum(t.state == optuna.trial.TrialState.PRUNED for t in trials),
+        "trials": [
+            {
+                "number": t.number,
+                "state": t.state.name,
+                "value": t.value,
+                "params": t.params,
+                "intermediate_values": {
+                    str(k): v for k, v in t.intermediate_values.items()
+                },
+            }
+            for t in trials
+        ],
+    }
+
+
 __all__ = [
     "ModelConfig",
     "ModelMetrics",
@@ -23,7 +23,11 @@ import numpy as np
 from scipy import stats
 
 from kenobase.analysis.near_miss import KENO_PROBABILITIES
+from kenobase.core.bitmask import encode_draws, intersection_count, masks_to_array, number_mask
 from kenobase.core.data_loader import DrawResult, GameType
+from kenobase.core.draw_collection import sort_draws
+from kenobase.core.keno_ev import hypergeom_mean_var
+from kenobase.core.profiling import profiled
 from kenobase.prediction.position_rule_layer import (
     BASE_ABSENCE,
     BASE_PRESENCE,
@@ -101,20 +105,6 @@ class PositionRuleLayerBacktestPayload:
     top_rules: dict
 
 
-def _hypergeom_mean_var(
-    *,
-    keno_type: int,
-    numbers_range: int = 70,
-    numbers_drawn: int = 20,
-) -> tuple[float, float]:
-    n = numbers_drawn
-    N = numbers_range
-    K = keno_type
-    mean = n * (K / N)
-    var = n * (K / N) * (1.0 - K / N) * ((N - n) / (N - 1))
-    return float(mean), float(var)
-
-
 def _chi_square_from_counts(
     observed: dict[int, int],
     expected: dict[int, float],
@@ -203,7 +193,7 @@ def _finalize_metrics(
 ) -> ModelMetrics:
     n_predictions = len(hits_list)
     mean_hits = float(np.mean(hits_list)) if hits_list else 0.0
-    expected_mean, var = _hypergeom_mean_var(keno_type=keno_type)
+    expected_mean, var = hypergeom_mean_var(keno_type=keno_type)
 
     mean_z = None
     mean_p = None
@@ -271,6 +261,7 @@ def _finalize_metrics(
     )
 
 
+@profiled("backtest.position_rule_layer")
 def backtest_position_rule_layer(
     draws: list[DrawResult],
     *,
@@ -301,7 +292,7 @@ def backtest_position_rule_layer(
     if not 0.0 <= recent_weight <= 1.0:
         raise ValueError("recent_weight must be in [0, 1]")
 
-    sorted_draws = sorted(draws, key=lambda d: d.date)
+    sorted_draws = sort_draws(draws)
     ordered_by_i = [extract_ordered_keno_numbers(d) for d in sorted_draws]
 
     # Sanity: ordered data should not be purely sorted most of the time.
@@ -337,9 +328,9 @@ def backtest_position_rule_layer(
     # Rule miner (rolling transitions)
     miner = RollingPositionRuleMiner(window_size=rule_window)
 
-    # Storage per model/k
-    hits_base: dict[int, list[int]] = defaultdict(list)
-    hits_rules: dict[int, list[int]] = defaultdict(list)
+    # Storage per model/k (ticket bitmasks, hits evaluated vectorized after the loop)
+    masks_base: dict[int, list[int]] = defaultdict(list)
+    masks_rules: dict[int, list[int]] = defaultdict(list)
     last_ticket_base: dict[int, list[int]] = defaultdict(list)
     last_ticket_rules: dict[int, list[int]] = defaultdict(list)
 
@@ -421,12 +412,22 @@ def backtest_position_rule_layer(
                 last_ticket_base[int(k)] = ticket_base
                 last_ticket_rules[int(k)] = ticket_rules
 
-                hits_base[int(k)].append(len(next_set.intersection(ticket_base)))
-                hits_rules[int(k)].append(len(next_set.intersection(ticket_rules)))
+                masks_base[int(k)].append(number_mask(ticket_base))
+                masks_rules[int(k)].append(number_mask(ticket_rules))
 
         # Add next draw to history for next iteration.
         add_history(sorted_draws[i + 1].numbers)
 
+    # Tickets built on day i are evaluated against draw i + 1.
+    next_masks = encode_draws(sorted_draws[start_index + 1 :])
+    hits_base = {
+        k: intersection_count(masks_to_array(m), next_masks).tolist() for k, m in masks_base.items()
+    }
+    hits_rules = {
+        k: intersection_count(masks_to_array(m), next_masks).tolist()
+        for k, m in masks_rules.items()
+    }
+
     # Finalize metrics per k
     by_type: dict[str, dict] = {}
     for k in sorted(set(keno_types)):
@@ -0,0 +1,298 @@
+"""Results-Index - Prozessweiter Cache fuer HYP-Ergebnisdateien.
+
+Liest results/hyp*.json genau einmal pro Dateiversion. Eintraege sind ueber
+(Pfad, mtime_ns, Groesse) versioniert; refresh() stat-et nur die Dateien und
+parst ausschliesslich neue oder geaenderte Dateien erneut.
+
+Zusaetzlich zum rohen JSON wird pro Datei eine typisierte HypothesisView
+vorberechnet, damit Konsumenten (HypothesisSynthesizer, FeatureExtractor)
+nicht bei jedem Aufruf verschachtelte Dicts durchlaufen muessen.
+
+Usage:
+    from kenobase.prediction.results_index import get_results_index
+
+    index = get_results_index("results")
+    data = index.results()          # {"HYP-010": {...}, ...}
+    view = index.views()["HYP-010"]
+    view.safe_numbers               # frozenset[int]
+
+Die zurueckgegebenen Dicts werden zwischen Aufrufern geteilt und sind als
+read-only zu behandeln.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+PATTERN_TYPES = ("duo", "trio", "quatro")
+
+
+def _int_set(values: Any) -> frozenset[int]:
+    """Wandelt eine JSON-Liste in frozenset[int] um (ignoriert Nicht-Zahlen)."""
+    if not isinstance(values, list):
+        return frozenset()
+    return frozenset(int(v) for v in values if isinstance(v, (int, float)))
+
+
+@dataclass(frozen=True)
+class HypothesisView:
+    """Typisierte, vorextrahierte Sicht auf ein HYP-Ergebnis.
+
+    Attributes:
+        hypothesis_id: z.B. "HYP-010".
+        source: Pfad der JSON-Datei.
+        data: Rohes JSON (read-only).
+        safe_numbers / popular_numbers: HYP-010 Klassifikation.
+        low_stake_numbers / high_stake_numbers: HYP-012 Klassifikation.
+        pattern_counts: HYP-007 Zahl -> Vorkommen in Top-10-Patterns.
+        holiday_significant: HYP-011 Feiertags-Effekt signifikant.
+        payout_significant: HYP-012 Auszahlungs-Korrelation signifikant.
+        confidence: Top-Level confidence (default 0.5).
+    """
+
+    hypothesis_id: str
+    source: Path
+    data: dict = field(repr=False, compare=False)
+    safe_numbers: frozenset[int] = frozenset()
+    popular_numbers: frozenset[int] = frozenset()
+    low_stake_numbers: frozenset[int] = frozenset()
+    high_stake_numbers: frozenset[int] = frozenset()
+    pattern_counts: dict[int, int] = field(default_factory=dict, compare=False)
+    holiday_significant: bool = False
+    payout_significant: bool = False
+    confidence: float = 0.5
+
+    @classmethod
+    def from_data(cls, data: dict, source: Optional[Path] = None) -> "HypothesisView":
+        """Erstellt die View aus einem HYP-Ergebnis-Dict.
+
+        Args:
+            data: Geparstes JSON eines HYP-Ergebnisses.
+            source: Optionaler Dateipfad.
+
+        Returns:
+            HypothesisView mit allen vorextrahierten Feldern.
+        """
+        classification = data.get("classification", {})
+        if not isinstance(classification, dict):
+            classification = {}
+
+        pattern_counts: dict[int, int] = {}
+        results = data.get("results", {})
+        if isinstance(results, dict):
+            for pattern_type in PATTERN_TYPES:
+                patterns = results.get(pattern_type, {})
+                if not isinstance(patterns, dict):
+                    continue
+                for pattern_info in patterns.get("top_10_patterns", []):
+                    for num in pattern_info.get("pattern", []):
+                        pattern_counts[num] = pattern_counts.get(num, 0) + 1
+
+        holiday = data.get("holiday_analysis", {})
+        correlation = data.get("correlation", {})
+        payout = correlation.get("total_auszahlung", {}) if isinstance(correlation, dict) else {}
+        confidence = data.get("confidence", 0.5)
+
+        return cls(
+            hypothesis_id=data.get("hypothesis", data.get("hypothesis_id", "")),
+            source=Path(source) if source is not None else Path(),
+            data=data,
+            safe_numbers=_int_set(classification.get("safe_numbers")),
+            popular_numbers=_int_set(classification.get("popular_numbers")),
+            low_stake_numbers=_int_set(classification.get("low_stake_numbers")),
+            high_stake_numbers=_int_set(classification.get("high_stake_numbers")),
+            pattern_counts=pattern_counts,
+            holiday_significant=bool(
+                holiday.get("is_significant", False) if isinstance(holiday, dict) else False
+            ),
+            payout_significant=bool(
+                payout.get("is_significant", False) if isinstance(payout, dict) else False
+            ),
+            confidence=confidence if isinstance(confidence, (int, float)) else 0.5,
+        )
+
+
+@dataclass
+class _IndexEntry:
+    """Eine geparste Dateiversion."""
+
+    mtime_ns: int
+    size: int
+    view: Optional[HypothesisView]  # None: kein hypothesis-Key oder ungueltig
+
+
+class ResultsIndex:
+    """Inkrementeller Index ueber results_dir/hyp*.json.
+
+    Thread-safe; eine Instanz pro Verzeichnis wird ueber get_results_index()
+    prozessweit geteilt.
+    """
+
+    def __init__(self, results_dir: str | Path, pattern: str = "hyp*.json"):
+        """Initialisiert den Index (ohne Dateien zu lesen).
+
+        Args:
+            results_dir: Pfad zum Ergebnis-Verzeichnis.
+            pattern: Glob-Pattern der Ergebnisdateien.
+        """
+        self.results_dir = Path(results_dir)
+        self.pattern = pattern
+        self._entries: dict[Path, _IndexEntry] = {}
+        self._lock = threading.Lock()
+        self.parse_count = 0  # Anzahl tatsaechlich geparster Dateien
+
+    def refresh(self) -> int:
+        """Synchronisiert den Index mit dem Dateisystem.
+
+        Returns:
+            Anzahl neu geparster Dateien.
+        """
+        if not self.results_dir.exists():
+            logger.warning(f"Results directory not found: {self.results_dir}")
+            with self._lock:
+                self._entries.clear()
+            return 0
+
+        parsed = 0
+        seen: set[Path] = set()
+        with self._lock:
+            for json_file in self.results_dir.glob(self.pattern):
+                try:
+                    stat = json_file.stat()
+                except OSError:
+                    continue
+                seen.add(json_file)
+
+                entry = self._entries.get(json_file)
+                if (
+                    entry is not None
+                    and entry.mtime_ns == stat.st_mtime_ns
+                    and entry.size == stat.st_size
+                ):
+                    continue
+
+                self._entries[json_file] = _IndexEntry(
+                    mtime_ns=stat.st_mtime_ns,
+                    size=stat.st_size,
+                    view=self._parse(json_file),
+                )
+                parsed += 1
+
+            for removed in set(self._entries) - seen:
+                del self._entries[removed]
+
+            self.parse_count += parsed
+        return parsed
+
+    @staticmethod
+    def _parse(json_file: Path) -> Optional[HypothesisView]:
+        try:
+            with open(json_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning(f"Could not load {json_file}: {e}")
+            return None
+
+        if not isinstance(data, dict):
+            return None
+        view = HypothesisView.from_data(data, json_file)
+        if not view.hypothesis_id:
+            return None
+        logger.debug(f"Indexed {view.hypothesis_id} from {json_file.name}")
+        return view
+
+    def views(self, refresh: bool = True) -> dict[str, HypothesisView]:
+        """Gibt typisierte Views pro Hypothesen-ID zurueck.
+
+        Bei mehreren Dateien mit derselben ID gewinnt die alphabetisch
+        letzte Datei.
+
+        Args:
+            refresh: Vorher refresh() aufrufen (default True).
+
+        Returns:
+            Dict Hypothesen-ID -> HypothesisView.
+        """
+        if refresh:
+            self.refresh()
+        with self._lock:
+            items = sorted(self._entries.items())
+        return {
+            entry.view.hypothesis_id: entry.view
+            for _, entry in items
+            if entry.view is not None
+        }
+
+    def results(self, refresh: bool = True) -> dict[str, dict]:
+        """Gibt rohe JSON-Daten pro Hypothesen-ID zurueck (read-only).
+
+        Args:
+            refresh: Vorher refresh() aufrufen (default True).
+
+        Returns:
+            Dict Hypothesen-ID -> JSON-Daten.
+        """
+        return {
+            hyp_id: view.data for hyp_id, view in self.views(refresh=refresh).items()
+        }
+
+    def clear(self) -> None:
+        """Verwirft alle Eintraege."""
+        with self._lock:
+            self._entries.clear()
+
+
+_INDEXES: dict[Path, ResultsIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_results_index(results_dir: str | Path = "results") -> ResultsIndex:
+    """Gibt den prozessweiten ResultsIndex fuer ein Verzeichnis zurueck.
+
+    Args:
+        results_dir: Pfad zum Ergebnis-Verzeichnis.
+
+    Returns:
+        Geteilter ResultsIndex (wird beim ersten Aufruf angelegt).
+    """
+    key = Path(results_dir).resolve()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = ResultsIndex(key)
+            _INDEXES[key] = index
+        return index
+
+
+def load_hypothesis_results(results_dir: str | Path = "results") -> dict[str, dict]:
+    """Laedt alle HYP-Ergebnisse ueber den prozessweiten Index.
+
+    Args:
+        results_dir: Pfad zum Ergebnis-Verzeichnis.
+
+    Returns:
+        Dict Hypothesen-ID -> JSON-Daten (read-only).
+    """
+    return get_results_index(results_dir).results()
+
+
+def clear_results_index() -> None:
+    """Verwirft alle prozessweiten Indizes (z.B. fuer Tests)."""
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
+
+
+__all__ = [
+    "HypothesisView",
+    "ResultsIndex",
+    "clear_results_index",
+    "get_results_index",
+    "load_hypothesis_results",
+]
@@ -34,6 +34,7 @@ from typing import Any, Optional, Union
 import numpy as np
 
 from kenobase.core.data_loader import DrawResult
+from kenobase.core.draw_collection import sort_draws
 from kenobase.core.economic_state import (
     EconomicState,
     extract_economic_states,
@@ -239,7 +240,7 @@ class StateAwarePredictor:
         logger.info("Fitting StateAwarePredictor...")
 
         # Store draws for prediction
-        self._draws = sorted(draws, key=lambda d: d.date)
+        self._draws = sort_draws(draws)
 
         # 1. Extract economic states
         logger.info("Extracting economic states...")
@@ -437,7 +438,7 @@ class StateAwarePredictor:
             else:
                 # Extract state from latest draws
                 states = extract_economic_states(
-                    draws=sorted(draws, key=lambda d: d.date)[-self.cv_window:],
+                    draws=sort_draws(draws)[-self.cv_window:],
                     window=self.cv_window,
                     numbers_range=self.numbers_range,
                     jackpot_high_threshold=self.jackpot_high_threshold,
@@ -513,7 +514,7 @@ class StateAwarePredictor:
             Current EconomicState
         """
         states = extract_economic_states(
-            draws=sorted(draws, key=lambda d: d.date),
+            draws=sort_draws(draws),
             window=self.cv_window,
             numbers_range=self.numbers_range,
             jackpot_high_threshold=self.jackpot_high_threshold,
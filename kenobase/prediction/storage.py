@@ -34,16 +34,21 @@ Usage:
     # Nach Ziehung
     actuals = [3, 5, 17, 22, 28, ...]
     metrics = storage.compare_and_update(pred.draw_id, actuals)
+
+    # Alternativ: SQLite-Backend (WAL, indiziert, Aggregation in SQL)
+    storage = SQLitePredictionStorage("results/predictions.db")
+    storage.migrate_from_json("results/predictions")
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import sqlite3
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -348,9 +353,439 @@ class PredictionStorage:
         }
 
 
+def _parse_draw_id(draw_id: str) -> tuple[str, Optional[str]]:
+    """Zerlegt eine draw_id in (Spieltyp, ISO-Datum).
+
+    Format: {GAME}-{YYYY}-{MM}-{DD}[-{N}]. Unbekannte Formate liefern
+    das Praefix als Spieltyp und kein Datum.
+    """
+    parts = draw_id.split("-")
+    game = parts[0].upper()
+    if len(parts) >= 4:
+        date_str = "-".join(parts[1:4])
+        try:
+            datetime.strptime(date_str, "%Y-%m-%d")
+            return game, date_str
+        except ValueError:
+            pass
+    return game, None
+
+
+class SQLitePredictionStorage(PredictionStorage):
+    """PredictionStorage mit eingebetteter SQLite-Datenbank.
+
+    Alle Vorhersagen liegen in einer Datei (WAL-Modus). draw_id, Datum,
+    Spieltyp und Strategie (mode) sind indiziert; Aggregat-Metriken
+    werden per SQL berechnet statt durch Einlesen aller Dateien.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS predictions (
+            draw_id TEXT PRIMARY KEY,
+            game TEXT NOT NULL,
+            draw_date TEXT,
+            strategy TEXT NOT NULL,
+            prediction_time TEXT NOT NULL,
+            numbers TEXT NOT NULL,
+            n_numbers INTEGER NOT NULL,
+            tier_predictions TEXT NOT NULL,
+            config TEXT NOT NULL,
+            actuals TEXT,
+            n_actuals INTEGER,
+            hits INTEGER,
+            hit_rate REAL,
+            precision REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_predictions_date ON predictions (draw_date);
+        CREATE INDEX IF NOT EXISTS idx_predictions_game_date ON predictions (game, draw_date);
+        CREATE INDEX IF NOT EXISTS idx_predictions_strategy ON predictions (strategy);
+        CREATE TABLE IF NOT EXISTS prediction_tiers (
+            draw_id TEXT NOT NULL REFERENCES predictions (draw_id) ON DELETE CASCADE,
+            tier TEXT NOT NULL,
+            n_numbers INTEGER NOT NULL,
+            hits INTEGER,
+            PRIMARY KEY (draw_id, tier)
+        );
+    """
+
+    def __init__(self, db_path: Union[str, Path] = "results/predictions.db"):
+        """Initialisiert den SQLite-Storage.
+
+        Args:
+            db_path: Pfad zur Datenbank-Datei
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.storage_dir = self.db_path.parent
+
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(self._SCHEMA)
+
+    def close(self) -> None:
+        """Schliesst die Datenbank-Verbindung."""
+        self._conn.close()
+
+    def __enter__(self) -> "SQLitePredictionStorage":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @staticmethod
+    def _prediction_row(prediction: Prediction) -> tuple:
+        """Konvertiert eine Prediction in eine Tabellenzeile."""
+        game, draw_date = _parse_draw_id(prediction.draw_id)
+        metrics = prediction.metrics
+        return (
+            prediction.draw_id,
+            game,
+            draw_date,
+            prediction.mode,
+            prediction.prediction_time.isoformat(),
+            json.dumps(prediction.numbers),
+            len(prediction.numbers),
+            json.dumps(prediction.tier_predictions),
+            json.dumps(prediction.config, ensure_ascii=False),
+            json.dumps(prediction.actuals) if prediction.actuals else None,
+            len(prediction.actuals) if prediction.actuals else None,
+            metrics.hits if metrics else None,
+            metrics.hit_rate if metrics else None,
+            metrics.precision if metrics else None,
+        )
+
+    @staticmethod
+    def _tier_rows(prediction: Prediction) -> list[tuple]:
+        """Konvertiert Tier-Zahlen (und ggf. Treffer) in Tabellenzeilen."""
+        actuals = set(prediction.actuals)
+        rows = []
+        for tier, tier_nums in prediction.tier_predictions.items():
+            tier_set = set(tier_nums)
+            hits = len(tier_set & actuals) if prediction.metrics else None
+            rows.append((prediction.draw_id, tier, len(tier_set), hits))
+        return rows
+
+    def save_predictions(self, predictions: Iterable[Prediction]) -> int:
+        """Speichert mehrere Vorhersagen in einer Transaktion.
+
+        Bestehende Eintraege mit gleicher draw_id werden ersetzt.
+
+        Args:
+            predictions: Vorhersagen zum Speichern
+
+        Returns:
+            Anzahl gespeicherter Vorhersagen
+        """
+        predictions = list(predictions)
+        with self._conn:
+            self._conn.executemany(
+                "DELETE FROM prediction_tiers WHERE draw_id = ?",
+                [(p.draw_id,) for p in predictions],
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO predictions VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._prediction_row(p) for p in predictions],
+            )
+            self._conn.executemany(
+                "INSERT INTO prediction_tiers VALUES (?, ?, ?, ?)",
+                [row for p in predictions for row in self._tier_rows(p)],
+            )
+        return len(predictions)
+
+    def save_prediction(self, prediction: Prediction) -> Path:
+        """Speichert eine Vorhersage.
+
+        Args:
+            prediction: Vorhersage zum Speichern
+
+        Returns:
+            Pfad zur Datenbank-Datei
+        """
+        self.save_predictions([prediction])
+        logger.info(f"Prediction saved: {prediction.draw_id} ({self.db_path})")
+        return self.db_path
+
+    @staticmethod
+    def _row_to_prediction(row: sqlite3.Row) -> Prediction:
+        """Konvertiert eine Tabellenzeile in eine Prediction."""
+        pred = Prediction(
+            draw_id=row["draw_id"],
+            numbers=json.loads(row["numbers"]),
+            prediction_time=datetime.fromisoformat(row["prediction_time"]),
+            tier_predictions=json.loads(row["tier_predictions"]),
+            mode=row["strategy"],
+            config=json.loads(row["config"]),
+            actuals=json.loads(row["actuals"]) if row["actuals"] else [],
+        )
+        if row["hits"] is not None:
+            pred.metrics = PredictionMetrics(
+                hits=row["hits"],
+                hit_rate=row["hit_rate"],
+                precision=row["precision"],
+            )
+        return pred
+
+    def load_prediction(self, draw_id: str) -> Optional[Prediction]:
+        """Laedt eine Vorhersage.
+
+        Args:
+            draw_id: ID der Ziehung
+
+        Returns:
+            Prediction oder None wenn nicht gefunden
+        """
+        row = self._conn.execute(
+            "SELECT * FROM predictions WHERE draw_id = ?", (draw_id,)
+        ).fetchone()
+        if row is None:
+            logger.warning(f"Prediction not found: {draw_id}")
+            return None
+
+        pred = self._row_to_prediction(row)
+        if pred.metrics is not None:
+            for tier, n_numbers, hits in self._conn.execute(
+                "SELECT tier, n_numbers, hits FROM prediction_tiers WHERE draw_id = ?",
+                (draw_id,),
+            ):
+                pred.metrics.tier_accuracy[tier] = hits / n_numbers if n_numbers else 0.0
+        return pred
+
+    @staticmethod
+    def _where(
+        game: Optional[str],
+        strategy: Optional[str],
+        date_from: Optional[str],
+        date_to: Optional[str],
+        only_evaluated: bool = False,
+    ) -> tuple[str, list]:
+        """Baut WHERE-Klausel fuer die indizierten Filter."""
+        clauses = []
+        params: list = []
+        if game is not None:
+            clauses.append("p.game = ?")
+            params.append(game.upper())
+        if strategy is not None:
+            clauses.append("p.strategy = ?")
+            params.append(strategy)
+        if date_from is not None:
+            clauses.append("p.draw_date >= ?")
+            params.append(date_from)
+        if date_to is not None:
+            clauses.append("p.draw_date <= ?")
+            params.append(date_to)
+        if only_evaluated:
+            clauses.append("p.hits IS NOT NULL")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def list_predictions(
+        self,
+        pattern: str = "*",
+        game: Optional[str] = None,
+        strategy: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> list[str]:
+        """Listet gespeicherte Vorhersagen (nur Index-Zugriff).
+
+        Args:
+            pattern: Glob-Pattern fuer draw_ids (".json" wird ignoriert)
+            game: Optionaler Spieltyp (KENO, LOTTO, ...)
+            strategy: Optionale Strategie (mode)
+            date_from: Optionales Startdatum (YYYY-MM-DD, inklusiv)
+            date_to: Optionales Enddatum (YYYY-MM-DD, inklusiv)
+
+        Returns:
+            Sortierte Liste von draw_ids
+        """
+        where, params = self._where(game, strategy, date_from, date_to)
+        glob = pattern[:-len(".json")] if pattern.endswith(".json") else pattern
+        if glob != "*":
+            where = f"{where} AND p.draw_id GLOB ?" if where else "WHERE p.draw_id GLOB ?"
+            params.append(glob)
+
+        rows = self._conn.execute(
+            f"SELECT p.draw_id FROM predictions p {where} ORDER BY p.draw_id", params
+        )
+        return [row[0] for row in rows]
+
+    def update_actuals(
+        self,
+        actuals_by_draw: dict[str, list[int]],
+    ) -> dict[str, PredictionMetrics]:
+        """Traegt Ist-Ergebnisse fuer mehrere Ziehungen in einer Transaktion ein.
+
+        Args:
+            actuals_by_draw: Mapping draw_id -> tatsaechliche Zahlen
+
+        Returns:
+            Mapping draw_id -> Metriken (unbekannte draw_ids fehlen)
+        """
+        results: dict[str, PredictionMetrics] = {}
+        prediction_rows = []
+        tier_rows = []
+
+        for draw_id, actuals in actuals_by_draw.items():
+            row = self._conn.execute(
+                "SELECT numbers, tier_predictions FROM predictions WHERE draw_id = ?",
+                (draw_id,),
+            ).fetchone()
+            if row is None:
+                logger.error(f"Prediction not found for draw_id: {draw_id}")
+                continue
+
+            tier_predictions = json.loads(row["tier_predictions"])
+            metrics = self.calculate_metrics(
+                predictions=json.loads(row["numbers"]),
+                actuals=actuals,
+                tier_predictions=tier_predictions,
+            )
+            results[draw_id] = metrics
+
+            prediction_rows.append((
+                json.dumps(actuals), len(actuals),
+                metrics.hits, metrics.hit_rate, metrics.precision, draw_id,
+            ))
+            actuals_set = set(actuals)
+            for tier, tier_nums in tier_predictions.items():
+                tier_rows.append((len(set(tier_nums) & actuals_set), draw_id, tier))
+
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE predictions SET actuals = ?, n_actuals = ?, hits = ?, "
+                "hit_rate = ?, precision = ? WHERE draw_id = ?",
+                prediction_rows,
+            )
+            self._conn.executemany(
+                "UPDATE prediction_tiers SET hits = ? WHERE draw_id = ? AND tier = ?",
+                tier_rows,
+            )
+
+        return results
+
+    def compare_and_update(
+        self,
+        draw_id: str,
+        actuals: list[int],
+    ) -> Optional[PredictionMetrics]:
+        """Vergleicht Vorhersage mit Ist-Ergebnis und aktualisiert.
+
+        Args:
+            draw_id: ID der Ziehung
+            actuals: Tatsaechliche Zahlen
+
+        Returns:
+            Berechnete Metriken oder None wenn Vorhersage nicht gefunden
+        """
+        metrics = self.update_actuals({draw_id: actuals}).get(draw_id)
+        if metrics is not None:
+            logger.info(f"Updated prediction {draw_id} with {metrics.hits} hits")
+        return metrics
+
+    def get_aggregate_metrics(
+        self,
+        only_evaluated: bool = True,
+        game: Optional[str] = None,
+        strategy: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> dict:
+        """Berechnet aggregierte Metriken per SQL.
+
+        Args:
+            only_evaluated: Nur Vorhersagen mit Ist-Ergebnissen
+            game: Optionaler Spieltyp
+            strategy: Optionale Strategie (mode)
+            date_from: Optionales Startdatum (YYYY-MM-DD, inklusiv)
+            date_to: Optionales Enddatum (YYYY-MM-DD, inklusiv)
+
+        Returns:
+            Dict mit aggregierten Metriken (gleiches Format wie PredictionStorage)
+        """
+        where, params = self._where(game, strategy, date_from, date_to, only_evaluated)
+        row = self._conn.execute(
+            f"""
+            SELECT
+                COUNT(*) AS count,
+                COUNT(p.hits) AS evaluated,
+                COALESCE(SUM(p.hits), 0) AS total_hits,
+                COALESCE(SUM(CASE WHEN p.hits IS NOT NULL THEN p.n_numbers END), 0)
+                    AS total_predictions,
+                COALESCE(SUM(CASE WHEN p.hits IS NOT NULL THEN p.n_actuals END), 0)
+                    AS total_actuals
+            FROM predictions p {where}
+            """,
+            params,
+        ).fetchone()
+
+        count = row["count"]
+        if not count:
+            return {"count": 0, "message": "No evaluated predictions found"}
+
+        tier_where, tier_params = self._where(game, strategy, date_from, date_to, True)
+        tier_rows = self._conn.execute(
+            f"""
+            SELECT t.tier, SUM(t.hits) AS hits, SUM(t.n_numbers) AS n_numbers
+            FROM prediction_tiers t JOIN predictions p ON p.draw_id = t.draw_id
+            {tier_where}
+            GROUP BY t.tier
+            """,
+            tier_params,
+        ).fetchall()
+
+        total_hits = row["total_hits"]
+        total_predictions = row["total_predictions"]
+        total_actuals = row["total_actuals"]
+
+        return {
+            "count": count,
+            "evaluated": row["evaluated"],
+            "total_hits": total_hits,
+            "avg_hits": round(total_hits / count, 2),
+            "avg_precision": round(
+                total_hits / total_predictions, 4
+            ) if total_predictions else 0,
+            "avg_hit_rate": round(
+                total_hits / total_actuals, 4
+            ) if total_actuals else 0,
+            "tier_precision": {
+                t["tier"]: round(t["hits"] / (t["n_numbers"] or 1), 4)
+                for t in tier_rows
+            },
+        }
+
+    def migrate_from_json(self, json_dir: Union[str, Path]) -> int:
+        """Importiert einen bestehenden JSON-Storage (eine Datei pro Ziehung).
+
+        Idempotent: bereits vorhandene draw_ids werden ueberschrieben.
+
+        Args:
+            json_dir: Verzeichnis des JSON-PredictionStorage
+
+        Returns:
+            Anzahl importierter Vorhersagen
+        """
+        predictions = []
+        for path in sorted(Path(json_dir).glob("*.json")):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    predictions.append(Prediction.from_dict(json.load(f)))
+            except (json.JSONDecodeError, KeyError, ValueError) as e:
+                logger.warning(f"Skipping {path}: {e}")
+
+        count = self.save_predictions(predictions)
+        logger.info(f"Migrated {count} predictions from {json_dir} to {self.db_path}")
+        return count
+
+
 __all__ = [
     "Prediction",
     "PredictionMetrics",
     "PredictionStorage",
+    "SQLitePredictionStorage",
     "generate_draw_id",
 ]
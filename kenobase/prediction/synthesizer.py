@@ -13,15 +13,19 @@ Scoring-Ansatz:
 - Jede Hypothese liefert 0-1 normalisierte Scores
 - Gewichtung basiert auf statistischer Signifikanz
 - Combined Score = gewichtete Summe / Summe der Gewichte
+
+Die JSON-Dateien werden ueber den prozessweiten ResultsIndex geladen
+(nur neue/geaenderte Dateien werden erneut geparst).
 """
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
+
+from kenobase.prediction.results_index import HypothesisView, get_results_index
 
 logger = logging.getLogger(__name__)
 
@@ -75,10 +79,14 @@ class HypothesisSynthesizer:
         self.numbers_range = numbers_range
         self.weights = weights or self.DEFAULT_WEIGHTS.copy()
         self._hyp_results: dict[str, dict] = {}
+        self._hyp_views: dict[str, HypothesisView] = {}
 
     def load_results(self) -> dict[str, dict]:
         """Laedt alle HYP-Ergebnisse aus dem results-Verzeichnis.
 
+        Nutzt den prozessweiten ResultsIndex: unveraenderte Dateien werden
+        nicht erneut geparst. Die Dicts sind geteilt und read-only.
+
         Returns:
             Dict mit Hypothesen-ID als Key und JSON-Daten als Value.
         """
@@ -86,35 +94,30 @@ class HypothesisSynthesizer:
             logger.warning(f"Results directory not found: {self.results_dir}")
             return {}
 
-        results = {}
-        for json_file in self.results_dir.glob("hyp*.json"):
-            try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    hyp_id = data.get("hypothesis", data.get("hypothesis_id", ""))
-                    if hyp_id:
-                        results[hyp_id] = data
-                        logger.info(f"Loaded {hyp_id} from {json_file.name}")
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Could not load {json_file}: {e}")
-
-        self._hyp_results = results
-        return results
-
-    def _extract_hyp007_scores(self, data: dict) -> dict[int, HypothesisScore]:
+        self._hyp_views = get_results_index(self.results_dir).views()
+        self._hyp_results = {
+            hyp_id: view.data for hyp_id, view in self._hyp_views.items()
+        }
+        logger.info(f"Loaded {len(self._hyp_results)} hypothesis results")
+        return self._hyp_results
+
+    @staticmethod
+    def _as_view(data: Union[HypothesisView, dict]) -> HypothesisView:
+        """Akzeptiert View oder rohes Dict (Rueckwaertskompatibilitaet)."""
+        if isinstance(data, HypothesisView):
+            return data
+        return HypothesisView.from_data(data)
+
+    def _extract_hyp007_scores(
+        self, data: Union[HypothesisView, dict]
+    ) -> dict[int, HypothesisScore]:
         """Extrahiert Scores aus HYP-007 (Pattern Validation).
 
         Zahlen die in Top-Patterns vorkommen bekommen hoeheren Score.
         """
         scores = {}
-        pattern_numbers: dict[int, int] = {}  # Zahl -> Haeufigkeit in Top-Patterns
-
-        # Sammle alle Zahlen aus Top-10 Patterns (Duos, Trios, Quatros)
-        for pattern_type in ["duo", "trio", "quatro"]:
-            patterns = data.get("results", {}).get(pattern_type, {})
-            for pattern_info in patterns.get("top_10_patterns", []):
-                for num in pattern_info.get("pattern", []):
-                    pattern_numbers[num] = pattern_numbers.get(num, 0) + 1
+        # Zahl -> Haeufigkeit in Top-10 Patterns (Duos, Trios, Quatros)
+        pattern_numbers = self._as_view(data).pattern_counts
 
         # Normalisiere auf 0-1
         max_count = max(pattern_numbers.values()) if pattern_numbers else 1
@@ -132,16 +135,18 @@ class HypothesisSynthesizer:
 
         return scores
 
-    def _extract_hyp010_scores(self, data: dict) -> dict[int, HypothesisScore]:
+    def _extract_hyp010_scores(
+        self, data: Union[HypothesisView, dict]
+    ) -> dict[int, HypothesisScore]:
         """Extrahiert Scores aus HYP-010 (Odds Correlation).
 
         Safe numbers (wenige Mitspieler) bekommen hoeheren Score.
         Popular numbers (viele Mitspieler) bekommen niedrigeren Score.
         """
         scores = {}
-        classification = data.get("classification", {})
-        safe_numbers = set(classification.get("safe_numbers", []))
-        popular_numbers = set(classification.get("popular_numbers", []))
+        view = self._as_view(data)
+        safe_numbers = view.safe_numbers
+        popular_numbers = view.popular_numbers
 
         for number in range(self.numbers_range[0], self.numbers_range[1] + 1):
             if number in safe_numbers:
@@ -164,16 +169,18 @@ class HypothesisSynthesizer:
 
         return scores
 
-    def _extract_hyp011_scores(self, data: dict) -> dict[int, HypothesisScore]:
+    def _extract_hyp011_scores(
+        self, data: Union[HypothesisView, dict]
+    ) -> dict[int, HypothesisScore]:
         """Extrahiert Scores aus HYP-011 (Temporal Cycles).
 
         Diese Hypothese hat keine per-number Scores, aber der Feiertags-Effekt
         ist signifikant. Wir geben allen Zahlen einen Basis-Score.
         """
         scores = {}
-        holiday = data.get("holiday_analysis", {})
-        is_sig = holiday.get("is_significant", False)
-        confidence = data.get("confidence", 0.5)
+        view = self._as_view(data)
+        is_sig = view.holiday_significant
+        confidence = view.confidence
 
         # Da keine per-number Daten: alle Zahlen bekommen Basis-Score
         base_score = confidence if is_sig else 0.5
@@ -189,19 +196,21 @@ class HypothesisSynthesizer:
 
         return scores
 
-    def _extract_hyp012_scores(self, data: dict) -> dict[int, HypothesisScore]:
+    def _extract_hyp012_scores(
+        self, data: Union[HypothesisView, dict]
+    ) -> dict[int, HypothesisScore]:
         """Extrahiert Scores aus HYP-012 (Stake Correlation).
 
         Low-stake numbers (wenig Einsatz) bekommen hoeheren Score.
         High-stake numbers (viel Einsatz) bekommen niedrigeren Score.
         """
         scores = {}
-        classification = data.get("classification", {})
-        low_stake = set(classification.get("low_stake_numbers", []))
-        high_stake = set(classification.get("high_stake_numbers", []))
+        view = self._as_view(data)
+        low_stake = view.low_stake_numbers
+        high_stake = view.high_stake_numbers
 
         # Auszahlung-Korrelation ist signifikant!
-        payout_sig = data.get("correlation", {}).get("total_auszahlung", {}).get("is_significant", False)
+        payout_sig = view.payout_significant
 
         for number in range(self.numbers_range[0], self.numbers_range[1] + 1):
             if number in low_stake:
@@ -244,7 +253,9 @@ class HypothesisSynthesizer:
         }
 
         for hyp_id, extractor in extractors.items():
-            if hyp_id in self._hyp_results:
+            if hyp_id in self._hyp_views:
+                all_scores[hyp_id] = extractor(self._hyp_views[hyp_id])
+            elif hyp_id in self._hyp_results:
                 all_scores[hyp_id] = extractor(self._hyp_results[hyp_id])
                 logger.info(f"Extracted scores from {hyp_id}")
 
@@ -14,7 +14,11 @@ import numpy as np
 from scipy import stats
 
 from kenobase.analysis.near_miss import KENO_PROBABILITIES
+from kenobase.core.bitmask import encode_draws, intersection_count, masks_to_array, number_mask
 from kenobase.core.data_loader import DrawResult
+from kenobase.core.draw_collection import sort_draws
+from kenobase.core.keno_ev import hypergeom_mean_var
+from kenobase.core.profiling import profiled
 
 
 @dataclass(frozen=True)
@@ -53,17 +57,6 @@ class TicketBacktestResult:
     hit_distribution: HitDistribution
 
 
-def _hypergeom_mean_var(*, keno_type: int, numbers_range: int = 70, numbers_drawn: int = 20) -> tuple[float, float]:
-    """Mean/variance for hits when ticket size=keno_type, draw size=numbers_drawn, population=numbers_range."""
-    # X ~ Hypergeom(N, K=keno_type, n=numbers_drawn) where K are "success states" (ticket numbers).
-    n = numbers_drawn
-    N = numbers_range
-    K = keno_type
-    mean = n * (K / N)
-    var = n * (K / N) * (1.0 - K / N) * ((N - n) / (N - 1))
-    return float(mean), float(var)
-
-
 def _chi_square_from_counts(
     observed: dict[int, int],
     expected: dict[int, float],
@@ -112,6 +105,7 @@ def _chi_square_from_counts(
     return float(chi2), float(p), int(len(merged_obs)), "chi-square vs exact hypergeometric null (merged bins)"
 
 
+@profiled("backtest.weighted_frequency")
 def walk_forward_backtest_weighted_frequency(
     draws: list[DrawResult],
     *,
@@ -140,7 +134,7 @@ def walk_forward_backtest_weighted_frequency(
     if min_n != 1 or max_n != 70:
         raise ValueError("Only numbers_range (1, 70) is supported for KENO backtest")
 
-    sorted_draws = sorted(draws, key=lambda d: d.date)
+    sorted_draws = sort_draws(draws)
     if start_index >= len(sorted_draws):
         raise ValueError(f"start_index={start_index} must be < number of draws ({len(sorted_draws)})")
 
@@ -152,8 +146,8 @@ def walk_forward_backtest_weighted_frequency(
     recent_q: deque[list[int]] = deque()
     recent_counts = {n: 0 for n in numbers}
 
-    # Per keno_type tracking
-    hits_by_k: dict[int, list[int]] = defaultdict(list)
+    # Per keno_type tracking (ticket bitmasks, hits evaluated vectorized below)
+    ticket_masks_by_k: dict[int, list[int]] = defaultdict(list)
     last_ticket_by_k: dict[int, list[int]] = {}
 
     def add_history(draw_numbers: list[int]) -> None:
@@ -190,16 +184,20 @@ def walk_forward_backtest_weighted_frequency(
         # sort by score desc; ties -> smaller number first.
         ranked = sorted(numbers, key=lambda n: (-score[n], n))
 
-        draw_set = set(sorted_draws[i].numbers)
         for k in keno_types:
             ticket = ranked[:k]
             last_ticket_by_k[k] = ticket
-            hits = len(draw_set.intersection(ticket))
-            hits_by_k[k].append(int(hits))
+            ticket_masks_by_k[k].append(number_mask(ticket))
 
         # Update history with current draw for next step
         add_history(sorted_draws[i].numbers)
 
+    draw_masks = encode_draws(sorted_draws[start_index:])
+    hits_by_k: dict[int, list[int]] = {
+        k: intersection_count(masks_to_array(masks), draw_masks).tolist()
+        for k, masks in ticket_masks_by_k.items()
+    }
+
     results: list[TicketBacktestResult] = []
     n_predictions = len(sorted_draws) - start_index
 
@@ -209,7 +207,7 @@ def walk_forward_backtest_weighted_frequency(
             raise RuntimeError(f"Internal error: hits length mismatch for k={k}")
 
         mean_hits = float(np.mean(hits_list)) if hits_list else 0.0
-        expected_mean, var = _hypergeom_mean_var(keno_type=k, numbers_range=max_n, numbers_drawn=numbers_drawn)
+        expected_mean, var = hypergeom_mean_var(keno_type=k, numbers_range=max_n, numbers_drawn=numbers_drawn)
 
         mean_z = None
         mean_p = None
@@ -343,18 +341,20 @@ def _run_single_seed_random(
     min_n, max_n = numbers_range
     numbers = list(range(min_n, max_n + 1))
 
-    hits_by_k: dict[int, list[int]] = {k: [] for k in keno_types}
+    ticket_masks_by_k: dict[int, list[int]] = {k: [] for k in keno_types}
 
-    for i in range(start_index, len(sorted_draws)):
-        draw_set = set(sorted_draws[i].numbers)
+    for _ in range(start_index, len(sorted_draws)):
         for k in keno_types:
-            ticket = rnd.sample(numbers, k)
-            hits = len(draw_set.intersection(ticket))
-            hits_by_k[k].append(hits)
+            ticket_masks_by_k[k].append(number_mask(rnd.sample(numbers, k)))
 
-    return hits_by_k
+    draw_masks = encode_draws(sorted_draws[start_index:])
+    return {
+        k: intersection_count(masks_to_array(masks), draw_masks).tolist()
+        for k, masks in ticket_masks_by_k.items()
+    }
 
 
+@profiled("backtest.random_tickets")
 def walk_forward_backtest_random_tickets(
     draws: list[DrawResult],
     *,
@@ -397,7 +397,7 @@ def walk_forward_backtest_random_tickets(
     if min_n != 1 or max_n != 70:
         raise ValueError("Only numbers_range (1, 70) is supported for KENO backtest")
 
-    sorted_draws = sorted(draws, key=lambda d: d.date)
+    sorted_draws = sort_draws(draws)
     if start_index >= len(sorted_draws):
         raise ValueError(f"start_index={start_index} must be < number of draws ({len(sorted_draws)})")
 
@@ -432,7 +432,7 @@ def walk_forward_backtest_random_tickets(
         std_random = float(np.std(seed_means)) if len(seed_means) > 1 else 0.0
 
         # Expected from hypergeometric
-        expected_mean, _ = _hypergeom_mean_var(keno_type=k, numbers_range=max_n, numbers_drawn=numbers_drawn)
+        expected_mean, _ = hypergeom_mean_var(keno_type=k, numbers_range=max_n, numbers_drawn=numbers_drawn)
 
         # Comparison with weighted-frequency
         mean_wf = wf_lookup.get(k)
@@ -24,7 +24,10 @@ import numpy as np
 import pandas as pd
 
 from kenobase.core.data_loader import DrawResult, DataLoader
+from kenobase.core.draw_collection import DrawCollection
+from kenobase.core.profiling import profiled, span
 from kenobase.features import FeatureExtractor, FeatureVector
+from kenobase.features.snapshots import FeatureSnapshots, history_digests, to_day
 from kenobase.prediction.model import (
     KenoPredictor,
     ModelConfig,
@@ -174,6 +177,7 @@ class KenoTrainer:
         wf_config: Optional[WalkForwardConfig] = None,
         numbers_range: tuple[int, int] = (1, 70),
         numbers_to_draw: int = 20,
+        feature_snapshots: Optional[FeatureSnapshots] = None,
     ):
         """Initialisiert den Trainer.
 
@@ -182,14 +186,29 @@ class KenoTrainer:
             wf_config: Optionale WalkForwardConfig
             numbers_range: Zahlenbereich
             numbers_to_draw: Anzahl gezogener Zahlen
+            feature_snapshots: Vorberechnete Walk-Forward-Features (z.B. aus
+                FeatureStore.sync_snapshots); ersetzen FeatureExtractor.extract
+                fuer Kontexte, deren Ziehungsanzahl und Historien-Fingerprint
+                zum Snapshot des Tages passen und deren Extractor-Einstellungen
+                denen des Trainers entsprechen
+
+        Raises:
+            ValueError: Wenn feature_snapshots andere Zahlen abdecken
         """
         if not HAS_LIGHTGBM:
             raise ImportError("LightGBM required. Install via: pip install lightgbm")
 
+        expected_numbers = list(range(numbers_range[0], numbers_range[1] + 1))
+        if feature_snapshots is not None and feature_snapshots.numbers.tolist() != (
+            expected_numbers
+        ):
+            raise ValueError("feature_snapshots do not cover numbers_range")
+
         self.model_config = model_config or ModelConfig()
         self.wf_config = wf_config or WalkForwardConfig()
         self.numbers_range = numbers_range
         self.numbers_to_draw = numbers_to_draw
+        self.feature_snapshots = feature_snapshots
 
         self._predictor: Optional[KenoPredictor] = None
         self._extractor = FeatureExtractor(
@@ -197,11 +216,13 @@ class KenoTrainer:
             numbers_to_draw=numbers_to_draw,
         )
 
+    @profiled("trainer.train_and_evaluate")
     def train_and_evaluate(
         self,
         draws: list[DrawResult],
         tune_hyperparameters: bool = False,
         n_cv_folds: int = 5,
+        tuning_storage: Optional[Union[str, Path]] = None,
     ) -> TrainingReport:
         """Trainiert und evaluiert das Modell.
 
@@ -216,6 +237,7 @@ class KenoTrainer:
             draws: Liste von DrawResult-Objekten
             tune_hyperparameters: Ob Hyperparameter getuned werden sollen
             n_cv_folds: Anzahl CV Folds
+            tuning_storage: Optionale SQLite-Datei fuer fortsetzbares Tuning
 
         Returns:
             TrainingReport mit allen Metriken
@@ -225,20 +247,33 @@ class KenoTrainer:
         report = TrainingReport(config=self.model_config)
 
         # Prepare data
-        X, y = self._prepare_training_data(draws)
+        with span("trainer.prepare_data", draws=len(draws)):
+            X, y = self._prepare_training_data(draws)
         logger.info(f"Prepared {len(X)} samples with {X.shape[1]} features")
 
-        # Optional: Hyperparameter tuning
+        # Optional: Hyperparameter tuning (Walk-Forward Folds)
+        tuning_summary = None
         if tune_hyperparameters:
             logger.info("Tuning hyperparameters...")
             predictor = KenoPredictor(config=self.model_config)
-            self.model_config = predictor.tune_hyperparameters(X, y, n_trials=50)
+            with span("trainer.tune_hyperparameters"):
+                self.model_config = predictor.tune_hyperparameters(
+                    X, y,
+                    n_trials=50,
+                    storage_path=tuning_storage,
+                    train_test_ratio=max(
+                        1, self.wf_config.train_months // max(1, self.wf_config.test_months)
+                    ),
+                    block_size=self.numbers_range[1] - self.numbers_range[0] + 1,
+                )
+            tuning_summary = predictor.tuning_summary
             report.config = self.model_config
 
         # Cross-Validation
         logger.info(f"Running {n_cv_folds}-fold cross-validation...")
         predictor = KenoPredictor(config=self.model_config)
-        cv_metrics, cv_f1_std = predictor.cross_validate(X, y, n_folds=n_cv_folds)
+        with span("trainer.cross_validate", folds=n_cv_folds):
+            cv_metrics, cv_f1_std = predictor.cross_validate(X, y, n_folds=n_cv_folds)
         report.cv_metrics = cv_metrics
         report.cv_f1_std = cv_f1_std
 
@@ -269,7 +304,9 @@ class KenoTrainer:
         # Final training on all data
         logger.info("Training final model on all data...")
         self._predictor = KenoPredictor(config=self.model_config)
-        self._predictor.train(X, y)
+        with span("trainer.final_fit", samples=len(X)):
+            self._predictor.train(X, y)
+        self._predictor.tuning_summary = tuning_summary
         report.feature_importance = self._predictor.get_feature_importance()
 
         # Check acceptance criteria
@@ -309,35 +346,71 @@ class KenoTrainer:
         # Extract features for each draw (using previous draws as context)
         X_list = []
         y_list = []
+        numbers = np.arange(self.numbers_range[0], self.numbers_range[1] + 1)
+        digests = history_digests(draws) if self.feature_snapshots is not None else None
 
         for i in range(1, len(draws)):
             # Features based on previous draws
-            context_draws = draws[:i]
-            vectors = self._extractor.extract(context_draws)
+            X_list.append(self._context_features(draws, i, digests))
 
-            # Target: which numbers appeared in this draw
-            target_numbers = set(draws[i].numbers)
+            # Label: 1 if number appeared in this draw, 0 otherwise
+            y_list.append(np.isin(numbers, draws[i].numbers))
 
-            for num in range(self.numbers_range[0], self.numbers_range[1] + 1):
-                vec = vectors.get(num)
-                if vec is None:
-                    continue
+        X = np.vstack(X_list).astype(np.float32)
+        y = np.concatenate(y_list).astype(np.int32)
 
-                # Feature vector
-                feature_values = [
-                    vec.features.get(name, 0.0)
-                    for name in KenoPredictor.FEATURE_NAMES
-                ]
-                X_list.append(feature_values)
+        return X, y
 
-                # Label: 1 if number appeared, 0 otherwise
-                y_list.append(1 if num in target_numbers else 0)
+    def _context_features(
+        self,
+        draws: list[DrawResult],
+        end: int,
+        digests: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Feature-Matrix (Zahlen x FEATURE_NAMES) aus dem Kontext draws[:end].
+
+        Nutzt feature_snapshots, wenn draws[end - 1] die letzte Ziehung ihres
+        Tages ist und der Snapshot dieses Tages aus genau draws[:end] gebaut
+        wurde (gleiche Ziehungsanzahl, gleicher Historien-Fingerprint und
+        gleiche Extractor-Einstellungen); bei jeder Abweichung (gefilterte
+        oder korrigierte Ziehungen, anderer Extractor) wird
+        FeatureExtractor.extract verwendet.
 
-        X = np.array(X_list, dtype=np.float32)
-        y = np.array(y_list, dtype=np.int32)
+        Args:
+            draws: Ziehungen in chronologischer Reihenfolge
+            end: Anzahl Kontext-Ziehungen
+            digests: history_digests(draws), falls bereits berechnet
 
-        return X, y
+        Returns:
+            (N, len(FEATURE_NAMES)) float32
+        """
+        snapshots = self.feature_snapshots
+        if (
+            snapshots is not None
+            and snapshots.has_history
+            and end > 0
+            and to_day(draws[0].date) == snapshots.origin
+        ):
+            day = to_day(draws[end - 1].date)
+            if end == len(draws) or to_day(draws[end].date) != day:
+                if digests is None:
+                    digests = history_digests(draws[:end])
+                idx = snapshots.verified_index(
+                    day, end, digests[end - 1], extractor_settings=self._extractor.settings
+                )
+                if idx is not None:
+                    return snapshots.matrix(day, KenoPredictor.FEATURE_NAMES, exact=True)
+
+        vectors = self._extractor.extract(draws[:end])
+        return np.array(
+            [
+                [vectors[num].features.get(name, 0.0) for name in KenoPredictor.FEATURE_NAMES]
+                for num in range(self.numbers_range[0], self.numbers_range[1] + 1)
+            ],
+            dtype=np.float32,
+        )
 
+    @profiled("trainer.walk_forward")
     def _walk_forward_validation(
         self,
         draws: list[DrawResult],
@@ -357,8 +430,8 @@ class KenoTrainer:
         if not draws:
             return results
 
-        # Sort by date
-        sorted_draws = sorted(draws, key=lambda d: d.date)
+        # Sort by date (einmal; Perioden sind danach Binaersuchen + Views)
+        sorted_draws = DrawCollection(draws)
         min_date = sorted_draws[0].date
         max_date = sorted_draws[-1].date
 
@@ -376,14 +449,10 @@ class KenoTrainer:
                 break
 
             # Filter draws for train and test periods
-            train_draws = [
-                d for d in sorted_draws
-                if current_train_start <= d.date < train_end
-            ]
-            test_draws = [
-                d for d in sorted_draws
-                if test_start <= d.date < test_end
-            ]
+            train_draws = sorted_draws.between(
+                current_train_start, train_end, inclusive="left"
+            )
+            test_draws = sorted_draws.between(test_start, test_end, inclusive="left")
 
             # Check minimum samples
             if len(train_draws) < self.wf_config.min_train_samples:
@@ -407,8 +476,9 @@ class KenoTrainer:
 
             # Prepare data
             try:
-                X_train, y_train = self._prepare_training_data(train_draws)
-                X_test, y_test = self._prepare_training_data(test_draws)
+                with span("trainer.wf_prepare", period=period_idx):
+                    X_train, y_train = self._prepare_training_data(train_draws)
+                    X_test, y_test = self._prepare_training_data(test_draws)
             except ValueError as e:
                 logger.warning(f"Period {period_idx}: Data preparation failed: {e}")
                 current_train_start = self._add_months(
@@ -418,8 +488,9 @@ class KenoTrainer:
 
             # Train and evaluate
             predictor = KenoPredictor(config=self.model_config)
-            predictor.train(X_train, y_train)
-            metrics = predictor.evaluate(X_test, y_test)
+            with span("trainer.wf_fit", period=period_idx, samples=len(X_train)):
+                predictor.train(X_train, y_train)
+                metrics = predictor.evaluate(X_test, y_test)
 
             result = WalkForwardResult(
                 period_idx=period_idx,
@@ -504,25 +575,9 @@ class KenoTrainer:
         if self._predictor is None:
             raise RuntimeError("Kein trainiertes Modell vorhanden")
 
-        # Extract features
-        vectors = self._extractor.extract(draws)
-
-        # Prepare feature matrix
-        X = []
-        numbers = []
-        for num in range(self.numbers_range[0], self.numbers_range[1] + 1):
-            vec = vectors.get(num)
-            if vec is None:
-                continue
-
-            feature_values = [
-                vec.features.get(name, 0.0)
-                for name in KenoPredictor.FEATURE_NAMES
-            ]
-            X.append(feature_values)
-            numbers.append(num)
-
-        X = np.array(X, dtype=np.float32)
+        # Extract features (oder Snapshot des letzten Ziehungstags)
+        X = self._context_features(draws, len(draws))
+        numbers = list(range(self.numbers_range[0], self.numbers_range[1] + 1))
 
         # Get predictions
         probabilities = self._predictor.predict_proba(X)
@@ -12,6 +12,7 @@ from kenobase.scraper.lotto_de import (
     KenoDrawResult,
     LottoDeScraper,
     analyze_birthday_correlation,
+    latest_draw_date,
 )
 from kenobase.scraper.lotto_hessen_api import (
     LottoHessenAPI,
@@ -35,6 +36,7 @@ __all__ = [
     "LottoDeScraper",
     "KenoDrawResult",
     "analyze_birthday_correlation",
+    "latest_draw_date",
     # Lotto Hessen API
     "LottoHessenAPI",
     "LottoHessenConfig",
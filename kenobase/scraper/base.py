@@ -4,6 +4,7 @@
 import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +14,7 @@ from urllib.parse import urljoin
 import requests
 from bs4 import BeautifulSoup
 
+from kenobase.scraper.http_client import HTTPResult, PoliteHTTPClient
 from kenobase.scraper.landeslotterien import LANDESLOTTERIEN, LotterieConfig
 from kenobase.scraper.parsers import KenoWinnerParser, KenoWinnerRecord, is_keno_article
 
@@ -42,6 +44,25 @@ class ScraperConfig:
     # Output
     output_dir: Path = field(default_factory=lambda: Path("data/scraped"))
 
+    # Concurrent mode: sites and articles in parallel, politeness per host
+    concurrent: bool = False
+    max_site_workers: int = 8
+    max_article_workers: int = 2
+    requests_per_second_per_host: Optional[float] = None  # None = 1 / delay_between_requests
+    burst_per_host: int = 1
+
+    # On-disk HTTP cache (ETag/Last-Modified); None = disabled
+    cache_dir: Optional[Path] = None
+
+    @property
+    def host_rate(self) -> float:
+        """Request rate per host used in concurrent mode."""
+        if self.requests_per_second_per_host is not None:
+            return self.requests_per_second_per_host
+        if self.delay_between_requests <= 0:
+            return 0.0
+        return 1.0 / self.delay_between_requests
+
 
 @dataclass
 class ScrapeResult:
@@ -82,6 +103,18 @@ class PressReleaseScraper:
         self.config = config or ScraperConfig()
         self.session = self._create_session()
 
+        # In sequential mode the explicit delays provide politeness,
+        # in concurrent mode the per-host token buckets do.
+        self.http = PoliteHTTPClient(
+            headers=dict(self.session.headers),
+            requests_per_second=self.config.host_rate if self.config.concurrent else 0.0,
+            burst=self.config.burst_per_host,
+            timeout=self.config.timeout,
+            max_retries=self.config.max_retries,
+            pool_size=self.config.max_article_workers,
+            cache_dir=self.config.cache_dir,
+        )
+
     def _create_session(self) -> requests.Session:
         """Create a configured requests session."""
         session = requests.Session()
@@ -115,31 +148,47 @@ class PressReleaseScraper:
 
         target_codes = codes if codes else list(LANDESLOTTERIEN.keys())
 
-        for code in target_codes:
+        def scrape_one(code: str):
             if progress_callback:
                 progress_callback(code, "starting")
 
             try:
-                records, articles_found, articles_parsed, errors = self._scrape_site(code)
-                all_records.extend(records)
-                all_errors.extend(errors)
-                total_articles_found += articles_found
-                total_articles_parsed += articles_parsed
-                sites_scraped += 1
-
+                outcome = self._scrape_site(code)
                 if progress_callback:
-                    progress_callback(code, f"done: {len(records)} records")
+                    progress_callback(code, f"done: {len(outcome[0])} records")
+                return outcome
 
             except Exception as e:
                 error_msg = f"[{code}] Site scrape failed: {str(e)}"
                 logger.error(error_msg)
-                all_errors.append(error_msg)
 
                 if progress_callback:
                     progress_callback(code, f"error: {str(e)}")
+                return None, error_msg
+
+        if self.config.concurrent:
+            workers = max(1, min(self.config.max_site_workers, len(target_codes)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(scrape_one, target_codes))
+        else:
+            outcomes = []
+            for i, code in enumerate(target_codes):
+                outcomes.append(scrape_one(code))
+                # Delay between sites
+                if i < len(target_codes) - 1:
+                    time.sleep(self.config.delay_between_sites)
+
+        for outcome in outcomes:
+            if outcome[0] is None:
+                all_errors.append(outcome[1])
+                continue
 
-            # Delay between sites
-            time.sleep(self.config.delay_between_sites)
+            records, articles_found, articles_parsed, errors = outcome
+            all_records.extend(records)
+            all_errors.extend(errors)
+            total_articles_found += articles_found
+            total_articles_parsed += articles_parsed
+            sites_scraped += 1
 
         duration = time.time() - start_time
 
@@ -210,23 +259,36 @@ class PressReleaseScraper:
             logger.info(f"[{code}] Found {articles_found} article links")
 
             # Process each article
-            for url, title in article_links[: self.config.max_articles_per_site]:
-                time.sleep(self.config.delay_between_requests)
-
+            def process(link: tuple[str, str]):
+                url, title = link
+                if not self.config.concurrent:
+                    time.sleep(self.config.delay_between_requests)
                 try:
-                    record = self._process_article(url, title, parser, config)
-                    if record:
-                        articles_parsed += 1
-                        if record.extraction_confidence >= self.config.min_confidence:
-                            records.append(record)
-                            logger.debug(
-                                f"[{code}] Extracted record: {record.city or record.region} "
-                                f"(confidence: {record.extraction_confidence})"
-                            )
+                    return self._process_article(url, title, parser, config), None
                 except Exception as e:
                     error_msg = f"[{code}] Article parse error ({url}): {str(e)}"
                     logger.warning(error_msg)
+                    return None, error_msg
+
+            selected = article_links[: self.config.max_articles_per_site]
+            if self.config.concurrent and selected:
+                workers = max(1, min(self.config.max_article_workers, len(selected)))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    outcomes = list(pool.map(process, selected))
+            else:
+                outcomes = [process(link) for link in selected]
+
+            for record, error_msg in outcomes:
+                if error_msg:
                     errors.append(error_msg)
+                elif record:
+                    articles_parsed += 1
+                    if record.extraction_confidence >= self.config.min_confidence:
+                        records.append(record)
+                        logger.debug(
+                            f"[{code}] Extracted record: {record.city or record.region} "
+                            f"(confidence: {record.extraction_confidence})"
+                        )
 
         except Exception as e:
             errors.append(f"[{code}] Scrape error: {str(e)}")
@@ -236,18 +298,9 @@ class PressReleaseScraper:
         )
         return records, articles_found, articles_parsed, errors
 
-    def _fetch_url(self, url: str) -> Optional[requests.Response]:
-        """Fetch a URL with retries."""
-        for attempt in range(self.config.max_retries):
-            try:
-                response = self.session.get(url, timeout=self.config.timeout)
-                response.raise_for_status()
-                return response
-            except requests.RequestException as e:
-                logger.warning(f"Fetch attempt {attempt + 1} failed for {url}: {e}")
-                if attempt < self.config.max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-        return None
+    def _fetch_url(self, url: str) -> Optional[HTTPResult]:
+        """Fetch a URL with retries (conditional GET if cached)."""
+        return self.http.get(url)
 
     def _find_article_links(
         self, soup: BeautifulSoup, config: LotterieConfig, base_url: str
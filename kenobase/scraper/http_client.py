@@ -0,0 +1,257 @@
+# kenobase/scraper/http_client.py
+"""Polite HTTP client shared by the scrapers.
+
+Provides per-host politeness for concurrent scraping:
+- TokenBucket / HostRateLimiter: independent request budget per host
+- HTTPCache: on-disk cache with ETag/Last-Modified validators
+- PoliteHTTPClient: one pooled session per host, conditional GETs, retries
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``.
+    ``acquire`` blocks until a token is available.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens per second (<= 0 disables limiting)
+            burst: Maximum number of tokens (bucket capacity)
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping if necessary.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+
+                wait = (1.0 - self._tokens) / self.rate
+
+            time.sleep(wait)
+            waited += wait
+
+
+class HostRateLimiter:
+    """Lazily creates one TokenBucket per host."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        """Get (or create) the bucket for a host."""
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return self._buckets[host]
+
+    def acquire(self, url: str) -> float:
+        """Take one token from the bucket of the URL's host."""
+        return self.bucket(urlsplit(url).netloc).acquire()
+
+
+@dataclass
+class HTTPResult:
+    """Response body plus cache metadata."""
+
+    url: str
+    status_code: int
+    text: str
+    headers: dict[str, str] = field(default_factory=dict)
+    from_cache: bool = False  # True if served from cache after a 304
+
+
+class HTTPCache:
+    """On-disk HTTP cache keyed by URL.
+
+    Each entry is a JSON file with the body and the validators
+    (ETag, Last-Modified) used for conditional requests.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+    def get(self, url: str) -> Optional[HTTPResult]:
+        """Load a cached response (None if missing or unreadable)."""
+        path = self._path(url)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        return HTTPResult(
+            url=data["url"],
+            status_code=data["status_code"],
+            text=data["text"],
+            headers=data.get("headers", {}),
+            from_cache=True,
+        )
+
+    def put(self, result: HTTPResult) -> None:
+        """Store a response if it carries a validator."""
+        headers = {
+            k: v for k, v in result.headers.items()
+            if k.lower() in ("etag", "last-modified")
+        }
+        if not headers:
+            return
+
+        path = self._path(result.url)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "url": result.url,
+                "status_code": result.status_code,
+                "text": result.text,
+                "headers": headers,
+            }, f, ensure_ascii=False)
+        tmp_path.replace(path)
+
+    @staticmethod
+    def conditional_headers(cached: HTTPResult) -> dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers."""
+        headers = {}
+        for key, value in cached.headers.items():
+            if key.lower() == "etag":
+                headers["If-None-Match"] = value
+            elif key.lower() == "last-modified":
+                headers["If-Modified-Since"] = value
+        return headers
+
+
+class PoliteHTTPClient:
+    """HTTP client with per-host rate limits, pooled sessions and caching.
+
+    Safe to share between threads: every host gets its own session
+    (and connection pool) and its own token bucket.
+    """
+
+    def __init__(
+        self,
+        headers: Optional[dict[str, str]] = None,
+        requests_per_second: float = 0.5,
+        burst: int = 1,
+        timeout: int = 30,
+        max_retries: int = 3,
+        pool_size: int = 4,
+        cache_dir: Optional[Path] = None,
+    ):
+        """Initialize the client.
+
+        Args:
+            headers: Default headers for every request
+            requests_per_second: Allowed request rate per host (<= 0 = unlimited)
+            burst: Requests allowed back-to-back per host
+            timeout: Request timeout in seconds
+            max_retries: Attempts per URL
+            pool_size: Connection pool size per host
+            cache_dir: Optional on-disk HTTP cache directory
+        """
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.pool_size = pool_size
+        self.limiter = HostRateLimiter(requests_per_second, burst)
+        self.cache = HTTPCache(cache_dir) if cache_dir is not None else None
+        self._sessions: dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def _session(self, host: str) -> requests.Session:
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                session.headers.update(self.headers)
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def get(self, url: str) -> Optional[HTTPResult]:
+        """Fetch a URL politely (conditional GET if cached).
+
+        Returns:
+            HTTPResult or None if all attempts failed
+        """
+        session = self._session(urlsplit(url).netloc)
+        cached = self.cache.get(url) if self.cache else None
+        headers = HTTPCache.conditional_headers(cached) if cached else {}
+
+        for attempt in range(self.max_retries):
+            self.limiter.acquire(url)
+            try:
+                response = session.get(url, headers=headers, timeout=self.timeout)
+                if response.status_code == 304 and cached is not None:
+                    logger.debug(f"Not modified (cache hit): {url}")
+                    return cached
+                response.raise_for_status()
+
+                result = HTTPResult(
+                    url=url,
+                    status_code=response.status_code,
+                    text=response.text,
+                    headers=dict(response.headers),
+                )
+                if self.cache:
+                    self.cache.put(result)
+                return result
+
+            except requests.RequestException as e:
+                logger.warning(f"Fetch attempt {attempt + 1} failed for {url}: {e}")
+                if attempt < self.max_retries - 1:
+                    time.sleep(2 ** attempt)  # Exponential backoff
+        return None
+
+    def close(self) -> None:
+        """Close all per-host sessions."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
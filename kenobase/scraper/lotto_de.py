@@ -1,18 +1,24 @@
 # kenobase/scraper/lotto_de.py
 """Scraper for official KENO data from lotto.de (DLTB central source)."""
 
+import csv
 import json
 import logging
+import os
 import re
-import time
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterator, Optional, Union
 
 import requests
 from bs4 import BeautifulSoup
 
+from kenobase.scraper.http_client import TokenBucket
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,10 +83,14 @@ class LottoDeScraper:
     web_base_url: str = "https://www.lotto.de"
     keno_archive_url: str = "https://www.lotto.de/keno/zahlen"
 
-    # Rate limiting
+    # Rate limiting (global across all workers)
     delay_between_requests: float = 1.0
     timeout: int = 30
 
+    # Bulk fetching: bounded fetch pool, parsing overlaps with fetching
+    max_workers: int = 4
+    parse_workers: int = 2
+
     # Session
     session: requests.Session = field(default_factory=requests.Session)
 
@@ -138,6 +148,13 @@ class LottoDeScraper:
         Returns:
             KenoDrawResult or None if not found
         """
+        html = self._fetch_draw_html(date)
+        if html is None:
+            return None
+        return self._parse_draw_page(html, date)
+
+    def _fetch_draw_html(self, date: datetime) -> Optional[str]:
+        """Fetch the raw archive page for a date (None on HTTP error)."""
         # Format date for URL
         date_str = date.strftime("%d.%m.%Y")
         url = f"{self.keno_archive_url}?datum={date_str}"
@@ -151,44 +168,132 @@ class LottoDeScraper:
             logger.warning(f"Failed to fetch {url}: {e}")
             return None
 
-        return self._parse_draw_page(response.text, date)
+        return response.text
 
     def fetch_date_range(
         self,
         start_date: datetime,
         end_date: datetime,
         progress_callback: Optional[callable] = None,
+        skip_dates: Optional[set] = None,
     ) -> list[KenoDrawResult]:
         """Fetch KENO draws for a date range.
 
+        Days are fetched by a bounded worker pool (``max_workers``) that
+        shares one global rate limit (1 / ``delay_between_requests``).
+        Each page is handed to a parse pool as soon as it arrives, so
+        parsing overlaps with the remaining fetches.
+
         Args:
             start_date: Start date (inclusive)
             end_date: End date (inclusive)
-            progress_callback: Optional callback(current_date, total_days)
+            progress_callback: Optional callback(current_date, days_done, total_days)
+            skip_dates: Optional set of dates (datetime.date) already present
 
         Returns:
-            List of KenoDrawResult
+            List of KenoDrawResult, sorted by date
         """
-        results: list[KenoDrawResult] = []
+        skip = skip_dates or set()
+        days = []
         current = start_date
-        total_days = (end_date - start_date).days + 1
-
         while current <= end_date:
-            if progress_callback:
-                days_done = (current - start_date).days + 1
-                progress_callback(current, days_done, total_days)
+            if current.date() not in skip:
+                days.append(current)
+            current += timedelta(days=1)
+
+        total_days = len(days)
+        if not total_days:
+            return []
+
+        rate = 1.0 / self.delay_between_requests if self.delay_between_requests > 0 else 0.0
+        bucket = TokenBucket(rate)
+        lock = threading.Lock()
+        done = [0]
+
+        with ThreadPoolExecutor(max_workers=max(1, self.parse_workers)) as parse_pool:
+
+            def fetch(day: datetime) -> Optional[Future]:
+                bucket.acquire()
+                html = self._fetch_draw_html(day)
+
+                if progress_callback:
+                    with lock:
+                        done[0] += 1
+                        progress_callback(day, done[0], total_days)
+
+                if html is None:
+                    return None
+                return parse_pool.submit(self._parse_draw_page, html, day)
+
+            workers = max(1, min(self.max_workers, total_days))
+            with ThreadPoolExecutor(max_workers=workers) as fetch_pool:
+                parse_futures = list(fetch_pool.map(fetch, days))
 
-            result = self.fetch_draw(current)
-            if result:
-                results.append(result)
+            results = [f.result() for f in parse_futures if f is not None]
+
+        results = [r for r in results if r is not None]
+        for result in results:
+            logger.info(
+                f"[{result.date.strftime('%Y-%m-%d')}] "
+                f"Numbers: {len(result.numbers)}, "
+                f"Winners: {result.total_winners or 'N/A'}"
+            )
+
+        return sorted(results, key=lambda r: r.date)
+
+    def sync(
+        self,
+        dataset_path: Union[str, Path],
+        end_date: Optional[datetime] = None,
+        start_date: Optional[datetime] = None,
+        progress_callback: Optional[callable] = None,
+    ) -> list[KenoDrawResult]:
+        """Incrementally sync a KENO dataset (CSV or JSON draw cache).
+
+        Fetches only days after the latest date already in the dataset
+        and appends them atomically.
+
+        Args:
+            dataset_path: KENO CSV (Datum;Keno_Z1..Z20;...) or JSON from save_results
+            end_date: Last day to fetch (default: today)
+            start_date: First day if the dataset is empty or missing
+            progress_callback: Optional callback(current_date, days_done, total_days)
+
+        Returns:
+            Newly fetched draws
+        """
+        dataset_path = Path(dataset_path)
+        end_date = end_date or datetime.now()
+
+        latest = latest_draw_date(dataset_path)
+        if latest is not None:
+            start_date = latest + timedelta(days=1)
+        elif start_date is None:
+            raise ValueError(
+                f"Dataset {dataset_path} is empty or missing; start_date required"
+            )
+
+        start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        if start_date > end_date:
+            if latest is None:
                 logger.info(
-                    f"[{current.strftime('%Y-%m-%d')}] "
-                    f"Numbers: {len(result.numbers)}, "
-                    f"Winners: {result.total_winners or 'N/A'}"
+                    f"{dataset_path.name}: start_date {start_date:%Y-%m-%d} is after "
+                    f"end_date {end_date:%Y-%m-%d}, nothing to fetch"
                 )
+            else:
+                logger.info(f"{dataset_path.name} is up to date (latest: {latest:%Y-%m-%d})")
+            return []
 
-            current += timedelta(days=1)
-            time.sleep(self.delay_between_requests)
+        logger.info(
+            f"Syncing {dataset_path.name}: {start_date:%Y-%m-%d} to {end_date:%Y-%m-%d}"
+        )
+        results = self.fetch_date_range(start_date, end_date, progress_callback)
+
+        if results:
+            if dataset_path.suffix.lower() == ".json":
+                append_draws_json(dataset_path, results)
+            else:
+                append_draws_csv(dataset_path, results)
 
         return results
 
@@ -386,6 +491,114 @@ class LottoDeScraper:
         logger.info(f"Saved {len(results)} draws to {output_path}")
 
 
+KENO_CSV_HEADER = (
+    ["Datum"] + [f"Keno_Z{i}" for i in range(1, 21)] + ["Keno_Plus5", "Keno_Spieleinsatz"]
+)
+
+
+def latest_draw_date(path: Union[str, Path]) -> Optional[datetime]:
+    """Return the latest draw date in a KENO CSV or JSON draw cache.
+
+    Args:
+        path: KENO CSV (Datum as DD.MM.YYYY) or JSON written by save_results
+
+    Returns:
+        Latest date or None if the file is missing or has no draws
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+
+    dates: list[datetime] = []
+    if path.suffix.lower() == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for draw in data.get("draws", []):
+            dates.append(datetime.strptime(draw["date"], "%Y-%m-%d"))
+    else:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            reader = csv.DictReader(f, delimiter=";")
+            for row in reader:
+                date_str = (row.get("Datum") or "").strip()
+                if not date_str:
+                    continue
+                try:
+                    dates.append(datetime.strptime(date_str, "%d.%m.%Y"))
+                except ValueError:
+                    continue
+
+    return max(dates) if dates else None
+
+
+def _atomic_write(path: Path, write) -> None:
+    """Write via a temp file in the same directory and rename into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", errors="surrogateescape", newline="") as f:
+            write(f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def append_draws_csv(path: Union[str, Path], results: list[KenoDrawResult]) -> int:
+    """Atomically append draws to a KENO CSV (semicolon, DD.MM.YYYY).
+
+    Existing content is copied unchanged; the new file replaces the old
+    one in a single rename, so readers never see a partial write.
+
+    Returns:
+        Number of rows appended
+    """
+    path = Path(path)
+    existing = (
+        path.read_text(encoding="utf-8", errors="surrogateescape") if path.exists() else ""
+    )
+
+    def write(f) -> None:
+        if existing:
+            f.write(existing if existing.endswith("\n") else existing + "\n")
+        else:
+            f.write(";".join(KENO_CSV_HEADER) + "\n")
+        for r in sorted(results, key=lambda r: r.date):
+            row = [r.date.strftime("%d.%m.%Y")] + [str(n) for n in r.numbers]
+            row += [r.plus5 or "", ""]
+            f.write(";".join(row) + "\n")
+
+    _atomic_write(path, write)
+    logger.info(f"Appended {len(results)} draws to {path}")
+    return len(results)
+
+
+def append_draws_json(path: Union[str, Path], results: list[KenoDrawResult]) -> int:
+    """Atomically merge draws into a JSON draw cache (format of save_results).
+
+    Returns:
+        Number of draws added or replaced
+    """
+    path = Path(path)
+    draws: dict[str, dict] = {}
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            for draw in json.load(f).get("draws", []):
+                draws[draw["date"]] = draw
+
+    for r in results:
+        draws[r.date.strftime("%Y-%m-%d")] = r.to_dict()
+
+    data = {
+        "source": "lotto.de",
+        "generated_at": datetime.now().isoformat(),
+        "count": len(draws),
+        "draws": [draws[k] for k in sorted(draws)],
+    }
+    _atomic_write(path, lambda f: json.dump(data, f, ensure_ascii=False, indent=2))
+    logger.info(f"Merged {len(results)} draws into {path}")
+    return len(results)
+
+
 def analyze_birthday_correlation(results: list[KenoDrawResult]) -> dict:
     """Analyze correlation between birthday numbers and winner counts.
 
@@ -6,6 +6,8 @@ Usage:
     python scripts/analyze.py analyze --config config/default.yaml
     python scripts/analyze.py validate --combination 1,2,3,4,5,6
     python scripts/analyze.py info --config config/default.yaml
+    python scripts/analyze.py cache status
+    python scripts/analyze.py --profile results/profile.trace.json analyze -d data.csv
 """
 
 from __future__ import annotations
@@ -15,7 +17,7 @@ import logging
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
 
@@ -23,19 +25,15 @@ import click
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from kenobase.analysis.stable_numbers import (
-    analyze_stable_numbers,
-    export_stable_numbers,
-)
-from kenobase.core.config import KenobaseConfig, load_config
-from kenobase.core.data_loader import DataLoader, DrawResult, GameType
-from kenobase.pipeline.output_formats import (
-    OutputFormat,
-    OutputFormatter,
-    format_output,
-    get_supported_formats,
-)
-from kenobase.pipeline.runner import PipelineResult, PipelineRunner
+# Kommando-spezifische Module (Pipeline/scipy, Optimizer, Stores) werden erst
+# im jeweiligen Kommando importiert, damit z.B. `info` schnell startet.
+from kenobase.core.config import load_config
+from kenobase.core.data_loader import DataLoader, DrawResult
+from kenobase.core.draw_collection import filter_draws_by_date as _filter_draws_by_date
+from kenobase.core.profiling import PROFILE_FORMATS, disable_profiling, enable_profiling, span
+
+if TYPE_CHECKING:
+    from kenobase.pipeline.runner import PipelineResult
 
 
 def setup_logging(verbosity: int) -> None:
@@ -71,14 +69,9 @@ def filter_draws_by_date(
         end_date: Enddatum (inklusive)
 
     Returns:
-        Gefilterte Liste von DrawResult-Objekten
+        Gefilterte Ziehungen (DrawCollection-Eingabe: Binaersuche, zero-copy)
     """
-    filtered = draws
-    if start_date:
-        filtered = [d for d in filtered if d.date >= start_date]
-    if end_date:
-        filtered = [d for d in filtered if d.date <= end_date]
-    return filtered
+    return _filter_draws_by_date(draws, start_date, end_date)
 
 
 def parse_combination(combo_str: str) -> list[int]:
@@ -93,6 +86,31 @@ def parse_combination(combo_str: str) -> list[int]:
     return [int(x.strip()) for x in combo_str.split(",")]
 
 
+def parse_pool(pool_spec: str) -> set[int]:
+    """Parst einen Zahlenpool aus Bereichen und Einzelzahlen.
+
+    Args:
+        pool_spec: Komma-separierte Zahlen/Bereiche, z.B. "1-35" oder "3,7,12"
+
+    Returns:
+        Menge der Zahlen im Pool
+
+    Raises:
+        ValueError: Bei leeren, nicht-numerischen oder absteigenden Eintraegen
+    """
+    pool: set[int] = set()
+    for part in pool_spec.split(","):
+        lo, _, hi = part.strip().partition("-")
+        try:
+            start, end = int(lo), int(hi or lo)
+        except ValueError:
+            raise ValueError(f"Invalid pool entry {part.strip()!r} in {pool_spec!r}") from None
+        if start > end:
+            raise ValueError(f"Invalid pool range {part.strip()!r} (start > end)")
+        pool.update(range(start, end + 1))
+    return pool
+
+
 def result_to_dict(result: PipelineResult) -> dict:
     """Konvertiert PipelineResult zu serialisierbarem Dict.
 
@@ -216,12 +234,43 @@ def result_to_dict(result: PipelineResult) -> dict:
     default=None,
     help="Spiel-Typ (ueberschreibt config.active_game)",
 )
+@click.option(
+    "--profile",
+    "profile_path",
+    default=None,
+    type=click.Path(),
+    help="Laufzeit-Profil der Pipeline-Stufen in diese Datei schreiben",
+)
+@click.option(
+    "--profile-format",
+    default="chrome",
+    type=click.Choice(list(PROFILE_FORMATS)),
+    help="Profil-Format (chrome: chrome://tracing/Perfetto, json: Spans + Aggregate)",
+)
 @click.pass_context
-def cli(ctx: click.Context, game: Optional[str]):
+def cli(
+    ctx: click.Context,
+    game: Optional[str],
+    profile_path: Optional[str],
+    profile_format: str,
+):
     """Kenobase V2.0 - Lottozahlen-Analysesystem mit Physics-Integration."""
     ctx.ensure_object(dict)
     ctx.obj["game"] = game
 
+    if profile_path:
+        enable_profiling()
+
+        def _write_profile() -> None:
+            profiler = disable_profiling()
+            if profiler is None:
+                return
+            profiler.save(profile_path, fmt=profile_format)
+            click.echo(profiler.summary(), err=True)
+            click.echo(f"Profile written to {profile_path}", err=True)
+
+        ctx.call_on_close(_write_profile)
+
 
 @cli.command()
 @click.option(
@@ -254,8 +303,8 @@ def cli(ctx: click.Context, game: Optional[str]):
     "-f",
     "output_format",
     default="json",
-    type=click.Choice(["json", "csv", "html", "markdown", "yaml"]),
-    help="Ausgabeformat (json, csv, html, markdown, yaml)",
+    type=click.Choice(["json", "jsonl", "csv", "html", "markdown", "yaml"]),
+    help="Ausgabeformat (json, jsonl, csv, html, markdown, yaml)",
 )
 @click.option(
     "--start-date",
@@ -293,6 +342,9 @@ def analyze(
         python scripts/analyze.py analyze -d data/raw/keno/KENO.csv -f json
     """
     setup_logging(verbose)
+    from kenobase.pipeline.output_formats import OutputFormatter
+    from kenobase.pipeline.runner import PipelineRunner
+
     logger = logging.getLogger(__name__)
 
     # Load config
@@ -308,7 +360,8 @@ def analyze(
     # Load data
     logger.info(f"Loading data from {data}")
     loader = DataLoader()
-    draws = loader.load(data)
+    with span("cli.load_data"):
+        draws = loader.load_collection(data)
 
     # Filter by date
     if start_date or end_date:
@@ -338,16 +391,14 @@ def analyze(
     # Format output using new output_formats module
     result_dict = result_to_dict(result)
     formatter = OutputFormatter()
-    formatted = formatter.format(result_dict, output_format)
 
-    # Write output
-    if output:
-        output_path = Path(output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(formatted, encoding="utf-8")
-        click.echo(f"Results written to {output}")
-    else:
-        click.echo(formatted)
+    # Write output (Datei: direkt streamen, ohne kompletten String)
+    with span("cli.write_output", format=output_format):
+        if output:
+            formatter.write_file(result_dict, output, output_format)
+            click.echo(f"Results written to {output}")
+        else:
+            click.echo(formatter.format(result_dict, output_format))
 
     # Optional: regional affinity artifact
     if regional_affinity_output:
@@ -418,6 +469,8 @@ def backtest(
         python scripts/analyze.py backtest -d data/raw/keno/KENO.csv -p 12
     """
     setup_logging(verbose)
+    from kenobase.pipeline.runner import PipelineRunner
+
     logger = logging.getLogger(__name__)
 
     # Load config and data
@@ -449,7 +502,8 @@ def backtest(
         period_draws = draws[start_idx:end_idx]
 
         logger.info(f"Running period {i + 1}/{periods} ({len(period_draws)} draws)")
-        result = runner.run(period_draws)
+        with span("cli.backtest_period", period=i + 1):
+            result = runner.run(period_draws)
 
         period_result = {
             "period": i + 1,
@@ -528,6 +582,8 @@ def validate(
         python scripts/analyze.py validate --combination 1,2,3,4,5,6
     """
     setup_logging(verbose)
+    from kenobase.pipeline.runner import PipelineRunner
+
     logger = logging.getLogger(__name__)
 
     # Load config
@@ -671,6 +727,11 @@ def stable_numbers(
         python scripts/analyze.py stable-numbers -d data/raw/keno/KENO.csv -o results/stable.json
     """
     setup_logging(verbose)
+    from kenobase.analysis.stable_numbers import (
+        analyze_stable_numbers,
+        export_stable_numbers,
+    )
+
     logger = logging.getLogger(__name__)
 
     # Load config
@@ -756,5 +817,294 @@ def stable_numbers(
         click.echo(json.dumps(output_data, indent=2, ensure_ascii=False))
 
 
+@cli.command("batch")
+@click.option(
+    "--hypothesis",
+    "-H",
+    "hypotheses",
+    multiple=True,
+    help="Hypothesen-ID (mehrfach angebbar, default: alle registrierten)",
+)
+@click.option("--keno", default=None, help="KENO-Ziehungen CSV (default: BatchInputs)")
+@click.option("--gq", default=None, help="Gewinnquoten (GQ) CSV (default: BatchInputs)")
+@click.option("--gk1", default=None, help="GK1-Daten CSV (default: BatchInputs)")
+@click.option("--stake", default=None, help="Spieleinsatz-Daten CSV (default: BatchInputs)")
+@click.option(
+    "--output-dir",
+    "-o",
+    default="results/batch",
+    help="Zielverzeichnis fuer Ergebnis-JSONs",
+    type=click.Path(),
+)
+@click.option("--workers", "-j", default=None, type=int, help="Anzahl Worker-Prozesse")
+@click.option("--force", is_flag=True, default=False, help="Unveraenderte nicht ueberspringen")
+@click.option("-v", "--verbose", count=True, help="Verbosity (-v INFO, -vv DEBUG)")
+def batch(
+    hypotheses: tuple[str, ...],
+    keno: Optional[str],
+    gq: Optional[str],
+    gk1: Optional[str],
+    stake: Optional[str],
+    output_dir: str,
+    workers: Optional[int],
+    force: bool,
+    verbose: int,
+):
+    """Fuehrt mehrere Hypothesen-Analysen parallel mit geteilten Eingaben aus.
+
+    Laedt die KENO-Ziehungen einmal, ueberspringt Hypothesen mit unveraendertem
+    Code und unveraenderten Eingaben und meldet Laufzeit und Peak-Memory.
+
+    Example:
+        python scripts/analyze.py batch -H HYP-004 -H HYP-010 -j 2
+    """
+    setup_logging(verbose)
+    from kenobase.pipeline.hypothesis_batch import BatchInputs, run_hypothesis_batch
+
+
+    paths = {"keno_path": keno, "gq_path": gq, "gk1_path": gk1, "stake_path": stake}
+    try:
+        result = run_hypothesis_batch(
+            hypotheses or None,
+            inputs=BatchInputs(**{k: v for k, v in paths.items() if v is not None}),
+            output_dir=output_dir,
+            max_workers=workers,
+            force=force,
+        )
+    except KeyError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"{'Hypothese':<12} {'Status':<8} {'Zeit [s]':>9} {'Peak [MB]':>10}")
+    for report in result.reports:
+        click.echo(
+            f"{report.hypothesis_id:<12} {report.status:<8} "
+            f"{report.wall_time_s:>9.2f} {report.peak_memory_mb:>10.1f}"
+        )
+        if report.error:
+            click.echo(f"  {report.error}", err=True)
+    click.echo(
+        f"ok={result.n_ok} skipped={result.n_skipped} errors={result.n_errors} "
+        f"(gesamt {result.total_wall_time_s:.2f}s, Laden {result.load_time_s:.2f}s)"
+    )
+    if result.n_errors:
+        sys.exit(1)
+
+
+@cli.command("portfolio")
+@click.option("--pool", "pool_spec", required=True, help="Zahlenpool, z.B. '1-35' oder '3,7,12'")
+@click.option("--size", "-k", default=8, type=int, help="Zahlen pro Tipp (Keno-Typ)")
+@click.option("--tickets", "-n", default=10, type=int, help="Anzahl Tipps (Budget)")
+@click.option(
+    "--objective",
+    type=click.Choice(["pairs", "trios", "backtest"]),
+    default="pairs",
+    help="Ziel: Paar-/Trio-Abdeckung oder historischer Backtest-ROI",
+)
+@click.option("--data", "-d", default=None, help="KENO-Ziehungen CSV (fuer --objective backtest)")
+@click.option("--max-per-decade", default=3, type=int, help="Max Zahlen pro Zehnergruppe")
+@click.option("--restarts", default=4, type=int, help="Anzahl Restarts")
+@click.option("--steps", default=5000, type=int, help="Annealing-Schritte pro Restart")
+@click.option("--workers", "-j", default=None, type=int, help="Anzahl Worker-Prozesse")
+@click.option("--seed", default=0, type=int, help="Zufalls-Seed")
+@click.option("--output", "-o", default=None, type=click.Path(), help="Ergebnis als JSON")
+@click.option("-v", "--verbose", count=True, help="Verbosity (-v INFO, -vv DEBUG)")
+def portfolio(
+    pool_spec: str,
+    size: int,
+    tickets: int,
+    objective: str,
+    data: Optional[str],
+    max_per_decade: int,
+    restarts: int,
+    steps: int,
+    workers: Optional[int],
+    seed: int,
+    output: Optional[str],
+    verbose: int,
+):
+    """Optimiert ein Ticket-Portfolio (Abdeckung oder Backtest-ROI).
+
+    Example:
+        python scripts/analyze.py portfolio --pool 1-35 -k 8 -n 20 --objective trios
+    """
+    setup_logging(verbose)
+    from kenobase.core.combination_engine import CombinationEngine
+    from kenobase.core.portfolio_optimizer import (
+        BacktestObjective,
+        CoverageObjective,
+        OptimizerConfig,
+        PortfolioOptimizer,
+    )
+
+
+    try:
+        pool = parse_pool(pool_spec)
+        engine = CombinationEngine(pool=pool, combination_size=size, max_per_decade=max_per_decade)
+        if objective == "backtest":
+            if not data:
+                click.echo("Error: --data is required for --objective backtest", err=True)
+                sys.exit(1)
+            target = BacktestObjective(DataLoader().load_collection(data))
+        else:
+            target = CoverageObjective(pool, t=2 if objective == "pairs" else 3)
+        config = OptimizerConfig(
+            n_restarts=restarts, anneal_steps=steps, max_workers=workers, seed=seed
+        )
+        result = PortfolioOptimizer(engine, target, config).optimize(tickets)
+    except (ValueError, FileNotFoundError) as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    label = "ROI" if objective == "backtest" else "Abdeckung"
+    click.echo(
+        f"{label}: {result.normalized_score:.4f} (Greedy-Score {result.greedy_score:.2f}, "
+        f"{result.n_candidates} Kandidaten, {result.elapsed_s:.2f}s)"
+    )
+    for ticket in result.tickets:
+        click.echo("  " + " ".join(f"{n:2d}" for n in ticket))
+    if output:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        Path(output).write_text(
+            json.dumps(result.to_dict(), indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+        click.echo(f"Results written to {output}")
+
+
+@cli.group()
+@click.option(
+    "--cache-dir",
+    default="results/.cache",
+    help="Verzeichnis des Result-Caches",
+    type=click.Path(),
+)
+@click.pass_context
+def cache(ctx: click.Context, cache_dir: str):
+    """Verwaltet den inhaltsadressierten Result-Cache."""
+    from kenobase.core.result_cache import ResultCache
+
+    ctx.ensure_object(dict)
+    ctx.obj["result_cache"] = ResultCache(cache_dir)
+
+
+@cache.command("status")
+@click.option("--stale-only", is_flag=True, default=False, help="Nur veraltete Eintraege")
+@click.option("--json", "as_json", is_flag=True, default=False, help="Ausgabe als JSON")
+@click.pass_context
+def cache_status(ctx: click.Context, stale_only: bool, as_json: bool):
+    """Zeigt alle Cache-Eintraege und ob sie veraltet sind."""
+    entries = ctx.obj["result_cache"].status()
+    if stale_only:
+        entries = [e for e in entries if e.is_stale]
+
+    if as_json:
+        click.echo(
+            json.dumps(
+                [dict(e.to_dict(), stale_reasons=e.stale_reasons) for e in entries],
+                indent=2,
+                ensure_ascii=False,
+            )
+        )
+        return
+
+    click.echo(f"{'Name':<28} {'Key':<12} {'Status':<7} {'Alter [d]':>9} {'Groesse':>10}")
+    for entry in entries:
+        status = "stale" if entry.is_stale else "fresh"
+        click.echo(
+            f"{entry.name:<28} {entry.key[:12]:<12} {status:<7} "
+            f"{entry.age_days:>9.1f} {entry.size:>10}"
+        )
+        for reason in entry.stale_reasons:
+            click.echo(f"  - {reason}")
+    total_mb = sum(e.size for e in entries) / (1024 * 1024)
+    n_stale = sum(1 for e in entries if e.is_stale)
+    click.echo(f"{len(entries)} Eintraege, {n_stale} veraltet, {total_mb:.2f} MB")
+
+
+@cache.command("gc")
+@click.option("--max-age-days", default=None, type=float, help="Max. Tage seit letztem Zugriff")
+@click.option("--max-size-mb", default=None, type=float, help="Max. Gesamtgroesse in MB")
+@click.option("--stale", is_flag=True, default=False, help="Veraltete Eintraege entfernen")
+@click.option("--dry-run", is_flag=True, default=False, help="Nur anzeigen, nichts loeschen")
+@click.pass_context
+def cache_gc(
+    ctx: click.Context,
+    max_age_days: Optional[float],
+    max_size_mb: Optional[float],
+    stale: bool,
+    dry_run: bool,
+):
+    """Entfernt veraltete, alte oder ueberzaehlige Cache-Eintraege (LRU)."""
+    if max_age_days is None and max_size_mb is None and not stale:
+        click.echo("Error: --stale, --max-age-days oder --max-size-mb angeben", err=True)
+        sys.exit(1)
+
+    evicted = ctx.obj["result_cache"].gc(
+        max_age_days=max_age_days,
+        max_size_mb=max_size_mb,
+        stale=stale,
+        dry_run=dry_run,
+    )
+    verb = "Wuerde entfernen" if dry_run else "Entfernt"
+    for entry in evicted:
+        click.echo(f"{verb}: {entry.name} ({entry.key[:12]}, {entry.size} Bytes)")
+    click.echo(f"{verb}: {len(evicted)} Eintraege")
+
+
+@cli.group()
+@click.option(
+    "--store-dir",
+    default="data/gq_store",
+    help="Verzeichnis des GQ-Stores",
+    type=click.Path(),
+)
+@click.pass_context
+def gq(ctx: click.Context, store_dir: str):
+    """Verwaltet den Parquet-Store der Gewinnquoten (GQ)."""
+    from kenobase.core.gq_store import GQStore
+
+    ctx.ensure_object(dict)
+    try:
+        ctx.obj["gq_store"] = GQStore(store_dir)
+    except ImportError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@gq.command("ingest")
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("--encoding", default="utf-8-sig", help="Encoding der CSV-Dateien")
+@click.option("--force", is_flag=True, default=False, help="Unveraenderte Dateien neu einlesen")
+@click.pass_context
+def gq_ingest(ctx: click.Context, paths: tuple[str, ...], encoding: str, force: bool):
+    """Normalisiert GQ-CSVs einmalig in den Store.
+
+    Example:
+        python scripts/analyze.py gq ingest Keno_GPTs/Keno_GQ_*.csv
+    """
+    store = ctx.obj["gq_store"]
+    try:
+        ingested = store.ingest(paths, encoding=encoding, force=force)
+    except (FileNotFoundError, ValueError) as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    for path in ingested:
+        click.echo(f"Eingelesen: {path}")
+    click.echo(f"{len(ingested)} neu, {len(paths) - len(ingested)} unveraendert")
+
+
+@gq.command("status")
+@click.pass_context
+def gq_status(ctx: click.Context):
+    """Zeigt eingelesene Quellen mit Zeilen und Datumsbereich."""
+    sources = ctx.obj["gq_store"].sources()
+    click.echo(f"{'Quelle':<50} {'Zeilen':>8} {'von':>10} {'bis':>10}")
+    for source in sources.values():
+        first = min((p.min_date for p in source.partitions), default="")
+        last = max((p.max_date for p in source.partitions), default="")
+        click.echo(f"{source.source[-50:]:<50} {source.rows:>8} {first[:10]:>10} {last[:10]:>10}")
+    click.echo(f"{len(sources)} Quellen")
+
+
 if __name__ == "__main__":
     cli()
@@ -10,6 +10,10 @@ Hypothese: Die Ziehungszahlen werden so gewaehlt, dass:
 
 Dieses Script analysiert die Keno_GQ Daten um diese Muster zu erkennen.
 
+Das DIST-002 Ergebnis (--mode payout-ratio) wird ueber den ResultCache in
+`<Output-Verzeichnis>/.cache` berechnet; bei unveraenderten Eingaben und
+unveraendertem Modul kommt es aus dem Cache (--force rechnet neu).
+
 Usage:
     python scripts/analyze_distribution.py                    # Standard-Analyse
     python scripts/analyze_distribution.py --mode payout-ratio --data Keno_GPTs/KENO_Quote_details_2023.csv
@@ -34,6 +38,7 @@ from kenobase.analysis.distribution import (
     detect_payout_ratio_anomalies,
     PayoutRatioResult,
 )
+from kenobase.core.result_cache import ResultCache
 
 
 def load_gewinnquoten(filepath: Path) -> pd.DataFrame:
@@ -300,60 +305,25 @@ def main(data_path: Path | None = None, output_path: Path | None = None) -> dict
     return results
 
 
-def analyze_payout_ratio_mode(data_path: Path, output_path: Path) -> dict:
-    """DIST-002: Auszahlung-Gewinner Ratio Analyse.
-
-    Berechnet payout_per_winner = Auszahlung / Anzahl der Gewinner
-    fuer jede Gewinnklasse und erkennt Anomalien.
+def build_payout_ratio_output(data_path: Path) -> dict:
+    """DIST-002: Laedt die Quote-Details und berechnet das JSON-Ergebnis.
 
     Args:
         data_path: Pfad zur CSV-Datei (KENO_Quote_details_2023.csv)
-        output_path: Pfad fuer JSON-Output
 
     Returns:
         Analyse-Ergebnisse als dict
     """
-    print("=" * 60)
-    print("DIST-002: Auszahlung-Gewinner Ratio Analyse")
-    print("=" * 60)
-
-    # Lade Daten
     print(f"\nLade: {data_path}")
     df = load_quote_details_data(str(data_path))
     print(f"Zeilen: {len(df)}")
     print(f"Zeitraum: {df['Datum'].min()} bis {df['Datum'].max()}")
     print(f"Spalten: {list(df.columns)}")
 
-    # Analyse durchfuehren
-    print("\n" + "-" * 60)
-    print("1. PAYOUT-PER-WINNER ANALYSE")
     results = analyze_payout_ratio(df)
-    print(f"   Analysierte Kombinationen: {len(results)}")
-
-    # Ergebnisse nach Keno-Typ gruppiert ausgeben
-    print("\n" + "-" * 60)
-    print("2. ERGEBNISSE PRO GEWINNKLASSE")
-    for r in sorted(results, key=lambda x: (x.keno_type, -x.matches)):
-        print(
-            f"   Keno-{r.keno_type}/{r.matches}: "
-            f"mean={r.mean_payout_per_winner:.2f} EUR, "
-            f"CV={r.cv:.4f}, "
-            f"n={r.n_draws}, "
-            f"zero_draws={r.zero_winner_draws}"
-        )
-
-    # Anomalien erkennen
-    print("\n" + "-" * 60)
-    print("3. ANOMALIEN (CV > 10%)")
     anomalies = detect_payout_ratio_anomalies(results, cv_threshold=0.1)
-    if anomalies:
-        for kt, m, reason in anomalies:
-            print(f"   Keno-{kt}/{m}: {reason}")
-    else:
-        print("   Keine Anomalien erkannt - Quoten sind konsistent")
 
-    # Ergebnisse speichern
-    output = {
+    return {
         "analysis_date": datetime.now().isoformat(),
         "task_id": "DIST-002",
         "data_source": str(data_path),
@@ -374,9 +344,59 @@ def analyze_payout_ratio_mode(data_path: Path, output_path: Path) -> dict:
         },
     }
 
-    output_path.parent.mkdir(exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2, default=str)
+
+def analyze_payout_ratio_mode(data_path: Path, output_path: Path, force: bool = False) -> dict:
+    """DIST-002: Auszahlung-Gewinner Ratio Analyse.
+
+    Berechnet payout_per_winner = Auszahlung / Anzahl der Gewinner
+    fuer jede Gewinnklasse und erkennt Anomalien. Das Ergebnis kommt aus
+    dem ResultCache, solange Eingabedatei und Analysemodul unveraendert sind.
+
+    Args:
+        data_path: Pfad zur CSV-Datei (KENO_Quote_details_2023.csv)
+        output_path: Pfad fuer JSON-Output
+        force: Auch bei einem Cache-Treffer neu berechnen
+
+    Returns:
+        Analyse-Ergebnisse als dict
+    """
+    print("=" * 60)
+    print("DIST-002: Auszahlung-Gewinner Ratio Analyse")
+    print("=" * 60)
+
+    output = ResultCache(output_path.parent / ".cache").get_or_compute(
+        "dist002",
+        lambda: build_payout_ratio_output(data_path),
+        module="kenobase.analysis.distribution",
+        inputs={"quote_details": data_path},
+        params={"cv_threshold": 0.1},
+        publish_to=output_path,
+        force=force,
+    )
+
+    # Ergebnisse nach Keno-Typ gruppiert ausgeben
+    print("\n" + "-" * 60)
+    print("1. PAYOUT-PER-WINNER ANALYSE")
+    print(f"   Analysierte Kombinationen: {output['summary']['total_combinations']}")
+
+    print("\n" + "-" * 60)
+    print("2. ERGEBNISSE PRO GEWINNKLASSE")
+    for r in sorted(output["results"], key=lambda x: (x["keno_type"], -x["matches"])):
+        print(
+            f"   Keno-{r['keno_type']}/{r['matches']}: "
+            f"mean={r['mean_payout_per_winner']:.2f} EUR, "
+            f"CV={r['cv']:.4f}, "
+            f"n={r['n_draws']}, "
+            f"zero_draws={r['zero_winner_draws']}"
+        )
+
+    print("\n" + "-" * 60)
+    print("3. ANOMALIEN (CV > 10%)")
+    if output["anomalies"]:
+        for anomaly in output["anomalies"]:
+            print(f"   Keno-{anomaly['keno_type']}/{anomaly['matches']}: {anomaly['reason']}")
+    else:
+        print("   Keine Anomalien erkannt - Quoten sind konsistent")
     print(f"\nErgebnisse gespeichert: {output_path}")
 
     # Fazit
@@ -421,6 +441,11 @@ def parse_args():
         default=None,
         help="Pfad fuer JSON-Output",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="DIST-002 auch bei einem Cache-Treffer neu berechnen",
+    )
     return parser.parse_args()
 
 
@@ -431,7 +456,7 @@ if __name__ == "__main__":
         # DIST-002: Payout Ratio Analyse
         data_path = args.data or Path("Keno_GPTs/KENO_Quote_details_2023.csv")
         output_path = args.output or Path("results/dist002_payout_ratio.json")
-        analyze_payout_ratio_mode(data_path, output_path)
+        analyze_payout_ratio_mode(data_path, output_path, force=args.force)
     else:
         # Standard-Analyse
         data_path = args.data or Path("Keno_GPTs/Keno_GQ_2022_2023-2024.csv")
@@ -10,6 +10,9 @@ more unpopular numbers (below-median popularity).
 Acceptance Criteria:
 - Spearman |r| > 0.15 with p < 0.05 for high-stake subset
 
+Results are computed through the ResultCache in `<output dir>/.cache`; an
+unchanged stake file and module are served from the cache (--force recomputes).
+
 Usage:
     python scripts/analyze_house002.py
     python scripts/analyze_house002.py --output results/custom_output.json
@@ -18,7 +21,6 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import logging
 import sys
 from dataclasses import asdict
@@ -36,6 +38,7 @@ from kenobase.analysis.stake_correlation import (
     analyze_high_stake_popularity_bias,
     load_stake_data,
 )
+from kenobase.core.result_cache import ResultCache
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -47,66 +50,17 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
-def main() -> int:
-    """Run HOUSE-002 analysis."""
-    parser = argparse.ArgumentParser(
-        description="HOUSE-002: High-stake draws vs unpopular numbers analysis"
-    )
-    parser.add_argument(
-        "--stake-file",
-        type=str,
-        default="Keno_GPTs/Keno_Ziehung2023_+_Restbetrag_v2.CSV",
-        help="Path to stake data file",
-    )
-    parser.add_argument(
-        "--output",
-        type=str,
-        default="results/house002_stake_popularity.json",
-        help="Output JSON file path",
-    )
-    parser.add_argument(
-        "--percentile",
-        type=float,
-        default=0.75,
-        help="Percentile threshold for high-stake (default: 0.75 = top 25%%)",
-    )
-    parser.add_argument(
-        "--correlation-threshold",
-        type=float,
-        default=0.15,
-        help="Minimum |r| for hypothesis support (default: 0.15)",
-    )
-    parser.add_argument(
-        "--verbose",
-        "-v",
-        action="store_true",
-        help="Enable verbose logging",
-    )
+def build_output(stake_path: Path, percentile: float, correlation_threshold: float) -> dict:
+    """Run the analysis and build the JSON output.
 
-    args = parser.parse_args()
-    setup_logging(args.verbose)
+    Raises:
+        ValueError: If the stake data could not be loaded
+    """
     logger = logging.getLogger(__name__)
 
-    # Resolve paths
-    stake_path = project_root / args.stake_file
-    output_path = project_root / args.output
-
-    logger.info("=" * 60)
-    logger.info("HOUSE-002: High-Stake Draws vs Unpopular Numbers")
-    logger.info("=" * 60)
-
-    # Check input file exists
-    if not stake_path.exists():
-        logger.error(f"Stake file not found: {stake_path}")
-        return 1
-
-    # Load stake data
-    logger.info(f"Loading stake data from: {stake_path}")
     stake_records = load_stake_data(stake_path)
-
     if not stake_records:
-        logger.error("Failed to load stake data")
-        return 1
+        raise ValueError("Failed to load stake data")
 
     logger.info(f"Loaded {len(stake_records)} stake records")
 
@@ -116,14 +70,13 @@ def main() -> int:
 
     # Run HOUSE-002 analysis
     logger.info(
-        f"Running analysis (percentile={args.percentile}, "
-        f"threshold={args.correlation_threshold})"
+        f"Running analysis (percentile={percentile}, threshold={correlation_threshold})"
     )
     result = analyze_high_stake_popularity_bias(
         stake_records=stake_records,
         popularity_scores=popularity_scores,
-        high_stake_percentile=args.percentile,
-        correlation_threshold=args.correlation_threshold,
+        high_stake_percentile=percentile,
+        correlation_threshold=correlation_threshold,
     )
 
     # Build output (ensure all values are JSON-serializable)
@@ -135,18 +88,18 @@ def main() -> int:
         elif isinstance(value, bool):
             result_dict[key] = bool(value)
 
-    output = {
+    return {
         "hypothesis": "HOUSE-002",
         "description": "High-stake draws favor unpopular numbers",
         "timestamp": datetime.now().isoformat(),
         "parameters": {
             "stake_file": str(stake_path),
-            "high_stake_percentile": args.percentile,
-            "correlation_threshold": args.correlation_threshold,
+            "high_stake_percentile": percentile,
+            "correlation_threshold": correlation_threshold,
         },
         "result": result_dict,
         "acceptance_criteria": {
-            "required_r": f"|r| > {args.correlation_threshold}",
+            "required_r": f"|r| > {correlation_threshold}",
             "required_p": "p < 0.05",
         },
         "verdict": {
@@ -160,42 +113,122 @@ def main() -> int:
         },
     }
 
-    # Print summary
+
+def print_summary(output: dict) -> None:
+    """Print the analysis summary from the JSON output."""
+    result = output["result"]
+    threshold = output["parameters"]["correlation_threshold"]
+    ratio_diff = result["mean_unpopular_ratio_high"] - result["mean_unpopular_ratio_low"]
+
     print("\n" + "=" * 60)
     print("HOUSE-002 ANALYSIS RESULTS")
     print("=" * 60)
-    print(f"Data source: {stake_path.name}")
-    print(f"Records analyzed: {result.n_draws}")
-    print(f"High-stake draws (top 25%): {result.n_high_stake}")
-    print(f"High-stake threshold: {result.high_stake_threshold:,.0f} EUR")
+    print(f"Data source: {Path(output['parameters']['stake_file']).name}")
+    print(f"Records analyzed: {result['n_draws']}")
+    print(f"High-stake draws (top 25%): {result['n_high_stake']}")
+    print(f"High-stake threshold: {result['high_stake_threshold']:,.0f} EUR")
     print()
     print("CORRELATION RESULTS:")
-    print(f"  Spearman r: {result.spearman_r:.4f}")
-    print(f"  p-value: {result.spearman_p:.4f}")
-    print(f"  Significant (p < 0.05): {result.is_significant}")
+    print(f"  Spearman r: {result['spearman_r']:.4f}")
+    print(f"  p-value: {result['spearman_p']:.4f}")
+    print(f"  Significant (p < 0.05): {result['is_significant']}")
     print()
     print("UNPOPULAR NUMBER RATIOS:")
-    print(f"  High-stake draws: {result.mean_unpopular_ratio_high:.3f}")
-    print(f"  Low-stake draws: {result.mean_unpopular_ratio_low:.3f}")
-    print(f"  Difference: {result.mean_unpopular_ratio_high - result.mean_unpopular_ratio_low:+.3f}")
+    print(f"  High-stake draws: {result['mean_unpopular_ratio_high']:.3f}")
+    print(f"  Low-stake draws: {result['mean_unpopular_ratio_low']:.3f}")
+    print(f"  Difference: {ratio_diff:+.3f}")
     print()
     print("VERDICT:")
-    if result.supports_hypothesis:
+    if result["supports_hypothesis"]:
         print("  [SUPPORTED] High-stake draws favor unpopular numbers")
-        print(f"  Correlation |r|={abs(result.spearman_r):.4f} > {args.correlation_threshold}")
+        print(f"  Correlation |r|={abs(result['spearman_r']):.4f} > {threshold}")
     else:
         print("  [NOT SUPPORTED] No significant correlation detected")
-        if not result.is_significant:
-            print(f"  p-value {result.spearman_p:.4f} >= 0.05 (not significant)")
+        if not result["is_significant"]:
+            print(f"  p-value {result['spearman_p']:.4f} >= 0.05 (not significant)")
         else:
-            print(f"  |r|={abs(result.spearman_r):.4f} <= {args.correlation_threshold} (weak effect)")
+            print(f"  |r|={abs(result['spearman_r']):.4f} <= {threshold} (weak effect)")
     print("=" * 60)
 
-    # Save output
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
 
+def main() -> int:
+    """Run HOUSE-002 analysis."""
+    parser = argparse.ArgumentParser(
+        description="HOUSE-002: High-stake draws vs unpopular numbers analysis"
+    )
+    parser.add_argument(
+        "--stake-file",
+        type=str,
+        default="Keno_GPTs/Keno_Ziehung2023_+_Restbetrag_v2.CSV",
+        help="Path to stake data file",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default="results/house002_stake_popularity.json",
+        help="Output JSON file path",
+    )
+    parser.add_argument(
+        "--percentile",
+        type=float,
+        default=0.75,
+        help="Percentile threshold for high-stake (default: 0.75 = top 25%%)",
+    )
+    parser.add_argument(
+        "--correlation-threshold",
+        type=float,
+        default=0.15,
+        help="Minimum |r| for hypothesis support (default: 0.15)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompute even if a cached result exists",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Enable verbose logging",
+    )
+
+    args = parser.parse_args()
+    setup_logging(args.verbose)
+    logger = logging.getLogger(__name__)
+
+    # Resolve paths
+    stake_path = project_root / args.stake_file
+    output_path = project_root / args.output
+
+    logger.info("=" * 60)
+    logger.info("HOUSE-002: High-Stake Draws vs Unpopular Numbers")
+    logger.info("=" * 60)
+
+    # Check input file exists
+    if not stake_path.exists():
+        logger.error(f"Stake file not found: {stake_path}")
+        return 1
+
+    # Run analysis (or reuse the cached result) and publish it to output_path
+    logger.info(f"Loading stake data from: {stake_path}")
+    try:
+        output = ResultCache(output_path.parent / ".cache").get_or_compute(
+            "house002",
+            lambda: build_output(stake_path, args.percentile, args.correlation_threshold),
+            module="kenobase.analysis.stake_correlation",
+            inputs={"stake": stake_path},
+            params={
+                "high_stake_percentile": args.percentile,
+                "correlation_threshold": args.correlation_threshold,
+            },
+            publish_to=output_path,
+            force=args.force,
+        )
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+
+    print_summary(output)
     logger.info(f"Results saved to: {output_path}")
 
     return 0
@@ -10,6 +10,9 @@ Hypothesis: CV (Coefficient of Variation) < 15% on at least 2 of 3 windows
 Acceptance Criteria:
 - CV < 15% on at least 2 of 3 windows indicates SUPPORTED
 
+Results are computed through the ResultCache in `<output dir>/.cache`; an
+unchanged stake file and module are served from the cache (--force recomputes).
+
 Usage:
     python scripts/analyze_house003.py
     python scripts/analyze_house003.py --output results/custom_output.json
@@ -18,7 +21,6 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import logging
 import sys
 from datetime import datetime
@@ -34,6 +36,7 @@ from kenobase.analysis.house_edge_stability import (
     result_to_dict,
     run_house003_analysis,
 )
+from kenobase.core.result_cache import ResultCache
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -45,6 +48,85 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
+def build_output(stake_path: Path, cv_threshold: float) -> dict:
+    """Run the analysis and build the JSON output.
+
+    Raises:
+        ValueError: If the stake data could not be loaded or analyzed
+    """
+    result = run_house003_analysis(
+        stake_path=stake_path,
+        windows=DEFAULT_WINDOWS,
+        cv_threshold=cv_threshold,
+    )
+    if result.n_records == 0:
+        raise ValueError("Failed to load or analyze stake data")
+
+    return {
+        "hypothesis": "HOUSE-003",
+        "description": "Rolling House-Edge Stability via CV over 7/14/30 day windows",
+        "timestamp": datetime.now().isoformat(),
+        "parameters": {
+            "stake_file": str(stake_path),
+            "windows": DEFAULT_WINDOWS,
+            "cv_threshold": cv_threshold,
+        },
+        "result": result_to_dict(result),
+        "acceptance_criteria": {
+            "cv_threshold": f"CV < {cv_threshold * 100:.0f}%",
+            "minimum_stable_windows": "2 of 3",
+        },
+        "verdict": {
+            "stable_count": result.stable_count,
+            "total_windows": result.total_windows,
+            "hypothesis_supported": result.hypothesis_supported,
+            "conclusion": (
+                "SUPPORTED: Low variance in Restbetrag indicates active payout control"
+                if result.hypothesis_supported
+                else "NOT SUPPORTED: Variance is within expected random range"
+            ),
+        },
+    }
+
+
+def print_summary(output: dict) -> None:
+    """Print the analysis summary from the JSON output."""
+    result = output["result"]
+    cv_threshold = output["parameters"]["cv_threshold"]
+
+    print("\n" + "=" * 60)
+    print("HOUSE-003 ANALYSIS RESULTS")
+    print("=" * 60)
+    print(f"Data source: {Path(output['parameters']['stake_file']).name}")
+    print(f"Records analyzed: {result['n_records']}")
+    print(
+        f"Date range: {(result['date_range_start'] or '')[:10]} to "
+        f"{(result['date_range_end'] or '')[:10]}"
+    )
+    print(f"Field analyzed: {result['field_analyzed']}")
+    print()
+    print(f"CV Threshold: {cv_threshold * 100:.0f}%")
+    print()
+    print("ROLLING WINDOW RESULTS:")
+    for ws in sorted(result["windows"], key=int):
+        wr = result["windows"][ws]
+        status = "STABLE" if wr["is_stable"] else "UNSTABLE"
+        print(f"  {int(ws):2d}-day window:")
+        print(f"    CV mean: {wr['cv_mean'] * 100:6.2f}%")
+        print(f"    CV std:  {wr['cv_std'] * 100:6.2f}%")
+        print(f"    CV range: [{wr['cv_min'] * 100:.2f}%, {wr['cv_max'] * 100:.2f}%]")
+        print(f"    N windows: {wr['n_windows']}")
+        print(f"    Status: [{status}]")
+        print()
+    print("VERDICT:")
+    print(f"  Stable windows: {result['stable_count']}/{result['total_windows']}")
+    if result["hypothesis_supported"]:
+        print("  [SUPPORTED] Low variance indicates active payout control")
+    else:
+        print("  [NOT SUPPORTED] Variance is within expected random range")
+    print("=" * 60)
+
+
 def main() -> int:
     """Run HOUSE-003 analysis."""
     parser = argparse.ArgumentParser(
@@ -68,6 +150,11 @@ def main() -> int:
         default=CV_STABILITY_THRESHOLD,
         help=f"CV threshold for stability (default: {CV_STABILITY_THRESHOLD})",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompute even if a cached result exists",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -92,85 +179,24 @@ def main() -> int:
         logger.error(f"Stake file not found: {stake_path}")
         return 1
 
-    # Run analysis
+    # Run analysis (or reuse the cached result) and publish it to output_path
     logger.info(f"Loading stake data from: {stake_path}")
-    result = run_house003_analysis(
-        stake_path=stake_path,
-        windows=DEFAULT_WINDOWS,
-        cv_threshold=args.cv_threshold,
-    )
-
-    if result.n_records == 0:
-        logger.error("Failed to load or analyze stake data")
+    try:
+        output = ResultCache(output_path.parent / ".cache").get_or_compute(
+            "house003",
+            lambda: build_output(stake_path, args.cv_threshold),
+            module="kenobase.analysis.house_edge_stability",
+            inputs={"stake": stake_path},
+            params={"windows": DEFAULT_WINDOWS, "cv_threshold": args.cv_threshold},
+            publish_to=output_path,
+            force=args.force,
+        )
+    except ValueError as e:
+        logger.error(str(e))
         return 1
 
-    logger.info(f"Analyzed {result.n_records} records")
-
-    # Build output
-    output = {
-        "hypothesis": "HOUSE-003",
-        "description": "Rolling House-Edge Stability via CV over 7/14/30 day windows",
-        "timestamp": datetime.now().isoformat(),
-        "parameters": {
-            "stake_file": str(stake_path),
-            "windows": DEFAULT_WINDOWS,
-            "cv_threshold": args.cv_threshold,
-        },
-        "result": result_to_dict(result),
-        "acceptance_criteria": {
-            "cv_threshold": f"CV < {args.cv_threshold * 100:.0f}%",
-            "minimum_stable_windows": "2 of 3",
-        },
-        "verdict": {
-            "stable_count": result.stable_count,
-            "total_windows": result.total_windows,
-            "hypothesis_supported": result.hypothesis_supported,
-            "conclusion": (
-                "SUPPORTED: Low variance in Restbetrag indicates active payout control"
-                if result.hypothesis_supported
-                else "NOT SUPPORTED: Variance is within expected random range"
-            ),
-        },
-    }
-
-    # Print summary
-    print("\n" + "=" * 60)
-    print("HOUSE-003 ANALYSIS RESULTS")
-    print("=" * 60)
-    print(f"Data source: {stake_path.name}")
-    print(f"Records analyzed: {result.n_records}")
-    print(
-        f"Date range: {result.date_range_start.strftime('%Y-%m-%d')} to "
-        f"{result.date_range_end.strftime('%Y-%m-%d')}"
-    )
-    print(f"Field analyzed: {result.field_analyzed}")
-    print()
-    print(f"CV Threshold: {args.cv_threshold * 100:.0f}%")
-    print()
-    print("ROLLING WINDOW RESULTS:")
-    for ws in sorted(result.windows.keys()):
-        wr = result.windows[ws]
-        status = "STABLE" if wr.is_stable else "UNSTABLE"
-        print(f"  {ws:2d}-day window:")
-        print(f"    CV mean: {wr.cv_mean * 100:6.2f}%")
-        print(f"    CV std:  {wr.cv_std * 100:6.2f}%")
-        print(f"    CV range: [{wr.cv_min * 100:.2f}%, {wr.cv_max * 100:.2f}%]")
-        print(f"    N windows: {wr.n_windows}")
-        print(f"    Status: [{status}]")
-        print()
-    print("VERDICT:")
-    print(f"  Stable windows: {result.stable_count}/{result.total_windows}")
-    if result.hypothesis_supported:
-        print("  [SUPPORTED] Low variance indicates active payout control")
-    else:
-        print("  [NOT SUPPORTED] Variance is within expected random range")
-    print("=" * 60)
-
-    # Save output
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
-
+    logger.info(f"Analyzed {output['result']['n_records']} records")
+    print_summary(output)
     logger.info(f"Results saved to: {output_path}")
 
     return 0
@@ -17,11 +17,14 @@ Akzeptanzkriterien:
 - AC6: Unit-Tests >= 3 PASSED (separat in tests/unit/test_distribution.py)
 
 Repro: python scripts/analyze_hyp001_complete.py -> results/hyp001_distribution_complete.json
+
+Das Ergebnis wird ueber den ResultCache in `<Output-Verzeichnis>/.cache` berechnet;
+bei unveraenderter GQ-Datei und unveraendertem Skript kommt es aus dem Cache
+(--force rechnet neu).
 """
 
 from __future__ import annotations
 
-import json
 import logging
 import sys
 from dataclasses import asdict, dataclass
@@ -49,6 +52,7 @@ from kenobase.analysis.near_miss import (
     analyze_all_near_miss,
     count_significant_anomalies,
 )
+from kenobase.core.result_cache import ResultCache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -301,31 +305,15 @@ def evaluate_hypothesis(
     }
 
 
-def run_hyp001_complete(
-    data_path: Optional[str] = None,
-    output_path: Optional[str] = None,
-) -> HYP001CompleteResult:
-    """Fuehrt vollstaendige HYP-001 Analyse durch.
+def compute_hyp001_complete(data_file: Path) -> HYP001CompleteResult:
+    """Berechnet die vollstaendige HYP-001 Analyse (ohne Speichern).
 
     Args:
-        data_path: Pfad zur GQ-Datendatei
-        output_path: Pfad fuer JSON-Output
+        data_file: Pfad zur GQ-Datendatei
 
     Returns:
         HYP001CompleteResult
     """
-    # Bestimme Pfade
-    if data_path is None:
-        data_path = "Keno_GPTs/Keno_GQ_2022_2023-2024.csv"
-
-    if output_path is None:
-        output_path = "results/hyp001_distribution_complete.json"
-
-    data_file = Path(data_path)
-    if not data_file.exists():
-        # Versuche absoluten Pfad
-        data_file = Path(__file__).parent.parent / data_path
-
     logger.info(f"Lade Daten von: {data_file}")
 
     # Lade Daten
@@ -381,8 +369,7 @@ def run_hyp001_complete(
         ),
     }
 
-    # Erstelle Ergebnis
-    result = HYP001CompleteResult(
+    return HYP001CompleteResult(
         analysis_date=datetime.now().isoformat(),
         data_source=str(data_file),
         period_start=df["Datum"].min().isoformat(),
@@ -400,16 +387,51 @@ def run_hyp001_complete(
         summary_stats=summary_stats,
     )
 
-    # Speichere Ergebnis
-    output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(asdict(result), f, ensure_ascii=False, indent=2, default=str)
+def run_hyp001_complete(
+    data_path: Optional[str] = None,
+    output_path: Optional[str] = None,
+    force: bool = False,
+) -> HYP001CompleteResult:
+    """Fuehrt vollstaendige HYP-001 Analyse durch.
+
+    Das Ergebnis kommt aus dem ResultCache (`<Output-Verzeichnis>/.cache`),
+    solange GQ-Datei und Skript unveraendert sind, und wird nach output_path
+    veroeffentlicht.
+
+    Args:
+        data_path: Pfad zur GQ-Datendatei
+        output_path: Pfad fuer JSON-Output
+        force: Auch bei einem Cache-Treffer neu berechnen
+
+    Returns:
+        HYP001CompleteResult
+    """
+    # Bestimme Pfade
+    if data_path is None:
+        data_path = "Keno_GPTs/Keno_GQ_2022_2023-2024.csv"
+
+    if output_path is None:
+        output_path = "results/hyp001_distribution_complete.json"
+
+    data_file = Path(data_path)
+    if not data_file.exists():
+        # Versuche absoluten Pfad
+        data_file = Path(__file__).parent.parent / data_path
+
+    output_file = Path(output_path)
+    output = ResultCache(output_file.parent / ".cache").get_or_compute(
+        "hyp001",
+        lambda: asdict(compute_hyp001_complete(data_file)),
+        module="scripts.analyze_hyp001_complete",
+        inputs={"gq": data_file},
+        publish_to=output_file,
+        force=force,
+    )
 
     logger.info(f"Ergebnis gespeichert: {output_file}")
 
-    return result
+    return HYP001CompleteResult(**output)
 
 
 def print_summary(result: HYP001CompleteResult) -> None:
@@ -513,9 +535,16 @@ def main() -> int:
             default=None,
             help="Output JSON (default: results/hyp001_distribution_complete.json)",
         )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Auch bei einem Cache-Treffer neu berechnen",
+        )
         args = parser.parse_args()
 
-        result = run_hyp001_complete(data_path=args.data, output_path=args.output)
+        result = run_hyp001_complete(
+            data_path=args.data, output_path=args.output, force=args.force
+        )
         print_summary(result)
 
         # AC Checklist
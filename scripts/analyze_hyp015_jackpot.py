@@ -7,6 +7,10 @@ Zahlentypen korreliert - insbesondere Birthday-Zahlen (1-31) vs Hohe Zahlen (32-
 Hypothese: Signifikante Korrelation (|r| > 0.2, p < 0.05, Chi-Quadrat p < 0.05)
 zwischen Jackpot-Events und Zahlentyp-Verteilung deutet auf nicht-zufaellige Muster hin.
 
+Das Ergebnis wird ueber den ResultCache in `<Output-Verzeichnis>/.cache` berechnet;
+bei unveraenderten Eingaben und unveraendertem Modul kommt es aus dem Cache
+(--force rechnet neu).
+
 Usage:
     python scripts/analyze_hyp015_jackpot.py
     python scripts/analyze_hyp015_jackpot.py --keno-data data/raw/keno/KENO_ab_2018.csv
@@ -23,10 +27,11 @@ project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
 from kenobase.analysis.jackpot_correlation import (
-    export_result_to_json,
+    result_to_dict,
     run_hyp015_analysis,
 )
 from kenobase.core.data_loader import DataLoader
+from kenobase.core.result_cache import ResultCache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -35,6 +40,16 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def build_output(keno_path: Path, gk1_path: Path) -> dict:
+    """Laedt die Ziehungen, fuehrt HYP-015 aus und liefert das JSON-Ergebnis."""
+    logger.info("\nLoading KENO draw data...")
+    draws = DataLoader().load(keno_path)
+    logger.info(f"Loaded {len(draws)} KENO draws")
+
+    logger.info("\nRunning HYP-015 analysis...")
+    return result_to_dict(run_hyp015_analysis(draws, gk1_path))
+
+
 def main():
     """Run HYP-015 jackpot correlation analysis."""
     parser = argparse.ArgumentParser(
@@ -60,6 +75,11 @@ def main():
         default=project_root / "results" / "hyp015_jackpot_correlation.json",
         help="Output JSON file path",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompute even if a cached result exists",
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -87,79 +107,76 @@ def main():
     logger.info(f"GK1 data:  {args.gk1_data}")
     logger.info(f"Output:    {args.output}")
 
-    # Load KENO draw data
-    logger.info("\nLoading KENO draw data...")
-    loader = DataLoader()
-    draws = loader.load(args.keno_data)
-    logger.info(f"Loaded {len(draws)} KENO draws")
-
-    # Run analysis
-    logger.info("\nRunning HYP-015 analysis...")
-    result = run_hyp015_analysis(draws, args.gk1_data)
+    # Run analysis (or reuse the cached result) and export it to args.output
+    result = ResultCache(args.output.parent / ".cache").get_or_compute(
+        "hyp015",
+        lambda: build_output(args.keno_data, args.gk1_data),
+        module="kenobase.analysis.jackpot_correlation",
+        inputs={"keno": args.keno_data, "gk1": args.gk1_data},
+        publish_to=args.output,
+        force=args.force,
+    )
 
     # Print results
     logger.info("\n" + "=" * 60)
     logger.info("RESULTS")
     logger.info("=" * 60)
 
-    corr = result.correlation
+    corr = result["correlation"]
     logger.info(f"\nSample Sizes:")
-    logger.info(f"  Jackpot draws: {corr.n_jackpot_draws}")
-    logger.info(f"  Normal draws:  {corr.n_normal_draws}")
-    logger.info(f"  Total draws:   {corr.n_total_draws}")
+    logger.info(f"  Jackpot draws: {corr['n_jackpot_draws']}")
+    logger.info(f"  Normal draws:  {corr['n_normal_draws']}")
+    logger.info(f"  Total draws:   {corr['n_total_draws']}")
 
     logger.info(f"\nCorrelation (Birthday ratio vs Jackpot indicator):")
-    logger.info(f"  Pearson r:     {corr.pearson_r:+.4f} (p={corr.pearson_p:.4f})")
-    logger.info(f"  Spearman r:    {corr.spearman_r:+.4f} (p={corr.spearman_p:.4f})")
+    logger.info(f"  Pearson r:     {corr['pearson_r']:+.4f} (p={corr['pearson_p']:.4f})")
+    logger.info(f"  Spearman r:    {corr['spearman_r']:+.4f} (p={corr['spearman_p']:.4f})")
 
     logger.info(f"\nChi-Square Test (Birthday vs High distribution):")
-    logger.info(f"  Chi2 stat:     {corr.chi_square_stat:.4f}")
-    logger.info(f"  p-value:       {corr.chi_square_p:.4f}")
-    logger.info(f"  DoF:           {corr.chi_square_dof}")
+    logger.info(f"  Chi2 stat:     {corr['chi_square_stat']:.4f}")
+    logger.info(f"  p-value:       {corr['chi_square_p']:.4f}")
+    logger.info(f"  DoF:           {corr['chi_square_dof']}")
 
     logger.info(f"\nSignificance Assessment:")
-    logger.info(f"  |r| > 0.2 met: {abs(corr.pearson_r) > 0.2}")
-    logger.info(f"  p < 0.05 met:  {corr.pearson_p < 0.05}")
-    logger.info(f"  Chi2 p < 0.05: {corr.chi_square_p < 0.05}")
-    logger.info(f"  IS SIGNIFICANT: {corr.is_significant}")
+    logger.info(f"  |r| > 0.2 met: {abs(corr['pearson_r']) > 0.2}")
+    logger.info(f"  p < 0.05 met:  {corr['pearson_p'] < 0.05}")
+    logger.info(f"  Chi2 p < 0.05: {corr['chi_square_p'] < 0.05}")
+    logger.info(f"  IS SIGNIFICANT: {corr['is_significant']}")
 
     # Number type statistics
     logger.info(f"\nNumber Type Statistics:")
     logger.info(f"{'Category':<12} {'Jackpot':<10} {'Normal':<10} {'Diff':<10} {'Z-Score':<10}")
     logger.info("-" * 52)
-    for stat in result.number_type_stats:
-        if stat.category in ["birthday", "high", "even", "odd"]:
+    for stat in result["number_type_stats"]:
+        if stat["category"] in ["birthday", "high", "even", "odd"]:
             logger.info(
-                f"{stat.category:<12} {stat.jackpot_ratio:>9.4f} {stat.normal_ratio:>9.4f} "
-                f"{stat.difference:>+9.4f} {stat.z_score:>+9.2f}"
+                f"{stat['category']:<12} {stat['jackpot_ratio']:>9.4f} "
+                f"{stat['normal_ratio']:>9.4f} {stat['difference']:>+9.4f} "
+                f"{stat['z_score']:>+9.2f}"
             )
 
     # Decade statistics
     logger.info(f"\nDecade Distribution:")
     logger.info(f"{'Decade':<12} {'Jackpot':<10} {'Normal':<10} {'Diff':<10}")
     logger.info("-" * 42)
-    for stat in result.number_type_stats:
-        if stat.category.startswith("decade_"):
-            decade_idx = int(stat.category.split("_")[1])
+    for stat in result["number_type_stats"]:
+        if stat["category"].startswith("decade_"):
+            decade_idx = int(stat["category"].split("_")[1])
             decade_label = f"{decade_idx}0s" if decade_idx > 0 else "1-9"
             logger.info(
-                f"{decade_label:<12} {stat.jackpot_ratio:>9.4f} {stat.normal_ratio:>9.4f} "
-                f"{stat.difference:>+9.4f}"
+                f"{decade_label:<12} {stat['jackpot_ratio']:>9.4f} "
+                f"{stat['normal_ratio']:>9.4f} {stat['difference']:>+9.4f}"
             )
 
-    # Export results
-    logger.info(f"\nExporting results to {args.output}...")
-    export_result_to_json(result, args.output)
-
     # Conclusion
     logger.info("\n" + "=" * 60)
     logger.info("CONCLUSION")
     logger.info("=" * 60)
-    if corr.is_significant:
+    if corr["is_significant"]:
         logger.info(
             "SIGNIFICANT correlation found between jackpot events and number types."
         )
-        if corr.pearson_r > 0:
+        if corr["pearson_r"] > 0:
             logger.info("Birthday numbers (1-31) appear MORE often during jackpots.")
         else:
             logger.info("Birthday numbers (1-31) appear LESS often during jackpots.")
@@ -172,7 +189,7 @@ def main():
     logger.info(f"\nResults saved to: {args.output}")
     logger.info("Done.")
 
-    return 0 if not corr.is_significant else 0  # Always success for completed analysis
+    return 0 if not corr["is_significant"] else 0  # Always success for completed analysis
 
 
 if __name__ == "__main__":
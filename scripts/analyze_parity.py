@@ -7,6 +7,7 @@ in Lotterieziehungen und testet gegen 50/50 Erwartung.
 Verwendung:
     python scripts/analyze_parity.py --game keno
     python scripts/analyze_parity.py --game lotto --output results/lotto_parity.json
+    python scripts/analyze_parity.py --game keno --config config/default.yaml
 """
 
 from __future__ import annotations
@@ -24,6 +25,7 @@ from kenobase.analysis.parity_ratio import (
     ParityRatioResult,
     analyze_parity_ratio,
 )
+from kenobase.core.config import load_config
 from kenobase.core.data_loader import load_draws, GameType
 
 
@@ -86,6 +88,12 @@ def main() -> int:
         default=0.10,
         help="Guardrail-Schwelle fuer Abweichung (default: 0.10 = 10%%)",
     )
+    parser.add_argument(
+        "--config",
+        type=str,
+        default="config/default.yaml",
+        help="Konfiguration mit Zahlenbereich des Spiels (default: config/default.yaml)",
+    )
 
     args = parser.parse_args()
 
@@ -117,9 +125,12 @@ def main() -> int:
 
     # Fuehre Analyse durch
     print(f"Analyzing parity ratio with guardrail={args.guardrail:.1%}...")
+    # Zahlenbereich aus der Spielkonfiguration (Nullmodell des exakten Tests)
+    game_config = load_config(args.config).games[args.game]
     result = analyze_parity_ratio(
         draws=draws,
         guardrail_ratio=args.guardrail,
+        max_number=game_config.numbers_range[1],
     )
 
     # Ausgabe
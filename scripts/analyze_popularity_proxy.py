@@ -14,6 +14,9 @@ Usage:
 
 Output:
     JSON report with correlation analysis and per-window statistics.
+
+Reports are computed through the ResultCache in `<output dir>/.cache`; unchanged
+draw/GQ files and module are served from the cache (--force recomputes).
 """
 
 from __future__ import annotations
@@ -37,6 +40,7 @@ from kenobase.analysis.popularity_correlation import (
     load_gq_popularity,
 )
 from kenobase.core.data_loader import DataLoader
+from kenobase.core.result_cache import ResultCache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -140,124 +144,41 @@ def evaluate_acceptance_criteria(
     }
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(
-        description="Popularity Proxy Analysis: Birthday Score vs Winner Count"
-    )
-    parser.add_argument(
-        "--draws",
-        type=Path,
-        default=Path("data/raw/keno/KENO_ab_2018.csv"),
-        help="Path to draws CSV file",
-    )
-    parser.add_argument(
-        "--gq-dir",
-        type=Path,
-        default=Path("data/raw/keno"),
-        help="Directory containing GQ CSV files",
-    )
-    parser.add_argument(
-        "--gq-file",
-        type=Path,
-        default=None,
-        help="Specific GQ file to use (overrides --gq-dir)",
-    )
-    parser.add_argument(
-        "--window",
-        type=int,
-        default=30,
-        help="Rolling window size for stability test (default: 30)",
-    )
-    parser.add_argument(
-        "--output",
-        type=Path,
-        default=Path("results/popularity_proxy.json"),
-        help="Output JSON path",
-    )
-    parser.add_argument(
-        "--verbose",
-        "-v",
-        action="store_true",
-        help="Verbose output",
-    )
-
-    args = parser.parse_args()
+def build_report(draws_path: Path, gq_files: list[Path], window: int) -> dict[str, Any]:
+    """Load draws and GQ data, run the correlation and build the JSON report.
 
-    if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+    Args:
+        draws_path: Path to draws CSV file
+        gq_files: GQ CSV files to merge
+        window: Rolling window size
 
-    # Validate inputs
-    if not args.draws.exists():
-        logger.error(f"Draws file not found: {args.draws}")
-        print(f"\nError: Draws file not found: {args.draws}")
-        return 1
+    Returns:
+        JSON report
 
-    # Load draws
-    logger.info(f"Loading draws from {args.draws}...")
+    Raises:
+        ValueError: If no draws or no GQ data could be loaded
+    """
+    logger.info(f"Loading draws from {draws_path}...")
     try:
         loader = DataLoader()
-        draws = loader.load(args.draws)
-        logger.info(f"Loaded {len(draws)} draws")
+        draws = loader.load(draws_path)
     except Exception as e:
-        logger.error(f"Failed to load draws: {e}")
-        print(f"\nError: Failed to load draws: {e}")
-        return 1
+        raise ValueError(f"Failed to load draws: {e}") from e
+    logger.info(f"Loaded {len(draws)} draws")
 
     if not draws:
-        logger.error("No draws loaded")
-        print("\nError: No draws loaded from file")
-        return 1
-
-    # Load GQ data
-    if args.gq_file:
-        gq_files = [args.gq_file] if args.gq_file.exists() else []
-    else:
-        gq_files = find_gq_files(args.gq_dir)
-
-    if not gq_files:
-        logger.warning("No GQ files found - analysis cannot proceed")
-        print("\nWarning: No GQ files found in specified directory")
-        print("The Popularity Proxy analysis requires Gewinnquoten data.")
-        print("\nExpected file pattern: *GQ*.csv or *Gewinnquoten*.csv")
-        print(f"Searched directory: {args.gq_dir}")
-
-        # Create empty report
-        report = {
-            "hypothesis": "POPULARITY_PROXY",
-            "title": "Birthday Score vs Winner Count Correlation",
-            "timestamp": datetime.now().isoformat(),
-            "status": "NO_DATA",
-            "error": "No Gewinnquoten (GQ) files found",
-            "data_sources": {
-                "draws_file": str(args.draws),
-                "gq_dir": str(args.gq_dir),
-                "gq_files_found": 0,
-            },
-            "summary": {
-                "result": "INCONCLUSIVE",
-                "interpretation": "Cannot test hypothesis without GQ data",
-            },
-        }
-
-        args.output.parent.mkdir(parents=True, exist_ok=True)
-        with open(args.output, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
-
-        print(f"\nEmpty report saved to: {args.output}")
-        return 1
+        raise ValueError("No draws loaded from file")
 
     logger.info(f"Found {len(gq_files)} GQ files")
     gq_data = merge_gq_data(gq_files)
     logger.info(f"Merged GQ data for {len(gq_data)} dates")
 
     if not gq_data:
-        logger.error("No valid GQ data loaded")
-        print("\nError: Failed to load any GQ data")
-        return 1
+        raise ValueError("Failed to load any GQ data")
 
     # Run correlation analysis
     logger.info("Running popularity proxy correlation analysis...")
-    results = correlate_birthday_with_winners(draws, gq_data, window=args.window)
+    results = correlate_birthday_with_winners(draws, gq_data, window=window)
 
     overall = results["overall"]
     rolling = results["rolling"]
@@ -272,7 +193,7 @@ def main() -> int:
         "title": "Birthday Score vs Winner Count Correlation",
         "timestamp": datetime.now().isoformat(),
         "data_sources": {
-            "draws_file": str(args.draws),
+            "draws_file": str(draws_path),
             "n_draws": len(draws),
             "gq_files": [str(f) for f in gq_files],
             "n_gq_dates": len(gq_data),
@@ -287,7 +208,7 @@ def main() -> int:
             "mean_winners": round(overall.mean_winners, 2),
         },
         "rolling_analysis": {
-            "window_size": args.window,
+            "window_size": window,
             "n_windows": len(rolling),
             "mean_correlation": summary.get("mean_rolling_correlation", 0),
             "std_correlation": summary.get("std_rolling_correlation", 0),
@@ -349,37 +270,36 @@ def main() -> int:
             f"Rolling stability: {support_pct:.1f}% of windows support hypothesis"
         )
 
-    # Create output directory
-    args.output.parent.mkdir(parents=True, exist_ok=True)
+    return report
 
-    # Write report
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
 
-    logger.info(f"Report saved to: {args.output}")
+def print_summary(report: dict[str, Any], output_path: Path) -> None:
+    """Print the analysis summary from the JSON report."""
+    overall = report["overall_result"]
+    rolling = report["rolling_analysis"]
+    acceptance = report["acceptance_criteria"]
 
-    # Print summary
     print("\n" + "=" * 60)
     print("POPULARITY PROXY ANALYSIS")
     print("Birthday Score vs Winner Count Correlation")
     print("=" * 60)
-    print(f"Draws: {len(draws)}")
-    print(f"GQ Dates: {len(gq_data)}")
-    print(f"Paired Samples: {overall.n_samples}")
+    print(f"Draws: {report['data_sources']['n_draws']}")
+    print(f"GQ Dates: {report['data_sources']['n_gq_dates']}")
+    print(f"Paired Samples: {overall['n_paired_samples']}")
     print()
-    print(f"Correlation (Spearman): r = {overall.correlation:.4f}")
-    print(f"P-Value: {overall.p_value:.6f}")
-    print(f"Significant (p < 0.05): {overall.is_significant}")
-    print(f"Supports Hypothesis (r > 0.3): {overall.supports_hypothesis}")
+    print(f"Correlation (Spearman): r = {overall['correlation']:.4f}")
+    print(f"P-Value: {overall['p_value']:.6f}")
+    print(f"Significant (p < 0.05): {overall['is_significant']}")
+    print(f"Supports Hypothesis (r > 0.3): {overall['supports_hypothesis']}")
     print()
-    print(f"Mean Birthday Score: {overall.mean_birthday_score:.2%}")
-    print(f"Mean Winners per Draw: {overall.mean_winners:.1f}")
+    print(f"Mean Birthday Score: {overall['mean_birthday_score']:.2%}")
+    print(f"Mean Winners per Draw: {overall['mean_winners']:.1f}")
     print()
 
-    if rolling:
-        print(f"Rolling Windows ({args.window}): {len(rolling)}")
-        print(f"Mean Rolling Correlation: {summary.get('mean_rolling_correlation', 0):.4f}")
-        print(f"Supporting Windows: {summary.get('supporting_windows', 0)}/{len(rolling)}")
+    if rolling["n_windows"]:
+        print(f"Rolling Windows ({rolling['window_size']}): {rolling['n_windows']}")
+        print(f"Mean Rolling Correlation: {rolling['mean_correlation']:.4f}")
+        print(f"Supporting Windows: {rolling['supporting_windows']}/{rolling['n_windows']}")
         print()
 
     print(f"Result: {report['summary']['result']}")
@@ -393,9 +313,125 @@ def main() -> int:
     for finding in report["summary"]["key_findings"]:
         print(f"  - {finding}")
     print()
-    print(f"Full report: {args.output}")
+    print(f"Full report: {output_path}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Popularity Proxy Analysis: Birthday Score vs Winner Count"
+    )
+    parser.add_argument(
+        "--draws",
+        type=Path,
+        default=Path("data/raw/keno/KENO_ab_2018.csv"),
+        help="Path to draws CSV file",
+    )
+    parser.add_argument(
+        "--gq-dir",
+        type=Path,
+        default=Path("data/raw/keno"),
+        help="Directory containing GQ CSV files",
+    )
+    parser.add_argument(
+        "--gq-file",
+        type=Path,
+        default=None,
+        help="Specific GQ file to use (overrides --gq-dir)",
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=30,
+        help="Rolling window size for stability test (default: 30)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("results/popularity_proxy.json"),
+        help="Output JSON path",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompute even if a cached report exists",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Verbose output",
+    )
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    # Validate inputs
+    if not args.draws.exists():
+        logger.error(f"Draws file not found: {args.draws}")
+        print(f"\nError: Draws file not found: {args.draws}")
+        return 1
+
+    # Find GQ files
+    if args.gq_file:
+        gq_files = [args.gq_file] if args.gq_file.exists() else []
+    else:
+        gq_files = sorted(find_gq_files(args.gq_dir))
+
+    if not gq_files:
+        logger.warning("No GQ files found - analysis cannot proceed")
+        print("\nWarning: No GQ files found in specified directory")
+        print("The Popularity Proxy analysis requires Gewinnquoten data.")
+        print("\nExpected file pattern: *GQ*.csv or *Gewinnquoten*.csv")
+        print(f"Searched directory: {args.gq_dir}")
+
+        # Create empty report
+        report = {
+            "hypothesis": "POPULARITY_PROXY",
+            "title": "Birthday Score vs Winner Count Correlation",
+            "timestamp": datetime.now().isoformat(),
+            "status": "NO_DATA",
+            "error": "No Gewinnquoten (GQ) files found",
+            "data_sources": {
+                "draws_file": str(args.draws),
+                "gq_dir": str(args.gq_dir),
+                "gq_files_found": 0,
+            },
+            "summary": {
+                "result": "INCONCLUSIVE",
+                "interpretation": "Cannot test hypothesis without GQ data",
+            },
+        }
+
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+        print(f"\nEmpty report saved to: {args.output}")
+        return 1
+
+    # Run analysis (or reuse the cached report) and publish it to args.output
+    try:
+        report = ResultCache(args.output.parent / ".cache").get_or_compute(
+            "dist004",
+            lambda: build_report(args.draws, gq_files, args.window),
+            module="kenobase.analysis.popularity_correlation",
+            inputs={"draws": args.draws, **{f"gq:{f.name}": f for f in gq_files}},
+            params={"window": args.window},
+            publish_to=args.output,
+            force=args.force,
+        )
+    except ValueError as e:
+        logger.error(str(e))
+        print(f"\nError: {e}")
+        return 1
+
+    logger.info(f"Report saved to: {args.output}")
+
+    print_summary(report, args.output)
 
-    return 0 if acceptance["all_passed"] else 1
+    return 0 if report["acceptance_criteria"]["all_passed"] else 1
 
 
 if __name__ == "__main__":
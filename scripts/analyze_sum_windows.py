@@ -11,6 +11,10 @@ KENO-Kontext:
 - Erwartungswert: E[sum] = 20 * (1+70)/2 = 710
 - Theoretische Std: ~58
 
+Das Ergebnis wird ueber den ResultCache in `<Output-Verzeichnis>/.cache` berechnet;
+bei unveraenderten Eingaben und unveraendertem Modul kommt es aus dem Cache
+(--force rechnet neu).
+
 Usage:
     python scripts/analyze_sum_windows.py --data data/raw/keno/KENO_ab_2018.csv
     python scripts/analyze_sum_windows.py --data data/raw/keno/KENO_ab_2018.csv --plot
@@ -20,7 +24,6 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import logging
 import sys
 from pathlib import Path
@@ -31,10 +34,12 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from kenobase.analysis.sum_distribution import (
     SumDistributionResult,
-    export_result_to_json,
     plot_sum_distribution,
+    result_from_dict,
+    result_to_dict,
     run_sum_window_analysis,
 )
+from kenobase.core.result_cache import ResultCache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -134,6 +139,18 @@ def format_result(result: SumDistributionResult) -> str:
     return "\n".join(lines)
 
 
+def compute_result(data_path: Path, bin_width: int) -> dict:
+    """Fuehrt die Analyse aus und liefert das JSON-Ergebnis.
+
+    Raises:
+        ValueError: Wenn keine Ziehungen geladen wurden
+    """
+    result = run_sum_window_analysis(data_path=data_path, bin_width=bin_width)
+    if result.total_draws == 0:
+        raise ValueError("No draws loaded - check data file")
+    return result_to_dict(result)
+
+
 def main() -> int:
     """Hauptfunktion des Scripts.
 
@@ -180,6 +197,11 @@ def main() -> int:
         action="store_true",
         help="Show plot interactively",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompute even if a cached result exists",
+    )
     parser.add_argument(
         "--quiet",
         "-q",
@@ -199,16 +221,21 @@ def main() -> int:
 
     logger.info(f"Starting sum window analysis on {data_path}")
 
-    # Analyse durchfuehren
-    result = run_sum_window_analysis(
-        data_path=data_path,
-        bin_width=args.bin_width,
-        output_path=output_path,
-    )
-
-    if result.total_draws == 0:
-        logger.error("No draws loaded - check data file")
+    # Analyse durchfuehren (oder aus dem Cache) und nach output_path veroeffentlichen
+    try:
+        output = ResultCache(output_path.parent / ".cache").get_or_compute(
+            "dist003",
+            lambda: compute_result(data_path, args.bin_width),
+            module="kenobase.analysis.sum_distribution",
+            inputs={"keno": data_path},
+            params={"bin_width": args.bin_width},
+            publish_to=output_path,
+            force=args.force,
+        )
+    except ValueError as e:
+        logger.error(str(e))
         return 1
+    result = result_from_dict(output)
 
     # Konsolen-Output
     if not args.quiet:
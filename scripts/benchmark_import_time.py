@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+"""benchmark_import_time.py - Startzeit von CLI, Bot und Paket-Imports messen.
+
+Jedes Ziel wird in einem frischen Python-Prozess gestartet (kalter
+Import-Cache des Interpreters, warmer Dateisystem-Cache). Gemessen wird
+die minimale Wall-Zeit ueber mehrere Wiederholungen und mit dem Budget
+in IMPORT_TIME_BUDGETS_S verglichen. Zusaetzlich wird geprueft, dass
+schwere ML-Abhaengigkeiten (LightGBM, SHAP, Optuna, statsmodels) nicht
+beim Start geladen werden.
+
+Usage:
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py --repeats 5 --json
+    python scripts/benchmark_import_time.py --importtime analysis_frequency
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Ziel -> Argumente fuer den Python-Interpreter
+IMPORT_TARGETS: dict[str, list[str]] = {
+    "analyze_info": [str(PROJECT_ROOT / "scripts" / "analyze.py"), "info"],
+    "run_bot_startup": [
+        "-c",
+        "import runpy, sys; sys.argv = ['run_bot.py', '--help']; "
+        f"runpy.run_path({str(PROJECT_ROOT / 'scripts' / 'run_bot.py')!r}, run_name='__main__')",
+    ],
+    "bot_core": ["-c", "import kenobase.bot.core"],
+    "analysis_frequency": ["-c", "from kenobase.analysis import calculate_frequency"],
+    "prediction_package": ["-c", "import kenobase.prediction"],
+}
+
+# Budget in Sekunden (Wall-Zeit inkl. Interpreter-Start, bewusst grosszuegig)
+IMPORT_TIME_BUDGETS_S: dict[str, float] = {
+    "analyze_info": 3.0,
+    "run_bot_startup": 1.5,
+    "bot_core": 1.5,
+    "analysis_frequency": 1.5,
+    "prediction_package": 1.0,
+}
+
+# Module, die erst bei tatsaechlicher Nutzung geladen werden duerfen
+HEAVY_MODULES: tuple[str, ...] = ("lightgbm", "shap", "optuna", "statsmodels")
+
+
+def measure_import_time(target: str, repeats: int = 3) -> float:
+    """Minimale Wall-Zeit (Sekunden) eines Ziels ueber mehrere Laeufe.
+
+    Args:
+        target: Schluessel aus IMPORT_TARGETS
+        repeats: Anzahl Wiederholungen
+
+    Returns:
+        Minimale Laufzeit in Sekunden.
+
+    Raises:
+        RuntimeError: Wenn der Prozess mit Fehler endet
+    """
+    timings = []
+    for _ in range(max(repeats, 1)):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, *IMPORT_TARGETS[target]],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        timings.append(time.perf_counter() - start)
+        if proc.returncode != 0:
+            raise RuntimeError(f"{target} failed: {proc.stderr.strip()[-500:]}")
+    return min(timings)
+
+
+def loaded_heavy_modules(statement: str) -> list[str]:
+    """Schwere Module, die nach `statement` in sys.modules stehen."""
+    code = (
+        f"{statement}\n"
+        "import sys\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    return [m for m in proc.stdout.strip().split(",") if m]
+
+
+def top_imports(target: str, limit: int = 15) -> list[tuple[int, str]]:
+    """Teuerste Imports (kumulativ, Mikrosekunden) via `python -X importtime`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *IMPORT_TARGETS[target]],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        rows.append((int(cumulative), name.rstrip()))
+    return sorted(rows, reverse=True)[:limit]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Import-/Startzeit-Benchmark")
+    parser.add_argument("targets", nargs="*", help="Ziele (default: alle)")
+    parser.add_argument("--repeats", type=int, default=3, help="Wiederholungen pro Ziel")
+    parser.add_argument("--json", action="store_true", help="Ausgabe als JSON")
+    parser.add_argument(
+        "--importtime", metavar="TARGET", help="Teuerste Imports eines Ziels anzeigen"
+    )
+    args = parser.parse_args()
+
+    if args.importtime:
+        for cumulative, name in top_imports(args.importtime):
+            print(f"{cumulative / 1e6:8.3f}s  {name}")
+        return 0
+
+    targets = args.targets or list(IMPORT_TARGETS)
+    unknown = set(targets) - IMPORT_TARGETS.keys()
+    if unknown:
+        parser.error(f"unknown targets: {sorted(unknown)}")
+
+    results = []
+    for target in targets:
+        seconds = measure_import_time(target, args.repeats)
+        budget = IMPORT_TIME_BUDGETS_S[target]
+        results.append(
+            {
+                "target": target,
+                "seconds": round(seconds, 3),
+                "budget": budget,
+                "ok": seconds <= budget,
+            }
+        )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'Ziel':<22} {'Zeit [s]':>9} {'Budget':>8}")
+        for r in results:
+            flag = "" if r["ok"] else "  UEBER BUDGET"
+            print(f"{r['target']:<22} {r['seconds']:>9.3f} {r['budget']:>8.1f}{flag}")
+    return 0 if all(r["ok"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,10 @@ Usage:
         --output data/processed/timeline.parquet \
         --fill-strategy nan \
         --mode matrix
+
+    # Partitioniertes Dataset (Verzeichnis, spaeter teilweise ladbar):
+    python scripts/build_timeline_grid.py --use-defaults \
+        --mode dataset --output data/processed/timeline
 """
 
 import argparse
@@ -85,9 +89,12 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--mode",
-        choices=["tuple", "matrix"],
+        choices=["tuple", "matrix", "dataset"],
         default="matrix",
-        help="Export mode: 'tuple' (numbers as tuples) or 'matrix' (expanded columns)",
+        help=(
+            "Export mode: 'tuple' (numbers as tuples), 'matrix' (expanded columns) or "
+            "'dataset' (directory partitioned by game/year; --output is the directory)"
+        ),
     )
 
     # Fill strategy
@@ -186,7 +193,6 @@ def main() -> int:
 
     # Export
     output_path = Path(args.output)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
         result_path = grid.to_parquet(output_path, mode=args.mode)
@@ -17,7 +17,8 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from kenobase.analysis.summen_signatur import (  # noqa: E402
     aggregate_bucket_counts,
-    compute_summen_signatur,
+    append_signatures_parquet,
+    compute_summen_signatur_table,
     export_signatures,
     split_signatures_by_date,
 )
@@ -116,6 +117,12 @@ def _resolve_paths(
     help="Basisverzeichnis fuer Artefakte (setzt train/test Pfade).",
     type=click.Path(),
 )
+@click.option(
+    "--parquet-output",
+    default=None,
+    help="Parquet-Verzeichnis; nur neue Ziehungen werden angehaengt (default aus config).",
+    type=click.Path(),
+)
 @click.option("-v", "--verbose", count=True, help="Verbosity (-v INFO, -vv DEBUG)")
 def main(
     config: str,
@@ -125,6 +132,7 @@ def main(
     train_output: Optional[str],
     test_output: Optional[str],
     output_dir: Optional[str],
+    parquet_output: Optional[str],
     verbose: int,
 ) -> None:
     """Berechnet Summen-Signaturen und exportiert Train/Test JSON."""
@@ -154,7 +162,7 @@ def main(
 
     logger.info("Loaded %s draws from %s", len(draws), data_path)
 
-    records = compute_summen_signatur(
+    records = compute_summen_signatur_table(
         draws=draws,
         keno_types=keno_types_list,
         bucket_std_low=cfg.analysis.summen_signatur.bucket_std_low,
@@ -177,6 +185,23 @@ def main(
     export_signatures(train_records, train_path, metadata | {"split": "train"})
     export_signatures(test_records, test_path, metadata | {"split": "test"})
 
+    parquet_dir = parquet_output or cfg.analysis.summen_signatur.parquet_output
+    if parquet_dir:
+        try:
+            appended = append_signatures_parquet(
+                draws,
+                parquet_dir,
+                keno_types=keno_types_list,
+                bucket_std_low=cfg.analysis.summen_signatur.bucket_std_low,
+                bucket_std_high=cfg.analysis.summen_signatur.bucket_std_high,
+                checksum_algorithm=cfg.analysis.summen_signatur.checksum_algorithm,
+                number_range=cfg.get_active_game().numbers_range,
+                source=str(data_path),
+            )
+        except ImportError as exc:
+            raise click.ClickException(str(exc)) from exc
+        click.echo(f"Parquet -> {parquet_dir} (+{len(appended)} records)")
+
     bucket_summary = {
         "train": aggregate_bucket_counts(train_records),
         "test": aggregate_bucket_counts(test_records),
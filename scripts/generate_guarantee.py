@@ -24,8 +24,7 @@ import numpy as np
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from kenobase.analysis.near_miss import KENO_PROBABILITIES
-from kenobase.core.keno_quotes import get_fixed_quote
+from kenobase.core.keno_ev import expected_return
 
 # Bestaetigte Kern-Zahlen aus Analyse
 CORE_NUMBERS = {
@@ -83,10 +82,7 @@ def calculate_uniqueness_score(numbers: List[int]) -> float:
 
 def _expected_return_per_draw(keno_type: int) -> float:
     """Theoretical EV (gross return) for 1 EUR Einsatz under fixed quotes."""
-    probs = KENO_PROBABILITIES.get(int(keno_type))
-    if not probs:
-        raise ValueError(f"Unsupported keno_type: {keno_type}")
-    return float(sum(float(p) * get_fixed_quote(keno_type, hits) for hits, p in probs.items()))
+    return expected_return(keno_type)
 
 
 def _load_pair_guarantee_backtest(path: Path) -> dict | None:
@@ -6,6 +6,7 @@ Usage:
     python scripts/predict.py --top 6 --output results/prediction.json
     python scripts/predict.py --format text
     python scripts/predict.py --ensemble --alpha 0.4  # Ensemble mode
+    python scripts/predict.py --ensemble --feature-store data/features  # Features cachen
 
 Dieses Script bietet zwei Modi:
 1. Rule-Based (default): HypothesisSynthesizer
@@ -14,6 +15,8 @@ Dieses Script bietet zwei Modi:
 Ensemble-Modus:
 - Laedt trainiertes ML-Modell oder trainiert on-the-fly
 - Kombiniert mit alpha * rules + (1-alpha) * ml
+- Optional (--feature-store): Walk-Forward-Features als Snapshots im
+  FeatureStore cachen; bei neuen Ziehungen werden nur neue Tage berechnet
 - Default: alpha=0.4 (40% rules, 60% ML)
 
 Rule-Based Modus:
@@ -41,6 +44,8 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from kenobase.core.config import load_config
 from kenobase.core.data_loader import DataLoader
+from kenobase.core.profiling import PROFILE_FORMATS, profiling
+from kenobase.features.store import FeatureStore
 from kenobase.prediction.synthesizer import HypothesisSynthesizer
 from kenobase.prediction.recommendation import (
     generate_recommendations,
@@ -165,6 +170,32 @@ Beispiele:
         help="Hyperparameter-Tuning fuer ML-Modell aktivieren",
     )
 
+    parser.add_argument(
+        "--feature-store",
+        type=str,
+        help="Verzeichnis fuer Walk-Forward-Feature-Snapshots (Ensemble, optional)",
+    )
+
+    parser.add_argument(
+        "--feature-snapshots",
+        type=str,
+        default="keno_walk_forward",
+        help="Name der Snapshot-Reihe im Feature-Store (default: keno_walk_forward)",
+    )
+
+    parser.add_argument(
+        "--profile",
+        type=str,
+        help="Laufzeit-Profil (Training, Walk-Forward, Vorhersage) in diese Datei schreiben",
+    )
+
+    parser.add_argument(
+        "--profile-format",
+        choices=PROFILE_FORMATS,
+        default="chrome",
+        help="Profil-Format: chrome (chrome://tracing/Perfetto) oder json",
+    )
+
     return parser.parse_args()
 
 
@@ -205,11 +236,24 @@ def run_ensemble_mode(args: argparse.Namespace) -> int:
 
     logger.info(f"Loaded {len(draws)} draws")
 
+    # Optional: vorberechnete Walk-Forward-Features (inkrementell aktualisiert)
+    feature_snapshots = None
+    if args.feature_store:
+        store = FeatureStore(base_dir=args.feature_store)
+        try:
+            feature_snapshots = store.sync_snapshots(args.feature_snapshots, draws)
+            logger.info(
+                f"Feature snapshots '{args.feature_snapshots}': {len(feature_snapshots)} days"
+            )
+        except ValueError as e:
+            logger.warning(f"Feature snapshots not used: {e}")
+
     # Initialize ensemble
     ensemble = EnsemblePredictor(
         alpha=args.alpha,
         numbers_range=(1, 70),
         results_dir=args.results_dir,
+        feature_snapshots=feature_snapshots,
     )
 
     # Check for saved model or train
@@ -409,11 +453,15 @@ def main() -> int:
     config = load_config(args.config)
     logger.info(f"Config loaded: {args.config}")
 
-    # Dispatch based on mode
-    if args.ensemble:
-        return run_ensemble_mode(args)
-    else:
-        return run_rule_based_mode(args)
+    run_mode = run_ensemble_mode if args.ensemble else run_rule_based_mode
+    if not args.profile:
+        return run_mode(args)
+
+    with profiling() as profiler:
+        exit_code = run_mode(args)
+    profiler.save(args.profile, fmt=args.profile_format)
+    print(profiler.summary(), file=sys.stderr)
+    return exit_code
 
 
 if __name__ == "__main__":
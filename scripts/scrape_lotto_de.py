@@ -56,6 +56,9 @@ Beispiele:
 
   # Mit Birthday-Korrelationsanalyse
   python scripts/scrape_lotto_de.py --recent 365 --analyze
+
+  # Inkrementell: nur fehlende Tage an bestehende KENO-CSV anhaengen
+  python scripts/scrape_lotto_de.py --sync data/raw/keno/KENO_ab_2018.csv
         """,
     )
 
@@ -73,6 +76,12 @@ Beispiele:
         metavar="YYYY-MM-DD",
         help="Scrape einzelnes Datum",
     )
+    date_group.add_argument(
+        "--sync",
+        type=Path,
+        metavar="DATASET",
+        help="Nur fehlende Tage laden und an KENO-CSV/JSON-Cache anhaengen",
+    )
     date_group.add_argument(
         "--start",
         type=str,
@@ -100,6 +109,12 @@ Beispiele:
         default=1.0,
         help="Verzoegerung zwischen Requests in Sekunden (default: 1.0)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Parallele Abrufe (globales Rate Limit bleibt --delay, default: 4)",
+    )
     parser.add_argument(
         "--analyze",
         action="store_true",
@@ -124,6 +139,17 @@ Beispiele:
     # Setup logging
     setup_logging(args.verbose)
 
+    # Create scraper
+    scraper = LottoDeScraper(delay_between_requests=args.delay, max_workers=args.workers)
+
+    # Incremental sync
+    if args.sync:
+        print(f"\nSync: {args.sync}\n")
+        results = scraper.sync(args.sync, progress_callback=print_progress)
+        print()
+        print(f"Neue Ziehungen angehaengt: {len(results)}")
+        return 0
+
     # Parse dates
     if args.date:
         start_date = datetime.strptime(args.date, "%Y-%m-%d")
@@ -135,9 +161,6 @@ Beispiele:
         start_date = datetime.strptime(args.start, "%Y-%m-%d")
         end_date = datetime.strptime(args.end, "%Y-%m-%d")
 
-    # Create scraper
-    scraper = LottoDeScraper(delay_between_requests=args.delay)
-
     # Print header
     print("\n" + "=" * 60)
     print("LOTTO.de KENO Archive Scraper")
@@ -67,6 +67,9 @@ Beispiele:
 
   # Output in bestimmtes Verzeichnis
   python scripts/scrape_press.py --all --output results/scraped
+
+  # Parallel (Rate Limit pro Host) mit HTTP-Cache fuer Re-Runs
+  python scripts/scrape_press.py --all --concurrent --cache-dir data/cache/http
         """,
     )
 
@@ -114,6 +117,17 @@ Beispiele:
         default=0.3,
         help="Minimale Extraktions-Konfidenz 0.0-1.0 (default: 0.3)",
     )
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="Sites parallel scrapen (Verzoegerung gilt dann pro Host)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="HTTP-Cache Verzeichnis (ETag/Last-Modified) fuer inkrementelle Re-Runs",
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -145,6 +159,8 @@ Beispiele:
         max_articles_per_site=args.max_articles,
         min_confidence=args.min_confidence,
         output_dir=args.output,
+        concurrent=args.concurrent,
+        cache_dir=args.cache_dir,
     )
 
     # Create scraper
@@ -21,6 +21,10 @@ Usage:
 
     # Einzelne Vorhersage anzeigen
     python scripts/track_predictions.py show --draw-id KENO-2025-12-28
+
+    # SQLite-Backend verwenden / JSON-Verzeichnis einmalig migrieren
+    python scripts/track_predictions.py --db results/predictions.db stats
+    python scripts/track_predictions.py --db results/predictions.db migrate
 """
 
 from __future__ import annotations
@@ -39,6 +43,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from kenobase.prediction.storage import (
     Prediction,
     PredictionStorage,
+    SQLitePredictionStorage,
     generate_draw_id,
 )
 
@@ -274,6 +279,17 @@ def cmd_stats(args: argparse.Namespace, storage: PredictionStorage) -> int:
     return 0
 
 
+def cmd_migrate(args: argparse.Namespace, storage: PredictionStorage) -> int:
+    """Migriert das JSON-Verzeichnis in die SQLite-Datenbank."""
+    if not isinstance(storage, SQLitePredictionStorage):
+        print("Fehler: migrate erfordert --db")
+        return 1
+
+    count = storage.migrate_from_json(args.storage_dir)
+    print(f"{count} Vorhersagen nach {storage.db_path} migriert.")
+    return 0
+
+
 def main() -> int:
     """Hauptfunktion."""
     parser = argparse.ArgumentParser(
@@ -287,6 +303,11 @@ def main() -> int:
         default="results/predictions",
         help="Pfad zum Speicherverzeichnis (default: results/predictions)",
     )
+    parser.add_argument(
+        "--db",
+        type=str,
+        help="SQLite-Datenbank statt JSON-Verzeichnis verwenden",
+    )
 
     subparsers = parser.add_subparsers(dest="command", help="Verfuegbare Befehle")
 
@@ -367,13 +388,21 @@ def main() -> int:
         help="Zeigt auch JSON-Ausgabe",
     )
 
+    # migrate command
+    subparsers.add_parser(
+        "migrate", help="Importiert --storage-dir in die SQLite-Datenbank (--db)"
+    )
+
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         return 1
 
-    storage = PredictionStorage(storage_dir=args.storage_dir)
+    if args.db:
+        storage = SQLitePredictionStorage(db_path=args.db)
+    else:
+        storage = PredictionStorage(storage_dir=args.storage_dir)
 
     commands = {
         "save": cmd_save,
@@ -381,6 +410,7 @@ def main() -> int:
         "list": cmd_list,
         "show": cmd_show,
         "stats": cmd_stats,
+        "migrate": cmd_migrate,
     }
 
     return commands[args.command](args, storage)
@@ -34,6 +34,37 @@ def project_root() -> Path:
     return Path(__file__).parent.parent
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _session_exact_cache(tmp_path_factory) -> Generator[Path, None, None]:
+    """Disk-Cache der exakten Verteilungen ausserhalb von results/ halten.
+
+    Yields:
+        Temporaeres Cache-Verzeichnis (via KENOBASE_EXACT_CACHE)
+    """
+    cache_dir = tmp_path_factory.mktemp("exact_cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("KENOBASE_EXACT_CACHE", str(cache_dir))
+        yield cache_dir
+
+
+@pytest.fixture
+def exact_cache_dir(tmp_path, monkeypatch) -> Generator[Path, None, None]:
+    """Eigener Disk-Cache und leerer Memo-Cache der exakten Verteilungen.
+
+    Fuer Tests, die die geschriebenen Cache-Dateien pruefen.
+
+    Yields:
+        Leeres Cache-Verzeichnis (via KENOBASE_EXACT_CACHE)
+    """
+    from kenobase.core.exact_distribution import clear_exact_cache
+
+    cache_dir = tmp_path / "exact"
+    monkeypatch.setenv("KENOBASE_EXACT_CACHE", str(cache_dir))
+    clear_exact_cache()
+    yield cache_dir
+    clear_exact_cache()
+
+
 # ============================================================================
 # Sample Data Fixtures
 # ============================================================================
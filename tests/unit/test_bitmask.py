@@ -0,0 +1,110 @@
+"""Unit tests for kenobase.core.bitmask."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from kenobase.core import bitmask
+from kenobase.core.bitmask import (
+    decode,
+    encode,
+    encode_draws,
+    encode_many,
+    hit_matrix,
+    intersection_count,
+    mask_numbers,
+    masks_to_array,
+    number_mask,
+    popcount,
+    union_count,
+)
+from kenobase.core.data_loader import DrawResult, GameType
+from kenobase.core.draw_collection import DrawCollection
+
+
+def random_rows(n: int, k: int, seed: int = 0) -> list[list[int]]:
+    rng = random.Random(seed)
+    return [rng.sample(range(1, 71), k) for _ in range(n)]
+
+
+class TestCodec:
+    """Encoding and decoding."""
+
+    def test_roundtrip(self):
+        numbers = [1, 2, 63, 64, 65, 70, 128]
+        assert decode(encode(numbers)) == numbers
+        assert mask_numbers(number_mask(numbers)) == numbers
+
+    def test_word_layout(self):
+        words = encode([1, 65])
+        assert words.dtype == np.uint64
+        assert words.tolist() == [1, 1]
+
+    def test_encode_many_matches_scalar(self):
+        rows = random_rows(50, 20) + [[], [70], [64, 65]]
+        expected = masks_to_array([number_mask(r) for r in rows])
+        np.testing.assert_array_equal(encode_many(rows), expected)
+        assert encode_many([]).shape == (0, 2)
+
+    @pytest.mark.parametrize("bad", [0, 129, -3])
+    def test_out_of_range(self, bad):
+        with pytest.raises(ValueError, match="outside bitmask range"):
+            encode_many([[1, bad]])
+        with pytest.raises(ValueError):
+            number_mask([bad])
+
+
+class TestSetOperations:
+    """Popcount-based set operations agree with Python sets."""
+
+    def test_counts_match_sets(self):
+        draws = random_rows(200, 20, seed=1)
+        tickets = random_rows(200, 10, seed=2)
+        a, b = encode_many(draws), encode_many(tickets)
+
+        expected_inter = [len(set(d) & set(t)) for d, t in zip(draws, tickets)]
+        expected_union = [len(set(d) | set(t)) for d, t in zip(draws, tickets)]
+        assert intersection_count(a, b).tolist() == expected_inter
+        assert union_count(a, b).tolist() == expected_union
+        assert popcount(a).tolist() == [20] * 200
+
+    def test_hit_matrix(self):
+        draws = random_rows(30, 20, seed=3)
+        tickets = random_rows(7, 6, seed=4)
+        hits = hit_matrix(encode_many(draws), encode_many(tickets), chunk_size=8)
+
+        assert hits.shape == (30, 7)
+        for i, d in enumerate(draws):
+            for j, t in enumerate(tickets):
+                assert hits[i, j] == len(set(d) & set(t))
+
+    def test_byte_table_fallback(self, monkeypatch):
+        table = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+        def fallback(words):
+            words = np.ascontiguousarray(words, dtype=np.uint64)
+            return table[words.view(np.uint8)].reshape(*words.shape, 8).sum(-1)
+
+        masks = encode_many(random_rows(20, 20, seed=5))
+        expected = popcount(masks)
+        monkeypatch.setattr(bitmask, "_popcount_words", fallback)
+        np.testing.assert_array_equal(popcount(masks), expected)
+
+
+def test_draw_collection_masks_are_cached_and_shared():
+    base = datetime(2024, 1, 1)
+    draws = [
+        DrawResult(date=base + timedelta(days=i), numbers=nums, game_type=GameType.KENO)
+        for i, nums in enumerate(random_rows(10, 20, seed=6))
+    ]
+    collection = DrawCollection(draws)
+
+    window = collection[2:5]
+    np.testing.assert_array_equal(window.masks, encode_draws(draws[2:5]))
+    assert np.shares_memory(window.masks, collection.masks)
+    assert np.shares_memory(encode_draws(collection), collection.masks)
+    assert not collection.masks.flags.writeable
@@ -9,13 +9,16 @@ Tests:
 
 from __future__ import annotations
 
+import asyncio
+import multiprocessing
+import threading
 import time
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from kenobase.bot.core import BotCore, PredictionResult
+from kenobase.bot.core import HAS_FCNTL, BotCore, PredictionResult, SharedPredictionStore
 from kenobase.bot.formatters import (
     format_short,
     format_detailed,
@@ -409,3 +412,210 @@ class TestBotCoreIntegration:
 
         # Synthesizer sollte zweimal aufgerufen worden sein
         assert mock_synthesizer.call_count == 2
+
+
+class TestBotCoreAsync:
+    """Tests fuer get_prediction_async, Hintergrund-Refresh und Shared-Cache."""
+
+    @pytest.fixture
+    def synth_patches(self):
+        """Patcht Synthese-Kette; jede Berechnung liefert eine laufende Nummer."""
+        calls = []
+
+        def fake_to_dict(recommendations):
+            calls.append(time.time())
+            return {
+                "numbers": [len(calls)],
+                "tier_summary": {"A": 1, "B": 0, "C": 0},
+                "count": 1,
+                "recommendations": [],
+            }
+
+        with patch("kenobase.bot.core.HypothesisSynthesizer"), patch(
+            "kenobase.bot.core.generate_recommendations", return_value=[]
+        ), patch("kenobase.bot.core.recommendations_to_dict", side_effect=fake_to_dict):
+            yield calls
+
+    def test_async_miss_then_hit(self, synth_patches, tmp_path):
+        """Erster Abruf berechnet im Executor, zweiter kommt aus dem Cache."""
+        bot = BotCore(config={}, results_dir=str(tmp_path))
+
+        async def run():
+            first = await bot.get_prediction_async()
+            second = await bot.get_prediction_async()
+            return first, second
+
+        first, second = asyncio.run(run())
+        bot.stop_background_refresh()
+
+        assert first.cached is False
+        assert second.cached is True
+        assert second.numbers == first.numbers
+        assert len(synth_patches) == 1
+
+    def test_stale_entry_served_while_revalidating(self, synth_patches, tmp_path):
+        """Abgelaufener Eintrag wird sofort geliefert und im Hintergrund erneuert."""
+        bot = BotCore(config={"cache": {"ttl_seconds": 0}}, results_dir=str(tmp_path))
+
+        async def run():
+            await bot.get_prediction_async()
+            stale = await bot.get_prediction_async()
+            await asyncio.wrap_future(bot._schedule_refresh("keno", 6))
+            return stale
+
+        stale = asyncio.run(run())
+        bot.stop_background_refresh()
+
+        assert stale.cached is True
+        assert stale.numbers == [1]
+        assert bot._cache["keno_6"][0].numbers[0] >= 2
+
+    def test_source_change_triggers_precompute(self, synth_patches, tmp_path):
+        """Aenderung an hyp*.json oder Ziehungsdaten loest Neuberechnung aus."""
+        draws = tmp_path / "draws.csv"
+        draws.write_text("a\n")
+        bot = BotCore(
+            config={"cache": {"watch_paths": [str(draws)], "precompute": [["keno", 6]]}},
+            results_dir=str(tmp_path),
+        )
+
+        assert bot.refresh_if_changed() == ["keno_6"]
+        assert bot.refresh_if_changed() == []
+
+        (tmp_path / "hyp099_test.json").write_text("{}")
+        assert bot.refresh_if_changed() == ["keno_6"]
+
+        draws.write_text("a\nb\n")
+        assert bot.refresh_if_changed() == ["keno_6"]
+        assert len(synth_patches) == 3
+        bot.stop_background_refresh()
+
+    def test_background_thread_precomputes(self, synth_patches, tmp_path):
+        """Hintergrund-Thread fuellt den Cache ohne Benutzeranfrage."""
+        bot = BotCore(config={"cache": {"poll_seconds": 0.05}}, results_dir=str(tmp_path))
+        bot.start_background_refresh()
+        try:
+            deadline = time.time() + 5
+            while "keno_6" not in bot._cache and time.time() < deadline:
+                time.sleep(0.01)
+            assert bot.get_status()["background_refresh"] is True
+        finally:
+            bot.stop_background_refresh(timeout=5)
+
+        assert "keno_6" in bot._cache
+        assert bot._request_times == []  # Vorberechnung zaehlt nicht zum Rate-Limit
+
+    def test_shared_store_between_instances(self, synth_patches, tmp_path):
+        """Zwei BotCore-Instanzen (z.B. Telegram + Discord) teilen den Datei-Cache."""
+        config = {"cache": {"shared_path": str(tmp_path / "shared" / "cache.json")}}
+        producer = BotCore(config=config, results_dir=str(tmp_path))
+        consumer = BotCore(config=config, results_dir=str(tmp_path))
+
+        produced = producer.get_prediction()
+        consumed = asyncio.run(consumer.get_prediction_async())
+        producer.stop_background_refresh()
+        consumer.stop_background_refresh()
+
+        assert consumed.cached is True
+        assert consumed.numbers == produced.numbers
+        assert consumed.timestamp == produced.timestamp
+        assert len(synth_patches) == 1
+
+    def test_cache_hit_not_queued_behind_running_refresh(self, synth_patches, tmp_path):
+        """Treffer kommen sofort, auch wenn alle Pool-Worker in Synthesen stecken."""
+        bot = BotCore(config={}, results_dir=str(tmp_path))
+        bot.get_prediction()
+        release = threading.Event()
+
+        def slow_recommendations(*args, **kwargs):
+            release.wait(10)
+            return []
+
+        async def hit():
+            return await asyncio.wait_for(bot.get_prediction_async(), timeout=2)
+
+        with patch(
+            "kenobase.bot.core.generate_recommendations", side_effect=slow_recommendations
+        ):
+            pending = [bot._schedule_refresh("keno", n) for n in (7, 8)]
+            try:
+                result = asyncio.run(hit())
+            finally:
+                release.set()
+                for future in pending:
+                    future.result(timeout=10)
+        bot.stop_background_refresh()
+
+        assert result.cached is True
+        assert result.numbers == [1]
+
+    def test_cache_hit_fingerprint_throttled_and_off_loop(self, synth_patches, tmp_path):
+        """Treffer durchlaufen die Quellen nicht bei jeder Anfrage und nie im Event-Loop."""
+        bot = BotCore(config={"cache": {"fingerprint_seconds": 60}}, results_dir=str(tmp_path))
+        bot.get_prediction()
+        scans = []
+        scan = bot._source_fingerprint
+
+        def record_scan():
+            scans.append(threading.get_ident())
+            return scan()
+
+        async def hits():
+            for _ in range(3):
+                await bot.get_prediction_async()
+            bot.fingerprint_seconds = 0
+            await bot.get_prediction_async()
+            return threading.get_ident()
+
+        with patch.object(bot, "_source_fingerprint", side_effect=record_scan):
+            loop_thread = asyncio.run(hits())
+        bot.stop_background_refresh()
+
+        assert len(scans) == 1
+        assert scans[0] != loop_thread
+
+    def test_refresh_if_changed_does_not_use_pool(self, synth_patches, tmp_path):
+        """Vorberechnung laeuft im aufrufenden Thread, nicht im Synthese-Pool."""
+        bot = BotCore(config={"cache": {"precompute": [["keno", 6]]}}, results_dir=str(tmp_path))
+
+        assert bot.refresh_if_changed() == ["keno_6"]
+        assert bot._executor is None
+        assert bot._inflight == {}
+
+    @pytest.mark.skipif(not HAS_FCNTL, reason="fcntl not available")
+    def test_shared_store_concurrent_processes_keep_all_keys(self, tmp_path):
+        """Parallele Prozesse (Telegram + Discord) ueberschreiben keine fremden Keys."""
+        path = tmp_path / "shared.json"
+        result = PredictionResult(
+            numbers=[1], tier_summary={}, timestamp=datetime(2024, 1, 1), game_type="keno"
+        )
+
+        def writer(prefix: str) -> None:
+            store = SharedPredictionStore(path)
+            for i in range(25):
+                store.put(f"{prefix}_{i}", result, float(i), "fp")
+
+        ctx = multiprocessing.get_context("fork")
+        procs = [ctx.Process(target=writer, args=(p,)) for p in ("telegram", "discord")]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join(30)
+
+        assert all(proc.exitcode == 0 for proc in procs)
+        store = SharedPredictionStore(path)
+        for prefix in ("telegram", "discord"):
+            for i in range(25):
+                assert store.get(f"{prefix}_{i}") is not None
+
+    def test_prediction_result_roundtrip(self):
+        """to_dict/from_dict erhalten alle Felder."""
+        result = PredictionResult(
+            numbers=[3, 9],
+            tier_summary={"A": 2},
+            timestamp=datetime(2024, 3, 1, 12, 0),
+            game_type="keno",
+            confidence=0.5,
+            details={"count": 2},
+        )
+        assert PredictionResult.from_dict(result.to_dict()) == result
@@ -404,6 +404,42 @@ class TestMemoryEfficiency:
         # Test bestanden wenn kein MemoryError
 
 
+class TestIsValidAndSample:
+    """Tests fuer is_valid() und sample()."""
+
+    def test_is_valid_matches_generate(self):
+        """is_valid akzeptiert genau die von generate() gelieferten Kombinationen."""
+        from itertools import combinations
+
+        pool = {1, 2, 3, 11, 12, 13, 21}
+        engine = CombinationEngine(pool=pool, combination_size=3, max_per_decade=2, max_sum=40)
+
+        generated = {c.numbers for c in engine.generate()}
+        valid = {c for c in combinations(sorted(pool), 3) if engine.is_valid(c)}
+
+        assert valid == generated
+        assert not engine.is_valid((1, 2, 99))
+        assert not engine.is_valid((1, 2))
+
+    def test_sample_is_reproducible_and_filtered(self):
+        """sample() liefert verschiedene gueltige Kombinationen, reproduzierbar per Seed."""
+        engine = CombinationEngine(pool=set(range(1, 41)), combination_size=8, max_per_decade=3)
+
+        first = engine.sample(200, seed=7)
+        second = engine.sample(200, seed=7)
+
+        assert first == second
+        assert len(first) == 200
+        assert len({c.numbers for c in first}) == 200
+        assert all(engine.is_valid(c.numbers) for c in first)
+
+    def test_sample_stops_when_space_is_exhausted(self):
+        """Bei wenigen gueltigen Kombinationen wird nicht endlos gesampelt."""
+        engine = CombinationEngine(pool={1, 2, 3, 4}, combination_size=3, max_per_decade=3)
+
+        assert len(engine.sample(10, seed=1)) == 4
+
+
 class TestEdgeCases:
     """Tests fuer Randfaelle."""
 
@@ -62,3 +62,17 @@ def test_guardrail_flag_triggers_on_large_deviation() -> None:
     assert result.max_deviation_ratio > 0.20
     assert result.bins[0].count == 14
     assert result.bins[0].within_guardrail is False
+
+
+def test_max_occupancy_exact_test() -> None:
+    # 50 Ziehungen, jede mit allen 7 Zahlen in einer Dekade: extrem geklumpt
+    draws = [_draw([1, 2, 3, 4, 5, 6, 7]) for _ in range(50)]
+
+    result = analyze_decade_distribution(draws, max_number=70, numbers_per_draw=7)
+
+    assert result.occupancy_p_value < 0.05
+    assert result.occupancy_chi_square > 0
+
+    # Weniger als zwei Klassen mit ausreichender Erwartung: kein Test
+    single = analyze_decade_distribution(draws[:1], max_number=70)
+    assert single.occupancy_p_value == pytest.approx(1.0)
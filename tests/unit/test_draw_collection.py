@@ -0,0 +1,129 @@
+"""Unit tests for kenobase.core.draw_collection."""
+
+from __future__ import annotations
+
+import pickle
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from kenobase.analysis.longterm_balance import detect_balance_triggers
+from kenobase.analysis.recurrence import analyze_recurrence
+from kenobase.core.data_loader import DrawResult, GameType
+from kenobase.core.draw_collection import DrawCollection, filter_draws_by_date, sort_draws
+
+BASE = datetime(2024, 1, 1)  # Montag
+
+
+def make_draws(n: int, shuffle: bool = False) -> list[DrawResult]:
+    rng = random.Random(5)
+    draws = [
+        DrawResult(
+            date=BASE + timedelta(days=i),
+            numbers=rng.sample(range(1, 71), 20),
+            game_type=GameType.KENO,
+        )
+        for i in range(n)
+    ]
+    if shuffle:
+        rng.shuffle(draws)
+    return draws
+
+
+class TestDrawCollection:
+    """Tests for the sorted draw collection."""
+
+    def test_sorts_once_and_behaves_like_sequence(self):
+        draws = make_draws(20, shuffle=True)
+        collection = DrawCollection(draws)
+
+        assert len(collection) == 20
+        assert [d.date for d in collection] == sorted(d.date for d in draws)
+        assert collection[0].date == BASE
+        assert collection[-1].date == BASE + timedelta(days=19)
+        assert collection == sorted(draws, key=lambda d: d.date)
+
+    def test_slicing_is_zero_copy(self):
+        collection = DrawCollection(make_draws(30))
+        window = collection[5:15]
+
+        assert isinstance(window, DrawCollection)
+        assert len(window) == 10
+        assert window[0] is collection[5]
+        assert np.shares_memory(window.dates, collection.dates)
+        assert window[2:4][0] is collection[7]
+
+    def test_between_inclusive_modes(self):
+        collection = DrawCollection(make_draws(10))
+        start, end = BASE + timedelta(days=2), BASE + timedelta(days=5)
+
+        assert len(collection.between(start, end)) == 4
+        assert len(collection.between(start, end, inclusive="left")) == 3
+        assert len(collection.between(start, end, inclusive="neither")) == 2
+        assert len(collection.between(end=end)) == 6
+        assert len(collection.between(start)) == 8
+
+    def test_before_last_n(self):
+        collection = DrawCollection(make_draws(10))
+        last3 = collection.before(BASE + timedelta(days=5), n=3)
+
+        assert [d.date.day for d in last3] == [3, 4, 5]
+        assert len(collection.before(BASE)) == 0
+
+    def test_calendar_masks(self):
+        collection = DrawCollection(make_draws(62))
+
+        weekends = collection.select(collection.weekday_mask({5, 6}))
+        assert all(d.date.weekday() in (5, 6) for d in weekends)
+        assert len(weekends) == sum(1 for d in collection if d.date.weekday() >= 5)
+
+        february = collection.select(collection.month_mask({2}))
+        assert len(february) == 29  # 2024 is a leap year
+        assert collection.year_mask({2024}).all()
+
+    def test_dates_are_read_only(self):
+        collection = DrawCollection(make_draws(3))
+        with pytest.raises(ValueError):
+            collection.dates[0] = np.datetime64("2000-01-01")
+
+    def test_pickle_roundtrip(self):
+        collection = DrawCollection(make_draws(5))[1:4]
+        restored = pickle.loads(pickle.dumps(collection))
+        assert restored == collection
+
+
+class TestHelpers:
+    """Tests for sort_draws / filter_draws_by_date."""
+
+    def test_sort_draws_passthrough(self):
+        collection = DrawCollection(make_draws(5))
+        assert sort_draws(collection) is collection
+
+        shuffled = make_draws(5, shuffle=True)
+        assert sort_draws(shuffled) == list(collection)
+
+    def test_filter_matches_list_scan(self):
+        draws = make_draws(40)
+        start, end = BASE + timedelta(days=10), BASE + timedelta(days=20)
+
+        from_list = filter_draws_by_date(draws, start, end)
+        from_collection = filter_draws_by_date(DrawCollection(draws), start, end)
+
+        assert isinstance(from_collection, DrawCollection)
+        assert from_collection == from_list
+
+
+class TestAnalysisAcceptsCollection:
+    """Analysis entry points give identical results for list and collection."""
+
+    def test_recurrence(self):
+        draws = make_draws(60, shuffle=True)
+        assert analyze_recurrence(DrawCollection(draws)) == analyze_recurrence(draws)
+
+    def test_balance_triggers(self):
+        draws = make_draws(120)
+        assert detect_balance_triggers(
+            DrawCollection(draws), window=100, trigger_threshold_std=1.0
+        ) == detect_balance_triggers(draws, window=100, trigger_threshold_std=1.0)
@@ -0,0 +1,113 @@
+"""Unit tests for kenobase.core.exact_distribution."""
+
+from __future__ import annotations
+
+import itertools
+import math
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from kenobase.core.exact_distribution import (
+    clear_exact_cache,
+    exact_distribution,
+    set_exact_cache_dir,
+)
+
+pytestmark = pytest.mark.usefixtures("exact_cache_dir")
+
+
+def _brute_force(lo: int, hi: int, k: int, decade_size: int) -> dict[str, Counter]:
+    combos = list(itertools.combinations(range(lo, hi + 1), k))
+    n_decades = (hi - lo) // decade_size + 1
+    occupancy = [
+        tuple(sum((x - lo) // decade_size == d for x in c) for d in range(n_decades))
+        for c in combos
+    ]
+    evens = [sum(x % 2 == 0 for x in c) for c in combos]
+    return {
+        "sum": Counter(sum(c) for c in combos),
+        "even": Counter(evens),
+        "sum_even": Counter((sum(c), e) for c, e in zip(combos, evens)),
+        "decades": Counter(occupancy),
+        "decade_max": Counter(max(o) for o in occupancy),
+        "decade_empty": Counter(sum(v == 0 for v in o) for o in occupancy),
+    }
+
+
+@pytest.mark.parametrize("lo,hi,k,decade_size", [(1, 12, 4, 5), (3, 14, 5, 4), (1, 9, 9, 3)])
+def test_matches_brute_force_enumeration(lo, hi, k, decade_size) -> None:
+    for statistic, expected in _brute_force(lo, hi, k, decade_size).items():
+        dist = exact_distribution(
+            statistic, numbers_min=lo, numbers_max=hi, numbers_drawn=k, decade_size=decade_size
+        )
+        assert dist.count_map() == dict(expected), statistic
+        assert sum(int(c) for c in dist.counts) == dist.total
+
+
+def test_keno_moments_and_marginals() -> None:
+    dist = exact_distribution("sum")
+    # Summe ohne Zuruecklegen: Var = k * (N^2 - 1) / 12 * (N - k) / (N - 1)
+    assert dist.mean == pytest.approx(710.0)
+    assert dist.var == pytest.approx(20 * (70**2 - 1) / 12 * 50 / 69)
+
+    joint = exact_distribution("sum_even")
+    assert joint.marginal("sum").count_map() == dist.count_map()
+    assert joint.marginal("even").count_map() == exact_distribution("even").count_map()
+    assert joint.prob((710, 10)) > 0.0
+    assert joint.prob((0, 0)) == 0.0
+
+    decades = exact_distribution("decades")
+    assert decades.columns == tuple(f"decade_{d}" for d in range(7))
+    assert np.allclose(decades.mean, 20 / 7)
+
+
+def test_large_totals_use_exact_python_ints() -> None:
+    dist = exact_distribution("sum", numbers_max=100, numbers_drawn=50)
+    assert dist.counts.dtype == object
+    assert sum(dist.counts) == math.comb(100, 50)
+
+
+def test_results_are_memoized_and_persisted(exact_cache_dir) -> None:
+    first = exact_distribution("decade_max")
+    assert exact_distribution("decade_max") is first
+    assert len(list(exact_cache_dir.glob("decade_max_*.npz"))) == 1
+
+    clear_exact_cache()
+    reloaded = exact_distribution("decade_max")
+    assert reloaded is not first
+    assert reloaded.count_map() == first.count_map()
+
+    clear_exact_cache(disk=True)
+    assert not list(exact_cache_dir.glob("*.npz"))
+
+
+def test_bin_probabilities_and_chi_square() -> None:
+    dist = exact_distribution("sum", numbers_max=10, numbers_drawn=3)
+    edges = np.arange(6, 31, 4)
+    assert dist.bin_probabilities(edges).sum() == pytest.approx(1.0)
+
+    # Vollstaendige Enumeration passt perfekt zum Nullmodell
+    sums = [sum(c) for c in itertools.combinations(range(1, 11), 3)]
+    statistic, p_value, dof = dist.chi_square(sums)
+    assert statistic == pytest.approx(0.0, abs=1e-12)
+    assert p_value == pytest.approx(1.0)
+    assert dof > 1
+
+    assert dist.chi_square([]) == (0.0, 1.0, 0)
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        exact_distribution("median")
+    with pytest.raises(ValueError):
+        exact_distribution("sum", numbers_max=10, numbers_drawn=11)
+    with pytest.raises(ValueError):
+        exact_distribution("decades", decade_size=0)
+
+
+def test_core_package_does_not_shadow_module():
+    import kenobase.core.exact_distribution as module
+
+    assert module.set_exact_cache_dir is set_exact_cache_dir
@@ -242,15 +242,18 @@ class TestNativeCorrelation:
 class TestEdgeCases:
     """Edge Cases und Fehlerbehandlung."""
 
-    def test_shap_not_installed_error(self, trained_predictor, monkeypatch):
-        """SHAPExplainer gibt Fehler wenn SHAP nicht installiert."""
+    def test_shap_not_installed_falls_back_to_native(self, trained_predictor, monkeypatch):
+        """Ohne SHAP-Paket wird LightGBM pred_contrib verwendet."""
         import kenobase.prediction.explainability as exp_module
 
         # Simuliere dass SHAP nicht installiert ist
         monkeypatch.setattr(exp_module, "HAS_SHAP", False)
 
+        explainer = exp_module.SHAPExplainer(trained_predictor)
+        assert explainer.backend == "native"
+
         with pytest.raises(ImportError, match="SHAP"):
-            exp_module.SHAPExplainer(trained_predictor)
+            exp_module.SHAPExplainer(trained_predictor, backend="shap")
 
     def test_custom_feature_names(self, trained_predictor, synthetic_data):
         """Custom Feature-Namen werden verwendet."""
@@ -267,6 +270,49 @@ class TestEdgeCases:
         assert explanation.feature_names == custom_names
 
 
+class TestBatchAndCache:
+    """SHAP-Matrix, Backends und Cache."""
+
+    def test_native_matches_shap_backend(self, trained_predictor, synthetic_data):
+        """pred_contrib liefert dieselben Werte wie shap.TreeExplainer."""
+        from kenobase.prediction.explainability import SHAPExplainer
+
+        X, _ = synthetic_data
+        native = SHAPExplainer(trained_predictor, backend="native")
+        tree = SHAPExplainer(trained_predictor, backend="shap")
+
+        np.testing.assert_allclose(native.shap_values(X[:20]), tree.shap_values(X[:20]), atol=1e-6)
+        assert np.isclose(native.base_value, tree.base_value, atol=1e-6)
+
+    def test_batch_is_single_matrix(self, trained_predictor, synthetic_data):
+        """explain_batch haelt eine (n_samples, n_features) Matrix."""
+        from kenobase.prediction.explainability import SHAPBatch, SHAPExplainer
+
+        X, _ = synthetic_data
+        batch = SHAPExplainer(trained_predictor).explain_batch(X[:70])
+
+        assert isinstance(batch, SHAPBatch)
+        assert batch.values.shape == (70, 20)
+        assert len(batch[10:12]) == 2
+        np.testing.assert_allclose(batch[3].shap_values, batch.values[3])
+        np.testing.assert_allclose(batch.predictions[3], batch[3].prediction)
+
+    def test_cache_shared_across_explainers(self, trained_predictor, synthetic_data):
+        """Gleiches Modell + gleicher Input -> gecachte Matrix."""
+        from kenobase.prediction.explainability import SHAPExplainer, clear_shap_cache
+
+        X, _ = synthetic_data
+        clear_shap_cache()
+
+        first = SHAPExplainer(trained_predictor).shap_values(X[:70])
+        second = SHAPExplainer(trained_predictor).shap_values(X[:70].copy())
+        assert first is second
+
+        uncached = SHAPExplainer(trained_predictor, use_cache=False).shap_values(X[:70])
+        assert uncached is not first
+        np.testing.assert_allclose(uncached, first)
+
+
 class TestIntegration:
     """Integration mit KenoPredictor."""
 
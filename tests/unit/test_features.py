@@ -4,6 +4,7 @@ Testet:
 - FeatureRegistry: Registrierung und Abruf von Features
 - FeatureExtractor: Feature-Extraktion aus Ziehungsdaten
 - FeatureStore: Speichern und Laden von Features
+- FeatureSnapshots: Walk-Forward-Snapshots (as_of, Bereiche, Append)
 - FeaturePipeline: End-to-End Pipeline
 
 Acceptance Criteria:
@@ -14,6 +15,9 @@ Acceptance Criteria:
 
 from datetime import datetime
 import tempfile
+from unittest.mock import patch
+
+import numpy as np
 import pytest
 
 from kenobase.core.data_loader import DrawResult, GameType
@@ -25,6 +29,7 @@ from kenobase.features.registry import (
 )
 from kenobase.features.extractor import FeatureExtractor, FeatureVector
 from kenobase.features.store import FeatureStore, StorageFormat
+from kenobase.features.snapshots import build_feature_snapshots
 from kenobase.features.pipeline import FeaturePipeline, PipelineConfig, PipelineResult
 
 
@@ -335,6 +340,162 @@ class TestFeatureStore:
         assert "tier" in df.columns
 
 
+# ====================
+# FeatureSnapshots Tests
+# ====================
+
+
+class TestFeatureSnapshots:
+    """Tests fuer Walk-Forward-Snapshots und deren Persistenz."""
+
+    def test_snapshot_matches_extract(self, sample_draws):
+        """Snapshot zum Tag D entspricht extract(draws bis D)."""
+        extractor = FeatureExtractor()
+        snapshots = build_feature_snapshots(sample_draws[:20], extractor)
+
+        assert snapshots.values.shape == (20, 70, 20)
+        assert snapshots.values.dtype == np.float32
+
+        expected = extractor.extract(sample_draws[:12])
+        loaded = snapshots.as_of(sample_draws[11].date)
+        for num in (1, 35, 70):
+            assert loaded[num].tier == expected[num].tier
+            assert loaded[num].features == pytest.approx(expected[num].features, abs=1e-6)
+
+    def test_as_of_uses_latest_snapshot_before_date(self, sample_draws):
+        """as_of liefert den letzten Snapshot <= Stichtag."""
+        snapshots = build_feature_snapshots(sample_draws[:5])
+
+        vectors = snapshots.as_of(datetime(2024, 1, 3, 18, 30))
+        assert vectors[1].metadata["snapshot_date"] == "2024-01-03"
+        with pytest.raises(KeyError):
+            snapshots.as_of("2023-12-31")
+
+    def test_store_roundtrip_append_and_range(self, sample_draws, temp_dir):
+        """Speichern, inkrementell anhaengen und Teilbereiche laden."""
+        extractor = FeatureExtractor()
+        store = FeatureStore(base_dir=temp_dir)
+        store.save_snapshots(
+            build_feature_snapshots(sample_draws[:10], extractor), "wf", chunk_size=4
+        )
+
+        full = store.sync_snapshots("wf", sample_draws[:15], extractor)
+        direct = build_feature_snapshots(sample_draws[:15], extractor)
+
+        assert len(full) == 15
+        np.testing.assert_array_equal(full.values, direct.values)
+        np.testing.assert_array_equal(full.tiers, direct.tiers)
+        assert store.append_snapshots(direct, "wf") == 0
+
+        window = store.load_snapshots("wf", start="2024-01-03", end="2024-01-06")
+        np.testing.assert_array_equal(window.dates, direct.dates[2:6])
+        np.testing.assert_array_equal(window.combined_scores, direct.combined_scores[2:6])
+        assert store.as_of("wf", "2024-01-20")[7].combined_score == pytest.approx(
+            float(direct.combined_scores[-1, 6])
+        )
+
+        assert "wf" in store.list()
+        assert store.delete("wf")
+        assert not store.exists("wf")
+
+    def test_append_rejects_other_history(self, sample_draws, temp_dir):
+        """Snapshots mit anderem Startdatum werden nicht angehaengt."""
+        store = FeatureStore(base_dir=temp_dir)
+        store.save_snapshots(build_feature_snapshots(sample_draws[:3]), "wf")
+
+        with pytest.raises(ValueError):
+            store.append_snapshots(build_feature_snapshots(sample_draws[1:5]), "wf")
+
+    def test_trainer_uses_snapshots(self, sample_draws):
+        """KenoTrainer erzeugt mit Snapshots dieselbe Trainingsmatrix."""
+        pytest.importorskip("lightgbm")
+        from kenobase.prediction.trainer import KenoTrainer
+
+        draws = sample_draws[:15]
+        snapshots = build_feature_snapshots(draws)
+
+        X_ref, y_ref = KenoTrainer()._prepare_training_data(draws)
+        X, y = KenoTrainer(feature_snapshots=snapshots)._prepare_training_data(draws)
+
+        np.testing.assert_array_equal(X, X_ref)
+        np.testing.assert_array_equal(y, y_ref)
+
+    def test_trainer_ignores_snapshots_of_other_history(self, sample_draws):
+        """Gefilterte oder korrigierte Ziehungen fallen auf extract zurueck."""
+        pytest.importorskip("lightgbm")
+        from kenobase.prediction.trainer import KenoTrainer
+
+        snapshots = build_feature_snapshots(sample_draws[:15])
+        filtered = sample_draws[:5] + sample_draws[6:15]
+        corrected = list(sample_draws[:15])
+        corrected[3] = DrawResult(
+            date=corrected[3].date,
+            numbers=[n % 70 + 1 for n in corrected[3].numbers],
+            game_type=corrected[3].game_type,
+        )
+
+        for draws in (filtered, corrected):
+            X_ref, _ = KenoTrainer()._prepare_training_data(draws)
+            X, _ = KenoTrainer(feature_snapshots=snapshots)._prepare_training_data(draws)
+            np.testing.assert_array_equal(X, X_ref)
+
+    def test_store_keeps_history_and_rejects_other_draws(self, sample_draws, temp_dir):
+        """Historien-Fingerprints werden gespeichert und beim Sync geprueft."""
+        store = FeatureStore(base_dir=temp_dir)
+        direct = build_feature_snapshots(sample_draws[:8])
+        store.save_snapshots(direct, "wf", chunk_size=3)
+
+        loaded = store.sync_snapshots("wf", sample_draws[:10])
+        np.testing.assert_array_equal(loaded.history[:8], direct.history)
+        np.testing.assert_array_equal(loaded.draw_counts, np.arange(1, 11))
+
+        with pytest.raises(ValueError, match="different draw history"):
+            store.sync_snapshots("wf", sample_draws[:4] + sample_draws[5:12])
+
+    def test_sync_rebuilds_series_without_history(self, sample_draws, temp_dir):
+        """Reihen ohne gespeicherte Historie werden beim Sync neu erstellt."""
+        from dataclasses import replace
+
+        store = FeatureStore(base_dir=temp_dir)
+        legacy = replace(build_feature_snapshots(sample_draws[:5]), draw_counts=None, history=None)
+        store.save_snapshots(legacy, "wf")
+        assert store.load_snapshots("wf").history is None
+
+        loaded = store.sync_snapshots("wf", sample_draws[:7])
+        assert loaded.has_history and len(loaded) == 7
+
+    def test_trainer_ignores_snapshots_of_other_extractor(self, sample_draws):
+        """Snapshots eines anders konfigurierten Extractors werden nicht genutzt."""
+        pytest.importorskip("lightgbm")
+        from kenobase.prediction.trainer import KenoTrainer
+
+        draws = sample_draws[:15]
+        snapshots = build_feature_snapshots(draws)
+        trainer = KenoTrainer(numbers_to_draw=10, feature_snapshots=snapshots)
+
+        with patch.object(
+            trainer._extractor, "extract", wraps=trainer._extractor.extract
+        ) as extract:
+            X, _ = trainer._prepare_training_data(draws)
+
+        assert extract.call_count == len(draws) - 1
+        X_ref, _ = KenoTrainer(numbers_to_draw=10)._prepare_training_data(draws)
+        np.testing.assert_array_equal(X, X_ref)
+
+    def test_store_keeps_extractor_settings(self, sample_draws, temp_dir):
+        """Extractor-Einstellungen stehen im Manifest; Sync mit anderen baut neu."""
+        store = FeatureStore(base_dir=temp_dir)
+        store.save_snapshots(build_feature_snapshots(sample_draws[:5]), "wf")
+        assert store.load_snapshots("wf").extractor_settings == FeatureExtractor().settings
+
+        other = FeatureExtractor(hot_threshold=0.5)
+        with pytest.raises(ValueError, match="Extractor settings"):
+            store.append_snapshots(build_feature_snapshots(sample_draws[:7], other), "wf")
+
+        loaded = store.sync_snapshots("wf", sample_draws[:7], other)
+        assert loaded.extractor_settings == other.settings and len(loaded) == 7
+
+
 # ====================
 # FeaturePipeline Tests
 # ====================
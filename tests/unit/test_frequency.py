@@ -20,6 +20,7 @@ from kenobase.analysis.frequency import (
     calculate_frequency,
     calculate_pair_frequency,
     calculate_rolling_frequency,
+    calculate_rolling_frequency_matrix,
     classify_numbers,
     classify_pairs,
     get_cold_numbers,
@@ -363,6 +364,53 @@ class TestCalculateRollingFrequency:
         assert all(f == 0.0 for f in freqs)
 
 
+class TestCalculateRollingFrequencyMatrix:
+    """Tests fuer calculate_rolling_frequency_matrix."""
+
+    def test_shape_and_columns(self, draws_for_rolling: list[DrawResult]) -> None:
+        """Matrix hat (n_windows, n_numbers) und Spalten entsprechen Einzelaufrufen."""
+        matrix = calculate_rolling_frequency_matrix(
+            draws_for_rolling, window=3, number_range=(1, 10)
+        )
+
+        assert matrix.frequencies.shape == (3, 10)
+        assert matrix.numbers == tuple(range(1, 11))
+        for number in range(1, 11):
+            expected = calculate_rolling_frequency(draws_for_rolling, window=3, number=number)
+            assert matrix.column(number).tolist() == expected
+
+    def test_matches_naive_window_count(self) -> None:
+        """Kumulative Summe liefert dieselben Werte wie Fenster-Zaehlung."""
+        import random
+
+        rng = random.Random(7)
+        draws = [
+            DrawResult(
+                date=datetime(2024, 1, 1),
+                numbers=rng.sample(range(1, 71), 20),
+                game_type=GameType.KENO,
+            )
+            for _ in range(60)
+        ]
+        matrix = calculate_rolling_frequency_matrix(draws, window=7, number_range=(1, 70))
+
+        for number in (1, 35, 70):
+            naive = [
+                sum(1 for d in draws[i : i + 7] if number in d.numbers) / 7
+                for i in range(len(draws) - 7 + 1)
+            ]
+            assert matrix.column(number).tolist() == naive
+
+    def test_inferred_range_and_short_input(self, draws_for_rolling: list[DrawResult]) -> None:
+        """Bereich wird aus Daten abgeleitet; zu wenige Ziehungen ergeben 0 Fenster."""
+        matrix = calculate_rolling_frequency_matrix(draws_for_rolling, window=10)
+
+        assert matrix.numbers == (1, 2, 3, 4, 5, 6)
+        assert matrix.n_windows == 0
+        with pytest.raises(KeyError):
+            matrix.column(99)
+
+
 # =============================================================================
 # Test: Convenience Functions
 # =============================================================================
@@ -0,0 +1,192 @@
+"""Unit tests for kenobase.core.gq_store."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from kenobase.analysis.distribution import load_gq_data, load_quote_details_data
+from kenobase.analysis.odds_correlation import load_gq_winner_data
+from kenobase.core.gq_store import (
+    GQ_COLUMNS,
+    HAS_PYARROW,
+    GQStore,
+    clear_gq_cache,
+    load_gq_frame,
+    read_gq_csv,
+    set_default_gq_store,
+    to_legacy_frame,
+)
+
+GQ_HEADER = "Datum,Keno-Typ,Anzahl richtiger Zahlen,Anzahl der Gewinner,1 Euro Gewinn"
+
+requires_pyarrow = pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow not installed")
+
+
+def _write_gq(path, rows):
+    path.write_text("\n".join([GQ_HEADER, *rows]) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_gq_cache()
+    yield
+    clear_gq_cache()
+    set_default_gq_store(None)
+
+
+@pytest.fixture
+def gq_csv(tmp_path):
+    return _write_gq(
+        tmp_path / "Keno_GQ_2024.csv",
+        [
+            '02.01.2024,10,10,0,"100.000"',
+            "02.01.2024,10,9,3.462,1000",
+            "01.01.2024,2,2,2.91,6",
+            "01.01.2024,Gewinnklasse,x,k.A.,-",
+            '"So, 29.12.",10,9,275.0,1000',
+            "31.12.2023,10,9,12,1000",
+        ],
+    )
+
+
+class TestNormalization:
+    """Tests for read_gq_csv / load_gq_frame."""
+
+    def test_schema_and_cleaning(self, gq_csv):
+        frame = read_gq_csv(gq_csv)
+
+        assert tuple(frame.columns) == GQ_COLUMNS
+        assert str(frame["date"].dtype) == "datetime64[ns]"
+        assert frame["keno_type"].dtype == "int8"
+        assert len(frame) == 5  # Gewinnklasse-Zeile verworfen
+        assert frame["date"].is_monotonic_increasing
+        # "So, 29.12." -> Jahr aus dem Dateinamen
+        assert frame["date"].iloc[-1] == pd.Timestamp("2024-12-29")
+        assert sorted(frame["winners"]) == [0, 12, 275, 2910, 3462]
+        assert frame["payout"].max() == 100000.0
+        assert frame["total_payout"].isna().all()
+
+    def test_memo_returns_independent_copies(self, gq_csv):
+        first = load_gq_frame(gq_csv)
+        first.loc[0, "winners"] = -1
+
+        assert (load_gq_frame(gq_csv)["winners"] >= 0).all()
+
+    def test_memo_invalidated_on_change(self, gq_csv):
+        assert len(load_gq_frame(gq_csv)) == 5
+        _write_gq(gq_csv, ["02.01.2024,10,10,0,100000"])
+
+        assert len(load_gq_frame(gq_csv)) == 1
+
+    def test_missing_required_column(self, tmp_path):
+        path = tmp_path / "bad.csv"
+        path.write_text("Datum,Keno-Typ\n01.01.2024,10\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Anzahl der Gewinner"):
+            read_gq_csv(path)
+
+    def test_semicolon_quote_details(self, tmp_path):
+        path = tmp_path / "quote_details.csv"
+        path.write_text(
+            "Datum;Keno-Typ;Anzahl richtiger Zahlen;Anzahl der Gewinner;Gewinn/1Eur;Auszahlung\n"
+            "01.01.2024;10;9;3;1.000;3.000,00\n",
+            encoding="utf-8",
+        )
+
+        df = load_quote_details_data(str(path))
+
+        assert list(df.columns)[-2:] == ["Gewinn/1Eur", "Auszahlung"]
+        assert df["Auszahlung"].iloc[0] == 3000.0
+        assert df["Anzahl der Gewinner"].iloc[0] == 3
+
+
+class TestLegacyLoaders:
+    """The analysis loaders share the normalized frame."""
+
+    def test_load_gq_data_legacy_columns(self, gq_csv):
+        df = load_gq_data(str(gq_csv))
+
+        assert list(df.columns) == [
+            "Datum",
+            "Keno-Typ",
+            "Anzahl richtiger Zahlen",
+            "Anzahl der Gewinner",
+            "1 Euro Gewinn",
+        ]
+        pd.testing.assert_frame_equal(df, to_legacy_frame(read_gq_csv(gq_csv)))
+
+    def test_winner_data_aggregates_per_date_and_type(self, gq_csv):
+        data = load_gq_winner_data(gq_csv)
+
+        assert data[pd.Timestamp("2024-01-02").to_pydatetime()] == {10: 3462.0}
+
+
+@requires_pyarrow
+class TestGQStore:
+    """Tests for the partitioned Parquet store."""
+
+    def test_ingest_writes_year_partitions(self, tmp_path, gq_csv):
+        store = GQStore(tmp_path / "store")
+
+        assert store.ingest([gq_csv]) == [str(gq_csv.resolve())]
+        assert store.ingest([gq_csv]) == []  # unveraendert
+
+        partitions = store.partitions()
+        assert [p.year for p in partitions] == [2023, 2024]
+        assert all((store.root / p.path).exists() for p in partitions)
+        assert sum(p.rows for p in partitions) == 5
+
+    def test_query_matches_memo_frame(self, tmp_path, gq_csv):
+        store = GQStore(tmp_path / "store")
+
+        pd.testing.assert_frame_equal(
+            load_gq_frame(gq_csv, store=store), load_gq_frame(gq_csv)
+        )
+
+    def test_query_filters(self, tmp_path, gq_csv):
+        store = GQStore(tmp_path / "store")
+        store.ingest([gq_csv])
+
+        frame = store.query("2024-01-01", "2024-06-30", keno_types=[10], columns=["date", "hits"])
+
+        assert list(frame.columns) == ["date", "hits"]
+        assert sorted(frame["hits"]) == [9, 10]
+        assert store.partitions(end="2023-12-31")[0].year == 2023
+        assert store.query("2030-01-01").empty
+
+    def test_reingest_replaces_changed_source(self, tmp_path, gq_csv):
+        store = GQStore(tmp_path / "store")
+        store.ingest([gq_csv])
+        _write_gq(gq_csv, ["05.05.2024,10,10,1,100000"])
+
+        assert store.ingest([gq_csv]) == [str(gq_csv.resolve())]
+        assert len(store.query()) == 1
+        assert not list((store.root / "year=2023").glob("*.parquet"))
+
+    def test_deduplicate_overlapping_sources(self, tmp_path, gq_csv):
+        other = _write_gq(tmp_path / "Keno_GQ_2024_b.csv", ["02.01.2024,10,9,99,1000"])
+        store = GQStore(tmp_path / "store")
+        store.ingest([gq_csv, other])
+
+        merged = store.query(
+            "2024-01-02", "2024-01-02", hits=[9], sources=[gq_csv, other], deduplicate=True
+        )
+
+        assert merged["winners"].tolist() == [99]
+        assert list(store.dates()) == sorted(set(store.query()["date"]))
+
+    def test_default_store_used_by_loaders(self, tmp_path, gq_csv):
+        store = set_default_gq_store(tmp_path / "store")
+
+        df = load_gq_data(str(gq_csv))
+
+        assert len(df) == 5
+        assert str(gq_csv.resolve()) in store.sources()
+
+    def test_unknown_source_raises(self, tmp_path, gq_csv):
+        store = GQStore(tmp_path / "store")
+
+        with pytest.raises(KeyError):
+            store.query(sources=[gq_csv])
@@ -0,0 +1,168 @@
+"""Unit tests for kenobase.pipeline.hypothesis_batch."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from kenobase.core.draw_collection import DrawCollection
+from kenobase.core.result_cache import ResultCache
+from kenobase.pipeline.hypothesis_batch import (
+    HYPOTHESIS_REGISTRY,
+    BatchInputs,
+    HypothesisSpec,
+    run_hypothesis_batch,
+    to_jsonable,
+)
+
+
+@dataclass
+class FakeSummary:
+    n_draws: int
+    first: datetime
+    mean: np.float64
+    numbers: set[int]
+
+
+def count_draws(draws, gq_path):
+    """Test target: uses the shared draws and a path input."""
+    return FakeSummary(
+        n_draws=len(draws),
+        first=draws[0].date,
+        mean=np.float64(np.mean([sum(d.numbers) for d in draws])),
+        numbers={len(Path(gq_path).read_text().splitlines())},
+    )
+
+
+def is_shared_collection(draws):
+    return {"is_collection": isinstance(draws, DrawCollection)}
+
+
+def fail(draws):
+    raise ValueError("boom")
+
+
+def write_keno_csv(path: Path, n: int) -> None:
+    header = ";".join(["Datum"] + [f"Keno_Z{i}" for i in range(1, 21)] + ["Keno_Plus5"])
+    rows = [
+        ";".join([f"{day:02d}.03.2024"] + [str(x) for x in range(day, day + 20)] + ["12345"])
+        for day in range(1, n + 1)
+    ]
+    path.write_text("\n".join([header] + rows) + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+def inputs(tmp_path) -> BatchInputs:
+    keno = tmp_path / "keno.csv"
+    gq = tmp_path / "gq.csv"
+    write_keno_csv(keno, 5)
+    gq.write_text("a\nb\nc\n", encoding="utf-8")
+    return BatchInputs(keno_path=str(keno), gq_path=str(gq))
+
+
+REGISTRY = {
+    "T-1": HypothesisSpec(
+        "T-1", f"{__name__}:count_draws", {"draws": "keno", "gq_path": "gq"}, "t1.json"
+    ),
+    "T-2": HypothesisSpec("T-2", f"{__name__}:is_shared_collection", {"draws": "keno"}, "t2.json"),
+    "T-ERR": HypothesisSpec("T-ERR", f"{__name__}:fail", {"draws": "keno"}, "err.json"),
+}
+
+
+class TestRunHypothesisBatch:
+    """Tests for run_hypothesis_batch."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_runs_and_writes_results(self, inputs, tmp_path, workers):
+        out = tmp_path / "out"
+        result = run_hypothesis_batch(
+            ["T-1", "T-2"], inputs=inputs, output_dir=out, max_workers=workers, registry=REGISTRY
+        )
+
+        assert [r.hypothesis_id for r in result.reports] == ["T-1", "T-2"]
+        assert result.n_ok == 2
+        assert all(r.wall_time_s >= 0 and r.peak_memory_mb >= 0 for r in result.reports)
+
+        t1 = json.loads((out / "t1.json").read_text())
+        assert t1["hypothesis"] == "T-1"
+        assert t1["result"]["n_draws"] == 5
+        assert t1["result"]["first"] == "2024-03-01T00:00:00"
+        assert t1["result"]["numbers"] == [3]
+        assert json.loads((out / "t2.json").read_text())["result"] == {"is_collection": True}
+
+    def test_skips_unchanged_and_reruns_on_input_change(self, inputs, tmp_path):
+        out = tmp_path / "out"
+        run_hypothesis_batch(["T-1", "T-2"], inputs=inputs, output_dir=out, registry=REGISTRY)
+
+        second = run_hypothesis_batch(
+            ["T-1", "T-2"], inputs=inputs, output_dir=out, registry=REGISTRY
+        )
+        assert [r.status for r in second.reports] == ["skipped", "skipped"]
+        assert second.load_time_s < 1.0
+
+        Path(inputs.gq_path).write_text("a\n", encoding="utf-8")
+        third = run_hypothesis_batch(
+            ["T-1", "T-2"], inputs=inputs, output_dir=out, registry=REGISTRY
+        )
+        assert [r.status for r in third.reports] == ["ok", "skipped"]
+
+        forced = run_hypothesis_batch(
+            ["T-2"], inputs=inputs, output_dir=out, registry=REGISTRY, force=True
+        )
+        assert forced.reports[0].status == "ok"
+
+    def test_error_is_isolated(self, inputs, tmp_path):
+        out = tmp_path / "out"
+        result = run_hypothesis_batch(
+            ["T-ERR", "T-2"], inputs=inputs, output_dir=out, max_workers=2, registry=REGISTRY
+        )
+
+        err, ok = result.reports
+        assert err.status == "error" and "boom" in err.error
+        assert ok.status == "ok"
+        assert not (out / "err.json").exists()
+        assert [e.name for e in ResultCache(out / ".cache").entries()] == ["T-2"]
+
+    def test_published_results_report_freshness(self, inputs, tmp_path):
+        out = tmp_path / "out"
+        run_hypothesis_batch(["T-1", "T-2"], inputs=inputs, output_dir=out, registry=REGISTRY)
+        cache = ResultCache(out / ".cache")
+
+        assert cache.artifact_status(out / "t1.json") == "fresh"
+        assert cache.artifact_status(out / "t2.json") == "fresh"
+
+        Path(inputs.gq_path).write_text("a\n", encoding="utf-8")
+        assert cache.artifact_status(out / "t1.json") == "stale"
+        assert cache.artifact_status(out / "t2.json") == "fresh"
+
+        run_hypothesis_batch(["T-1"], inputs=inputs, output_dir=out, registry=REGISTRY)
+        assert cache.artifact_status(out / "t1.json") == "fresh"
+
+    def test_republishes_missing_output_from_cache(self, inputs, tmp_path):
+        out = tmp_path / "out"
+        run_hypothesis_batch(["T-2"], inputs=inputs, output_dir=out, registry=REGISTRY)
+        (out / "t2.json").unlink()
+
+        result = run_hypothesis_batch(["T-2"], inputs=inputs, output_dir=out, registry=REGISTRY)
+        assert result.reports[0].status == "skipped"
+        assert json.loads((out / "t2.json").read_text())["result"] == {"is_collection": True}
+
+    def test_unknown_hypothesis(self, inputs, tmp_path):
+        with pytest.raises(KeyError, match="T-404"):
+            run_hypothesis_batch(["T-404"], inputs=inputs, output_dir=tmp_path, registry=REGISTRY)
+
+
+def test_default_registry_targets_resolve():
+    for spec in HYPOTHESIS_REGISTRY.values():
+        assert callable(spec.resolve())
+        assert set(spec.datasets) <= {"keno", "gq", "gk1", "stake"}
+
+
+def test_to_jsonable_handles_nan_and_numpy():
+    data = to_jsonable({1: np.array([1, 2]), "x": float("nan"), "y": np.int64(3)})
+    assert data == {"1": [1, 2], "x": None, "y": 3}
@@ -0,0 +1,70 @@
+"""Tests for lazy package exports and the import-time budget."""
+
+from __future__ import annotations
+
+import ast
+import importlib
+from pathlib import Path
+
+import pytest
+
+from scripts.benchmark_import_time import (
+    IMPORT_TARGETS,
+    IMPORT_TIME_BUDGETS_S,
+    loaded_heavy_modules,
+    measure_import_time,
+)
+
+LAZY_PACKAGES = ["kenobase.analysis", "kenobase.prediction"]
+
+
+def _type_checking_imports(package: str) -> dict[str, tuple[str, str]]:
+    """Exported name -> (submodule, attribute) from the TYPE_CHECKING block."""
+    path = Path(importlib.import_module(package).__file__)
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    block = next(node for node in tree.body if isinstance(node, ast.If))
+    names = {}
+    for node in block.body:
+        assert isinstance(node, ast.ImportFrom)
+        module = node.module.removeprefix(f"{package}.")
+        for alias in node.names:
+            names[alias.asname or alias.name] = (module, alias.name)
+    return names
+
+
+@pytest.mark.parametrize("package", LAZY_PACKAGES)
+def test_lazy_index_matches_type_checking_imports(package):
+    module = importlib.import_module(package)
+    assert module._EXPORT_INDEX == _type_checking_imports(package)
+    assert set(module.__all__) == set(module._EXPORT_INDEX)
+
+
+@pytest.mark.parametrize("package", LAZY_PACKAGES)
+def test_all_exports_resolve(package):
+    module = importlib.import_module(package)
+    for name in module.__all__:
+        submodule, attr = module._EXPORT_INDEX[name]
+        expected = getattr(importlib.import_module(f"{package}.{submodule}"), attr)
+        assert getattr(module, name) is expected
+    assert set(module.__all__) <= set(dir(module))
+
+
+def test_unknown_attribute_raises():
+    import kenobase.analysis
+
+    with pytest.raises(AttributeError, match="no_such_name"):
+        kenobase.analysis.no_such_name  # noqa: B018
+
+
+@pytest.mark.parametrize(
+    "statement",
+    ["from kenobase.analysis import calculate_frequency", "import kenobase.prediction"],
+)
+def test_heavy_dependencies_not_loaded(statement):
+    assert loaded_heavy_modules(statement) == []
+
+
+@pytest.mark.parametrize("target", sorted(IMPORT_TARGETS))
+def test_import_time_budget(target):
+    seconds = measure_import_time(target, repeats=2)
+    assert seconds <= IMPORT_TIME_BUDGETS_S[target], f"{target}: {seconds:.2f}s"
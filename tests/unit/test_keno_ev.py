@@ -0,0 +1,113 @@
+"""Unit tests for kenobase.core.keno_ev."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from kenobase.analysis.near_miss import KENO_PROBABILITIES
+from kenobase.core.keno_ev import (
+    expected_return,
+    hit_distribution,
+    hypergeom_mean_var,
+    portfolio_distribution,
+)
+from kenobase.core.keno_quotes import KENO_FIXED_QUOTES_BY_TYPE
+
+SMALL_QUOTES = {2: {2: 4.0}, 3: {0: 1.0, 2: 1.5, 3: 10.0}, 4: {3: 3.0, 4: 25.0}}
+
+
+def brute_force(tickets, stakes, quotes, numbers_range, numbers_drawn):
+    """Exhaustive enumeration of all draws for a small number space."""
+    totals: dict[float, int] = defaultdict(int)
+    draws = list(combinations(range(1, numbers_range + 1), numbers_drawn))
+    for draw in draws:
+        drawn = set(draw)
+        payout = sum(
+            stake * quotes[len(t)].get(len(drawn.intersection(t)), 0.0)
+            for t, stake in zip(tickets, stakes)
+        )
+        totals[round(payout, 6)] += 1
+    return {p: c / len(draws) for p, c in totals.items()}
+
+
+class TestSingleTicket:
+    def test_hit_distribution_matches_near_miss_table(self):
+        for keno_type, probs in KENO_PROBABILITIES.items():
+            assert hit_distribution(keno_type) == pytest.approx(probs)
+
+    def test_hypergeom_mean_var_matches_distribution(self):
+        probs = hit_distribution(10)
+        mean = sum(m * p for m, p in probs.items())
+        var = sum((m - mean) ** 2 * p for m, p in probs.items())
+        assert hypergeom_mean_var(keno_type=10) == pytest.approx((mean, var))
+
+    @pytest.mark.parametrize("keno_type", sorted(KENO_FIXED_QUOTES_BY_TYPE))
+    def test_portfolio_of_one_equals_expected_return(self, keno_type):
+        dist = portfolio_distribution([list(range(1, keno_type + 1))])
+        assert dist.ev == pytest.approx(expected_return(keno_type))
+        assert dist.probabilities.sum() == pytest.approx(1.0)
+
+    def test_unsupported_type(self):
+        with pytest.raises(ValueError, match="Unsupported"):
+            expected_return(1)
+
+
+class TestPortfolio:
+    @pytest.mark.parametrize(
+        "tickets",
+        [
+            [[1, 2, 3], [3, 4, 5, 6], [1, 6]],
+            [[1, 2, 3, 4], [1, 2, 3, 4], [2, 5]],
+            [[1, 2], [3, 4], [5, 6, 7]],
+            [[1, 2, 3, 4], [2, 3, 4, 5], [3, 4, 5, 6], [4, 5, 6, 7]],
+        ],
+    )
+    def test_matches_brute_force(self, tickets):
+        stakes = [1.0 + 0.5 * i for i in range(len(tickets))]
+        dist = portfolio_distribution(
+            tickets, stakes=stakes, quotes=SMALL_QUOTES, numbers_range=12, numbers_drawn=5
+        )
+        expected = brute_force(tickets, stakes, SMALL_QUOTES, 12, 5)
+
+        assert dict(zip(dist.payouts.tolist(), dist.probabilities.tolist())) == pytest.approx(
+            expected
+        )
+        assert dist.stake == pytest.approx(sum(stakes))
+
+    def test_disjoint_ev_is_additive(self):
+        tickets = [list(range(1, 11)), list(range(11, 17)), [20, 30]]
+        dist = portfolio_distribution(tickets)
+        assert dist.ev == pytest.approx(sum(expected_return(len(t)) for t in tickets))
+        assert dist.n_regions == 3
+
+    def test_summary_statistics(self):
+        dist = portfolio_distribution([[1, 2, 3, 4, 5, 6], [4, 5, 6, 7, 8, 9]])
+        second_moment = float(np.dot(dist.payouts**2, dist.probabilities))
+        assert dist.variance == pytest.approx(second_moment - dist.ev**2)
+        assert dist.roi == pytest.approx(dist.ev / 2.0 - 1.0)
+        assert dist.p_profit == pytest.approx(dist.prob_at_least(2.0, strict=True))
+        assert dist.prob_at_least(0.0) == pytest.approx(1.0)
+        assert dist.quantile(0.0) == 0.0
+        assert dist.quantile(1.0) == dist.payouts.max()
+        assert dist.to_dict()["n_tickets"] == 2
+
+    def test_invalid_input(self):
+        with pytest.raises(ValueError, match="duplicate"):
+            portfolio_distribution([[1, 1, 2]])
+        with pytest.raises(ValueError, match="outside"):
+            portfolio_distribution([[1, 71]])
+        with pytest.raises(ValueError, match="unsupported"):
+            portfolio_distribution([[1]])
+        with pytest.raises(ValueError, match="stakes"):
+            portfolio_distribution([[1, 2]], stakes=[1.0, 2.0])
+        with pytest.raises(ValueError):
+            portfolio_distribution([])
+
+    def test_max_states_guard(self):
+        tickets = [[i, i + 1, i + 2, i + 3] for i in range(1, 30, 2)]
+        with pytest.raises(ValueError, match="max_states"):
+            portfolio_distribution(tickets, max_states=100)
@@ -0,0 +1,170 @@
+"""Tests for bulk and incremental fetching in kenobase.scraper.lotto_de.
+
+Uses recorded archive pages from tests/fixtures/lotto_de instead of the network.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+
+from kenobase.core.data_loader import DataLoader
+from kenobase.scraper.lotto_de import (
+    LottoDeScraper,
+    append_draws_csv,
+    latest_draw_date,
+)
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "lotto_de"
+
+
+class FakeResponse:
+    def __init__(self, text: str, status_code: int = 200):
+        self.text = text
+        self.status_code = status_code
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}")
+
+
+class FixtureSession:
+    """Serves recorded pages keyed by the ?datum= query parameter."""
+
+    def __init__(self):
+        self.headers: dict[str, str] = {}
+        self.requested: list[str] = []
+        self._lock = threading.Lock()
+
+    def get(self, url: str, timeout: int = 30) -> FakeResponse:
+        datum = parse_qs(urlsplit(url).query)["datum"][0]
+        with self._lock:
+            self.requested.append(datum)
+        day = datetime.strptime(datum, "%d.%m.%Y")
+        path = FIXTURES / f"keno_{day:%Y-%m-%d}.html"
+        if not path.exists():
+            return FakeResponse("", status_code=404)
+        return FakeResponse(path.read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def scraper() -> LottoDeScraper:
+    return LottoDeScraper(
+        session=FixtureSession(), delay_between_requests=0.0, max_workers=3
+    )
+
+
+def write_keno_csv(path: Path, dates: list[str]) -> None:
+    header = ";".join(
+        ["Datum"] + [f"Keno_Z{i}" for i in range(1, 21)] + ["Keno_Plus5", "Keno_Spieleinsatz"]
+    )
+    rows = [";".join([d] + [str(n) for n in range(1, 21)] + ["12345", "1.000.000"]) for d in dates]
+    path.write_text("\n".join([header] + rows) + "\n", encoding="utf-8")
+
+
+class TestFetchDateRange:
+    """Tests for concurrent fetch_date_range."""
+
+    def test_parses_recorded_pages_in_order(self, scraper):
+        results = scraper.fetch_date_range(datetime(2024, 3, 1), datetime(2024, 3, 4))
+
+        # 2024-03-04 has no recorded page (404) and is skipped
+        assert [r.date.day for r in results] == [1, 2, 3]
+        assert all(len(r.numbers) == 20 for r in results)
+        assert results[0].numbers[:3] == [2, 9, 10]
+        assert results[0].plus5 is not None
+        assert results[0].winners_by_type[10][10] == 0
+
+    def test_skip_dates_are_not_requested(self, scraper):
+        scraper.fetch_date_range(
+            datetime(2024, 3, 1),
+            datetime(2024, 3, 3),
+            skip_dates={datetime(2024, 3, 2).date()},
+        )
+        assert sorted(scraper.session.requested) == ["01.03.2024", "03.03.2024"]
+
+    def test_progress_callback_counts_all_days(self, scraper):
+        calls = []
+        scraper.fetch_date_range(
+            datetime(2024, 3, 1),
+            datetime(2024, 3, 3),
+            progress_callback=lambda d, done, total: calls.append((done, total)),
+        )
+        assert sorted(calls) == [(1, 3), (2, 3), (3, 3)]
+
+
+class TestIncrementalSync:
+    """Tests for LottoDeScraper.sync."""
+
+    def test_csv_sync_fetches_only_missing_days(self, scraper, tmp_path):
+        dataset = tmp_path / "KENO.csv"
+        write_keno_csv(dataset, ["29.02.2024", "01.03.2024"])
+
+        new = scraper.sync(dataset, end_date=datetime(2024, 3, 3))
+
+        assert sorted(scraper.session.requested) == ["02.03.2024", "03.03.2024"]
+        assert [r.date.day for r in new] == [2, 3]
+        assert latest_draw_date(dataset) == datetime(2024, 3, 3)
+
+        draws = DataLoader().load(dataset)
+        assert len(draws) == 4
+        assert draws[-1].numbers == new[-1].numbers
+
+    def test_sync_is_noop_when_up_to_date(self, scraper, tmp_path):
+        dataset = tmp_path / "KENO.csv"
+        write_keno_csv(dataset, ["03.03.2024"])
+        before = dataset.read_bytes()
+
+        assert scraper.sync(dataset, end_date=datetime(2024, 3, 3)) == []
+        assert scraper.session.requested == []
+        assert dataset.read_bytes() == before
+
+    def test_json_cache_sync(self, scraper, tmp_path):
+        dataset = tmp_path / "draws.json"
+        scraper.save_results(
+            scraper.fetch_date_range(datetime(2024, 3, 1), datetime(2024, 3, 1)), dataset
+        )
+
+        scraper.sync(dataset, end_date=datetime(2024, 3, 3))
+
+        data = json.loads(dataset.read_text(encoding="utf-8"))
+        assert [d["date"] for d in data["draws"]] == ["2024-03-01", "2024-03-02", "2024-03-03"]
+        assert data["count"] == 3
+
+    def test_empty_dataset_requires_start_date(self, scraper, tmp_path):
+        with pytest.raises(ValueError, match="start_date"):
+            scraper.sync(tmp_path / "missing.csv", end_date=datetime(2024, 3, 3))
+
+        new = scraper.sync(
+            tmp_path / "missing.csv",
+            start_date=datetime(2024, 3, 2),
+            end_date=datetime(2024, 3, 3),
+        )
+        assert len(new) == 2
+        assert (tmp_path / "missing.csv").read_text().startswith("Datum;Keno_Z1;")
+
+    def test_empty_dataset_with_start_after_end(self, scraper, tmp_path):
+        dataset = tmp_path / "missing.csv"
+
+        new = scraper.sync(
+            dataset, start_date=datetime(2024, 3, 5), end_date=datetime(2024, 3, 3)
+        )
+
+        assert new == []
+        assert scraper.session.requested == []
+        assert not dataset.exists()
+
+    def test_append_leaves_no_temp_files(self, scraper, tmp_path):
+        dataset = tmp_path / "KENO.csv"
+        write_keno_csv(dataset, ["01.03.2024"])
+        results = scraper.fetch_date_range(datetime(2024, 3, 2), datetime(2024, 3, 2))
+
+        append_draws_csv(dataset, results)
+
+        assert [p.name for p in tmp_path.iterdir()] == ["KENO.csv"]
@@ -334,6 +334,83 @@ class TestKenoPredictorSaveLoad:
             predictor.save(tmp_path / "model")
 
 
+class TestHyperparameterTuning:
+    """Tests fuer persistentes Optuna-Tuning."""
+
+    @pytest.fixture
+    def sample_data(self):
+        """Creates small chronological sample data."""
+        np.random.seed(7)
+        X = np.random.randn(300, 20).astype(np.float32)
+        y = (np.random.rand(300) > 0.7).astype(np.int32)
+        return X, y
+
+    def test_walk_forward_folds_are_chronological(self):
+        """Train windows precede test windows and respect block boundaries."""
+        from kenobase.prediction.model import _walk_forward_folds
+
+        folds = _walk_forward_folds(700, n_folds=3, train_test_ratio=6, block_size=10)
+
+        assert len(folds) == 3
+        for train_idx, test_idx in folds:
+            assert train_idx.max() < test_idx.min()
+            assert test_idx.min() % 10 == 0
+            assert len(train_idx) == 6 * len(test_idx)
+        assert folds[-1][1].max() == 699
+
+    def test_resume_from_sqlite_storage(self, sample_data, tmp_path):
+        """A second call continues the stored study instead of restarting."""
+        pytest.importorskip("optuna")
+        from kenobase.prediction.model import KenoPredictor, ModelConfig
+
+        X, y = sample_data
+        storage = tmp_path / "study.db"
+
+        predictor = KenoPredictor(config=ModelConfig(n_estimators=5))
+        predictor.tune_hyperparameters(X, y, n_trials=2, n_folds=2, storage_path=storage)
+        assert storage.exists()
+        assert predictor.tuning_summary["n_trials"] == 2
+
+        resumed = KenoPredictor(config=ModelConfig(n_estimators=5))
+        config = resumed.tune_hyperparameters(
+            X, y, n_trials=3, n_folds=2, storage_path=storage
+        )
+        assert resumed.tuning_summary["n_trials"] == 3
+        assert config.n_estimators == 5
+        assert config.learning_rate == resumed.tuning_summary["best_params"]["learning_rate"]
+
+    def test_intermediate_values_reported_per_fold(self, sample_data):
+        """Each completed trial reports one intermediate value per fold."""
+        pytest.importorskip("optuna")
+        from kenobase.prediction.model import KenoPredictor, ModelConfig
+
+        X, y = sample_data
+        predictor = KenoPredictor(config=ModelConfig(n_estimators=5))
+        predictor.tune_hyperparameters(X, y, n_trials=2, n_folds=3, pruner=None)
+
+        for trial in predictor.tuning_summary["trials"]:
+            assert trial["state"] == "COMPLETE"
+            assert len(trial["intermediate_values"]) == 3
+
+    def test_tuning_summary_saved_next_to_model(self, sample_data, tmp_path):
+        """save() writes the study history, load() restores it."""
+        pytest.importorskip("optuna")
+        from kenobase.prediction.model import KenoPredictor, ModelConfig
+
+        X, y = sample_data
+        predictor = KenoPredictor(config=ModelConfig(n_estimators=5))
+        predictor.config = predictor.tune_hyperparameters(X, y, n_trials=2, n_folds=2)
+        predictor.train(X, y)
+
+        model_path = tmp_path / "model"
+        predictor.save(model_path)
+
+        assert (tmp_path / "model.tuning.json").exists()
+        loaded = KenoPredictor()
+        loaded.load(model_path)
+        assert loaded.tuning_summary["best_params"] == predictor.tuning_summary["best_params"]
+
+
 class TestIntegration:
     """Integration tests with realistic data."""
 
@@ -15,6 +15,7 @@ import pytest
 
 from kenobase.analysis.number_index import (
     CorrelationResult,
+    GK1IndexEngine,
     IndexResult,
     NumberIndex,
     calculate_index_correlation,
@@ -348,3 +349,63 @@ class TestEdgeCases:
         # Invalid numbers should not cause errors
         assert 71 not in result.indices
         assert 0 not in result.indices
+
+
+class TestGK1IndexEngine:
+    """Tests for the precomputed, incremental index engine."""
+
+    @staticmethod
+    def make_draws(n: int) -> list[tuple[datetime, list[int]]]:
+        base_date = datetime(2024, 1, 1)
+        return [
+            (base_date + timedelta(days=i), [(i % 7) + 1, (i % 3) + 10, 70])
+            for i in range(n)
+        ]
+
+    def test_lookup_matches_recomputation_for_every_date(self) -> None:
+        """index_table(at) equals calculate_index_table on the prefix."""
+        draws = self.make_draws(40)
+        gk1_events = [(datetime(2024, 1, 10), 10), (datetime(2024, 1, 25), 9)]
+        engine = GK1IndexEngine.from_draws(draws, gk1_events)
+
+        for i, (draw_date, _) in enumerate(draws):
+            expected = calculate_index_table(draws[: i + 1], gk1_events)
+            assert engine.index_table(at=draw_date) == expected
+
+    def test_segments_reset_counts(self) -> None:
+        """Counts restart at each GK1 event."""
+        draws = self.make_draws(20)
+        engine = GK1IndexEngine.from_draws(draws, [(datetime(2024, 1, 11), 10)])
+
+        assert engine.segments() == [(0, 10), (10, 20)]
+        assert engine.index_vector(at=datetime(2024, 1, 10))[69] == 10
+        assert engine.index_vector(at=datetime(2024, 1, 11))[69] == 1
+
+    def test_incremental_updates_equal_full_build(self) -> None:
+        """Appending draws and late GK1 events gives the same matrix as a rebuild."""
+        draws = self.make_draws(30)
+        gk1_events = [(datetime(2024, 1, 8), 10), (datetime(2024, 1, 20), 9)]
+
+        engine = GK1IndexEngine()
+        for draw_date, numbers in draws[:15]:
+            engine.append_draw(draw_date, numbers)
+        for event_date, keno_type in gk1_events:  # first one arrives late
+            engine.add_gk1_event(event_date, keno_type)
+        engine.extend(draws[15:])
+
+        full = GK1IndexEngine.from_draws(draws, gk1_events)
+        assert (engine.counts == full.counts).all()
+        assert engine.index_table() == full.index_table()
+        assert engine.index_table().gk1_event_type == 9
+
+    def test_append_out_of_order_raises(self) -> None:
+        engine = GK1IndexEngine.from_draws(self.make_draws(3), [])
+        with pytest.raises(ValueError, match="chronologically"):
+            engine.append_draw(datetime(2023, 12, 31), [1])
+
+    def test_query_before_first_draw(self) -> None:
+        engine = GK1IndexEngine.from_draws(self.make_draws(3), [])
+        result = engine.index_table(at=datetime(2023, 1, 1))
+
+        assert result.draws_since_reset == 0
+        assert all(idx.current_index == 0 for idx in result.indices.values())
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import io
 import json
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime
 
+import numpy as np
 import pytest
 
 from kenobase.pipeline.output_formats import (
@@ -12,8 +15,11 @@ from kenobase.pipeline.output_formats import (
     FormatterConfig,
     OutputFormat,
     OutputFormatter,
+    dumps_json,
     format_output,
     get_supported_formats,
+    write_csv_records,
+    write_jsonl,
 )
 
 
@@ -92,7 +98,7 @@ class TestOutputFormat:
 
     def test_all_formats_defined(self):
         """Alle erwarteten Formate sind definiert."""
-        expected = {"json", "csv", "html", "markdown", "yaml"}
+        expected = {"json", "jsonl", "csv", "html", "markdown", "yaml"}
         actual = {f.value for f in OutputFormat}
         assert actual == expected
 
@@ -437,6 +443,125 @@ class TestFormatOutputFunction:
         assert "# Kenobase Analysis Report" in result
 
 
+# ============================================================
+# Test Streaming API
+# ============================================================
+
+
+@dataclass
+class _DailyRecord:
+    day: date
+    hits: np.int64
+    win: float
+
+
+class TestStreaming:
+    """Tests fuer write/write_file, JSON Lines und Record-Writer."""
+
+    @pytest.mark.parametrize("fmt", ["json", "jsonl", "csv", "html", "markdown", "yaml"])
+    def test_write_matches_format(self, sample_pipeline_result, fmt):
+        """write() in einen Stream liefert exakt den format()-String."""
+        formatter = OutputFormatter()
+        buffer = io.StringIO()
+        formatter.write(sample_pipeline_result, buffer, fmt)
+        assert buffer.getvalue() == formatter.format(sample_pipeline_result, fmt)
+
+    def test_write_file_keeps_csv_line_endings(self, sample_pipeline_result, tmp_path):
+        """write_file schreibt dieselben Bytes wie format()."""
+        formatter = OutputFormatter()
+        path = formatter.write_file(sample_pipeline_result, tmp_path / "out" / "r.csv", "csv")
+        expected = formatter.format(sample_pipeline_result, "csv").encode("utf-8")
+        assert path.read_bytes() == expected
+
+    def test_jsonl_format_sections(self, sample_pipeline_result):
+        """JSONL: Meta-Zeile plus eine Zeile pro Listen-Element."""
+        output = OutputFormatter().format(sample_pipeline_result, OutputFormat.JSONL)
+        rows = [json.loads(line) for line in output.splitlines()]
+
+        assert rows[0]["section"] == "meta"
+        assert rows[0]["draws_count"] == 100
+        freq_rows = [r for r in rows if r["section"] == "frequency_results"]
+        assert len(freq_rows) == len(sample_pipeline_result["frequency_results"])
+        assert freq_rows[0]["number"] == sample_pipeline_result["frequency_results"][0]["number"]
+
+    def test_write_jsonl_streams_generator(self):
+        """write_jsonl serialisiert numpy, Dataclasses und Datumswerte."""
+        records = (
+            _DailyRecord(day=date(2024, 1, i), hits=np.int64(i), win=i / 2)
+            for i in range(1, 6)
+        )
+        buffer = io.StringIO()
+
+        assert write_jsonl(records, buffer, chunk_size=2) == 5
+        lines = buffer.getvalue().splitlines()
+        assert json.loads(lines[0]) == {"day": "2024-01-01", "hits": 1, "win": 0.5}
+        assert len(lines) == 5
+
+    def test_write_csv_records(self):
+        """write_csv_records nimmt Feldnamen aus dem ersten Record."""
+        buffer = io.StringIO()
+        count = write_csv_records(({"a": i, "b": i * i} for i in range(3)), buffer)
+
+        assert count == 3
+        assert buffer.getvalue().splitlines() == ["a,b", "0,0", "1,1", "2,4"]
+
+    def test_dumps_json_special_types(self):
+        """dumps_json braucht keinen Custom-Encoder fuer numpy/datetime."""
+        payload = {"arr": np.arange(3), "ts": datetime(2025, 1, 2, 3, 4), "x": np.float32(0.5)}
+        assert json.loads(dumps_json(payload)) == {
+            "arr": [0, 1, 2],
+            "ts": "2025-01-02T03:04:00",
+            "x": 0.5,
+        }
+
+    def test_json_format_keeps_nan_and_float_repr(self):
+        """OutputFormat.JSON bleibt beim json-Modul, auch wenn orjson installiert ist."""
+        data = {
+            "p_value": float("nan"),
+            "small": 1e-05,
+            "large": 1e20,
+            "f32": np.float32(0.1),
+        }
+        output = OutputFormatter().format(data, OutputFormat.JSON)
+
+        assert output == json.dumps(data, cls=CustomJSONEncoder, indent=2, ensure_ascii=False)
+        assert '"p_value": NaN' in output
+        assert '"small": 1e-05' in output
+        assert '"large": 1e+20' in output
+        assert '"f32": 0.10000000149011612' in output
+
+    def test_dumps_json_stdlib_fallback_keeps_nan(self, monkeypatch):
+        """Ohne orjson: NaN und Float-Darstellung wie json.dumps."""
+        monkeypatch.setattr("kenobase.pipeline.output_formats.HAS_ORJSON", False)
+        assert dumps_json({"p": float("nan"), "x": 1e-05}) == '{"p":NaN,"x":1e-05}'
+
+    def test_dumps_json_orjson_float_handling(self, monkeypatch):
+        """Mit orjson (dokumentiert): NaN -> null, kuerzeste Float-Darstellung."""
+        pytest.importorskip("orjson")
+        monkeypatch.setattr("kenobase.pipeline.output_formats.HAS_ORJSON", True)
+        data = {"p": float("nan"), "small": 1e-05, "large": 1e20, "f32": np.float32(0.1)}
+        assert dumps_json(data) == '{"p":null,"small":0.00001,"large":1e20,"f32":0.1}'
+
+    def test_jsonl_format_keeps_nan_like_json(self, monkeypatch):
+        """OutputFormat.JSONL schreibt NaN wie OutputFormat.JSON, auch mit orjson."""
+        monkeypatch.setattr("kenobase.pipeline.output_formats.HAS_ORJSON", True)
+        data = {"p_value": float("nan"), "tests": [{"name": "chi2", "p_value": float("nan")}]}
+        lines = OutputFormatter().format(data, OutputFormat.JSONL).splitlines()
+
+        assert lines == [
+            '{"section":"meta","p_value":NaN}',
+            '{"section":"tests","name":"chi2","p_value":NaN}',
+        ]
+
+    def test_registered_formatter_used_by_write(self, sample_pipeline_result):
+        """register_formatter ersetzt auch den Stream-Writer."""
+        formatter = OutputFormatter()
+        formatter.register_formatter(OutputFormat.CSV, lambda data: "custom")
+        buffer = io.StringIO()
+        formatter.write(sample_pipeline_result, buffer, "csv")
+        assert buffer.getvalue() == "custom"
+
+
 # ============================================================
 # Test Edge Cases
 # ============================================================
@@ -223,3 +223,30 @@ class TestStatisticalSignificance:
         # P-value should be valid (between 0 and 1)
         assert 0 <= result.chi_p_value <= 1
         assert result.chi_square >= 0
+
+    def test_per_draw_exact_test_detects_fixed_split(self) -> None:
+        """Always exactly 10 even numbers is too regular for the hypergeometric null."""
+        draws = [
+            _draw([2, 4, 6, 8, 10, 12, 14, 16, 18, 20, 1, 3, 5, 7, 9, 11, 13, 15, 17, 19])
+            for _ in range(200)
+        ]
+
+        result = analyze_parity_ratio(draws, max_number=70)
+
+        assert result.binomial_p_value == pytest.approx(1.0)
+        assert result.per_draw_p_value < 0.05
+        assert result.per_draw_chi_square > 0
+
+    def test_per_draw_test_uses_given_number_range(self, exact_cache_dir) -> None:
+        """Without max_number N is inferred (and flagged); with it the game's N is used."""
+        draws = [_draw(list(range(1, 21))) for _ in range(50)]
+        draws += [_draw(list(range(3, 23))) for _ in range(50)]
+
+        inferred = analyze_parity_ratio(draws)
+        keno = analyze_parity_ratio(draws, max_number=70)
+
+        assert any("max_number not given" in w for w in inferred.warnings)
+        assert not any("max_number" in w for w in keno.warnings)
+        assert keno.per_draw_chi_square != pytest.approx(inferred.per_draw_chi_square)
+        cached = sorted(p.name for p in exact_cache_dir.glob("even_*.npz"))
+        assert cached == ["even_n1-22_k20_v1.npz", "even_n1-70_k20_v1.npz"]
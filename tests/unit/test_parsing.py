@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import numpy as np
+import pandas as pd
 import pytest
 
-from kenobase.core.parsing import parse_float_mixed_german, parse_int_mixed_german
+from kenobase.core.parsing import (
+    parse_float_mixed_german,
+    parse_float_series_mixed_german,
+    parse_int_mixed_german,
+    parse_int_series_mixed_german,
+)
 
 
 @pytest.mark.unit
@@ -33,3 +40,20 @@ def test_parse_float_mixed_german_handles_german_decimal() -> None:
 def test_parse_float_mixed_german_strips_currency_and_noise() -> None:
     assert parse_float_mixed_german("3.187.965,80 ?") == pytest.approx(3187965.80)
     assert parse_float_mixed_german("Gewinnquote5.000,00ÿ?") == pytest.approx(5000.0)
+
+
+@pytest.mark.unit
+def test_series_parsers_match_scalar_parsers() -> None:
+    values = pd.Series(
+        [275.0, "3.462", "2.91", None, np.nan, "1.234,56", "x", 7, "3.462"],
+        dtype=object,
+        index=range(10, 19),
+    )
+
+    ints = parse_int_series_mixed_german(values)
+    floats = parse_float_series_mixed_german(values)
+
+    assert ints.tolist() == values.apply(parse_int_mixed_german).tolist()
+    assert floats.tolist() == values.apply(parse_float_mixed_german).tolist()
+    assert list(ints.index) == list(values.index)
+    assert ints.dtype == np.int64
@@ -0,0 +1,162 @@
+"""Unit tests for kenobase.core.portfolio_optimizer."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from kenobase.core.combination_engine import CombinationEngine
+from kenobase.core.data_loader import DrawResult, GameType
+from kenobase.core.portfolio_optimizer import (
+    BacktestObjective,
+    CoverageObjective,
+    OptimizerConfig,
+    PortfolioOptimizer,
+    lazy_greedy,
+)
+
+
+def make_draws(n: int, seed: int = 0) -> list[DrawResult]:
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 1, 1)
+    return [
+        DrawResult(
+            date=start + timedelta(days=i),
+            numbers=sorted(rng.choice(np.arange(1, 71), 20, replace=False).tolist()),
+            game_type=GameType.KENO,
+        )
+        for i in range(n)
+    ]
+
+
+def brute_coverage(tickets, pool, t):
+    covered = {c for ticket in tickets for c in combinations(sorted(ticket), t)}
+    return len(covered) / len(list(combinations(sorted(pool), t)))
+
+
+class TestCoverageObjective:
+    def test_subsets_many_matches_scalar(self):
+        objective = CoverageObjective(range(1, 16), t=3)
+        tickets = [(1, 4, 7, 9, 15), (2, 3, 5, 11, 14)]
+
+        many = objective.subsets_many(tickets)
+
+        for ticket, row in zip(tickets, many):
+            assert sorted(row.tolist()) == sorted(objective.subsets(ticket).tolist())
+        assert many.max() < objective.n_subsets
+
+    def test_incremental_state_matches_brute_force(self):
+        pool = range(1, 13)
+        objective = CoverageObjective(pool, t=2)
+        tickets = [(1, 2, 3, 4), (3, 4, 5, 6), (7, 8, 9, 10)]
+        state = objective.new_state()
+        for ticket in tickets:
+            objective.add(state, ticket)
+
+        assert objective.normalize(objective.score(state), 3) == pytest.approx(
+            brute_coverage(tickets, pool, 2)
+        )
+        # (3, 4) ist doppelt abgedeckt -> Entfernen kostet 5 statt 6 Paare
+        assert objective.loss(state, (1, 2, 3, 4)) == 5.0
+        objective.remove(state, (1, 2, 3, 4))
+        assert objective.score(state) == pytest.approx(12.0)
+
+    def test_weights(self):
+        objective = CoverageObjective(range(1, 6), t=2, weights={(1, 2): 5.0}, default_weight=0)
+        state = objective.new_state()
+        assert objective.gain(state, (1, 2, 3)) == 5.0
+        assert objective.gain(state, (3, 4, 5)) == 0.0
+        with pytest.raises(ValueError, match="subset"):
+            CoverageObjective(range(1, 6), t=2, weights={(1, 9): 1.0})
+
+
+class TestBacktestObjective:
+    def test_value_matches_manual_payout(self):
+        draws = make_draws(50)
+        objective = BacktestObjective(draws)
+        ticket = (3, 17, 29, 44, 58, 61)
+
+        from kenobase.core.keno_quotes import get_fixed_quote
+
+        manual = sum(get_fixed_quote(6, len(set(ticket) & set(d.numbers))) for d in draws) - 50
+        assert objective.value(ticket) == pytest.approx(manual)
+
+        tickets = [ticket, (1, 2, 3, 4, 5, 6), (10, 20, 30, 40, 50, 60, 70, 1)]
+        fresh = BacktestObjective(draws)
+        assert fresh.gains(fresh.new_state(), tickets) == pytest.approx(
+            [objective.value(t) for t in tickets]
+        )
+
+
+class TestLazyGreedy:
+    def test_matches_plain_greedy(self):
+        pool = range(1, 11)
+        objective = CoverageObjective(pool, t=2)
+        candidates = list(combinations(pool, 4))
+
+        selected, state = lazy_greedy(objective, candidates, 5)
+
+        # Referenz: naiver Greedy (erster Kandidat mit maximalem Gewinn)
+        ref_state = objective.new_state()
+        reference = []
+        for _ in range(5):
+            best = max(candidates, key=lambda c: objective.gain(ref_state, c))
+            reference.append(best)
+            objective.add(ref_state, best)
+
+        assert objective.score(state) == objective.score(ref_state)
+        assert len(set(selected)) == 5
+
+
+class TestPortfolioOptimizer:
+    def test_coverage_improves_and_respects_filters(self):
+        engine = CombinationEngine(pool=set(range(1, 21)), combination_size=5, max_per_decade=3)
+        objective = CoverageObjective(engine.pool, t=2)
+        config = OptimizerConfig(n_restarts=2, anneal_steps=500, max_workers=1)
+
+        result = PortfolioOptimizer(engine, objective, config).optimize(6)
+
+        assert len(result.tickets) == 6
+        assert len(set(result.tickets)) == 6
+        assert all(engine.is_valid(t) for t in result.tickets)
+        assert result.score >= result.greedy_score
+        assert result.normalized_score == pytest.approx(
+            brute_coverage(result.tickets, engine.pool, 2)
+        )
+        assert result.to_dict()["n_tickets"] == 6
+
+    def test_parallel_restarts_match_serial(self):
+        engine = CombinationEngine(pool=set(range(1, 31)), combination_size=6, max_per_decade=3)
+        objective = CoverageObjective(engine.pool, t=3)
+
+        def run(workers):
+            config = OptimizerConfig(
+                n_restarts=2, anneal_steps=300, max_workers=workers, max_candidates=2000
+            )
+            return PortfolioOptimizer(engine, objective, config).optimize(budget=8, stake=2.0)
+
+        serial, parallel = run(1), run(2)
+        assert len(serial.tickets) == 4
+        assert serial.tickets == parallel.tickets
+        assert serial.restart_scores == parallel.restart_scores
+
+    def test_backtest_objective(self):
+        draws = make_draws(80, seed=3)
+        engine = CombinationEngine(pool=set(range(1, 16)), combination_size=4, max_per_decade=4)
+        objective = BacktestObjective(draws)
+        config = OptimizerConfig(n_restarts=1, anneal_steps=0, max_workers=1)
+
+        result = PortfolioOptimizer(engine, objective, config).optimize(3)
+
+        values = sorted((objective.value(c) for c in combinations(range(1, 16), 4)), reverse=True)
+        assert result.score == pytest.approx(sum(values[:3]))
+        assert result.normalized_score == pytest.approx(result.score / (3 * 80))
+
+    def test_requires_size(self):
+        engine = CombinationEngine(pool=set(range(1, 10)), combination_size=3)
+        optimizer = PortfolioOptimizer(engine, CoverageObjective(engine.pool))
+        with pytest.raises(ValueError, match="n_tickets or budget"):
+            optimizer.optimize()
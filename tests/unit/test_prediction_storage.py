@@ -13,6 +13,7 @@ from kenobase.prediction.storage import (
     Prediction,
     PredictionMetrics,
     PredictionStorage,
+    SQLitePredictionStorage,
     generate_draw_id,
 )
 
@@ -219,3 +220,101 @@ class TestPredictionStorage:
         """Test: Laden nicht-existenter Vorhersage."""
         loaded = temp_storage.load_prediction("NONEXISTENT")
         assert loaded is None
+
+
+class TestSQLitePredictionStorage:
+    """Tests fuer SQLitePredictionStorage."""
+
+    @pytest.fixture
+    def sqlite_storage(self, tmp_path):
+        """Erstellt temporaere SQLite-Datenbank."""
+        storage = SQLitePredictionStorage(tmp_path / "predictions.db")
+        yield storage
+        storage.close()
+
+    def test_wal_mode(self, sqlite_storage):
+        """Test: Datenbank laeuft im WAL-Modus."""
+        mode = sqlite_storage._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_save_and_load(self, sqlite_storage):
+        """Test: Speichern und Laden einer Vorhersage."""
+        pred = Prediction(
+            draw_id="KENO-2025-12-28",
+            numbers=[1, 5, 17, 23, 45, 67],
+            tier_predictions={"A": [17, 23], "B": [1, 45]},
+            config={"top_n": 6},
+        )
+        sqlite_storage.save_prediction(pred)
+
+        loaded = sqlite_storage.load_prediction("KENO-2025-12-28")
+        assert loaded.to_dict() == pred.to_dict()
+        assert sqlite_storage.load_prediction("NONEXISTENT") is None
+
+    def test_list_with_filters(self, sqlite_storage):
+        """Test: Filter nach Spieltyp, Strategie und Datum."""
+        sqlite_storage.save_predictions([
+            Prediction(draw_id="KENO-2025-12-26", numbers=[1]),
+            Prediction(draw_id="KENO-2025-12-27", numbers=[1], mode="ensemble"),
+            Prediction(draw_id="KENO-2025-12-28", numbers=[1]),
+            Prediction(draw_id="LOTTO-2025-12-27", numbers=[1]),
+        ])
+
+        assert len(sqlite_storage.list_predictions()) == 4
+        assert sqlite_storage.list_predictions(game="keno", strategy="rule_based") == [
+            "KENO-2025-12-26", "KENO-2025-12-28",
+        ]
+        assert sqlite_storage.list_predictions(date_from="2025-12-27", date_to="2025-12-27") == [
+            "KENO-2025-12-27", "LOTTO-2025-12-27",
+        ]
+        assert sqlite_storage.list_predictions("LOTTO-*.json") == ["LOTTO-2025-12-27"]
+
+    def test_aggregate_matches_json_storage(self, sqlite_storage, tmp_path):
+        """Test: SQL-Aggregation entspricht dem JSON-Backend."""
+        json_storage = PredictionStorage(storage_dir=tmp_path / "json")
+        cases = [
+            ([1, 5, 17], [5, 17, 22], {"A": [17], "B": [1, 5]}),
+            ([2, 6, 18, 30], [6, 18, 23], {"A": [18, 2]}),
+            ([3, 7], None, {"A": [3]}),
+        ]
+        for i, (nums, acts, tiers) in enumerate(cases):
+            pred = Prediction(draw_id=f"KENO-2025-12-{20 + i}", numbers=nums, tier_predictions=tiers)
+            json_storage.save_prediction(pred)
+            sqlite_storage.save_prediction(pred)
+            if acts:
+                json_storage.compare_and_update(pred.draw_id, acts)
+        sqlite_storage.update_actuals({"KENO-2025-12-20": [5, 17, 22], "KENO-2025-12-21": [6, 18, 23]})
+
+        for only_evaluated in (True, False):
+            assert sqlite_storage.get_aggregate_metrics(only_evaluated) == (
+                json_storage.get_aggregate_metrics(only_evaluated)
+            )
+
+    def test_compare_and_update(self, sqlite_storage):
+        """Test: Vergleich und Update inkl. Tier-Genauigkeit."""
+        sqlite_storage.save_prediction(Prediction(
+            draw_id="KENO-2025-12-28", numbers=[1, 5, 17], tier_predictions={"A": [17, 1]},
+        ))
+
+        metrics = sqlite_storage.compare_and_update("KENO-2025-12-28", [5, 17, 22])
+        assert metrics.hits == 2
+
+        loaded = sqlite_storage.load_prediction("KENO-2025-12-28")
+        assert loaded.actuals == [5, 17, 22]
+        assert loaded.metrics.hits == 2
+        assert loaded.metrics.tier_accuracy == {"A": 0.5}
+        assert sqlite_storage.compare_and_update("NONEXISTENT", [1]) is None
+
+    def test_migrate_from_json(self, sqlite_storage, tmp_path):
+        """Test: Einmalige Migration aus JSON-Verzeichnis."""
+        json_storage = PredictionStorage(storage_dir=tmp_path / "json")
+        for i in range(3):
+            pred = Prediction(draw_id=f"KENO-2025-12-{20 + i}", numbers=[1, 2, 3])
+            json_storage.save_prediction(pred)
+        json_storage.compare_and_update("KENO-2025-12-20", [1, 9])
+        (tmp_path / "json" / "broken.json").write_text("{not json")
+
+        assert sqlite_storage.migrate_from_json(tmp_path / "json") == 3
+        assert sqlite_storage.migrate_from_json(tmp_path / "json") == 3
+        assert sqlite_storage.list_predictions() == json_storage.list_predictions()
+        assert sqlite_storage.load_prediction("KENO-2025-12-20").metrics.hits == 1
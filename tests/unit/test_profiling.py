@@ -0,0 +1,195 @@
+"""Unit tests fuer kenobase.core.profiling."""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+import kenobase.core.profiling as prof
+from kenobase.core.data_loader import DrawResult, GameType
+from kenobase.core.profiling import (
+    NULL_SPAN,
+    Profiler,
+    disable_profiling,
+    enable_profiling,
+    get_profiler,
+    profiled,
+    profiling,
+    span,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_global_profiler():
+    """Kein Test hinterlaesst einen aktiven Profiler."""
+    disable_profiling()
+    yield
+    disable_profiling()
+
+
+def _make_draws(n: int = 60) -> list[DrawResult]:
+    base = datetime(2024, 1, 1)
+    return [
+        DrawResult(
+            date=base + timedelta(days=i),
+            numbers=sorted({(i * 7 + k * 3) % 70 + 1 for k in range(20)} | set(range(1, 21)))[:20],
+            game_type=GameType.KENO,
+        )
+        for i in range(n)
+    ]
+
+
+class TestDisabled:
+    """Ohne aktiven Profiler ist die Instrumentierung ein No-op."""
+
+    def test_span_returns_shared_null_span(self):
+        assert get_profiler() is None
+        with span("x", a=1) as s:
+            s.set(b=2)
+        assert span("y") is NULL_SPAN
+
+    def test_profiled_calls_function_directly(self):
+        @profiled
+        def add(a, b):
+            return a + b
+
+        assert add(1, 2) == 3
+        assert add.__name__ == "add"
+
+
+class TestProfiler:
+    """Spans, Verschachtelung, Aggregate und Export."""
+
+    def test_nested_spans_and_self_time(self):
+        with profiling(track_memory=False) as profiler:
+            with span("outer"):
+                for _ in range(3):
+                    with span("inner", kind="loop"):
+                        sum(range(1000))
+
+        stats = profiler.stats()
+        assert stats["outer"].count == 1
+        assert stats["inner"].count == 3
+        assert stats["outer"].self_s <= stats["outer"].total_s
+        assert stats["outer"].total_s >= stats["inner"].total_s
+
+        inner = [r for r in profiler.records if r.name == "inner"]
+        assert all(r.parent == "outer" and r.depth == 1 for r in inner)
+        assert inner[0].attrs == {"kind": "loop"}
+
+    def test_profiled_decorator_names(self):
+        @profiled("custom.name")
+        def named():
+            return 1
+
+        @profiled
+        def auto():
+            return 2
+
+        with profiling() as profiler:
+            named()
+            auto()
+            named()
+
+        stats = profiler.stats()
+        assert stats["custom.name"].count == 2
+        assert any(name.endswith("auto") for name in stats)
+
+    def test_exception_closes_span(self):
+        with profiling() as profiler:
+            with pytest.raises(RuntimeError):
+                with span("outer"):
+                    with span("failing"):
+                        raise RuntimeError("boom")
+            with span("after"):
+                pass
+
+        after = [r for r in profiler.records if r.name == "after"][0]
+        assert after.depth == 0 and after.parent is None
+
+    def test_threads_have_separate_stacks(self):
+        profiler = enable_profiling(track_memory=False)
+
+        def work():
+            with span("thread.work"):
+                pass
+
+        with span("main"):
+            threads = [threading.Thread(target=work) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        records = [r for r in profiler.records if r.name == "thread.work"]
+        assert len(records) == 4
+        assert all(r.depth == 0 for r in records)
+
+    def test_max_records_keeps_aggregates(self):
+        with profiling(Profiler(max_records=2)) as profiler:
+            for _ in range(5):
+                with span("s"):
+                    pass
+        assert len(profiler.records) == 2
+        assert profiler.dropped == 3
+        assert profiler.stats()["s"].count == 5
+
+    def test_profiling_restores_previous(self):
+        outer = enable_profiling()
+        with profiling() as inner:
+            assert get_profiler() is inner
+        assert get_profiler() is outer
+
+    def test_export_json_and_chrome(self, tmp_path):
+        with profiling() as profiler:
+            with span("pipeline.run", draws=10):
+                with span("pipeline.frequency"):
+                    pass
+
+        data = json.loads(profiler.save(tmp_path / "p.json").read_text())
+        assert data["version"] == prof.PROFILE_FORMAT_VERSION
+        assert {s["name"] for s in data["stats"]} == {"pipeline.run", "pipeline.frequency"}
+        assert len(data["spans"]) == 2
+
+        trace = json.loads(profiler.save(tmp_path / "t.json", fmt="chrome").read_text())
+        events = trace["traceEvents"]
+        assert {e["ph"] for e in events} == {"X"}
+        run = next(e for e in events if e["name"] == "pipeline.run")
+        assert run["cat"] == "pipeline"
+        assert run["args"]["draws"] == 10
+
+        with pytest.raises(ValueError):
+            profiler.save(tmp_path / "x", fmt="xml")
+
+    def test_summary(self):
+        assert Profiler().summary() == "No spans recorded"
+        with profiling() as profiler:
+            with span("a.b"):
+                pass
+        assert "a.b" in profiler.summary()
+
+
+class TestInstrumentation:
+    """Annotierte Pipeline-Stufen erscheinen im Profil."""
+
+    def test_pipeline_runner_stages(self):
+        from kenobase.core.config import KenobaseConfig
+        from kenobase.pipeline.runner import PipelineRunner
+
+        config = KenobaseConfig()
+        config.analysis.summen_signatur.enabled = False
+        runner = PipelineRunner(config)
+        draws = _make_draws()
+
+        with profiling() as profiler:
+            runner.run(draws)
+
+        stats = profiler.stats()
+        assert stats["pipeline.run"].count == 1
+        assert "pipeline.frequency" in stats
+        freq = next(r for r in profiler.records if r.name == "pipeline.frequency")
+        assert freq.parent == "pipeline.run"
+        assert freq.attrs["draws"] == len(draws)
@@ -0,0 +1,150 @@
+"""Unit tests for kenobase.core.result_cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+
+import pytest
+
+from kenobase.analysis import house_edge_synthesis
+from kenobase.core.result_cache import ResultCache, file_digest
+
+MODULE = "kenobase.analysis.house_edge_stability"
+
+
+@pytest.fixture
+def cache(tmp_path) -> ResultCache:
+    return ResultCache(tmp_path / ".cache")
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "stake.csv"
+    path.write_text("a;b\n1;2\n", encoding="utf-8")
+    return path
+
+
+class TestResultCache:
+    """Tests for ResultCache."""
+
+    def test_key_depends_on_inputs_params_and_version(self, cache, data_file):
+        base = cache.make_key(MODULE, {"stake": data_file}, {"w": 7})
+
+        assert cache.make_key(MODULE, {"stake": data_file}, {"w": 7}) == base
+        assert cache.make_key(MODULE, {"stake": data_file}, {"w": 14}) != base
+        assert cache.make_key(MODULE, {"stake": data_file}, {"w": 7}, version="2") != base
+
+        data_file.write_text("a;b\n1;23\n", encoding="utf-8")
+        assert cache.make_key(MODULE, {"stake": data_file}, {"w": 7}) != base
+
+    def test_get_or_compute_hits_cache(self, cache, data_file):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"cv": 0.1}
+
+        first = cache.get_or_compute("house003", compute, MODULE, {"stake": data_file})
+        second = cache.get_or_compute("house003", compute, MODULE, {"stake": data_file})
+
+        assert first == second == {"cv": 0.1}
+        assert len(calls) == 1
+
+    def test_artifact_status_and_publish(self, cache, data_file, tmp_path):
+        published = tmp_path / "house003.json"
+        cache.get_or_compute(
+            "house003", lambda: {"cv": 0.1}, MODULE, {"stake": data_file}, publish_to=published
+        )
+
+        assert json.loads(published.read_text()) == {"cv": 0.1}
+        assert cache.artifact_status(published) == "fresh"
+        assert cache.artifact_status(tmp_path / "other.json") == "unknown"
+
+        data_file.write_text("changed\n", encoding="utf-8")
+        assert cache.artifact_status(published) == "stale"
+        (entry,) = cache.status()
+        assert entry.stale_reasons == [f"input stake changed: {data_file}"]
+
+        published.write_text("{}", encoding="utf-8")
+        assert cache.artifact_status(published) == "unknown"
+
+    def test_artifact_status_uses_published_index(self, cache, data_file, tmp_path, monkeypatch):
+        published = tmp_path / "house003.json"
+        cache.get_or_compute("other", lambda: [1], MODULE, {"stake": data_file})
+        cache.get_or_compute(
+            "house003", lambda: {"cv": 0.1}, MODULE, {"stake": data_file}, publish_to=published
+        )
+
+        def no_scan():
+            raise AssertionError("artifact_status must not scan all entries")
+
+        monkeypatch.setattr(cache, "entries", no_scan)
+        assert cache.artifact_status(published) == "fresh"
+        monkeypatch.undo()
+
+        (entry,) = [e for e in cache.entries() if e.name == "house003"]
+        cache.evict(entry.key)
+        assert not any(cache.published_dir.iterdir())
+        assert cache.artifact_status(published) == "unknown"
+
+    def test_force_recomputes(self, cache, data_file):
+        calls = []
+        for force in (False, False, True):
+            cache.get_or_compute(
+                "x", lambda: calls.append(1) or len(calls), MODULE, {"in": data_file}, force=force
+            )
+        assert len(calls) == 2
+
+    def test_gc_by_stale_age_and_size(self, cache, data_file, tmp_path):
+        other = tmp_path / "other.csv"
+        other.write_text("x\n", encoding="utf-8")
+        cache.get_or_compute("a", lambda: {"v": "a" * 1000}, MODULE, {"in": data_file})
+        cache.get_or_compute("b", lambda: {"v": "b" * 1000}, MODULE, {"in": other})
+
+        # "a" has not been accessed for 10 days
+        (entry_a,) = [e for e in cache.entries() if e.name == "a"]
+        old = time.time() - 10 * 86400
+        os.utime(cache._object_path(entry_a.key), (old, old))
+
+        assert [e.name for e in cache.gc(max_age_days=5, dry_run=True)] == ["a"]
+        assert len(cache.entries()) == 2
+
+        assert [e.name for e in cache.gc(max_size_mb=0.0015)] == ["a"]
+        assert [e.name for e in cache.entries()] == ["b"]
+
+        other.unlink()
+        assert [e.name for e in cache.gc(stale=True)] == ["b"]
+        assert cache.entries() == []
+
+    def test_explicit_version_is_not_checked_against_source(self, cache, data_file):
+        cache.get_or_compute("x", lambda: [1], MODULE, {"in": data_file}, version="1.0")
+        (entry,) = cache.status()
+        assert not entry.is_stale
+
+
+def test_file_digest_missing(tmp_path):
+    assert file_digest(tmp_path / "nope") == "missing"
+
+
+def test_synthesis_reports_freshness(tmp_path, data_file):
+    results_dir = tmp_path / "results"
+    cache = ResultCache(results_dir / ".cache")
+    payload = {"correlation": {"is_significant": True, "pearson_r": 0.1, "pearson_p": 0.01}}
+    cache.get_or_compute(
+        "hyp015",
+        lambda: payload,
+        "kenobase.analysis.jackpot_correlation",
+        {"gk1": data_file},
+        publish_to=results_dir / "hyp015_jackpot_correlation.json",
+    )
+
+    report = house_edge_synthesis.run_synthesis(results_dir)
+    (hyp,) = report.hypotheses
+    assert hyp.freshness == "fresh"
+
+    data_file.write_text("new\n", encoding="utf-8")
+    report = house_edge_synthesis.run_synthesis(results_dir)
+    assert report.hypotheses[0].freshness == "stale"
+    assert house_edge_synthesis.hypothesis_to_dict(report.hypotheses[0])["freshness"] == "stale"
@@ -0,0 +1,190 @@
+"""Tests for concurrent press scraping against a local stub HTTP server."""
+
+from __future__ import annotations
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from kenobase.scraper import base as scraper_base
+from kenobase.scraper.base import PressReleaseScraper, ScraperConfig
+from kenobase.scraper.http_client import HTTPCache, PoliteHTTPClient, TokenBucket
+from kenobase.scraper.landeslotterien import LotterieConfig
+
+PRESS_PAGE = """
+<html><body>
+  <a href="/presse/keno-gewinner-1">KENO Gewinner in Musterstadt</a>
+  <a href="/presse/keno-gewinner-2">KENO Gewinner in Beispieldorf</a>
+</body></html>
+"""
+
+ARTICLE_PAGE = """
+<html><body><article>
+  KENO Gewinner: Ein Spieler aus {city} hat am 12.03.2024 mit KENO Typ 10
+  und den Zahlen 5 - 12 - 20 - 26 - 34 - 41 - 48 - 55 - 62 - 68
+  genau 100.000 Euro gewonnen.
+</article></body></html>
+"""
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves a press page and two articles with ETag support."""
+
+    def do_GET(self):  # noqa: N802
+        self.server.hits.append((self.headers["Host"], self.path, time.monotonic()))
+
+        if self.path == "/presse":
+            body = PRESS_PAGE
+        elif self.path.startswith("/presse/keno-gewinner-"):
+            body = ARTICLE_PAGE.format(city="Musterstadt")
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        etag = f'"{self.path}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.server.not_modified += 1
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        payload = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Starts a threaded stub server on localhost."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.hits = []
+    server.not_modified = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stub_sites(stub_server, monkeypatch):
+    """Two lotteries on different hosts (127.0.0.1 / localhost) of the stub."""
+    port = stub_server.server_address[1]
+    sites = {}
+    for code, host in (("site_a", "127.0.0.1"), ("site_b", "localhost")):
+        sites[code] = LotterieConfig(
+            code=code,
+            name=f"Stub {code}",
+            bundesland="Bayern",
+            base_url=f"http://{host}:{port}",
+            press_path="/presse",
+            search_pattern="keno",
+            article_selector="a",
+            title_selector="h1",
+            content_selector="article",
+        )
+    monkeypatch.setattr(scraper_base, "LANDESLOTTERIEN", sites)
+    return sites
+
+
+def make_config(tmp_path, **kwargs) -> ScraperConfig:
+    defaults = dict(
+        delay_between_requests=0.0,
+        delay_between_sites=0.0,
+        max_retries=1,
+        timeout=5,
+        concurrent=True,
+        output_dir=tmp_path / "out",
+    )
+    defaults.update(kwargs)
+    return ScraperConfig(**defaults)
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_wait(self):
+        bucket = TokenBucket(rate=20.0, burst=2)
+        start = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        # 2 immediate, 2 more at 20/s -> ~0.1s
+        assert time.monotonic() - start >= 0.08
+
+    def test_zero_rate_is_unlimited(self):
+        bucket = TokenBucket(rate=0.0)
+        assert all(bucket.acquire() == 0.0 for _ in range(100))
+
+
+class TestConcurrentScraping:
+    """Tests for PressReleaseScraper concurrent mode."""
+
+    def test_scrapes_all_sites(self, stub_server, stub_sites, tmp_path):
+        scraper = PressReleaseScraper(make_config(tmp_path))
+        result = scraper.scrape_all()
+
+        assert result.sites_scraped == 2
+        assert result.articles_found == 4
+        assert result.articles_parsed == 4
+        assert not result.errors
+        assert {r.keno_type for r in result.records} == {10}
+
+    def test_rate_limit_is_per_host(self, stub_server, stub_sites, tmp_path):
+        rate = 10.0
+        scraper = PressReleaseScraper(
+            make_config(tmp_path, requests_per_second_per_host=rate, max_article_workers=2)
+        )
+        scraper.scrape_all()
+
+        by_host: dict[str, list[float]] = {}
+        for host, _, t in stub_server.hits:
+            by_host.setdefault(host.split(":")[0], []).append(t)
+        assert set(by_host) == {"127.0.0.1", "localhost"}
+
+        for times in by_host.values():
+            times.sort()
+            gaps = [b - a for a, b in zip(times, times[1:])]
+            # 3 requests per host: no two within the same token interval
+            assert min(gaps) >= (1.0 / rate) * 0.8
+
+    def test_rerun_uses_conditional_requests(self, stub_server, stub_sites, tmp_path):
+        config = make_config(tmp_path, cache_dir=tmp_path / "http_cache")
+
+        first = PressReleaseScraper(config).scrape_all()
+        assert stub_server.not_modified == 0
+
+        second = PressReleaseScraper(config).scrape_all()
+        assert stub_server.not_modified == 6  # 2 press pages + 4 articles
+        assert len(second.records) == len(first.records)
+
+
+class TestPoliteHTTPClient:
+    """Tests for the shared HTTP client."""
+
+    def test_cache_entry_has_validators(self, stub_server, tmp_path):
+        port = stub_server.server_address[1]
+        url = f"http://127.0.0.1:{port}/presse"
+        client = PoliteHTTPClient(requests_per_second=0, cache_dir=tmp_path, max_retries=1)
+
+        fresh = client.get(url)
+        cached = client.get(url)
+
+        assert not fresh.from_cache
+        assert cached.from_cache
+        assert cached.text == fresh.text
+        assert HTTPCache.conditional_headers(cached) == {"If-None-Match": '"/presse"'}
+
+    def test_missing_page_returns_none(self, stub_server):
+        port = stub_server.server_address[1]
+        client = PoliteHTTPClient(requests_per_second=0, max_retries=1)
+        assert client.get(f"http://127.0.0.1:{port}/missing") is None
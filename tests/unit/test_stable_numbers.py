@@ -6,12 +6,15 @@ A number is stable if stability_score >= threshold (default 0.90)
 """
 
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 
+from kenobase.analysis import stable_numbers
 from kenobase.analysis.stable_numbers import (
     StableNumberResult,
     analyze_stable_numbers,
+    analyze_stable_numbers_multi,
     calculate_stability_score,
     get_stable_numbers,
 )
@@ -247,3 +250,59 @@ class TestStabilityThreshold:
                 assert r.is_stable is True
             else:
                 assert r.is_stable is False
+
+
+class TestAnalyzeStableNumbersMulti:
+    """Tests for the matrix-based multi-window analysis."""
+
+    @pytest.fixture
+    def random_draws(self):
+        import random
+
+        rng = random.Random(42)
+        base_date = datetime(2024, 1, 1)
+        return [
+            create_draw(base_date + timedelta(days=i), rng.sample(range(1, 71), 20))
+            for i in range(120)
+        ]
+
+    def test_matches_per_number_computation(self, random_draws):
+        """Scores match the per-number rolling frequency formula."""
+        from kenobase.analysis.frequency import calculate_rolling_frequency
+
+        results = analyze_stable_numbers(random_draws, window=30, number_range=(1, 70))
+
+        for r in results:
+            freqs = calculate_rolling_frequency(random_draws, 30, r.number)
+            score, mean, std = calculate_stability_score(freqs)
+            assert r.stability_score == pytest.approx(score, abs=1e-12)
+            assert r.avg_frequency == pytest.approx(mean, abs=1e-12)
+            assert r.std_frequency == pytest.approx(std, abs=1e-12)
+            assert r.data_points == len(freqs)
+
+    def test_multiple_windows_in_one_call(self, random_draws):
+        """Each window gets its own sorted result list; too large windows are empty."""
+        by_window = analyze_stable_numbers_multi(
+            random_draws, windows=[10, 50, 500], number_range=(1, 70)
+        )
+
+        assert set(by_window) == {10, 50, 500}
+        assert by_window[500] == []
+        for window in (10, 50):
+            assert by_window[window] == analyze_stable_numbers(
+                random_draws, window=window, number_range=(1, 70)
+            )
+            assert all(r.window == window for r in by_window[window])
+
+    def test_multiple_windows_share_one_cumsum(self, random_draws):
+        """The cumulative sum is built once, not once per window."""
+        with patch.object(
+            stable_numbers, "presence_cumsum", wraps=stable_numbers.presence_cumsum
+        ) as cumsum:
+            analyze_stable_numbers_multi(random_draws, windows=[10, 20, 50], number_range=(1, 70))
+
+        assert cumsum.call_count == 1
+
+    def test_invalid_window_raises(self, random_draws):
+        with pytest.raises(ValueError, match="window"):
+            analyze_stable_numbers_multi(random_draws, windows=[10, 0])
@@ -12,13 +12,17 @@ from kenobase.analysis.stake_correlation import (
     NumberStakeClassification,
     StakeAnalysisSummary,
     StakeCorrelationResult,
+    StakeDataset,
     StakeDrawRecord,
     aggregate_stake_by_date,
+    analyze_auszahlung_correlation,
     analyze_high_stake_popularity_bias,
+    analyze_restbetrag_correlation,
     analyze_stake_correlation,
     calculate_draw_frequency_from_records,
     calculate_number_stake_scores,
     classify_numbers_by_stake,
+    load_stake_data,
 )
 
 
@@ -454,3 +458,114 @@ class TestAnalyzeHighStakePopularityBias:
 
         with pytest.raises(AttributeError):
             result.spearman_r = 0.9  # type: ignore
+
+
+def make_random_records(n: int, seed: int = 0) -> list[StakeDrawRecord]:
+    """Create n records with random draws and amounts."""
+    rng = np.random.default_rng(seed)
+    return [
+        make_stake_record(
+            f"{1 + i % 28:02d}.{1 + i // 28 % 12:02d}.{2020 + i // 336}",
+            sorted(rng.choice(np.arange(1, 71), size=20, replace=False).tolist()),
+            spieleinsatz=float(rng.integers(100_000, 400_000)),
+            total_auszahlung=float(rng.integers(50_000, 200_000)),
+            restbetrag=float(rng.integers(10_000, 90_000)),
+        )
+        for i in range(n)
+    ]
+
+
+class TestStakeDataset:
+    """Tests for the columnar StakeDataset."""
+
+    def test_roundtrip_records(self):
+        records = make_random_records(5) + [make_stake_record("01.02.2024", [1, 2, 3])]
+
+        data = StakeDataset.from_records(records)
+
+        assert len(data) == 6
+        assert data.numbers.shape == (6, 20)
+        assert data.to_records() == records
+        assert data[-1].numbers == [1, 2, 3]
+        assert data[1:3].to_records() == records[1:3]
+
+    def test_empty(self):
+        data = StakeDataset.from_records([])
+
+        assert not data
+        assert data.to_records() == []
+
+    def test_number_means(self):
+        data = StakeDataset.from_records(
+            [
+                make_stake_record("01.01.2024", [1, 2], spieleinsatz=100.0),
+                make_stake_record("02.01.2024", [2, 3], spieleinsatz=300.0),
+            ]
+        )
+
+        means = data.number_means(data.spieleinsatz)
+
+        assert means[1] == 100.0
+        assert means[2] == 200.0
+        assert means[4] == 0.0
+        assert data.number_counts[2] == 2
+
+    def test_analyses_match_record_lists(self):
+        records = make_random_records(60, seed=7)
+        data = StakeDataset.from_records(records)
+
+        for analyze in (
+            analyze_stake_correlation,
+            analyze_auszahlung_correlation,
+            analyze_restbetrag_correlation,
+            analyze_high_stake_popularity_bias,
+        ):
+            assert analyze(records) == analyze(data)
+
+
+class TestLoadStakeData:
+    """Tests for load_stake_data."""
+
+    HEADER = (
+        "Datum;" + ";".join(f"z{i}" for i in range(1, 21)) + ";Plus-5;Spieleinsatz;"
+        "Total_gewinner;Total_Auszahlung;Eur_pro_Spieler;Restbetrag_nach_Auszahlung;Kasse"
+    )
+
+    def _write(self, tmp_path, rows):
+        path = tmp_path / "stake.csv"
+        path.write_text("\n".join([self.HEADER, *rows]) + "\n", encoding="utf-8")
+        return path
+
+    def test_parses_german_numbers_and_skips_invalid_rows(self, tmp_path):
+        numbers = ";".join(str(n) for n in range(1, 21))
+        path = self._write(
+            tmp_path,
+            [
+                f"01.01.2024;{numbers};12345;342.774;1443;173.458;1,5;169.316;1.234.567",
+                f"kein Datum;{numbers};12345;1;1;1;1;1;1",
+                f"02.01.2024;{numbers};12345;1.000;2;3;1,5;;5",
+                f"03.01.2024;{numbers};12345;1,2,3;2;3;1,5;4;5",
+            ],
+        )
+
+        data = load_stake_data(path)
+
+        assert isinstance(data, StakeDataset)
+        assert len(data) == 2
+        first = data[0]
+        assert first.date == datetime(2024, 1, 1)
+        assert first.numbers == list(range(1, 21))
+        assert first.spieleinsatz == 342774.0
+        assert first.total_gewinner == 1443
+        assert first.kasse == 1234567.0
+        assert data[1].restbetrag == 0.0
+
+    def test_missing_columns_returns_empty(self, tmp_path):
+        path = tmp_path / "stake.csv"
+        path.write_text("Datum;Spieleinsatz\n01.01.2024;1\n", encoding="utf-8")
+
+        assert len(load_stake_data(path)) == 0
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_stake_data(tmp_path / "missing.csv")
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
 
 from kenobase.analysis.summen_signatur import (
+    HAS_PYARROW,
+    _scale_distributions,
     aggregate_bucket_counts,
+    append_signatures_parquet,
     compute_summen_signatur,
+    compute_summen_signatur_table,
     export_signatures,
+    read_signatures_parquet,
     split_signatures_by_date,
 )
 from kenobase.core.config import KenobaseConfig
@@ -74,6 +82,72 @@ def test_summen_signatur_buckets_and_scaling(tmp_path) -> None:
     assert bucket_counts[6]["very_high"] == 1
 
 
+def _random_draws(n: int, seed: int = 7) -> list[DrawResult]:
+    rng = np.random.default_rng(seed)
+    base = datetime(2022, 1, 1)
+    return [
+        DrawResult(
+            date=base + timedelta(days=i),
+            numbers=sorted(int(x) for x in rng.choice(np.arange(1, 71), 20, replace=False)),
+            bonus=[],
+            game_type=GameType.KENO,
+            metadata={},
+        )
+        for i in range(n)
+    ]
+
+
+def test_scale_distributions_sums_to_target() -> None:
+    rng = np.random.default_rng(3)
+    counts = rng.integers(0, 5, size=(200, 7))
+    targets = rng.integers(0, 11, size=200)
+    scaled = _scale_distributions(counts, targets)
+
+    valid = (counts.sum(axis=1) > 0) & (targets > 0)
+    assert np.array_equal(scaled.sum(axis=1)[valid], targets[valid])
+    assert not scaled[~valid].any()
+    # Gleichstand: kleinerer Index bekommt den Rest
+    assert _scale_distributions(np.array([[1, 1, 1]]), np.array([2])).tolist() == [[1, 1, 0]]
+
+
+def test_table_matches_records_and_bucket_counts() -> None:
+    draws = _random_draws(60)
+    table = compute_summen_signatur_table(draws, keno_types=[2, 6, 10], source="unit")
+    records = compute_summen_signatur(draws, keno_types=[2, 6, 10], source="unit")
+
+    assert len(table) == len(records) == 180
+    assert [r.to_dict() for r in table.to_records()] == [r.to_dict() for r in records]
+    assert table.bucket_counts() == aggregate_bucket_counts(records)
+    assert len(set(table.checksum)) == len(table)
+
+    train, test = split_signatures_by_date(table, datetime(2022, 2, 1))
+    assert len(train) + len(test) == len(table)
+    assert [r.draw_date for r in train.to_records()] == [
+        r.draw_date for r in records if r.draw_date < datetime(2022, 2, 1)
+    ]
+
+
+@pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow not installed")
+def test_parquet_append_matches_full_compute(tmp_path) -> None:
+    draws = _random_draws(40)
+    out = tmp_path / "signaturen"
+
+    first = append_signatures_parquet(draws[:25], out, keno_types=[6, 8])
+    second = append_signatures_parquet(draws, out, keno_types=[6, 8])
+    assert len(first) == 50
+    assert len(second) == 30
+    assert len(append_signatures_parquet(draws, out, keno_types=[6, 8])) == 0
+
+    stored = read_signatures_parquet(out)
+    full = compute_summen_signatur_table(draws, keno_types=[6, 8])
+    assert [r.to_dict() for r in stored.to_records()] == [r.to_dict() for r in full.to_records()]
+
+    # Parameteraenderung erzwingt Neuaufbau
+    rebuilt = append_signatures_parquet(draws, out, keno_types=[6])
+    assert len(rebuilt) == 40
+    assert len(read_signatures_parquet(out)) == 40
+
+
 def test_pipeline_runner_skips_summen_signatur_when_disabled() -> None:
     config = KenobaseConfig()
     config.analysis.summen_signatur.enabled = False
@@ -18,6 +18,12 @@ from kenobase.prediction.synthesizer import (
     NumberScore,
     HypothesisScore,
 )
+from kenobase.prediction.results_index import (
+    HypothesisView,
+    ResultsIndex,
+    clear_results_index,
+    get_results_index,
+)
 from kenobase.prediction.recommendation import (
     generate_recommendations,
     get_decade,
@@ -220,3 +226,56 @@ class TestGenerateRecommendations:
         # Keine Zehnergruppe sollte mehr als 2 haben
         for decade, count in decade_counts.items():
             assert count <= 2, f"Decade {decade} has {count} numbers, expected <= 2"
+
+
+class TestResultsIndex:
+    """Tests fuer den mtime-basierten ResultsIndex."""
+
+    def test_unchanged_files_are_not_reparsed(self, temp_results_dir):
+        """Zweiter Zugriff parst nichts, geaenderte Datei wird neu geladen."""
+        index = ResultsIndex(temp_results_dir)
+
+        assert index.refresh() == 2
+        assert index.refresh() == 0
+
+        path = temp_results_dir / "hyp010_test.json"
+        data = json.loads(path.read_text())
+        data["classification"]["safe_numbers"] = [70]
+        path.write_text(json.dumps(data) + "\n")
+
+        assert index.refresh() == 1
+        assert index.views(refresh=False)["HYP-010"].safe_numbers == frozenset({70})
+
+    def test_removed_file_drops_hypothesis(self, temp_results_dir):
+        """Geloeschte Dateien verschwinden aus dem Index."""
+        index = ResultsIndex(temp_results_dir)
+        assert set(index.results()) == {"HYP-010", "HYP-012"}
+
+        (temp_results_dir / "hyp012_test.json").unlink()
+        assert set(index.results()) == {"HYP-010"}
+
+    def test_shared_index_between_synthesizers(self, temp_results_dir):
+        """Mehrere Synthesizer teilen denselben prozessweiten Index."""
+        clear_results_index()
+        HypothesisSynthesizer(results_dir=str(temp_results_dir)).synthesize()
+        HypothesisSynthesizer(results_dir=str(temp_results_dir)).synthesize()
+
+        assert get_results_index(temp_results_dir).parse_count == 2
+
+    def test_view_preextracts_fields(self, mock_hyp012_data):
+        """HypothesisView enthaelt vorextrahierte Sets und Flags."""
+        view = HypothesisView.from_data(mock_hyp012_data)
+
+        assert view.hypothesis_id == "HYP-012"
+        assert 6 in view.low_stake_numbers
+        assert 4 in view.high_stake_numbers
+        assert view.payout_significant is True
+
+    def test_extractors_accept_view_and_dict(self, mock_hyp010_data):
+        """Extraktoren liefern fuer View und rohes Dict dieselben Scores."""
+        synth = HypothesisSynthesizer()
+        from_dict = synth._extract_hyp010_scores(mock_hyp010_data)
+        from_view = synth._extract_hyp010_scores(HypothesisView.from_data(mock_hyp010_data))
+
+        assert from_dict == from_view
+        assert from_view[1].score == 0.8
@@ -27,6 +27,10 @@ from kenobase.analysis.ticket_correlation import (
     calculate_diversification_score,
     analyze_ticket_pair,
     analyze_ticket_correlation,
+    calculate_correlation_matrix,
+    calculate_overlap_matrix,
+    calculate_roi_sync_matrix,
+    calculate_timing_matrix,
 )
 
 
@@ -319,3 +323,78 @@ class TestTicketPairValidation:
         assert pair.ticket_b_type == 6
         assert pair.ticket_a_numbers == (9, 50)
         assert pair.ticket_b_numbers == (3, 24, 40, 49, 51, 64)
+
+
+class TestCorrelationMatrix:
+    """Matrix mode must match the per-pair functions."""
+
+    @pytest.fixture
+    def data(self):
+        rng = np.random.default_rng(42)
+        tickets = [
+            tuple(sorted(rng.choice(np.arange(1, 71), size, replace=False).tolist()))
+            for size in (2, 4, 6, 8, 10, 6)
+        ]
+        roi = [rng.normal(size=50) for _ in tickets]
+        roi[1][[3, 17]] = np.nan  # pairwise NaN filtering
+        roi[2] = np.ones(50)  # constant series
+        roi[3] = roi[3][:30]  # shorter series
+        roi[5] = roi[0] * 3 + rng.normal(size=50) * 0.01  # strongly correlated
+        wins = [(rng.random(50) < 0.3).tolist() for _ in tickets]
+        wins[4] = wins[4][:40]
+        return tickets, [r.tolist() for r in roi], wins
+
+    def test_overlap_matrix(self):
+        tickets = [(1, 2, 3), (3, 4), (10, 11, 12)]
+        overlap = calculate_overlap_matrix(tickets)
+        assert overlap.overlap_count.tolist() == [[3, 1, 0], [1, 2, 0], [0, 0, 3]]
+        assert overlap.jaccard_index[0, 1] == pytest.approx(0.25)
+        assert np.allclose(np.diag(overlap.jaccard_index), 1.0)
+
+    def test_matches_pairwise_functions(self, data):
+        tickets, roi, wins = data
+        matrix = calculate_correlation_matrix(tickets, roi, wins)
+
+        for i in range(len(tickets)):
+            for j in range(i + 1, len(tickets)):
+                pair = TicketPair(len(tickets[i]), len(tickets[j]), tickets[i], tickets[j])
+                expected = analyze_ticket_pair(pair, roi[i], roi[j], wins[i], wins[j])
+                actual = matrix.pair_correlation(i, j)
+
+                assert actual.overlap == expected.overlap
+                assert actual.diversification_score == pytest.approx(
+                    expected.diversification_score
+                )
+                assert (actual.sync is None) == (expected.sync is None)
+                if expected.sync is not None:
+                    assert actual.sync.spearman_r == pytest.approx(expected.sync.spearman_r)
+                    assert actual.sync.spearman_p == pytest.approx(expected.sync.spearman_p)
+                    assert actual.sync.n_observations == expected.sync.n_observations
+                if expected.timing is None:
+                    assert actual.timing is None
+                else:
+                    assert vars(actual.timing) == pytest.approx(vars(expected.timing))
+
+    def test_invalid_entries_and_ranking(self, data):
+        tickets, roi, wins = data
+        roi_missing = list(roi)
+        roi_missing[0] = None
+
+        sync = calculate_roi_sync_matrix(roi_missing, min_observations=10)
+        assert not sync.valid[0].any()
+        assert np.isnan(sync.spearman_r[0, 1])
+
+        timing = calculate_timing_matrix(wins, min_draws=45)
+        assert not timing.valid[4].any()
+        assert timing.valid[0, 1]
+
+        matrix = calculate_correlation_matrix(tickets, roi, wins, labels=list("abcdef"))
+        top = matrix.most_diversified(3)
+        assert len(top) == 3
+        assert top[0][2] >= top[1][2] >= top[2][2]
+        assert ("a", "f") not in [(a, b) for a, b, _ in top]
+        assert matrix.mean_diversification().shape == (6,)
+
+    def test_length_mismatch_raises(self):
+        with pytest.raises(ValueError):
+            calculate_correlation_matrix([(1, 2), (3, 4)], roi_series=[[0.1] * 20])
@@ -12,11 +12,14 @@ import pytest
 from kenobase.core.data_loader import DrawResult, GameType
 from kenobase.core.timeline import (
     DRAW_PATTERNS,
+    HAS_PYARROW,
     GameData,
     TimelineGrid,
     load_multi_game_grid,
 )
 
+requires_pyarrow = pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow not installed")
+
 
 # ============================================================================
 # Fixtures
@@ -257,6 +260,41 @@ class TestTimelineGridMatrix:
         assert df.loc["2024-01-02", "eurojackpot_euro1"] == 1
         assert df.loc["2024-01-02", "eurojackpot_euro2"] == 2
 
+    def test_to_numbers_matrix_variable_length(self):
+        """Shorter draws leave trailing number columns NaN."""
+        draws = [
+            DrawResult(date=datetime(2024, 1, 1), numbers=[1, 2, 3], game_type=GameType.KENO),
+            DrawResult(date=datetime(2024, 1, 2), numbers=[4, 5], game_type=GameType.KENO),
+        ]
+        grid = TimelineGrid()
+        grid.add_game("keno", draws)
+        df = grid.to_numbers_matrix()
+
+        assert list(df.columns) == ["keno_has_draw", "keno_z1", "keno_z2", "keno_z3"]
+        assert df["keno_z1"].dtype == "int64"
+        assert df.loc["2024-01-01", "keno_z3"] == 3
+        assert pd.isna(df.loc["2024-01-02", "keno_z3"])
+
+    def test_to_numbers_matrix_ffill_keeps_raw_draw_mask(self, sample_lotto_draws):
+        """ffill fills numbers and metadata, has_draw stays the raw mask."""
+        grid = TimelineGrid(fill_strategy="ffill")
+        grid.add_game("lotto", sample_lotto_draws)
+        df = grid.to_numbers_matrix()
+
+        assert not df.loc["2024-01-04", "lotto_has_draw"]
+        assert df.loc["2024-01-04", "lotto_z1"] == 1
+        assert df.loc["2024-01-04", "format"] == "test"
+        assert df.loc["2024-01-06", "lotto_z1"] == 10
+
+    def test_duplicate_date_keeps_last_draw(self, sample_lotto_draws):
+        """A repeated draw date keeps the draw given last."""
+        replacement = sample_lotto_draws[0].model_copy(update={"numbers": [7, 8, 9, 10, 11, 12]})
+        grid = TimelineGrid()
+        grid.add_game("lotto", sample_lotto_draws + [replacement])
+
+        assert len(grid.games["lotto"]) == 2
+        assert grid.to_dataframe().loc["2024-01-03", "lotto_numbers"] == (7, 8, 9, 10, 11, 12)
+
 
 class TestTimelineGridCoverage:
     """Tests for draw coverage statistics."""
@@ -366,6 +404,48 @@ class TestTimelineGridParquet:
         df = pd.read_parquet(result_path)
         assert "lotto_z1" in df.columns
 
+    @requires_pyarrow
+    def test_dataset_mode_round_trip(
+        self, sample_keno_draws, sample_lotto_draws, sample_eurojackpot_draws, tmp_path
+    ):
+        """Dataset export reads back to identical frames."""
+        grid = TimelineGrid(fill_strategy="ffill")
+        grid.add_game("keno", sample_keno_draws)
+        grid.add_game("lotto", sample_lotto_draws)
+        grid.add_game("eurojackpot", sample_eurojackpot_draws)
+
+        root = grid.to_parquet(tmp_path / "timeline", mode="dataset")
+        assert (root / "game=lotto" / "year=2024" / "part-0.parquet").exists()
+
+        loaded = TimelineGrid.read_parquet(root)
+        assert loaded.fill_strategy == "ffill"
+        assert loaded.games["keno"].draws[0].metadata == {"spieleinsatz": "100"}
+        pd.testing.assert_frame_equal(loaded.to_dataframe(), grid.to_dataframe())
+        pd.testing.assert_frame_equal(loaded.to_numbers_matrix(), grid.to_numbers_matrix())
+
+    @requires_pyarrow
+    def test_dataset_mode_partial_load(self, sample_keno_draws, sample_lotto_draws, tmp_path):
+        """Game and date filters load only the requested slice."""
+        grid = TimelineGrid()
+        grid.add_game("keno", sample_keno_draws)
+        grid.add_game("lotto", sample_lotto_draws)
+        grid.to_parquet(tmp_path / "timeline", mode="dataset")
+
+        loaded = load_multi_game_grid(
+            dataset_path=tmp_path / "timeline",
+            games=["keno"],
+            start="2024-01-03",
+            end=datetime(2024, 1, 5),
+        )
+
+        assert list(loaded.games) == ["keno"]
+        assert len(loaded.games["keno"].draws) == 3
+        assert loaded.start_date == datetime(2024, 1, 3)
+        assert loaded.end_date == datetime(2024, 1, 5)
+
+        with pytest.raises(KeyError):
+            TimelineGrid.read_parquet(tmp_path / "timeline", games=["eurojackpot"])
+
 
 # ============================================================================
 # Convenience Function Tests